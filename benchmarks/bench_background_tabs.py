@@ -0,0 +1,35 @@
+"""Idle CPU use with many open tabs, with and without background tab throttling"""
+import argparse
+from benchmarks.harness import create_app, create_window, wait, process_tree_cpu_time
+
+
+def measure_idle_cpu(seconds):
+    start = process_tree_cpu_time()
+    wait(int(seconds * 1000))
+    return (process_tree_cpu_time() - start) / seconds * 100
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=30.0)
+    args = parser.parse_args()
+
+    create_app()
+    window = create_window(args.tabs)
+    manager = window.tab_lifecycle_manager
+    manager.grace_period_ms = 1000
+
+    manager.set_enabled(False)
+    wait(2000)
+    print(f"Idle CPU with {args.tabs} tabs, throttling off: {measure_idle_cpu(args.seconds):.1f}% of one core")
+
+    manager.set_enabled(True)
+    wait(manager.grace_period_ms + 2000)
+    print(f"Idle CPU with {args.tabs} tabs, throttling on: {measure_idle_cpu(args.seconds):.1f}% of one core")
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""CPU use and frame times of the stand-in page with lightweight rendering off and on.
+
+Frame times are the requestAnimationFrame intervals of the active tab, a frame that takes
+longer to style and paint shows up as a longer interval.
+"""
+import json
+import time
+import argparse
+from benchmarks.harness import create_app, create_window, wait, report, process_tree_cpu_time
+
+# Records frame intervals in the page until it is asked for them
+FRAME_RECORDER = """
+(function() {
+    window.__benchFrames = [];
+    var last = null;
+    function frame(t) {
+        if (last !== null) {
+            window.__benchFrames.push(t - last);
+        }
+        last = t;
+        window.__benchRaf = requestAnimationFrame(frame);
+    }
+    window.__benchRaf = requestAnimationFrame(frame);
+})();
+"""
+READ_FRAMES = "cancelAnimationFrame(window.__benchRaf); JSON.stringify(window.__benchFrames || [])"
+
+
+def run_js(page, source, timeout=10.0):
+    result = []
+    page.runJavaScript(source, 0, result.append)
+    deadline = time.monotonic() + timeout
+    while not result and time.monotonic() < deadline:
+        wait(20)
+    return result[0] if result else None
+
+
+def measure(window, seconds):
+    page = window.tabs.currentWidget().webview.page()
+    run_js(page, FRAME_RECORDER)
+    start = process_tree_cpu_time()
+    wait(int(seconds * 1000))
+    cpu = (process_tree_cpu_time() - start) / seconds * 100
+    frames = json.loads(run_js(page, READ_FRAMES) or "[]")
+    return cpu, frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=5)
+    parser.add_argument("--seconds", type=float, default=15.0)
+    args = parser.parse_args()
+
+    create_app()
+    window = create_window(args.tabs)
+    # Freezing would hide the difference in background tabs
+    window.tab_lifecycle_manager.set_enabled(False)
+    lightweight_mode = window.lightweight_mode
+
+    for enabled in (False, True):
+        lightweight_mode.set_enabled(enabled)
+        wait(2000)
+        cpu, frames = measure(window, args.seconds)
+        state = "on" if enabled else "off"
+        print(f"Lightweight mode {state}, {args.tabs} tabs: {cpu:.1f}% of one core")
+        report(f"Lightweight mode {state}, active tab frame interval", frames)
+
+    lightweight_mode.set_enabled(False)
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Memory of two browser windows in one process versus two separate SearchTabs processes"""
+import sys
+import argparse
+import subprocess
+from benchmarks.harness import create_app, create_window, wait, wait_for_loads, process_tree_rss
+
+SETTLE_MS = 5000
+
+
+def measure_single_process(tab_count):
+    """Resident memory of one process with one window, printed for the parent to collect"""
+    create_app()
+    window = create_window(tab_count)
+    wait(SETTLE_MS)
+    print(process_tree_rss())
+    window.close()
+
+
+def measure_two_processes(tab_count):
+    total = 0
+    for _ in range(2):
+        output = subprocess.run([sys.executable, "-m", "benchmarks.bench_multi_window", "--child",
+                                 "--tabs", str(tab_count)], capture_output=True, text=True, check=True).stdout
+        total += int(output.split()[-1])
+    return total
+
+
+def measure_two_windows(tab_count):
+    create_app()
+    first = create_window(tab_count)
+    second = first.window_manager.create_window()
+    second.confirm_close_tabs = False
+    for _ in range(tab_count - 1):
+        second.add_new_tab()
+    second.show()
+    wait_for_loads(second)
+    wait(SETTLE_MS)
+    rss = process_tree_rss()
+    second.close()
+    first.close()
+    return rss
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=3, help="tabs per window")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure_single_process(args.tabs)
+        return
+
+    separate = measure_two_processes(args.tabs)
+    shared = measure_two_windows(args.tabs)
+    print(f"Two processes, {args.tabs} tabs each: {separate / 1024 ** 2:.0f} MB")
+    print(f"Two windows in one process, {args.tabs} tabs each: {shared / 1024 ** 2:.0f} MB "
+          f"({100.0 * (separate - shared) / separate:.0f}% less)")
+
+
+if __name__ == "__main__":
+    main()
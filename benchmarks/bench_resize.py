@@ -0,0 +1,48 @@
+"""Frame time while dragging the window edge, with and without resize coalescing"""
+import time
+import argparse
+from benchmarks.harness import create_app, create_window, wait, report
+
+STEP_INTERVAL_MS = 16
+
+
+def drag(app, window, steps):
+    """Resize the window back and forth like a mouse drag, returns the time of every step"""
+    start_width = window.width()
+    samples = []
+    for step in range(steps):
+        offset = (step % 60) * 8 if (step // 60) % 2 == 0 else (60 - step % 60) * 8
+        start = time.perf_counter()
+        window.resize(start_width + offset, window.height())
+        app.processEvents()
+        samples.append((time.perf_counter() - start) * 1000)
+        wait(STEP_INTERVAL_MS)
+    wait(500)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=240)
+    args = parser.parse_args()
+
+    app = create_app()
+    window = create_window(args.tabs)
+    window.resize(1024, 768)
+    wait(1000)
+
+    window.resize_coalescing = False
+    report("Resize step, direct", drag(app, window, args.steps))
+
+    window.resize_coalescing = True
+    report("Resize step, coalesced", drag(app, window, args.steps))
+    if window.last_resize_stats:
+        print("Snapshot frames during last drag: {frames}, mean {mean_ms:.2f} ms, "
+              "p95 {p95_ms:.2f} ms, max {max_ms:.2f} ms".format(**window.last_resize_stats))
+
+    window.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Widgets, memory and tab switch time with a web view per tab versus one shared web view per window.
+
+Each layout runs in its own process so that memory left over from one doesn't count for the other.
+A switch is timed until the event loop has handled everything the switch posted.
+"""
+import sys
+import json
+import time
+import argparse
+import subprocess
+from PySide6.QtWidgets import QApplication
+from PySide6.QtWebEngineWidgets import QWebEngineView
+from benchmarks.harness import create_app, create_window, wait, report, process_tree_rss
+from utils.settings import get_settings
+
+SETTLE_MS = 5000
+SWITCH_INTERVAL_MS = 200
+
+
+def measure(tab_count, shared, switches):
+    """Runs in the child process, prints the results as JSON for the parent"""
+    app = create_app()
+    get_settings().set_value("shared_webview", shared)
+    window = create_window(tab_count)
+    # Frozen tabs would be thawed on every switch, which is the same work in both layouts
+    window.tab_lifecycle_manager.set_enabled(False)
+    wait(SETTLE_MS)
+
+    widgets = QApplication.allWidgets()
+    result = {
+        "widgets": len(widgets),
+        "native_widgets": sum(1 for widget in widgets if widget.internalWinId()),
+        "web_views": sum(1 for widget in widgets if isinstance(widget, QWebEngineView)),
+        "rss": process_tree_rss(),
+        "switch_ms": [],
+    }
+    for i in range(switches):
+        index = (window.tabs.currentIndex() + 1) % tab_count
+        start = time.perf_counter()
+        window.tabs.setCurrentIndex(index)
+        app.processEvents()
+        result["switch_ms"].append((time.perf_counter() - start) * 1000)
+        wait(SWITCH_INTERVAL_MS)
+
+    window.close()
+    print(json.dumps(result))
+
+
+def run_child(tab_count, shared, switches):
+    command = [sys.executable, "-m", "benchmarks.bench_shared_webview", "--child", "--tabs", str(tab_count),
+               "--switches", str(switches)]
+    if shared:
+        command.append("--shared")
+    output = subprocess.run(command, capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=10)
+    parser.add_argument("--switches", type=int, default=100)
+    parser.add_argument("--shared", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.tabs, args.shared, args.switches)
+        return
+
+    results = {}
+    for shared, label in ((False, "View per tab"), (True, "Shared view")):
+        result = results[shared] = run_child(args.tabs, shared, args.switches)
+        print(f"{label}, {args.tabs} tabs: {result['widgets']} widgets, {result['native_widgets']} native, "
+              f"{result['web_views']} web views, {result['rss'] / 1024 ** 2:.0f} MB")
+        report(f"{label}: tab switch", result["switch_ms"])
+
+    per_tab, shared = results[False]["rss"], results[True]["rss"]
+    print(f"Shared view uses {(per_tab - shared) / 1024 ** 2:.0f} MB "
+          f"({100.0 * (per_tab - shared) / per_tab:.0f}%) less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Layout and scroll cost with hundreds of tabs, horizontal tab bar versus vertical sidebar.
+
+Tabs hold empty widgets instead of web views so that only the tab strip is measured.
+"""
+import time
+import argparse
+from PySide6.QtWidgets import QWidget, QHBoxLayout
+from benchmarks.harness import create_app, report
+from ui.ui_components import TabWidget, FixedWidthTabBar
+from ui.tab_sidebar import TabSidebar
+
+
+def build_window(vertical):
+    window = QWidget()
+    layout = QHBoxLayout(window)
+    tabs = TabWidget()
+    tabs.setTabBar(FixedWidthTabBar())
+    tabs.setTabsClosable(True)
+    sidebar = TabSidebar(tabs)
+    layout.addWidget(sidebar)
+    layout.addWidget(tabs)
+    sidebar.setVisible(vertical)
+    tabs.set_tab_bar_attached(not vertical)
+    window.resize(1024, 768)
+    window.show()
+    return window, tabs, sidebar
+
+
+def timed(app, action):
+    start = time.perf_counter()
+    action()
+    app.processEvents()
+    return (time.perf_counter() - start) * 1000
+
+
+def attach_bar(app, tabs, label):
+    """Re-attach the bar, timing each event loop turn until it shows every tab"""
+    start = time.perf_counter()
+    turns = [timed(app, lambda: tabs.set_tab_bar_attached(True))]
+    while not tabs.is_tab_bar_synced():
+        turns.append(timed(app, lambda: None))
+    report(f"{label}: event loop turn while filled", turns)
+    print(f"{label}: bar filled after {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+def run(app, vertical, tab_count, label):
+    window, tabs, sidebar = build_window(vertical)
+
+    add_samples = [timed(app, lambda i=i: tabs.addTab(QWidget(), f"Research thread {i}"))
+                   for i in range(tab_count)]
+    report(f"{label}: add tab", add_samples[-50:])
+
+    report(f"{label}: rename tab", [timed(app, lambda i=i: tabs.setTabText(i, f"Renamed thread {i}"))
+                                    for i in range(0, tab_count, 5)])
+
+    report(f"{label}: window relayout", [timed(app, lambda w=w: window.resize(w, 768))
+                                         for w in range(900, 1300, 8)])
+
+    # Switching to tabs far apart forces the strip to scroll
+    report(f"{label}: switch and scroll", [timed(app, lambda i=i: tabs.setCurrentIndex((i * 37) % tab_count))
+                                           for i in range(100)])
+
+    if vertical:
+        scrollbar = sidebar.view.verticalScrollBar()
+        report(f"{label}: wheel scroll", [timed(app, lambda i=i: scrollbar.setValue(
+            (i * 120) % max(1, scrollbar.maximum()))) for i in range(100)])
+
+    if vertical:
+        # The first switch back fills the tab bar, later ones only replay what changed meanwhile
+        attach_bar(app, tabs, f"{label}: first switch to tab bar")
+        tabs.set_tab_bar_attached(False)
+        for i in range(10):
+            tabs.addTab(QWidget(), f"Late thread {i}")
+            tabs.setTabText(i * 7, f"Renamed again {i}")
+        tabs.removeTab(3)
+        attach_bar(app, tabs, f"{label}: later switch to tab bar")
+
+    window.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tabs", type=int, default=500)
+    args = parser.parse_args()
+
+    app = create_app()
+    run(app, False, args.tabs, "Tab bar")
+    run(app, True, args.tabs, "Sidebar")
+
+
+if __name__ == "__main__":
+    main()
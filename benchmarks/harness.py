@@ -0,0 +1,131 @@
+"""Shared helpers for the benchmark scripts.
+
+Run a benchmark from the repository root, for example:
+    python -m benchmarks.bench_resize
+
+Tabs load the local stand-in page instead of Perplexity, and profiles and
+settings are redirected to a temporary directory so user data is never touched.
+"""
+import os
+import sys
+import time
+import tempfile
+from PySide6.QtCore import QStandardPaths, QSettings, QUrl, QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication
+
+STANDIN_PAGE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "standin.html")
+STANDIN_URL = QUrl.fromLocalFile(STANDIN_PAGE).toString()
+
+_settings_dir = None
+
+
+def create_app():
+    global _settings_dir
+    QStandardPaths.setTestModeEnabled(True)
+    if _settings_dir is None:
+        _settings_dir = tempfile.mkdtemp(prefix="searchtabs_bench_")
+        for settings_format in (QSettings.NativeFormat, QSettings.IniFormat):
+            QSettings.setPath(settings_format, QSettings.UserScope, _settings_dir)
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    app.setStyle("Fusion")
+    return app
+
+
+def create_window(tab_count=1, url=STANDIN_URL, wait_for_load=True):
+    """Create and show a BrowserWindow whose tabs open the given URL"""
+    from ui import ui_components
+    ui_components.HOME_URL = url
+    from core.window_manager import WindowManager
+
+    window = WindowManager().create_window()
+    window.confirm_close_tabs = False
+    for _ in range(tab_count - 1):
+        window.add_new_tab()
+    window.show()
+    if wait_for_load:
+        wait_for_loads(window)
+    return window
+
+
+def wait(ms):
+    """Run the event loop for the given number of milliseconds"""
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def wait_for_loads(window, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        tabs = window.tabs
+        if not any(tabs.widget(i).webview.page().isLoading() for i in range(tabs.count())):
+            return True
+        wait(50)
+    return False
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100.0))]
+
+
+def report(name, samples_ms):
+    if not samples_ms:
+        print(f"{name}: no samples")
+        return
+    print(f"{name}: n={len(samples_ms)} mean={sum(samples_ms) / len(samples_ms):.2f} ms "
+          f"p50={percentile(samples_ms, 50):.2f} ms p95={percentile(samples_ms, 95):.2f} ms "
+          f"max={max(samples_ms):.2f} ms")
+
+
+def _descendant_pids(root_pid):
+    children = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        children.setdefault(int(fields[1]), []).append(int(entry))
+
+    pids = []
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        pids.append(pid)
+        pending.extend(children.get(pid, []))
+    return pids
+
+
+def process_tree_cpu_time():
+    """CPU seconds used by this process and its QtWebEngine helper processes (Linux only)"""
+    if not os.path.isdir("/proc"):
+        times = os.times()
+        return times.user + times.system
+    ticks = os.sysconf("SC_CLK_TCK")
+    total = 0
+    for pid in _descendant_pids(os.getpid()):
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+        except OSError:
+            continue
+        total += int(fields[11]) + int(fields[12])
+    return total / ticks
+
+
+def process_tree_rss():
+    """Resident memory in bytes of this process and its helper processes (Linux only)"""
+    total = 0
+    for pid in _descendant_pids(os.getpid()):
+        try:
+            with open(f"/proc/{pid}/statm") as f:
+                total += int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except OSError:
+            continue
+    return total
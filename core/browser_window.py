@@ -1,23 +1,45 @@
 import logging
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QMainWindow, QTabWidget, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QApplication, \
-    QMessageBox
-from PySide6.QtGui import QPalette, QColor, QIcon
-from ui.ui_components import ThinProgressBar, FixedWidthTabBar, BrowserTab
-from managers.profile_manager import ProfileManager
+from PySide6.QtCore import Qt, QTimer, QEvent
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QApplication, \
+    QMessageBox, QStyle, QMenu
+from PySide6.QtGui import QPalette, QColor
+from PySide6.QtWebEngineWidgets import QWebEngineView
+from ui.ui_components import ThinProgressBar, FixedWidthTabBar, BrowserTab, TabWidget
+from ui.tab_sidebar import TabSidebar
+from ui.tab_preview import TabHoverPreviews
 from ui.navigation_controller import NavigationController
 from managers.shortcut_manager import ShortcutManager
-from managers.theme_manager import ThemeManager
+from managers.tab_lifecycle_manager import TabLifecycleManager
 from ui.ui_event_handlers import UIEventHandlers
 from core.settings_window import SettingsWindow
+from ui.archive_dialog import ArchiveSearchDialog
+from ui.quick_open import QuickOpenDialog
+from ui.diagnostics import DiagnosticsDialog
+from ui.export_dialog import ExportDialog
+from utils import tracing
 
 logger = logging.getLogger(__name__)
 
+# Quiet period after the last resize event before the web view gets the final geometry
+RESIZE_SETTLE_MS = 150
+
 
 class BrowserWindow(QMainWindow):
-    def __init__(self):
+    def __init__(self, window_manager, add_tab=True):
         super().__init__()
         self.setWindowTitle("SearchTabs")
+        # Closed windows release their tabs, the application keeps running while others are open
+        self.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.window_manager = window_manager
+
+        # Resize events during a drag are coalesced, see resizeEvent
+        self.resize_coalescing = True
+        self.resize_settle_timer = QTimer(self)
+        self.resize_settle_timer.setSingleShot(True)
+        self.resize_settle_timer.setInterval(RESIZE_SETTLE_MS)
+        self.resize_settle_timer.timeout.connect(self.finish_resize)
+        self.resizing_tab = None
+        self.last_resize_stats = None
 
         # Set initial size
         self.resize(1024, 768)
@@ -27,13 +49,15 @@ class BrowserWindow(QMainWindow):
 
         logger.info("Initializing browser window")
 
-        # Set up theme manager
-        self.theme_manager = ThemeManager()
+        # Theme, profile, archive and history are shared by all windows
+        self.settings = window_manager.settings
+        self.theme_manager = window_manager.theme_manager
         self.theme_manager.theme_changed.connect(self.apply_theme)
-
-        # Set up profile manager
-        self.profile_manager = ProfileManager(self)
-        self.profile = self.profile_manager.setup_profile()
+        self.profile_manager = window_manager.profile_manager
+        self.profile = window_manager.profile
+        self.archive_manager = window_manager.archive_manager
+        self.history_manager = window_manager.history_manager
+        self.export_manager = window_manager.export_manager
 
         # Create central widget with layout
         self.centralwidget = QWidget()
@@ -41,11 +65,17 @@ class BrowserWindow(QMainWindow):
         self.mainlayout.setContentsMargins(0, 0, 0, 0)
         self.mainlayout.setSpacing(0)
 
+        # With a shared web view, tabs only hold their pages and the current one is shown in this view
+        self.shared_view = QWebEngineView() if window_manager.shared_webview else None
+        self.shared_view_tab = None
+
         # Create tab widget with fixed width tabs
-        self.tabs = QTabWidget()
+        self.tabs = TabWidget()
         self.tabs.setTabBar(FixedWidthTabBar())
         self.tabs.setTabsClosable(True)
         self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.currentChanged.connect(self.on_current_tab_changed)
+        self.tabs.tab_menu_requested.connect(self.show_tab_menu)
 
         # Create left corner buttons (Home and Add Tab)
         leftcorner = QWidget()
@@ -58,29 +88,77 @@ class BrowserWindow(QMainWindow):
 
         # Home button
         self.homebutton = QPushButton()
-        self.homebutton.setIcon(QIcon(self.theme_manager.get_themed_icon_path("home")))
+        self.homebutton.setIcon(self.theme_manager.get_themed_icon("home"))
         self.homebutton.setToolTip("Go to Perplexity.ai home")
         self.homebutton.clicked.connect(self.navigation_controller.go_home)
         leftlayout.addWidget(self.homebutton)
 
         # Add Tab button
         self.addtabbutton = QPushButton()
-        self.addtabbutton.setIcon(QIcon(self.theme_manager.get_themed_icon_path("add")))
+        self.addtabbutton.setIcon(self.theme_manager.get_themed_icon("add"))
         self.addtabbutton.setToolTip("Add new tab")
         self.addtabbutton.clicked.connect(self.add_new_tab)
         leftlayout.addWidget(self.addtabbutton)
 
-        # Create right corner button (Settings)
+        # Create right corner buttons (Archive and Settings)
+        rightcorner = QWidget()
+        rightlayout = QHBoxLayout(rightcorner)
+        rightlayout.setContentsMargins(5, 0, 5, 0)
+        rightlayout.setSpacing(2)
+
+        self.archivebutton = QPushButton()
+        self.archivebutton.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_DialogSaveButton))
+        self.archivebutton.setToolTip("Archive page for offline reading")
+        self.archivebutton.clicked.connect(self.archive_manager.archive_current_tab)
+        rightlayout.addWidget(self.archivebutton)
+
         self.settingsbutton = QPushButton()
-        self.settingsbutton.setIcon(QIcon(self.theme_manager.get_themed_icon_path("settings")))
+        self.settingsbutton.setIcon(self.theme_manager.get_themed_icon("settings"))
         self.settingsbutton.setToolTip("Settings")
         self.settingsbutton.clicked.connect(self.showsettings)
+        rightlayout.addWidget(self.settingsbutton)
 
         # Set corner widgets
         self.tabs.setCornerWidget(leftcorner, Qt.Corner.TopLeftCorner)
-        self.tabs.setCornerWidget(self.settingsbutton, Qt.Corner.TopRightCorner)
-
-        self.mainlayout.addWidget(self.tabs)
+        self.tabs.setCornerWidget(rightcorner, Qt.Corner.TopRightCorner)
+
+        # Create vertical tab sidebar, it replaces the tab bar when enabled
+        self.tab_sidebar = TabSidebar(self.tabs)
+        self.tab_sidebar.close_requested.connect(self.close_tab)
+        self.tab_sidebar.menu_requested.connect(self.show_tab_menu)
+
+        self.sidebar_homebutton = QPushButton()
+        self.sidebar_homebutton.setToolTip("Go to Perplexity.ai home")
+        self.sidebar_homebutton.clicked.connect(self.navigation_controller.go_home)
+
+        self.sidebar_addtabbutton = QPushButton()
+        self.sidebar_addtabbutton.setToolTip("Add new tab")
+        self.sidebar_addtabbutton.clicked.connect(self.add_new_tab)
+
+        self.sidebar_archivebutton = QPushButton()
+        self.sidebar_archivebutton.setIcon(self.archivebutton.icon())
+        self.sidebar_archivebutton.setToolTip("Archive page for offline reading")
+        self.sidebar_archivebutton.clicked.connect(self.archive_manager.archive_current_tab)
+
+        self.sidebar_settingsbutton = QPushButton()
+        self.sidebar_settingsbutton.setToolTip("Settings")
+        self.sidebar_settingsbutton.clicked.connect(self.showsettings)
+
+        self.tab_sidebar.header_layout.addWidget(self.sidebar_homebutton)
+        self.tab_sidebar.header_layout.addWidget(self.sidebar_addtabbutton)
+        self.tab_sidebar.header_layout.addStretch()
+        self.tab_sidebar.header_layout.addWidget(self.sidebar_archivebutton)
+        self.tab_sidebar.header_layout.addWidget(self.sidebar_settingsbutton)
+
+        self.contentlayout = QHBoxLayout()
+        self.contentlayout.setContentsMargins(0, 0, 0, 0)
+        self.contentlayout.setSpacing(0)
+        self.contentlayout.addWidget(self.tab_sidebar)
+        self.contentlayout.addWidget(self.tabs)
+        self.mainlayout.addLayout(self.contentlayout)
+
+        self.vertical_tabs = self.settings.value("vertical_tabs")
+        self.set_vertical_tabs(self.vertical_tabs)
 
         # Create ultra-thin progress bar
         self.progressbar = ThinProgressBar()
@@ -92,17 +170,34 @@ class BrowserWindow(QMainWindow):
         # Set up UI event handlers
         self.ui_event_handlers = UIEventHandlers(self)
 
+        # Memory pressure and renderer recovery cover the tabs of all windows
+        self.memory_monitor = window_manager.memory_monitor
+        self.crash_recovery_manager = window_manager.crash_recovery_manager
+        self.prerender_manager = window_manager.prerender_manager
+        self.navigation_telemetry = window_manager.navigation_telemetry
+        self.network_timing = window_manager.network_timing
+        self.lightweight_mode = window_manager.lightweight_mode
+        self.lightweight_mode.watch_window(self)
+        self.thumbnail_cache = window_manager.thumbnail_cache
+        self.thumbnail_cache.watch_window(self)
+        self.tab_previews = TabHoverPreviews(self)
+
+        # Set up background tab throttling
+        self.tab_lifecycle_manager = TabLifecycleManager(self)
+
         # Apply theme before creating the first tab
         self.apply_theme(self.theme_manager.get_current_theme())
 
-        # Create first tab
-        self.add_new_tab()
+        # Create first tab, a window opened for a moved tab starts empty
+        if add_tab:
+            self.add_new_tab()
 
         # Set up shortcuts
         self.shortcut_manager = ShortcutManager(self)
 
         # Settings
-        self.confirm_close_tabs = True
+        self.confirm_close_tabs = self.settings.value("confirm_close_tabs")
+        self.settings.changed.connect(self._on_setting_changed)
 
         logger.info("Browser window initialization complete")
 
@@ -117,6 +212,50 @@ class BrowserWindow(QMainWindow):
         # Move the window to the center
         self.move(x, y)
 
+    def changeEvent(self, event):
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.tab_lifecycle_manager.on_window_state_changed(self.isMinimized())
+        elif event.type() == QEvent.Type.ActivationChange and self.isActiveWindow():
+            self.window_manager.window_activated(self)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        if not self.resize_coalescing or not self.isVisible() or not event.oldSize().isValid():
+            return
+
+        # Show a snapshot of the current page for the duration of the drag instead of
+        # relaying out the web view on every step
+        if self.resizing_tab is None:
+            tab = self.tabs.currentWidget()
+            background = QColor(self.theme_manager.get_colors()["background"])
+            if tab and tab.begin_resize(background):
+                self.resizing_tab = tab
+        self.resize_settle_timer.start()
+
+    def finish_resize(self):
+        tab = self.resizing_tab
+        self.resizing_tab = None
+        if tab is None:
+            return
+        try:
+            frame_times = tab.end_resize()
+        except RuntimeError:
+            # Tab was closed during the drag
+            return
+
+        intervals = sorted((b - a) * 1000 for a, b in zip(frame_times, frame_times[1:]))
+        if intervals:
+            self.last_resize_stats = {
+                "frames": len(frame_times),
+                "mean_ms": sum(intervals) / len(intervals),
+                "p95_ms": intervals[min(len(intervals) - 1, int(len(intervals) * 0.95))],
+                "max_ms": intervals[-1]
+            }
+            logger.info("Resize finished: {frames} frames, mean {mean_ms:.1f} ms, p95 {p95_ms:.1f} ms, "
+                        "max {max_ms:.1f} ms".format(**self.last_resize_stats))
+
+    @tracing.traced()
     def apply_theme(self, theme=None):
         """Apply the current theme to all UI elements"""
         logger.info(f"Applying theme: {theme if theme else self.theme_manager.get_current_theme()}")
@@ -129,7 +268,9 @@ class BrowserWindow(QMainWindow):
         self.tabs.setStyleSheet(stylesheet)
         self.homebutton.setStyleSheet(stylesheet)
         self.addtabbutton.setStyleSheet(stylesheet)
+        self.archivebutton.setStyleSheet(stylesheet)
         self.settingsbutton.setStyleSheet(stylesheet)
+        self.tab_sidebar.setStyleSheet(stylesheet)
 
         # Update existing tabs
         colors = self.theme_manager.get_colors()
@@ -137,54 +278,198 @@ class BrowserWindow(QMainWindow):
             tab = self.tabs.widget(i)
             if hasattr(tab, 'webview'):
                 tab.webview.setStyleSheet(f"background-color: {colors['background']}")
+        if self.shared_view is not None:
+            self.shared_view.setStyleSheet(f"background-color: {colors['background']}")
 
         # Update progress bar
         self.progressbar.update_theme(self.theme_manager.get_effective_theme())
 
-        self.homebutton.setIcon(QIcon(self.theme_manager.get_themed_icon_path("home")))
-        self.addtabbutton.setIcon(QIcon(self.theme_manager.get_themed_icon_path("add")))
-        self.settingsbutton.setIcon(QIcon(self.theme_manager.get_themed_icon_path("settings")))
-
+        self.homebutton.setIcon(self.theme_manager.get_themed_icon("home"))
+        self.addtabbutton.setIcon(self.theme_manager.get_themed_icon("add"))
+        self.settingsbutton.setIcon(self.theme_manager.get_themed_icon("settings"))
+        self.sidebar_homebutton.setIcon(self.homebutton.icon())
+        self.sidebar_addtabbutton.setIcon(self.addtabbutton.icon())
+        self.sidebar_settingsbutton.setIcon(self.settingsbutton.icon())
+
+    def set_vertical_tabs(self, enabled):
+        """Switch between the horizontal tab bar and the vertical tab sidebar"""
+        self.vertical_tabs = enabled
+        # Remembered for new windows, the other open windows keep their layout
+        self.settings.set_value("vertical_tabs", enabled)
+        self.tab_sidebar.setVisible(enabled)
+        # A detached tab bar is not updated, so tab changes no longer lay out every tab
+        self.tabs.set_tab_bar_attached(not enabled)
+
+    def _on_setting_changed(self, key, value):
+        if key == "confirm_close_tabs":
+            self.confirm_close_tabs = value
+
+    def toggle_vertical_tabs(self):
+        self.set_vertical_tabs(not self.vertical_tabs)
+
+    @tracing.traced()
     def add_new_tab(self):
-        newtab = BrowserTab(self.profile)
-        index = self.tabs.addTab(newtab, "Loading...")
-        self.tabs.setCurrentWidget(newtab)
+        newtab = BrowserTab(self.profile, shared_view=self.shared_view is not None)
 
         # Apply theme to new tab
         colors = self.theme_manager.get_colors()
         newtab.webview.setStyleSheet(f"background-color: {colors['background']}")
 
-        # Connect signals for tab title and loading progress
-        newtab.webview.titleChanged.connect(
-            lambda title, tab=newtab: self.ui_event_handlers.update_tab_title(title, tab))
-        newtab.webview.loadStarted.connect(self.ui_event_handlers.load_started)
-        newtab.webview.loadProgress.connect(self.ui_event_handlers.update_progress)
-        newtab.webview.loadFinished.connect(self.ui_event_handlers.load_finished)
+        # Shared managers follow the tab for its whole life, whichever window it is in
+        self.archive_manager.watch_tab(newtab)
+        self.history_manager.watch_tab(newtab)
+        self.crash_recovery_manager.watch_tab(newtab)
+        self.prerender_manager.watch_tab(newtab)
+        self.navigation_telemetry.watch_tab(newtab)
+        self.network_timing.watch_tab(newtab)
+        self.thumbnail_cache.watch_tab(newtab)
+        self.lightweight_mode.watch_tab(newtab)
+        tracing.trace_page_loads(newtab.webview)
+
+        self.attach_tab(newtab, "Loading...")
 
         logger.info("New tab added")
 
+    def attach_tab(self, tab, title, icon=None):
+        """Add a new tab or one moved from another window and select it"""
+        tab.window_owner = self
+
+        # Connect signals for tab title and loading progress, they are undone by detach_tab
+        tab.window_connections = [
+            (tab.webview.titleChanged, lambda title, tab=tab: self.ui_event_handlers.update_tab_title(title, tab)),
+            (tab.webview.iconChanged, lambda icon, tab=tab: self.ui_event_handlers.update_tab_icon(icon, tab)),
+            (tab.webview.loadStarted, self.ui_event_handlers.load_started),
+            (tab.webview.loadProgress, self.ui_event_handlers.update_progress),
+            (tab.webview.loadFinished, self.ui_event_handlers.load_finished),
+        ]
+        for signal, slot in tab.window_connections:
+            signal.connect(slot)
+
+        # Managers attach before the tab is added, adding it emits currentChanged
+        self.tab_lifecycle_manager.watch_tab(tab)
+
+        index = self.tabs.addTab(tab, title)
+        if icon is not None:
+            self.tabs.setTabIcon(index, icon)
+        self.tabs.setCurrentWidget(tab)
+
+    def detach_tab(self, tab):
+        """Remove a tab without closing its page, returns its title and icon"""
+        if self.resizing_tab is tab:
+            self.finish_resize()
+        if self.shared_view_tab is tab:
+            # The view stays with this window, the tab takes only its page along
+            tab.webview.detach_view()
+            self.shared_view.setParent(self)
+            self.shared_view_tab = None
+        for signal, slot in tab.window_connections:
+            signal.disconnect(slot)
+        tab.window_connections = []
+
+        index = self.tabs.indexOf(tab)
+        title, icon = self.tabs.tabText(index), self.tabs.tabIcon(index)
+        self.tabs.removeTab(index)
+        return title, icon
+
+    def all_tabs(self):
+        return [self.tabs.widget(i) for i in range(self.tabs.count())]
+
+    def show_tab_menu(self, index, global_pos):
+        tab = self.tabs.widget(index)
+        if tab is None:
+            return
+        menu = QMenu(self)
+        newwindowaction = menu.addAction("Move to New Window", lambda: self.window_manager.move_tab(tab))
+        newwindowaction.setEnabled(self.tabs.count() > 1)
+        for number, window in enumerate(self.window_manager.windows, 1):
+            if window is not self:
+                menu.addAction(f"Move to Window {number}",
+                               lambda window=window: self.window_manager.move_tab(tab, window))
+        menu.addSeparator()
+        menu.addAction("Export All Tabs...", self.show_export_dialog)
+        menu.addSeparator()
+        menu.addAction("Close Tab", lambda: self.close_tab(self.tabs.indexOf(tab)))
+        menu.exec(global_pos)
+
     def showsettings(self):
         self.settings_window = SettingsWindow(self)
         self.settings_window.exec()
 
+    def on_current_tab_changed(self, index):
+        tab = self.tabs.widget(index)
+        if tab:
+            if tab.is_discarded():
+                # The page reloads now, show its thumbnail until it has loaded
+                self.thumbnail_cache.show_placeholder(tab)
+            if self.shared_view is not None:
+                self.show_in_shared_view(tab)
+            tab.mark_active()
+
+    def show_in_shared_view(self, tab):
+        """Swap the tab's page into the window's web view, the previous page keeps loading without one"""
+        previous = self.shared_view_tab
+        if previous is tab:
+            return
+        tab.show_in_view(self.shared_view)
+        self.shared_view_tab = tab
+        if previous is not None:
+            try:
+                previous.webview.detach_view()
+            except RuntimeError:
+                # Tab was closed
+                pass
+
+    # The dialogs delete themselves when closed, the window owns them until then
+    def show_diagnostics(self):
+        DiagnosticsDialog(self).show()
+
+    def show_archive_search(self):
+        ArchiveSearchDialog(self).show()
+
+    def show_export_dialog(self):
+        ExportDialog(self).show()
+
+    def show_quick_open(self):
+        QuickOpenDialog(self).show()
+
     def close_current_tab(self):
         currentindex = self.tabs.currentIndex()
         if currentindex != -1:
             self.close_tab(currentindex)
 
+    def select_adjacent_tab(self, step):
+        """Switch to the next (step 1) or previous (step -1) tab, wrapping around at the ends"""
+        count = self.tabs.count()
+        if count > 1:
+            self.tabs.setCurrentIndex((self.tabs.currentIndex() + step) % count)
+
+    @tracing.traced()
     def close_tab(self, index):
         if self.tabs.count() > 1:
+            tab = self.tabs.widget(index)
+            if self.resizing_tab is tab:
+                self.finish_resize()
             self.tabs.removeTab(index)
+            # Removing only hides the tab, deleting it frees its page and the state kept for it elsewhere
+            tab.deleteLater()
             logger.info(f"Tab {index} closed")
         else:
             logger.info("Cannot close last tab")
 
+    def close_without_confirmation(self):
+        self.confirm_close_tabs = False
+        self.close()
+
     def closeEvent(self, event):
         if self.confirm_close_tabs:
+            if len(self.window_manager.windows) > 1:
+                title, message = 'Close Window', f'Close this window and its {self.tabs.count()} tabs?'
+            else:
+                title, message = 'Confirm Exit', 'Are you sure you want to close SearchTabs?'
             close_dialog = QMessageBox(
                 QMessageBox.Question,
-                'Confirm Exit',
-                'Are you sure you want to close SearchTabs?',
+                title,
+                message,
                 QMessageBox.Yes | QMessageBox.No,
                 self
             )
@@ -200,4 +485,7 @@ class BrowserWindow(QMainWindow):
             else:
                 event.ignore()
         else:
-            event.accept()
\ No newline at end of file
+            event.accept()
+
+        if event.isAccepted():
+            self.window_manager.window_closed(self)
\ No newline at end of file
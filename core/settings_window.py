@@ -1,21 +1,25 @@
-from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QCheckBox, QPushButton,
-                               QFormLayout, QGroupBox, QHBoxLayout, QComboBox)
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QLabel, QCheckBox, QPushButton, QFormLayout, QGroupBox,
+                               QHBoxLayout, QComboBox, QMessageBox, QScrollArea, QWidget, QFrame)
 from PySide6.QtGui import QDesktopServices
-from PySide6.QtCore import QUrl
-from utils.log_terminal import LogTerminal
+from PySide6.QtCore import QUrl, Qt
 from ui.about import AboutDialog
+from utils import tracing
+from utils import qt_async
 import logging
 
+# Width of the sections, the dialog adds room for the scroll bar
+CONTENT_WIDTH = 300
+# Share of the screen height the dialog may take before its sections scroll
+MAX_SCREEN_FRACTION = 0.85
+
 
 class SettingsWindow(QDialog):
+    @tracing.traced()
     def __init__(self, browser_window):
         super().__init__()
         self.browserwindow = browser_window
         self.setWindowTitle("Settings")
 
-        # Set a larger fixed size to accommodate all content comfortably
-        self.setFixedSize(300, 710)  # Increased height to accommodate new section
-
         # Apply current theme to settings window
         self.setPalette(self.browserwindow.theme_manager.get_palette())
 
@@ -23,10 +27,20 @@ class SettingsWindow(QDialog):
         self.setStyleSheet(self.browserwindow.theme_manager.get_settings_window_stylesheet())
 
         self.initUI()
+        self.fit_to_screen()
 
         # Center the settings window
         self.center_window()
 
+    def fit_to_screen(self):
+        """As tall as the sections need, up to most of the screen, the sections scroll beyond that"""
+        screen = self.browserwindow.screen().availableGeometry()
+        # A scroll area's size hint is capped, the sections ask for their full height
+        needed = self.sizeHint().height() - self.scroll_area.sizeHint().height() + self.content.sizeHint().height()
+        height = min(needed, int(screen.height() * MAX_SCREEN_FRACTION))
+        self.setFixedWidth(self.sizeHint().width())
+        self.resize(self.width(), height)
+
     def center_window(self):
         # Get parent geometry
         parent_geometry = self.browserwindow.geometry()
@@ -55,7 +69,35 @@ class SettingsWindow(QDialog):
         self.confirm_close_tabs_checkbox = QCheckBox("Warning before closing")
         self.confirm_close_tabs_checkbox.setChecked(self.browserwindow.confirm_close_tabs)
 
+        self.auto_archive_checkbox = QCheckBox("Archive pages automatically")
+        self.auto_archive_checkbox.setChecked(self.browserwindow.archive_manager.auto_archive)
+
         general_layout.addWidget(self.confirm_close_tabs_checkbox)
+        self.background_throttling_checkbox = QCheckBox("Freeze background tabs")
+        self.background_throttling_checkbox.setChecked(self.browserwindow.tab_lifecycle_manager.enabled)
+
+        self.vertical_tabs_checkbox = QCheckBox("Vertical tab sidebar")
+        self.vertical_tabs_checkbox.setChecked(self.browserwindow.vertical_tabs)
+
+        self.prerender_checkbox = QCheckBox("Preload hovered thread links")
+        self.prerender_checkbox.setToolTip("Loads a link in the background while the pointer rests on it")
+        self.prerender_checkbox.setChecked(self.browserwindow.prerender_manager.enabled)
+
+        self.lightweight_mode_checkbox = QCheckBox("Lightweight rendering")
+        self.lightweight_mode_checkbox.setToolTip("Turns off page animations and blur effects, fully in background tabs")
+        self.lightweight_mode_checkbox.setChecked(self.browserwindow.lightweight_mode.enabled)
+
+        general_layout.addWidget(self.auto_archive_checkbox)
+        general_layout.addWidget(self.background_throttling_checkbox)
+        general_layout.addWidget(self.vertical_tabs_checkbox)
+        general_layout.addWidget(self.prerender_checkbox)
+        self.shared_webview_checkbox = QCheckBox("One web view per window")
+        self.shared_webview_checkbox.setToolTip("Tabs share their window's web view, which uses fewer widgets and "
+                                                "less memory. Applies after a restart")
+        self.shared_webview_checkbox.setChecked(self.browserwindow.settings.value("shared_webview"))
+
+        general_layout.addWidget(self.lightweight_mode_checkbox)
+        general_layout.addWidget(self.shared_webview_checkbox)
 
         general_group.setLayout(general_layout)
         layout.addWidget(general_group)
@@ -73,8 +115,12 @@ class SettingsWindow(QDialog):
         reset_description.setWordWrap(True)
         reset_description.setStyleSheet("color: gray; font-size: 10px;")
 
+        self.search_archive_button = QPushButton("Search Archive")
+        self.search_archive_button.clicked.connect(self.show_archive_search)
+
         privacy_layout.addWidget(self.reset_data_button)
         privacy_layout.addWidget(reset_description)
+        privacy_layout.addWidget(self.search_archive_button)
 
         privacy_group.setLayout(privacy_layout)
         layout.addWidget(privacy_group)
@@ -117,6 +163,24 @@ class SettingsWindow(QDialog):
         switchtabs_shortcut = QLabel("Ctrl+Tab")
         switchtabs_shortcut.setMinimumWidth(100)
 
+        archive_shortcut = QLabel("Ctrl+S")
+        archive_shortcut.setMinimumWidth(100)
+
+        searcharchive_shortcut = QLabel("Ctrl+Shift+F")
+        searcharchive_shortcut.setMinimumWidth(100)
+
+        quickopen_shortcut = QLabel("Ctrl+K")
+        quickopen_shortcut.setMinimumWidth(100)
+
+        newwindow_shortcut = QLabel("Ctrl+N")
+        newwindow_shortcut.setMinimumWidth(100)
+
+        verticaltabs_shortcut = QLabel("Ctrl+B")
+        verticaltabs_shortcut.setMinimumWidth(100)
+
+        export_shortcut = QLabel("Ctrl+Shift+E")
+        export_shortcut.setMinimumWidth(100)
+
         #sendtotray_shortcut = QLabel("Ctrl+Shift+M") #disable for now
         #sendtotray_shortcut.setMinimumWidth(100) #disable for now
 
@@ -124,6 +188,12 @@ class SettingsWindow(QDialog):
         shortcuts_layout.addRow("Add New Tab:", addtab_shortcut)
         shortcuts_layout.addRow("Close Tab:", closetab_shortcut)
         shortcuts_layout.addRow("Switch Between Tabs:", switchtabs_shortcut)
+        shortcuts_layout.addRow("Archive Page:", archive_shortcut)
+        shortcuts_layout.addRow("Search Archive:", searcharchive_shortcut)
+        shortcuts_layout.addRow("Quick Open History:", quickopen_shortcut)
+        shortcuts_layout.addRow("New Window:", newwindow_shortcut)
+        shortcuts_layout.addRow("Vertical Tabs:", verticaltabs_shortcut)
+        shortcuts_layout.addRow("Export All Tabs:", export_shortcut)
         #shortcuts_layout.addRow("Send to Tray:", sendtotray_shortcut) #disable for now
 
         shortcuts_group.setLayout(shortcuts_layout)
@@ -136,7 +206,16 @@ class SettingsWindow(QDialog):
         self.log_terminal_button = QPushButton("Open Log Terminal")
         self.log_terminal_button.clicked.connect(self.show_log_terminal)
 
+        self.diagnostics_button = QPushButton("Open Diagnostics")
+        self.diagnostics_button.clicked.connect(self.browserwindow.show_diagnostics)
+
+        self.trace_button = QPushButton()
+        self.trace_button.clicked.connect(self.toggle_tracing)
+        self.update_trace_button()
+
         dev_layout.addWidget(self.log_terminal_button)
+        dev_layout.addWidget(self.diagnostics_button)
+        dev_layout.addWidget(self.trace_button)
         dev_group.setLayout(dev_layout)
         layout.addWidget(dev_group)
 
@@ -159,7 +238,7 @@ class SettingsWindow(QDialog):
 
         # Save Button
         buttons_layout = QHBoxLayout()
-        buttons_layout.setContentsMargins(0, 10, 0, 0)  # Add top margin
+        buttons_layout.setContentsMargins(20, 10, 20, 20)  # Add top margin and the padding of the sections
 
         save_button = QPushButton("Save Settings")
         save_button.setMinimumWidth(120)  # Set minimum width for buttons
@@ -171,29 +250,65 @@ class SettingsWindow(QDialog):
         cancel_button.clicked.connect(self.close)
         buttons_layout.addWidget(cancel_button)
 
-        layout.addLayout(buttons_layout)
-
         # Set layout margins
-        layout.setContentsMargins(20, 20, 20, 20)  # Add padding around all edges
-
-        self.setLayout(layout)
+        layout.setContentsMargins(20, 20, 20, 10)  # Add padding around all edges
+
+        # The sections scroll on screens too short for all of them, the buttons stay in view
+        self.content = QWidget()
+        self.content.setLayout(layout)
+        self.content.setFixedWidth(CONTENT_WIDTH)
+        self.scroll_area = QScrollArea()
+        self.scroll_area.setWidget(self.content)
+        self.scroll_area.setFrameShape(QFrame.Shape.NoFrame)
+        self.scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.scroll_area.setMinimumWidth(CONTENT_WIDTH + self.scroll_area.verticalScrollBar().sizeHint().width())
+        self.scroll_area.viewport().setAutoFillBackground(False)
+
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(self.scroll_area)
+        main_layout.addLayout(buttons_layout)
+        self.setLayout(main_layout)
 
     def reset_browser_data(self):
         """Call the profile manager to reset browser data"""
         self.browserwindow.profile_manager.reset_browser_data()
 
+    def show_archive_search(self):
+        """Open the offline archive search dialog"""
+        self.browserwindow.show_archive_search()
+
     def show_log_terminal(self):
         """Show the log terminal window"""
-        if not hasattr(self, 'log_terminal') or not self.log_terminal.isVisible():
-            self.log_terminal = LogTerminal(self)
-
-            # Get the root logger if no specific logger exists
-            logger = getattr(self.browserwindow, 'logger', logging.getLogger())
-            logger.addHandler(self.log_terminal.get_log_handler())
-
-            self.log_terminal.show()
-        else:
-            self.log_terminal.activateWindow()
+        self.browserwindow.window_manager.show_log_terminal()
+
+    def update_trace_button(self):
+        self.trace_button.setText("Stop Tracing and Save" if tracing.is_enabled() else "Start Tracing")
+
+    def toggle_tracing(self):
+        """Start recording a performance trace, or stop and save the current one"""
+        if not tracing.is_enabled():
+            tracing.start()
+            self.update_trace_button()
+            return
+
+        path, events = tracing.stop_recording()
+        self.update_trace_button()
+        # Large traces take a while to serialize, write them on the worker pool
+        qt_async.spawn(self.save_trace(self.browserwindow, path, events), name="Save trace")
+
+    @staticmethod
+    async def save_trace(browser_window, path, events):
+        try:
+            await qt_async.run_blocking(tracing.write, path, events)
+            title, text = "Trace Saved", f"Trace saved to:\n{path}\n\nOpen it at ui.perfetto.dev or chrome://tracing."
+        except OSError as e:
+            logging.error(f"Error saving trace: {e}")
+            title, text = "Trace Not Saved", f"The trace could not be saved:\n{e}"
+        # The settings window may have been closed in the meantime
+        info_dialog = QMessageBox(QMessageBox.Information, title, text, QMessageBox.Ok, browser_window)
+        browser_window.theme_manager.apply_qmessagebox_style(info_dialog)
+        info_dialog.open()
 
     def open_github_repo(self):
         QDesktopServices.openUrl(QUrl("https://github.com/Avaxerrr/SearchTabs_Perplexity_Alternative"))
@@ -204,7 +319,13 @@ class SettingsWindow(QDialog):
 
     def save_settings(self):
         # Save general settings
-        self.browserwindow.confirm_close_tabs = self.confirm_close_tabs_checkbox.isChecked()
+        self.browserwindow.settings.set_value("confirm_close_tabs", self.confirm_close_tabs_checkbox.isChecked())
+        self.browserwindow.archive_manager.set_auto_archive(self.auto_archive_checkbox.isChecked())
+        self.browserwindow.tab_lifecycle_manager.set_enabled(self.background_throttling_checkbox.isChecked())
+        self.browserwindow.set_vertical_tabs(self.vertical_tabs_checkbox.isChecked())
+        self.browserwindow.prerender_manager.set_enabled(self.prerender_checkbox.isChecked())
+        self.browserwindow.lightweight_mode.set_enabled(self.lightweight_mode_checkbox.isChecked())
+        self.browserwindow.settings.set_value("shared_webview", self.shared_webview_checkbox.isChecked())
 
         # Save theme settings
         selected_theme = self.theme_combo.currentText()
@@ -0,0 +1,151 @@
+import logging
+from PySide6.QtCore import QObject, QPoint
+from managers.theme_manager import ThemeManager
+from managers.profile_manager import ProfileManager
+from managers.archive_manager import ArchiveManager
+from managers.history_manager import HistoryManager
+from managers.memory_manager import MemoryPressureMonitor
+from managers.crash_recovery import CrashRecoveryManager
+from managers.prerender_manager import PrerenderManager
+from managers.navigation_telemetry import NavigationTelemetry
+from managers.lightweight_mode import LightweightModeManager
+from managers.export_manager import ExportManager
+from managers.thumbnail_cache import ThumbnailCache
+from managers.idle_scheduler import IdleScheduler
+from managers.stall_watchdog import StallWatchdog
+from managers.leak_detector import LeakDetector
+from managers import idle_scheduler
+from managers.profile_manager import delete_discarded_profiles
+from utils import logger as log_files
+from utils.log_terminal import LogTerminal
+from utils.settings import get_settings
+from ui.startup_shell import save_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class WindowManager(QObject):
+    """Owns the browser windows and everything they share in one process.
+
+    All windows use the same web profile, so they share one HTTP cache, cookie store
+    and set of renderer processes instead of each starting their own.
+    """
+    def __init__(self):
+        super().__init__()
+        self.windows = []
+        self.active_window = None
+        self.log_terminal = None
+        self.settings = get_settings()
+        # Read once, tabs can only move between windows that show them the same way
+        self.shared_webview = self.settings.value("shared_webview")
+        self.stall_watchdog = StallWatchdog(self)
+        self.leak_detector = LeakDetector(self)
+
+        self.theme_manager = ThemeManager()
+
+        self.profile_manager = ProfileManager(self)
+        self.profile = self.profile_manager.setup_profile()
+        self.network_timing = self.profile_manager.network_timing
+
+        self.archive_manager = ArchiveManager(self)
+        self.history_manager = HistoryManager(self)
+        self.memory_monitor = MemoryPressureMonitor(self)
+        self.crash_recovery_manager = CrashRecoveryManager(self)
+        self.prerender_manager = PrerenderManager(self)
+        self.navigation_telemetry = NavigationTelemetry(self)
+        self.lightweight_mode = LightweightModeManager(self)
+        self.export_manager = ExportManager(self)
+        self.thumbnail_cache = ThumbnailCache(self)
+
+        self.idle_scheduler = IdleScheduler(self)
+        self._schedule_maintenance()
+
+    def _schedule_maintenance(self):
+        """Deferred work that runs in the background while the app is idle"""
+        scheduler = self.idle_scheduler
+        scheduler.schedule_once("Freeze startup objects", idle_scheduler.freeze_startup_objects,
+                                idle_scheduler.STARTUP_FREEZE_DELAY_MS / 1000)
+        scheduler.schedule_once("Delete discarded profiles", delete_discarded_profiles, 30)
+        scheduler.schedule("Garbage collection", idle_scheduler.collect_garbage, 10 * 60)
+        scheduler.schedule("Rotate log", log_files.rotate_log, 10 * 60, deadline=60 * 60)
+        scheduler.schedule("Trim caches", idle_scheduler.trim_caches, 30 * 60)
+        scheduler.schedule("Trim thumbnail cache", self.thumbnail_cache.trim_disk_cache, 60 * 60)
+        scheduler.schedule("Compact history", self.history_manager.compact_when_idle, 30 * 60,
+                           deadline=2 * 60 * 60)
+        scheduler.schedule("Optimize archive index", self.archive_manager.optimize_index, 6 * 60 * 60)
+
+    def create_window(self, add_tab=True):
+        """Create a browser window without showing it"""
+        from core.browser_window import BrowserWindow
+
+        window = BrowserWindow(self, add_tab)
+        self.idle_scheduler.watch_window(window)
+        self.windows.append(window)
+        if self.active_window is None:
+            self.active_window = window
+        logger.info(f"Browser window created ({len(self.windows)} open)")
+        return window
+
+    def new_window(self):
+        """Open another window next to the active one"""
+        window = self.create_window()
+        if self.active_window is not None and self.active_window is not window:
+            window.move(self.active_window.pos() + QPoint(40, 40))
+        window.show()
+        return window
+
+    def current_window(self):
+        """The window the user interacted with last"""
+        return self.active_window or (self.windows[0] if self.windows else None)
+
+    def window_activated(self, window):
+        self.active_window = window
+
+    def window_closed(self, window):
+        if window in self.windows:
+            self.windows.remove(window)
+        if self.active_window is window:
+            self.active_window = self.windows[-1] if self.windows else None
+        logger.info(f"Browser window closed ({len(self.windows)} open)")
+        if not self.windows:
+            # The last window's look is what the next launch shows while starting
+            save_snapshot(window)
+
+    def all_tabs(self):
+        return [tab for window in self.windows for tab in window.all_tabs()]
+
+    def visible_tabs(self):
+        """The current tab of every window"""
+        return [window.tabs.currentWidget() for window in self.windows if window.tabs.currentWidget()]
+
+    def move_tab(self, tab, target=None):
+        """Move a tab into another window, or a new one, keeping its page loaded"""
+        source = tab.window_owner
+        if target is source:
+            return
+        if target is None:
+            target = self.create_window(add_tab=False)
+            target.resize(source.size())
+            target.move(source.pos() + QPoint(40, 40))
+
+        title, icon = source.detach_tab(tab)
+        target.attach_tab(tab, title, icon)
+        target.show()
+        target.activateWindow()
+        logger.info(f"Tab '{tab.webview.title()}' moved to window {self.windows.index(target) + 1}")
+
+        if source.tabs.count() == 0:
+            source.close_without_confirmation()
+
+    def show_log_terminal(self):
+        """One log terminal for all windows, so each record reaches a single handler"""
+        if self.log_terminal is None:
+            self.log_terminal = LogTerminal()
+        # Closing the terminal detaches its handler, reattach it when shown again
+        handler = self.log_terminal.get_log_handler()
+        root_logger = logging.getLogger()
+        if handler not in root_logger.handlers:
+            root_logger.addHandler(handler)
+        self.log_terminal.show()
+        self.log_terminal.raise_()
+        self.log_terminal.activateWindow()
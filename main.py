@@ -1,78 +1,101 @@
 import sys
-import os
-import shutil
+import time
 
-from PySide6.QtWidgets import QApplication, QSplashScreen
-from PySide6.QtGui import QIcon, QPixmap
-from PySide6.QtCore import QSettings, QStandardPaths, Qt, QTimer
-from core.browser_window import BrowserWindow
-from utils.logger import setup_logger
+# Startup times are reported relative to this
+launched = time.perf_counter()
 
-# Set up logging
-logger = setup_logger()
+from utils import tracing
 
+# Only what the splash and the startup shell need, QtWebEngine and the managers are imported once they show
+with tracing.span("Import Qt", "startup"):
+    from PySide6.QtWidgets import QApplication, QSplashScreen
+    from PySide6.QtCore import Qt, QTimer
+    from ui.startup_shell import StartupShell, load_snapshot, delete_snapshot
+    from utils.logger import setup_logger
+    from utils.settings import get_settings
+    from utils import icons
+    from utils import qt_async
 
-def delete_profile():
-    appdatapath = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-    profilepath = os.path.join(appdatapath, "searchtabs_profile")
-    if os.path.exists(profilepath):
-        try:
-            shutil.rmtree(profilepath)
-            logger.info(f"Profile directory removed: {profilepath}")
-        except Exception as e:
-            logger.error(f"Error removing profile directory: {e}")
+# Set up logging
+logger = setup_logger()
 
 
 if __name__ == "__main__":
-    app = QApplication(sys.argv)
-
-    # Set the global application icon
-    basedir = os.path.dirname(os.path.abspath(__file__))
-    icon_path = os.path.join(basedir, "icons/final", "logo_s.png")
-    if not os.path.exists(icon_path):
-        # Try alternative path for packaged application
-        icon_path = os.path.join(os.path.dirname(sys.executable), "icons/final", "logo_s.png")
-    app.setWindowIcon(QIcon(icon_path))
-
-    # Create and show splash screen
-    splash_path = os.path.join(basedir, "icons/final", "logo_s.png")
-    if not os.path.exists(splash_path):
-        splash_path = os.path.join(os.path.dirname(sys.executable), "icons/final", "logo_s.png")
-
-    splash_pixmap = QPixmap(splash_path)
-    # Resize if needed (adjust dimensions as appropriate for your logo)
-    if splash_pixmap.width() > 400 or splash_pixmap.height() > 400:
-        splash_pixmap = splash_pixmap.scaled(400, 400, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-
-    splash = QSplashScreen(splash_pixmap, Qt.WindowStaysOnTopHint)
-    splash.setWindowFlag(Qt.FramelessWindowHint)
-    splash.show()
-
-    # Process events to make sure splash is displayed immediately
-    app.processEvents()
-
-    settings = QSettings("YourOrganization", "SearchTabs")
-    if settings.value("reset_profile", False, type=bool):
-        delete_profile()
-        settings.setValue("reset_profile", False)
-        settings.sync()  # Ensure settings are saved immediately
-
+    with tracing.span("Create QApplication", "startup"):
+        # QtWebEngine is imported after the application is created, which needs shared contexts set up front
+        QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+        app = QApplication(sys.argv)
+        qt_async.install()
+
+    # Set the global application icon, its sizes are decoded when a window first needs them
+    app.setWindowIcon(icons.app_icon())
     app.setStyle("Fusion")  # Use Fusion style for better dark theme support
 
-    # Create the main window but don't show it yet
-    window = BrowserWindow()
+    with tracing.span("Load settings", "startup"):
+        settings = get_settings()
+    if settings.value("reset_profile"):
+        # The last session's page is browsing data too
+        delete_snapshot()
+
+    # The last session's window stands in for the browser while it starts, the splash only
+    # shows when there is no snapshot yet
+    splash = shell = None
+    with tracing.span("Load startup snapshot", "startup"):
+        snapshot = load_snapshot()
+    if snapshot is not None:
+        with tracing.span("Show startup shell", "startup"):
+            shell = StartupShell(snapshot, launched)
+            shell.show()
+            app.processEvents()
+    else:
+        with tracing.span("Show splash screen", "startup"):
+            # Scaled to size when the resources are built
+            splash = QSplashScreen(icons.splash_pixmap(), Qt.WindowStaysOnTopHint)
+            splash.setWindowFlag(Qt.FramelessWindowHint)
+            splash.show()
+
+            # Process events to make sure splash is displayed immediately
+            app.processEvents()
+
+    with tracing.span("Import modules", "startup"):
+        from core.window_manager import WindowManager
+        from managers.profile_manager import discard_profile
+        from managers.history_manager import delete_history
+        from managers.thumbnail_cache import delete_thumbnails
+
+    if settings.value("reset_profile"):
+        with tracing.span("Reset profile", "startup"):
+            # Renamed only, the files are deleted later by an idle job
+            discard_profile()
+            delete_history()
+            delete_thumbnails()
+            settings.set_value("reset_profile", False)
+
+    # Create the main window but don't show it yet, further windows share its profile
+    with tracing.span("Create shared managers", "startup"):
+        window_manager = WindowManager()
+    with tracing.span("Create main window", "startup"):
+        window = window_manager.create_window()
 
 
     # Function to finish splash and show main window
     def finish_splash():
-        splash.finish(window)
-        window.show()
+        with tracing.span("Show main window", "startup"):
+            splash.finish(window)
+            window.show()
         logger.info("Application started")
 
 
-    # Use a timer to display the splash for a minimum time (e.g., 1 second)
-    # This ensures the splash is visible even if the app loads quickly
-    QTimer.singleShot(1000, finish_splash)
+    if shell is not None:
+        # The shell covers the window until its first page has loaded
+        with tracing.span("Show main window", "startup"):
+            shell.cover(window)
+            window.show()
+        logger.info("Application started")
+    else:
+        # Use a timer to display the splash for a minimum time (e.g., 1 second)
+        # This ensures the splash is visible even if the app loads quickly
+        QTimer.singleShot(1000, finish_splash)
 
 
-    sys.exit(app.exec())
\ No newline at end of file
+    sys.exit(qt_async.run())
\ No newline at end of file
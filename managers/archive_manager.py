@@ -0,0 +1,211 @@
+import os
+import time
+import hashlib
+import sqlite3
+import logging
+import threading
+from PySide6.QtCore import QObject, Signal, QStandardPaths, QTimer
+from PySide6.QtWebEngineCore import QWebEngineDownloadRequest
+
+logger = logging.getLogger(__name__)
+
+# Delay before an automatic archive so that streamed answers have time to render
+AUTO_ARCHIVE_DELAY_MS = 5000
+
+
+class ArchiveManager(QObject):
+    """Saves pages as MHTML under the app data directory and indexes their text with SQLite FTS5"""
+    page_archived = Signal(str, str)  # url, archive file path
+
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.profile = window_manager.profile
+
+        appdatapath = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+        self.archive_dir = os.path.join(appdatapath, "archive")
+        os.makedirs(self.archive_dir, exist_ok=True)
+        self.db_path = os.path.join(self.archive_dir, "index.sqlite3")
+
+        self.settings = window_manager.settings
+        self.auto_archive = self.settings.value("auto_archive")
+        self.settings.changed.connect(self._on_setting_changed)
+
+        # Archive file path -> metadata of saves that are still being written by Chromium
+        self._pending = {}
+        self._db_lock = threading.Lock()
+        self.search_available = self._init_db()
+
+        self.profile.downloadRequested.connect(self._on_download_requested)
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, check_same_thread=False)
+
+    def _init_db(self):
+        try:
+            with self._db_lock, self._connect() as db:
+                # WAL lets the GUI thread read while a worker indexes or optimizes
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("""
+                    CREATE TABLE IF NOT EXISTS pages (
+                        hash TEXT PRIMARY KEY,
+                        url TEXT NOT NULL,
+                        title TEXT,
+                        file TEXT NOT NULL,
+                        size INTEGER,
+                        archived_at REAL
+                    )""")
+                db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts "
+                           "USING fts5(hash UNINDEXED, title, url, body)")
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Archive index unavailable: {e}")
+            return False
+
+    def set_auto_archive(self, enabled):
+        self.settings.set_value("auto_archive", enabled)
+
+    def _on_setting_changed(self, key, value):
+        if key == "auto_archive":
+            self.auto_archive = value
+
+    def watch_tab(self, tab):
+        """Schedule automatic archiving whenever the tab finishes loading"""
+        tab.webview.loadFinished.connect(lambda ok, tab=tab: self._on_load_finished(tab, ok))
+
+    def _on_load_finished(self, tab, ok):
+        if not ok or not self.auto_archive:
+            return
+        # Skip the Perplexity home page, it has no thread content worth keeping
+        if tab.webview.url().path() in ("", "/"):
+            return
+        QTimer.singleShot(AUTO_ARCHIVE_DELAY_MS, lambda tab=tab: self.archive_tab(tab))
+
+    def archive_current_tab(self):
+        window = self.window_manager.current_window()
+        tab = window.tabs.currentWidget() if window else None
+        if tab:
+            self.archive_tab(tab)
+
+    def archive_tab(self, tab):
+        """Extract the page text, then save an MHTML copy unless identical content is already archived"""
+        try:
+            page = tab.webview.page()
+        except RuntimeError:
+            # Tab was closed before a delayed archive ran
+            return
+        url = page.url()
+        if url.scheme() not in ("http", "https"):
+            return
+        title = page.title()
+        page.toPlainText(lambda text, page=page, url=url.toString(), title=title:
+                         self._on_text_extracted(page, url, title, text))
+
+    def _on_text_extracted(self, page, url, title, text):
+        # MHTML output embeds a timestamp and random MIME boundaries, so the extracted
+        # text is hashed instead to recognise unchanged pages
+        content_hash = hashlib.sha256(f"{url}\n{text}".encode("utf-8")).hexdigest()
+        if self.is_archived(content_hash):
+            logger.info(f"Page already archived: {url}")
+            return
+
+        path = os.path.normpath(os.path.join(self.archive_dir, f"{content_hash}.mhtml"))
+        if path in self._pending:
+            return
+        self._pending[path] = {"hash": content_hash, "url": url, "title": title, "text": text}
+        try:
+            page.save(path, QWebEngineDownloadRequest.SavePageFormat.MimeHtmlSaveFormat)
+        except RuntimeError as e:
+            self._pending.pop(path, None)
+            logger.error(f"Error archiving {url}: {e}")
+
+    def _on_download_requested(self, download):
+        if not download.isSavePageDownload():
+            return
+        path = os.path.normpath(os.path.join(download.downloadDirectory(), download.downloadFileName()))
+        if path not in self._pending:
+            return
+        download.isFinishedChanged.connect(lambda download=download, path=path: self._on_save_finished(download, path))
+
+    def _on_save_finished(self, download, path):
+        if not download.isFinished():
+            return
+        meta = self._pending.pop(path, None)
+        if meta is None:
+            return
+        if download.state() != QWebEngineDownloadRequest.DownloadState.DownloadCompleted:
+            logger.error(f"Archiving {meta['url']} failed: {download.interruptReasonString()}")
+            return
+
+        # Index on a background thread so large pages don't block the UI
+        t = threading.Thread(target=self._index_page, args=(path, meta))
+        t.daemon = True
+        t.start()
+
+    def _index_page(self, path, meta):
+        try:
+            size = os.path.getsize(path)
+            with self._db_lock, self._connect() as db:
+                db.execute("INSERT OR IGNORE INTO pages (hash, url, title, file, size, archived_at) "
+                           "VALUES (?, ?, ?, ?, ?, ?)",
+                           (meta["hash"], meta["url"], meta["title"], os.path.basename(path), size, time.time()))
+                db.execute("INSERT INTO pages_fts (hash, title, url, body) VALUES (?, ?, ?, ?)",
+                           (meta["hash"], meta["title"], meta["url"], meta["text"]))
+            logger.info(f"Archived {meta['url']} ({size} bytes)")
+            self.page_archived.emit(meta["url"], path)
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Error indexing archived page {meta['url']}: {e}")
+
+    def optimize_index(self):
+        """Idle job, merges the search index segments on a worker thread"""
+        if not self.search_available:
+            return
+        yield
+        threading.Thread(target=self._optimize_db, name="ArchiveOptimize", daemon=True).start()
+
+    def _optimize_db(self):
+        try:
+            with self._db_lock, self._connect() as db:
+                db.execute("INSERT INTO pages_fts (pages_fts) VALUES ('optimize')")
+                db.execute("PRAGMA optimize")
+            logger.info("Archive search index optimized")
+        except sqlite3.Error as e:
+            logger.error(f"Error optimizing archive search index: {e}")
+
+    def is_archived(self, content_hash):
+        if not self.search_available:
+            return False
+        # Reads skip _db_lock, which workers hold for whole inserts and optimizes
+        with self._connect() as db:
+            row = db.execute("SELECT 1 FROM pages WHERE hash = ?", (content_hash,)).fetchone()
+        return row is not None
+
+    def search(self, query, limit=50):
+        """Return archived pages matching the query, most relevant first"""
+        if not self.search_available:
+            return []
+
+        # Quote every term so user input can't break the FTS5 query syntax,
+        # and match on prefixes so results show up while typing
+        terms = [term.replace('"', '""') for term in query.split()]
+        with self._connect() as db:
+            if not terms:
+                rows = db.execute("SELECT hash, url, title, file, archived_at, '' FROM pages "
+                                  "ORDER BY archived_at DESC LIMIT ?", (limit,)).fetchall()
+            else:
+                match = " ".join(f'"{term}"*' for term in terms)
+                rows = db.execute("""
+                    SELECT p.hash, p.url, p.title, p.file, p.archived_at,
+                           snippet(pages_fts, 3, '', '', '…', 12)
+                    FROM pages_fts JOIN pages p ON p.hash = pages_fts.hash
+                    WHERE pages_fts MATCH ?
+                    ORDER BY rank LIMIT ?""", (match, limit)).fetchall()
+
+        return [{
+            "hash": row[0],
+            "url": row[1],
+            "title": row[2],
+            "path": os.path.join(self.archive_dir, row[3]),
+            "archived_at": row[4],
+            "snippet": row[5]
+        } for row in rows]
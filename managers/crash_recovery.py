@@ -0,0 +1,150 @@
+import time
+import logging
+from PySide6.QtCore import QObject, QTimer
+from PySide6.QtWebEngineCore import QWebEnginePage
+
+logger = logging.getLogger(__name__)
+
+PING_INTERVAL_MS = 5000
+# A renderer that doesn't answer a ping within this time is considered hung
+HANG_TIMEOUT = 15.0
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 60.0
+# A tab that crashes this often within the window is left alone until the user reloads it
+MAX_RESTARTS = 5
+RESTART_WINDOW = 10 * 60.0
+
+
+class TabRecoveryState:
+    def __init__(self):
+        self.crashes = 0
+        self.hangs = 0
+        self.restarts = 0
+        self.recent_failures = []
+        self.gave_up = False
+        self.retry_at = None
+        self.ping_sent = None
+        self.ping_token = 0
+        self.last_reason = ""
+
+
+class CrashRecoveryManager(QObject):
+    """Detects crashed and unresponsive renderers and reloads their tabs with exponential backoff"""
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.total_crashes = 0
+        self.total_hangs = 0
+
+        self.ping_timer = QTimer(self)
+        self.ping_timer.timeout.connect(self._ping_tabs)
+        self.ping_timer.start(PING_INTERVAL_MS)
+
+    def watch_tab(self, tab):
+        tab.recovery_state = TabRecoveryState()
+        tab.recovery_timer = QTimer(tab)
+        tab.recovery_timer.setSingleShot(True)
+        tab.recovery_timer.timeout.connect(lambda tab=tab: self._restart(tab))
+        tab.countdown_timer = QTimer(tab)
+        tab.countdown_timer.timeout.connect(lambda tab=tab: self._update_countdown(tab))
+
+        tab.webview.renderProcessTerminated.connect(
+            lambda status, exit_code, tab=tab: self._on_render_process_terminated(tab, status, exit_code))
+        # Pending pings are dropped by navigations, so they must not count as a hang
+        tab.webview.loadStarted.connect(lambda tab=tab: self._reset_ping(tab))
+        tab.reload_requested.connect(lambda tab=tab: self.reload_now(tab))
+
+    def _tabs(self):
+        return self.window_manager.all_tabs()
+
+    def _on_render_process_terminated(self, tab, status, exit_code):
+        if status == QWebEnginePage.RenderProcessTerminationStatus.NormalTerminationStatus:
+            return
+        tab.recovery_state.crashes += 1
+        self.total_crashes += 1
+        self._schedule_recovery(tab, f"renderer {status.name} (exit code {exit_code})")
+
+    def _on_unresponsive(self, tab):
+        tab.recovery_state.hangs += 1
+        self.total_hangs += 1
+        self._schedule_recovery(tab, "renderer unresponsive")
+
+    def _schedule_recovery(self, tab, reason):
+        state = tab.recovery_state
+        now = time.monotonic()
+        state.ping_sent = None
+        state.last_reason = reason
+        state.recent_failures = [t for t in state.recent_failures if now - t < RESTART_WINDOW] + [now]
+        title = tab.webview.title()
+
+        if len(state.recent_failures) > MAX_RESTARTS:
+            state.gave_up = True
+            state.retry_at = None
+            tab.countdown_timer.stop()
+            tab.show_placeholder(f"This tab stopped working ({reason}) and keeps failing.\n"
+                                 f"Automatic reloading has been stopped.")
+            logger.error(f"Tab '{title}' failed {len(state.recent_failures)} times, giving up: {reason} "
+                         f"(crashes: {state.crashes}, hangs: {state.hangs})")
+            return
+
+        delay = min(BACKOFF_BASE * 2 ** (len(state.recent_failures) - 1), BACKOFF_MAX)
+        state.retry_at = now + delay
+        logger.error(f"Tab '{title}' {reason}, reloading in {delay:.0f}s "
+                     f"(crashes: {state.crashes}, hangs: {state.hangs})")
+        tab.recovery_timer.start(int(delay * 1000))
+        tab.countdown_timer.start(1000)
+        self._update_countdown(tab)
+
+    def _update_countdown(self, tab):
+        state = tab.recovery_state
+        if state.retry_at is None:
+            tab.countdown_timer.stop()
+            return
+        remaining = max(0, round(state.retry_at - time.monotonic()))
+        tab.show_placeholder(f"This tab stopped working ({state.last_reason}).\nReloading in {remaining}s...")
+
+    def _restart(self, tab):
+        state = tab.recovery_state
+        state.retry_at = None
+        state.restarts += 1
+        tab.countdown_timer.stop()
+        tab.show_webview()
+        if state.last_reason == "renderer unresponsive":
+            # A hung renderer never processes a reload, so the page is replaced instead
+            tab.reset_page()
+        else:
+            tab.webview.reload()
+        logger.info(f"Tab restarted (restart #{state.restarts})")
+
+    def reload_now(self, tab):
+        """Manual reload from the placeholder, also re-enables automatic recovery"""
+        state = tab.recovery_state
+        state.gave_up = False
+        state.recent_failures = []
+        tab.recovery_timer.stop()
+        self._restart(tab)
+
+    def _reset_ping(self, tab):
+        tab.recovery_state.ping_sent = None
+
+    def _ping_tabs(self):
+        now = time.monotonic()
+        for tab in self._tabs():
+            state = getattr(tab, "recovery_state", None)
+            if state is None or state.gave_up or state.retry_at is not None:
+                continue
+            page = tab.webview.page()
+            if page.lifecycleState() != QWebEnginePage.LifecycleState.Active or page.isLoading():
+                state.ping_sent = None
+                continue
+            if state.ping_sent is not None:
+                if now - state.ping_sent > HANG_TIMEOUT:
+                    self._on_unresponsive(tab)
+                continue
+            state.ping_sent = now
+            state.ping_token += 1
+            page.runJavaScript("0", 0, lambda result, state=state, token=state.ping_token: self._on_pong(state, token))
+
+    def _on_pong(self, state, token):
+        if state.ping_token == token:
+            state.ping_sent = None
@@ -0,0 +1,384 @@
+import os
+import re
+import json
+import queue
+import logging
+import threading
+from datetime import datetime
+from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtWebEngineCore import QWebEngineScript, QWebEnginePage
+
+logger = logging.getLogger(__name__)
+
+# Tabs extracted at the same time, each one keeps its renderer busy
+MAX_CONCURRENT_EXPORTS = 3
+# A tab that has not answered by then is counted as failed
+TAB_TIMEOUT_MS = 30000
+MAX_FILENAME_LENGTH = 80
+
+# Converts the main content of the page to Markdown
+MARKDOWN_SCRIPT = """
+(function() {
+    var SKIP = {SCRIPT: 1, STYLE: 1, NOSCRIPT: 1, SVG: 1, BUTTON: 1, NAV: 1, HEADER: 1, FOOTER: 1,
+                FORM: 1, INPUT: 1, TEXTAREA: 1, SELECT: 1, TEMPLATE: 1, IFRAME: 1, CANVAS: 1};
+
+    function skipped(element) {
+        return SKIP[element.tagName] || element.getAttribute('aria-hidden') === 'true';
+    }
+
+    function inline(node) {
+        var out = '';
+        node.childNodes.forEach(function(child) {
+            if (child.nodeType === 3) {
+                out += child.textContent.replace(/\\s+/g, ' ');
+                return;
+            }
+            if (child.nodeType !== 1 || skipped(child)) {
+                return;
+            }
+            var tag = child.tagName;
+            if (tag === 'UL' || tag === 'OL') {
+                return;
+            } else if (tag === 'A' && child.href) {
+                out += '[' + inline(child).trim() + '](' + child.href + ')';
+            } else if (tag === 'STRONG' || tag === 'B') {
+                out += '**' + inline(child).trim() + '**';
+            } else if (tag === 'EM' || tag === 'I') {
+                out += '*' + inline(child).trim() + '*';
+            } else if (tag === 'CODE') {
+                out += '`' + child.textContent + '`';
+            } else if (tag === 'BR') {
+                out += '\\n';
+            } else {
+                out += inline(child);
+            }
+        });
+        return out;
+    }
+
+    function list(element, lines, indent) {
+        var number = 1;
+        for (var i = 0; i < element.children.length; i++) {
+            var item = element.children[i];
+            if (item.tagName !== 'LI') {
+                continue;
+            }
+            var marker = element.tagName === 'OL' ? (number++) + '. ' : '- ';
+            lines.push(indent + marker + inline(item).trim());
+            var nested = item.querySelectorAll(':scope > ul, :scope > ol');
+            for (var j = 0; j < nested.length; j++) {
+                list(nested[j], lines, indent + '  ');
+            }
+        }
+    }
+
+    function table(element, lines) {
+        var rows = element.querySelectorAll('tr');
+        lines.push('');
+        for (var i = 0; i < rows.length; i++) {
+            var cells = [];
+            rows[i].querySelectorAll('th, td').forEach(function(cell) {
+                cells.push(inline(cell).trim().replace(/\\|/g, '\\\\|'));
+            });
+            lines.push('| ' + cells.join(' | ') + ' |');
+            if (i === 0) {
+                lines.push('|' + cells.map(function() { return ' --- '; }).join('|') + '|');
+            }
+        }
+        lines.push('');
+    }
+
+    function block(node, lines) {
+        node.childNodes.forEach(function(child) {
+            if (child.nodeType === 3) {
+                var text = child.textContent.trim();
+                if (text) {
+                    lines.push(text);
+                }
+                return;
+            }
+            if (child.nodeType !== 1 || skipped(child)) {
+                return;
+            }
+            var tag = child.tagName;
+            if (/^H[1-6]$/.test(tag)) {
+                lines.push('', '#'.repeat(+tag[1]) + ' ' + inline(child).trim(), '');
+            } else if (tag === 'P') {
+                lines.push('', inline(child).trim(), '');
+            } else if (tag === 'PRE') {
+                lines.push('', '```', child.textContent.replace(/\\n$/, ''), '```', '');
+            } else if (tag === 'UL' || tag === 'OL') {
+                lines.push('');
+                list(child, lines, '');
+                lines.push('');
+            } else if (tag === 'BLOCKQUOTE') {
+                lines.push('', '> ' + inline(child).trim(), '');
+            } else if (tag === 'TABLE') {
+                table(child, lines);
+            } else {
+                block(child, lines);
+            }
+        });
+    }
+
+    var lines = [];
+    block(document.querySelector('main') || document.body, lines);
+    return JSON.stringify({
+        title: document.title,
+        url: location.href,
+        markdown: lines.join('\\n').replace(/\\n{3,}/g, '\\n\\n').trim()
+    });
+})();
+"""
+
+
+def safe_filename(title, number):
+    name = re.sub(r'[\\/:*?"<>|\x00-\x1f]', "", title).strip(" .") or "Untitled"
+    return f"{number:02d} - {name[:MAX_FILENAME_LENGTH].rstrip(' .')}"
+
+
+class TabExport:
+    def __init__(self, number, tab):
+        self.number = number
+        self.tab = tab
+        self.files = []
+        self.waiting = 0
+        self.refreeze = False
+        # Lifecycle state the memory pressure monitor had put the page in, restored afterwards
+        self.restore_state = None
+        self.on_loaded = None
+        self.timer = None
+
+
+class ExportJob(QObject):
+    """Exports a set of tabs, a few at a time, and writes the files on a worker thread"""
+    progress = Signal(int, int, str)
+    finished = Signal(int, int, str)
+    # Emitted from the writer thread with the tab number and an error message or ""
+    written = Signal(int, str)
+
+    def __init__(self, tabs, directory, include_pdf, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.include_pdf = include_pdf
+        self.pending = [TabExport(number, tab) for number, tab in enumerate(tabs, 1)]
+        self.total = len(self.pending)
+        self.active = {}
+        self.done = 0
+        self.failed = 0
+        self.running = False
+        self.cancelled = False
+        self._cancel_event = threading.Event()
+
+        self._queue = queue.Queue()
+        self.written.connect(self._on_written)
+        self._writer = threading.Thread(target=self._writer_loop, name="ExportWriter")
+        self._writer.daemon = True
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self.running = True
+        self._writer.start()
+        logger.info(f"Exporting {self.total} tabs to {self.directory}")
+        self._start_next()
+
+    def cancel(self):
+        if not self.running:
+            return
+        self.running = False
+        self.cancelled = True
+        self._cancel_event.set()
+        for export in list(self.active.values()):
+            export.timer.stop()
+            self._release(export)
+        self.active.clear()
+        self.pending.clear()
+        self._queue.put(None)
+        logger.info(f"Export cancelled after {self.done} of {self.total} tabs")
+        self.finished.emit(self.done - self.failed, self.failed, self.directory)
+
+    def _start_next(self):
+        while not self.cancelled and self.pending and len(self.active) < MAX_CONCURRENT_EXPORTS:
+            export = self.pending.pop(0)
+            self.active[export.number] = export
+            self._extract(export)
+        if self.running and not self.pending and not self.active and self.done == self.total:
+            self.running = False
+            self._queue.put(None)
+            logger.info(f"Export finished, {self.done - self.failed} of {self.total} tabs written")
+            self.finished.emit(self.done - self.failed, self.failed, self.directory)
+
+    def _extract(self, export):
+        tab = export.tab
+        try:
+            page = tab.webview.page()
+        except RuntimeError:
+            # Tab was closed after the export started
+            self._fail(export, "tab closed")
+            return
+
+        export.timer = QTimer(self)
+        export.timer.setSingleShot(True)
+        export.timer.timeout.connect(lambda export=export: self._fail(export, "timed out"))
+        export.timer.start(TAB_TIMEOUT_MS)
+
+        # Frozen pages run no scripts, thaw them for the export and freeze them again afterwards
+        state = page.lifecycleState()
+        if getattr(tab, "throttled", False):
+            export.refreeze = True
+            tab.window_owner.tab_lifecycle_manager.thaw(tab)
+        elif state == QWebEnginePage.LifecycleState.Frozen:
+            # Frozen by the memory pressure monitor rather than by background throttling
+            export.restore_state = state
+            page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+        elif state == QWebEnginePage.LifecycleState.Discarded:
+            # A discarded page has no renderer, it reloads when made active
+            export.restore_state = state
+            export.on_loaded = lambda ok, export=export: self._on_reloaded(export, ok)
+            page.loadFinished.connect(export.on_loaded)
+            page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+            return
+        self._run_scripts(export, page)
+
+    def _on_reloaded(self, export, ok):
+        self._disconnect_loaded(export)
+        if self.active.get(export.number) is not export:
+            return
+        if not ok:
+            self._fail(export, "could not reload the discarded page")
+            return
+        try:
+            self._run_scripts(export, export.tab.webview.page())
+        except RuntimeError:
+            self._fail(export, "tab closed")
+
+    def _disconnect_loaded(self, export):
+        if export.on_loaded is None:
+            return
+        try:
+            export.tab.webview.page().loadFinished.disconnect(export.on_loaded)
+        except (RuntimeError, TypeError):
+            # Tab was closed
+            pass
+        export.on_loaded = None
+
+    def _run_scripts(self, export, page):
+        export.waiting = 2 if self.include_pdf else 1
+        page.runJavaScript(MARKDOWN_SCRIPT, QWebEngineScript.ScriptWorldId.ApplicationWorld,
+                           lambda result, export=export: self._on_markdown(export, result))
+        if self.include_pdf:
+            page.printToPdf(lambda data, export=export: self._on_pdf(export, data))
+
+    def _on_markdown(self, export, result):
+        if self.active.get(export.number) is not export:
+            return
+        try:
+            data = json.loads(result)
+        except (TypeError, ValueError):
+            self._fail(export, "could not read the page")
+            return
+        export.title = data["title"] or data["url"]
+        header = f"# {export.title}\n\nSource: {data['url']}\n\nExported: {datetime.now():%Y-%m-%d %H:%M}\n\n"
+        export.files.append((".md", (header + data["markdown"] + "\n").encode("utf-8")))
+        self._part_done(export)
+
+    def _on_pdf(self, export, data):
+        if self.active.get(export.number) is not export:
+            return
+        if data:
+            export.files.append((".pdf", bytes(data)))
+        else:
+            logger.error(f"PDF export of tab {export.number} failed")
+        self._part_done(export)
+
+    def _part_done(self, export):
+        export.waiting -= 1
+        if export.waiting:
+            return
+        export.timer.stop()
+        title = getattr(export, "title", "")
+        base = os.path.join(self.directory, safe_filename(title, export.number))
+        self._queue.put((export.number, [(base + suffix, data) for suffix, data in export.files]))
+        del self.active[export.number]
+        self._release(export)
+        self.progress.emit(self.done, self.total, f"Writing {title}")
+        self._start_next()
+
+    def _fail(self, export, reason):
+        if self.active.pop(export.number, None) is None:
+            return
+        if export.timer is not None:
+            export.timer.stop()
+        self._release(export)
+        logger.error(f"Export of tab {export.number} failed: {reason}")
+        self._count(failed=True)
+        self._start_next()
+
+    def _release(self, export):
+        self._disconnect_loaded(export)
+        if export.refreeze:
+            export.refreeze = False
+            try:
+                export.tab.window_owner.tab_lifecycle_manager.throttle(export.tab)
+            except RuntimeError:
+                pass
+        elif export.restore_state is not None:
+            state, export.restore_state = export.restore_state, None
+            try:
+                if state == QWebEnginePage.LifecycleState.Frozen:
+                    export.tab.freeze()
+                else:
+                    export.tab.discard()
+            except RuntimeError:
+                pass
+
+    def _count(self, failed):
+        self.done += 1
+        if failed:
+            self.failed += 1
+        self.progress.emit(self.done, self.total, f"{self.done} of {self.total} tabs exported")
+
+    def _on_written(self, number, error):
+        if self.cancelled:
+            return
+        if error:
+            logger.error(f"Error writing export of tab {number}: {error}")
+        self._count(failed=bool(error))
+        self._start_next()
+
+    def _writer_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None or self._cancel_event.is_set():
+                return
+            number, files = item
+            error = ""
+            for path, data in files:
+                try:
+                    with open(path, "wb") as f:
+                        f.write(data)
+                except OSError as e:
+                    error = str(e)
+            self.written.emit(number, error)
+
+
+class ExportManager(QObject):
+    """Starts bulk exports of open tabs, one job at a time"""
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.job = None
+
+    def export_tabs(self, tabs, directory, include_pdf=False):
+        if self.job is not None:
+            self.job.cancel()
+        tabs = [tab for tab in tabs if tab.webview.url().scheme() in ("http", "https")]
+        folder = os.path.join(directory, f"SearchTabs export {datetime.now():%Y-%m-%d %H%M%S}")
+        job = ExportJob(tabs, folder, include_pdf, self)
+        job.finished.connect(lambda *args, job=job: self._on_finished(job))
+        self.job = job
+        return job
+
+    def _on_finished(self, job):
+        if self.job is job:
+            self.job = None
@@ -0,0 +1,325 @@
+import os
+import time
+import queue
+import sqlite3
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from PySide6.QtCore import QObject, Signal, QStandardPaths, QCoreApplication
+from utils import tracing
+
+logger = logging.getLogger(__name__)
+
+# How long the writer waits to collect a batch before committing it
+FLUSH_INTERVAL = 1.0
+MAX_BATCH_SIZE = 500
+# Number of changed entries searched linearly before the search index is rebuilt
+MAX_OVERLAY_SIZE = 2000
+
+URL, TITLE, VISIT_COUNT, LAST_VISIT = range(4)
+
+
+def _search_key(url):
+    """Strip the scheme and www. so that typing a domain matches as a prefix"""
+    key = url.lower()
+    for prefix in ("https://", "http://"):
+        if key.startswith(prefix):
+            key = key[len(prefix):]
+            break
+    if key.startswith("www."):
+        key = key[4:]
+    return key
+
+
+def history_path():
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), "history.sqlite3")
+
+
+def delete_history():
+    """Remove the history database and its WAL files, as when browser data is reset"""
+    path = history_path()
+    for name in (path, path + "-wal", path + "-shm"):
+        try:
+            os.remove(name)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error deleting history database: {e}")
+
+
+class HistoryManager(QObject):
+    """Keeps visited URLs in SQLite (WAL mode) and an in-memory index for quick-open lookups"""
+    index_loaded = Signal(object)
+    index_built = Signal(object, int)
+
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+
+        self.db_path = history_path()
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+
+        settings = window_manager.settings
+        self.max_entries = settings.value("history_max_entries")
+        self.max_age_days = settings.value("history_max_age_days")
+        settings.changed.connect(self._on_setting_changed)
+
+        # url -> [url, title, visit_count, last_visit]
+        self.entries = {}
+        # (sorted keys, urls in key order, haystack, line offsets, urls in line order)
+        self._index = ([], [], "", [], [])
+        self._index_dirty = False
+        self._index_building = False
+        # url -> generation of entries changed since the index snapshot was taken
+        self._overlay = {}
+        self._generation = 0
+
+        self._queue = queue.Queue()
+        self.index_loaded.connect(self._on_index_loaded)
+        self.index_built.connect(self._on_index_built)
+        self._writer = threading.Thread(target=self._writer_loop, name="HistoryWriter")
+        self._writer.daemon = True
+        self._writer.start()
+
+        # Every way of quitting goes through aboutToQuit, a restart or a quit from the menu
+        # doesn't close the windows first
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def _on_setting_changed(self, key, value):
+        # The new limits apply from the next compaction
+        if key == "history_max_entries":
+            self.max_entries = value
+        elif key == "history_max_age_days":
+            self.max_age_days = value
+
+    def watch_tab(self, tab):
+        """Record visits from the tab's URL and title changes"""
+        webview = tab.webview
+        webview.urlChanged.connect(lambda url, webview=webview: self.record_visit(url.toString(), webview.title()))
+        webview.titleChanged.connect(lambda title, webview=webview: self.update_title(webview.url().toString(), title))
+
+    def record_visit(self, url, title=""):
+        if not url.startswith(("http://", "https://")):
+            return
+        now = time.time()
+        entry = self.entries.get(url)
+        if entry is None:
+            entry = [url, title, 0, now]
+            self.entries[url] = entry
+        entry[VISIT_COUNT] += 1
+        entry[LAST_VISIT] = now
+        if title:
+            entry[TITLE] = title
+        self._touch(url)
+        self._queue.put(("visit", (url, entry[TITLE], now)))
+
+    def update_title(self, url, title):
+        entry = self.entries.get(url)
+        if entry is None or not title or entry[TITLE] == title:
+            return
+        entry[TITLE] = title
+        self._touch(url)
+        self._queue.put(("title", (title, url)))
+
+    def _touch(self, url):
+        self._generation += 1
+        self._overlay[url] = self._generation
+        if len(self._overlay) > MAX_OVERLAY_SIZE:
+            self._schedule_rebuild()
+
+    def compact(self):
+        """Apply retention limits in memory and ask the writer to compact the database"""
+        cutoff = time.time() - self.max_age_days * 86400
+        stale = [url for url, entry in self.entries.items() if entry[LAST_VISIT] < cutoff]
+        overflow = len(self.entries) - len(stale) - self.max_entries
+        if overflow > 0:
+            remaining = sorted((e for e in self.entries.values() if e[LAST_VISIT] >= cutoff),
+                               key=lambda e: e[LAST_VISIT])
+            stale.extend(e[URL] for e in remaining[:overflow])
+        for url in stale:
+            del self.entries[url]
+            self._overlay.pop(url, None)
+        if stale:
+            self._schedule_rebuild()
+        self._queue.put(("compact", (cutoff, self.max_entries)))
+
+    def compact_when_idle(self):
+        """Idle job, compaction itself is one step"""
+        yield
+        self.compact()
+
+    def shutdown(self):
+        """Flush pending writes and stop the writer thread"""
+        self._queue.put(None)
+        self._writer.join(timeout=2.0)
+
+    def search(self, text, limit=20):
+        """Prefix matches on the URL first, then substring matches on URL and title"""
+        needle = text.strip().lower()
+        sorted_keys, sorted_urls, haystack, line_offsets, line_urls = self._index
+
+        results = []
+        seen = set()
+
+        def add(url):
+            entry = self.entries.get(url)
+            if entry is not None and url not in seen:
+                seen.add(url)
+                results.append(entry)
+
+        # Entries changed since the last rebuild are checked first, their indexed copy may be stale
+        recent = sorted((self.entries[url] for url in self._overlay if url in self.entries),
+                        key=lambda e: e[LAST_VISIT], reverse=True)
+        for entry in recent:
+            if not needle or needle in _search_key(entry[URL]) or needle in entry[TITLE].lower():
+                add(entry[URL])
+            else:
+                seen.add(entry[URL])
+            if len(results) >= limit:
+                return results
+
+        if not needle:
+            # The index is ordered by recency, so the most recent visits come first
+            for url in line_urls:
+                add(url)
+                if len(results) >= limit:
+                    break
+            return results
+
+        key = _search_key(needle)
+        i = bisect_left(sorted_keys, key)
+        while i < len(sorted_keys) and sorted_keys[i].startswith(key) and len(results) < limit:
+            add(sorted_urls[i])
+            i += 1
+
+        # Substring search runs in C over one string holding every "key<TAB>title" line
+        pos = haystack.find(needle)
+        while pos != -1 and len(results) < limit:
+            line = bisect_right(line_offsets, pos) - 1
+            add(line_urls[line])
+            next_line = line + 1
+            if next_line >= len(line_offsets):
+                break
+            pos = haystack.find(needle, line_offsets[next_line])
+
+        return results
+
+    def _schedule_rebuild(self):
+        """Rebuild the search index from a snapshot on a background thread"""
+        if self._index_building:
+            self._index_dirty = True
+            return
+        self._index_building = True
+        self._index_dirty = False
+        snapshot = [(e[URL], e[TITLE], e[LAST_VISIT]) for e in self.entries.values()]
+        t = threading.Thread(target=self._build_index, args=(snapshot, self._generation))
+        t.daemon = True
+        t.start()
+
+    def _build_index(self, snapshot, generation):
+        snapshot.sort(key=lambda e: e[2], reverse=True)
+
+        keyed = sorted((_search_key(url), url) for url, _, _ in snapshot)
+        sorted_keys = [k for k, _ in keyed]
+        sorted_urls = [u for _, u in keyed]
+
+        lines = [f"{_search_key(url)}\t{title.lower()}\n" for url, title, _ in snapshot]
+        line_offsets = []
+        position = 0
+        for line in lines:
+            line_offsets.append(position)
+            position += len(line)
+        line_urls = [url for url, _, _ in snapshot]
+
+        self.index_built.emit((sorted_keys, sorted_urls, "".join(lines), line_offsets, line_urls), generation)
+
+    def _on_index_built(self, index, generation):
+        self._index = index
+        # Keep only changes made after the snapshot was taken
+        self._overlay = {url: gen for url, gen in self._overlay.items() if gen > generation}
+        self._index_building = False
+        if self._index_dirty:
+            self._schedule_rebuild()
+
+    def _on_index_loaded(self, rows):
+        # Visits recorded while the database was loading take precedence
+        for row in rows:
+            if row[URL] not in self.entries:
+                self.entries[row[URL]] = list(row)
+        self._schedule_rebuild()
+        logger.info(f"History loaded with {len(rows)} entries")
+
+    # Writer thread
+
+    def _writer_loop(self):
+        try:
+            db = sqlite3.connect(self.db_path)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS history (
+                    url TEXT PRIMARY KEY,
+                    title TEXT NOT NULL DEFAULT '',
+                    visit_count INTEGER NOT NULL DEFAULT 0,
+                    last_visit REAL NOT NULL
+                )""")
+            db.execute("CREATE INDEX IF NOT EXISTS history_last_visit ON history (last_visit)")
+            db.commit()
+            rows = db.execute("SELECT url, title, visit_count, last_visit FROM history").fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"History database unavailable: {e}")
+            return
+        self.index_loaded.emit(rows)
+
+        running = True
+        while running:
+            batch = []
+            try:
+                batch.append(self._queue.get())
+                deadline = time.monotonic() + FLUSH_INTERVAL
+                while len(batch) < MAX_BATCH_SIZE:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                pass
+
+            if None in batch:
+                running = False
+                batch = batch[:batch.index(None)]
+            try:
+                with tracing.span("History flush", "io", operations=len(batch)):
+                    self._write_batch(db, batch)
+            except sqlite3.Error as e:
+                logger.error(f"Error writing history: {e}")
+        db.close()
+
+    def _write_batch(self, db, batch):
+        visits = [args for op, args in batch if op == "visit"]
+        titles = [args for op, args in batch if op == "title"]
+        compactions = [args for op, args in batch if op == "compact"]
+
+        with db:
+            if visits:
+                db.executemany("""
+                    INSERT INTO history (url, title, visit_count, last_visit) VALUES (?, ?, 1, ?)
+                    ON CONFLICT(url) DO UPDATE SET
+                        title = CASE WHEN excluded.title != '' THEN excluded.title ELSE title END,
+                        visit_count = visit_count + 1,
+                        last_visit = excluded.last_visit""", visits)
+            if titles:
+                db.executemany("UPDATE history SET title = ? WHERE url = ?", titles)
+            for cutoff, max_entries in compactions[-1:]:
+                db.execute("DELETE FROM history WHERE last_visit < ?", (cutoff,))
+                db.execute("DELETE FROM history WHERE url NOT IN "
+                           "(SELECT url FROM history ORDER BY last_visit DESC LIMIT ?)", (max_entries,))
+
+        if compactions:
+            db.execute("PRAGMA incremental_vacuum")
+            db.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            db.execute("PRAGMA optimize")
+            logger.info("History database compacted")
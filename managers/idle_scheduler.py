@@ -0,0 +1,170 @@
+import gc
+import time
+import logging
+from PySide6.QtCore import QObject, QTimer, QEvent, Qt
+from PySide6.QtGui import QPixmapCache
+from PySide6.QtWidgets import QApplication
+from utils import tracing
+
+logger = logging.getLogger(__name__)
+
+# The app counts as idle once it is in the background with no input for this long
+IDLE_AFTER_SECONDS = 20
+CHECK_INTERVAL_MS = 5000
+# Work done per slice before control goes back to the event loop
+SLICE_MS = 8
+# Objects alive this long after startup are moved out of the collector's reach
+STARTUP_FREEZE_DELAY_MS = 60000
+
+INPUT_EVENTS = frozenset({
+    QEvent.KeyPress, QEvent.MouseButtonPress, QEvent.MouseMove, QEvent.Wheel,
+    QEvent.TouchBegin, QEvent.TouchUpdate, QEvent.ShortcutOverride,
+})
+
+
+class IdleJob:
+    def __init__(self, name, steps, interval, deadline):
+        # steps returns an iterator, each next() on it does one short piece of the work
+        self.name = name
+        self.steps = steps
+        self.interval = interval
+        self.deadline = deadline
+        self.next_run = time.monotonic() + interval
+        self.iterator = None
+        self.runs = 0
+
+
+class IdleScheduler(QObject):
+    """Runs low-priority maintenance in short slices while the app is idle, and stops on input"""
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.jobs = []
+        self.current = None
+        self.last_input = time.monotonic()
+        self.interrupted = False
+
+        self.check_timer = QTimer(self)
+        self.check_timer.timeout.connect(self.check)
+        self.check_timer.start(CHECK_INTERVAL_MS)
+
+        self.slice_timer = QTimer(self)
+        self.slice_timer.setSingleShot(True)
+        self.slice_timer.timeout.connect(self.run_slice)
+
+    def schedule(self, name, steps, interval, deadline=None):
+        """Run steps() every interval seconds when idle, or once deadline seconds overdue regardless"""
+        job = IdleJob(name, steps, interval, deadline)
+        self.jobs.append(job)
+        return job
+
+    def schedule_once(self, name, steps, delay, deadline=None):
+        job = self.schedule(name, steps, delay, deadline)
+        job.interval = None
+        return job
+
+    def watch_window(self, window):
+        """Watch a browser window for input.
+
+        The filter sits on the window's QWindow, which gets each input event once before it is
+        passed on to a widget, an app-wide filter would run for every event of every object.
+        Input in other windows doesn't count, the app isn't idle while it is active anyway.
+        """
+        # Creates the native window, which happens on show anyway
+        window.winId()
+        window.windowHandle().installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() in INPUT_EVENTS:
+            self.last_input = time.monotonic()
+            if self.current is not None and not self.interrupted:
+                # The job keeps its place and resumes in the next idle period
+                self.interrupted = True
+                self.slice_timer.stop()
+        return False
+
+    def is_idle(self):
+        if time.monotonic() - self.last_input < IDLE_AFTER_SECONDS:
+            return False
+        if QApplication.applicationState() == Qt.ApplicationActive:
+            return False
+        return not any(tab.webview.page().isLoading() for tab in self.window_manager.all_tabs())
+
+    def _due_job(self):
+        now = time.monotonic()
+        idle = None
+        # A job that was interrupted continues before new ones start
+        for job in sorted(self.jobs, key=lambda job: job.iterator is None):
+            if now < job.next_run:
+                continue
+            if job.deadline is not None and now - job.next_run >= job.deadline:
+                return job
+            if idle is None:
+                idle = self.is_idle()
+            if idle:
+                return job
+        return None
+
+    def check(self):
+        if self.current is not None and not self.interrupted:
+            return
+        job = self._due_job()
+        if job is None:
+            return
+        self.interrupted = False
+        self.current = job
+        if job.iterator is None:
+            job.iterator = iter(job.steps())
+            logger.info(f"Idle job started: {job.name}")
+        self.slice_timer.start(0)
+
+    def run_slice(self):
+        job = self.current
+        if job is None or self.interrupted:
+            return
+        end = time.perf_counter() + SLICE_MS / 1000
+        with tracing.span("Idle slice", "idle", job=job.name):
+            try:
+                while time.perf_counter() < end:
+                    next(job.iterator)
+            except StopIteration:
+                self._finish(job)
+                return
+            except Exception as e:
+                logger.error(f"Idle job {job.name} failed: {e}")
+                self._finish(job)
+                return
+        self.slice_timer.start(0)
+
+    def _finish(self, job):
+        job.iterator = None
+        job.runs += 1
+        self.current = None
+        if job.interval is None:
+            self.jobs.remove(job)
+        else:
+            job.next_run = time.monotonic() + job.interval
+        logger.info(f"Idle job finished: {job.name}")
+        # Another job may be due as well
+        self.check()
+
+
+def collect_garbage():
+    """One full collection as its own step, a full one already includes the younger generations"""
+    yield
+    gc.collect()
+    yield
+
+
+def freeze_startup_objects():
+    """Collect once, then keep everything allocated during startup out of later collections"""
+    yield from collect_garbage()
+    gc.freeze()
+    logger.info(f"{gc.get_freeze_count()} startup objects frozen")
+
+
+def trim_caches():
+    """Drop cached pixmaps and old trace files"""
+    QPixmapCache.clear()
+    yield
+    yield from tracing.prune_traces()
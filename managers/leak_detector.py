@@ -0,0 +1,160 @@
+import gc
+import os
+import sys
+import time
+import logging
+import tracemalloc
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QApplication
+from utils import qt_async
+
+logger = logging.getLogger(__name__)
+
+# Frames kept per allocation, each one more multiplies tracemalloc's own overhead
+TRACEBACK_FRAMES = 1
+MAX_SNAPSHOTS = 10
+TOP_SITES = 50
+# Allocations of the tracing machinery itself, they grow with every snapshot
+IGNORED_FILES = (tracemalloc.__file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>",
+                 "<unknown>")
+# Classes that leak together with a tab, counted by Qt class name
+COUNTED_TYPES = ("BrowserTab", "QWebEngineView", "QWebEnginePage")
+
+
+class Snapshot:
+    __slots__ = ("taken", "snapshot", "traced_bytes", "counts")
+
+    def __init__(self, taken, snapshot, traced_bytes, counts):
+        self.taken = taken
+        self.snapshot = snapshot
+        self.traced_bytes = traced_bytes
+        self.counts = counts
+
+
+class Growth:
+    """Allocations of one module or source line that changed between two snapshots"""
+    __slots__ = ("site", "size", "size_diff", "count", "count_diff")
+
+    def __init__(self, site, size=0, size_diff=0, count=0, count_diff=0):
+        self.site = site
+        self.size = size
+        self.size_diff = size_diff
+        self.count = count
+        self.count_diff = count_diff
+
+
+def _module_names():
+    """Source file -> module name of everything imported"""
+    names = {}
+    for name, module in list(sys.modules.items()):
+        path = getattr(module, "__file__", None)
+        if path:
+            names[os.path.normcase(os.path.abspath(path))] = name
+    return names
+
+
+def _module_of(filename, names):
+    module = names.get(os.path.normcase(os.path.abspath(filename)))
+    return module or os.path.basename(filename)
+
+
+def _take_snapshot():
+    """Runs on the worker pool, filtered once here rather than on every comparison"""
+    return tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(False, path) for path in IGNORED_FILES])
+
+
+def _compare(old, new, by_module, names):
+    """Runs on the worker pool, comparing snapshots takes seconds on a large heap"""
+    if not by_module:
+        growth = []
+        for diff in new.compare_to(old, "lineno")[:TOP_SITES]:
+            frame = diff.traceback[0]
+            growth.append(Growth(f"{_module_of(frame.filename, names)}:{frame.lineno}", diff.size, diff.size_diff,
+                                 diff.count, diff.count_diff))
+        return growth
+
+    modules = {}
+    for diff in new.compare_to(old, "filename"):
+        module = _module_of(diff.traceback[0].filename, names)
+        entry = modules.get(module)
+        if entry is None:
+            entry = modules[module] = Growth(module)
+        entry.size += diff.size
+        entry.size_diff += diff.size_diff
+        entry.count += diff.count
+        entry.count_diff += diff.count_diff
+    return sorted(modules.values(), key=lambda entry: abs(entry.size_diff), reverse=True)[:TOP_SITES]
+
+
+class LeakDetector(QObject):
+    """Python heap snapshots with tracemalloc, and counts of objects that tabs should free with them.
+
+    Tracing slows allocation down, so it only runs after it is started from Diagnostics.
+    """
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.snapshots = []
+        self.busy = False
+
+    def is_tracing(self):
+        return tracemalloc.is_tracing()
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEBACK_FRAMES)
+            logger.info("Started tracing Python allocations")
+
+    def stop(self):
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            # Snapshots can't be compared with ones of another tracing run
+            self.snapshots.clear()
+            logger.info("Stopped tracing Python allocations")
+
+    def traced_memory(self):
+        """Current and peak bytes of traced allocations"""
+        return tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+
+    def count_objects(self):
+        """Live objects of COUNTED_TYPES, and the number of open tabs.
+
+        Walks the Qt object trees rather than gc.get_objects(), which misses objects frozen by the
+        idle scheduler. A closed tab that is still referenced is a hidden top level widget.
+        """
+        counts = dict.fromkeys(COUNTED_TYPES, 0)
+        # None of these roots has a parent, so no object is counted twice
+        for root in [QApplication.instance(), self.window_manager] + QApplication.topLevelWidgets():
+            for obj in [root] + root.findChildren(QObject):
+                name = obj.metaObject().className()
+                if name in counts:
+                    counts[name] += 1
+        counts["Open tabs"] = len(self.window_manager.all_tabs())
+        return counts
+
+    async def take_snapshot(self):
+        """Snapshot the heap on the worker pool, collecting garbage first so only live objects remain"""
+        if not tracemalloc.is_tracing() or self.busy:
+            return None
+        self.busy = True
+        try:
+            gc.collect()
+            counts = self.count_objects()
+            snapshot = await qt_async.run_blocking(_take_snapshot)
+            entry = Snapshot(time.time(), snapshot, tracemalloc.get_traced_memory()[0], counts)
+            self.snapshots.append(entry)
+            if len(self.snapshots) > MAX_SNAPSHOTS:
+                self.snapshots.pop(0)
+            logger.info(f"Heap snapshot taken, {entry.traced_bytes / 1024 ** 2:.1f} MB traced, {counts}")
+            return entry
+        finally:
+            self.busy = False
+
+    async def compare(self, old, new, by_module=True):
+        """Allocation sites sorted by how much they grew from the old snapshot to the new one"""
+        return await qt_async.run_blocking(_compare, old.snapshot, new.snapshot, by_module, _module_names())
+
+    async def export_async(self, snapshot, path):
+        """Written in tracemalloc's format, tracemalloc.Snapshot.load() reads it back for comparing elsewhere"""
+        await qt_async.run_blocking(snapshot.snapshot.dump, path)
+        logger.info(f"Heap snapshot exported to {path}")
@@ -0,0 +1,186 @@
+import logging
+from PySide6.QtCore import QObject
+from PySide6.QtWebEngineCore import QWebEngineScript
+
+logger = logging.getLogger(__name__)
+
+LEVEL_OFF = "off"
+LEVEL_ACTIVE = "active"
+LEVEL_BACKGROUND = "background"
+
+# Injected into every page of the profile. Adds a style sheet whose rules depend on the level the
+# tab is at, and marks images and frames for lazy loading as they are added.
+LIGHTWEIGHT_SCRIPT = """
+(function() {
+    if (window.__searchtabsLite) {
+        return;
+    }
+
+    var STYLES = {
+        active: "*, *::before, *::after { transition-duration: 0s !important; transition-delay: 0s !important;" +
+                " backdrop-filter: none !important; scroll-behavior: auto !important; }",
+        background: "*, *::before, *::after { transition: none !important; animation: none !important;" +
+                    " backdrop-filter: none !important; scroll-behavior: auto !important; }" +
+                    " img, video, canvas, iframe { content-visibility: auto; }"
+    };
+
+    var style = document.createElement('style');
+    style.id = 'searchtabs-lightweight';
+    var level = 'active';
+    var paused = [];
+
+    function lazify(element) {
+        var tag = element.tagName;
+        if ((tag === 'IMG' || tag === 'IFRAME') && !element.hasAttribute('loading')) {
+            element.setAttribute('loading', 'lazy');
+            if (tag === 'IMG') {
+                element.decoding = 'async';
+            }
+        } else if ((tag === 'VIDEO' || tag === 'AUDIO') && element.paused && !element.hasAttribute('preload')) {
+            element.preload = 'none';
+        }
+    }
+
+    function lazifyTree(root) {
+        if (root.nodeType !== 1) {
+            return;
+        }
+        lazify(root);
+        var elements = root.querySelectorAll('img, iframe, video, audio');
+        for (var i = 0; i < elements.length; i++) {
+            lazify(elements[i]);
+        }
+    }
+
+    function setLevel(newLevel) {
+        level = newLevel;
+        style.textContent = STYLES[level] || '';
+        if (level === 'background') {
+            // Decorative muted videos stop, anything with sound keeps playing
+            var videos = document.querySelectorAll('video');
+            for (var i = 0; i < videos.length; i++) {
+                if (!videos[i].paused && videos[i].muted) {
+                    videos[i].pause();
+                    paused.push(videos[i]);
+                }
+            }
+        } else {
+            paused.forEach(function(video) { video.play().catch(function() {}); });
+            paused = [];
+        }
+    }
+
+    function start() {
+        document.documentElement.appendChild(style);
+        setLevel(level);
+        lazifyTree(document.documentElement);
+        new MutationObserver(function(records) {
+            if (level === 'off') {
+                return;
+            }
+            for (var i = 0; i < records.length; i++) {
+                var added = records[i].addedNodes;
+                for (var j = 0; j < added.length; j++) {
+                    lazifyTree(added[j]);
+                }
+            }
+        }).observe(document.documentElement, {childList: true, subtree: true});
+    }
+
+    if (document.documentElement) {
+        start();
+    } else {
+        // Scripts injected at document creation run before the root element exists
+        var rootObserver = new MutationObserver(function() {
+            if (document.documentElement) {
+                rootObserver.disconnect();
+                start();
+            }
+        });
+        rootObserver.observe(document, {childList: true});
+    }
+    window.__searchtabsLite = setLevel;
+})();
+"""
+
+
+class LightweightModeManager(QObject):
+    """Reduces animations, blur effects and media loading in pages, fully in background tabs"""
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.profile = window_manager.profile
+        self.settings = window_manager.settings
+        self.enabled = self.settings.value("lightweight_mode")
+
+        # One script on the shared profile covers the pages of all tabs and windows
+        self.script = QWebEngineScript()
+        self.script.setName("searchtabs-lightweight")
+        self.script.setSourceCode(LIGHTWEIGHT_SCRIPT)
+        self.script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+        self.script.setWorldId(QWebEngineScript.ScriptWorldId.ApplicationWorld)
+        self.script.setRunsOnSubFrames(False)
+        if self.enabled:
+            self.profile.scripts().insert(self.script)
+
+        self.settings.changed.connect(self._on_setting_changed)
+
+    def set_enabled(self, enabled):
+        self.settings.set_value("lightweight_mode", enabled)
+
+    def _on_setting_changed(self, key, value):
+        if key == "lightweight_mode":
+            self._apply_enabled(value)
+
+    def _apply_enabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        if enabled:
+            self.profile.scripts().insert(self.script)
+        else:
+            self.profile.scripts().remove(self.script)
+        # Pages that are already open are switched over in place
+        for tab in self.window_manager.all_tabs():
+            if enabled:
+                self._run(tab, LIGHTWEIGHT_SCRIPT)
+            self.apply_level(tab)
+        logger.info(f"Lightweight mode {'enabled' if enabled else 'disabled'}")
+
+    def watch_window(self, window):
+        window.lightweight_current = None
+        window.tabs.currentChanged.connect(lambda index, window=window: self._on_current_changed(window))
+
+    def watch_tab(self, tab):
+        # New documents start at the active level, background tabs are lowered once loaded
+        tab.webview.loadFinished.connect(lambda ok, tab=tab: self._on_load_finished(tab))
+
+    def _on_load_finished(self, tab):
+        if self.enabled:
+            self.apply_level(tab)
+
+    def _on_current_changed(self, window):
+        previous = window.lightweight_current
+        current = window.tabs.currentWidget()
+        window.lightweight_current = current
+        if not self.enabled:
+            return
+        if previous is not None and previous is not current:
+            self.apply_level(previous)
+        if current is not None:
+            self.apply_level(current)
+
+    def level_for(self, tab):
+        if not self.enabled:
+            return LEVEL_OFF
+        window = getattr(tab, "window_owner", None)
+        if window is not None and window.tabs.currentWidget() is tab:
+            return LEVEL_ACTIVE
+        return LEVEL_BACKGROUND
+
+    def apply_level(self, tab):
+        self._run(tab, f"window.__searchtabsLite && window.__searchtabsLite('{self.level_for(tab)}');")
+
+    @staticmethod
+    def _run(tab, source):
+        tab.webview.page().runJavaScript(source, QWebEngineScript.ScriptWorldId.ApplicationWorld)
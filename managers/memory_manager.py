@@ -0,0 +1,194 @@
+import os
+import time
+import select
+import logging
+import threading
+from collections import deque
+from PySide6.QtCore import QObject, Signal, QTimer
+from PySide6.QtGui import QPixmapCache
+
+logger = logging.getLogger(__name__)
+
+PSI_PATH = "/proc/pressure/memory"
+MEMINFO_PATH = "/proc/meminfo"
+
+# Unprivileged PSI triggers need a window that is a multiple of 2 seconds
+PSI_TRIGGER = b"some 150000 2000000"
+POLL_INTERVAL_MS = 2000
+# Minimum time between two responses at the same level
+ACTION_COOLDOWN = 30.0
+# Shorter for discards, but as long as the PSI avg10 window, so one spike that keeps
+# avg10 high for a while doesn't discard a tab on every poll and trigger event
+CRITICAL_COOLDOWN = 10.0
+
+LEVEL_NORMAL, LEVEL_MODERATE, LEVEL_HIGH, LEVEL_CRITICAL = range(4)
+LEVEL_NAMES = ["Normal", "Moderate", "High", "Critical"]
+THRESHOLD_SETTINGS = {
+    LEVEL_MODERATE: "memory_moderate_available_pct",
+    LEVEL_HIGH: "memory_high_available_pct",
+    LEVEL_CRITICAL: "memory_critical_available_pct",
+}
+
+
+def read_psi():
+    """Returns the avg10 values of the 'some' and 'full' memory pressure lines"""
+    values = {"some": 0.0, "full": 0.0}
+    with open(PSI_PATH) as f:
+        for line in f:
+            kind, *fields = line.split()
+            for field in fields:
+                if field.startswith("avg10="):
+                    values[kind] = float(field[6:])
+    return values
+
+
+def read_meminfo():
+    """Returns (MemAvailable, MemTotal) in bytes"""
+    info = {}
+    with open(MEMINFO_PATH) as f:
+        for line in f:
+            key, value = line.split(":", 1)
+            if key in ("MemAvailable", "MemTotal"):
+                info[key] = int(value.split()[0]) * 1024
+    return info.get("MemAvailable", 0), info.get("MemTotal", 0)
+
+
+class MemoryPressureMonitor(QObject):
+    """Watches Linux PSI and available memory, and sheds tab memory in escalating steps"""
+    pressure_event = Signal()
+    action_taken = Signal(str)
+
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+
+        settings = window_manager.settings
+        self.enabled = settings.value("memory_monitor_enabled")
+        # Percentages of total memory still available below which each level starts
+        self.available_thresholds = {
+            level: settings.value(key) for level, key in THRESHOLD_SETTINGS.items()
+        }
+        settings.changed.connect(self._on_setting_changed)
+
+        self.mode = "Unavailable"
+        self.level = LEVEL_NORMAL
+        self.psi = {"some": 0.0, "full": 0.0}
+        self.mem_available = 0
+        self.mem_total = 0
+        self.actions = deque(maxlen=200)
+        self._last_action = {}
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(POLL_INTERVAL_MS)
+        self.poll_timer.timeout.connect(self.evaluate)
+        self.pressure_event.connect(self.evaluate)
+
+        if self.enabled and os.path.exists(MEMINFO_PATH):
+            self.start()
+        else:
+            logger.info("Memory pressure monitor disabled or not supported on this platform")
+
+    def _on_setting_changed(self, key, value):
+        for level, threshold_key in THRESHOLD_SETTINGS.items():
+            if key == threshold_key:
+                self.available_thresholds[level] = value
+
+    def start(self):
+        self.mode = "Polling"
+        if os.path.exists(PSI_PATH):
+            try:
+                fd = os.open(PSI_PATH, os.O_RDWR | os.O_NONBLOCK)
+                os.write(fd, PSI_TRIGGER)
+            except OSError as e:
+                logger.info(f"PSI triggers unavailable, polling instead: {e}")
+            else:
+                self.mode = "PSI trigger"
+                t = threading.Thread(target=self._psi_trigger_loop, args=(fd,), name="PSIMonitor")
+                t.daemon = True
+                t.start()
+        self.poll_timer.start()
+        logger.info(f"Memory pressure monitor started ({self.mode})")
+
+    def _psi_trigger_loop(self, fd):
+        poller = select.poll()
+        poller.register(fd, select.POLLPRI)
+        while True:
+            try:
+                for _, event in poller.poll():
+                    if event & select.POLLERR:
+                        logger.error("PSI trigger stopped reporting")
+                        os.close(fd)
+                        return
+                    if event & select.POLLPRI:
+                        self.pressure_event.emit()
+            except OSError as e:
+                logger.error(f"PSI trigger failed: {e}")
+                return
+
+    def evaluate(self):
+        try:
+            if os.path.exists(PSI_PATH):
+                self.psi = read_psi()
+            self.mem_available, self.mem_total = read_meminfo()
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading memory pressure: {e}")
+            return
+
+        level = self._compute_level()
+        if level != self.level:
+            logger.info(f"Memory pressure level {LEVEL_NAMES[self.level]} -> {LEVEL_NAMES[level]}")
+            self.level = level
+        self.respond(level)
+
+    def _compute_level(self):
+        available_pct = 100.0 * self.mem_available / self.mem_total if self.mem_total else 100.0
+        level = LEVEL_NORMAL
+        for candidate, threshold in self.available_thresholds.items():
+            if available_pct < threshold:
+                level = max(level, candidate)
+
+        # PSI reports the share of time tasks were stalled on memory in the last 10 seconds
+        if self.psi["full"] > 10:
+            level = max(level, LEVEL_CRITICAL)
+        elif self.psi["some"] > 25:
+            level = max(level, LEVEL_HIGH)
+        elif self.psi["some"] > 10:
+            level = max(level, LEVEL_MODERATE)
+        return level
+
+    def respond(self, level):
+        """Escalate through the responses up to the given level"""
+        if level >= LEVEL_MODERATE and self._cooled_down(LEVEL_MODERATE):
+            # Pixmaps that are only kept to be drawn faster, all of them can be made again
+            QPixmapCache.clear()
+            freed = self.window_manager.thumbnail_cache.release_memory()
+            self._record(LEVEL_MODERATE, f"Dropped cached pixmaps and {freed / 1024 ** 2:.1f} MB of thumbnails")
+
+        if level >= LEVEL_HIGH and self._cooled_down(LEVEL_HIGH):
+            frozen = [tab for tab in self._background_tabs() if tab.freeze()]
+            if frozen:
+                self._record(LEVEL_HIGH, f"Froze {len(frozen)} background tabs")
+
+        if level >= LEVEL_CRITICAL and self._cooled_down(LEVEL_CRITICAL):
+            # Discard one tab at a time so that memory is reclaimed gradually
+            candidates = [tab for tab in self._background_tabs() if not tab.is_discarded()]
+            if candidates:
+                tab = min(candidates, key=lambda t: t.last_active)
+                if tab.discard():
+                    self._record(LEVEL_CRITICAL, f"Discarded least recently used tab '{tab.webview.title()}'")
+
+    def _background_tabs(self):
+        # The current tab of every window counts as visible
+        visible = self.window_manager.visible_tabs()
+        return [tab for tab in self.window_manager.all_tabs() if tab not in visible]
+
+    def _cooled_down(self, level):
+        cooldown = CRITICAL_COOLDOWN if level == LEVEL_CRITICAL else ACTION_COOLDOWN
+        return time.monotonic() - self._last_action.get(level, -cooldown) >= cooldown
+
+    def _record(self, level, description):
+        self._last_action[level] = time.monotonic()
+        message = f"[{LEVEL_NAMES[level]}] {description}"
+        self.actions.append((time.time(), message))
+        logger.warning(f"Memory pressure response: {message}")
+        self.action_taken.emit(message)
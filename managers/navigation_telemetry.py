@@ -0,0 +1,187 @@
+import csv
+import json
+import time
+import logging
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from PySide6.QtCore import QObject
+from utils import qt_async
+
+logger = logging.getLogger(__name__)
+
+# Bucket upper bounds grow by 10% from 1 ms to about 5 minutes, so a percentile is within 10%
+BUCKET_GROWTH = 1.1
+BUCKET_BOUNDS_MS = []
+_bound = 1.0
+while _bound < 300000:
+    BUCKET_BOUNDS_MS.append(_bound)
+    _bound *= BUCKET_GROWTH
+del _bound
+
+# Twelve five minute slices, the histograms cover the last hour
+SLICE_SECONDS = 300
+SLICE_COUNT = 12
+# Origins beyond this are dropped least recently used first
+MAX_ORIGINS = 64
+RECENT_NAVIGATIONS = 500
+
+PERCENTILES = (50, 95, 99)
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+
+
+def write_json(path, data):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+
+
+class RollingHistogram:
+    """Load times in fixed log-scale buckets over a sliding window of time slices"""
+    def __init__(self):
+        # (slice start, bucket counts, failures), oldest first
+        self.slices = deque(maxlen=SLICE_COUNT)
+
+    def _current_slice(self, now):
+        start = int(now // SLICE_SECONDS) * SLICE_SECONDS
+        if not self.slices or self.slices[-1][0] != start:
+            self.slices.append((start, [0] * (len(BUCKET_BOUNDS_MS) + 1), [0]))
+        return self.slices[-1]
+
+    def record(self, duration_ms, ok, now=None):
+        now = time.time() if now is None else now
+        _, counts, failures = self._current_slice(now)
+        counts[bisect_left(BUCKET_BOUNDS_MS, duration_ms)] += 1
+        if not ok:
+            failures[0] += 1
+
+    def _merged(self, now):
+        oldest = now - SLICE_SECONDS * SLICE_COUNT
+        merged = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        failures = 0
+        for start, counts, slice_failures in self.slices:
+            if start + SLICE_SECONDS <= oldest:
+                continue
+            for i, count in enumerate(counts):
+                merged[i] += count
+            failures += slice_failures[0]
+        return merged, failures
+
+    def summary(self, now=None):
+        """Returns count, failures and the load time percentiles in milliseconds"""
+        merged, failures = self._merged(time.time() if now is None else now)
+        total = sum(merged)
+        result = {"count": total, "failures": failures}
+        for pct in PERCENTILES:
+            result[f"p{pct}"] = self._percentile(merged, total, pct)
+        return result
+
+    @staticmethod
+    def _percentile(counts, total, pct):
+        if not total:
+            return None
+        rank = total * pct / 100.0
+        seen = 0
+        for i, count in enumerate(counts):
+            seen += count
+            if seen >= rank:
+                # The bucket's upper bound, loads above the last bound report that bound
+                return BUCKET_BOUNDS_MS[min(i, len(BUCKET_BOUNDS_MS) - 1)]
+        return BUCKET_BOUNDS_MS[-1]
+
+    def buckets(self, now=None):
+        merged, _ = self._merged(time.time() if now is None else now)
+        return {f"{BUCKET_BOUNDS_MS[min(i, len(BUCKET_BOUNDS_MS) - 1)]:.1f}": count
+                for i, count in enumerate(merged) if count}
+
+
+class NavigationTelemetry(QObject):
+    """Times every page load of every tab and keeps rolling percentiles per origin and per tab"""
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.origins = OrderedDict()
+        self.tabs = {}
+        self.recent = deque(maxlen=RECENT_NAVIGATIONS)
+
+    def watch_tab(self, tab):
+        tab.navigation_started = None
+        tab.webview.loadStarted.connect(lambda tab=tab: self._on_load_started(tab))
+        tab.webview.loadFinished.connect(lambda ok, tab=tab: self._on_load_finished(tab, ok))
+        key = id(tab)
+        self.tabs[key] = RollingHistogram()
+        tab.destroyed.connect(lambda obj=None, key=key: self.tabs.pop(key, None))
+
+    def _on_load_started(self, tab):
+        tab.navigation_started = time.monotonic()
+
+    def _on_load_finished(self, tab, ok):
+        if tab.navigation_started is None:
+            return
+        duration_ms = (time.monotonic() - tab.navigation_started) * 1000
+        tab.navigation_started = None
+        url = tab.webview.url()
+        origin = f"{url.scheme()}://{url.host()}" if url.host() else url.scheme()
+        self.record(origin, id(tab), duration_ms, ok)
+        logger.info(f"Navigation to {origin} {'finished' if ok else 'failed'} in {duration_ms:.0f} ms")
+
+    def record(self, origin, tab_key, duration_ms, ok):
+        now = time.time()
+        histogram = self.origins.pop(origin, None)
+        if histogram is None:
+            histogram = RollingHistogram()
+            if len(self.origins) >= MAX_ORIGINS:
+                self.origins.popitem(last=False)
+        self.origins[origin] = histogram
+        histogram.record(duration_ms, ok, now)
+
+        if tab_key in self.tabs:
+            self.tabs[tab_key].record(duration_ms, ok, now)
+        self.recent.append({"time": now, "origin": origin, "duration_ms": round(duration_ms, 1), "ok": ok})
+
+    def origin_summaries(self):
+        return [(origin, histogram.summary()) for origin, histogram in self.origins.items()]
+
+    def tab_summaries(self):
+        """Summaries for the open tabs, labelled with their current title"""
+        summaries = []
+        for tab in self.window_manager.all_tabs():
+            histogram = self.tabs.get(id(tab))
+            if histogram is not None:
+                summaries.append((tab.webview.title() or tab.webview.url().toString(), histogram.summary()))
+        return summaries
+
+    def csv_rows(self):
+        rows = [["scope", "name", "count", "failures"] + [f"p{pct}_ms" for pct in PERCENTILES]]
+        for scope, summaries in (("origin", self.origin_summaries()), ("tab", self.tab_summaries())):
+            for name, summary in summaries:
+                rows.append([scope, name, summary["count"], summary["failures"]] +
+                            [summary[f"p{pct}"] for pct in PERCENTILES])
+        return rows
+
+    def json_data(self):
+        return {
+            "window_seconds": SLICE_SECONDS * SLICE_COUNT,
+            "origins": [dict(summary, origin=origin, buckets_ms=self.origins[origin].buckets())
+                        for origin, summary in self.origin_summaries()],
+            "tabs": [dict(summary, tab=name) for name, summary in self.tab_summaries()],
+            "recent": list(self.recent),
+        }
+
+    def export_csv(self, path):
+        write_csv(path, self.csv_rows())
+        logger.info(f"Navigation telemetry exported to {path}")
+
+    def export_json(self, path):
+        write_json(path, self.json_data())
+        logger.info(f"Navigation telemetry exported to {path}")
+
+    async def export_async(self, path, as_json=False):
+        """Snapshot the telemetry here and write the file on the worker pool"""
+        if as_json:
+            await qt_async.run_blocking(write_json, path, self.json_data())
+        else:
+            await qt_async.run_blocking(write_csv, path, self.csv_rows())
+        logger.info(f"Navigation telemetry exported to {path}")
@@ -0,0 +1,252 @@
+import json
+import time
+import logging
+from datetime import datetime, timezone
+from collections import deque
+from PySide6.QtCore import QObject
+from PySide6.QtWebEngineCore import QWebEngineScript, QWebEngineUrlRequestInterceptor
+from utils import qt_async
+from managers.navigation_telemetry import write_json
+
+logger = logging.getLogger(__name__)
+
+# Oldest requests are dropped beyond this
+MAX_REQUESTS = 5000
+# Timing entries a page keeps until they are collected
+MAX_PAGE_ENTRIES = 500
+
+# Records Resource Timing entries of the page, including the document itself, until collected
+TIMING_SCRIPT = """
+(function() {
+    if (window.__searchtabsNetwork || typeof PerformanceObserver === 'undefined') {
+        return;
+    }
+    var entries = [];
+    window.__searchtabsNetwork = entries;
+
+    function positive(end, start) {
+        return end > 0 && start > 0 ? Math.max(end - start, 0) : 0;
+    }
+
+    function add(list) {
+        list.getEntries().forEach(function(e) {
+            if (entries.length >= %d) {
+                entries.shift();
+            }
+            entries.push({
+                url: e.name,
+                type: e.initiatorType,
+                start: performance.timeOrigin + e.startTime,
+                duration: e.duration,
+                blocked: positive(e.domainLookupStart, e.fetchStart),
+                dns: positive(e.domainLookupEnd, e.domainLookupStart),
+                connect: positive(e.connectEnd, e.connectStart),
+                tls: positive(e.connectEnd, e.secureConnectionStart),
+                wait: positive(e.responseStart, e.requestStart),
+                receive: positive(e.responseEnd, e.responseStart),
+                size: e.transferSize || 0,
+                status: e.responseStatus || 0
+            });
+        });
+    }
+
+    new PerformanceObserver(add).observe({type: 'navigation', buffered: true});
+    new PerformanceObserver(add).observe({type: 'resource', buffered: true});
+})();
+""" % MAX_PAGE_ENTRIES
+
+COLLECT_SCRIPT = "JSON.stringify((window.__searchtabsNetwork || []).splice(0))"
+
+TIMING_PHASES = ("blocked", "dns", "connect", "wait", "receive")
+
+
+class NetworkRequest:
+    __slots__ = ("url", "method", "resource_type", "initiator", "first_party", "tab_key", "started",
+                 "timing")
+
+    def __init__(self, url, method, resource_type, initiator, first_party, tab_key, started):
+        self.url = url
+        self.method = method
+        self.resource_type = resource_type
+        self.initiator = initiator
+        self.first_party = first_party
+        self.tab_key = tab_key
+        # Seconds since the epoch, replaced by the page's own start time once its timing arrives
+        self.started = started
+        # Resource Timing entry of the request, None until the page reported it as complete
+        self.timing = None
+
+    @property
+    def duration_ms(self):
+        return self.timing["duration"] if self.timing else None
+
+
+class NetworkRequestInterceptor(QWebEngineUrlRequestInterceptor):
+    """Notes every request of the shared profile, it never changes or blocks one"""
+    def __init__(self, network_timing):
+        super().__init__(network_timing)
+        self.network_timing = network_timing
+
+    def interceptRequest(self, info):
+        self.network_timing.request_started(info)
+
+
+class NetworkTiming(QObject):
+    """Per-request timing of the shared profile, kept in a bounded ring buffer.
+
+    The interceptor sees each request as it starts, the page's Resource Timing entries
+    complete it with the phase durations once the page is asked for them.
+    """
+    def __init__(self, window_manager, profile):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.requests = deque(maxlen=MAX_REQUESTS)
+        # url -> requests still waiting for their timing entry, oldest first
+        self._pending = {}
+        # Current page url of each tab, requests are attributed to a tab by their first party url
+        self._tab_urls = {}
+        self._tab_titles = {}
+
+        self.interceptor = NetworkRequestInterceptor(self)
+        profile.setUrlRequestInterceptor(self.interceptor)
+
+        self.script = QWebEngineScript()
+        self.script.setName("searchtabs-network-timing")
+        self.script.setSourceCode(TIMING_SCRIPT)
+        self.script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentCreation)
+        self.script.setWorldId(QWebEngineScript.ScriptWorldId.ApplicationWorld)
+        self.script.setRunsOnSubFrames(False)
+        profile.scripts().insert(self.script)
+
+    def watch_tab(self, tab):
+        key = id(tab)
+        tab.webview.urlChanged.connect(lambda url, key=key: self._on_url_changed(key, url))
+        tab.webview.titleChanged.connect(lambda title, key=key: self._tab_titles.__setitem__(key, title))
+        # Collected at the end of each load, and whenever the waterfall of the tab is shown
+        tab.webview.loadFinished.connect(lambda ok, tab=tab: self.collect(tab))
+        tab.destroyed.connect(lambda obj=None, key=key: self._forget_tab(key))
+
+    def _on_url_changed(self, key, url):
+        self._tab_urls = {u: k for u, k in self._tab_urls.items() if k != key}
+        self._tab_urls[url.toString()] = key
+
+    def _forget_tab(self, key):
+        """Closed tabs are deleted, requests already recorded keep their tab key"""
+        self._tab_urls = {u: k for u, k in self._tab_urls.items() if k != key}
+        self._tab_titles.pop(key, None)
+
+    def request_started(self, info):
+        first_party = info.firstPartyUrl().toString()
+        request = NetworkRequest(
+            info.requestUrl().toString(),
+            bytes(info.requestMethod()).decode("ascii", "replace"),
+            info.resourceType().name.replace("ResourceType", ""),
+            info.initiator().toString(),
+            first_party,
+            self._tab_urls.get(first_party),
+            time.time(),
+        )
+        self._append(request)
+        self._pending.setdefault(request.url, deque()).append(request)
+
+    def _append(self, request):
+        if len(self.requests) == self.requests.maxlen:
+            evicted = self.requests[0]
+            waiting = self._pending.get(evicted.url)
+            if waiting and evicted in waiting:
+                waiting.remove(evicted)
+                if not waiting:
+                    del self._pending[evicted.url]
+        self.requests.append(request)
+
+    def collect(self, tab):
+        """Ask the page of the tab for the timing of its completed requests"""
+        try:
+            page = tab.webview.page()
+        except RuntimeError:
+            return
+        key = id(tab)
+        page.runJavaScript(COLLECT_SCRIPT, QWebEngineScript.ScriptWorldId.ApplicationWorld,
+                           lambda result, key=key: self._on_collected(key, result))
+
+    def _on_collected(self, key, result):
+        try:
+            entries = json.loads(result)
+        except (TypeError, ValueError):
+            return
+        for entry in entries:
+            self._complete(key, entry)
+
+    def _complete(self, key, entry):
+        request = None
+        waiting = self._pending.get(entry["url"])
+        if waiting:
+            for candidate in waiting:
+                if candidate.tab_key in (None, key):
+                    request = candidate
+                    break
+            if request is not None:
+                waiting.remove(request)
+                if not waiting:
+                    del self._pending[entry["url"]]
+        if request is None:
+            # Served without reaching the network stack, from memory or a service worker
+            request = NetworkRequest(entry["url"], "GET", entry["type"], "", "", key, 0)
+            self._append(request)
+        request.tab_key = key
+        request.started = entry["start"] / 1000
+        request.timing = entry
+
+    def tab_requests(self, key):
+        """Requests of one tab in start order, key None gives the ones no tab could be found for"""
+        return sorted((request for request in self.requests if request.tab_key == key),
+                      key=lambda request: request.started)
+
+    def tab_title(self, key):
+        return self._tab_titles.get(key, "")
+
+    def har_data(self):
+        """The buffer as a HAR 1.2 log, entries without timing have -1 for unknown phases"""
+        pages = {}
+        entries = []
+        for request in sorted(self.requests, key=lambda request: request.started):
+            page_id = f"tab_{request.tab_key}" if request.tab_key is not None else "other"
+            if page_id not in pages:
+                pages[page_id] = {
+                    "startedDateTime": _iso_time(request.started),
+                    "id": page_id,
+                    "title": self.tab_title(request.tab_key) if request.tab_key is not None else "Other",
+                    "pageTimings": {},
+                }
+            timing = request.timing or {}
+            timings = {phase: round(timing[phase], 1) if timing else -1 for phase in TIMING_PHASES}
+            timings["send"] = 0 if timing else -1
+            timings["ssl"] = round(timing["tls"], 1) if timing else -1
+            entries.append({
+                "pageref": page_id,
+                "startedDateTime": _iso_time(request.started),
+                "time": round(request.duration_ms, 1) if timing else -1,
+                "request": {"method": request.method, "url": request.url, "httpVersion": "",
+                            "headers": [], "queryString": [], "cookies": [], "headersSize": -1,
+                            "bodySize": -1},
+                "response": {"status": timing.get("status", 0), "statusText": "", "httpVersion": "",
+                             "headers": [], "cookies": [], "content": {"size": timing.get("size", 0),
+                                                                      "mimeType": ""},
+                             "redirectURL": "", "headersSize": -1, "bodySize": timing.get("size", -1)},
+                "cache": {},
+                "timings": timings,
+                "_resourceType": request.resource_type,
+                "_initiator": request.initiator,
+                "_firstPartyUrl": request.first_party,
+            })
+        return {"log": {"version": "1.2", "creator": {"name": "SearchTabs", "version": ""},
+                        "pages": list(pages.values()), "entries": entries}}
+
+    async def export_async(self, path):
+        """Snapshot the buffer here and write the file on the worker pool"""
+        await qt_async.run_blocking(write_json, path, self.har_data())
+        logger.info(f"Network timing exported to {path}")
+
+
+def _iso_time(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat(timespec="milliseconds")
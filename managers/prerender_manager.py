@@ -0,0 +1,301 @@
+import os
+import time
+import logging
+from collections import OrderedDict
+from PySide6.QtCore import QObject, QUrl, QFile, QIODevice, Slot
+from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtWebEngineCore import QWebEnginePage, QWebEngineScript
+from managers.memory_manager import LEVEL_NORMAL
+
+logger = logging.getLogger(__name__)
+
+# How long the pointer has to rest on a link before it is prerendered
+HOVER_DELAY_MS = 150
+# Assumed cost of a prerender whose renderer process is shared with open tabs
+ESTIMATED_PAGE_MB = 80
+
+# Reports resting on and leaving same-origin links, and takes over clicks on links being prerendered
+HOVER_SCRIPT = """
+(function() {
+    if (window.__searchtabsPrerender) {
+        return;
+    }
+    window.__searchtabsPrerender = true;
+
+    new QWebChannel(qt.webChannelTransport, function(channel) {
+        var bridge = channel.objects.prerender;
+        var hovered = null;
+        var timer = null;
+        var requested = {};
+
+        function linkAt(target) {
+            return target && target.closest ? target.closest('a[href]') : null;
+        }
+
+        function eligible(link) {
+            return link.origin === location.origin && !link.target && !link.hasAttribute('download') &&
+                   link.href.split('#')[0] !== location.href.split('#')[0];
+        }
+
+        document.addEventListener('mouseover', function(event) {
+            var link = linkAt(event.target);
+            if (link === hovered) {
+                return;
+            }
+            if (hovered) {
+                clearTimeout(timer);
+                if (requested[hovered.href]) {
+                    delete requested[hovered.href];
+                    bridge.leave(hovered.href);
+                }
+            }
+            hovered = link && eligible(link) ? link : null;
+            if (hovered) {
+                var href = hovered.href;
+                timer = setTimeout(function() {
+                    requested[href] = true;
+                    bridge.hover(href);
+                }, %d);
+            }
+        }, true);
+
+        document.addEventListener('click', function(event) {
+            if (event.button !== 0 || event.ctrlKey || event.metaKey || event.shiftKey || event.altKey) {
+                return;
+            }
+            var link = linkAt(event.target);
+            if (link && requested[link.href]) {
+                event.preventDefault();
+                event.stopImmediatePropagation();
+                delete requested[link.href];
+                bridge.activate(link.href);
+            }
+        }, true);
+    });
+})();
+""" % HOVER_DELAY_MS
+
+
+def read_process_rss(pid):
+    """Resident memory of a process in bytes, or None where /proc is not available"""
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+class PrerenderBridge(QObject):
+    """Object the hover script of a page talks to over the web channel.
+
+    Each page has its own, a prerendered page's bridge is handed to the tab that adopts the page.
+    """
+    def __init__(self, manager, tab, parent):
+        super().__init__(parent)
+        self.manager = manager
+        self.tab = tab
+
+    @Slot(str)
+    def hover(self, url):
+        self.manager.start(self.tab, url)
+
+    @Slot(str)
+    def leave(self, url):
+        self.manager.cancel(url)
+
+    @Slot(str)
+    def activate(self, url):
+        self.manager.activate(self.tab, url)
+
+
+class Prerender:
+    def __init__(self, url, page, bridge):
+        self.url = url
+        self.page = page
+        self.bridge = bridge
+        self.started = time.monotonic()
+        self.load_ms = None
+
+
+class PrerenderManager(QObject):
+    """Loads hovered same-origin links in hidden pages and swaps them in when clicked"""
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.profile = window_manager.profile
+        self.memory_monitor = window_manager.memory_monitor
+
+        self.settings = window_manager.settings
+        self.enabled = self.settings.value("prerender_enabled")
+        self.max_pages = self.settings.value("prerender_max_pages")
+        self.budget_mb = self.settings.value("prerender_memory_budget_mb")
+        self.settings.changed.connect(self._on_setting_changed)
+
+        # Oldest first, the oldest prerender is evicted to make room
+        self.prerenders = OrderedDict()
+        self.stats = {"started": 0, "used": 0, "cancelled": 0, "evicted": 0, "skipped": 0}
+
+        self.script = QWebEngineScript()
+        self.script.setName("searchtabs-prerender")
+        self.script.setSourceCode(self._load_webchannel_js() + HOVER_SCRIPT)
+        self.script.setInjectionPoint(QWebEngineScript.InjectionPoint.DocumentReady)
+        self.script.setWorldId(QWebEngineScript.ScriptWorldId.ApplicationWorld)
+        self.script.setRunsOnSubFrames(False)
+        if self.enabled:
+            self.profile.scripts().insert(self.script)
+
+        self.memory_monitor.pressure_event.connect(self._on_memory_pressure)
+
+    @staticmethod
+    def _load_webchannel_js():
+        f = QFile(":/qtwebchannel/qwebchannel.js")
+        if not f.open(QIODevice.ReadOnly):
+            logger.error("qwebchannel.js not found, link prerendering will not work")
+            return ""
+        source = bytes(f.readAll()).decode("utf-8")
+        f.close()
+        return source + "\n"
+
+    def set_enabled(self, enabled):
+        self.settings.set_value("prerender_enabled", enabled)
+
+    def _on_setting_changed(self, key, value):
+        if key == "prerender_enabled":
+            self._apply_enabled(value)
+        elif key == "prerender_max_pages":
+            self.max_pages = value
+            while len(self.prerenders) > self.max_pages:
+                self._evict_oldest()
+        elif key == "prerender_memory_budget_mb":
+            self.budget_mb = value
+            self._enforce_budget()
+
+    def _apply_enabled(self, enabled):
+        if enabled == self.enabled:
+            return
+        self.enabled = enabled
+        # Pages that are already open pick up the change on their next load
+        if enabled:
+            self.profile.scripts().insert(self.script)
+        else:
+            self.profile.scripts().remove(self.script)
+            self.cancel_all()
+        logger.info(f"Link prerendering {'enabled' if enabled else 'disabled'}")
+
+    def watch_tab(self, tab):
+        tab.prerender_bridge = PrerenderBridge(self, tab, tab)
+        self._attach_channel(tab.webview.page(), tab.prerender_bridge)
+        # An adopted prerendered page already has a channel, with its own bridge
+        tab.page_replaced.connect(lambda tab=tab: self._attach_channel(tab.webview.page(), tab.prerender_bridge))
+
+    def _attach_channel(self, page, bridge):
+        # The channel has to be in place before the page loads, the script connects on load
+        if page.webChannel() is not None:
+            return
+        channel = QWebChannel(page)
+        channel.registerObject("prerender", bridge)
+        page.setWebChannel(channel, QWebEngineScript.ScriptWorldId.ApplicationWorld)
+
+    def start(self, tab, url):
+        if not self.enabled:
+            return
+        if url in self.prerenders:
+            self.prerenders.move_to_end(url)
+            return
+
+        target = QUrl(url)
+        current = tab.webview.url()
+        if (target.scheme(), target.host(), target.port()) != (current.scheme(), current.host(), current.port()):
+            return
+        if self.memory_monitor.level > LEVEL_NORMAL:
+            self.stats["skipped"] += 1
+            logger.info(f"Prerender skipped under memory pressure: {url}")
+            return
+
+        while self.prerenders and (len(self.prerenders) >= self.max_pages or
+                                   self.memory_used_mb() + ESTIMATED_PAGE_MB > self.budget_mb):
+            self._evict_oldest()
+
+        page = QWebEnginePage(self.profile, self)
+        page.setAudioMuted(True)
+        # Until a tab adopts the page, hovers on it are reported for the tab that started it
+        bridge = PrerenderBridge(self, tab, page)
+        self._attach_channel(page, bridge)
+        prerender = Prerender(url, page, bridge)
+        page.loadFinished.connect(lambda ok, prerender=prerender: self._on_load_finished(prerender, ok))
+        self.prerenders[url] = prerender
+        page.load(target)
+        self.stats["started"] += 1
+        logger.info(f"Prerendering {url}")
+
+    def _on_load_finished(self, prerender, ok):
+        if self.prerenders.get(prerender.url) is not prerender:
+            return
+        if not ok:
+            self._discard(prerender.url)
+            return
+        prerender.load_ms = (time.monotonic() - prerender.started) * 1000
+        logger.info(f"Prerender ready in {prerender.load_ms:.0f} ms: {prerender.url}")
+        self._enforce_budget()
+
+    def cancel(self, url):
+        if url in self.prerenders:
+            self._discard(url)
+            self.stats["cancelled"] += 1
+
+    def cancel_all(self):
+        for url in list(self.prerenders):
+            self.cancel(url)
+
+    def _evict_oldest(self):
+        url = next(iter(self.prerenders))
+        self._discard(url)
+        self.stats["evicted"] += 1
+        logger.info(f"Prerender evicted: {url}")
+
+    def _discard(self, url):
+        prerender = self.prerenders.pop(url)
+        # Deleting the page stops a load that is still running
+        prerender.page.deleteLater()
+
+    def activate(self, tab, url):
+        """Swap the prerendered page into the tab, or navigate normally if there is none"""
+        prerender = self.prerenders.pop(url, None)
+        if prerender is None:
+            tab.webview.setUrl(QUrl(url))
+            return
+
+        prerender.page.setAudioMuted(False)
+        # Another tab than the one that started the prerender may be the one whose link was clicked
+        prerender.bridge.tab = tab
+        tab.adopt_page(prerender.page)
+        self.stats["used"] += 1
+        state = f"loaded in {prerender.load_ms:.0f} ms" if prerender.load_ms is not None else "still loading"
+        logger.info(f"Prerender used after {(time.monotonic() - prerender.started) * 1000:.0f} ms "
+                    f"({state}): {url}")
+
+    def memory_used_mb(self):
+        """Memory held by prerenders, measured for renderer processes of their own and estimated otherwise"""
+        tab_pids = {tab.webview.page().renderProcessPid() for tab in self.window_manager.all_tabs()}
+        counted_pids = set()
+        total = 0.0
+        for prerender in self.prerenders.values():
+            pid = prerender.page.renderProcessPid()
+            if pid in counted_pids:
+                continue
+            rss = read_process_rss(pid) if pid and pid not in tab_pids else None
+            if rss is None:
+                total += ESTIMATED_PAGE_MB
+            else:
+                counted_pids.add(pid)
+                total += rss / 1024 ** 2
+        return total
+
+    def _enforce_budget(self):
+        while self.prerenders and self.memory_used_mb() > self.budget_mb:
+            self._evict_oldest()
+
+    def _on_memory_pressure(self):
+        if self.prerenders:
+            logger.info("Memory pressure, cancelling prerenders")
+            self.cancel_all()
@@ -1,29 +1,87 @@
 import os
+import sys
+import time
 import logging
-from PySide6.QtCore import QStandardPaths, QSettings
+import subprocess
+from PySide6.QtCore import QStandardPaths
 from PySide6.QtWebEngineCore import QWebEngineProfile
-from PySide6.QtWidgets import QMessageBox
+from PySide6.QtWidgets import QMessageBox, QApplication
+from managers.network_timing import NetworkTiming
+from utils import qt_async
 
 logger = logging.getLogger(__name__)
 
+PROFILE_NAME = "searchtabs_profile"
+# A reset profile is renamed at startup and deleted later when the app is idle
+DISCARDED_SUFFIX = ".discarded-"
+
+
+def profile_path():
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), PROFILE_NAME)
+
+
+def discard_profile():
+    """Move the profile out of the way so the app starts with a fresh one right away"""
+    path = profile_path()
+    if not os.path.exists(path):
+        return
+    try:
+        os.rename(path, f"{path}{DISCARDED_SUFFIX}{int(time.time())}")
+        logger.info(f"Profile directory discarded: {path}")
+    except OSError as e:
+        logger.error(f"Error discarding profile directory: {e}")
+
+
+def delete_discarded_profiles():
+    """Idle job, deletes discarded profiles one file per step"""
+    appdatapath = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
+    try:
+        names = [name for name in os.listdir(appdatapath) if name.startswith(PROFILE_NAME + DISCARDED_SUFFIX)]
+    except OSError:
+        return
+    for name in names:
+        for root, dirs, files in os.walk(os.path.join(appdatapath, name), topdown=False):
+            for entry in files:
+                try:
+                    os.remove(os.path.join(root, entry))
+                except OSError as e:
+                    logger.error(f"Error removing {entry} from discarded profile: {e}")
+                yield
+            try:
+                os.rmdir(root)
+            except OSError as e:
+                logger.error(f"Error removing discarded profile directory {root}: {e}")
+            yield
+        logger.info(f"Discarded profile {name} deleted")
+
 
 class ProfileManager:
-    def __init__(self, browser_window):
-        self.browser_window = browser_window
-        # Assuming theme_manager is accessible from the browser_window
-        self.theme_manager = browser_window.theme_manager
+    def __init__(self, window_manager):
+        self.window_manager = window_manager
+        # Assuming theme_manager is accessible from the window_manager
+        self.theme_manager = window_manager.theme_manager
+        self.settings = window_manager.settings
 
     def setup_profile(self):
-        appdatapath = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-        profilepath = os.path.join(appdatapath, "searchtabs_profile")
-        profile = QWebEngineProfile("searchtabs_profile", self.browser_window)
+        profilepath = profile_path()
+        # One profile for all windows, it outlives each of them
+        profile = QWebEngineProfile(PROFILE_NAME, self.window_manager)
         profile.setPersistentStoragePath(profilepath)
         profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies)
         profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
-        profile.setHttpCacheMaximumSize(100 * 1024 * 1024)  # 100 MB cache
+        profile.setHttpCacheMaximumSize(self.settings.value("http_cache_mb") * 1024 * 1024)
         logger.info(f"Profile set up with path {profilepath}")
+        self.profile = profile
+        # Every request of every tab goes through the shared profile
+        self.network_timing = NetworkTiming(self.window_manager, profile)
+        self.settings.changed.connect(self._on_setting_changed)
         return profile
 
+    def _on_setting_changed(self, key, value):
+        if key == "http_cache_mb":
+            self.profile.setHttpCacheMaximumSize(value * 1024 * 1024)
+            logger.info(f"HTTP cache limit set to {value} MB")
+
     def reset_browser_data(self):
         """Mark browser data for deletion on next startup"""
         confirmation_dialog = QMessageBox(
@@ -31,7 +89,7 @@ class ProfileManager:
             "Reset Browser Data",
             "This will clear all browsing data and log you out of websites. The app will need to restart. Continue?",
             QMessageBox.Yes | QMessageBox.No,
-            self.browser_window
+            self.window_manager.current_window()
         )
         confirmation_dialog.setDefaultButton(QMessageBox.No)
 
@@ -42,15 +100,14 @@ class ProfileManager:
 
         if confirmation == QMessageBox.Yes:
             # Mark profile for deletion on next startup
-            settings = QSettings("YourOrganization", "SearchTabs")
-            settings.setValue("reset_profile", True)
+            self.settings.set_value("reset_profile", True)
 
             info_dialog = QMessageBox(
                 QMessageBox.Information,
                 "Data Marked for Reset",
                 "Browser data will be reset when the app restarts.",
                 QMessageBox.Ok,
-                self.browser_window
+                self.window_manager.current_window()
             )
 
             # Apply theme styling to the info message box
@@ -58,8 +115,13 @@ class ProfileManager:
 
             info_dialog.exec_()
 
-            # Restart the application
-            import sys
-            import subprocess
-            subprocess.Popen([sys.executable] + sys.argv)
-            sys.exit(0)
+            qt_async.spawn(self._restart(), name="Restart")
+
+    async def _restart(self):
+        """Start a new instance of the app and quit this one"""
+        # The new instance reads the reset flag at startup, it has to be on disk before that
+        await self.settings.sync_async()
+        # Forking copies the page tables of this process, which takes a while with many tabs open
+        await qt_async.run_blocking(subprocess.Popen, [sys.executable] + sys.argv)
+        # Leaves the event loop without closing the windows, which would ask for confirmation
+        QApplication.exit(0)
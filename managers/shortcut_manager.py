@@ -22,4 +22,36 @@ class ShortcutManager:
         closetabshortcut = QShortcut(QKeySequence("Ctrl+W"), self.browser_window)
         closetabshortcut.activated.connect(self.browser_window.close_current_tab)
 
+        # Next Tab shortcut (Ctrl+Tab)
+        nexttabshortcut = QShortcut(QKeySequence("Ctrl+Tab"), self.browser_window)
+        nexttabshortcut.activated.connect(lambda: self.browser_window.select_adjacent_tab(1))
+
+        # Previous Tab shortcut (Ctrl+Shift+Tab), Shift+Tab arrives as Backtab
+        previoustabshortcut = QShortcut(QKeySequence("Ctrl+Shift+Backtab"), self.browser_window)
+        previoustabshortcut.activated.connect(lambda: self.browser_window.select_adjacent_tab(-1))
+
+        # Archive Page shortcut (Ctrl+S)
+        archiveshortcut = QShortcut(QKeySequence("Ctrl+S"), self.browser_window)
+        archiveshortcut.activated.connect(self.browser_window.archive_manager.archive_current_tab)
+
+        # Search Archive shortcut (Ctrl+Shift+F)
+        searcharchiveshortcut = QShortcut(QKeySequence("Ctrl+Shift+F"), self.browser_window)
+        searcharchiveshortcut.activated.connect(self.browser_window.show_archive_search)
+
+        # Quick Open shortcut (Ctrl+K)
+        quickopenshortcut = QShortcut(QKeySequence("Ctrl+K"), self.browser_window)
+        quickopenshortcut.activated.connect(self.browser_window.show_quick_open)
+
+        # New Window shortcut (Ctrl+N)
+        newwindowshortcut = QShortcut(QKeySequence("Ctrl+N"), self.browser_window)
+        newwindowshortcut.activated.connect(self.browser_window.window_manager.new_window)
+
+        # Toggle Vertical Tabs shortcut (Ctrl+B)
+        verticaltabsshortcut = QShortcut(QKeySequence("Ctrl+B"), self.browser_window)
+        verticaltabsshortcut.activated.connect(self.browser_window.toggle_vertical_tabs)
+
+        # Export All Tabs shortcut (Ctrl+Shift+E)
+        exportshortcut = QShortcut(QKeySequence("Ctrl+Shift+E"), self.browser_window)
+        exportshortcut.activated.connect(self.browser_window.show_export_dialog)
+
         logger.info("Shortcuts configured")
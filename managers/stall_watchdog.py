@@ -0,0 +1,116 @@
+import sys
+import time
+import logging
+import threading
+import traceback
+from collections import deque, Counter
+from PySide6.QtCore import QObject, QTimer
+from managers.navigation_telemetry import RollingHistogram
+from utils import tracing
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL_MS = 100
+# A heartbeat this much later than due counts as a stall of the event loop
+STALL_THRESHOLD_MS = 250
+# How often the watchdog looks at the heartbeat, and samples the stack during a stall
+WATCHDOG_INTERVAL_MS = 50
+# Gaps this long are the machine sleeping rather than the app hanging
+MAX_STALL_SECONDS = 300
+RECENT_STALLS = 100
+STACK_LIMIT = 40
+
+
+class Stall:
+    __slots__ = ("started", "duration_ms", "stack", "samples")
+
+    def __init__(self, started, duration_ms, stack, samples):
+        self.started = started
+        self.duration_ms = duration_ms
+        # Most frequently sampled main thread stack, innermost frame last
+        self.stack = stack
+        self.samples = samples
+
+    @property
+    def location(self):
+        """The innermost frame of the stack, where the main thread was stuck"""
+        return self.stack[-1].strip().splitlines()[0] if self.stack else "unknown"
+
+
+class StallWatchdog(QObject):
+    """Notices when the Qt event loop stops running and records where the main thread was.
+
+    A timer on the main thread beats every 100 ms. A watchdog thread samples the main
+    thread's Python stack while the beat is overdue, and the main thread records the stall
+    with the stack seen most often once it runs again.
+    """
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.main_thread_id = threading.main_thread().ident
+        self.histogram = RollingHistogram()
+        self.recent = deque(maxlen=RECENT_STALLS)
+        self.total_stalls = 0
+
+        # Set by the first beat, the time before the event loop started is not a stall
+        self.last_beat = None
+        # Stacks sampled by the watchdog thread during the current stall
+        self._samples = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self.heartbeat_timer = QTimer(self)
+        self.heartbeat_timer.timeout.connect(self.beat)
+        self.heartbeat_timer.start(HEARTBEAT_INTERVAL_MS)
+
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def beat(self):
+        now = time.perf_counter()
+        if self.last_beat is None:
+            self.last_beat = now
+            return
+        late_ms = (now - self.last_beat) * 1000 - HEARTBEAT_INTERVAL_MS
+        # The beat was due one interval after the previous one, it is late from then on
+        started = self.last_beat + HEARTBEAT_INTERVAL_MS / 1000
+        self.last_beat = now
+        with self._lock:
+            samples, self._samples = self._samples, []
+        if late_ms >= STALL_THRESHOLD_MS and late_ms < MAX_STALL_SECONDS * 1000:
+            self._record(started, late_ms, samples)
+
+    def _record(self, started, duration_ms, samples):
+        stack = Counter(samples).most_common(1)[0][0] if samples else ()
+        stall = Stall(time.time() - (time.perf_counter() - started), duration_ms, list(stack), len(samples))
+        self.total_stalls += 1
+        self.histogram.record(duration_ms, True)
+        self.recent.append(stall)
+        # The stall on the main thread's track of the trace, with the stack that was sampled
+        tracing.complete("Event loop stall", "stall", started, duration_ms / 1000,
+                         location=stall.location, stack="".join(stack))
+        logger.warning(f"Event loop stalled for {duration_ms:.0f} ms in {stall.location}\n"
+                       + "".join(stack))
+
+    def _watch(self):
+        while not self._stop.wait(WATCHDOG_INTERVAL_MS / 1000):
+            last_beat = self.last_beat
+            if last_beat is None:
+                continue
+            overdue_ms = (time.perf_counter() - last_beat) * 1000 - HEARTBEAT_INTERVAL_MS
+            if overdue_ms < STALL_THRESHOLD_MS:
+                continue
+            frame = sys._current_frames().get(self.main_thread_id)
+            if frame is None:
+                continue
+            stack = tuple(traceback.format_stack(frame, limit=STACK_LIMIT))
+            del frame
+            with self._lock:
+                self._samples.append(stack)
+
+    def summary(self):
+        return self.histogram.summary()
+
+    def stop(self):
+        self._stop.set()
+        self.heartbeat_timer.stop()
@@ -0,0 +1,146 @@
+import logging
+from PySide6.QtCore import QObject, QTimer
+
+logger = logging.getLogger(__name__)
+
+# Pauses every playing media element, playback is left for the user to resume
+PAUSE_MEDIA_SCRIPT = """
+(function() {
+    document.querySelectorAll('video, audio').forEach(function(media) {
+        if (!media.paused) {
+            media.pause();
+        }
+    });
+    return true;
+})();
+"""
+
+
+class TabLifecycleManager(QObject):
+    """Freezes pages that are not visible after a grace period and thaws them on activation"""
+    def __init__(self, browser_window):
+        super().__init__(browser_window)
+        self.browser_window = browser_window
+
+        self.settings = browser_window.settings
+        self.enabled = self.settings.value("background_throttling")
+        self.grace_period_ms = self.settings.value("background_grace_seconds") * 1000
+        self.settings.changed.connect(self._on_setting_changed)
+
+        self.current_tab = None
+        self.minimized = False
+
+        self.browser_window.tabs.currentChanged.connect(self.on_current_changed)
+
+    def watch_tab(self, tab):
+        if hasattr(tab, "freeze_timer"):
+            # Tab moved in from another window, take it over from that window's manager
+            tab.freeze_timer.timeout.disconnect()
+        else:
+            tab.freeze_timer = QTimer(tab)
+            tab.freeze_timer.setSingleShot(True)
+            tab.throttled = False
+            # What throttling changed on the page, undone on thaw even if the freeze itself failed
+            tab.muted_by_lifecycle = False
+            tab.hidden_by_lifecycle = False
+        tab.freeze_timer.timeout.connect(lambda tab=tab: self.throttle(tab))
+
+    def set_enabled(self, enabled):
+        self.settings.set_value("background_throttling", enabled)
+
+    def _on_setting_changed(self, key, value):
+        if key == "background_throttling":
+            self._apply_enabled(value)
+        elif key == "background_grace_seconds":
+            # Timers that are already running keep their old interval
+            self.grace_period_ms = value * 1000
+
+    def _apply_enabled(self, enabled):
+        self.enabled = enabled
+        tabs = self.browser_window.tabs
+        for i in range(tabs.count()):
+            tab = tabs.widget(i)
+            if enabled and tab is not self.current_tab:
+                tab.freeze_timer.start(self.grace_period_ms)
+            elif not enabled:
+                self.thaw(tab)
+
+    def on_current_changed(self, index):
+        previous = self.current_tab
+        self.current_tab = self.browser_window.tabs.widget(index)
+
+        if self.current_tab is not None:
+            self.thaw(self.current_tab)
+        if previous is not None and previous is not self.current_tab and self.enabled:
+            try:
+                previous.freeze_timer.start(self.grace_period_ms)
+            except RuntimeError:
+                # Previous tab has been closed
+                pass
+
+    def on_window_state_changed(self, minimized):
+        if minimized == self.minimized:
+            return
+        self.minimized = minimized
+        if self.current_tab is None:
+            return
+        if minimized and self.enabled:
+            self.current_tab.freeze_timer.start(self.grace_period_ms)
+        elif not minimized:
+            self.thaw(self.current_tab)
+
+    def throttle(self, tab):
+        """Mute the page, pause its media, then freeze its scripts and timers"""
+        if not self.enabled or tab.throttled:
+            return
+        if tab is self.current_tab and not self.minimized:
+            return
+
+        page = tab.webview.page()
+        # A page the user muted stays muted when the tab is thawed
+        if not page.isAudioMuted():
+            page.setAudioMuted(True)
+            tab.muted_by_lifecycle = True
+        page.runJavaScript(PAUSE_MEDIA_SCRIPT, 0, lambda result, tab=tab: self._freeze(tab))
+
+    def _freeze(self, tab):
+        try:
+            # The tab may have been activated while the media was being paused
+            if tab is self.current_tab and not self.minimized:
+                self._restore(tab)
+                return
+            if tab is self.current_tab:
+                # A minimized window still counts as visible
+                tab.webview.page().setVisible(False)
+                tab.hidden_by_lifecycle = True
+            if tab.freeze():
+                tab.throttled = True
+                logger.info(f"Background tab frozen: {tab.webview.title()}")
+            else:
+                self._restore(tab)
+        except RuntimeError:
+            # Tab was closed in the meantime
+            pass
+
+    def _restore(self, tab):
+        """Unmute and show the page again if throttling muted or hid it"""
+        page = tab.webview.page()
+        if tab.hidden_by_lifecycle:
+            tab.hidden_by_lifecycle = False
+            if tab.webview.isVisible():
+                page.setVisible(True)
+        if tab.muted_by_lifecycle:
+            tab.muted_by_lifecycle = False
+            page.setAudioMuted(False)
+
+    def thaw(self, tab):
+        tab.freeze_timer.stop()
+        self._restore(tab)
+        if not tab.throttled:
+            return
+        tab.throttled = False
+        page = tab.webview.page()
+        if not page.isVisible() and tab.webview.isVisible():
+            page.setVisible(True)
+        tab.mark_active()
+        logger.info(f"Tab thawed: {tab.webview.title()}")
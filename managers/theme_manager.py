@@ -1,7 +1,9 @@
-from PySide6.QtCore import QObject, Signal, QSettings
+from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QPalette, QColor
 import darkdetect
 import threading
+from utils.settings import get_settings
+from utils import icons
 
 
 class ThemeManager(QObject):
@@ -28,24 +30,33 @@ class ThemeManager(QObject):
 
     def __init__(self):
         super().__init__()
-        self.settings = QSettings("SearchTabs", "Preferences")
-        self.current_theme = self.settings.value("theme", "System")
+        self.settings = get_settings()
+        self.current_theme = self.settings.value("theme")
+        self.settings.changed.connect(self._on_setting_changed)
+
+        # darkdetect runs a subprocess on Linux, the OS theme is asked once and then kept up to date by the listener
+        self._system_theme = None
 
         # Start theme listener if system theme is selected
+        self._listener_started = False
         if self.current_theme == "System":
             self._start_theme_listener()
 
     def set_theme(self, theme):
         if theme in ["Light", "Dark", "System"]:
-            old_theme = self.current_theme
-            self.current_theme = theme
-            self.settings.setValue("theme", theme)
+            self.settings.set_value("theme", theme)
+
+    def _on_setting_changed(self, key, theme):
+        if key != "theme":
+            return
+        old_theme = self.current_theme
+        self.current_theme = theme
 
-            # Start or stop the theme listener based on selection
-            if theme == "System" and old_theme != "System":
-                self._start_theme_listener()
+        # Start or stop the theme listener based on selection
+        if theme == "System" and old_theme != "System" and not self._listener_started:
+            self._start_theme_listener()
 
-            self.theme_changed.emit(theme)
+        self.theme_changed.emit(theme)
 
     def get_current_theme(self):
         return self.current_theme
@@ -53,7 +64,9 @@ class ThemeManager(QObject):
     def get_effective_theme(self):
         """Returns the actual theme to use (resolves System to Light/Dark)"""
         if self.current_theme == "System":
-            system_theme = darkdetect.theme()
+            if self._system_theme is None:
+                self._system_theme = darkdetect.theme()
+            system_theme = self._system_theme
             return system_theme if system_theme in ["Light", "Dark"] else "Dark"
         return self.current_theme
 
@@ -108,6 +121,20 @@ class ThemeManager(QObject):
             QPushButton:hover {{
                 background-color: {colors["button_hover"]};
             }}
+
+            QListView {{
+                background-color: {colors["tab_background"]};
+                color: {colors["text"]};
+                border: none;
+                outline: 0;
+            }}
+            QListView::item:selected {{
+                background-color: {colors["tab_selected"]};
+                color: {colors["text"]};
+            }}
+            QListView::item:hover {{
+                background-color: {colors["button_hover"]};
+            }}
         """
 
     def get_settings_window_stylesheet(self):
@@ -327,36 +354,39 @@ class ThemeManager(QObject):
 
     def _start_theme_listener(self):
         """Start a background thread to listen for OS theme changes"""
+        # A thread of its own rather than the qt_async pool, the listener blocks for the life of the app
         try:
             t = threading.Thread(target=darkdetect.listener, args=(self._on_system_theme_change,))
             t.daemon = True
             t.start()
+            self._listener_started = True
         except Exception as e:
             print(f"Failed to start theme listener: {e}")
 
     def _on_system_theme_change(self, new_theme):
         """Called when OS theme changes"""
+        self._system_theme = new_theme
         if self.current_theme == "System":
             # Emit the signal to trigger UI updates
             self.theme_changed.emit("System")
 
-    def get_themed_icon_path(self, icon_name):
-        """Returns the path to the appropriate themed icon based on current theme and icon name"""
+    def get_themed_icon(self, icon_name):
+        """Returns the shared icon for the current theme, icons are decoded once per process"""
         effective_theme = self.get_effective_theme()
 
         # Icon mapping dictionary
-        icon_paths = {
+        icon_names = {
             "Light": {
-                "home": "icons/final/home_dark.png",
-                "add": "icons/final/add_tab_dark.png",
-                "settings": "icons/final/tune_dark.png"
+                "home": "home_dark",
+                "add": "add_tab_dark",
+                "settings": "tune_dark"
             },
             "Dark": {
-                "home": "icons/final/home.png",
-                "add": "icons/final/add_tab.png",
-                "settings": "icons/final/tune.png"
+                "home": "home",
+                "add": "add_tab",
+                "settings": "tune"
             }
         }
 
         theme_key = "Light" if effective_theme == "Light" else "Dark"
-        return icon_paths[theme_key].get(icon_name, "icons/final/setting.png")  # Default to settings icon
+        return icons.icon(icon_names[theme_key].get(icon_name, icon_names[theme_key]["settings"]))
@@ -0,0 +1,198 @@
+import os
+import time
+import shutil
+import hashlib
+import logging
+from collections import OrderedDict
+from PySide6.QtCore import QObject, Qt, QSize, QTimer, QBuffer, QByteArray, QIODevice, QStandardPaths
+from PySide6.QtGui import QImage, QPixmap
+from utils import qt_async
+from utils import tracing
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZE = QSize(320, 200)
+JPEG_QUALITY = 80
+# Decoded thumbnails kept in memory, least recently used ones are dropped beyond this
+MEMORY_BUDGET_BYTES = 24 * 1024 * 1024
+DISK_BUDGET_BYTES = 64 * 1024 * 1024
+# Time the page gets to paint after loading before it is captured
+CAPTURE_DELAY_MS = 500
+# Captures of one tab are at least this far apart, tabs that are slow to grab wait longer
+MIN_CAPTURE_INTERVAL_SECONDS = 10
+# Grab time a capture may take on the GUI thread before its tab's interval is stretched
+CAPTURE_BUDGET_MS = 15
+# Tabs whose captures take longer than this on average are not captured anymore
+MAX_CAPTURE_MS = 150
+
+
+def _cache_key(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def _downscale(image):
+    """Runs on the worker pool, returns the thumbnail and its JPEG encoding"""
+    thumbnail = image.scaled(THUMBNAIL_SIZE, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+    thumbnail = thumbnail.copy(0, 0, min(thumbnail.width(), THUMBNAIL_SIZE.width()),
+                               min(thumbnail.height(), THUMBNAIL_SIZE.height()))
+    data = QByteArray()
+    buffer = QBuffer(data)
+    buffer.open(QIODevice.WriteOnly)
+    thumbnail.save(buffer, "JPEG", JPEG_QUALITY)
+    return thumbnail, bytes(data)
+
+
+def _write_file(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def thumbnail_directory():
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "thumbnails")
+
+
+def delete_thumbnails():
+    """Remove the thumbnails on disk, as when browser data is reset"""
+    try:
+        shutil.rmtree(thumbnail_directory())
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"Error deleting thumbnails: {e}")
+
+
+class ThumbnailCache(QObject):
+    """Small images of tab pages for previews and placeholders, keyed by page URL.
+
+    Pages are grabbed on the GUI thread, which is the only part that has to run there, and
+    downscaled on the worker pool. Thumbnails live in a byte-budgeted LRU in memory and are
+    written to a JPEG cache on disk as they are captured, which also keeps them across restarts.
+    """
+    def __init__(self, window_manager):
+        super().__init__(window_manager)
+        self.window_manager = window_manager
+        self.directory = thumbnail_directory()
+        # url -> thumbnail
+        self.memory = OrderedDict()
+        self.memory_bytes = 0
+        self.stats = {"captures": 0, "skipped": 0, "capture_ms": 0.0}
+
+    def watch_tab(self, tab):
+        tab.thumbnail_captured = 0.0
+        tab.thumbnail_cost_ms = 0.0
+        tab.webview.loadFinished.connect(lambda ok, tab=tab: self._on_load_finished(tab, ok))
+
+    def watch_window(self, window):
+        tabs = window.tabs
+        tabs.current_about_to_change.connect(lambda index, tabs=tabs: self._on_deactivated(tabs, index))
+
+    def _on_load_finished(self, tab, ok):
+        tab.hide_thumbnail()
+        if ok:
+            QTimer.singleShot(CAPTURE_DELAY_MS, lambda tab=tab: self.capture(tab))
+
+    def _on_deactivated(self, tabs, index):
+        tab = tabs.widget(index)
+        if tab is not None:
+            self.capture(tab)
+
+    def show_placeholder(self, tab):
+        """Cover a tab that is about to load with what its page looked like last time"""
+        pixmap = self.get(tab.webview.url().toString())
+        if pixmap is not None:
+            tab.show_thumbnail(pixmap)
+
+    def capture(self, tab):
+        """Grab the tab's page if it is on screen and was not captured recently"""
+        try:
+            webview = tab.webview
+            if not webview.isVisible() or tab.is_discarded() or webview.page().isLoading():
+                return
+        except RuntimeError:
+            # Tab was closed
+            return
+        url = webview.url().toString()
+        if not url:
+            return
+        interval = MIN_CAPTURE_INTERVAL_SECONDS * max(1.0, tab.thumbnail_cost_ms / CAPTURE_BUDGET_MS)
+        if tab.thumbnail_cost_ms > MAX_CAPTURE_MS or time.monotonic() - tab.thumbnail_captured < interval:
+            self.stats["skipped"] += 1
+            return
+
+        start = time.perf_counter()
+        with tracing.span("Capture thumbnail", "thumbnail"):
+            image = webview.grab().toImage()
+        cost_ms = (time.perf_counter() - start) * 1000
+        # Averaged so one slow frame doesn't stop captures of the tab
+        tab.thumbnail_cost_ms = cost_ms if not tab.thumbnail_captured else 0.7 * tab.thumbnail_cost_ms + 0.3 * cost_ms
+        tab.thumbnail_captured = time.monotonic()
+        self.stats["captures"] += 1
+        self.stats["capture_ms"] += cost_ms
+        if tab.thumbnail_cost_ms > MAX_CAPTURE_MS:
+            logger.info(f"Thumbnails of {url} take {tab.thumbnail_cost_ms:.0f} ms, no longer captured")
+        if not image.isNull():
+            qt_async.spawn(self._store_async(url, image), name="Store thumbnail")
+
+    async def _store_async(self, url, image):
+        thumbnail, data = await qt_async.run_blocking(_downscale, image)
+        self.put(url, thumbnail)
+        try:
+            await qt_async.run_blocking(_write_file, self._path(url), data)
+        except OSError as e:
+            logger.error(f"Error writing thumbnail of {url}: {e}")
+
+    def put(self, url, thumbnail):
+        """Keep a thumbnail in memory, it is already on disk"""
+        previous = self.memory.pop(url, None)
+        if previous is not None:
+            self.memory_bytes -= previous.sizeInBytes()
+        self.memory[url] = thumbnail
+        self.memory_bytes += thumbnail.sizeInBytes()
+        while self.memory_bytes > MEMORY_BUDGET_BYTES and len(self.memory) > 1:
+            evicted_url, evicted = self.memory.popitem(last=False)
+            self.memory_bytes -= evicted.sizeInBytes()
+
+    def _path(self, url):
+        return os.path.join(self.directory, _cache_key(url) + ".jpg")
+
+    def get(self, url):
+        """The thumbnail of a page as a pixmap, or None if it was never captured"""
+        thumbnail = self.memory.get(url)
+        if thumbnail is not None:
+            self.memory.move_to_end(url)
+            return QPixmap.fromImage(thumbnail)
+        path = self._path(url)
+        if not os.path.exists(path):
+            return None
+        # A small JPEG, reading it back is cheaper than a round trip to the worker pool
+        thumbnail = QImage(path)
+        if thumbnail.isNull():
+            return None
+        self.put(url, thumbnail)
+        return QPixmap.fromImage(thumbnail)
+
+    def release_memory(self):
+        """Drop the thumbnails held in memory, they are read back from disk when needed. Returns the bytes freed"""
+        freed = self.memory_bytes
+        self.memory.clear()
+        self.memory_bytes = 0
+        return freed
+
+    def trim_disk_cache(self):
+        """Idle job, deletes the least recently written thumbnails beyond the disk budget"""
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith(".jpg")]
+        except OSError:
+            return
+        yield
+        entries = sorted(entries, key=lambda entry: entry.stat().st_mtime, reverse=True)
+        total = 0
+        for entry in entries:
+            total += entry.stat().st_size
+            if total > DISK_BUDGET_BYTES:
+                try:
+                    os.remove(entry.path)
+                except OSError as e:
+                    logger.error(f"Error removing thumbnail {entry.path}: {e}")
+                yield
@@ -0,0 +1,94 @@
+"""Pre-scale the icons and compile them into resources/resources_rc.py.
+
+Run from the repository root after changing anything in icons/final:
+    python -m resources.build_resources
+"""
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QImage, QGuiApplication
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_DIR = os.path.join(ROOT, "icons", "final")
+OUTPUT = os.path.join(ROOT, "resources", "resources_rc.py")
+
+# Toolbar icons at 1x, 1.5x and 2x of the 16 and 24 px sizes styles use for buttons
+BUTTON_SIZES = (16, 24, 32, 48)
+# Window icon sizes, plus the 50 px logo of the About dialog and its 2x variant
+LOGO_SIZES = (16, 24, 32, 48, 50, 64, 100, 128, 256)
+SPLASH_MAX = 400
+
+BUTTON_ICONS = ["home", "home_dark", "add_tab", "add_tab_dark", "tune", "tune_dark"]
+LOGO_SOURCE = "logo_l.png"
+SPLASH_SOURCE = "logo_s.png"
+
+
+def scaled(image, size):
+    if image.width() <= size and image.height() <= size:
+        return image
+    return image.scaled(size, size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+
+def load(name):
+    image = QImage(os.path.join(SOURCE_DIR, name))
+    if image.isNull():
+        sys.exit(f"Could not read {name}")
+    return image
+
+
+def build(work_dir):
+    """Write the scaled images below work_dir and return their paths relative to it"""
+    files = []
+
+    def save(image, path):
+        full_path = os.path.join(work_dir, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if not image.save(full_path, "PNG"):
+            sys.exit(f"Could not write {path}")
+        files.append(path)
+
+    for name in BUTTON_ICONS:
+        image = load(f"{name}.png")
+        for size in BUTTON_SIZES:
+            save(scaled(image, size), f"icons/{name}/{size}.png")
+
+    logo = load(LOGO_SOURCE)
+    for size in LOGO_SIZES:
+        save(scaled(logo, size), f"logo/{size}.png")
+
+    save(scaled(load(SPLASH_SOURCE), SPLASH_MAX), "splash.png")
+    return files
+
+
+def write_qrc(work_dir, files):
+    path = os.path.join(work_dir, "resources.qrc")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<!DOCTYPE RCC>\n<RCC version="1.0">\n<qresource prefix="/searchtabs">\n')
+        for file in files:
+            f.write(f"    <file>{file}</file>\n")
+        f.write("</qresource>\n</RCC>\n")
+    return path
+
+
+def main():
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv)
+    rcc = shutil.which("pyside6-rcc")
+    if rcc is None:
+        sys.exit("pyside6-rcc not found, it is installed with PySide6")
+
+    work_dir = tempfile.mkdtemp(prefix="searchtabs_resources_")
+    try:
+        files = build(work_dir)
+        qrc = write_qrc(work_dir, files)
+        # PNGs are already compressed, zlib on top only costs decompression at startup
+        subprocess.run([rcc, "--no-compress", qrc, "-o", OUTPUT], check=True)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    print(f"Wrote {len(files)} images to {os.path.relpath(OUTPUT, ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
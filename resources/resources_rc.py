@@ -0,0 +1,11587 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6.8.2
+# WARNING! All changes made in this file will be lost!
+
+from PySide6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00${\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x03\x00\x00\x00\xf4\xe0\x91\xf9\
+\x00\x00\x03\x00PLTELiq\x00\x00\x00\x00\x00\
+\x00\x98\x9d\xb8\x00\x00\x00\x00\x00\x00\xdf\xe1\xf4\x00\x00\x00\
+\x00\x00\x00\x06\x06\x07\xdd\xde\xf1\xd2\xd3\xe558B\xae\
+\xae\xba\xbb\xc7\xe7\xe0\xdf\xf0\xa8\xae\xc5\x00\x00\x00\x00\x00\
+\x00=@K\xc4\xd1\xf2\xcb\xcb\xd9\xab\xb7\xd4\xe7\xe7\xf7\
+a\x99\xd2\x10\x11\x14\x98\x98\xa3\xcd\xce\xdc\xa0\xa3\xb3\xa1\
+\xab\xc7\x00\x00\x00;;?ou\x89\x00\x00\x00{\x84\
+\x9a\xdd\xdd\xec\x9e\xa8\xc5\x85\x8d\xa5\x9f\x9f\xab\xc5\xc5\xd3\
+\x00\x00\x00i\x87\xb2\x8b\x92\xaa\x9b\xa3\xbf\x9b\xa3\xbd\xa7\
+\xaf\xcb\xe9\xe9\xf9\xc9\xd5\xf7\xe7\xe7\xf9\xe3\xe5\xf9\xc7\xd3\
+\xf7\xdd\xe1\xf9\xdf\xe3\xf9\xc7\xd5\xf7\xd9\xdf\xf9\xe1\xe3\xf9\
+\xd3\xdb\xf9\xe5\xe7\xf9\xd5\xdd\xf9\xcf\xd9\xf7\xcb\xd7\xf7\xcd\
+\xd7\xf7\xdb\xe1\xf9\xcf\xd9\xf9\xd7\xdd\xf9\xeb\xe9\xf9\xe5\xe5\
+\xf9\xdb\xdf\xf9\xcb\xd5\xf7\xd1\xd9\xf9\xd1\xd9\xf7\xd1\xdb\xf9\
+\xe1\xe5\xf9\xd3\xdb\xf7\xcd\xd7\xf9\xc9\xd5\xf9\xe7\xe9\xf9\xe9\
+\xe7\xf9\xd5\xdc\xf9\xcb\xd7\xf9\xdf\xe1\xf9\xd5\xdc\xf7\xd9\xdf\
+\xf8\xd1\xdb\xf7\xd7\xdf\xf9\xdd\xe1\xf7l\xb9\xff\x19\x06+\
+\x14\x0b1\x10\x050[\xaa\xfa^\xae\xfed\xb0\xfe\x1c\
+\x0b1\xdf\xe2\xf7\x1c\x0b,!\x12:\x03\x00\x1c\xdb\xe0\
+\xf7\x0b\x00\x11\x13\x06*\x11\x06%\x1f\x0f5\xc8\xd4\xf9\
+Y\xa8\xf9 \x135\x06\x01#\x14\x0b,\x0d\x05*\x11\
+\x00\x1a\xe3\xe4\xf8\x15\x0d6\xdd\xe3\xf9j\xb6\xfd\x0b\x03\
+$\xcd\xd9\xf9\x8d\x91\xa9\xcb\xd5\xf9\x18\x071' >\
+\xcd\xd9\xf7\xca\xd1\xed-(D&\x19=\x1d\x05#]\
+\xac\xfb\x98\x99\xad\xcf\xd7\xf6\x00\x00\x13\xb2\xb4\xc5\x12\x00\
+\x22\x1a\x00\x18mm\x83\x18\x0f;\x18\x04\x22\x22\x13@\
+]\x5cp\x1b\x125\x15\x00\x19;3X\x92\x97\xb1!\
+\x1b7\x1b\x0c5`\xb6\xfeW\xa4\xf3\x0c\x00\x1a``\
+\x87TSh\xb3\xbb\xd7][y\x1d\x0f/XVs\
+\x1f\x1eN\xc5\xca\xe0\xcd\xcf\xe2q\xbd\xfff\xb6\xffT\
+Prqr\x8c\xa7\xa8\xba+\x1fE\xb1\xb7\xd0\x12\x00\
+\x12\x9e\xa5\xc0\x87\x88\x9fY\xa7\xf5m\xc6\xff\x15\x12.\
+92N\x18\x12A\x1f\x1b>5+Jki\x8do\
+\xce\xff\xc3\xcc\xeb,)N\xe1\xe3\xf7NHaif\
+\x7f\x9e\xa1\xb4\x9d\xa2\xbacbz@:U\xc0\xc4\xd9\
+OKh\xa9\xae\xc5\x8f\x90\xa3 \x1dE\xda\xde\xf7\xb7\
+\xc1\xdd\xd7\xdc\xf5ED`\x82\xe3\xffe\xc6\xff\x22-\
+\x5c\xd2\xd8\xf1) M{}\x90g\xb6\xfc{|\x97\
+B<^x\xce\xff\x8b\xe9\xff3>kk\xbf\xffC\
+@heg\x85xv\x8e8\x5c\x96\x80\xd9\xffHG\
+hv\xc9\xffv\xd7\xffBn\xa7\x7f\x82\x97qq\x97\
+\xcf\xd7\xf9@t\xb9M\x8f\xd3\x88\x8d\xa1~\x83\x9fC\
+AV\xaa\xb3\xcf\x86\x85\x96U\x5c\x87./Z\x94\x96\
+\xa7R\x9d\xe9.K\x88|\xd3\xff-DzL\x86\xc8\
+yz\xa0\xa6\xae\xcd\xcd\xd6\xf3\xd5\xd9\xefa\xc1\xff^\
+\xae\xf43T\x90\xc9\xd4\xf4K}\xb5\xbc\xc5\xe2\x8d\x94\
+\xaf\xa2\xa8\xc2ih\x92\xcb\xd3\xf4\xbd\xbf\xd0^\xa5\xe7\
+6a\xa5x\xde\xffc\x7f\xa9!3t\xc7\xd3\xf4<\
+^\x8e\x8f\x95\xb0|\xd3\xfd\xf518\xe8\x00\x00\x00.\
+tRNS\x00\x02u\xfd$>\xfe,\x87\x0a\xfc\xcb\
+\x97)\xf6\xe5\xfd\x14\x18w\xfd\x8b\xeb\xfe\xfbn=\xa0\
+\x86\xe16J\xc3Z\xc9\xbc\xe7\xd5R@4\xe0\xbb\xc5\
+\xc3\xdda\x12d|\x00\x00\x00\x09pHYs\x00\x00\
+\x5cF\x00\x00\x5cF\x01\x14\x94CA\x00\x00 \x00I\
+DATx\x9c\xed{yXS\xe7\xb6\xf7\xb1j{\
+\xb5\xad\xd6\xd6\x1eN\xcf9\xb7\xf7t\xb8\xf7\xdc\xe7|\
+_\x99\x12\x08\x10\x82\x180B\x15\x81 \x12\xd4\x0c\x84\
+\x10\x84@\x22\x88\x8c\x11\x99gP\x04\xc2$\x83\x88\x80\
+\xa2\x18@\x04\x05\xc7B\x9d\xe7J\xadc\xc5\xd6\xa1\xa8\
+\xc7\xa1\xd5\xf6\xb1\xd5o\xad\xf7\xdd;\x04\xa5\xc3sn\
+\xff\xb8\x7f|+;{\xbf{\x0d\xbf\xdfo\xadwo\
+z8\x8f\xfc\xe1\x0f\xff\xdf\xfeW\xda\xb8?\xbc\xfd\x97\
+\x0f\xa6\xbel\xf9\x1b\xcck\x0c\x87\xd7(\xbf\xd7\xcc\x99\
+/O\xfd\xe0/o\xbf\xfe\x9b\xe9_\x7f{\xeaL\xc6\
+F\x11P\x5c/\xba\xf4\xf2b\xd6di\xc9\xba-\xcd\
+\xe8\xbd\xd8*\x06k\xeao\xd20\xee\xef\x1fX\x221\
+9Xv/\xca\xe1\xe5ei\xceOn\xbdF+3\
+%\x11}L\x94`Y\xa0\x88\x0f\xfe>\xee\xd7\xba\xff\
+\x80HF\xa8\x99\xcc\x95\x81\x22-3\xfc^\x96f\xbc\
+f\xdd2z\xd8\x9bQ\x93 `^\x96\x1f\xbc\xfe\x0b\
+\x12\xc6\x8d{\xdb\xc2l\x86L+\x0c3c\xa3\xf9\x99\
+D/v\xed\xc56\xee\xc5\xce\x84|g\xd2/\xc9\xb1\
+x{\xd2/\xb4?\x93B\xcc5M\xde\xcb\x8bm\xdf\
+\x92\xe5\x06\x9b\xebeim\xc9\xb2\x98\x86m\xda\x1dv\
+\x5c\xa3\x1e\x0c\xd3z\xe6\x07?\xf3(\x8c{}*\xe1\
+\x9c;w\x04i.j\xf127K/\xf4 \xbf\x97\
+\x9759\xd8\x04k\xf0z\xb1\x1a\xad\x19\x11\x08\xc6<\
+\xaf(\xd9\xda\xda\xcb\xdar\xe6\xd41\xb7a\xdc\xdf'\
+\xcf\xb4\xb4\x9ek\x8d\xa8\x98k9\x17\x17^\xd6s\xc9\
+\xd9\xda\x12?s\x19\x15\xd6\xd6\x0c\x1a,I\x05\xa1\xc4\
+\x05\x16\xd1=\xc0*\x0c\x83\x0ft\xc1\xd6\x82\x9f\x14\x80\
+\x82\xc9c<\x8b\xe3^\x9flI\x89\xac\x09!\x0b@\
+\x1a\xa3^j\xa45\x0c[\x13D\x9aM\x96\x96l\x89\
+\x17\x0bD\xa4Z\xb3\x83\xb3f\x14[\xce\x9d9\xf9\xcf\
+/\xee\xffT\x9c\x93\xb5%\xed\x15\x0e\xb6\x98a\xa5#\
+`\x09\x991\x10\x22\xe6K\x14\x11\x09\xec\xd2\x92\xea\x19\
+\x11o*\xb1\xb6\x9c\xfa\xdcs0n\xd2\xab\x96&\x0c\
+\x93Y2gs\x1f\xb9a\xc6\xe45\x92nib~\
+\xa1\xe0\x05\x17\xdcX\xce|u\xf4\xbb0\xe9m\xb2\xff\
+/\x14\xb2\xb2Y\x9b\xfb\x9c8\xeb\xe1\x8e+3\xc7\x10\
+7:\xe9\x054`\xb2\x1c\xfd6\xfe\xd98\x06\xf5o\
+\xb0\x99\xeda\x86+\xbf\x981\x22yd@\xe4\xceh\
+\xfe\x18Lz\xd5\xe2_\xe2\xafkW\xab\x0d\xf2\xf6\xba\
+\x99\xbf\x9e\xfa\xa2\x99m\xc2\xb8\xff\xfa\x97\xf8-\xae(\
+\xa4\xfa\xf4ty\x80\xba\xee_*\xff\xafq\xa3\x06\xe0\
+H\xbc\x8ex\xd0%{1\x0b1+!Y9\xa6*\
+\xd4Y\x15\xd7\x9f\xc4\xea\x03\xea\xab,\x1c\x1d\xad_\xa8\
+rt4+\x1d\x15#K\xd3\x08\xc6\xfd\xd9\xc2Z\x88\
+\xe9h4*4\x03AM\x8e\x04\x8d\xa6X\x0b\x85\xb8\
+\xb2\xb6(\x89M\xbb~\xbbi\xdf\xf9^}\xd0\x09\x92\
++\xb4fA\x98\x02\xa2\xc0\x04J\xf9M}Xh\xd9\
+\xa7`\xd2\xdbBZ\xe3\xc8P\x0aA\x00\x5c\x85\xc0$\
+tdu9\xd253$\x88\x08[\xd2z\x9bN\x9d\
+9s\xf8qtZ+i\x01\x95\x91\x8b\x90\xa6\x9a\x1a\
+wDL\x82M\x80Y\x99oO\xa3\x02\xde\x9c*t\
+\xa4\x1fkZJ\xbe\x90\xea\xf5re\xd50\x06X\x19\
+\xcc\x15BB\xcb\xd4\x9c\xdc\x86\xeb\x87\xab\xab\xab\xcfl\
+\xe9\x0f\xd0Lvd\xcd\xab\xfb\x11\xe20\xe9\xccd)\
+<\xa2\x0a\x85\x14\x10\x0e\xed\xd4i\xec;hA\x9cB\
+\xc2\xca\xf2\x08\x1d\xeb\xba\x12\x0daI\x97NTyY\
+\x0bi\xdc$.\xf5DK\x98\xa69\xab\xf7\xebS\xd5\
+\xd5{\xef\xc8U\xadF\x0b\xa1\x90\x09\xe6$Z\xcc\xc5\
+\xd1\x11\xc0\xc9\xa9\x9d\x9duU3\x19rrf\xb9\x1c\
+\x1d\xb5\x7f&\x8f\xe1\xb8\xbfR]\xd4)dn\xbc\xaa\
+J\x8ab\xa5\x01z\xb9\x5c\x9a\xd8)t\xb4\x10j\xd1\
+o\x91\xda^\x92:|\xe5Rn`\xe6\xd6\x8eDC\
+\xc3O\x87\x0f\xef}v$26\x87\xd9-\xa1Ew\
+F^sW*Q#\xf4z\xd4\x95\xa86@\x139\
+\xa9B\x96\xd9\xd1\xc4\x0f#\xf8+y\x0c\xa7\xfd\xc5\x91\
+\x9d\x8a\x90\xa5\x17\x0a\xabZ\xd5E\x91i:\x9d*O\
+\x1f+\x1d\xb2\xd0\xda\x10\x09\xc6\xc4\x00CaX@`\
+\xff\x9a\xe4*\xe1N\x85!\xef\xc8\xbd\xb3\xfdy\x8a\xfa\
+T-[\xdb\x99\xd8\xdc\xdc<`a\x817\x17\x92\xa4\
+R}V\x96^.M\xdai\xe1h\x8eN\xcd\xfa/\
+d\x0f&\xbc*\x1c\xc3\xb6g\xaa\xd2\xae\xdfx\xfc\xf8\
+\xfc\xdd\xd8tyX*\xb2;j\xab:\xa4aa\xaa\
+\xb0\xb2mU\xb8[\xc2\x0c\xb54=/2\xab\xa8\xa8\
+\xc3Tfa1\xdc\x92\xf8\xc8\xc2Bk!\xb4\xbe\xa2\
+P\xeb\x8bu\x15\x15\x99\x91\xfaX}\xe3\x18\x1c\xd6\xaf\
+\xbeI\x04Lu\xb4!\xf76B\x1bX\xd9\x90\xd5`\
+\x91&\xfa\xc6\xde\xbd\xcf\x9e\x9d\xda\xfb\xb8\x22= q\
+2L\xb8.\xc7\x10\x22)\x8aN\xc2vm\xb4Z8\
+\x1f\xc8W(\x0cI-\xb1\x97h\x19\xd9$\x8b\xe4\x81\
+\xb9\x16\x18M\x8dSG\xea\xce>^\xbb\xf6\xce\xd9\xcc\
+t\xa9<\x15\xf1\xc9\x87\xcd\x15:VM \x02&\x0b\
+m\xd0KOd\xed8\xb9UR|\xef\xf0\x99\xea\xea\
+\x05\xd5g\xf6~\xaa\xd3\xab\xaf\x0c_i\x91Dl\xea\
+\xe9\xc8?\x9dl\x83\xechB\xaf\xca\x0cEb\xddp\
+kR\x9d\x0d\x96\x93\x0fH\xc0\x98\x8d\xf5\x1e]d\xc5\
+\x9d\xc3\xf0\x9e>\xdb{\xa7\x22]\xd5\xf2\xb2\x96\xf2\x08\
+mlX\xbe\x97\x89\x80Wl\xccMK\xce\xa9\x99\xd1\
+WO\x9d\xa9^\x80V}\xf8l\x83\xbc\xb0P\x15Q\
+\x91\x91\xaa\xb5\x99\x0c\xb3\xa0\xf4\x90+\xb4H\x95\xb6\x0b\
+\xb5W\x02\xbb,l\x1c\xb5X+t\xb4q\xf4\xd0j\
+\x1d\xb5\x8e\xa9I\x9a\xe6O\xf15]p\xb4\xfa\xf0\x9d\
+f}Z\xa75U\x88\x1c\x84E\xeb(\x1c\x11\xa0e\
+OP\x0a0;\xc3\x83\xcf\xee\x85\xe2\xa8\x05Q\x0b\xaa\
+\xbf\xbe\xa3\x93K\x15\xc7:\xab\x90R\xc8\xd0C\xae\xa3\
+Qk\x91,\xcd\x7f\xd9\xa2{S\xe2d$\xa7\xc0\x16\
+Z#\xc6\x07u\xc1?\x11~\xd2\xc3\xc9\xe0\xb4.S\
+{d\xce\x08\xa0}\x85\x0a\xd0j\x85\xa3Dhmj\
+C\x8a\xef\x9d\xaa\x8e\x22\x06\x18\x15y\xd9\xc9\x88\xae\x1d\
+1\x9b\xcaK\x19\x166\xc2!i\xeb\xcb6\xd6%\xcd\
+CB\x1a&\x10d{\xbaTi\x7f\x82\x9f\x12\x0b\xa2\
+\xa2@\xc0\xa9\xf3!i\x07\x85\x14\x9bRhI\x1e\x15\
+\xc0\xd4\xd1J\x9ar \x22\xf8\xde\xa9(F\xc1\x99\x05\
+\xbdi\x89\x04\xdfhR\xa8\xb5\xa8K\xbc\x04\x9d\x0c\xe9\
+\xb6N\xb6\xb1I\x96\x940\x85\x14\xd9\x08\xd7\x92\x08\xd5\
+\xe3CD\x00H8\xf387\xad\xc5\xc4C\x93\xf0\xc3\
+L\x80\x915\x92`\xd3\x19\x1e\xfc\xd3^\x86?\xea\xd9\
+\xe3\x90\xd8\x83\x14\x96\xc9\xd1\xdaxxhS+-\x8c\
+\xda\xa1\xdcV\x100\x5cX8\xd9\xc6Ck\xc3\xa3\xb0\
+\x90j\xa3\xed\x88(\xfe\xd3\xd7\xb0\x01\x04\xe2\xd0y\x8d\
+j\x0f\x133=kp\x98\x04x\x10\xed\x1e66\x1e\
+\xf0\xc1WhcVR\xf53F\xc0\xde\xaf\x1a\x8a2\
+h[t\x1f<\x90Bk\xf40j\x85C\x92\xad2\
+\x10\x95!)\x19\xf2\xb0\xe1yh=\x10C\xcb\xe3i\
+\xb5C\x99\x0d'\x0fG\xe1\x04>\x8d\x8a\xfa\xe1lq\
+l\x06\xa2\x83r\x22\xd3\x86\xae\xd8g\x80 ky\xd0\
+\x02\x80\x03\x8c\x8dq\xbb$\xf8\xfaa|\x0a\xeeT\xef\
+\xfdS\xb4\xa1\xfe\x11\x10\xf2xD\xa9\xd6\xd8=T\x05\
+\x0a\xd0p\x02($5L\x22\xcf\xd1\xf2l0E6\
+\x5c\xd5\x9d\x9aZ\x97\xa1\xc8\xca=s*\x0a'\xf0\xe9\
+\xb3O\x0d\xaalxUy8?8\xf1\xa0O\x1e\x0f\
+\x0e*\x80\x07\x82yD6\x8f\x9c@\x85\xb0.\xc9\x90\
+~\xbd\xfa\xd4\xb3g\xcf\x9a\xeeI\xb22\xcbx@h\
+\x83\x89\x90\xa3\xcdi\xde\x09K\x1e\x08\xe0%\xe7&\xca\
+xZ\xc7\x8e\xa2\x22C@{NN\xce\xa5K-\x85\
+\x91\xf2\x80\xac\x80\x90\xb4\x10E\xe4\xd5g\x87\xcf,X\
+p\xe6\x87\xa6\xfdi\xba\xd3Pn\xf4\x00l\x86\x8e\x5c\
+\x19\x01\x04\x19!\x01\xdcH\x16Z\x9b\x13jCz\xf6\
+Og\xef\xfd\xb45R\xafh\xad\xb2A6b\xf0\x8e\
+\xd5et[@\x81\xd1\xc8\xd5&\xe7\xc6\xf1x;\xb6\
+\xab$\x8a\xa2\x88@\x8340S\xa7\xdb\xd8\xbf\xff\xc8\
+\xb1c_~\xbbFah\xe8\xbdw\xa7\xe9\xe8\xe3{\
+\xb9\x0d\x92\xfeG\x00NIl\xb4\x04\x0a\xc4\x8cL\x80\
+tC)\x8c\xf4\xabm\x84\x9f\xe4y`YE\x86\xfa\
+n\x0f\x1a7R\xf5\x1e\xf0\xb3\xc6\xc8\xe3\x1ae\x5c\x8f\
+d\xc9\xa5\xaa\x0cM`N\xb9N\xb1\xb3\xbb\xb4\xb4\xad\
+-!\xa1jx\xb2\x0f\x0f&m\xd1(U\xa47\x14\
+^\xdd\x9f\x1b\x9c\xa5\xeb\xaf\xe3q\x91\x85Gh\xa0\xda\
+\x88\xa3d\x04\xb0\xd0L\x874\x8b\xc7\xab\xdb\x93\x94\xad\
+\x0eS+Z\x93\xc2N\x18\x8d2\x9aD\xe4y@9\
+xd\x5c\x19\xaf.7..\xba\xbf\x93\xa7}\xa3\xdb\
+\x87\x07\x1f\xb6K\xb4.\xa94I\xadO\xcf\xd2K2\
+\xf3w\xf0x2#N\x8d\x10\x18Y\xa2\x91\x09 4\
+\x97%\xc7%n\xc7\x8e\x81\xd6\xb0\xfc\xc6\xee\xce8}\
+\x06\x8f\xb8\xb8\x5c\xe8\xdb\xc8@\x80\x02\x1e<\x84\x11\xba\
+\x8c*\x1fR\xa9\x05\x01F\x1f\x99\x8f\x0f&sm\xda\
+C\x14\x8d'\xea\xd5aE\xad5;\xfb@0\x17\x0a\
+\xa1\xda\x88 \x04\xc7\xc3\xc8\xa5\x02\xb8`L\x88\xac\xd0\
+\xc8\xc0\xb4\xc6Zi\x07>i\x0a\xf9\x09\x0f\xe2\xe6f\
+$v\x13x.\x0a\xe1\x0eg\x14j\xeaq\xb82#\
+\xb0\x02\xbd\xccG&\x83/O\xc6\xe5\x96\x84\x04\x16\x18\
+\xb5\xc3=E]\xdd0\x15\x99\x8ca\xc6/\xa1@9\
+f\x02(\xa9\xb9\xf1\x00\x87\x97\x11[\x0en\x9f\xa1\xe6\
+\xac\x01.\x17\xb6|iy\xf3#.p\xd0\x94\xa1\xb8\
+\xa0pM9\x17\x1d2./\xb9\x0a\x5cD\x01V\x97\
+h\x02\xb7\x19aK:\x02\x93A\xb1\xa9d\x94\x99O\
+\x80&\xf8 \x0b5\x1f\xae\x0f\x80\xd6\x86\xaf1\xa2\xab\
+3,\xe5\x0a\xc6d\xc3\x95&\xb0\xee\x9c\x88\x88\xa1\xba\
+\xa0|\x7f*`\xb8\xb0\x0e\x032\x7f\x1fl\xa5D\x15\
+\xb1\x0d\x9fRnY\xf8\x05#\x86\xe1\xe3\x83H>H\
+\x02\x0b#!\xa5\x02d\xc8\x05>\x92@3\xd0\x05\x0b\
+\xde\xe7)\x9b}\xb8\xfe2\xee\xd2\xe4\xdc\xac\x0b\x80\xe1\
+\xcf\xf5\xf0\xf1'\x0a\x8c\x8d\xcd\xe1\x89C\xc6\xee\x88\xad\
+Jp\xcb\x86\xeb\xda\x83.\xd5\x0d\xfb\x13-2^N\
+\x88\xae\x11V\xfe2\xde\xe9\x88\x9dXA\xd4\xcb\x08\xf4\
+\x08\x99\xcc\x87\x99\x00\xb8}|\x08#\x12\x93)\xe2\x0d\
+\xd8\xe7)\xdf\xe2\xad?\x97\x1b\xd3\xaci4\x02\xa2\xbf\
+?|e\xdc\xd4=\xd1\x99\xb5UK\xb9C\x99q}\
+\x10\xf7\xe9\xbe\x14\xd2\x1c\x14W\x87TP\x90\x13\xad\x8b\
+\x01\xe1\xfe0\x9c\xd3\xe112\xd2O]F\x95\x8c\xb4\
+&#;\xc5%S\xa1\x02(\xa1\x0f\x87\xcb!\x19\xb8\
+\x96\x11\xe3\xf8\xdcL\xf9\xd6\xc7\x07Y9\xfe\x17C\xe4\
+\xa4)\x10\xe0\xf3r\xad&\xe8\xea\x1b\xdc\xa5\x5c\xd9\x90\
+.n\xb7\x0f\xf8\xfc\x87\x07\x9aK\x1e\xbd\x8c\xa92\xe0\
+\x0f\xdf\x81\x83\x83\xf5\xd2cA\x05\x80#\xf3Y\xda\x9e\
+\x92\x0c\xd28\x04_\xc6\x91-]\x8atT\x00\xc7\x87\
+\x03\x06N\x1f\xe4\xe40\x19\xb0\xe6p`\x02K\x91\x13\
+Y/j\x0c\x9d\xfe2\x0e\xac:[\x826=\x9d\xbc\
+\x94\x03\xde!I\x5c\x1f\x87$,\xedyC\xb6\x14\xae\
+>\x9c\x9c\x90\x88[<.Su,(\x86@q\x1f\
+u~\x82\x14@D\xc0e\x84\x93y\x06pV(\x80\
+\xc3!{\x88\x852T\xc4\x91}\x9e\xb2FF\x05\xf8\
+sd'Ta\xa9\xb0\xa8\xea\xd2\x04\x96w/E2\
+\x7f\x1f\x9c\x00\xcdXZ9\x99\xa4\xf9\xe7D\x04\xc6\xa0\
+K\x86\x02\x97\xeeA\x01\xfeT#\x5c9\x18\xa0\xfdq\
+9\xfe\x1c*\x00S!\x83C\xc4\xe1\x15\xee8X\x84\
+\x13X\xe3\xef\xafd\xcae\xc7\xb3\x0a;N\xec\x8c\x0b\
+\xec\x8dqq\xf1\xf7wA:\x98\xc0n(\xc48\x97\
+H\xf2\x87\xe7/\xc6E\xa6\xc4 d\xc8N\x07\xc5\xf8\
+\x938\x85E|r\xa5Cg\xb6\x80\x09\x12\xb7?\xd1\
+\x82Z\xe1\xdegs\xcaq\x0eG\xc9T\xfb\xfbt\x05\
+\x04\x18\xa4\xf0\xf0\xb9\xc0\x8d\x92\x1c(\x80HQ\xa2\xc1\
+\xb5K\xa5\xbb\x88:\x94P\xa0\x84\x9eO\xa7\xc4\xd0\xee\
+X\x10\xaa\x96\xf4\xeb\xefo\x12\xe0\xcfa]\xa689\
+\xe33\x00\x02*\xbb\xf1\xa6\xb2.GmP\x1b:\xdd\
+8\x94\x0e\x19wJ\x0aw\xe3\x1d~9.\x1cN\x8e\
+Jr\x02\xc3.\x9cG\xa9\x1cpsNG\x0fRt\
+\xff\xee:\x06\x97a\xc0\x1bf\x0bp\xc6.P\x0f\xad\
+\x00\x06\x9c\xb0C\x0e8\x947S\x8e\x83\xf3Ba\xd8\
+\xa5\x8c\x928M\x9a\x0a~\xd3\xd3\x0f\xba\x98\xf8\x95\x9c\
+NI\xe20\xd4\xd2\xf6]\xe0\xf9\x0b<\x00#\xc3\x9b\
+\x1d\x89\xa0\x9a\xb3tO\xc4\x00\xf4\x843\xda\xd9\xe2\xef\
+B\x88\xe8\xe6q\x5c`\x1f\xa9\x00\xa5\x1b\xb9A\xd9p\
+vq\x81\xc3\xa5\xaa\xe4\x0a\xb4\x0e?\x07\x8e\xbb\xf8\x7f\
+\x12\xa7\x92\x1b\x0c\x8a\xfec7w\xd4\xd6\xe7\x87\x19N\
+\x98&\xe0\xe2\xd6\xa9\xc9\x87|7z\xe7\x92\xa3\x0a\x8c\
+\x01\xd9n\x80\xa4\x5c\x97\x95\x98\x9cZ\xa7\xdc\x13=\xa8\
+$\x0dU\xb5D\x0fAk\x90\xad\xf4w#]\x02\x19\
+#\x00|n\x84\x16\xbenn.n\xb0\xa8J)\x81\
+\x85[m\xd0q\x10\xd3\xda\x9c\xab\xe9(M\xe0\xb8\xf9\
+\xf4U\x0e\xefH\x0a\x19@\x0e\xa2\xd4\xff\x82\xaa\xa5O\
+I(\x81%G\x13X\x8b7nJ\xb1\x7f_{s\
+\xb3\xb4w\xa7K{\xf8\x00\x00*\xfb\x06\xe2\x9a\x9b\xc3\
+\xdb\xbb]\x10\x1d\x80\xdd\x08\xa1\x1b\x15\xe0\x86\xf5n\x0c\
+\xbfR\xe9F\xd0;\xbb\x95}J\xe5\xe6\xa05\xd0M\
+WDo\x8e\x1b\xec\x89\xb2\x0f\x0a9\xdb6\xc9k\xa1\
+_7\xb7Ovvm/4\x18Zr\x1a+9P\
+\xe4\xd6\xa1\x09<\x80\xecP\xddw!,$7LW\
+\xeb\xaf\xec\x09?\x80\xb8}C=\x9b\x22\x12\x07\x86\x95\
+\xcc\xb8h\x03\xec\x04\xdc\x18\x1f\xbd\xd2\x0duQ\x8a\xfb\
+\x94\x9cZ\x10\xb0\xb4\xeaj\x5c*\xc4\xfa\xfa\xc4\x10\xe8\
+\xf3\xe7\x8c/\x0c\x19\x80\xec\xc1V\xb5\x1c\xcc\x10\x10\xa0\
+\xae\xafMP*3\x8a\xc2\x0f\xb8)!\x09Qv\x96\
+\xec\xa9\x97\xb4*\x95\xf6=\xe1W(\xaa\xb8k\xe30\
+C\xcd\xb0\xc1\x87\xdd\x02\xe2\x86\xee\xc4J\xb1\x98\xea\x00\
+\xa4\xbe>\xa5\x18\xb6@)\x1e\x0a\xac\xb5\x17\x03=x\
+\xfa\xc4b\xb1=g\xbc\xc2\xb0\xb3r\x8f:V\xdf\x10\
+\x99\x96\x96\x96\x97\xae\x97K[S\x07c\x03k\xddP\
+5\x99\x0e\xccrgv\x5c\xaa\xbd\xdb\xe9\xa0\x0b\x80\x08\
+U.o\x5c\x80\x96\x09>\xa5S\xba\xd9\xb3[\x00q\
+dw\xb3\x878U \x86\xa5=$\xc1\x16\x88\xed\x0f\
+\xea\x1e\xd9\x03\xb5\xbd\x1b\xca\x00\x1d\xf6.\x05\x12\x03\xb4\
+\x1f\x9cy\xfd\x8b\x1b\xe7o\x9c\xbd^\xd4\xa0\x0fHR\
+\x17\x95\xe1\xd4\x08\x02N\xcb\xcd\xbe$\xb0D)n\x0f\
+\x8a\xb1W\xda\xdb\x8b\xc50r1v\x08wn@\xad\
+\x04\x1e{f\x02\xf6\xd8\x16\x1exr\xc33\xbd\x01\xb0\
+\xcd\xd1en\xa9\xba#.\xf6\xc0+\xfe\xc4E\x8c>\
+\xd42\xa4\xc8\xcd*\xfe\xea\xf1\xa9S_\x1f:\xf4\xf5\
+\x96;w\xb3\xd2\xd5\xd2\x1a\xe4\xed\x13\xbb\x10\x0c\x5c\xad\
+\xeb-\xact)\x0bz\xeaF\xe0\xdc\x08\xbe\x18\x9b\xb5\
+g9\xc4#\x02\xe0\xd6\xecB\x97\xd0\xc5\xf1\x88\xf2\xf9\
+\xe5\x9918\x00\xf1Pa\xa7\x98\xd0\x8b\xc5.\x076\
+\x05D\xdf8\xf55\xfc\xe2\xb28jm\xf5\xa1\x1f\xce\
+k\xd2\x15\xedb\x94IKIZ_\xb9d\xd0>G\
+5d\x02\x1f\x81f:f\x05\xf4\x99|f\x19\xc4\x8e\
+K\xba\xc4\xb9\xfb\xab0\xc3~\xa8y'\x80\xfa\x8aw\
+\xf7\x89w$\xe9\x8ao\x1c\xae^\xb0x\xf1\xe2O\x17\
+\xa3\x84S\xd7\x22\xf5\xd2\x13\xa8\x99\xc1B~q\xe5\xd6\
+\xb8\x9c$\xe9\xa5m}bszs\x02*`\xb4\xcf\
+\x9e\xbd\xf1\x05\x8c2\xc9\xe0e]9\xe3\xa9\x9c\xcf\xa0\
+\x8b{2\x8b\xef\xe2\xef\xaek\xd7\x82\x84\xc50\x85\x05\
+{\xbf\x08\x96'%\xb0\x8d\xd8\xbb\xda\x8b]\xfb\x5c\xd6\
+\xd5\xc7\xc6\xc2[\xa2\xe8\x1a\xe9{\x84\xc9\xde\x5c\x80+\
+9\xec\xed\xe7\x8b\xe73\xe1\xf9\xae\xa4\x97\x1c\xd5@G\
+\xe6\x03\xb1\xab\xab\xebnWt\xef\xee\x83\x8f\xb8\xb2^\
+\xa3\xbbs(\x8a\xb0/\xbe\x83\x12\xa2\xaa\x9b*\xf2\x14\
+;\xdd\x5cw\x13\x12\x02\xee\xda]_\x14\xd0\x00/\x89\
+!\xa0\xc3|\xaacM@L\x04\x80pS\xc4\x15H\
+\xc519q\xf2\xc4\xc2z\xbc\x035\xae}\xae\xf3\xa9\
+?93\xf2:\xf2\xa3\x82\x15D\xc1b\xf8\xfd7X\
+\x9aC\x1b\xc1rh@\xdc\x1e\x1bPt\xf2\x8b/\x9e\
+\xe4\xc9\x8b:M\xac\xf3Y\x15\xaef\x02\x5cYFz\
+\xa51\xd7\xcav\xb5To\x90\x1b\x12\x13v\x93\xfeY\
+tWq\xc6\xa6\xe2\xb3\x9f\x91\xf6\x17\xad \x06\x02\xce\
+\x5c\x0bIk\xa9\xdb\xd6\xb9m[grrA\xe3\xe0\
+\xe0`FR\xac\xe6\xfc\xdeC\x9f\xed\xfb\xaa!\xe4\xa0\
++\xc3a:S\x9d\xac\x000\xc2\xcf\xa8 \x22\x5c\xb7\
+\x17\xe9#U\xaa<\xb9z;\x93M\xddp\xe4H\xd2\
+\xee\x1dB\xfa\xc5\x0c?\x0ca\xc1\xc2^}llv\
+fQ \x98*\xb6H*\x95\xe66\xdc\xdd\xbb`m\
+\xd4\xb3U\x1b\xd3B\x12\x08\x07a\xc2\xcb<\x06\xcdL\
+\x00\xd5\x80\xd6\xbd\xbe\x0f/\x03\xd9\x01\x81\xdf\x9f?\x7f\
+7K/\xed\xd89P\xdb\xd1U\x9b\x91S\xd2\xde\xd2\
+\xdaz\xe9R\x924\xed\xc6!f\x00\x0b\xf1\xc0\xb7a\
+U\x7f\x96:;)).\x0e\x8e\xfa\xad\xf9\xf9\x07\x15\
+\x8a\xe0\xb3\xa7\xe0-Y\xd0\xb4?\xb2\xf9~\x9f\xebX\
+F\x05\x90\xa5\xef|899\xb9\xba\xce/\xe9\xadt\
+u\xda\xed\xd9\x0am\xee=\xb4\xe5\xb3/\xf2\x0c\xb1*\
+U\xac4 ::06V\xad\x96\xaaTE\x85\x0d\
+t\x02@\x8e\x86SX{\xa77-?\xe1\x13O_\
+O_\x91\xe7nDL\x964\x1c9\x15\xb5xq\xf5\
+\xed\x8a\xb4\xb8JB\xe04\xb6\x00\xa0urBnH\
+\xd8\xedZ\x9b\x19\xb1=\xc1\xd7\xb54)r\xff\x96\xa3\
+k?m\xda\xb7?=\xa0\xec\xf3\xcdk\xd6|\xbb\xa6\
+\xac\x0c\xce\x9f\x7f~s{Q\xf0O `\x05\x15\xb0\
+a\xc5\x8a;\x8b\xef4\x9d\x0f\x89\xedq\xb2\xa7(\xe4\
+\xb3+I\x0e?,\xb6l\xf9\xe1d\xa4d\x8f\x13i\
+\x8e\x18.H\x02\x1c\xac\x00'\xa7\xddD\x83/\x1c\x0f\
+\xafn\x8c\xf9\xc4w\xfe\x8e\xde\x86#\x87\xd6~\xba8\
+j\xcb\x91\x86l\xd1\xbcy\xae\xae\xf3\xe6\xe1\xd9\x15^\
+\x86m\xd9y\xfb\x8fF\xe1+\x80\x02Vl\xc0m\xf8\
+\xec\xfb\xe0\x8d9N\xd0?k\xbbww\xe5f\xe9\xcf\
+\xfe\xe9\xde\x91\xac\xe6\xecNW_B\x00\xa4\xbe\xaeL\
+\xc3N\xbe\xbe\xac\x00W_\xa0\xf6\xc5\x10D|\xc7\x0f\
+\xce\x86Xe\x92<\xe4\xce\xa9\xc5\x8b\xbf\xfetc\xe4\
+\xb1\xdd\xbe\xf3\x5c1\xee:\xcf\x17>\xae\x09[c\x83\
+o\x9cZ\x81\x8f\xe0\xc2%\x0b7,\x5cxgI\xd4\
+\xaa\x8d\xfa\xecd'O\x14\x00_\xc4\xf3MV\xe4\xea\
+\x1b\xf2\x22\xf3\x8a\x14\xc7}\x9d<}I\x834\x82:\
+\xf0\x9e\x11\x80z\x9d\xe8\xd7\xc9\x97\xdex:\xcd\xebQ\
+4\x5cm\xfa\xe1\xb3\xa6#\x91\xb1\xc7\xe7\x11T$'\
+q\xd7\x8c\xcc\xbc\xde\xea3+\xc8\x046\xe0g\xc5g\
+w\x83u-\x22\xa0\xa1\xf4\xbe\xae\xdb2\x12%\x1b\xfb\
+\x93\xa4\x860uv-\xb6\xb7\xad\xd3\x97\x90\x12uD\
+\x84i\x02\xec\xd0\x9c\x18\x19N\xa4\x8bu\xf5ay\xbd\
+?\xfd\xd4\x9b\xa7h\xed\xa6\x9dQ\xf3\x84ue\xbe4\
+\xf8\xc9\xd7gp\xf4\xc0\xbea\xc3\xe2-_\x14K\x15\
+\x05\xbe\xcc\x0e|\xb2\xad\xabP\x92YQ\xf6`]L\
+O\x92\xa2}=b&lmN\xa0-:\xb1tN\
+\xcf\x0b0\x85\x90\xc5\xd7u<\xfe\xff+\x0dzil\
+\xbb\x83\xd9\xd6\xa2\x00\x07\x87\x1dq\x86\xe0'\x0b\xbe\x8e\
+Z\xb1b\xc3\x86%\x8b\xf6\xed\xfb)2\xa0\xa8\x9c\x86\
+\x13\x1e\xe44\x87\x87\xf7~Y\x90@\x86\x95\xaf\xe8$\
+p~{.%\xf8\xbe`#\x02<\xd9\x13\x19\xa2'\
+\xb69oGM\xbd:,\xec`\x92\xb4v$F\xe2\
+\x9e\xbe\x83\x0a\x95\xa1Aq\xf6\xce\xd1\xa6\xa6}\xb7\x17\
+\xdd\xdb\x9fg(*ji\xdf\xdeXz\xa1$$\x22\
+\xb0\xe2\xe6\xad6O\xda\x86\xe7\xc1\xccFO\x02\xe7\xe7\
+\xe4\xf4\xf3\x02\x1cL}{\x92\x13\x950\xcf!\xb5]\
+\xdd\xe3\xfbP\xa1\xb9\x80\xb4\x0e#:\x07%\x9a\x8eD\
+Cz\xe4\xa6\xebw\xbf?y\xbd\x22+\xaf\xa8\xa8\xa4\
+'V*\x0f\x0b\x8b\xdd\xd8\xbfy}\x82'\x91\x89\xe6\
+t0\xf0\x02]:!8eb\xc3\xbe\x9eT\x00a\
+\xc41S~Of\x0a~0\xeb\x8c\xcc\xcd\xbe\x9e1\
+\xea\xb0m\x9e\xac\xf9:xz\x9e\xc8\x0d\xbf\xe8\xfb0\
+_\xaa\x87-jhH\xd7\xc7f\xd6g\xcc\xbb\x9c\xad\
+V\xab[j\xdfHp`\x12\x01\x0a \x8eE\x140\
+\x0d9\xd0\x97\xd4\x81\xa5Ac\x04\x98\xee=\x99\xa5_\
+\xe3@\x9b\xa7\xa7\xc8a\xd6qU\x19\xdc^\x0c1\x5c\
+&~\x82=\xafC\x12=\x1e\xae\x9f\x14\xd4(\xd4\x8a\
+0yl}~\xed:P\x95\x1d\xabR\xd4a\x8a\x08\
+\x8c\x22\x8a\x1c\x1c\x8e\x05\x8d\x1f\xc1\x1dm\xf3F\x04\xa0\
+T\xd6p)*LY\xe7+\x12yzn\x8e^\x83\
+\xbe\xcdiq\xa5\xf3\xd8\x84\x0eM\xf8\x83Y\x9e\x10t\
+\xf0\xbd\xfc\xb4]\xde\xda\xf8\xf0\x1b\x91g[\x89Dw\
+\xb0F\x15\xb7\x1e\xe91H\x90D\x9e\x0eG\x82\x0a\x1c\
+F\xe1\x8f2F\x00\xe6\x8b\xfc\xfcXz8\xc5\x5c\xf8\
+\x06\x90<g\xc1\xff*\x06\x18\x91_YqK\xa5\x9f\
+\xc8\xd3\xcf\xcf\xcf!'0\xfc\xa2\x88\xd8,hkG\
+@\xbb\x83\x83\xc8\xb3 1bS\xe37\x9e\x9b\xf3\x0a\
+\xb7!-$\x02\x88\x1fT\xcc:\x18\xf4\x80\x85\x87C\
+\xe4G9\xe0\xea\x87.*@\x84\x1cD/\xf8\xd0D\
+\x0ex\x02\xf3\x03\x01\xb3\xc8\xaa&\xe5\xf47\x9e\x08]\
+\x12\x91R:C\x84bDX\x15\x13\x90\x0fR;$\
+\xe15\xa5\xb3\xc0\xb19\xd2\xf0\x90\xf8\x11\xce\x0fgq\
+$(f\xb6\x08\x11\xa1\xc2\x01\x81=i-&8\xf8\
+Q\x01\x18\xa0=\x89\x08\xd9l\x11J\x22\x126\x17\x7f\
+)\x12\xf1a\x91\x90\x1f\x5c\x06\x0e\x87\xf2\xf0\xa0\xcb\xb3\
+\xa0\x00\xa2\xe8\xf6|\xaaj\x11\xad\xdb\x1e\xae\xbb\x08E\
++E~\xb3\xd7\xe4\x15\xee h8,\x11\xdf\x0f&\
+\x10#\x22\xedP\x0a\xdc!\x07\x1c%\xa5b\x04\x90\x10\
+\xb8\x81\xda\x81\xf0\x9b\x0c& r\xe0\xf3\x81lWk\
+d\xadhvyx\xee->\x0d\x81\x9b/\xf2{ \
+o\x1d\xd0\x04\x1d+\xe5\x8b\x12\x12VB\xda\xec/\x1b\
+\x0aw8\x88fc\xf7~~\x90\x0a\x13\x98\xc1t6\
+\xdbo\xa4K\x07r;\x9b\xd9\x82Q\x9c\xd4\x18\xcf\xb7\
+A8\x01\xa4r\xb8U\x18\xd2\x98\x11-y\xc8g\xa2\
+|\xe2~X\xd8\x1c\xae{\xfa\x0d\xa0\x96\x0c\x82\x0bB\
+5\xc5I;X\x14\x10\x84\x13 3e\xba\x1cME\
+\x05\xf0\x99d?F\x1e{\xbf\x12\x04\x14\xaf\xc1\x15R\
+\xf1\xc7\xc7\xc9\x03Z\xde\x98Eh\x089.\x065\x9a\
+\xfcuDO\xf3v?\xe2\x9eQ\x93\x12\xb7\x8ep\x13\
+\x90#A\x0f\xf8T\xae\x09\x9bO>\xa3\x04\xf0E\xec\
+A`\xf9\xb3\xf84a\xd6\xb7\xb0\x05|\xfeJ\xdam\
+\x8f*\xe4\xd6\x0c\xb2\xa2\x02D~\xf7\xbb\xc2\x22Z\xda\
+\xfc\xf8|\x87]%!\x85\x83m\x22\xc8\x14\xad,K\
+\x89\xbb,\x9a\xcd\xa7\xba\x8f\x81\x00\xa2\x96\xe8\xa5\xc0&\
+\x08>\xbb\x05|\x93A\xc6,\x91\x1f\xd3 \x9f\x0f\x02\
+\x96!?\xd6w\xe5\x86\xc9\xdb\x13f\xc0j%\x8d\xcf\
+*H\x0c\xd24\x1f\x04\xaa\x95\x03\x85\xd1\xb9\xcd\x11-\
+\xeb\x88\xbeo\xca\x8b\xe5\xb8\x22\x08 \xc0\x8f\xae\xf8~\
+\x94Bd:\xb1\x02F\xdc3\xf8f\xb6r%\x0a\xf8\
+\x92\x19\xc0\x8c\x1cMaL~q9\xf5\xa3\xfd\xb3#\
+\x22\xa8\xe3Bt~\x02\xac/\x0f\xb64\xeb\xca\xd7\xb7\
+\xad\x14`\xf4\xbb\xd3\xc1\x89\xa54)\xfeX\xd0S\xfe\
+\x0bF\xf7t\x96\x99\x80YL\xfb\xe7\xf8x\xcc W\
+\x01\x11\xb0\x06\xd7\xc0Z\x1e\xbd\xe9\xe1\xac\xd2\xfa\xe2Z\
+>_\x00\xc79\xfe\xc3\x96 M\xe3\xb2u\xd1\xad\xdf\
+af\xfc\xae\xde^?\xbe\x1f\xacV\xae<\xc7O\xa8\
+II,\x9d\x8d\x890\x81\x02\xda\xd69\x82\xc3\x9eD\
+\xf4J\x05\x9c3\xb91\xeb\x1c\x15\x09\x97\x95\xe7\x96u\
+\xa5}I\xee\xbe\xe9\x09\xef\xbf\x05\xd7\x87I\x91\x07\xe8\
+H\x0e\xe4\x06\x1d\xbc\xbclY\xa3$.\x81/\x10\x08\
+\xf8\xf1\xe5]\xe4\xca_\x09\xa7s\xd3O\x07\xb7\xee:\
+\x07\xab\x19\x07C\x0a\xce\x9d3\xef\xde\xc40\x22\x00\x06\
+E\xdaz.\x07\x9c\xf1e\x119\xe8H\xd8\x13\xdd{\
+\x19z\x8b\xe7\x17\x14e=\x85@iOP\xf8\xe7\x09\
+\xf13\xce\xc5\x04n\xfa\xa7\x00\x8d\xbf\xeb~\xfcJ\x01\
+\xd6\x81\x82\x95\xe7\xda\xf2#a\x17\x04\x82\xfb-\x11\x19\
+\xbb\xd0+\x10\x90\xe6\xe2\xe1\x1cO\x06L\xceT\x80\xc0\
+\xd4\xb8\x80|!7>\x1e\xce\x0f\x07\xcb\xe34\x89\x19\
+\xe3\xe3\x9d\xb7G\xf7\xdeZ\x89\x0d\x0af\x5c\xcc*l\
+|X\x90\x14\xb4\xf5a||\xbc`Y\x8c\xa6\xf0\x9f\
+|\xaa@`v\x89\x17\xdcG\x05\xeb\xca\x92r\x0d\x86\
+\xc2=\x17\x13\x90!\xfe\x1cE'b\xce\x9d\x13\xc0\x84\
+X\x01\xe0\xc1[X\xe09\x1e\xb7X\xb0\xeb@kt\
+\xb4\x1c\xfek\xab.\xd9\x13\xb1u\x1dK0\xe3@V\
+@\xa1:\xe8x\xdb2hT \x88\x89\x80\x09\x90\x22\
+\x0a\x00\xb8|\xf0\xb7\x09\x04\xbb\x0e\xa6\xc5\x15J\xe5\xfa\
+,}@\x80tO))\x86\xa8`\xc69\xc8\xa5\x16\
+\xcfN\xc0\x04>r^y\xbf,<M\xdf\x10\x19\xd9\
+\x90.\x97\x06\xd4\xefbJ\x04\xa5\x17\xca\x0d\x06C\xda\
+\xc5\x19\xf1\xcex\xeb\x1c#)$[\x10\x7f+9\xc1\
+\x84\x13\xdf\x93\x08\x05\xa5qruz\xb1n\xa3.-\
+]\x1e\xd4\xbaK`\xe2%\x9d\xce \xc9\xac\x00\x81`\
+\x19-\xa6#\x80\xe6\x04]\xe1\xd2\x86\xcc\xaf\xbe\xff\xfe\
+\xee\xfe4\xbd\xba\xf5>)[7\xd8S(I\x93\x86\
+I\xd5\xd0\xa1\xbb\xc0\xdd\xd9]\x10#\xd9\xf4#\xa9l\
+i.\x9d\xc1\xa8\x8f\x17\xf4l\xda\xe5\xcc\xafU\x845\
+T|q\xed\xda\xb5\x1bO\xf2\xf4A\xdb\xbf3\xdf(\
+j\xcb\x18\x01\xcb\x04/Z\x81BR\xfcdu\xd3\xd1\
+}\xb7W}\x11\x98.m\x15,+\xbd\xd8\xb3I\x15\
+\x91y\xf0fWv\xf6E\xe0w\x87\xfe\xdd\xbd/H\
+\x0a\x7fD\xce\xf8\xb2=\xbb\x96\xb1\xb0\xf1vm\xf1\x82\
+\xcbI\xb9\xd1OV\x1d:\xba\xf6h\xd3\xbe\xef#\xe5\
+A\x8dc\xb0\x98M@\xe0l:\x91E~`\xf1\x93\
+\xcf\xce,\x02[\xb5\xe5|\x9a\xdeP\x9eS(\x89\xd6\
+]]3\x1eZ\xd86\xfe\xe3\x8fI\x96\xbb\xb3\xe0\x01\
+L\x00\xcb\x9c\x979;\xc3\x15\xa7\x0cs\x89w\xf6\x16\
+\x1c\xd7E\xeeo\x02\x04\xf8\xddi\xedg'\x83\x03\xea\
+\xdb\x04&\xa2x\x96\x8a\x11\xe0\xec\x8c\xb7\x88\x80\x0b8\
+\xbc\xd7\xf5jt\x0b\x9b\x16-\x5c\xb8d\xc9\x8aE[\
+N\x06\xab\xa5\x81\xb1\xfde\x05m\xf1\x1f;;/_\
+\xfe1\xcc\x1f\xf3\x9c\xdd\x97\x8d\x0f\x04\x01\xeeH\x19\xef\
+\x8e\x0a`\x0d\x06\x1a\xbc\xf7h\xd2\xce\x1fZ\xb4\x08\x7f\
+y[\xb1v\xd5\xc6,\xd5zS\xdf\xce\x94\x0b\xae&\
+\x01\x02F\x80;\x11\xe1,x\x18^|}\x1f\x88\x87\
+\xdfz6,<zM'/:}a\xd7r\xef\x8f\
+)>0\x10\x03\xe2\xf1d\x02\xeep\x90R&\x8c\xfa\
+ZB6nX\x00\x10`\x1bV4}\xd5\x90\x12#\
+ \x0d:S~26F\x803At\xff\x98\x81\x85\
+\xb0\xf7\xcd\x88\xe0\x93M\xf0{\xef\x86\xd5\xa0`\xd1\xa2\
+\x8a,E\xdbrow\x93A69\x04\xde\xe3#\xfa\
+\xa7\x0b\x08=\xd2\xd2/\xea\xf1~\xb8)\xadb\xd1\xe2\
+\x15\xb4\x87\x0dM\xdf\x07\xa7\xdc$1\xaa\x01[E\xa3\
+\x02H\x05\xe3a\xecfD\xf1\xf7G\xb1r5\xd8\x8a\
+E\xfb#\x15\xbb\xe8h\xad\xac\xac(\x0aa\x04\x1e\xc9\
+U|\x1b\xdc\xad\xa8,w\xf4;\xb7\xad\x1f,\xabo\
+\xce\xea\xdd\xb0\x96\xfc\xea\xb8z\xc3\xea\xa3w\x83\xc3/\
+\xd2\xa1\x99N\xf8\xa5\x02\xa6\x13\x8f\xbb7\x13D\xa8\x82\
+\xc0\xc8\xebGW0\x02V]k\x8e\x8d\xc3$w+\
+\x90jEYh\xb3\xde\x07$q\xeb\x89.wv\xfc\
+\xa5\x05\xb5=\xad\x9a\x94hEa\xe4\x8d3L\x0f\x1b\
+V\xedO\x8b\xb8E\xc1\x89pw\xc2/\x98N\x05L\
+1\x15\xb3\xd0\xee\xb7z5\x9a\xd5\xd5\xab7<^\xfd\
+x\xf55x\x8bbk\xdc\x9dI\xf3\xa5\xa4W\x16\xe8\
+\xe9Ai\xae&\xec\xe0\x03\x08\x92\xda\x1fo5\x96m\
+\xaf\x0fO\x09\xca>v\xf3tQ\xde\xfe3\x0bV#\
+\xff5\xf8\xe5Y\xd2\xdbfG7\x8eR\x90^\xa7\xd0\
+\x7fK\xf6\x11\xd3\xb6\x15\x8b\xebm\xe5~L\x97\xb7\x7f\
+K5\x16\xaf\xdewM\x22\xdfX\x80\xc3\xb7\xb2*\xed\
+\xbaOs\xc8<\x0e(T\xf2,\xbd<$\xe9\x00:\
+\xa7\xaf\x1f\xa8\xd9\x9e\x1b\x94\x12\xdd\xff\xe5\xc5[\xces\
+v\xd5\xab#\xbfjjZ\xbca\xe1\xaa}74\x01\
+\x99\x9b\xad\x08>\xa3\xdf\x0a\x8fe\x1fQ\x01\xff\xf7c\
+\x98!~h\xd0\x0aW\xdb\xb2\xc3\x1a\x9e\xdc\xd9\xb7j\
+\xd1\xedU76f\xc5\x1es&\x03\xb0\xeaH\x89\x99\
+Nr\xf1\xd8\xd6[\x94\x15PQ\x91\x95.Wl\x9b\
+\xb3~\xe04\x0c>Hw\xf0\xdb\x82)\xde\xcb\xbd\xbd\
+\xad\xacn&\x19\x1a\xae\xdeX\xbdp\xf5\xf9\xbb\xd1\x01\
+\x81[\xa7;3\x85V\xcc\x05\xa8\xfe\x0f\x15\xf0W\xe2\
+\xa310\x92\xe8\xbdY\x11\x96\x9e}\xf2\xc6\x8d\xb3O\
+\xb2\xf4\xba\xfeu$p\xab\xa79$\xbcf\x9d\x15#\
+\xf3\xa0.\xab\xe2\xfc\x92\xd5_(\xd2\xe5q{\x92B\
+R\xa27\xd6\xdc\x5c\xdf6\xc7{9\x85q^#5\
+\xa4\xa7\xf7\xef\xaf\x88\xcd\x93G_-%N\xa4\xf0\xa6\
+\xcdZ9{\xff\xf8\x0f\xf2\xef\x09\xa7\xbde\xe5L\xdb\
+F\xaf\x15c\xee\xc7\x15j}\xba^\x95\x9enPU\
+\xac\x0f%\xbe\xcb\xc775'\x0e\xec\x9aC\x13/\xf7\
+\xabrW\xef\x83\x9f\x94\xd7\xa2\xf5\x864U\xff\x9a\x07\
+\x97C\xed\xecB\x19 l\xe8\xa6B\xae\xd6\x83\xa5\x05\
+\xd6\x94\xda\x12\xea\x11sF\xc6\xff \xff\xa2r\xdc+\
+S\x18\xa7y\x82{\xe8\x83\x96l\x85Z\xae\xce\xce\xfe\
+\xb6t\x0e\x13\xb7\x8b\xa9\xb8o\xc7\xdc,\x7f\x9a\xdb\xf0\
+\xd5>\xf81\xb3\xe8\xf6\xf5\x06y\xcf\xf8]\xa1\xa1 \
+\xd3\xd6\xca\xbb+\x83\xc5\x08]W\x9e\xa4Pdo\xfd\
+r\xfd\x1c[\xab\xe7\x0d^\xa9\xd2w\xe9?m\x9e\xf0\
+\x8f\x17\xc3h\xb6O\x8f\xd7\xd4|y\xe0r(P\xda\
+Q\xd9mO\xed\xec\xd8\xf0\xf8\x88\x86\xafn/\xd9\xb0\
+d\xc9\xed\xaf\x1a\xb2\x1f\x86\xceY\x0eI\xb6V?\xd6\
+67g\xb4\x85\xd2\x8a\xd0\xe5\xd3/\xaf\xbfu\x7f\x8e\
+U\xa8\xdd\x8b\xf0\xee\xde\xff \x8f\x00\xd9\x831m\xf9\
+\xf2\xe5\xa1\xa1\xee@o\x22\x9dcg\xe7=\x87\x0d\xdf\
+R\x84\xf4.Z\xbbd\xf5\xedE\x1b\xd3\xfb/\xcf\x01\
+r<\xec\xca\xc3\xc3O\xb7\x8d\xcc1\xd4\x96\x0ef,\
+{\x8b\xf9w\xc5\x93\xde\xfdh\xcc8\x08w\x0fu\xb7\
+u\x1f\xb3\x1az\xcd\x97\xe4]\xbf}\xfb\xf6\x8a'\x91\
+\x86|\xef9\xb6\x98f\xfbO+\xbb\x9aZ\xbb\x911\
+Y}gk;6\xbb\x95\xfbG\xff\xcd\xfc\xe3\xf2q\
+\x13\xdebglg;jV\xb6\xdf\x99\xaa\xedBY\
+\xa7\x1dqA\xe0i\x92!\xaf\xe2\xe4\xdd\x8a,C\xef\
+x+\xcackG\xedy2;\x8ao\xc7\xde\xa1-\
+{\x8b\xd9\x01\x18\xc1\xc4\x7f\x87\x092\x12H\xb5\x9d\x95\
+ilvHfgR\xc0\x0aB_m6\xbc(\xe9\
+\xfa\x90\xcc\x9b\xb6\xb6l\xa3\xb6\x14\x81\x11AqLz\
+P\x87I\xddG\x13\xa7\x99\x04Lxk:yf0\
+\x0a\x0b\xf26!%\xd6\x862-\xdb\x85\xe2\xd5\xce\x8e\
+%\xb1\xb5\x0d\x9ds1_*Ud\xd7\x90\xfeI\x14\
+\xafVXFP0\x13\x9f\x00L&\xfa\xecH7\x04\
+\xd4v\xfa[\x13F\xfe\xd6g\xd2\xc4\xf7\x97\xc3\xf4m\
+\x81\x12\xc3\xb0\x227\x80d\x8b\x9eP\x98\xac-\x01'\
+Pv\xb6(\x0aW\xcb\x7f\xbcu\xf3\xe2-x\xff@\
+\x0d*\x22\xd5\xd8\x04\xa62\xe9v$\x06.x\x1c\xc1\
+\x81\x0f\xa5-\xaax\x7f\xa2\xf9\x1f\x99\xbc\xf9\xde\x1f)\
++5Rd\xc7\xac(\x17\xa0Y\x91\x18\xa2\xb0yp\
+\x17J\xe8\xd9\x22[F\xa1\x1d\xb3\xa2\xfePd\xa7\xe9\
+\x0c\x85\x95\xed\x1f\xdf{\xd3\x8c\x1f6\xe1\x9d)\x04\xc2\
+\xca\xd6\xca\x04\x86\xad3\x05\xb4%ZN\xe7i;\x22\
+\x97B\xda\x852\x998\xc0P\xc6\xc7\xe4\x84\x86\xd2\x00\
+\xd1O\x060\xe5\x9dW\x9e\xfb;\x9fw_\x9bb\xfb\
+sf\xc6\x14J\x84\xb1\x0d\x99\xb9\xc9\xd7\xcev\x0c\xb3\
+2\xcbal\xce\x94\xd7\xde}\xeeo\xee\xc6M\x9a\xf8\
+Z\x9b\xdd\x0b\xc0\xa3)\x9eS\xf5\xa2\x8e\xb1\x92C\xcd\
+V\xac@T\x9a\xc8K\x00\x00\x00\xdbIDAT\xe4\
+\x7f\xfe\xaf\xcd\xc6M\x9bHg\x10:&\xdd\xcf\xea\xf8\
+\x85\xf0\x98\xb9\xa1\x84\x7f\xe2\xb41\xfe\xdam\xda\xc4\x97\
+>\x9c\xf3\xcb\xf8\xbf\xc5~E\x22\xd8\xbf\xbf\xf6\xee\x18\
+\xfc\xb8\x0b\xff\xfd\xce\xfb\xd3\xff\xe7\x0a~\xc5\xa6\xbf\xff\
+\xce+c\xf2\xa3\x82\x09\xef\xbd\xf6\xe1\xefK\xf7\xc2<\
+>|\xed\xbd\x09?\xff7\x9f\x93\xde|\xf7\x9d\xdf&\
+\xe1\xd7\x07=\xa6}\xf8\xda;\x13\xa7\xfd<?J\x98\
+0\xf1\x9d\xd7\xde\xff\xe3\xef\xf0,\xbch\x7f|\x1f\xe8\
+\x7f\xa1}\xd3>L|\xef\xa5\x7f\xfb\xdb\x7f~X:\
+\xe5\xf7z \xa6O)\xfd\xf0?\xff\xf6\xdaK\xef\xbd\
+;\xe1\x85\xb7o\xcc)L\x9b\xf0\xee{\xef\xbd\xf3\xd2\
+K\xff\xf6{\xd9K/\xbd\xf3\xde\xc4\x89\x13\xde\xfc\xb5\
+\xeeMS\x187i\xd2\x9boNx\xe5\xf7\xb3\x09\x13\
+\xde\xfc\x99\xad\xff\x7f\x87\x08\xf4\xab\xda\xe3\x9dS\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00P/\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x80\x00\x00\x00\x80\x08\x06\x00\x00\x00\xc3>a\xcb\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00 \x00IDATx\x9c\xec\
+\xbdw\xbc\x14\xc5\xf2\xf0\xfd\xed\x99\xd9\xdds\x0e \x19\
+A$\x88\x8adAT@\x94 IT\xcc\x01\xcc\x98\
+0 \x22\xa0\x82\x88D\x03\x06T\xd4k\xba\xe6\x84p\
+QAA\x05$JFAA\x143\x08H\x06\x81\x93\
+w\xa6\x9e?&\xcf\xce\x1e\xf0\xde\xfb{\xde\xe7}\x9f\
+\xb7\xcfg\xcf\xcevWwWWUWWW\x87\x81\
+\xff?\xfc_\x1d\xd4\xff%u\xfe\xbf)\xc8\xff\xce\xca\
+\xfe\xa7\x98\xa1\x00\x1d0>\xfcpa\x8b:uj\xd4\
+K\xe8\xa9\xdaF2U=i\x18\x1a\xda\xffP\xad\xff\
+\x1f\x08%%i\x8a\x8b\x8b\xf7i\x92\xde\xb2u\xf7\xde\
+?&\xbd\xfd\xc6\xba7\xdf|n?\x90\xe6\x7f@8\
+\xfe\x9b\x02\xa0\x00c\xca\x94\xcfOi|B\xe3\x9e\xe5\
+\xca\x95?3\x95\x93s\xb2a\xe8\xc9 \x90x\xff\x02\
+\xb9$\xf0}\xb85Ea\xb3\xe5/\xab\xdc\xbfS\xce\
+\xe1\xa6\x1f.L\xb6\xac\x11\x8e\x88eY\xc5%\xa5\xeb\
+\x0f\xe6\x1fX\xb4s\xe7\xae\xcf:v<q\x16P\x02\
+X\xff^\x0d\x91\xfa\xfe\x0beh\x83\x07\x0f\xaer\xcd\
+5w\xf4\xadT\xa9r\xdf\xdc\x9c\x9c\xc6\x00\x12d\xaa\
+[\xcb\xdf%\xca\xdfe\xde\xffI\xe1\xdf\xc1/\xc8\x0d\
+\x09\xffv\x1f\xd3\xe9\xf4\xf6={\xf7NZ\xb9r\xd9\
+s}\xfb^\xf2\x1b\xb6f\xf8\x8f\xd0\xfc\xb7\xf3^q\
+\xc5\x15\x95\x86\x0d{x@\xd5*\xd5\xee\xd0u\xa3\xea\
+\xff\xa3L\xf9?] \xfe\xd3\x90\xa1)\xa5\xf4\xaf}\
+\xfb\xde\xfel\xd6g\x0f\x0e\x18p\xdd\xef\x80\xf9\xef\x16\
+\xfb\xef\x04c\xde\xbc\x15\x17\x1fwl\xe3\x09\xc9d\xf2\
+\xa8\xc3\xca\x11\x91\xe8\xff8\xb8\xcc\x0ej\x97\xffV\xf9\
+Q\xad\x15\x15\xae\xc3\xad\xf3\xbf\xdd\xe6\x98`Yf\xc1\
+\x96\xad\x7f\x8e\xbf\xfd\xf6\xfeO-_\xfe\xe9\x01\xfef\
+7\xf8\xbb\xe8\xa9;\xee\xb8\xa3\xda\xed\xb7\x0d\x7f\xaar\
+\xe5\xcaWx\xb1\xd9\x08\x167\xbeg{\x8e\xc3,\x0a\
+\x17\x8d\x0b\x86l\xe3\x7f\xb6\x90\x0d\xcf\xb86\xc5\xc1\xff\
+]\x98\xb2\x84*n\x88,\x0b\x97hPP\x98_\xb0\
+j\xce\xdc\xcf\xfb\xdexc\xef\xef\xf9\x1b\xda\xe0\xef\x08\
+\x80\xf6\xfc\xf3o6\xe9\xd9\xf3\xfc)\xb999\x8dB\
+\x08\xabL\xe3N)\xdb\x0e(\xb3m\xca\xb7\x15\x94\x80\
+8\x09*\x00,\x04\xd2\x9d\xbc\x12\xc0\xda\x85\x8d\x83\x0b\
+\x067\xddE\xc4+\xe7\xef\xe2\x1cS\x97_`&,\
+N=*X\xa0\xdb\xeeP^A\xa1\x9c4\xe7\xd9\xcd\
+\x1b\xa1s\xc6o\xa7h\xcb4\xf7\xae\xfbn\xed\x0d\xdd\
+\xbb\xb7\xf9\x04(\xe50\xc2\xe1\x0a\x80\xfe\xda[\x1f\x9d\
+\xd6\xbds\xd7\xa9\xba\x91\xa8\xee\xb7\xecP\xdd;&:\
+k\xf8\x1b\xfa4T\xde\xa1\xba\xee\xbf\x17\xfcR\xb2\x8a\
+\x93#1e\xc1\x94\xa52\xb2\xa9\x9el\xe5\x91\xa5\xdd\
+\xe2L\x1d\xbc\xdf\xa5\xeb\xd7\x7f?\xf0\xcc3[\xfd\x13\
+{\xb6Pf8\x9c\x19\xb9\xfe\xcf\xd7\xa7\xb6\xef\xde\xa9\
+\xeb'6\xf3\x1d\xb1\x0f\xf6\xbc\x0cd]\x84| \x09\
+@\xfbM\x90\xc0wf\xbf\x0b?)\xbf\x8c\xa8\xba\xf1\
+`2\xcb\x91@-\x99\xf0\xd1\x18\x09\x94\x12\xce%1\
+\xf0\xe1n,\x91o\x1fo?D\x9f\x83y2TB\
+&%2\xda\xed\x94/\x01\xf5\x89J4n\xdc\xf8\xb9\
+9\xf3\xbe\xba\x09\x08M\xc1\xe3\xc2\xa1\x04@\x9b8\xf1\
+\x85fgu\xe9>UO\x18G N]\x91\xc6\xf9\
+\xe8\x0b\xe2\x90\xce\xfe\xb8\xcf\x12\x12\x89h\xd3T \x8f\
+Mz!LxE\x94T\xe2\xd5\xad\x02\xd0n^\x1f\
+\x0f\x15 \xa6\x04r\x87\xcb\x0c\xd7\x18\xec]~-~\
+\x0b\xc2ms\x9f\xc3L\x0b\xd3$(\x5c\xc1?\x17\x07\
+\x15\xa2\x95\x9b\xe6\x97\xa7\x02\xf9\x15\xd1\xfa\xbd\xfa\x9c\x08\
+\xa5\x14\xcd\x1a5\x998k\xd6\x92\x8b\x81D<k\xed\
+P\x96\x00\xa8\xde\xbd{\xd7\xec\xd5\xab\xf7$#\x91\xac\
+fw\xbc \xd3\x83\x84\x8f\xeb3\xa1\xa2\x22=H\x05\
+~I(-N\x1b\x84\xeb\x09C\xfa\xbfT \xaf\x8a\
+\x85qK\x08\xb21\xb6g\x87\x08N\x00\xd2e\xb4\xdf\
+\xe6L\x8d\xa5\x08\xd3\xc9/3\xac\x11\xfc\xbc\xfe\xff(\
+\xfe\xe1r\x09a\x14M\x0f\xb4X\x04\x94\xa65m\xda\
+\xf2\x9f/\xbd\xf4\xd6)\xd8^\xd9\xd8\x905\x01(\xf7\
+\xee\xbb3\x9f\xadX\xb1b\xe7\xf8d\x17\xd18\x02f\
+\x83=\x5c\xb8x\xa6d>\xc7M\x0f\xb2\x95\x9b\x19D\
+\x84]\xbbvS\xae\x5c\xdea\xe0\x16\xac/{\x99\xd9\
+\xf3\xc4\xa9\xffC\x98\xf6\x87\x15\x1f\xf7\xdb\x8eS\x9aJ\
+\xd4\xad\xd3\xe0\x8cu\xebV\xbd\xff\xdbo\xbf\xe5\xc7\x95\
+\x96M\x03\x18\x1fN\x9f\x7fQ\xf5\xea5\xfa\x1c\xda0\
+\xcb\xac8\x1e\xeep\x1a\x9c)\xdd\xe12\xa2v\xc2\xe1\
+\x0aJ\xa4$\x81t\xda\xe4\xc6kn\xa4\xdbi]\xb8\
+\xed\xe6[0-+<\xa4g\xc5!\xf8\x1c\xcd\xa0\x0e\
+\xf1\xed>\x875g|\x19Q\xda\x06\xeb\xcd\x98\x93\xc4\
+\xe0e\x8f\xd5\xb9\xb9y\x0d\xc7?\xfa\xe2X \x97\x98\
+\x10\xa7\x01T\xbbv\xedj\xf5\xbf\xfd\x9e\xc9\x86aT\
+\xc8\xce\x90C\xf5\x80\xb8\xf4\xff\xdc:\xffO4\x898\
+\xdaq\xff\xfe\xfd\xbc\xf4\xec\xcb|\xf1\xc9|\x12Z\x8a\
+\xad\x1b\xffd\xc3\x0f\x1b8\xbeqC*U\xaad\x97\
+\x90\xb5\x9a\xffF\x1b\xb2\x95\x19\xa7\xc9\xa2q\x87\xabu\
+\xfdP\xa1|\x85V\xf5\xeb7\xfa\xe2\xd3O?\xdc\x14\
+\xcd\x1c\xd7\x9a\x9c\x85_\xae\x1ds\xfc\xb1\xc7\xdf}\xe8\
+\xa2\x0f\x07\xe1hU\x7f\x0f\xf9p\x99\x87\xab\xf23\x83\
+\xcd|\xe1\xb3\x99\xb3xt\xe4x\x8a\xf3KP\x9a\x81\
+R\x82\x88 \x96\x89\xa5L\xae\xbb\xad\xaf\xdc\xd2\xbf\x9f\
+\x82\xb2\x84\xe0\x7f\x22\x1c.}\xca\xa2o\xf6\xce\xbaw\
+\xdf\x9e\x85M\x1a\xd7:\x0f\xf8+\x98\x12\xd5\x00\xaa\xcb\
+9\xe7\xd4\xbd\xee\xca\x1b_\xd4u='\x88N\x1c-\
+\x0e\xa5\xd4\xcb\xca\x9f\x8d\x9dQ2d\x96\xef[\xc7e\
+\xcd\xa2\x09\xa4\xbbv\xd1\xe2EK\x18v\xc70\xc4\xd4\
+Q\x9a\x8e\x88\x89\xab\xf7\x95R(4\xbe^\xb6J\x95\
+\xab\x94K\xf3\x13[x\x02\x90\xad\x9d~\xfc\xa1\xc6\xe5\
+\xb2C\x9cR\x0f\xd3D\xc5\xd2'{\xfbU \xce6\
+Jssr\xeb5l\xd8d\xf9'\x9fL\xfd\x99\xc0\
+Jb4oj\xce\x9cU\xf75i\xda\xec\x81C\xa3\
+\x9d]\xe2\xc2)\x7f\xbf\xb7\xfe[A|f\xab\x909\
+\xa2\x10KH\xa7K9\xb7\xcb\xf9\xec\xdf[\x00\xa2\x91\
+sL3j\x9f\xd5\x07=\xaf<\x07\xfe\xd8\xcc\xce/\
+\xde\xc5\xdc\xf9; \xa8\x94\xc5\x8cy\x9fR\xa9r\xc5\
+\xc3\xac\xfc\x7fS\x1b\xcb\xac\xcf\x9f\xb6f\xc3d\xf7\xae\
+\xdd\x9f7o^\xfb2`\xbf\x1b\x175\x02\x8f\xa8W\
+\xaf^\x1f\xb7\x04w\xcc\x8c\x0f\x12~\xf4l\x22\xe51\
+\xc2K\x0c\xdb%^\x8f\x8c\xcc\xb3b\xe32\xec\xaeH\
+\xd5\xc1*\xb0\xab\xf7\xe8#\x02b\xd9)K\x97,c\
+\xdf\xde\xfd\xa0)Ru\xea\xd2\xf5\xe1g8\xf1\xcc\x8e\
+4kw2mz_\xc0\x99\x13_G;\xb2\x1e\x16\
+\x1a\xa5\x85\xc2\x9c\xd9sb\xda\x16_\xb7\xe7\x1c\x89\xc5\
+[\x85\xf2I\x5c\x9b$\xf2\x1c\xa0\x87\x04\xfb\xa8\x07\x9b\
+i\xdb\xb88XA\xd0HyU\xabV=\xf3\xea\xab\
+\xfb5$\xc0\xf7\xa0\x00\xe8\x0f>\xf2\xcc\xc9\xe5\xcaU\
+8\xde\xcb\xec\xd2R\xb2\x7f\x82\xc4\x17\x94=\x9eF\x1a\
+\xeb\xe1  \xa6\xf8\xf1\x02\x96\x03\xef\xe5\x89\xa1\x87O\
+\x8c\xc8w\xa4~\x8f\xf7\x1e~\xf6\xf8\x0e\xc2\xf2\xc5\xab\
+D\xe9\x1a\xa2L\x8e\xe9~6\xb99It]\xa1\x14\
+\x18\x02\x15\xf3\xf2ht\xe95Xb\xa2i\x06?}\
+\xffK\x80\xaf\xbePK\xa8|\x1f\xcft\xda\xcc\x80\xf7\
+q\x08\xf3-Z\x86-\xa8\xd1v\xbb\x82\xe3\xd3'\x5c\
+\xae\xffQ\xc1<\xc1\x8eD\xd0Y\x05@\xe2\x9akn\
+8\x9f\x80\x87\xd0\x08\x08@\xaa}\xdb\xf6g\xc5\x09\xb8\
+\x1fb,k\xdc\x8a\xc2\xa2\x1d\xea0\x02\x82`\xa6M\
+\x96.Y\xce\xb7k\xd6\xc9\xbe={U2eX\xd5\
+\xaaU\xd7\x9a\xb7j&\xadZ\xb5T\xba\xae{\xd5\x04\
+\x95Y\xc6\xc2I\xa0\x02+0\xe2\xf9u\xdaO\xbf\xfd\
+\xfa\xbb|6c\x96Z0w\xa1\xfc\xfe\xf3oJ3\
+\x0c\x10\x0b]\x13\x94\x80e\xf9\x02\xa5,\xd0\x12\x82R\
+\x1a\xa0a\x9a\xc1\x0d7\x0e\x1eY\xdb\x0f\xb7\xdc\xd2W\
+\xc6\x8c\x1dO\xad\x9a\xb5Th5\xcb\x05R\xb1\x9d\xd7\
+M\xf2~\xf8\x8a\xc3\xcd$\x99\x00\x91\x81;\x93\xea\xf1\
+\xbf\x05\xa8yT\xed\xae\xc0S@\x11\x84\x05\xa0|\xb5\
+j\xb5\xda\x87*p\xa4\x08\xc4\xefZ\xb1\xc6\xaa\x84\x91\
+\x12?\x9b \x88 \x93\xdf\x99\xcc+/\xbc\xa9\xf6\xec\
+\xdc\x8b\xaei\x0e\xb4\xa5\x89\xad\x16T\xad:5\xe9?\
+\xe4\x0e\xe9vV7\xa5\xe2(\x15\xa9N\x10\x0a\x0b\x0a\
+e\xfd\xfa\xefi\xd0\xa0\x81\xaaT\xb9\x12\x0a\xd8\xb3g\
+\xaf\xcc\x98>S\xcd\xf8d\x96l\xf8\xfeG\xa5\xeb\x06\
+\xbaR\x0a4\x94(\x04\x8d_g\xcf\xa0\xd5%\xd7P\
+t\xd0\xa6\xb3%`\xe4\xc1\xef\xb3\xa7\xa34\x03\xb1L\
+\xea\x1f[/\x06\x85\xa0Z\xf4c\xe7\xce\x9b\xc7\xf2\xe5\
+_\xa9qcG\xc9\xc4\x89\xff@\xd35[(\xdd\xe5\
+\xc5@V\x11\x9b\x22\x0b\xe7-b\xd1\xbcE\xea\xe7\x0d\
+?JA\xd1\x01\xa5\xebI\xa9{t]\xd5\xb6\xc3i\
+\xd2\xe3\x9c\x1e\xaa\x5c^^\x80\xee\x8a\x8ce\xce\xb8N\
+\x11\x17\x1f\xc9S\xe9\x88*\xadk\xd7nPu\xcb\x96\
+_\xf78%\xdb\xa0\xa9T\xea\xd8\x1f\x7f\xda\xf3\x9d\xa1\
+\xeb\xc9\xff\xa6Ms0?\x9f\xc1\x03\x06\xf3\xf5\x92\xb5\
+\x18\xba\x81'\xd5\x04\x9d\xaa\xb6\x0e4\xad\x12\xce\xbd\xac\
+\x17\xf7\x8f\x1e\x81;\x0f\x8bZ\xbd.\xfc\xc6\x8d\x9b\xb8\
+\xe1\xca\x1b\xd8\xbbk\x1f\xa9\xa4\xce\x15\xd7]-\x1b\x7f\
+\xdb\xc4\xa2\xf9_\xaa\xb4\xa5P\xba\x8e)\xd0\xe2\xc4\x16\
+\x9c\xd9\xf5t\x8e?\xbe\x01w\xdf>\xc4a\xb8\xc5Q\
+\x1d\xbbr\xf2\x0d\x83I\x94\xaf\xc6\x81\x1d\x9b\xf8~\xea\
+?\xd94k6\x00\x96\x95\xe6\x83YS\xa4v\xedZ\
+*v\xae\xe2<\x9a\x96i\xddw\xdf0m\xce\xacY\
+\x88f V\x9a:u\x8eb\xcc\xe8\x07i\xd9\xb2\x95\
+\x9d+\x90MDX\xb5b\x15\xe3G?\xca\xa6_\xff\
+@)[\xe3\xd9\xb3\x0dg\xb8\xb2L*T\xaa\xc0\xad\
+\x83o\xe5\xa2\xcb.\xf1\xaa;\xfcp\x08\xe6)x\xef\
+\xfd\xb7\xae\x18r\xd7M\xff\x02J]\x0d\xa0\x0d\x18t\
+\x7f#]w6p\xfe\x17\x98o\x8f\x8bi\xee\xbcu\
+ \xebV\xff\x80\x9eH!\x22\x98F\x8a\x8a\xc7\xb7 \
+Y\xb1\x0aVI)\x85\xdb\xfe\xa0\xe4\x8f\xef\xd1\x95\x8e\
+\xa6\xe50s\xf2\x0c\xd2f1\xa3\x1f|\x10_\x99\xfb\
+S?\x97\x17o\xbc\xf2:\xfb\xf7\x1e$\xa9\xa7\xc0T\
+\xbc\xfd\xda\xbbJDa\x9a\x8a\x86\xcd\x9aI\xd7\x1e\x9d\
+\xe8\xde\xb3\x8b:\xbav\x0d\x0f\xa3\xde\xd7\x5c.\xef\xbf\
+:I\xe9\x9a\xc6\xf6\xf9s\x99>w.\xa4\xcac\x15\
+\x1fD\xd7\x0c\xa7\x93\x09\x97^s1\xb5k\xd7r\x94\
+ph0\x0b=\xea\x9a\xae\xddr\xcbm\xfc\xb5\xef \
+_\xad\xfe\x9a\x9cr\xe5\xe4\xfa\xbe7\xa9\x13[\xb6\x14\
+q:\x97\xb8}L\x84w\xdf|\x8f\xa7\x1f~\x0a\xdd\
+\xc8\xc10r@\x04KLD\x04M\xe9\xe8\x9a\x86(\
+\xa1\xe0@1\x8f>\xf0(\xdf~\xb3\x96Q\xe3F\xfd\
+M\x87\xc4!\x98'\xd0\xf0\xb8\x86-\x80\x8f\x08\x08@\
+\xa2\xf1\x09M\x1b\xc4h\x8cX\xedR\xd6\x9c\xd5K\x17\
+\xe1\x85g_\xe2\xdb\xd5\xdf\xa3\xf4$\xa6iR\xaf\xdb\
+\x85\x9ct\xd5\x1d\xe4\x94\xcb\xb5\xe7\xdd\x1a\x14\x95\x9al\
+\xfei\x13\xdf\xbd0\x86\xd2\xdf\xbf\xc3\xd0\x12|>\xf5\
+sN?\xa3\x03\xddzt\x0f\xd5l\x9a&K\xbe\x5c\
+*\x93\xdf\x9b\xc2\x8a%+\x94\xa6\xe9(\x0cG[\x08\
+}\xae\xe9\xcd\xa5W\x5c&\xb5k\x1f\x19\xb0\xda|\xcc\
+\xfa\xdfu\x9b\xda\xbds7s>\x9e\x8d\xa6\xeb\xe8J\
+\xa04\x1f]S\x882Q\xca\xd6\x0e'4:\x1eK\
+\x9c\x11?\x86\xf8A\xfa\xd4\xaf_\x9fg\x9e\x99\xc8y\
+\xbd\xce\xa3\xff\x80\xfe\x9c}vO\x1b\xc4#\x9e\xad\xba\
+\xe7\xcc\x9e\xcb\x93\x0f?I2\x91\x07h\x94\xa6K\xc8\
+m\xd8\x9aJ'\xb4&yD\x15\xcc\xa2\x83\xec\xffi\
+-\xf9\xdf}\x89!\x1aJK2k\xea\xa7T\xa9R\
+\x85\x01\x83\x06\xd8\x85\xa9x\xde\xc4i\xfd(\x9e\xc1\xdf\
+\x15*T\xaa\x0f\xa4\x80B7\xae\xdc\x07\x1f\xcd\xbb\xff\
+\xd4S\xda\x0d\xcdh\xed\xbf\x13\x04v\xed\xde-\xe7t\
+\xbfPa\x19\x88\x08M\xaf\xbe\x89\x96\x17\xf5\xc5J;\
+\xc6\x97\x83\x90R\xa0\xe9PX\x9cf\xde\xe8\xbb\xc8_\
+\xb7\x1c%i\xcaW+\xc7\xf4/>%\x910\xd8\xbe\
+}\x07S\xde\x9b\xc2\x87S\xa7\xb3w\xf7>t]\x07\
+\x01C\x19\xe8JC\x10\xce\xbb\xfcl\x86\x0e\x1f\x8a\xaf\
+5\xc2!(\xdc_.Z\xca\xd4w>`\xedW\xdf\
+PRR\x82f\xe8\xb4\xe9\xd8V\x12\x89\x84\x9a\xfb\xd9\
+<\xdath\xcd\x84g&x\xc3\xd0a4\x975\xab\
+\xbf\x96\x96-[\xaa`\xf7p\xeb,,,\x94s\xbb\
+\xf6R\x85\xf9\xa5\x80\x01\xe5+\xd0\xf6\xae\xc7\xa9{b\
+S4M\x91.\x05\xa5A\xa9Xl\xfdm3k\x9f\
+\x1eN\xe9\xc6\x0d\x08\x16\xa5V1/OzM\x9a\xb7\
+l\xfe_sLn\xdd\xba\xf9\x8bSO9\xee\x0a`\
+\x87\xab\x01\x8cd2Y%\xd8 \xb7\x01\xc1\xb8l\xd2\
+\x17\x87\xd8\xf4\x8f\xa6+1\x15\x9a\xae\xa8\xd0\xa0\x11\xad\
+.\xe9K\xba\x18\xc4\xb2\x8d.O\xb9+\x85\x08\xe4&\
+\x0d:\xdc;\x96\x8fo\xba\x10\xa3\xe8\x00\xfbw\xee\xe7\
+\xd9\x09\xcf\xf0\xfbo\x1be\xe9\x97\xcb\x94\x85\x0eJ#\
+\x95[\x81\xb3\xce\xee\xce\xa5}\xce\x97t\x89\xa9V\x7f\
+\xf5\x8dT\xabQY\x9d}n\x8f,\xac\x0f\xb7I\x80\
+\xf6g\xb4\xe3\xf4\x0e\xa7q\xef\x80\xa1|9\xffKz\
+]r\x0e\x83\x87\xdd\xadv\xed\xd8\xc5\xecYsX\xb2\
+d){\xf6\xec\xa5J\x95\xca^\xfe\xb2z\x16@\xab\
+\x96\xadT4\xce}\x9e\xf4\xd6\xfb\xaa \xbf\x14\x94\x81\
+*\x97\xc7y\xcf\xbeE^\x85\xea\xce\xa2\x14\x98b\xcf\
+Bt4\xea7\xa8K\xb5\xf1/\xf3\xc5\x90+)\xdd\
+\xbc\x09CK\xf2\xec\x93\x13\xd5Ko\xbc\x1c\xdb\x9e8\
+\xad\x1d\x17O\xe0\xb7a$*\xe1\xec\x13\xf0l\x00M\
+\xd3\x12q\x0d\xc86\x04\xc454\x98\xb6j\xf97(\
+\xa5\xb0\xa4\x94\xa6\xe7_N\xba\xc8\x8e\xb7\xa7^\x128\
+\xd5 \x8e7B\x91W\xbe\x12u\xbb\x9e\xcf\xe6O\xde\
+A\xe9I&\xbf5\x15K)e\x89\xc1Qu\x8e\xe6\
+\xb2+/\xe1\xbc\x0bzrD\x85rnU\xb4h\xd9\
+TQ\x06\xe3\xdd\xe0\xd6\xe7\xfb\x0a\x84\xd2t)\xa6e\
+\x22\x0e\xce\xd5kT\xa3\xedi\xa7\xb2d\xc92f\xce\
+\xf8\x84\xab\xae\xbe\xda6\xc4U\xf6\xf6\xfaq\xf1\xc6\x97\
+\x02f\xce\x98\x05J\xc3\x92R\xda\xde|\x179y\xd5\
+\xb1\x1c/\xb4e\x09\x96e\xd7\xa1\x94\xed\xf6-\x9f\xca\
+\xe1\xd4A\xe3\x98wg\x1f\x12F\x825+\xd6\xb0g\
+\xcf^*\x07\x042\x8aK\xb6\x09`\x5c\xbc\xa6k\x06\
+\x0e\xd5=G\x90e\x89\x16\xdf\xb0C\xcd.c\xd2\x14\
+l\xd9\xb2\x15\xa5\x14\xe9\x92\x12*\xd5o\x8cc\xe0\xda\
+\xcc\xb7\x8d~\xfb#\xb6P\x98\xa6`\x9aP\xb5Qs\
+Le\x82\xd2\xd0\x8d\x04]\xcf\xea*\xcf\xbd\xfa,\xd3\
+>\x9d\xc4UW_\xe22?\x80\x83\x84\xf0\x8c\xc3\xad\
+\xa0\xb0\x88E\x0b\x16\x22fx\xc9\xd7\xb4\x04\x0b\x8b\xd2\
+R\xd3c\xdf\xb9\xe7\x9f\x8be*>\x9e\xf6\x89W\xfe\
+\xe1\xd9\xc4\x12\xf8\xef\x7f\xef?pP~\xfdy\xa3m\
+_\x18I\x1a\x9c\xd6\xddo\xb3\x15\xf0E8\xcf\x96%\
+\x98\x02\xd5\x8fmD^\x9d\x13\xb0P(\x12|\xbb\xe6\
+\xdb\xc3\xc2\xe2p\x82e\x89\x86\xd3\x17\xfegN\xe9\x09\
+\x14\x14\x14a\xf7s\xc1\xc8)\x17\xf2\xfeE\xb7\xd2\x05\
+\x85 \x99\x93\x87 \x88R\xb49\xa3-\xe3\x1e\x1b\xa9\
+Nm\xd3\x12qz\xa1\xe7\xb8\xc1%\xb2oo\x05\xbc\
+\xc0\xf8\x13M\xc5\xc4\xa7\x9f\xe0\xce;oe\xe6\xccO\
+\xd0\x94\x9fn\x09X\x12\xde\xad\xd4\xb9KG*U>\
+\x82\x9f6\xfc\xcc\xcf?\xff\x1c\xef\x09\x17[\x90\xa3R\
+\xe7\xc2\x06\xdd\xb1\xdb\xfe\xdc\xa64]GD\xa8P\xfb\
+XPF\xd8\x8b\xe9\xb6\xdf\xf96-\xb0\xd2\x82U\x0a\
+\x95Nh\x8ch\x0aM\xd3\xd8\xbbg\xdf\x7f\xc4\x8fl\
+!,\x00A\xf1\x8d\xd5y1~\xe9\xd8n'\xe4\xe5\
+\xe58\x9c\xb20\xf7\xef\xcd\xc8\x1e,7(\x14\xc5\xfb\
+\xfeD3\x92\x80P\xed\xc8\xcaa\xb4\x04g\x8b\xb5\xad\
+/\x95\x0aZ\xc6\x0e\xfb\x95\xc2\xff\xb3\xf3\xb6>\xf9T\
+i\xd6\xac%M\x9b5u\xec\x0f\xbf@\xc7Q\xe55\
+C\xe9:=\xce\xea\x86\xa6\x19L\xfb\xf0#\x05\xbe\xbb\
+:\xdc\xce\x80\xbdg[\x8bx\xabv\x11\xd9P^\xfb\
+4\xcf7\xe4\xba\x893\xda'\xb6M`\x99 J\x03\
+MCPhzL_\x8d\xf2(\x9b\xba.\xc3z\x0c\
+\x95\x1a\xeca\x19\x1f\x07a\xdf/\x1d\xa9?\xd4\xbb\x15\
+\x0d\x1a\xd4\x17\x80\x84\x91b\xf3\x9a\x85hq\xf8\x8b`\
+Z\x16\x96\xb3`\xa3'a\xf3\x8a\x85\xb6b\x128\xa1\
+QC\x8f\xa0n\xf06\x90\x06\xea\x0bm\xd0\x14\xc1\xc2\
+\xfe\xb8q]\xbatWo\xbd\xfd\x0e\xf5\xeb\x1f\xeb5\
+\xd4cN\x06\x01\xe0\x9c\xf3\xce\x161\x15_\xcc\x9a+\
+b\xd9-\xb2=x\xbe\xa0\xba\x8e\xd10\xcd\x22\xeaI\
+\xa0\xd6Q\xb50\xadR@8\xb8\xf9'\x04\xc9\x98X\
+\x84\xb4\x96\xd3&\x95\x80\xbf~\xda\x00(,\xcb\xe2\xe8\
+\xbaGKPsD;O\xa8\xefJ8>\xbav\x13\
+\x0ce\x0f\x01\xb1\xbd\xdbO\x02[\xddE\xbd\xe6\x02\x9c\
+\xde\xb1\x9dRb\xa1)\xc5\xdaIo\xa0\xd4\x014-\
+<\xab2\x9d\xee\xa8){\xc9v\xd7/\xdf\xb0c\xd5\
+24Q\x98b\xd2\xb6}\xbbp\xcb\x9c\xcc\xc1\xa8`\
+\x9d\x96c_\xb8\xe3\x85\xdb\xc3\xc0_\xa0\x8ak\x87\xae\
++\x82\xa7M\x1a5i\xa4\x8e=\xae\xbe\xec\xdc\xba[\
+u:\xb5\x93\xba\xf9\x9a\xeb\xd9\xb9s\x87\xeb\xc6\xb5\x05\
+Ll\x86G\x19\x17\x14)\x01\xca\x95+O\xbdzu\
+Q\x08R\x94\xcf\xe6\xaf\x17x\x06_\x94\x96\x04\xca\xd9\
+\xf3\xdbz\x0a\xb6\xfc\x82\x12\x85\x912h\xd2\xac\xa9\x8a\
+\xb67\xae\xb3\x1f*D\xf3yk\x01V$\xc1\x95\xf0\
+\xd8\xf9O\x00Y\xcf\xe7\x1fi\xd0\xd9\xe7\x9d\xc3k/\
+\xbe\xca\x9e]\xfb0J\x0b\x99=z0=\xc6>\x8d\
+\x14\xe7\xda\xbd\xd4\xb2\x19\x8f\x02S\x04\xb3\xe8\x0f\x96=\
+1\x82\x84f \x92\xa6S\x8f\x8e\xd4\xacU3C\xcd\
+\x05\x1ck\xb6W9\x90\xa8\x94\xe2\xeeA\x83\xd8\xb8\xf1\
+\x17\xdexk\x12\xb9\xb9\xb9\x0e@\xcc\xd8#\xca\xb1\xba\
+q\x86\x12\xf14\x83BQ\xf3\xc8Zj\xd3\x8f\x9b)\
+)H\xb3n\xd5w\x8c\xb9o\x94\x8c}\xec!U\x5c\
+\x5cBiI)\xfb\xf7\xefg\xdf\xde\xdd\x1c8p\x80\
+\x03\xfb\x0fr\xf0@>\xfb\xff\xda\xc7\xc1\x83\xf9\xe4\xef\
+?HAA!\x05\xf9ERRP\xa8vm\xdb\x01\
+\x96\xc2\xd0\x92,\x7f\xf6q.\xf9gkD*\xf8\x0c\
+\x09j\x15@%\x8a\xf9\xea\x991\xe8z\x02,\x93\xce\
+\xdd;\x91L&\xc3t\x8eS\xedY\xf8TV\xf0\x17\
+\x83\x22\x12 \x19\x0f\xc4\x8bX\xa8;\xfaX%\x13I\
+F\x8c}@\x06\xde4@\xe9Z\x82\x03\xeb\xbe\xe1\xc3\
+\x1b\xae\xa2\xd9\x957P\xfd\xc4\x0e$s\xcb\xa1ta\
+\xff\xd6\xdf\xd9\xb2\xecc~\xf9\xe8\x03T\xdaDaa\
+$\x0d\x06\xde}\xa7\xd3\x83\xfd\x11\xbel|ln\xfe\
+\xfa\xeb\xcfl\xdb\xb6\x8dt:\xfe\xd4\xb4x,\xf6\x7f\
+\xdb\xcb\xd8\xf6\xe0|\xf0\xe0A\x9ezt\x02\x8b\x17.\
+!\xa9\xe58p\x1a_-\xfdJum\xdb\x01Q\xae\
+\xf0\xea(e8%i(\xec\x95D\xf1\xac\x0f@D\
+\xb9S;C7l\xa8];\x98v\xfb\xb5t\x19\xf7\
+89\x95\x8e!]\x1c@\xce\x80\xc2\xdd\xbf\xb2b\xc2\
+\x03\x14l\xde\x8aB0R\x1a\xb7\x0e\xbc\xc5_\x87\x0b\
+29[\x97\xcf\xe8\xc9\x91d\xcb\x8f0\xc8\x08q\xa2\
+u\xb8!\x9c\xef\xe46\xa7\xa8\x01C\xef\xe2\x99\x87\x9e\
+\xc40\x12X\xbb7\xf3\xed\xd3\xa3\x10\xa5C\xb9\x8aX\
+\xe9\x12\xac\x82\x03hz\x02%\x96;\xf4\xf3\xc0C#\
+\xa8^\xa3\x06e\xaa\x9f\xb8 \xf0\xd6;\x93(M\xa7\
+)_\xa1|$I2~\xb9\xcc1\xd3% 0{\
+\xd6l\x99\xf0\xe0\x13j\xef\x9e} \xca\xd6P6k\
+\xa9]\xef\x04\xa9X\xad\xba\xca\xcd\xcd%\x91L\x92\x93\
+\xd4I\xa5rI\xa4R$SI\x12\xa9$y9)\
+\xca\x95\xcb!\x99L\x90H\x1a$\x92)rrr%\
+/7\xc9\xda5_\xa9\xb7\x9e{\x15M\xe9\x94n\xf9\
+\x83\x8f\xfb^F\x8d6\xa7Q\xb9\xf1\xc9\x18\x15\xabP\
+r`\x1f\xbb\xd7}\xc5\xeeU\xcb\xd0\xd1l\xcdh\x95\
+r\xcf}\xf7R\xb3f\xcd\xd8\xb6\x1eV8\x04\x5c\x8c\
+\x00\xfc\xb7\x1c\x8ev\xb8\xec\x8a\xcb\xa8Z\xbd\x1aO\x8d\
+}\x8c\x83\x7f\xe5\xdb\xea\x16\x0b\x0a\xf6\xa2\x89B\xd75\
+D9&\x9b\x12\x8e\xae{\x14\xad\xdb\xb4\x16@\xb9\x87\
+$\xff\x8e\x0f47/\x97\x1c\x0b\xfc\x13\x99a5\xeb\
+\x06\xdb\x05m\xaf\xc6m\xdf\xb6\x9d\x81\xb7\xdd\xc1\xe2\x05\
+\xcb\x94\xd24\xce\xe8t:\x03\x06\x0f\xe0\x9d\xd7\xdee\
+\xfd\xb7\xdfq\xf2i\xad\x190x\x80\xd25w\x0b\xa5\
+\x8a\x90)J\xe5\xa0~\xb1\x07\xaaV\xad\x9b1\xfb\x93\
+\xcf\xd9\xbei;\x0a!\x81\xc6\xde\x15\xcb\xd9\xb3b\x19\
+\x968\xc3\x10\xca\xd9\xa4i\xa24\xc5\x90\xfb\x07\xd1\xeb\
+\x82s\x1c\xd5\x1f\xde\xe9\xf7\x9f\x05\xbf\x9c\x0c\x01\x10\x0f\
+\xa0l\xd1\x09\xba\x1a\xa3\x1a\x87H\xdc\x99\xdd\xce\xa4M\
+\xbbS\x99\xfc\xf6d\x16\xccZ\xc0\xa6\x9f\x7f\xb5!\x95\
+\x90\xb6\xa0V\xed\x9a\xb4\xeb\xd0\x9eO\xa7Mc\xcb\x1f\
+\x9b\xe9\x7f\xc3\xcd\xea\x857^%'\x95\x83(_e\
+\x870\x12\xdf\xea\xb6\x8d\xaa\xc0V4E\x88\xf9qm\
+\x11\xb1\x8d?\x85b\xd9\xa2\xaf\x11\x05U\xaaWg\xc8\
+\xb0\xc1\xd2\xad\xc7\x99J\x04\xee\x1b=\xcc\x9f\xb6y&\
+\x9f]^h\x9fFF\x0d\xe2\xe3\x81\xbd\x88u\xcf\xc0\
+\xbb\xd8\xbcq+\xba\xd2\xa8\x5c\xa5\x22\x7f\xed\xd9\x8f\x86\
+m\x07)\xc4\xab#m\xa5i\xd5\xa65w\x0d\x1d\xc8\
+\xb1\xc77\xf0,w\x85\xf2OO\xc7\xd0<\x9b\x9e\x8c\
+\xe3Q0\x84\x04@\x22O\xd9\x06\x83\xb2\xcc\x82l\x15\
+\x95+_\x9e\xbe\xfd\xae\xa7o\xbf\xeb\xf9k\xff~z\
+\x9fs9\xf9\x07\xf2\x19p\xff]\x5c|\xc9\x05\xa0\xa0\
+K\x8f\x8e\xdcu\xfb\x9d\xfc\xf6\xf3\xaf\xf4\xbf\xf1f\x9e\
+y\xf9%rss\x90\x08\x22\xaeu?\x7f\xde|\x8e\
+:\xaa\xa64<\xa1\x91\x9f\x1a\xd9C\xe0D\xfa1N\
+Y\xcb\x96.\x95u\xeb\xd6)M3H\x9b\x16\xbd.\
+:\x97\xc1\xc3\x06Kn*\xe9[\xdb\xee\xfc_ej\
+\x90\xacm\x8d\xf4\x0c\x11a\xc8\x9dw\xb2t\xc1\x0at\
+=I\xcf\x8b\xce\xe5\x9e\xfb\x87\xb0l\xf1\x0a\xa6O\x99\
+&+\x16.U\x96R\xb4nw\xaa4o\xddTu\
+\xea\xda\x99\xfa\xf5\xeb\xc5\x94\xeb\x13\xa1,\x9a[\xc4\x0b\
+A\xb6\xa0\x05\x81\xa2\x9f\xa8\xe4\x04\xa7\x10q\xf0e\xa6\
+\xb9\xbdH\x84#\x8e8\x02\xcd\xd0I\x9b&\xb9\xb9\xe5\
+\x9cL\x8af-O\xe4\xb1g\x9e\x22\x91\xc8a\xc3\xfa\
+\x0d\x0c\xba\xfdv\x8a\x8a\x8a\xf1\xf6\xc5yu(vl\
+\xdf)\xfdo\xb9\x9d[n\xea\xa7\xdc\xde\xef\xd5#\x11\
+\x9c\x9c\x04\x11\xf8\xf3\xcf?\xe5\xce\xdb\x06pG\xbf\xdb\
+\xd4\xde]\xfbP\x0a\xce\xbb\xf4\x5c\x19>\xea>r\x92\
+Ie\xf7\xb8@Ws\xc8\xb9e\xcbf\x9f\x16\xbe\xe3\
+>\x02\xe7:\xa3\x1cf\x880l\xc8\x10\x16\xcf_\x0a\
+Z\x82\x1e\xe7\x9d\xcd\xd0\x91CQ\x9a\xceig\xb4\xe3\
+\xc2>\x17\xa9b\xd3\x02]\xf1\xd8?\x1e\xe5\xba\x1b\xaf\
+\xa3\xfe1\x01\xe6\x8bS\xaeg\x8b\xc4\xd3;\x04^\x06\
+o\xe2\xf2ez\x02\x03\x10\xc1\xddL\x22\xd1\x08\xe7!\
+\xc2\xf90\x9c\x049\x80\x88\x0a\xecA\xd20\xc5\xc2\xb2\
+,g\xdan\xc3\xb6<\xa9%\x8f=\xfb\x14\x89D\x92\
+\xb5k\xd62\xf8\x8e;()-\xf5\xd2\xdd\xbaj\x1c\
+Y\x83[\xfb\x0f\x94!\xf7\x0eu<u\xe28$\x02\
+\xcds\xf0\xb1DH\x9b&o\xbd\xf1&\x97\x9c\x7f\xb1\
+Z\xbet\x05\x15*T\x92\xea\xd5k\x22\x02\xa9d\xc2\
+1\xb0m\xe6\x89r\xb6s87H\xacY\xfd\xb5<\
+>~\xac\xe7yt\x0bweE\x5c{\xc3\x1bvl\
+\xe7\xcd\x88{\x872w\xd6BPI.\xe9s)\x0f\
+\x8c\x1d.v\xaas\x1aXD\xd2X\x14\x97\x16\xdb\xf8\
+;e\x89+P\x01\x99\x0a\x901@WW\xe0\xc5\xd3\
+\x8aa\xda\xfbp\xfewXl\x02\x02`\x85!\xe3\x98\
+\x1d\x9ex\x13\x9a\x94\x86\xcau\xe1TV8Q\xba\x83\
+\xb8\x7f\x9b\x89;\xce\xb6:\xb9\x15c\x9fx\x04\xdd\xd0\
+Y\xf3\xd5j\xee\x1dt\x07f\xa9\xe95\xd4a\xb8\xba\
+\xad\xffM\xaa\xe7\xd9==\x1c-G\xc8p4\x8d\xfb\
+\xf9\xe1\xfb\xf5r\xdd\x95W\xf3\xf4\x84\x89\x14\x97\xa49\
+\xb3\xdb\x99\xbc?m2\xb5\xeb\x1c\x8de\x09\xe9R\x07\
+\x07\x15p\xf9:\x1a+m\x9a\xfc\xf3\xa5\x97\xd4\xd2%\
++X\xb3\xfa+\x9bA\x12\x86\x0bJ\xa6\xb3F #\
+\x86\x0e\x93\xd93\xe7\x802\xb8\xf1\xf6~\x0c\x1ev\x17\
+\x22\xa2lw\xb6\x03\xaflf\xa7%\x1d \xb9@\xb0\
+\xa3D;\x95K\xdf SCR\x12\xa4\xbd;\x0e\x05\
+Y\x1b\x1e |\x01\xb0\xb4,L\x8b\xcf\x18\x0a\x12I\
+\x8b\x8e\x1b.\x92\x01IV\x9a\xc2\xc4^\xfd\x0avn\
+Wh\xdb\x9f~:\xa3\x1ey\x04M7X\xbe\xe4k\
+\x86\xdf{7\x96\xe5K\xba\x0f\x1f\xde\x8f,8^:\
+\x11\x8a\x8b\x8by\xea\xf1\xc7\xb9\xea\xf2\xab\xd4\x0f?\xfc\
+B\xcd\x9aG\xf1\xf4sO\xf3\xe0\xf8\x87\xa9V\xb5\x86\
+2\x12:\x16\x82)\x96\x83aX\xd5.\x98\xff\x85\xf4\
+\xbe\xec\x22Y\xb9b\x15JK\xd0\xff\xb6[x\xf1\x85\
+\x89\xe4\x1f\xcc\x8f\x19\xf6\x94-\x98 #\x86\x0ee\xd6\
+'s\x94\xa6%\xb9\xf1\xd6~\xdc\xd4\xafo\x08O\x97\
+\x97\x96e\x0bD\xb4\xbf(\xe5\xee\x97\xb4\xcb,\xc8/\
+\xa4\xa4$\x9d\xa1\xf23z\xb7\xd7\xbb\x82?\xa3|\x0c\
+\xf3'~- \xac\xb9\xc3\xf1q\x9fH\xba[X4\
+\x0d\x09:I@\x94\xf2\x08\x13\xc2\xc3\xe9a\x9d\xce\xec\
+\xc4\xf01\xe3Ph,\x9a\xb7\x90\x87G\x8d\x16\xfb0\
+_\x0082Gt\xcf\x01\xacX\xb6\x9c\x8bz\x9d\xcf\
+;oNF\xd7s\xb8\xf4\xf2\xdeL\xfdx*\xed\xda\
+\xb7\xc3c\x85\xb3\x18*\xae\x10\x8a\xab\xd8\xed\xd0\xa4i\
+sZ\xb5:E)\x0c\x94\xa6Q\xa9R5j\xd5:\
+\x8adN*\x82\xb1r\x05SF\x0f\x1b\xc1\xec\x19_\
+(\xddHq\xd9\xd5\xbd\xb9\xe9\xd6\xbed\xb6\xd0\xd3\x17\
+\x98\x08\xa6G(G\x00E\xf3h_\x98_@\x8f.\
+gH\xef\xcb\xce\xf3q\x8c\xd2\xd6\xa5'*s}\x22\
+\xa4\xd1\x22\x8a\x84,\xae\xe0\xb8\xa9\x9c\xdd32\xafG\
+\x88\x0b\x99\xcd\xcdLw7Y\xf8\xfes\x89\xc0\xd8\xaa\
+\xb0\xc7Y]).*b\xfc\xe81|:\xfdc\x95\
+\xccI1d\xd80D\xc4\x99;\xbb\x19l2\xef\xff\
+k?\x8f\x8f\x1f\xcf\xcc\xe9\x9f\xa1\xe9\x09\x8e=\xee8\
+\x1e\x18;\x9a&M\x8f\xcf\xc4Q\xb9\x88\xa8X\x9c\xab\
+U\xaf\xa1\xee\xbb\x7f\x04\x15\x8f\xa8\xc0\x07S?\xe0\x8d\
+\xb7\xdf\xa2r\x95\xaa\x99\xed\x11\x0bK\x84Q\xc3\x863\
+{\xe6l\xa5\xb4\x14\xbd.\xea\xc5]w\x0f\x8ce~\
+&\x9d2\xba\x80\x17c$\x12R\xe3\xc8\x9a\xaa\xf6Q\
+\xb5\xb2\x96\xe3\x95\x10SU\xb0\xd3{\xbc\x0b\xc0e\xf8\
+\x01\xb2\xcf\x193\xd1\x0d\x0aL\xb6<\xfe\x15-\xfe\x5c\
+>\xfc\x1d]\x85\x08\xe7\x17\xa0\xd7\x05\xe7r\xf0`>\
+/<\xf94\xd3&\x7f@n^\x1e\xb7\xddyg\xa0\
+!vi3\xa7\x7f\xc2\x93\x8fO\x90\xfd\x7f\x1dT9\
+\xb9\xe5\xe8w\xfb\xad\x5cum\x1f\xbcc\x08\x19\xc5;\
+\xfdPY\x91\x16\x861\xb8\xf2\x9a\xeb\xd0\x13\xc42\xdf\
+i\xa5\x8c\x1cz\x1f\xb3g\xccQz\x22\x87\xb3\xcf;\
+\x9ba#\x87\x95\xc9|\x1fmqj\x09\x1fxuC\
+\x22\x99TS>\xfc8cW\xd2\xa1<5\xc1\xf4\x0c\
+\xcd\x1f G\x16GP\xf6\xfe-\x81\xffnia\xd1\
+\x08\xeb\x08\x09\xd4\x18B\xc4\xee\xe0\xbe\xfa\x85L\xd5\x13\
+\xb0\xb8\xfb\x5cu\x19\xc5\x85E\xbc\xfe\xdc\xf3\xbc\xff\xda\
+\xdb\xd49\xba.\xad\xdb\x9eF\x95\xaa\x15\xd9\xb3g\x0f\
+\x0f\xde?\x96\xafW}\x8d\xa54\xd5\xa1sw\x86\x0c\
+\xbb\x93\x9a5\xed\x0b\xcd\x82\x12\xef]\x05\xe7\x96m\x99\
+N\x0d\xe16\xbb0\x22pD\xc5\x8a\xf4\xbb\xf5\xce\xb0\
+?B|\xc0\x91\xc3\xeeS_|\xfa\x05z\x22\x87\xae\
+=\xbb\xc8}c\xeeSaJ\xfa\x992l9\xb1\x02\
+~\x86\xa0\x8e\x0d\xe2\x1c\xa7!\xe3\x08\xe5#(\x99D\
+\x8cf\x06b]\xc1\x1efY\x0a\x8f\xcai4>\x1a\
+\x17-\xcf\xfema\x82X\x9e\xe4\x07\x11\xf3rK8\
+\xf7\xb57^\xc3\xbe={d\xfa{\x93\xd5\x13\xa3\x1f\
+\xc6L\x9bT\xaeVUJ\xd3\xa6*(,\xa6F\xcd\
+\xa3\x19<\xfcn:vj\xe7[\xea\xd1\xb6\x8b\xffm\
+y\xf6\x87?\x03\xb2\x19\xaf\x9c{\x032qq=\x80\
+N\xbc\x8c\x19\xf1\x00\xb3g\xceV\xba\x96C\xa7n\x9d\
+d\xf4\xc3\xa3\x91\x08\xa3\xcb\xd4\x04\x0aP\x82e\x9a\x0a\
+\xc3 \x1b\xdd]\x019\xb4[<*a~\x19n\x08\
+.\xdfG\xf6\x03\xb8\x16C4s\xb0\x80 \x06\xd9|\
+N\x87PP\x22X\x96oy\xbbc\xb9o,F\x8c\
+\x17\xf7\x03\xdc1d\x80\xaa\x5c\xb5\x1a\x09-I*\x99\
+C\xfe\xfe|U\x94_\xc4\xf9\x97_\xc4\xa4i\xefJ\
+\x87\x8em\xed\xd9B\xa0\xbcX\xc3\x08{\xec\x06g\x0f\
+\x81;\x03\x10\x9c\xd9F\x08\xdd\x0c\xdc\xc4\x12\x1e\x1c5\
+J}6m\xa6\xd2\xb5\x14\x1d\xba\x9d\xc9\x98\xf1c\x95\
+\xe5N\xf5\x02\x9f\x92\x92R\x89\xc6\x09\x81\x9e\xed\x08c\
+\x98f\xfeo\x11!??\xdf\x9f\xebg\x124B\xfb\
+8+.\xfe9\xa0\x01\xacH\xbf\x95H\x1f\x8e\xc8\xb1\
+'\x13\xd9\x84 \xf8\xe8\x00\xab\xcc\x06\xba\xdeA\xb7m\
+k\xd7\xac\xe1\xf3\x8f?!\x95\x9b\xc3\xb9\x17](\xd5\
+\xaaUS\x1b\x7f\xdf(\x1b\xd6\xafW?|\xb7\x9eo\
+\xbf\xfe\x86=\xbbv\xa2k\x09\xdb\x9d\x22BN\xf9$\
+\xb7\x0d\xbc\x8dd*\xa5\x82\xb3\x90X\xb4\x82Z\xc6\x9d\
+vIf/\x8d\xd2\xda\xbb,\xc2\xe9\x89\x8f\x8c\x1e#\
+3>\xfcD\xe9z.\xa7w\xee\xc4\xd8\xf1\xa3\xe2\xeb\
+\x05^x\xf6\x09\xd5\xf1\xccn\xd2\xfc\xc4\xd6~\x07\x16\
+\xd0\x94\x12\x05J7t\xd2\xe9RDr\x9c\xd9r\xe0\
+\x14\x94\x13\x1e\x1f?\x86K/\xbf\x8a\xa6\xcdZ\xc4\x0e\
+\xc3\x19\x0d\x0c\xc4\x07\xffG\x83'\x00n\x85\xb6/\xd9\
+\xf5\x84\xf9\x85\xb8\x9b2mb\xb9\x0b\x18\xe2\x11\xc7u\
+\xc0x|V`Z&\x1b~\xf8\x9e\xc6\x8d\x9b\xe1J\
+\xba\xeb\xe0\xf2\xe6\xbc\x01\xb4\xfe\xd8\xb8\x91\xfe7\xf6C\
+L{\x90\x98\xf2\xf6$\x956\xd3h\xe8J\xe9\xf6N\
+f]\xd38\xaav\x1dv\xfd\xb9\xdd\xc1\xdb\xa2\xa0\xa0\
+\x80\xe1C\x06\xf3\xf0\x93Oc\xe8\xc6\xe1\xad\x1e\x0a\xf6\
+\x124x]2[\xff\xb2]\xcd\xe2\x11i\xcc\xfd\x0f\
+\xc8g\xd3g*C\xcf\xa5m\x87v\x8c{|\xb4s\
+\xaa8&\x0f\xb0y\xd36\xee\xbe\xe3N\xf5\xd2[o\
+K\xddz\xf53\xb03M\xd3\xb7/DB*\x1a\x81\
+\x82\x82\x02Y8w\xb1\xb2L\x8dQ\xe3\x9a\x07f/\
+\xfe=\x86\x1eO\x828\x04\x06\xb8\xf0\xe5u~\x08h\
+\x00\xcd\x01\xf7\x1b\xebIZ\xc0-\x95)g\xfe\xf8\xe4\
+\x81;\xdf\xaf\xfd\xf3y&<\xf6 c\x1fz\x82\x8b\
+.\xb9\x22\x94\xae\xd0\xec\x1f\xaey\xab\xe0\xdbo\xbeA\
+\xd00\x0c\xfbnC\x11\x8b\xa3\xea\x1c%M\x9a7W\
+\x0d\x1a\x1e\xcf\x09\x8dO\xa0q\xb3FT(\x97'\x1f\
+N\xfeH\xfd\xb2\xe1'\x1a\x9cP\x9f\xb7_z\x95U\
+KW\xf2\xc0\xddC\x18\xfb\xd8\xe3\xe8Y\x84 \xce\x99\
+\xa6\x94\xa0\x0c\x15\xf2a\x84\xf2*\xfc1]\x84\x87G\
+\x8f\x91\xcf\xa6\x7f\xaat#\x876g\xb4\xe3\x91\xa7\x1e\
+\x15Me\xd6\xe6\xfa7L\xd3\xe4\x87\xef~\x90\xc2\x83\
+iu\xfdeW\xa9\x16'\xb5&\xb7\x5c\x92ko\xba\
+^\xbc\xabL\x84\x80\x16\x0c\xa8o\x81\x1f\x7f\xfc\x81q\
+#G\xab\xa2\x22\x93Y\x9f}A\x85\x8a\x8f\xd0\xef\xd6\
+\xfe\x94\xafP\xc1\xe7U\x0cO\xc2\xdc\xf25@t\xa0\
+1\x02\x10\x19\xc5x\xc7\x92\xdd\x9b\x9c=\xebG\x02\xe9\
+\x81,*\x90G\xa0\xf5)mh\xd2\xf4dZ\xb4<\
+\xc9\xb5\x9d<0_\xa5\xfa\xcb\xb8\xc7\x9f\xd0\x10\xcbR\
+\x88nG\xd4\xaa]\x8b7\xa6\xbe\xab\x12\x86\x11\xc2L\
+\x10u\xc1e\xe7{h6i\xd1\x82;n\xec\xc7\x92\
+E\x8b\x196\xe8.\x1e|b\x02\x09#\x11\x16wG\
+\xf0,3\xcdwk\xd7\xc9O\xdf\xff\xa0\xb6\xfc\xf6;\
+\xbah\xfc\xfe\xe3\xaf,\x98;_\x9a\xb7l\xa1*W\
+\xaeb\xaf\xcf{\xed\xf1+~\xf2\xd1\xc7\x98\xf1\xe1\x0c\
+\xa5\xe99\x9c\xd6\xe1t\x1ez\xe2A\x94R\xc1\xbb\x9b\
+\xbdL\x02\xec\xda\xb9\x93\xc7F\x8f\xe3\xaf\xdd\x07\x94\xa1\
+\xa50Ma\xd5\xf2\x95\x5c|\xe5\xc5\x9cp\x94A\xc6\
+\xd7\x00\x00 \x00IDATBc\xf5\xd5\xca\xafl\
+\xd5\x9aq\x19\x91\x8d\xeco\xbf\xfe\xc2\xdd\x03\x07\xb0g\
+\xd7~4\x95Di\x1a\x1f\xfd\xeb#,\xcb\xe2\xee{\
+\xef\xc3\xbf\x0b'\xc2\xd6\xd04'\x12\x17\x12\xb2\xe8,\
+ \xa0\xf2}\xaa\x05*p\xd3C\xee\xbeh~?\xae\
+e\xcbS\x98\xfc\xd1\xc7 \x19W&\xa0\x94\xe6,\xaa\
+\x05\xe4V),Q\xe4\x96\xcb\x93\xb6\xed\xdb\xa8ko\
+\xea\x8bn\x18\xa1S=qC{\xc3F\x0dy\xe2\xf9\
+\xe7\x18t\xcbm,_\xba\x9c\xe1w\x0d\xe2\xa1\xa7\x9e\
+D\xd7\xfd\xe6\xfd\xf6\xcbO\xbc\xf3\xca\x1b|9w\x01\
+\xc5\x05\xc5JW\x1aJ\xd30\xd0\xf9\xf9\xdb\x0d\x8c\x1a\
+x\xafJ\x9b\x16MOlF\xaf\xde\x17\xd1\xe3\xec\xb3\
+\xbd\x0d#\x0ax\xee\xe9\x89L}w*\xba\x9e\xe2\x94\
+\xd3Na\xdc\xe3\xe3\xd0t\xdd\xe3\x99\xcf|\x1b\xa7\xad\
+[63\xa0\xdf\xcd\xec\xdc\xba\x9b\xa4\x96\x0bJ\xa14\
+\xa1q\xf3\xe6\xdc9x\x88\x88\x88\xd24{7\x80\xcd\
++-@o\xbb\x9cc\x1a\x1c\xc7\xd4\xe9\x9f2e\xd2\
+\x14\xfe\xf1\xf4\xb3T\xafQ\x93g^\x9c(\xb5k\x1f\
+\xad\xca\x1c\xb3P\xf1i\xc1\xa9\x8c\x13\xb2/\x069\x05\
+\x05G\x8eL\xe3\xc3\xcdQ\xc6\xa0\x1b\xc4S\x02\x1f\xe7\
+\xb7r\x86\x1e\x01>\x982M\x94\xae\xd3\xf7\xd6\x1b\xd4\
+\x88\x07GS\xa7^\xfd\xb0,\xba\xdf\x81\x8f[l\xb3\
+\xe6M\x98\xf0\xc2?$\x95\xcac\xc5\xb2\xe5\x8c\x182\
+\x04\xcb\xb2(.*b\xe2#\x8fK\xdf\x8b\xaef\xfe\
+\xcc\xf9\xa4\x8b!\xa1\xa7\xec\xe3\xe0h(\xec\xfd}\x09\
+=An2\xc5\xcf\xeb7\xf0\xc4\xfd\xe3\xe8{io\
+\xf9\xee\xdbo\x00x\xe5\xf9\x97\x99\xfc\xda\xfb$\x8c\x14\
+-N:\x91\x07\x1f\x7f\x18]7\x22\x86\xa2\xdfQ\x14\
+P\xbb\xf6\xd1L\x9e\xfe1\xcf\xbf\xf1\x8a\x5cv\xdd\x15\
+\x8e0\x0aU\xabW\xb2\x17\x85\x00\xa5i\xf6\xb63\xcb\
+\xde\x19\x15\x22\x1a\xb6\x1e1\x0c\x83>W\xf5\xa1i\x8b\
+&\x5c{\xe3\x95R\xbbvm\x7f\xcc\x8c\xf0\x22s0\
+P1i\xe1\x10c\x03\x04\x1b\xe4f\xce\x1cK\xa2\x8d\
+\x8eZ\x99A\x83#\xa0\xd5\xbc\x08\xefN|'[q\
+q\xb1|6\xe33\x95H$9\xeb\x9c\x9e>q\xb3\
+\x19\xb8\x91\x969B\xa0\x1e\x9b\xf8\x0cw\xf7\xef\xcf\xb2\
+\x85Kyd\xe4(\xd9\xf4\xeb&~\xf9\xfe\x17\x954\
+\xec\x8d%i\xb3\x84\xd2d.95\xeac\x94\xcbC\
+S`\xe5\x1f\xa0t\xf7\x9fP\xf0\x17\x86\x91DS:\
+\xdb~\xdb\xa2\x06^\xd7\x8f\xd3\xbb\x9e\xc9\xc2\xd9\x0bI\
+\x18I\xea\x1e[\x9f\xf1\x13\x1f%\x99\xf2\xd7\x02\xdc\x9e\
+\x1f2\xbf\x1cM\xa9i:M\x9a7SM\x9a5#\
+\x99J\xc8\x9b/\xbd\xae\x16/\xfc\x92}\xfb\xf6P\xa9\
+R\x15tMG\xb9\x9eP\xa5yl\x0f6\xcc-\xf7\
+\xc6[n\x92\x96'\x9d\xa42\x99\x1c\xed\xb01\xc4)\
+\x83|\x81\xb5\x00+\xb6(_\xd6\x5c+3(}\xa1\
+\x9b|2\xdcA\xa1\xfc!F*,\xd3\xb2\x87\x00\xe7\
+\xc4\xc8\x8ci\xd3UI\xb1E\x873\xdbS\xae\x5c\xf9\
+p\x01\x87\x19D\xa0\xc5I\xcdy\xe8\xc9'\x19:`\
+ \xf3>\x9d\xab\x14\x1ah\x06i\xb3\x14\xaa\xd7\xa5\xd1\
+\x85\xb7P\xaf\xcdi\x94+\x9f\xebY\xee\xa6X\x14\x16\
+\x16\xb1\xf5\xbb\xf5l\xfc\xf4=\x0a\xd6.\xb4g\x13\x96\
+\xc9\x92\xd9\x0bIh\x06\xb5\xeb\xd7e\xe2\xab\xcfJn\
+n^\xa6\xc1\x87\xed\xcf\x88v\x95 \xeeW\x5cw\xb5\
+\xfa\xe4\xa3\x8f\xd9\xb9k\x07\x1fM\xf9\x17\xd7\xdet3\
+\xca\xbb)G2\x5c\xbd\xd1p\xd2)\xa7\x04g\x90\xd9\
+(\x00\x04\xfb\x8c?\x01\x0c\xe6\x0b\xe6\xcfr0$\xf3\
+*\xf2p\xc6\xa8F\x88\xc2\xa9\xc8oB\xf4\xb0\x7f\xdb\
+\x8d\xd6\x1d&|:\xe3s\x94\xd2\xe8qN\x8f\xd0H\
+\xe1~\xbeY\xfd\x15\xd3>\x9czHy\x10\x81\xd6m\
+N\xe2\xa4\x93[\xa3\xb4\x04\xa2\x19\x94\x88I\x9d^7\
+q\xfeS\x93i\xd5\xb3;GT(\x0f\x96\x86i\x82\
+\x99\x06L\x8d\xdcT\x1e\x0dO9\x99N\x0f<N\x93\
+\xa1/b\x95\xaf\x04J\xb3\x9d5br\xfd\x1d7\x90\
+W\xae\x9c\x0a\xe2\xe4\x0f\xb5\xe1\x1d\x83\xc1!\xd8\xfd6\
+\x0c\x83\xab\xae\xbf\x1aei\xcc\x9c>\x03\x11\xb15\x89\
+\x98\xde\xbe\xc7xg[\xa4}\xde\xd3\xe1\xc0\xf8\x9d8\
+\x98\xafl\x01\x10\xef_\xd6b3\xfbxY\xb06S\
+\xc2\x16\x86`Z\xa63\x1bPl\xda\xb8\x89\x1f\xd6\xfd\
+L\xe5*\x958\xbdC{\x89\x96\xa2\x14\xdcw\xef`\
+F\x0e\xbf\x97\x1f7\xfc\xe0\x11\xd8]F\x0a>\x03,\
+^\xf0%\xcb\x97\xad\xc2R\x06\xa5\x96I\xcb[F\xd0\
+\xee\xba~$S\x06%\xc5BIZ(\xb1 mB\
+\xda\xb2?\xa6e\x9f\xd57,E\xc3\xd6\xadi;\xe6\
+M\xa4j\x0d\xbb|\x11\x9e\x9f\xf0\x14\x96\x15~\x15O\
+YK\xe4A\xfc]\x1c\xcf9\xff|\xaa\xd5\xa8\xc6\xf6\
+?\xb7\xb3x\xe1\x22~\xfe\xe1Gt]\xc7P\x09\xf2\
+\x0f\x1e\xf0\xa6\x82\xd9=~\xd9i\xfc\xef\x86\xb2\x0f\x87\
+F?^\x9ad\x87\x89|\xbc\xf5\xeaH\x92e:\xe7\
+\xa25\xf8\xec\x93O\xd14E\x873;\x08\xce\xb4*\
+HD\x11\x18t\xcf}\xf4\x1f8\x88\xe3\x1b6\x0c\x1d\
+\xf0\xf4Ps\xe2,\xcb\xe2\xf9\xa7\x9fE\xd3\x93\x88\x82\
+c\xce\xe9C\x93n\xbd0M!\x9d\x16J\x1df{\
+\xccr\x8fh\x07\x8e\xaa\x8b%\x1cY\xbb&\xa7\x0e}\
+\x8e\x12\xcd\x1e\x9b\xb7o\xfa\x93i\xef\xff+\xecZ\xce\
+B\xd4\x0cR9\x1f\xa5i\x5ct\xf9%\x18\x92`\xd4\
+\x9d\xf7\xf2\xd8\xfdc0\xc4 \xa9R\xf49\xebB\x9e\
+}l\x02\x85\x85\x85!\xb7\xf3\x7f\xed\x13\xe5]\x9c\x00\
+\xc4\xbe\xedC\xdc\xfdk\xca\x9b\xb3{\xdfQ\xd8\x8c\xef\
+pC\x5cg\x8a\x00JL\xfb\xac \xf0\xf9\x8cO\xc5\
+\x12\x8bngu\xcb\x1c;\x1c|;w\xe9\xce\xf57\
+\xddf\xa3\x1c\xa5~\xe0y\xf9\xe2\xa5l\xde\xb4\x0dM\
+\xd3\xb0r*p\xd2U\xfd()\x16\xaf\xb7\xdb\xe7\xf1\
+\x95\xcdx\xd3>\x9c*\xce\x01U\xfb\x88\xba- f\
+Z\xa8Y\xb7\x1e\xf5/\xbc\x19K\x04\x0d\x9d\x0f&M\
+\xf6\xa7\xd7\x12\xd4\x83\x8a\xc0fG\xdc\x9dE*\xb2S\
+j\xc3\xfa\xf5\xbc\xf3\xe2kb\x88\x86\xa6%\xd0\xb5\x04\
+:\x0a])\xa4T\x98\xfe\xee\xbf\xe8\xdf\xf7F)*\
+*\xf4\xe8\xe8\xf3%\xf2\x91\xe0o\x1f\xc6\x83\x97\x08/\
+%8\xac\xfbxe\x0c\x01\xee\x99z\x1bR\xd9\x1b$\
+\x03K`\xee\xa6Eq\x1a\xed\xedB\x09\xf6X\xdc\xbd\
+y\x81r\x1d\xa0\xd2\x92R\xbe]\xbd\x9atI\x11\xba\
+R\xac\x5c\xbc\x98=\xdbv\xab#\xabU\xa5I\xb3\xc6\
+a\xeb?[\xf0\xfc\x1f\x99@\x8b\xe6-Dw\xe6\xe7\
+\xc7t;\x171sl\x86\x06\x99/6\xb3\xad\x80`\
+Z\xa6`\x9a\xf6\xc2\x90i:\xf7\x15\xa4\xa1\xf1\xf9\xbd\
+)\xd1\x92\xa0\x14\xdb~\xdf\xcc\x96?6\x07\xda\xe4\x0a\
+\xb9o\x03\x04\xf7\x22zq@qq1c\x86\x0c\xa3\
+\xb8\xb0T\xa1\x19\x88)\xa8\xca\xb5\xd0j\x9d\x00)\xfb\
+\x9c\xa0\xae\x0c\xfe\xf8q\xa3zl\xf4XO\xf0\xc5;\
+\xe8\xea1(T\xbf\xc7\x13\xdc\xe1\xc3\x81W>\xf3A\
+\x22\xcc\xf7\x0b\x09\xad\x05\xf8k\xd2\x0e``=VB\
+\x9c\x91\x08.\xcas\x99\x06\xa3<\x9c\xc5\xbe2\xee\xf5\
+\xe7_\x96\x8f\xa7LQ\x85\x07\x0a\xd0\xf5\x04\x86J0\
+\xff\xd3y$4\x8dS\xdb\x9dl[\xe5\x12\xc11\xce\
+\xfb\xe3V\x1ezo\x9b\x1d~X\xb7N\x94\xa0J\xd3\
+\x85\xd4>\xb9\xb3\xcdH\x97H.S\x04\x7f'\xb1\xb7\
+\x9e\xa1P\xee\x999M\x81\x05J\x83T*\x8f*'\
+\x9eF\xfe\x9a\x85\xe8\x9a\xc1\xaaeK\xa5\xd7%\x97*\
+\xcfS\x18\x17\xa28\x8b\xf0\xe1\xa4\xf7\xd9\xb5}/J\
+OR\xaai\xb4\x1c2\x91j\x0d[\x22\xc0\xc1\xfcb\
+~\xfd\xf8-v\xcd~\x03]\xd3\x98\xff\xf9\x17\xf4\xee\
+\xfb\x13\xc7\x9fp\xbc\xd3\x0fm^x\xae\xe2\x80_\xd5\
+[Cp\x19\x1dr\x0cFf&\x0e\x1f\xadXO`\
+tKuH\xd4\x22\x94\xcf\x00\xcbdDPHL\xd3\
+\xe4\xde\xfew\xb0v\xc57JS\x1a\x86}\x1d\x91}\
+s\xa7\xb2\xf9\xb8x\xf6<\xce:\xbf'M[\xb4\xc4\
+\xdbf\x9dQw$.\xa3W\x08\xdb\xb6n\xb3\x97a\
+D\xa7R\xed\xfa\xdeqq\xcb\xe9\xae\xee\x86Q\xfb\x1d\
+\x01\x8e'V\xfc\xc5\x14\xcf\x9a\xd4\x15\xca\xd1\x04\xd5\x1a\
+5\xe5\xe07\x0b\x00\x9d\xd7\x9fyEM\x9b\xf2\x01\x96\
+\x05i\xd3\xc4\xb2\xd2\x98\xa5ig\xd8(\xb5\xe3L\xd3\
+&\xbc3\xd5E\x84\xe2\xc2R4=I\xda*\xa5y\
+\xbfA\xd4o\xd5\xd6\xc6X\xe0\x88r9T\xbf\xb1?\
+\x0bw\xfd\xce\x81\xb5\x8b\xd0$\xc1\xa2\xb9_p|C\
+g\x1b\x9b\xc4\xf0%\x8e\x07q\xbc\x0a>\x87\xa5\x03\xc8\
+\xba!\xa4\xac\x90\xc9\x19\x97\xc9\xba\xaeg\xce\x0f\x04\xde\
+x\xe9e\xf9v\xe5Z\xa5\x1b),\xcbD\xaby<\
+\x89*5\x90\x03\xfb)\xd9\xfc\x1d\x06BqA\x11#\
+\xef\xba\x9b\xd7\xa7}h/t\x88\xbd%\xbb\xb8\xa8\x90\
+\x92\x12\xfbHvaa!\xa5%i\x0e\x1e\xd8'\x07\
+\xf7\xefW\xc5\xc5\xc5\x94\x16\x97b\x92\x06\xd1(<\x98\
+/\xa5\x85%J\xe9\x06\xba\x9e@O\xe6`\x958N\
+\x1a\xcbW\xd7\xaeJ\x15\x00K\xec\xbb\x00\xc5^3\xf3\
+\xbc!&\x8e\x16S\xe4\xd5\xa8f\xb7Gi\x14\xe4\x17\
+q\xe0\xa7->=\x03\x1e\x00w\x11-H\x03\xe5\x9c\
+\xe9\xd3\xb4\x04\x0aH\xa7\xf39\xbaMW,G\xd0,\
+\xc0R\xf6X\x5c\xa7cO\xd6\xad\x99\x8f\xa64~\xfb\
+\xf97\x02\x8b/\x11ff\xe7E8-\x1a\x9f9\xbe\
+\x86<\x81\xc1U$\xd7\xed\x13\x7fY+\x91g\xe1\x99\
+\x09\x13h\xd4\xb8\x09=\xce9\xc7\xaf^\xa0\xa0 \x9f\
+)oOR*\x91\xc4\xb2\x84\x06}\x06p|\xb7\xcb\
+\xd0\x12\x06\xa5\xa6\xc9\xf6\x1f\xbe\xe7\xfb\xa7\xefB\x15\x1e\
+\xa0\xf0\xafb\xae;\xef2,eQTXHQA\
+\x11\x02\xf6\xf4\xcb\x19\xef\x95\xd2\xd0\x94R\xb6\x13\xc5\xde\
+\xb9\xa3)\xdb\x16\xd1\x94\xa64\xcdp\xd4e\xda\xb1\xec\
+\xfd\xbd\x06\xae@\xba\xea?x\x98\x22\xa4,\x95#\x08\
+\xae\xe9c\x95\x22\x9a\x86\x88\xe2\xd8\xc6\x0d\xe9\xd8\xbd3\
+\x88\x85\xa6\xe9Dw\x13*l\xb7\xaea$0\x0c\x83\
+D\x22\x81\xd2`\xe2COPR\x5c\x82`\xa2\x95\x14\
+\xe1n\xfc\xf5\xec\x10@\xd3\x0co)\xc0\xdf\x06\x96\x9d\
+\xe6a\xbeD\xbf\xa3\xf0\xf1!\xb2!\xc4\xcd\xec\xaf\x01\
+\x84\xc6\xf9\xd8\x01\x1a\xa6\xbe\xf7/\x996y\xba\x9aS\
+a\x0e\xd5\x8f\xac\xc1I'\x9f\xe2\x11}\xe5\xd2\xe5\x94\
+\xa6-\x0c]\xa7\x5c\xa3f\xb4\xb8\xf4*\xcc\x22\xbb\x83\
+%u\x8d\xba'\xb6\xa0\xe4\xba\xa1\xfc\xf4\xecPt\xdd\
+ \xff\xaf|LI\x03\x0a]\xb3]\xaeJ\xf3\xf7\x16\
+\xba\xa7jt\xcd\xbe\xe0\x09@\xd3\xc4a\xa2\xd3\x1b\x95\
+`\x95\x16P\xb4o\x17\xc9\xbcj\x9e\x81\xe3k\x80\xf0\
+\xf8\x8f\xb3=\xdd6e\x94sK\xa83\xee*(\xdc\
+\xb1\x0dQ\x1a\x96%\x9c\xd1\xedt.\xbb\xaaw,\xb9\
+\xc3q\xbe{X\x013?\x9a\xc6w\xab\xd7\x914\xf2\
+\xf8u\xde\xfb4:\xf7.J\xd3\xd8\xc3\x90\xd8K\xd2\
+;\xd6\xccE\xe9\x09\xc4Jsl\xa3\xe3\x9d\xf1=j\
+\x0c\xa9\xc8o\xc8\x14\x94`\x88\xc10\xb0\xe1 \xa2\x01\
+\x82&`\xc6\x1e\xa0@!~zaA\x01\xf3\xbfX\
+\xa8t=\x97\x82\xfc\x22V.[&'\x9d\xec\xbb-\
+wn\xdf\xee\xb8\x5c-\xaa59\x85t\x91#\xf5\x8e\
+\xd6\xd55\xa8\xd1\xf4$~P\xa0)\x8d\xfa\x0d\x8f\xe3\
+\xee1\xf7;\x8c\x0dK\xb2\xbb\xe2\xa0\x94B\xd3u\x0c\
+]'\x91L\xa0'\x12$\x0c\x1dM\xd3\x19\xd8\xf7f\
+6\xfd\xfe\x07\x86a\xb0\xf3\x87\xd5\x1c\xdd\xba\x9b\x7f\xd1\
+\xb6DG@\xb7I\x12J\x0f\x8e\xa7zR\xd8\xb5~\
+5\xee=\x7f\xf5\x1a4\x88N\xa5c\x9f\xa3\xeb\xf4g\
+\xf6\xe8*\xebV}\xab\x94\xa6\xf1\xdd\xbboQ\xb5a\
+\x0b\x8el\xd1\x85\x92\x12E\xda,\xe5\xf7\xd9\xef\xb2}\
+\xfeg(]\xc3B\xe8\xd2\xfd\xac\x80\x81\x17\xa4{p\
+\xbb\xa7\xbfU?\xbc\x1a\x93M\xf5\xbb\xf9cl\x00\x0b\
+\x0boWO\xa4\x01q\xc1M\xcf\xcd\xcd\xe3\xe9\x97\x9e\
+f\xc0M\x03hrb3\xe9\xd7\xbf\x9f\x0a\xda,\xc9\
+d\x0aw\xf7P\xe1\xce?\xd04\x904\xbe!+@\
+I>\xee\xcd\xff5\x8e\xaa\xce1\xc7\xd5\xcf\x94\xe9l\
+\xc3`\xa0\x89\x0ah\xdd\xae-\x1b\x7f\xdb\x84\xd2\x0c~\
+\x9d\xff1\xc7\xb4\xebFI\xb1?Rg\x1bRCk\
+\x1c\xe2\xda\x04P\xbc\x7f\x07\xbb\xbf\xfb\x96\xa4n`\x8a\
+I\xe3\xa6M\xc5r\xdf\xcc@\xe6\xdd\x05\xb1(\x0at\
+\xef\xd5KMy\xfb]\xfe\xdc\xb4\x83\x04\x09\x96<p\
+\x0f\xb9\xd5k\xa3\x1dQ\x95\x82\xad\x1b\xa0\xc4Ds\xde\
+c\xd4\xf3\x82s\xa9U\xbb\xb6c\xa3\x04\x8c|\xa2\xc2\
+\x16fw\xd9\x1c\xc3\x9b\x99\x05\xe1b6\x85\x965\xb7\
+\x89\x8fSJq\xf7\x88\xc1\x5c\xdd\xf7*eE\xb0h\
+\xd2\xa2\x99m\x0d\xa3\xd8\xbah\x16\xc5\xf9[\xd0\x01]\
+\xec7V%r\xe0\xc7\x0f^@7r\x11\xb1\xa8\xd3\
+\xa0n`~\xeb\xdf\x9f\xe7z\xea\xdcq<\xc3\xf5\xea\
+|w=\xb7\x87\x98f\x1aD\xb1\xef\xdb\xc5\xec\xfey\
+\x8dwC\x99MH\x15\xa2\x80\x9d\xd5\xfd\x1f\x98\xc3\x0b\
+\xe8I\xc5\xb7o?CBO\x82\x08-N9\x91#\
+*UR\xde\xc0\x18 h\x86f\x11\x5c\x1bC~\xff\
+\xed\x17\xde}\xfdu\x8a\x8b\xd3\xde\x06XMOP\xb2\
+{\x07\xc5\xbf\xafG+\xb6\x9c)\xb0E\xc3\xa6\x0d\xb9\
+\xe3\xee!\x11\x1c\x83\xbb\x85\xa2\x9fl<\x8ay\x16E\
+TJ\xb4\xf0cP\xe5\xc6U\x94M\x08\x14u\xea\x1e\
+C^9\xff\x16O\xf7\xd3\xa0aC\x1a7;\x01M\
+\x14)\x14\xf3\xef\xb9\x89\x1d\xdf/\xa2\xc4*`\xef\xb6\
+_X\xfc\xe4pv|9\x0f%\x82\xd2\x84\xb3\xce;\
+/\x86\xa0\xca\xd9\xaa\xed\x8c\xf2\xca\xefyQ\x06\x1cs\
+\xec\xb1\xaaM\x87v\xa2)E\x22\x91`\xe9\xc41\x18\
+\xfaA\xf4\x80\x10\x84wp\xb9\xf6\x803\x1dt\xa4I\
+\x14l\xfff.;\x97/@\x13\x0b\xcb,\xe1\xf2k\
+\xafr\xa6\x8e6\x0e\xd1\xba\xbd\x8f\x08\xeb\xd6~\xc3\xd3\
+\x8f=\xc6e\xbd\xceUW^|9\xaf\xbe\xf0\x1a;\
+w\xed\xa7\xd1\x89-\xa4M\xe7\x0eh\xbaBs\xce\x00\
+j\x0a\x129Iz\xdfp5O\xbc\xf0<\x86\x91\xf0\
+|\x5c\x1b\xbe\xffV\xae\xbf\xf2\x22\x16/\xfc\xdc\x1f\x97\
+b\xe8\x1f\xb6\x11\xe2\x04!\xca[;\x1c\xc6\xb9\x80\xb8\
+\xb4\x98X\xc7\x80\x8a;\xeb7\xe8\x81\x11\xdcu\xdd\x0d\
+\x94\x16\x95\x22{\xf7\xb0\xea\xc1A\x88\xd8W\xc3h\x9a\
+a_\xdb\x8ep\xe1U\x97S\xeb\xa8\xda!E\x14w\
+E\x8c\x04\xe3#\xf5\x09p\xc7\xbdw\xab[\xae\xbc\x9a\
+\xe2\x82B\xac=\x7f\xf0\xf9\xf0[\xe96\xee\x05L\xab\
+\x9co\xfc\xb9\x8c\x0eL\x11,e\xfb&0\x14\xfb~\
+\xfa\x92o\x9e\x1dCB\x81\x12\x8bv\x9d\xdasj\xdb\
+\xd3|\xc3\xd1\xb3K\xec\xb6\xa7KK\xf9j\xc52\x16\
+/\x5c\xc8\xa2\xf9\x0b\xd9\xb5s7\x9a\x96D\xd7\x93t\
+\xea\xd2S\xce\xec\xde\x956\xedOU\xe5\xcb\xe5*\x01\
+v\xef\xdc\xc5\x07\xefN\xe2\xa3\xb7\xa7\x90\xccM\xf2\xee\
+\xa7\x1f\x91\x9b\x9b\x971\xee}\xb7n\xbd\xfa\xfe\xbb_\
+\x99?w\x9e:\xbd\xe3YY\xe8\xef[\x01*\xf0\xdb\
+SQ\xd9&rD\xf7\x04F\x8d\xa0\x8c*\x0e'\x04\
+V\xc6\x9d\x0cu\xea\xd7\xe3\xe1\xe7\x9f\x93\x07\xef\xbdW\
+\xed\xdd\xbe\x07\xf7\xae\x1d\xc1V{\x02XJX\xb5|\
+\x19}\xae\xefKN^\x1eJ@\xd34\x5c\x0fX\xb4\
+\xfe\xa0v\x08\x1am(\xa8^\xa3\x06]{\xf6`\xc6\
+\xd4\x8fP(\x8a\xff\xf8\x9e\x99\x03\xfbp\xea\x9d\xa3\xa8\
+X\xbf\x15V\xb1\xadM\xecC9\xae\xdb\xd6\xf6\x97\xeb\
+Z!?N}\x8e??\x9d\xe6,U\xdb^\xf6&\
+\xcd\x9b2\xef\xf3\xcf9\xa2bENj\xd3\x16\x94P\
+R\x5c\xcc\xca\xa5KY0g\x0e\x8b\xbf\xfc\x92\x83\x07\
+\xf2QJG\xd3R\x9c\xdc\xae3\x1d;w\xa6K\xf7\
+\x8e\x1cqDy\x15\x1d\xaf\xabV\xabF\xb3V-\x99\
+\xf2\xd6$\x12J\xc8\xcd\xcb\xb3\xdb\x19\x96/z]p\
+\x09\xba\xa1\xd1\xe9\xccna\x7fP\x88\xe4\x12\x22\x01!\
+\x83\xd0\xa1P\xd0\xf6\x09\x94S\xc6\x151aQ9<\
+\xe6g\x09\x02\xc77:A\xbd\xf0\xfe$f~4U\
+V\xcc_\xa2\xd6\xafY\x0b(\x8ek\xda\x88\x9e\x97\x5c\
+\xc0+\x13&\xf2\xfb\xcf\xbf2n\xf80\xc6Nx\x12\
+\xa54,w\xdb6\xf1\x877\xdd\x10\xda\x8c!0c\
+\xdaG|\xf4\xfe\x14\x12F\x02\x11\x13]\xe9\xb0w\x1b\
+K\x87\xdfH\x85\xe6m\xa8uZO*\x1d\xdb\x92T\
+\xe5*\xa0\x12\x94\x16\x1d\xe0\xc0\x1f\xbf\xb0w\xfd\x97l\
+\x9d;\x1dUd\xa2\xd0A\xd9w\x8ejh\xbc\xf9\xcc\
+\xcbX\x92\xc6\x12\x93S;v m\xa6e\xcd\xaa\x95\
+\xaa\xb8$\x0d\x18\x18\xa9\x5c\xce\xe8\xdc\x83\xf6\x1d;\xd2\
+\xbe\xd3\xe9T:\xa2\x9co\xa4e\xe5\x9c\x86)Pj\
+\xa5cFs;&\x91Hp\xfe\x85\x97\x1f\x92\xbee\
+Ey\xd7\xed\xc5\xc0\xc5\x9c\x0d\x8c\xdba\x1eF,\x0a\
+\x93\x01\x1f0\xd6P\xbe(\xe5\xe4\xe4pa\xef+\xd5\
+E}\xae\xa2\xcfY\xbd\xd8\xb7{\x0f\x17]{\xb5\x9c\
+\xd6\xa1\xbd:\xea\xe8\xa3\x19\xde\xff\x0e\xbe^\xba\x9c\xf1\
+\xa3F2\xcc]\x10\xf1\xa6\x0a\xd9\xf1\xb0\x1biCM\
+\x9b2\x99\xe7\x9ex\x02#\x91\xa4Q\x8b&\x5c|\xc5\
+\x15<=\xfaa\x0a\x0f\xe4\x930\x12\x14\xae_\xcd/\
+\xeb\xbe&m\xa5\x11e\xd8\x82f\x96\xa0\xeb\x86\xed\xad\
+s\x86\x06K\x99\xd4:\xfaH\x1ex\xf4a\x19\xd4\xf7\
+VURX\x82\xae4t`\xd5\x97+0\xc5R\xb9\
+\x15*\xd2\xb6c;i\xd7\xb1\x93\xea\xd0\xb9\xad\xa4R\
+I\xe5\xe1R\xc6\x9a\xbe7Rk\x9a\x98\x88*I\x97\
+\xe2\x1a\xcf\xae\xc5\x1f\xa4\xa7\xffV\xb4\xbf\xd7\x0d\xe3x\
+\x15\x0d\x91-a\xae\x02)\x0b\xf9L\x98(\xbc\x00\xe9\
+\xd2bQJS\x9an\xf8\x96\xb7\xa7\x97\x84\xb4(,\
+1)-I+\x85\xa2I\x8b\xe6\x0c\x1e=\x92\x87\x87\
+\x0dg\xc1\xac\xcf9\xb2VM\xfa\xder\xbbm\x9c\xc5\
+\x0c{A<\xdcY\xc0\x94w\xdf\xe5\xc5\xa7\x9f\xc2H\
+\xa4h\xde\xaa%\x0f>9\x01\xc3H\xd0\xf0\xbd&\xbc\
+\xf8\xd4\x04\x96\xcc\x9e\x87\x8e\xed\x99K(\xddA\xc6\x04\
+\xc3\xb0\x15\xbd\x95\xc6\x02\xca\x1d\x91\xc7\xc5\xd7\x5c\xc6\xc5\
+}\xae\xc4H$T\xd3V-\xf9z\xe9J\x9b\xa4\x9a\
+\xa2z\x8d*\xdcy\xff0\x9a\xb7jE\xc2\xd0\xdd\x97\
+\x9c)\x098X\xbck\x86\x22\xb8[A\x18\xc7~1\
+\x1d\xbfp\xcc\xf1\x82C\xf2\xa3\xac\x90\x8d\x9f\xb1~\x00\
+?1\xd3\xcc\x08f\xcf6I\x0c\x86}{v\xc9e\
+\x17tU\xc77l\xc4s\xff\x9c\x14\xbb\x94iY\x96\
+}E\xac\x99\xf6\xb4\xc5\xe9\x9d;\xd3o\xc8 ^x\
+\xe2q\xde\x7f\xedu\xaa\x1fY\x93s.\xb8\x18\x11b\
+/\x9b\x06\xdf\x9e{\xef\x8d\xd7y\xf5\x1f\xcf\xa3\xe9\x09\
+Ni\xd7\x8eQ\xe3\x1fB\xd3\xec\xe6U\xa9V\x8d\xfb\
+\x1e|\x88\x9d\x03v0g\xe6g\xac\x5c\xf8%\x1b\x7f\
+\xfe\x85\xd2\x22\xfb\x9aN\xd3\xb2\xa8qt\x1d\x1a\x9d\xd8\
+\x9c\xd3:\x9dN\x9b\xd3\xdba\xe8\x06\x96\x98Lz\xe3\
+\x0dV.[\x81\xebe\xd4\xc4d\xf7\x8em\xec\xda\xb1\
+\x1d]\xd7\x9c3}\x99T\xb1g\x1b\xd9i\xe4\xb3F\
+a\x9fQ\x8c%\xfd\x7f\x1c\xa2\x85FE)l\x03\xc4\
+\x18[q\x05\x1e\xbaR\xa5\x8a\x8a\x8a0M3k\xa3\
+,e\x1b~\x12\xe86\x22p\xde%\x97\xb0g\xe7.\
+&\xbf\xf9:\xcf=:\x9e\xcaU\xaarZ\x87N\xce\
+\xf5\xac\xd1\xb1\xcd\xfe~\xfd\xa5\xe7y\xeb\xe5W\xd0\x8d\
+\x14\x1d\xbbt\x97\xa1\xa3\xefW\xba\xae\x87\xf7)\x08T\
+\xabQ\x83\xde\xd7]C\xef\xeb\xae\xc1L\x9b<0p\
+ \xdf\xacX\xc5\xd9}.\x94[\x07\xdd\xed\x0f6\x02\
+\x7fn\xdd\xcc\x83#F\xf0\xfd\xda\xef\xd1\x95A\x8bV\
+\xad\xe8ya/V/[.\xf3>\x9b\xa1&\x8c\x19\
+EiI\x09=\xcf\xbf\xc0fc\x80\xdb\xee]Re\
+\x8c\x026\x0d\x9c\xc5{\x0b\x0b\xcb\xb2\x94\xa6E\xdf\xe5\
+\x1d\x08\x0ec\x0e\xdf\x18\xf7\xf3\x95\x85Gx?@\xe0\
+\xd9\xad3\x98\x1e\xb5,\xe3`\x05\xa8T\xa5*\x1f\xcf\
+^Fnn\x9e\x8a\xad\xdc\xb3X\x053]\x1aN\x12\
+\xb8\xee\xd6~\xfc\xb9e\x0b_\xce\x9d\xcd#\x0f\x0c\xe7\
+\xd1\x7f\xbc@\xa3&\xcd\x9d\x1b5}&\x89\x08\xffx\
+r\x02S'\xbd\x87a\xa4\xe8~\xce9\x0c\xbe\x7f\x98\
+r\xdfC\x94Qm N\xd3u\xf4\xa4\x81\xa5LL\
+\xcb\x0a\xe19s\xfaG<\xfb\xc4\x04J\x8a\xd2\xe4\x95\
+/\xcf\xe0\xe1\xc3\xe8\xd4\xb5\x0b\xa0\xe8rVw\xa5\xa5\
+t\xe6L\xfb\x90g\xc6?\x88\xae\xeb\xd2\xadW\xaf\x00\
+\xf7}Z\x1e\x8aY\x9a\xa6y\xd6Y\x14\xdf`\xcf\xf1\
+\xec\xa9\x98\xf4\xa8v\x96\xc8s\xc6\x89\x9cH\x9e\x98\x1d\
+A\xfe\x83\xb7\xe3\xc5\x8d\x0a\xdby\xe1\xde\x18\xc9{D\
+\xc5J$\x92I\xa2\xc1\x85\xd3\x1cG\x8ak\xfc\x84\xcb\
+R\xdc3z4'\x9er*f\xdad\xd4\xe0\xbb\xd8\
+\xbe\xedO\x1f\x07\x87\xf9\x8f\x8d\x19\xc3\x07\xefM\xc60\
+r9\xe7\x82\xf3\x192\xe2\xbe\xf08\x1a\xe3,\x0b\xd6\
+c\xdf*&\xa4\xd3%\x00\xe4\xe7\x1fd\xec\xf0\xfbx\
+t\xdcC\x14\x17Y\x9cx\xd2I\xbc6e\x92t\xec\
+\xda\x15\x7f\x87\x93b\xd0}\xc3\xe9x\xce\xf9\x08\x16\x13\
+\x1e\x1a\xa9f\xcd\x98\x1e\xc7\xa30\xe3\xb22\xc2\xf7<\
+\x86\xe8\x1d\xf8\x9dA\xbf(\xcd\x02Z\xce\x8b\x0a\xc0\x84\
+>\x11\xc6\x95yO`h\xde(10\xd9>A\xb8\
+\x00\x03B\xd2\xea\xf9\x02$\xb3h\xb1}\x00\x0f\x8c\x7f\
+\x8cc\x8ek\xc8\xc1\xfd\x07\xb8o\xc0m\xce\x19y{\
+9w\xdc\xf0\xfb\x99\xf5\xf1'\xe8F\x92\x0b/\xbd\x94\
+;\x87\xde\x93\x89\x83ShV\xd4\x04\xfb\x9a\xb6t\x9a\
+\xb5k\xbe\xa6\xef\xa5\x971\xff\x8b\x05\xa4\x12)n\xb8\
+\xfd\x16y\xe2\x85\xe7\xa8R\xb5\x9a\x12\xcbB\xc4\x0a\xdd\
+;p\xcf\xfd#h\xdf\xe5\x1c\x14\x8a'\xc7\x8cR\x9f\
+\xcf\xfc\xd8'|\x5c\x851\xb8\xc4\xda\x08\xd9zVY\
+\xf1\x91:2\xd4C\x5c~'\x04\xae\x89\xcb\x82\xcc\x7f\
+\x1abT\x97\x1f\xa5y\xd3%O\xea\x030\xc9T\x8a\
+\xd1O<I\xe5\xeaU\xd9\xb6e3\x8f\xdc?\x0c\x11\
+\x8b\xc7F\x8da\xd1\xec\xd9\xe8F\x82\xbe\xb7\xdc\xcc\xad\
+w\x0d\xf0\xf2F+\x8bJ\x7f\xa8~\xa5\x00\x8d\x95K\
+\x963\xa8\xdf\xed\xec\xdb\xb3\x9f\xfa\xc7\x1c\xc3s\xaf\xbd\
+\xca\x15\xd7^\xed\x0d\x0b\xff\x9a\xf4\x9a\xc7-/\xbf\x82\
+\xfb\xc6\x8e\xa5]\xc7\xb3DS\x1aO\x8d\x1d\xcd\xacO\
+>\xceF\xe7x\x92\x08\xca\xdb\xadw\xb8\xe6\xdf\xe1\xf2\
+\xa4\x0c\xcdS\xc6\x0d!\x87.\xe7p\x1a\x18\x977N\
+\xfd\xb87\xaezj=\x00\xec\xaa\xc4\xcaU\xaa\xf2\xe0\
+\xd3/\x92J\xe5\xf1\xf5\xb2\xa5\xdczEo\xe6\x7f\xf6\
+\x19\x86\x9e\xe0\xce\xa1C\xa5\xcf\xb5W{CIlG\
+\x89\xed\xfe\xb6\xda\xd5t\x1d\xa5t\x0e\xec+ \x914\
+\xe8{\xeb\x8d\xbc\xfc\xee[\x1c\xdb\xb0\xa1\xe79\xdb\xf8\
+\xeb\xcf<\xf9\xe8Xvl\xff3\xd4\x187\xfd\xfe\x87\
+\x1f\xa2u\xfb.h\xa2\xf3\xd4\xd8\xd1|1sfV\
+\xd5\x1d\xfc\xe1\xabk\xb7\xbb\xaaX\xd8\xb8r\xe2\xb4Y\
+\xb6\x10\x9b\x1e\x88\xc8\xbc'0K%q\x88\x95\xf5\x89\
+;j\x1aF\xc0\xdd\x9c\x99E\xf4\x03\x19\x8f\xae[\x87\
+\x11\x8fN@Dc\xeb\xef\x9bI\x18:\xf7\x8c\x1e\xc9\
+Y\xe7\x9f\xa7\xac 1%\x9c=\xba2\xe9\xd4\x8aX\
+\xc2\xb4)\x93X\xbdr\x05(\x8d*\xd5\xab\xf0\xf4+\
+\xff\xa4\xcf\xb5}\xbd\xe3b\xee\x9a\xc1\xcb\xcfN\xa4|\
+\xaa2o\xbf\xf2\xa2#;Vh\xfd@\x81\xba\xff\xa1\
+q\xb4l\xd3\x0eM\xd3yr\xecH\x16/\x98\x9b9\
+\xa6\xc7\xd0\xc2?}\xeck\xc18\xc6f\xd3\xe0\x87\xc3\
+\x8f\xb8\xf4\x10\x0e\xee\x83E\xd9\x95\xc6I\xe5\xe1\x08\x8c\
+\x17\x1f\x00\x10\xecm^*p\xb3wf\xab$\xf4\xb5\
+\xee\xdb5\xb6\xba\xd0lgL\xb5Z\xd53\xbdm\x82\
+\xbfl\x1c<S\xee&\x8b\xf0\xe7\xe6?\x18p\xf3\xb5\
+<\xf7\xf8c\x94\x14\x97\xa0\xb0hsF{\x8ek\xd8\
+\xc8\xd3\x16\xa6i\xb2j\xd9\x97\x0c\xbc\xf9zV-_\
+\x86\x9e\xc8\xe5\xb3O>e\xd8\xc0\xfe\xac]\xb3\xda\x97\
+8\x87\xc1\xc9T\x92\x11\x8f\x8e\xa7\xf9\xc9'\xa3P\x8c\
+\xbf\x7f(+\x17/\xca\x18v\x82K\xd76n\xee\xb0\
+\xe2\xbb\xb2\xb3\xf1\xa0,\xe1\x88\xa39\x91\xdf\xd9\x04#\
+v\x08\xc8&ieIs\xb6\xbcn\xa4\x15\xc8\xa8\x00\
+\xcbr{Z\x043ouS9\x04\x16\xdey\xf5e\
+\xde~\xf9ED\x14\xf5\x1b4\xc0*\xb5\x189\xe8.\
+vl\xdb\xea-\xe5f \x11X!u\xd7\xf8g\xcd\
+\x98\xce\x0d\xbd/\xe3\xa7\xf5?\x90W.\x8f\x1aG\x1e\
+\x85XB\xba\xa44$o{v\xed\xe0\x8b\xd9\x9f\xf0\
+\xeb\x86\x0d\x18Z.\x1a\x09\x0c-\xc5\x8f?\xfc\xc0\xda\
+oV\xfa\xaf\x91\xc3-\xdf\xb6WF>6\x81\xe6'\
+\xb5AL\xc5\xb8\xfb\xee\xe6\xab\xe5\x8b\xe39\x12\xf8\xf6\
+\xb6\xb1e\xca\xf2!\xe9\x9bM\x08\xdc\xe7le\x04C\
+\xbc\x0d\xf0\xef\xd6\x9eE\xd4\xbc5\xf6\xc0\x9f\x9b\xee\xbe\
+\xe0-\xf4'\xfe\xe7\x1fO>\xc1\x9b/\xbf\x04\xca\xe0\
+\x8ea\xc3x\xf8\x85\x17\xa8]\xb7\xae\x14\xe5\x17r\xff\
+\x9d\xfd9x\xf0\x80\x9f'\xd8\x8bD\xbc\xfdv\x07\xf6\
+\xefg\xe4\xbdC\x18?z$\xe9\xb4E\xfd\xe3\x8e\x93\
+g_\x7f\x8b\xba\x0d\x1a`\x89`\xda\x97\x12y\xb9\xab\
+\xd5\xa8\xc9\xbd\x0f\x8c\xe7\xd5\x7f}D\xed:u\x05\x14\
+\xc7\x1c\xdf\x907\xa7N\xe3\x8akoA\x0b\xcd`\xfc\
+\xfd\x04\xa9T\x8aQ\x13\x9e\xe0\x84\x16-0\xd3\x16c\
+\xef\x19\xc4\x9a\xaf\x97\x85p\x09\xd1\xc0\x0d\xee%\xd5q\
+\xb4.\x8b\x8b\xd9\xb8\x9cM]\xc4\x84\xf8i`\xf0\xf9\
+\xef\xe8\x9f,\xd3\x9a\xe05\xebvv\x85X%\xce]\
+|\x01\x9b4\xb0\xcbCD\x187|\x18\xd3\xa7LF\
+\xd7\x93\xdc5l8=z\xf5\x227/\x8f\xd1\x13\x9f\
+R\x15*Tf\xdb\xe6-\x8c\x1e2\x103\x1d\xb8H\
+\xd9\xbby\xd3\x0ek\xbeZ\xc5\xf5\xbd/a\xf1\x82\x85\
+hF\x8a>\xd7]\xc7s\xaf\xbd\xadj\xd7\xado\x8f\
+\xe7\xe0\xec\xe3\x0f7\x05\x11\xaaV\xab\xce\xd0q\xa3T\
+Qi!7\xdc~\xab\x94+W\x8e\x90\x98\x05\xda\xe4\
+\xee4N&\x93\x8c{\xfa9\x8em\xd2\x84\xb4\x09\xa3\
+\x06\x0dd\xfd\xba5\xf1\xbd\xd4\xb2_\x92e\x99\x0e\xce\
+\xd9\x8c\x86C\xe9\xf1\xb2\xe2\xe3`\x02!\xf6ph\xa8\
+<\x09%\x85\xd23\xf2Y\xf1\xb8\x04\x0d\x227BL\
+\x09\xac\xc5\xbb\xf3k\xc70\xb4,F\xdd;X\x16\xcd\
+\x9d\x8b\xae'\x198l8\xdd\xce9\xdb+\xb3j\x8d\
+\x1a\x8c~\xeaiI\xe8\xb9lX\xfb-\xe3G\xde\xe7\
+\xa9Q\xb7\x1e3\x9d\xe6\xc5\x89\x13\x19|\xeb\xad\xec\xdb\
+\xb7\x9f\xa3\x8e>Z\x9e\x7f\xed\x0d\xfa\xf6\xbb\xcd\xbe\x93\
+@\xdc\xedf\x81m\x92\xde\x98\xeck\x92\xfa\xc7\x1c\xcb\
+9\x17\x9cM\xcb\xd6\xadCN5\xf7\xfc_p2\xef\
+\x0aB*\x95\xe4\xa1\xa7\xfeA\x9dc\x8e\xc5J\x0b#\
+\x06\xdc\xc6\x86\xf5\xeb\xec:\x82<\x16%\xba\x12\x0c\xe5\
+\xbf\x9d\xd4\xdb\xb2\x1e$m\xcc\xf0p(Y\xc8\xaa\x19\
+\x22A\x0b&:oN#\xd2R\x1fq\x89\xaf\xcc\xcd\
+\x97\xe1;\xf6\xf2\xb8\xad\xb6\xf8k\xef\x1eV.]F\
+q\xd1\x01t4\xb6o\xde\x82\x99v\xaek\x15\x9bq\
+\x0f\x0c\x19\xc0\xb2\x05\x8b\x95\xae'\xb9\xf3\xdeat=\
+\xbbg\xa0^\xfb\xe9\xd8F\x0d\xd5\xd0\xf1\x8f\xa0\x94\xce\
+\x92\xb9sx\xff\xcd\x97=\xbb\xe1\xcf\xcd\x9b\xe9\x7f\xed\
+\xb5L}\xe7\x1d\x94\xd28\xf7\xfc\x8b\xf8\xe7\xbb\x93\xd4\
+\xb1'\x9c\xe0\xe9\x06W\xb8mfg\xae\xc6\x07k\xbb\
+\xf3\xde\x91\xa14\xef\x15\xb1\x0e@\xd4\x94\x15\x11r\xf3\
+ry\xe4\xd9\x97\xe4\xa8\xa3\xebI\xba\xc8b\xc4\x1d\xb7\
+\xb3\xe1\xbb\xb5\xe2j\x9c\x85s\xe60\xe5\x8dW1\x94\
+\x8e!\x06c\x07\x0f\xe6\xbdW_e\xf3\xc6\x8d8/\
+\x93\xf0:\x9f\xe5\xe2\xea|\xe2zy\x94\xf1\xc1\x0e\x9c\
+!,A\xa5\xeb|W~{\xca\x97O6n\xd6\xfa\
+Z7\xd6\xf5\x92\x85[\x16\x98\xb7;\x99%\x00\x1b<\
+\xaa\xe7\xbdl\xc9\xc6XV,^\xa8\xa6\xbe\xf1\x06k\
+\xd7\xac\xc5@\xb3_\x8a\xa8\x14\x96Y\x8a\x9e48\xbd\
+k7\xb9\xec\xba\xab\xd5K\x13\x9f\xe6\xeb%+\xd1\x0d\
+\x83\xbbF\xdcO\xe7\x1e=\x22-\x0e\x87Y\x9f|\xc2\
+3\xe3F\xa2i:5k\xd5\xa6\xdeq\xc7\xb1z\xf9\
+*\x0a\x8a\x8a)W\xb1\x02CF\x8e\xe2\xd4\xd3N\x8b\
+)C1b\xd0 V.YB\xd7^gq\xf7\xfd\
+\xa3\x22s\xf3\xb8\xa0\xbc\xfd\x0d\x1e\xb1\xa3\x0e\xfb \x0d\
+\x80=\xbb\xf7p\xf7-\xd7\xb2{\xeb\x0e\x12\xa9$\x17\
+_}\x1d3\xff5\x95}\xbb\xf7\xa0\xa1;\xd3N\xd7\
+\xe611-\x93\x96m\xdb\xd1\xef\xee\xc1\xf6\x1dI\x01\
+~\xb8\xcfng\x8b\xfa\xf9\xbdM\xdd\x914\xf1\x98e\
+\xff\xde\xb3k\xc7\xdang\xd4;\x17\xf8#\xf4\xce \
+\x02\x80eN\xcf\x1d\xed\xe7\xa9)7O\xa0\x0c\xf7\xd9\
+L\x972\xf1\xa1q\x8c\xbd\xeb\x1e~\xfc\xf6Gr\xf4\
+\x1c\x0c=\x89BC\x13\x85\xa1%PiX\xf4\xe9g\
+\xea\xb6K\xfb\xf0\xcd\xd2\xaf0t\x83\xc1\xa3F:\xcc\
+w+\xf4+\xb6\x0fz\x82\xa0h\xdf\xf9L\x1a4l\
+\x8ca%\xd8\xb9e\x1b+\xe7/\xa1\xa4\xb0\x84\xe6'\
+\xb7\xe4\xc5\xf7\xde\x13\x9b\xf96\xacw\xf2\xd9\x09\x96\x15\
+\xb8\x1d5\x83\xe7n]\x84\xf2\xe0\xc2z\x19\xc3\xc43\
+-\x8b\x0f'\xbf\xc3\xa6\xdf\x7fA\x80*\xd5\xaa\xf0\xe0\
+3\xafP\xfd\xe8Z\xa4K\xd2\xbc\xff\xf2+\x1c\xd8\xb3\
+\x1fC%\xd0\x94f\xdb!\x96\xa0+\x0dCK\x924\
+R|\xb7r%\x03\xae\xbc\x825_-\x0b\xd1=\x9b\
+\xba\x0fm\xf6\x0d\xdaZ*\xc2\xc7@\x9a\x1b27\x85\
+\x0a\x99PQ\xbfr\x1c|\xb0'\xb8\xc2 \xc2\xa3\x0f\
+\x8cb\xd9\xdc\x05*a\xe4\x02\x8a\xb4Y\x82\xa4\xca\xa3\
+r+\xa2\x89\x09\x07w\xa3[it\x95@\xd7m\xaa\
+\xb6>\xa3\x1d\x1d\xbat\xb1O\xe8\x04\xb6q\xbb\xca\xfa\
+\xe0\x81\x03\xf2\xe5\xfcyj\xf9\xc2\xf9\xac^\xb6\x0c\xcd\
+\x04]\xe9(\xecc\xe1\x95jT\xe6\xe1g\xff\x01\xa1\
+K\xe8\x9c2\x1c\x86\xaa\x101\x22\xd2\xee\xac&\x16\x17\
+\x152b\xf0m\x9cxR+\xae\xbca\x80\x0f\x15]\
+\x0a\x0d\xd0h\xed7\xab\xe5\xa9G\xc7\xa9\xb6\xed;0\
+~\xe2K\x08pd\xcd\x1aT?\xf2h\xd9\xf3\xe7^\
+\x05\xf6^\xc4\x22 \xf7\xb8S\xa8pT=t]\xa7\
+t\xcfv\x0a\x7f]\x0b\xfb\xb6\xa3kI\xac\xd24c\
+\x07\x0e\xe6\xe1\x97^\xe2\xf8\xc6M\xed*\x03=\xfc\xb0\
+\xc6\xf8\x98\xa1\x22\xda\xd4\xc3;\x1c\x9a]\x03g\x85\x11\
+\x8193g\xb0x\xde<\x0c#\x07\x13A*T\xa5\
+\xfey\xb7sd\xb36h\x09\x1d\x914E\x05\x85l\
+_\xbd\x98\x1d\x9f\xfd\x13=\xff/@X>o\x01k\
+W\xaf\xa2Y\xcb\x93\xedY\x82R\x14\xe6\x1fd\xc1\x9c\
+9,\xf8|\x16\xdf|\xb5JiJC\xd7u4\x14\
+J\xd3Q\xa2l\xa3N\xc1\x89\xa7\x9eJH\x0d\xb9\x0d\
+\x17\x97~\x81\x8d\x18\xae\xcf!\xd2\x16\x05l\xfa\xfdw\
+V,[\xc9\xae];\xb8\xfa\xc6\x01\xf6\xc5f\xd9h\
+\xe1\xc4\x9f\xd8\xaa5\xd7\xde\xd8\x9f\xd6mN\x15\xc4~\
+\xdd\xe3\x82Y\xb3Y\xfb\xf5\x1ae\xa8$iLR\x0d\
+Z\xd3\xfe\xa6\x07\xa8R\xf3H\xfcW\xcd\x08\xf9\xf9\x85\
+\xfc:g*\xdb?z\x06CiH\xa9\xc5\x84Q\xa3\
+x~\xd2d\xc1{1b\x0c?\x0e\x87?A\xd8\x80\
+\xe9\xffo\x9c\x0e>t\xb0\x04\xd2\xa5%\xbc\xf9\xfc\x8b\
+h\x89\x1c,tr\x8eiB\xfbAO\x91\x9b\x97K\
+\xa9)\x98\xce\xcaZ^\xc5JT\xad})\xb5N\xee\
+\xc0\xda'o\x87\x9d[\xd04\x9d\xa7\xc7\x8e\xe3\xc9\xd7\
+\xdfd\xf5\x8a\x15|1s\x06_-_\x86e\xdaW\
+\xaf\x19z\x8ad*\x97v\x1d;\xd2\xf5\xdc\xb3i\xda\
+\xa2\x19S\xdf~\x8f\x15\x8b\x96\xc8q\x8dOP7\x0c\
+\xb8\x8d\xe0\x1bE\x82=W\xc4\xefD\xee\xdbB\x90\xf8\
+\xab\x92\x8eo\xd4\x98{\x1e\x18G\xd3\x13\x9bcY\x91\
+\x17\x94\x10Qz\xfe\x18\xa2\xfa\xde\xd2\x1f\x9c\xab\x9f@\
+x\xef\xd5WPZ\x02\x0b\x8dr\x0dO\xe1\x8c\xc1\x13\
+H$t\xe7~\x22{\x95Q\x01y\xb9\xb94=\xff\
+*\x8e\xa8U\x97\x0d\xcf\x0e$a$\xd9\xf6\xdb\x1f\xcc\
+\x999\x83.g\x9fK`6\x1d\x8bo\xb6\xc5E\xa2\
+i\xf1g\x03\xe3\xcc\xa4\xbf'\x5c\xc1\x92\x16\xcf_\xc0\
+\xde\xbd\x7f\xa1\xebIJ\x94\xe2\xccA\x8f\x91\xcc\xc9\xa5\
+\xc4\x14\xd2\xa6\xebOwK\xd7\xa8Z\xb3&-\x07<\
+\xce\xf2\x11}H\x8a\xc1\x9e?wqE\xb7\xee\x88\xb2\
+O\xcd\xea$\x10%4o\xdd\x9a.g\xf7\xe4\x8c\xce\
+\x9dH\xe6\xe4x\x83w\xef\xeb\xaf\xa5\xf7\xf5\xd7*p\
+\x98\x11yu\xac\xf7\x10\x9c\xaeO2\x00\x8a\x00\x00\x0f\
+\xc9IDAT\x88\xb2\x0fy\x04:\xb6\x88\xaf\x14,\
+\x11z\x9ew\xbe\x0d\x87w\x83\x00\x19\xc5E\x0d\xa8\x00\
+\xd4\xe6\x8d\xbf\xf3\xc7\xa6?H&r(\xb5\xa0\xf3\x1d\
+\xa3\xd0\x0d\xdd\xee\x04\x02\xa6%\x8e\x00\x08JSh\x96\
+\xa2\xde\xa9\x1d\xd8\xd1\xb6'\x7f\xad\x9c\x83\xa6\x19\xcc\xf9\
+x:]\xcf>7To<\xd5\xcb\xe2H|\xc8x\
+g\x90'\xd51\x22\x15M\xcf\xba\xe7M)V.]\
+\x8a\xd2\xec\xdb4\xebt\xbe\x08#U\x81\xb4e\xbf'\
+@,\x13\xc4\x9fkkb\x13\xa1b\xadz\x1c\xd9\xe1\
+\x02v/\xfc\x08\x1d\x9d\x84a\xdf\xefW\xb7\xc1q\x9c\
+\xd1\xa3\x1b\x9d\xbb\xf7\xa0z\x8d\xea>6\x01\xcb-|\
+\x83\x09(g\xb3\x8d\x8b\xa7k\x93\xb8L\xb2\xdf\xed'\
+\xf6\x10\x12l\xb38\xc3\x83[\x96\xc3a\xcf\xcf\xe0\xce\
+vBVc\xd4\xd2\xf2)\xf5\xd3\x0f\xdf\xa3\x1b\xf6\xc6\
+\x98\xaaMO!U\xbe2\xe9\xb4\xdd^K\x04{\xaf\
+\x01\xa0\x04e9\xb7wX\x8ac\xcf\xee\xcb\xb2e\x9f\
+\x914\x12\xac\xffv\xbd2-\xd3\xbb\xfa&\x9by\x16\
+\xc4\xc4\xc3 \x0b\x1f\xdd\x90qWpH\xc2c\xc4\xe6\
+P\xe9n\xf8\xfd\x97\xdf\x04P\x96UB\xb5&m\x02\
+s}\xd7\xe3%\xde\xf8.\xa20\x95\xa0,\xa8\xd6\xfc\
+4v\xcc\xff\x17JKpT\xbd\xa3\xb9\xe7\xc1qR\
+\xb7\xfe1\x19\xa2\x96\xa9\xda\x02 \x91-a\xbel\xb8\
+\x92\xe08|,\xb1\x0f\xc4\xa9 L\xa4\x91.l \
+\xcd5$\x83[\xae}\xc2\xbbK;\xf6\x85\x13{v\
+\xedq\xf62\x9a\xe4\x1eY\x97t\xa9\xd3\x09\x02\xeen\
+\x97\x1e\x967\xc5ST8\xaa\x1e\xcaHa!\x94\x14\
+\x17q\xe0\xaf\xfdT\xac\x5c9\x03\xbf\xe0\xfb\x053\xf0\
+\x0c\x12+\x8b:\xff\xaf\xdb\x00.QJ\x8aK\x94B\
+aY&\xc9\xdc\x8a\x1e\x85\xc5}G\x8f{E\x86\xeb\
+\xf5rl\x9cT\xf9\xaaX\xcaD\x94A\xb5#kP\
+\xa7~\xfd\xc8{\xe2\xa2\xf5\xf9\xe3|tsflP\
+\xfe\x10a\x9a\x81\x03\x19\x12q\x08e\xac\xce(\xafG\
+\xb9c\xbb+\x04\xee/\xf7\xbf%\x16\x07\xf6\xed\x96\x95\
+K\x97\xab\x85\xb3g;\xfe\x12\xc1\xd0u\xef\xfa\x18G\
+%\xd9\x9d\xc0]+q4\x90\x89B7\x0c0\x0c\xe7\
+\x9dF\xce\x157~\x15A\x02\xc4\x11\xa5\xec\xb8\xc0\xb3\
+\xbf)\xd4L\xfbw\xc5\xc68\x80Bqq\xbf\xdd|\
+N\xc3R\xb99v\x94\xa6#\xc5{q\xd7\xd1]\xd7\
+\xaf\xdd`G\xd1*\xe5\x08\x04\x14\x1f\xfc\x13MO\x80\
+@\x22\xe3\xfd|q!Hz\xe2\x1b\x1f\x82\xf6Mi\
+3\x9d\xb6\x95\xbdw\x01E\xdc\xb6(\xb7ma\x86\x07\
+K\xb3\x05\xc3\x94\xad\x7flQ\xcb\xbf\x9c/\xcb\x16,\
+P\xeb\xd7}gOL\xf5\x14J\xb3\xaf\x8c;\xb0e\
+\x03\x86\xa1(-\x0d\xd3\x01\xf1\xfd\x91\xaemT\xb8o\
+;Vi>z\x22\x8fTn9*\x1cqD\xb8'\
+\x1f.\x8fb\xbe\xc52\xbd\x86z\x02PZRR\x1c\
+;\xdf\x8f\x9b\xf3\xc6\xfdv\xe2\xdcy\xfb1\x0d\x1a\xb0\
+\xe9\x97\xdf\xd14\x83\xed_\xcf\xa7Z\xe3SI;\xc3\
+\x80\xa7\x0d\x9cl\x96%\x80\x85\xa6\xeb\xecY\xbb\x0cM\
+K\x82\x99\xe6\xa8:GG\xda\xe52\x01\xaf\x1c\xff\xba\
+.\x07\xf9`\x1b\x02\xcf\xfe\xfa\x9b\xb0w\xf7n>\x99\
+2\x99\xcd\xbf\xfe\x82\xae\x14+\xe6\xcdg\xa2iq\xce\
+\xc5\x97\xd8\xbb\x81\x02\xd9\xbdS5\xe2\xbeT\xc7?\x8d\
+T\x5c\x98\xcfwk\xd6\xb0t\xe1BV\xafX\xa6\xb6\
+\xfe\xb1\x95\x84\xa1+MO\x900R\xb8W\xb6\xe9b\
+_\x09\xbd\xf7\xbbU\xa4\x0f\xeeD\xe5Tu\xdal3\
+_!\xde\x0b\xacD\x04MSl\x9a7\x95D\x22\x0f\
+\x04\x1a\xb7h\x86\xa1\x07\xb6\x8c\x1f\xae\x1f \x1a\xef|\
+\xa7\xcd\xd2b\xe7\x97\xb8\x02`\xed\xd9\xbdkw\x06\xf3\
+c\x0a\x8d\x13\xbe\xb8p\xcai\xa7\xc9\x82\xcf\xe7(C\
+\xd3\xd8\xbah&\x0d\xcf\xbb\x16\xbd\x5c\x0dLg\xe5\xcd\
+\x12\xff\xc5Q\x22&Ji\x14\x1d\xd8\xc3\xf6%s\xd0\
+\xc5~\xdd\xcc)\xedO\x8fA\xc1\xc6\xe0\x87uk\xd8\
+\xb5c+g\x9c\xd9\xd3KQ\xf8c\xbf\x8adt\x99\
+\xbf`\xd6\xe7<\xf7\xf0\xc3\x98\xc5i4e`\xa0Q\
+\xfcW\x01\x0b?\x9e\xc1\x17\xd3\xa6\xd1\xe3\xa2K\xe5\xd6\
+\xbb\x87\xb8\xc5\x11R\x8b\x22\x1c\xd8\xbb\x8b\xa5\x0b\x17\xb2\
+|\xd1\x22\xbe\xf9z5\xc5\x05\x05\xe8F\x02M\xe9\xa4\
+rr\xb1\x04*V\xadN\xdb\x8e\x9d\xe4\xd4vmT\
+\xa3\xe6\xcd\x19\xd2\xb7/\xbb\xb6\xed \xa54\xbe\xfe\xe7\
+x\xce\xb8\xf7q\x0e\x1e\x14L\xe7\xca\xd2\xd0\x02\x90\x08\
+\xf9;6\xb2y\xce\x07h\x80i\xa5\xe9zn/\xcf\
+\xe6vg)e\xf1\x22d\x00\x86\xdao\xc7\x17\xe4\xe7\
+\xef\xc1\xbe\xa5\xc7\xd3\x00\xe9\xad[~\xddv\x08\xed\x99\
+QA,\xbc3\x04\xb4\xedp\x86\xaaQ\xb3\x1a{\xb7\
+\xef\x22\xa9`\xc5\x13\xf7p\xfa\xc8\x17\x10-E:m\
+bY\x96}\xf9\x93\xd2\xb0\x04te\xb2\xee\x851$\
+\x9c\xa1\xa2~\xc3\xe3i\xd2\xfc\xc4H3\x95G\x81\xa9\
+\xef\xbe\xc5\xe6?~\xa1}\xa7\xee\xce\x0ec\x95\x89F\
+\xe4\xd7\xea\xe5\xcbyj\xf4\x18\x0c\x95\xc4\xd0S 6\
+\x0e\xb6!\xa8\x91\xa3%\x99\xf7\xd1\x87J\xd7\x147\x0f\
+\x1e\x8c{c\xca\x96\x8d\x1b\xf9r\xde\x5c\x96/\x9a'\
+?\xad\xdf\xa0tMC\xd7\x0c\xd04\x12)\x9b\xe9\xf5\
+\x1b6\xe2\xe4\xd3\xda\xcb\xa9\xed\xdb\xa9\xe3Nh\x88R\
+\xbe;\xfe\xa6!\x83xp\xe0]\xe8F\x92\x83\xdf.\
+f\xf1\x13C8\xf1\x86\xfbQz\x05\xcc\xb4\x85\xe9\xec\
+\x961\x92\x06;\xbf]\xc0\x8f\xaf>\x86\x86}\x93e\
+\x9d\xfa\xf5\xe8\xdc\xa3[\xd6>y\xa8N\x1f\x17\xbfw\
+\xef\xae]@)\x01\xaa\xe54o\xd5\xb6\xf3+o\xcf\
+\x9b\x99%_\xa8\xd0l\x12(\x91\xa7\xaf\x97-e\xdc\
+\xa0\xbbI&\x92 \x16\xaabM\x8e\xeb};U\x9a\
+\x9f\x8e\x996\x11\x14\xa6i\xb2\xeb\xebyl\x9e\xfe\x1a\
+\xb2\x7f\x17\xff\xab\xbds\x8d\x8e\xaa\xba\xe2\xf8\xef\xcc\x9d\
+\x0cCB\x1e\x04\x12y\xc4@\x02HB\x80$\x12h\
+\x10\x8c\x08\x88\x02F\xbb|\xad\xaa\xb5\xb6\xa2T\x14\x8b\
+h\xd1\xd2\xae\xeaR\xc1\x85\xa2]P\x09\xcbE\xa5\x8b\
+*\x82\xcaC\x05\xa36\x12\xd0\xa0 \x8fR\x1b\x1e\x16\
+5\xc1\x84\x98\x90\xc4\x90\xb7\xc9df\xee\xe9\x87;w\
+\xe6\xce+\xeft)\x8b\xff\x87\xdc\xc9\xbd\xfb\xdc\xbd\xcf\
+9\xfb\x9c\xb3\xf7>\x8f\xab\xa2\xe2@e\xd5\xcb9\x8c\
+\x1d\x97\xe2\xa7\xe2v[\x1b\xdb_\x7f\x8d\xd77m@\
+\x22\x991\xf3jy\xdf\xe2GD\xd4\xe0K\xc0\xe8\xd2\
+y\xc9\xa9m\xe5\xbe\xef\xe6\x9bhnh\xc1$\x14\xb0\
+X\x88\xce\x9c\x87\x12>\x98\xd6\xcaJ\x9a\x8e\xef\x85\xe6\
+j\x844\xe1\x90v\x1e\xfc\xf3\x13\xb2\xa6\xaaR\xec\xdf\
+\x93O\xf1W\xa7\xb5\xd3\xbe\x84\xe2\xb2\x17\x04\x16k(\
+\xe9S&\xcbIS\xaf\x10\x19S3\x89\x8a\x8e\x0aZ\
+n\x02\xf8\xfb\xba\xb5|\xb8u\x1b\xfa)fN\xc5B\
+l\xe6,\xfa\xc7\x8fGE`;\x7f\x8e\xf3\xc7\x0f\xd0\
+\xf6]\xb1\xc6CJ\x94~\x0a+sr\x18\x93\x94\x84\
+>\xf4\x04\x18\xdd\xfc\xcc\x82@4FYrwm~\
+\xea\xa9\xe5\xf7\xad\x01\xea\xf44\x0a01\xff\xf3\x8a\xbc\
+\x01\xe1Q\x83\x83\xe6\xa4\x1b\xd8\xb9e3o\xe4\xacG\
+1\x85\x00\x9a\xdf+B\x07b\x1d6\x9a\xb66\x1b\xb6\
+\xf2\xafQ\x9cm\x80v8\x92\xc3i\xe7\x9eG\x96\xc8\
+\xebo\xb9\xd5\x1d\xacs\xe7J\xc0\xa6\x97\xd7\xb1}\xcb\
+\xab\x84(V$\x92\x16[\x13\xe9\x19i<\xbbf#\
+\x81\xb7ViE\xb0'\xf7=rV\xad\xc6\xacX\xc0\
+\x1aF\xc6\xf2\x0dX\xa3b\xdd\x13)\xcdu\xf5\x14\xfe\
+\xe5\x01\xa8:\x83\xe6\xbd\xb8\xf6\xa2\xb9z\x17\x87\x84\xd8\
+\xe1\x972e\xfa4\xd2\xa6Lf\xc2\xe5iX,\x16\
+\xdc\xd6;zt1XI\x08^z~\x15\xfb\xdf\xdd\
+\xe5>(\x13\xc0\x18\xbf\x90\x80SJ\xa4\x10(V\xab\
+\xfc\xe3\xaa\x95\x225c\x92\xd7;z\x0a\x01,_z\
+\xe7/\xf2\xf3v\xee\x02Z\x0c}+\x09[\xdf9\xb2\
+1q\xcc\xf8\x19=\xe6\xe2\x83=\xbbw\xb3i\xcd\x1a\
+\x9cm\x0e\xff\x87R\x0b\x1d;\x05\x98\xadV\xee}d\
+\xa9\x9c5\xf7:\x01\xd2\xed\x9f\xfb\x9e\x99w\xa6\xa8\x88\
+'\x1f]\x8a\xad\xed\x07\x9e|\xee\x05\x99<!-\xa8\
+\xf3\xa7\xa7Z\xbbr\x05\x05\x1f\xe5#\x04\xc4\xdf\xbc\x88\
+\xf8\xac\xdb]SE\x12a2\xa1(&*\xbe,\xe4\
+\xe4\xaa_aQ,\x08!p\xa022)\x85\x8ci\
+W2uF\x96\x1c\x918\xd2+\xb6h\x9c>\xfet\
+_\x1e\xd3\xaf\xf6\xcc^\x0a\x97\xbb\xe9\x11L\xfb\x91\x9f\
+\xbb[n~i\xbdhmj\xd6\xbc\x1f\xdd v\xd9\
+\x02m\xaadbf&\x8b\x97/#&v\x88\x96R\
+\xf8\xf6\xb5\xddGsC]\xf5\xb5Y\xf1s\xedv{\
+!`\xd7m\x00\x094\x9d(<z\xb8/\x14`v\
+v6\xe9\x99\x99\xbc\xbdy\xab\xfc|\xef>\xd1X[\
+\xab} \xca\xe9\xc4)!&.\x8e\xe9sfs\xc3\
+m\xb7\x10\x1e\x11!<k\x09\x8co\xf1\x14@\xc2\xa8\
+Q\xdc\xb1\xe0nYS\xf5\xbd\x187!\xad\xfd\x92\xd1\
+\x0cx\xaa\xcfUif\xaf\xd3\x8e5f\xb4\x16\x054\
+\xb9\xdcQ\xd5\x89\x94\x92\xf0\xe1\xa3@\xb1\x22\x85\x93\xd0\
+\x88H\xd6m\xdb&\xc3\x06\x84\xb9\xb6\x7fK\x11\xf0\xbc\
+d)9\xf5\x9fc\xac\xf8\xd32\x96<\xde\xc8\xdc\x1b\
+o\xf5\x92\xd9\x93F\x8bQ\xcc\x9a\x9f-\xae\x9as\x1d\
+\x07\xf6\x15Px\xf4\xb0\xac(\xab@\xaa*\xd111\
+\x22!i\x8c\x9cz\xd5\x0c\x86\x0e\x1f\xe6\x93\xa7\xde\xa9\
+|\x80\x92\xd2o\xbe\xb0\xdb\xed\xb5\x80\x03\xbc\x03AM\
+\xff\xd8\xf0\xc2\xc7\xf3o\xbc\xf3a\xc5\x1c\xe2\xbf\xa9\xaf\
+\x87\x18\x14\x13\xc3\xbdK\x7f'\x16<\xfc\x10U\x15\x95\
+\xd4\xd6\xd4\x8001d\xe8%2*:\xda=q\xa2\
+u\xa9\xba[\x17<\xdc<\xf3\xdalakm\xf1\xfb\
+\x8a\xbc\x11\x9e\x89\x1fm\x85\x0eH0\x99h=_\x06\
+dx\x22\xc3\xaaD\xe2\xa4\xad\xa1\x06\x89\x03\x84\x89\xc8\
+\xe8\x81\x84\x86\x85\x09U\xf5\xb4@O\xa8\xc8\xe3\xff\x9f\
+:~L.{h\xa10\xf7\xb3\xb2v\xf5\x0a\xbe-\
+\xfaR.z\xf4\x09\xc3\xf0\xe5\xdd\xca\x01\xcc!!d\
+\xcd\x99E\xd6\x9cY\xee0\xa3\x8bB\xf8YX\xbdW\
+\xf7\x00\x1c>\xb0\xe7c\xa0\xde\xc5\xc0kM\xa0\xad\xac\
+\xac\xa8\xb4\xf8\x9b\x93Gz\x85S\x90\xb8\x81\x10\x82K\
+\x86\x0da\xec\xf8\x14\xc6\xa6$\x111p\xa0\xf0\xac\x04\
+\xf6\xb8k\xfa\xae\xa1\x80\xef\x02BB,\x84GDv\
+&\xf0\x07\x08R\xd2S1\xa9\xa0\xa0P\x9e\xff\x16!\
+\x16\xd7a\xc0\xae\x8fE\x98\xcc\x0a\xc5\xbb_\xc1\xacX\
+\x90*$$\x8d\xc5\xa3\x90\xae\xca\xf33\xbf\x05)\x13\
+'\x89_\xfef\x11\xaa\x03\xee\xb8\xfb\xb7r\xc1\xe2\xc7\
+\xfcD\xd2O8\xd3*\xd4\x10\xd5\x90\x869\x01=\xff\
+R\x7f\xb9hw\xf6\xafC\x04(\xb3\xa6\xc6\xba\x9a\xbf\
+\xe5\xac,\x00\x9a\xf5{\x8aO\x12aR\x14\xcb\x15W\
+\xce\x9d\xe3\xbb\xf4K\x97\xc4\xe8\x87\xea\x0f\xa5QY}\
+]\x85\x00tH\xffe\xd0\x02\xad\xa0L\xaeB\xd2}\
+^\xe3si\xf8a\xdc&\xae\xf3\xf6wO=|\x86\
+\xc5\xc5\xf3\xfe\x8e7\x10N\xa0\xa9\x9e\xcaS\x87\x08\x8b\
+\xbf\x0c\xd1/\x9c\xc6\x8a3\x14\xefXO\xe3\xd1}\x80\
+\xf6\x11\xa9\x85\xcb\x96\xc9A1\xb1\xdeY5i\x02\xe8\
+\xd6\xb8\xa6\xa4\x82\x09\x97O\x22$D\xe1\xf6_/\xc4\
+l6\x0b\xb7\x0d\xa0\xa7\xd3\x05\xf3s\x99<\x95\xac\xbf\
+\xcb$\xa4'\xff\xf8\x1b\xc1\xc6\xab\xfb\xbb\x9dz\x9d\x08\
+\xef\xdf\xee\x9e\xc5Ewp\x7f\xde\xce\x7f\xbe\xff\xd6{\
+@\x8d\xb18\x8d\xe8\x07\xa4o\xff\xe0\xc4+q\x97\x8e\
+J\xf1/\xfdN\xa2+\xf4\xbe\xb4\x81\xfc\x9bn\xf2r\
+/Fu!o\xd7N6>\xf7\xa2\xfb\xd3\xb4\xaa\xd3\
+\x89]*(&\x89b2\xa3\x22Q\xa5\x83\x19\xd7\xcf\
+\x93\x0f<\xbe\xdckF\xc9\xbd\xb4\xdd`\xf8y\x14\xdf\
+\xd5\x93KC\x85\xf5\xa4\x0c\xbaK\xa3\xd3\xe1O\xdbj\
+\xfb\xa1\xe9\xae\x9fO\xb9\xeb\xec\xd9\xa2\xbd@\x83~\xdf\
+\xd7oR\x01\x15\xe9$s\xfa\x9c\xd9\xc6E(n\xfe\
+\xc6Lv\x11\x1d\xd9\xb2]\xb5u\xdb\xa3wu\xa2^\
+\xff\x8f\x1e\x9b\x8ce@\x7f\x8e\x1f9\xa2\xb5c\x93\x82\
+\xd9$\x5cg\x15H\x1cN\x07Y\xf3\xe6q\xff\xef\x97\
+\x09\x93\xf1L\x1a\x11 \xbe\xa0\x1fZi\xe4c\xb8\x04\
+\x8b\x91t\x94\xff\x8eh\x8c2\xf8\xfa\xfe\xbe\xfc\x8c\xff\
+\x17\xec\xdd\xbd\xf3\xedm\xaf\xec\x00\xce\x19X\x05\xe4e\
+\x05R7n-xq\xdc\x84\xc9\xd3\x82J\xe6\xdb\xdf\
+\xfa\xbe\xc9\xa7k\xf6}&\xc0\xbd\x98\xd4\xeb\xf4\xd6@\
+\xb9\xeb\x0a|\xf9\xba\xfex\x14BRVRB\xee\xb6\
+\xed\x9c<\xfa/\xeaj\xeb\x89\x1a\x18\xc5\x98\x89\xa9\x5c\
+sc\xb6LJ\x19'\xbc3\x15@\xe3}e\xee\x0e\
+\x02\xe4\xcf\xa7\x83\xf1\xdc\xf4\xa5o\xaf\x8c\x0c\xf7t\x92\
+\xfa\xda\xea\xca\xdb\xe6\xa7\xde\xd3\xd0P\xfb\x19\x9a\x01\xe8\
+\xc53\x10bG$\x8e\xbdf\xe3\x96\xfd9a\x03\xc2\
+#\x83v\xd1\x81\xeeu\xd4\x85w\xd4\x95uf\x08\x08\
+D\x13\xa8p\xbc =1\x05\xbd^\x0dI:\xa2\x0d\
+\xc8\xbf\xabCc\xb0w\x04\x16\xa2\xfd\xb4\xbei\x82\xc8\
+\x22\xa5\xaa\xae]\xfd\x87\x15o\xbe\xf6\xd2&\xa0\x04\x9f\
+)\xcf`\xa7\x12\xb5\xd5\xd7\xd6\xb4\xa8\xaaCN\xfe\xd9\
+\xd5SE\x87\xb6\xf6O\x01\x22\xa8\xbf\xe8\xefK\x06\xa7\
+\xfd\xa9a\xff\xde]\x1f\xacy\xfe\xb1\x0d@1\xae\xf8\
+\xbf\x11\xc1\x14@\x05Z\x0b\xff\xfdymBb\xf2\xa0\
+\xc4\xd1\xe3\x92\xfbR\xc8\x1f\x03.\x94\x0a7\xe2L\xf1\
+\x97'\x17/\xb8\xfeY)\x9d'\x80\xc6@4\xed\x9c\
+K\x86\x03h\xde\xfb\xd1\xdb\xe5i\x19\xd3\x13\x87\x0d\x1f\
+\x19\xdf'R\xfe\x08p!V~Eyi\xd9\x92\x85\
+\xf3\x9fn\xa8?\x7f\x08\xa8&\xc8 \xd3\x9e\x02\x00\xd8\
+\x80\xa6\xbc\xdc\xed\xdf\xa6O\x99\x9e8th|\x5co\
+\x0bz\x11\xbd\x8f\xca\x8a\xd2\xb2%\xf7g?\xfd]i\
+\xf1'@9\xae\xb9\xff@\xe8H\x01$\xd0\x22\xa5\xb3\
+>\xf7\x9d\xd7\x8a\x93S\xd2\x87\x5c:bL\xc2\x85\xd8\
+b.\x14\x94\x9c9\xfd\xf5\x83\xf7^\xb7\xb2\xfc\xec\x99\
+\x8f\x81\xb3\x04\x18\xf7\x8d\xe8H\x01\xc0\xa5\x04@}\xde\
+\xfbo\x15[C\xc3\x187>#\xc9dR:\x93\xf6\
+\x22\xfeO\x90Rr\xe8\xc0G\x05\x0f/\xbc\xe1\xc5\xda\
+\xf3\xd5\x9f\xa2U~[G\xe9:[\x89\x12\xf8\x018\
+\x7f\xe4`~\xe9\x7fO\x1d+\x9f\x90\x9a9:<\x22\
+*\xa2\x072_D/\xa1\xb9\xa9\xa1q\xc3\xfag^\
+]\xfd\xcc\x92\x8dv\xbb\xed0Z\xb7\xdfn\xcb\xd7\xd1\
+\x95V,\xd1\xf64\xd6\x94\x95\x16\x95\xefx\xe3\xe5\xe3\
+\x91Q\xd1JBbR\x5cH\xa0#A/\xa2\xcf\xa1\
+:\x9d\xf6\x83\x9f\xe5\x1dzt\xf1M\x7f=X\xf0a\
+.P\x88f\xf0\x05\x1d\xf3}\xd1\xdd\xc1<\x04\x88\x01\
+F\xc7\xc4\x0cK\xbd\x7f\xc9S\xf3\xb2ffO\x1b\x10\
+\x1e\x19\xde\xcd\xf7]D\x17\xe0p\xd8\xed\xc7\x0e}R\
+\xb8!\xe7\xe9wO\x1e?r\x148\x0dT\xa05\xd0\
+.\x85\xa6zb\xcd\x99\x80\xfe@,024t\xc0\
+e\xb7\xdd\xb1(k\xfa\xcc\xec\xf4\xcb\x92\xd3\x12C\xcc\
+!\x9dY\xd4\x1f\x10\xfa\xe6\x92\x8b\xf0@UU\xb5\xac\
+\xb4\xa8\xec\xf0\xc1\xfc/\xde|}\xdd\xa7e%E'\
+\xd1\x82;\x15@\x13]h\xf5F\xf4F)\xeb\x8a0\
+\x10\x18\x0a\xc4\xf5\xef\x1f\x16?{\xee\xad\xc9i\x93\xa6\
+%\xc6\x8f\x18\x137h\xf0\x90\xa8\xf0\x88\xc8\x88~\xd6\
+0\xab\xd9\xac(\xfaa\x8c\xe0\x9ag\xd7'\x06\x02|\
+\x0d\xdc8\xdb\xd6\x19\xb4\xbbB\xa4\x834\xc6\x8d*\xdd\
+\x85/\xff@\xf2\x18\xf9\xf9\xd2\xaa\xaaS\xdaZ[l\
+\xad\xad\xcd\x0d\xdfWW6\x9c-\xf9\xa6\xea\xab\xd3_\
+\x14}\xb8{\xcb\x89\xaas\xe5g\xd1\x8c\xbbr\xe0{\
+4\xbb,\xc0:\xbb\xce\xa37\x9b\x99@\x1b\x1aB\x81\
+H4\x85\x88r]\xc3\x5c\xf7\xcd\xf4\xd1\x96\xf4\x0b\x08\
+N4\x03\xce\x8e\x16\xbd\xab\x03j]\xd7:\xb4\xc5\x1c\
+m\xb4\xbb\x8d\xa9\xf3\xe8\xab~V\xa0\xf5\x0c\x164\xa5\
+\xd0\xaf\xe6>\xe4y\xa1@\xa2Un\x1b\x9a\x12\xd8\xd0\
+Z\xb9\x83\x1eN@\x06\xc2\xff\x00\x01#\xce\x04\x08\xed\
+\x04\x19\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x11\x5c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00\x11\x0eIDATh\x81\xbd\
+ZwXU\xd7\xb2\xff\xcd>\x9bC9\x14E\x8a\x85\
+\x8e\xd8@E\xc1\xde\xb0\x01\x8a&\x9ahb\xae-\x8a\
+5\xc6r\x8d&\xd6hD\x8c\x0d\xac\xd8[^,7\
+\xc6$6\xd4\xa8\xd1\xabb\xac\x01\xc4^\x00;\x0a\x82\
+J;u\xefy\x7f\x9c\x02\xe8A\xfd\x12\xdf\x1b\xbe\xf9\
+\xbe\xbd\xd7\x9e\xb5\xd6of\xd6\x9a5\xb3\x0e\x84w\xa0\
+\xbe}g)cc\xa3\x1cEQA\xef\x22\xffO\xc9\
+`\x9089\xf9b\xc9\x8a\x15\xe3\xb4o\x93\xad\x14\xd0\
+\xe9\xd3\xd7|k\xd5\xaa1Li\xa3\xec&\x08B\xb0\
+ \x08\xb6\xcc\x95\xcb\xbfO\x22\x02\xcb2\xeb$\xc9p\
+K2\x18~\x7f\x9aW\xb0\xa1Y\xb3\x80\x9bVe_\
+m\xd8\xbcy\xb3]\xfb\xf6\x1f~\xa7R\xa9\xc6\x11`\
+\xf7N3\xb2\xb5\x91\xde'\xb1\xa1T]\xba\xf1\xf4\xe9\
+\xb3_\x0f\x18\xd0\xbd\xb0\xfc\x97\x0a\xd3\xee\xdd{\xdc\xad\
+i\x93\xf0\xbd\xa2h\xd3\xaa\xe2\x00f1~\xa5\x8d+\
+\xf9\xf6\xa6~\x7f\x9f$\xd9p5=\xfdRLLL\
+\x9b{\xe66\xc1\xfc\x90\x98\x98h\x1f\x1a\x1a\xb6O!\
+\xda\xb4b\xd3\x94el\xfe{\xb5\xad\xb2oo\xea\xf7\
+\xf7Y\x10\xc4\xe0F\x8d\x1a\x1d\xda\xb0a\xa7\xebk\x0a\
+\xc4\xc4\xf4\x8f\xb3\xb1Q\xb6|/\xa6\x02\xc0\x0c\x1c9\
+x\x14q\xd3\xe3PZ\xaa~_\xc3B\x14m\xeau\
+\xe8\xd0i\x19L\xee%\x00\xd8\xb6m_PDD\xd7\
+\xcb$\xc0\xf6\x1f\x8dn^Q\x0c\xacZ\xba\x06\xdb\xb7\
+\xee\x83Bi\x07W\x07\xe6M?o\xa4\xaa\xaeU\xff\
+)~\xc08\x85\x9c\x96\x96\xde\xa6{\xf7\x96g\x05\x00\
+\x08i\xd4h8\x08\xb6\xccF\xcb\x95g\xb3\xff\x98\x01\
+Yff\xb9\xac\xbd\xbc\x0c\xb3IT\x06\xf2\x9f\x15\xf0\
+\xb6\x1fw\x22b\xd1FD\xad\xdd\x0dM\x15/:\x9c\
+|\xb4\xc2\xb8\x92$\xb3,\xc9lm\xce\xb7\xb1\xcc\x10\
+\xfc\xfc|G\x03\x80\x08@\xb4\xb7s\xecV\xd9>c\
+\x00i\xa9\x97x\xf9\xc2$d\xdd\xce\x84\x87\xa7\x1b\xc7\
+~1\x04\xd1=\xa2-\x01 ;\xfb.g\xa4_\x86\
+J\xa5\xc2\xde=\x87\xf0\xbc\xe09\x09\x04\xe8\x0a\x1e\xc1\
+\xc1\xa5\x0a\x0c\xea\x22\xd8;80\xcca\x98\x88\xd7\xac\
+^Mz\x83\x9e\xc7\x8e\x1d\x0f\x81\x08/_\x16b\xe7\
+\x8f?\xf3\xed[\xb7\xe0\xe1\xe9\x89O\x07\xf6%o\x1f\
+\xefJ\xbd`o\xaf\x8a\x04`'\x86\x86\x86:\xda\xdb\
+9\xd4\xae,Ndef\xf3\xb8\xd1_S`\xcc\x00\
+\x84\xf7\x19\x8f\xe7Y\xb70w\xe6b\xd8(Et\xe8\
+\x14\x813\xa7\xcf\xf1\xca%I\xb8\x9f\xf5\x80\x06\xc4\x0e\
+\xe4\x09\x93\xc7\xc2\xcf\xd7\x0b{v\xed\xe5\xe5\xf3\xbe!\
+\x9dN\x82B\xa9@\xdb\x8em\xc82\x0735h\x10\
+\xc2\x1a\xad\x1a\x04\xa0\xb0\xb0\x88\x87\xf4\x1bF\x85\x823\
+U\x0b\x0e\xc7\x95\x8c;8\xf4\xf1\x10\xac\xde\xb6\x9ak\
+\xd7\x09\xb2\x1a\xa0\x95J\xa5\xe7\x94Y\xdf\xd7\xa4Q\xa3\
+&\xf8\xcd\x98\xb9 \x8b\xc1\xaf\x0b20\x7f\xeebd\
+\x14)\x10>\xe4\x1b\x18d@!\x007\x0f\xfc\x84\xa7\
+\xfb\xb7\xc0\xde\xd9\x91\x1b\x875\xa1n=\x22Y!\x10\
+\x1a6\x0e\xa1r]q.\xe5,\xfe8|\x8c\xbd\xfd\
+|\xc8\xb3\xa6;\xa2\xa2\xa3-\x91\x95@\x0c0\x98\x99\
+6\xad\xfd\x81\x7f=\x91F\x9d\xbe]\x09\x89\x15 \x02\
+\xfeZ\xf7=j\x94>\xe4\xc4\xb5K*=a\xf6\x1d\
+\xd8\xddJ$\x82\xc0\x5c\x0e\xbc9\xbc\x9b(\xf7i\x1e\
+\x9c\x02[B\x92\x00Y6\xb2\xb3wm\xe4\x90\x80M\
+\xdb7\xc0\xde\xc1\xce\xdc\xcbBG\x8e\x1ca\xff\x00\x7f\
+\x22\x85\x02P\x08\xd4\xadg4\xe2\xe7\xcc\xe3\xc8\xe8h\
+2\xbb\x81\xc1\xc4\xa6\x89n\xdc\xb8\x85Z\xcd#\xc0\xac\
+\x80d\x00\x88\x80\x9a\xad\xa3p{\xcd\xb7d\xb1\xc6\xab\
+\xf8\x08\x10\x99\x05\xc1\xfc\xdd\xc2\x5c\xf1=\xb0v\x00?\
+MO\x81 0\x98\x19\xb2\xcc\xc8I=\x81\xe0\xc6\xc1\
+\xb0\xb3\xb7#\xe3\xb26r\xc1\xf3\x17(Uk\xd0\xb9\
+K$\x05\x04\xd4\x06\xb3\x11L577\xb0\x04\xacO\
+Z\xc72\xc023\xd4Z-\xf2\xf3\x0b\xf0\xe0\xfeC\
+\x16@Tx\xff\x96\x05\xab$\x03/\xb2o\xa2\x86W\
+M~\x15\x8f\xe5\xdd\xa4\x94\x88r/\xd6\xa8\xff\xe7\x9f\
+\xe1\xe4\xe1\xe1H\x99\xf3%\xaa6\x08\xc7\x8b\xbb\xd7P\
+t-\x15\xb3~X\x09\xb6,\x04#eee\xc1\xc3\
+\xc3\x03\xb5\xbc\xbc-\xd6\x92eF\xf2\xde\x03|\xf3\xca\
+m\xca8\x7f\x99\xaf]\xbde\x02@\xb0U*ak\
+\xab$\x07\x95\x13\xe7\x1e:BWTNp\xae\xdf\x02\
+/\xef\xde@\xd6\x9e\xad\x98\x9f8\x9b\xde\x84\xadL\x81\
+7\x0889;\xd3\xda\xed\x1b\xf0\xdb\x8e_\xb0{\xe7\
+N4k\xdd\x12\xf7\xb4^\x9c\x97\xfb\x14\x81\xb5\x03\x89\
+\x09P\x97\x96B\xb4\xb1\xe1&M\xc3\xc8<\x183P\
+\x5c\x5c\xccG\x0f\x1d#7\x8f\xea\xd8\xb1w;\xb4Z\
+-\xb9\xbb\xbbY\xc66\xcf\x9bz\xf1\x22]NM\x85\
+\xc3\xfdk\x9c\x91\xbc\x0b\xc1\xa1\x0di\xe1\xd28\x84\xb7\
+\x08{k\x12\x22j\xf0f\x0f\x00\x80\xa3\x93\x13\x06\x0c\
+\x1f\x8c\xb4\xf4\xcb\xe8?l\x10\x9c\x9dU4i\xec\x04\
+(\x14\x0a\x84\xb7h\x8e\x1b7o\xb3\xca\xc1\x9e\x82\xea\
+\x04\x01 h\xd4\x1a^\xbbj\x1d\xfe<y\x0a\x91\xdd\
+#9v\xe4\x10\x02\x80\x1b7\xae\xb1\xbd\x83\x03\xa9T\
+\x0e\xa6\xe5E\xb8\x94\x96\xc6\x0b\xe7&\xd0\xa2\xa4\x04\xb6\
+\xb3\xb7\xc3\xacofa\xc9\xfa\xa5\xe6x\xfbFlz\
+\x98R\x89w9<\x00\x82\x0c\x82\xcc2\x9c\x5c\x5c0\
+\x7fi\x02\x92\x96'!#=\x83\x1b5nD\x81A\
+A\x90\x198\xf3\xe7\x19\x8c\x8c\x1d\x8d:\xf5\xea\xd2\xbf\
+\xbf\x9eD\x92$\x13@(.)\xe6eK\x96a\xdd\
+\x9aU\x90M\xa0.\xa5\xa5\xf3\xf7\xb3\xe7#!i\x09\
+j\xf9x\x91\xccLz\x96\x8c\xc0\x89p\xf4\xc8a\xd6\
+h4\xd6\xf1T\xd8\x03oq\x93\x99\x8ck\xd7\x18;\
+\xaaTu\xc5\xbc\x84E\x986a\x12M\x9e1\x15\x1e\
+\xd5=\xb1r\xc9J&\x85\x82\x96\xac\x5cB...\
+\xb8p\xee\x82%\x9dS98\xd2\xcc\xd9\xb3\xe0\xeb\xe7\
+\x0ff #\xfd\x12\xc7\xcf\x8a\xc7\xa2\x15\x09T\xa3f\
+\xf52p\x90\x8dx\x18h\x10\x1c\x02\x1b\xa5\xadU|\
+\xe66\x93\x02lrXye\xca\xbd\x99\xc2\x16\xb3\x04\
+f\x86Ao\x80F\xad\x86\x9b\xbb;\x7f>|\x18\xbe\
+\xf8l(\xb9\xd5\xa8\xce\xd3\xbe\x9f\x83FM\x1a\x96)\
++3\x98e\xcb2\x08\x0c\xaa\x0b\x00\xb8\x92\x91\xc1\xf1\
+3\xe7b\xc1\x8a\x04x\xf9x\xa3\xa8\xa8\x88U*'\
+\x02\x00\x99e2\x1f\xd9\xd5\xdc\xdc\xa8\xa4\xa4\x18*G\
+G+\xf8\xca+P\x0e\xe7\xab:\xe6\xe7\xe7\xe1\xfa\xd5\
++\xdc\xb6]G2{.)q9\xf6\xee\xfa\x8d\x9b\
+4o\x06\x1f_?\x8a\xfc\xa0'gg\xdf&\xc9\xa0\
+5\xaem\x98]\xcd\x96g3]\xcd\xb8\xccsf\xcc\
+\xc1\x82e\x8b\xe1\xe3\xebC``\xe3\xea\xf5ptt\
+\xe6\x96m[\x82e\x99\x98\x01I\x96\xb1m\xeb6\xce\
+\xcf\xcb\xa31\xe3\xc7C\xa9TZ\xf5\x84\x08\x8d\x15\xb5\
+\xcaQ\xd5*\xd5\x10\xd2\xa8\x09d\xd3\xa6\x03\x03\xc5\xa5\
+\x1a\x1e1\xfeK\xf4\xf9\xd7\xa7d\xf2\x0e\x15\xbd,\xc4\
+\xb4\x89\x938v4\xc8\xc9\xc9\x99\x7f\x5c\xb7\x852.\
+\xa6\xb2^\xa7\xa3g\x8fs\xb9\xef\xa0\xcf\xe0\xe8\xe2B\
+q3\xe2h^\xe2B\xf8\xfa\xfb\x01\x00\xee\xde\xcd\xc6\
+\xe5\xd4+\x90d\x09=?\xee\x05\x82`L\x0ee\x86\
+\x8dBI\xf6\xf6N,\x90@V1\xeaM\x1e\x90Q\
+y\xcd\x05A\x80\xb3K\x152\x9f\x1e\xa5\xa5j\xe4\xe6\
+\xe6c\xca\xb7\xd3\x88\x99!\x19$\x88\xa2\x08'gg\
+\xccMXDS\xc6N\xe4\xbbw\xee\xc3\xadE\x14j\
+\xc7\xce&\x10#\xf7j*M\x1f7\x15..N\x88\
+[\xbe\x90\xfd\x03\x03,\xde\xf4\xf1\xf5G\xd2\x0f\xeb0\
+jp,JJJH\x012\xe2Q(\xf0\xc9\xbf\xfa\
+\xb1$\xc9\x10D\x11r9L\xe51\x8af\xd4o\xda\
+(\x96SP\x96q\xf2x\x0aw\xe8\x14\x01\x19@\xde\
+\xd3\xa7\xb8x\xfe\x1c\xba\xf7\xfc\x10\x0c@!\x8a\xc8\xcd\
+}N\xc1\xb1\xdf\xc0\xb7m\x0ct\x06c\xc7Za\x11\
+\xa8\xd9\xbc#.\xce\x1f\x03\x12\x88d\x00TnBA\
+\x14\xa9g\xef\xde\xbcb~\x22\x9e\xe5\xe4\xe2\xfa\xe5\xab\
+\x5c/$\x98\x88\x04\x12E\xa1\x02\xb8\xf28\x0d0\x85\
+Q\x19\x04f\x82\xcc\x80\xccF\x0bT`\x06R\xcf\x9e\
+\xe7\xdc\x87\x0fq\xec\xc0!j\xdb\xa1-\x81\x01w\x8f\
+\xea\xe8\xd6\xe3CKX\xfb\xf3\xe4i68{\xc0\xab\
+u\x0c\xb4z\xc0``\xe8\xf52tz\x86[\xdd&\
+po\x15\x8d\xdf\xf7$s\x85\xfa\x81\x01\xbd^\x8f=\
+;vQv\xa1\x02\x0a\xff\xe6\x984b<\xb23\xb3\
+\x8ca\xdb\xc2F\x1c\xb2\xa9\x8f\xd9#&\x0fp9\xcd\
+\x8c#K\x92\x04\xb5Z\x0d\x95\xa3#~\xdf\x97\xcc\xcb\
+\x17\xad\xa2\xaa\xf5\x9b\xe3\xe5\xb5sH\xde\xf5+\x1a\x86\
+7\x85Z]\x0a\xbdV\xcf\xa5\xa5%\xd0\xebtt\xee\
+\xd4\x19T\xf1\x0a\x84\xc1\x00\x18d@\x92dc\xfe\xc4\
+\x04f\x01Uj\x07\xe3\xe0\xf6\xe5t&\xe5,$Y\
+\x86$\x19\x8cKB\x92P\xa8\xd6\xa1\xdb\xfa\xff\x80Y\
+\x81s\xcb\xa7P\xca\xf1\x93\xf0\x0b\x08\xb0\xba,\xcca\
+\xd6\xa2\x80\xb5\xe5\xb3\x7fw2\xdf\xcd\xce\xc6\xd8\x89\xe3\
+\xe9\xd0\xbe\x83T\x7f\xf08x\xb5\xf9\x00\x0fR\x0e\x22\
+y\xe7r\xbc|Qb\xcc\xd4@\xa4\x10\x04\x88J\x11\
+\xb2\x01\xa4Q\xe7Y6\xa1,\x1bM-\x13`\x80\x0c\
+Ma\x01Zul\x87)sfV\x98\xab ?\x9f\
+\x07\xf4\xfc\x18\xf9\xd7\xcf\x93\x8d\xab/J\x1eg\xc3\xb3\
+G\xebw:\x9f*M\xe6\x22c\xa2\xa9\xa8\xb0\x10\x0c\
+\xc0\xcd\xcd\x0dY\xd7SQ3\xac3\x0a33\x10\x12\
+\xde\x04\xa3&\x8d3\x0a\x96\xdbU\xf7\xef\xde\xe3Q\x03\
+\x86\x92:7\x1b6\xd5\xfcL\x063e\xb1Z\x0d\x1e\
+\x9d<\x88\xdec\x06\xb1\xccLD\xc6\xb0\x91\xfb\xf4\x09\
+N\x9f8\x05\xf7\xea\xd5\x91\xba`2\x0c:=Zu\
+\x8d@\xfb.\x9dq\xfb\xe6\x0d\x0e\xacS\x8f\xdet\xe5\
+dJ%\xe85V*mQ\xcd\xcd\x1d\x0c v\xec\
+hvxr\x87\xff\x18\xd6\x09\x05\xa7\x0f\xc2?(\xa0\
+\xec\xe8cc*\xcd\x00\xbc}}\xa9ix(\xce/\
+\x1e\x87\x17w.\x82L\xb1\xa68'\x13\xe9\xcb&B\
+QR\x00\x01\xa0\xbbYY\xbcm\xf3\x16L\xfar<\
+\xd6\xaf\xde\x88Z\xde~\xd8\xf0\xf36,\xdb\xba\x11\x0d\
+\xc2\x9b`Z\xfc\x1c(D\x11\x99\x99\x99d\xac\xc1_\
+\xc7g.a*\x9c\xc4\xd6\xa8\xa8\xf0%\xbbyx\xd0\
+\x92-\x1b0m\xec\xbf1z\xd2D^\x95\xb0\x88|\
+\x02\xfd\xd1\xb2m\xdb2A\x06\xb6o\xd9\x02\xc1F\x81\
+\xcf\xfa\xf5\xc6\xcf+&C#\x8b \x85\x08Y]\x82\
+v\x91\x11\x90\xfd=8q\xf6|j\x17\xd5\x89:\xf7\
+\xe8\xc1}\x07\x0c Q\x14A\xa6\xa0d\xef\xa0b\x1d\
+K\x16\x83w\x8d\x8e\xb1x\xf1-\x1e\xa8\x9cw\xff\xb2\
+\xd3\xa81\x08\xb2@\x10\x14\x0a\x9a\x16\x1f\x8f\x1d\x9b6\
+\xe1\xfa\x95\xab\xa6[\x02\xc6\xa6\xb5kq\xe7V&O\
+\x8f\x8f\xc7G\xfd\xfbc\xcb\x81=\x182j0\x9a\x86\
+\xd5\xe3\x1f\x92w\xc1;\xd0\x179O\x9fP\xffQ\xc3\
+8/\xf71\xea\x07\xd7\x83Ba\x89\xe2\x16\x96d\x89\
+\xf9-\x98\xcclxM\x01+\x1d\xfb\x0f\x1eN\xe6I\
+@\xc6lT\xe5\xe4\x8c\xe9\xf3\xe6#i\xf1\x02\xe4<\
+~\x8c5K\x96!\xf7I\x1e\xa6\xce\x99M\xa2h\x03\
+\x06\xa0\xb4\xb5\x83w\x80\x1ft\x06-\xcd\x9b5\x0b%\
+\xa5Z\x9e\xb7,\x91?\x19<\x80z~\xda\x0f3'\
+\x8eGIIq\xc5\xab\x19\xa3\xb5\xe9]\xafW\xca<\
+\x80r\xe0Q\x09\x1b5\xb0tvu\xf7\xc0\xb8\xa93\
+1y\xc4\x08\x18t\x12\x7f5c\x1a\x04AQ\xee\xee\
+\x86\x91\x95y\x07\x0f\xee=\xc4\xd0Q\xa3\xd0\x7f\xc8`\
+Z8g&\xa95\x1a\xb4\xe9\xd0\x11=>\xee\x87\xd9\
+_MDiii\xf99\xc8\xbc`\xde\x85a\x00\x04\
+\xad5\xf0\xafy\x83M\x5c\xf1=\xe5\xf81x\xf9\x05\
+p\xc1\xb3'\xc6\xb0\xc9F..*\xc4\xbc\x99\xd3\xf0\
+\xdf\xc3\x87\xb9qX\x18j\xd7\xad\x87#\x07\xf7\xe3\xc2\
+\x99T>\xb0g7\x98\x19\xed:w\xa1\xa8\x0fz#\
+n\xca$h\xd4\x1ac\xc8EY\x0do\x15\x13Wl\
+\xaf\xb8\x07*\x11*\x1b\x80!Kz\xc8l<\x9cV\
+'&rqQ\x09\xe2\x96.\xa5\xc0\xba\x0d\xb0~y\
+\x22\x18@FZ\x1a&\x8d\x19\xc3\x1d:G\xf2\xe0\x91\
+_\x90$K\x00\x80\xa8\x1e\xbd0=~.z}\xd2\
+\xcf\xb2\xeb#\xa2\xa3\xd1\xbek7\x8e\x9f:\x99u:\
+\x1dk5j\xd6\xab\xd5\xd0\xa85\x96\xba\xa3\x02\xa6W\
+\xb0\x02\xe5\xcf\x81W\xb3\xb9r\xf1\xfdBJ\x0ao^\
+\x91D9\xf7\x1fb\xf6\xd8\xf1\xec\x1d\xe0O\xd5}|\
+h\xc4\x84\x09`\x00}\x06\x0d\xa2o\xc7\x8d\xc1\xc4A\
+\x83\xe1\xe8\xea\xcas\x13\x96\x90\xab[5\xa4\x9e\xbf\x00\
+\x06\x99\xb2{Fhx32\x87\x5c\x00P\xabK\x11\
+\x1c\x1aJ\xa5%%\xfc\xd5\xd0!x\xf2 \x874\x1a\
+\x0d\x06E\xc5\xa0\xcf\x90\x81\xe83\xf8s\xbc\x8dD\xcb\
+\xd3\xab\x91\xca\xa4i\xf6\xed\xdb\x88\x9f\xfe\x1dyG\x0e\
+D\xf0'\xe1(y\x94I\x97\x7fKB\xab\x8e\x11\xb8\
+\x92\x9e\x86\x13G\xfe\xe0\x8c\x8b\x7f\xc1\xc7\xc7\x9b\x9e\xe7\
+\xbe\xe4\x99\xdf\xce\xa4*\xae\xd5\xca\x96\x9a\xc92Z\xad\
+\x0e?m\xdd\xcc\x03cGY\xc2\xa4N\xa7\xe3\xe7\x05\
+\xcf\xa1\xb4\xb5\xc7\xa3gjj0z1\x1c}\xea\xa2\
+\xe0\xe6_\xd8\xb1i.<kyq\xdb.]\xc8\xda\
+/\x11\xe6\xe77\x97\x94\x0c\x1c\xd8\xb3\x9f\xddZDR\
+P\xafa\xd0K\x06\xb8\x06\x85@P\x08X=\x7f!\
+B[\xb5\xe0\xf6QQ4l\xec8(m\x95\x00\x88\
+\xcci\xa6y\xcf\x00\x02d\x06l\x94\xb6\x180d$\
+\x19\x0dc\xb4\x8e\x93\x93\x0b\xd5\x0fn\x88\xed\x1b6\xc1\
+\xbf\xe7\xe7po\xd8\x12zIB\xf5\xf0\x8e(\xcd\xb9\
+\x8b#\xfb\x92\xd1\xb6K\x17S-\x82\x0a9\x10\xc3X\
+\xd4\x8b\x80\xd6<\xa6\x95\x13\x9b\xf1\xa2\xe09\xa9\xdc\xea\
+\xc2\xa0\xd7\x83e\x03d\x00\xf6\x9e^\xa8\xea\xe9\x8e\x19\
+\x8b\x16V\xb8J4W7,\x1b\xdf\x0d\x06\x03 \x1b\
+\xcbP\x8b\x9c\xe9Y\xd2\xebq\xf3\xda\x15>w*\x05\
+\x99\xd7o\x90_\xc3n\x90\x0c\x06\xb0,\xc1\xc02l\
+\x9c\x5c\xa0\xb9\xaf\xb7\xdc\x0bY\xbd\x9d0\x18 \xa6\x9d\
+=\xaf\x96\x0d\xb2D\x82 \xbe.A\xa8[\xbf>_\
+\xdf\x7f\x94|:\xf7\x81\xc4\xc6s \xf7\xc21\xd4\xae\
+W\xdfd\x11\xc6\x853\xa7\xd0\xacU;\x80\x04\x8b\x99\
+\xce\x9c8\x815\xf3\x17\xa2\xb4\xa8\x10%\x05/xb\
+\xdc\x1c\xd2\xeb\xf5H=\xf3'\x9fOI\xa1K\x7f\xa5\
+\xc2\xdb\xcf\x1f\xcd\xdbu@\xdbN\x9dp\xe1\xf8/p\
+k\xd4\x06\xb2\xc2\x16\xba\xe2\x17xtr\x0f>\xea\xd9\
+\xc5\x5c\x95\xbe\x8e\x8c\xc0\x0f\xb3o\x15\x11\x00\xd5\xb1s\
+O\xae\xab\x1c]\xac\xdeek5j\xcc\x1e;\x1e9\
+\xcf\xd5pn\xd0\x12\xc5\xf7o\x02\xcf\xee\xf1\xdc\xd5+\
+Q\xd3\xcb\x8br\x1e=\xc4\xe4/\x86c\xf0\xc8\x91\xdc\
+5\xa67\x01\x80N\xab\xc1\xd0^\x1f\xa1f\xcc\x08\xd8\
+\xd7\xac\x8d\xac\xad\xf3P\xcd\x8e\xb9\xb0\xb0\x98\x1a5o\
+\xcea\xad[\xa3qx\x189\xb98\x83@\xd0\xe9\xb4\
+X8e\x0a_\xbfr\x93\xec<\xfdP\xfc8\x0b\x0d\
+\xc3B\xf9\x9b\xf88\xb2Q*\xad\xc1\x82N\xa7)\xea\
+\xde\xde\xc7\x9f\x00\x08;\x93/m\xf7\xf5\xab\xf3\xa9U\
+I\x00:\x9d\x0e\xa7~?\xcc\xf7ng\x92\xabgu\
+\x8e\xe8\x16I.U\xab\x98,A\xb8y\xed\x0a\xd7i\
+\x10B\xe6\x02\xfe\xe9\xe3G\x18\xdd\x7f\x00\xda&\x1c\x81\
+\xc2F\xc4\x9d]I\xa8+\x16\xf0\xa8\xa9SI\x14\x15\
+\x00\x80\x1d[\xd6\xb3\x9d\xbd=z\x7f:\xd0xx1\
+\xe3jZ\x1a?y\xf8\x18^\xfe~\xa8\x1b\x12BD\
+\x84\xcaR\xd1\x9c\xc7\xf7\x8e\xf7\xeaZ/J\x04 \x9f\
+M9\xba\xd5\xd7/\xa8/3\x09\xd6\x84ml\x94\xe8\
+\xd4\xa3\x87y\x1bY.\xc8a\x02\x5c\xa7~\x08\x95\x95\
+\xa5\x0c\xf7\xea5\xe0\xef\xe3\x8d;\xff\x13\x07{\xef\xfa\
+xv\xf6\x00\x0f\x9d3\x13\x0a\x85\xc22fDdw\
+rpP\xb1y,\x22BH\xd30\x0ai\xda\x14\xaf\
+\x8eo\x8d\xaef\x5c\xdc\x0a@o\xd6\xcf\xe1\xa7\xfd\x97\
+\xf6\xfb\xf8\xd5\xe9X!F\xfd]bF~^\x1e~\
+\xdd\xf2\x03^>\x7f\x816]\xbbr\xab\x8e\x1d\x08\xa0\
+\xf7\xf2{r\xde\xd3\x87\x97>\xe8\x1c\x14\x01\xe0\x85\xd9\
+$\xfa\xa2\xfc\xe7\x97\x9b\xb5\xee\xf8\xb1Ri\xe7\xf0\xcf\
+\xa7 8\xa8T\x08k\xd3\x06\xad;w\x82\xb7\xbf\xff\
+\xfbA\x0e@\xabQ\x17mY;\x7f\xc8\x95\x8c\xf3\xd7\
+\x01\xc0\xe2\xd3\xcc\xcc\xabOd\x89o\x057\x0a\x8fT\
+*m\xed\xdf\xcbl\x00\xde\xe7O\xf8Z\xad\xba\xf8?\
+\xdbV\x8e\xdb\xb2n\xc1^\x98V\xac\xa2\xbc@F\xfa\
+\x99[O\x9f\xdc?\x1f\x10\x14\xd2\xd4\xd9\xc5\xd5\x93\xde\
+X\xcc\xfd\xff\xd2\x93\xc7\x0f\xee\xac_\xf5\xdd\xc8\x1f7\
+$\xec\x02 \x99\xdb\x15\xaf\xc8q\xe6\xed\xabwwm\
+_\xfd\x9b\xa3\x93\xf33\x07\x07'\x0fG'\x97\xaa\x8a\
+\xf2\xbb\x0f\xe6\x84\x17\xa0\xff\xe3\xff\xfd\x90\x0c\x06\xfd\xc3\
+\xfb\x99\xb7\xfe{t\xcf\x9a\xc9_\xf6\x9ep9\xfd\xfc\
+\x05\x94\xdd\xa8\x980TN\x04\xa0j\xb5j\xd5\x03\xbb\
+t\xfb\xa8\xbe\x9b[M7\x12\x04\xabQ\xea}\x93\xcc\
+\xcc\x85/\x9e\x15\x1c?\xfc\xeb\x8dG\x8f\xee\xdd\x01\x90\
+\x8fW\x80\x9b\xe9\x7f\x01\xd1J1+VJ\xa0\xb7\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x068\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00\x05\xeaIDATH\x89\x95\
+\x96ilTU\x14\xc7\xff\xe7\xcd\xf4\xcd\xd6\xe9\xce\x0c\
+3\x9d)\xddL+e\x00)\xd6B\xc5\x0a$EZ\
+\xc0\x80 \x8aQ\x89&\xa2H\x00\x83K\xe2J\xe4\x83\
+\xd1\xa8A\xa3\x10D\x0c(\x8a\x15EM]X\x0bR\
+\xd0\xd2\x96\xa5-\x0a\xb5v_\x06h;3-t\xda\
+\xd7\x99w\x8f\x1f\x86\x19J\x5c\xd0\x93\xdc\xbc\xe4\xe4\xdd\
+\xdf\xb9\xf7\x7f\x96\xf7\x08\xa3\xac\xa5\xa17[g\xd2\x17\
+\x93F\xb2\x08\x01\xc2\xff0I\x22\x86P{\x07\x87F\
+\xf6ff&\x9c\x0d\xfb\x09\x00\xb6l\xd9\x125w\xee\
+\xb2wt\xb2\xbc\x82\x99\xa5\xeb\xb7\x12\x00\xfe\xef\x91\x08\
+\x1c\x0c\x06\xb7\xd7\xd5\xb9\x9f(.\xbeI!\x00hk\
+\xf3m\x96e\xfd\xe37\xda\xeb\xed\xf3\xc2\xeb\xf5!=\
+3\xed\x86q\x14E\xd9\x99\x9a\x1a\xfb UU5\xe6\
+8\x9c\xce:0\xae\x9d\x9c\x88\xc1|\x9dD\xc1`\x90\
+\x1f{\xea5\xf2\x07%~\xfb\xc5G\xc8\x9el\x03\x03\
+L\xf8\x07)\x89\xf8\xd2\xc5\xae|mLL\xec<\x16\
+!8\x038\xb8\xaf\x9c?\xfe\xbe\x1a1\x18\xe2\x0d\xaf\
+\xac\xa6\xda3u|\xa6\xa6\x1e\xceT't\x92`\xef\
+\xe0\x15\x92$\x0d3\x08\x9f\x7f\xbe\x0b\x8b\x17/\xe1\xb7\
+^\xdf\x84\xd6K\xfd\xb8o\xfe\x0c\x14\xce.$\x06@\
+\xcc\xa47\xc6\xcc\xd7<\xber\xdd\x12\x9dN\x9f\xcf!\
+\xfd\xf0\xce\x8eo)s\xf9\xf3\x04k*\x1d\xdb\xfe\x1e\
+O\x9b1\x1d\xb3\x8a\xeeDJ\x9a\x03\x13\xc7gR\x9c\
+,X\xd2j`\xb7\xdbi\xc2\x84\x09\xf8\xe5\xd8\x09\xd4\
+\x90\x93\x92K\x1e\xa6C\xa5\xbb\xb0`N\x01\x85\xaf\xa6\
+(\xc3\x8dZ\x06 \xc2\xd7b\xc0a\x96\xd9]}\x94\
+z\xcf\x9f\xc63\xcb\x97Q\xf6\xf8l\xf8|^\xe8t\
+z\xe8\x0cF\xe8\x8dF|\xf0\xee\x87\xe8]\xe6\xe5\x80\
+\x12\xa0\xce\xf6.\xf6\xf4\x01\x9a\x981\x88\xd7I\x10|\
+\x8d%\x04\xa0\x85\x00\x98C\xf2\x10\x03\xab\xd7\xae\xa0m\
+\xefo\xc5\xedS\xec|\xc1\xed\x86#\xc5\x81\xa8(\x1d\
+d\x9d\x01\xc7\x8f\x96\xc1\xe7\x19\xc0\xabon@bb\
+\x22I\x1a\x09\x87\x0f\x94#\xba\xf3\x02\xb7W\x96\xe2\xc9\
+gW\x92\xe0kIa\x00Zq5R\xd8!I\x1a\
+8\xd3\xd3\x91_\x90G\xcd\x7f4\xe1t\xcdi\xb6%\
+'\xa3\xba\xaa\x069\x13r\xa8\xdf\xe7CKk\x0b\xfb\
+\x87\xfch\xfa\xbd\x99\x8d\xa6h\xcc_r7\x1d>x\
+\x84\x07\xfd~6\x9a\xa2I\x92B\xf5\x22\x04 \x09\x00\
+\x829\xb2zz{X\xb0@{[\x07\x1a\x1b\x1a\xb9\
+\xe2\xe0Q\xec+\xdb\x8b{\xef_Jq\xf1q`f\
+L\xc9\xcd\xa3?\x1a\x9a9J\xd6\xc12\xd6\x82\xf6\xd6\
+vV\x85J\xaa*\xd0\xd2\xda\x12a1\x03Z!p\
+M7\x00\xe6\x9880\x80\xf3\xe7~\xe7;f\xcf\xc2\
+\xc2\xa5\xf7\xd2og\xcf\xf2\xa6\xb7\xdf\xe3\xda\x8e~\x08\
+\xc1\xa8\xaa\xa8\xc2\xd4\x82\xdb\x90\x7f\xfbt\xaa=u\x86\
+\xebk\xeb\x11\x17\x1f\x0b\x86\x04\xadVf\xc1!\x95\x04\
+\x00\xad\x8a\xeb\x03\x90FK}\x17{X\x80`\x8e\x8d\
+\xa5\xbe\xbe>Xl6\xd4\xf9M\x94\xf9\xe8:\xb0`\
+4\xee\xdd\x89\x92\xb1V\x16\x0c\xe4L\x9aD\x9f~\xbc\
+\x9bU\x01\x9eUTDz\x83>\xc2\x8b$9\xec8\
+U}\x92\xd5`\x10?u3E\xb9\x1b`4|\x87\
+\x11e\x84\xdd]\xdd0\xda\xf2\xa0(\x02B\x08Dg\
+L\xc4\x9e]_\xd1\xb8\xcc4\x04\x94\x00\xfbb\x1c\x90\
+\xc78\xa9\xb9\xa9\x19\xd99\xe3#\x87\x0d%\x19\x80\xb8\
+\xda\xb4\xe3].\xeahmc\xf6\xb8\xd9 K4o\
+\xf1\x22\x80\x88\x94\xa1a^\xf3\xec\x06\xc4d\xe5B\x05\
+\xa1\xe3@)\xee_\xb1\x88}\xbe~\xbare\x10\xb7\
+\x8d\x04\xe0\xe9=\x07\x93y\x12\x0b\x01\x02\x85x\x82\x01\
+\xfa\xf9\xe4\x85\x8d\xd1\xe6\xd85tu\xa6uwu\xf0\
+\xaf\xb5\xbfRBb\x02\x0f\xf9\x07\xa9`\xe6L\x94\xed\
+\xd9\xc3V\xab\x95\xaa\x8fU\xc2\xe7\xedg\x9dAF\xbf\
+\xc7\x83u\xeb_F\x5c|\x1c\xf9\x07\xfd\x5cq\xe4\x08\
+\xee*)\x8e\x8c\x0d&`\xf0r\xff6\x899\x14I\
+\x08@e\xc0jw\x12\x13!=+\x8bt\x06#\xb6\
+\xbe\xfb>\xbb&O\xa1\xa9\xd3\x0bp\xd7\xa2\xbb!\x1b\
+\xa3(\xff\xce\x19X\xfb\xd2\x0b\xf4\xc37_#\xa8\xaa\
+`\x00\xaa\x10$8\xc4P\x19`\x01\xa8\xe12\x0d\x07\
+\x09=\x19Be\x08\xc1\xe8\xea\xecdSt4$\x8d\
+\x84\xea\xcaJ\xfe\xe9P9O/,\x84\xa7\xb7\x0f\x81\
+@\x10E\xf3\x16\xd0\xee\x9d;9\x10\x08\x22\x18\x08D\
+\x18\x11\x1e\x00)\x5c\xa6\xe1U\xfe\xe3~\xde\xbd\xbf\x1a\
+\xcf=\xfd\x0a'\x8e\xb1P\x92\xd5\x8a\x8d\xeb7\xb0\xc1\
+`\xc2\xec\xe2\x12RA\x98|k\x1e\x12-V\x18\xcd\
+fNI\xcb\xc0\xda\xb5/\xa2\xec\xe7&\xec\xf9\xac\x94\
+G\xb3\xc4\xdf\xf5\xc1\xc1\x13\xe7p\xd3\xf2\x97p\xc5\xdd\
+J\x15\x07v\xf0\xf2U\xab\xa8\xb0h\x0e@\x84\xee\x8e\
+\x0e\xb0\x00\xac\xb6d\x12\xcc\x18\x1eRP[s\x1a)\
+\xf7\xac&\xa3=\x03\xc7\xbf|\x0b\x0bF\xb1\x84\x00\xb4\
+\xc3\x8a\xe23\x8dr\xa6%\x99\xd0xb\x1f.\xb75\
+\xf0\x9a\x07\x96\xa2\xbe\xf6\x14\x5c\x93o\xe1\xd8\xb8\x04\xda\
+\xbc\xe9#x\x07\x86\xb8\xbb\xb5\x1d\xc3\xca0\x8c\xd1f\
+\xe4N\x9b\x86O\xbe,\xe5\xbe\xa4T\x9a\xe8H\x00\x8f\
+b\x05FF|\xda\xa6\x96\xf3\xe5\x09I\x96\x97\xf9j\
+\xf7=\xb4\xe2Qj\xa8?\xcb\xf1s]\xb0\xdamd\
+OIa\xbd\xc1H#\xca0\xbc\xaa\x0c\xad#\x1dY\
+\x13]\xc8v\xb9\xa8\xa6\xf28\xbbrsi}V\x16\
+{=^NNq\x92`D\xa6]GW\xfb!\x02\
+ \x95\x1dn\xfa.)\xc9>\x17\xffj\x8c\xf6\xa6f\
+\x5c\x1e\x18\xe0\x9c[&\xff\xe3\x87,l\x1e\xcf\xa5\xa3\
+%\x85\xe3fk\x00p\xd0\xcf\xfb3\xb2n\xce3\x99\
+\xcc\xa9\xe1&\xf9\xab\x11b\x13\x12`\xb1\xd9n\x08\xef\
+\xe9qW\x96\xee\xda\xba\xa4\xeed\xc5\xc0\xe87\xe57\
+6~\xb1\xd01.c\x9eV\x96-\xf4\xff\xfeZ\x00\
+0\x82\x81`ogw\xeb\x8f\xcf\xac\x5c\xb8\x1b\x80\x02\
+\x00\x7f\x02\x81&\xf9\xde\x91\xb6\xd2M\x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x005\xca\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00d\x00\x00\x00d\x08\x06\x00\x00\x00p\xe2\x95T\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00 \x00IDATx\x9c\xed\
+\xbdw\x9c\x15\xc5\xd2\xf8\xfd\xed9\xe7l^\xd2\xee\x92\
+s\x92\x05\xc9Q@\x82\x08\x0ab\x16T\x14\xaf\x01Q\
+2\x02\x82\x81$ H\x061\x80\x11\x15\x03\xa8\x5c\x05\
+\x14\x95(Qr\xceA`\xc9\xb0\xc0.\x9b\xcf\x99\xa9\
+\xf7\x8f9aN\xda\x05\xf5>\xbf\xfb|\xde\xa7\xf8\x0c\
+\xb3\xa7\xa7\xbb\xba\xba\xaa\xbb\xba\xaa\xba\xa7\x07\xfe\x0f\xfe\
+\xab@\xfd\xc3\xb8lC\x86\x0c\x89LH\xa8\x1c\x11\x19\
+\x19\xf1O\xe2\xfe\xaf\x84\xf3\xe7\x0f;'M\x9a\x94\x03\
+\xe8\x80\xf1O\xe0\xfc[L\xeb\xd2\xa5KD\x8f\x1e\x83\
+k\x97+W\xee\xce\xe8\xa8\xe8\xdb\x1c\x0eG\x0d\x9bR\
+%\x95\xcd\x16\xaf\x94\xd2\xbc\xe8\x15 \xff\x00\xb5\xe1\xe0\
+?\x8d?\x08\x04\x11D\xc4\xc8\x10C.\xe5\xe6\xe5\x1d\
+s\xe6\xe5n\xbex\xf9\xfc\x8a\xcf?\x7fo\xd3\x07\x1f\
+|\x90\xfdW)\xfa+\x02Q3f|X\xfc\xae\xbb\
+:=\x13\x1f\x1b\xff\x94#\x22\xa2\x06(\xe5e\xca\xff\
+8s\xfe\x0b\xc0\xddfM!\xb9y\xce\xb3\x99Y\xd7\
+\xbf\xd9\xb3g\xcf\x9cG\x1e\xe9p\x8c\x9b\x1c97%\
+\x90\x81\x03G\x15\xe9\xd1\xa3g\xff\x84bE\xfbi\x9a\
+-\xf1f\xca\xfe\xff\x0dD$+\xfdz\xda\x17\xcb\x96\
+\xad|\xb3O\x9f\xc7Os\x83\xdd\xf4F\x05\xa2\xadX\
+\xb1\xadM\xf5j\xd5\xde\x8f\x88\x88\xac\x9e?%\x16\xac\
+\xd6\x11cM\x0bG\x81\x84H\x0b\xc4\x19\xae\xbe\xc0\xb2\
+\x81u[\xeb\x0d\xa4\xa9\xa0:\x0a\xa2;\x1f0\x0c\xd7\
+\xc5\x93\xa7R^i\xd6\xac\xc6\x17\x80\xab\xa0\xfc\xb6\x1b\
+\xc0\xe9\xd8\xb9\xf3\xe4\x90\xca\x95*}l\xb7\xdb\x8b{\
+\x08\x17\x0b\x91J\x81H\xe8v{\xf3Z\x12\xfdd\xa3\
+@\x89%\x8f\x1bI(\xcd\x17N\xa6A\xa0\xc2\xd0\x12\
+\xaa\xac%c(\xba\x82\xca(3E)\x85\x88\xa0P\
+~}A\xac\xe5\x14(\xa5\xc5\x16-Z\xf4\xde\x1e=\
+\xfa\x96\xbfp\xe1\xe4\x8a\xfd\xfb\xf7\xe7\xe5GzA\x02\
+\x89\xdc\xb7\xef\xec\xcc\x12\xc5\x8b\x0fC);\x12\x8e\x15\
+7\xd2]B\xb1\xc7\xfa,\x5cw\x0d7l\xf2\xab'\
+\xbf\xe1(a\xfe\x0eUW\xa8a\xa6\x02h) \xaf\
+)\x1d\x15\x15\x15]\xbfU\xab\xf6\xcd23\x9dKv\
+\xec\xf8#;\x1c\xf5\xf9\x09$b\xcf\x9eSo'%\
+%\xbd \x22^\x0a\xccj|\x04\x05\xb3Y!\x08\x9e\
+Y^,\xe9\xc1\x0d\x117\x0e\xe5\xfd\xdf\x0a\xc1ZD\
+\xb91\x06b\xf0\xd1$\xde_\xc1\x9d'\x94V\x0a\xad\
+\xa9\xfc\xc7W\xa8\xeeb\xcd\x19\x88\xcf\xdabk\xae\x88\
+\xc8\x88JM\x9a4m\x96\x92r\xe4\x87\x83\x07\x0f\xe6\
+\x04U\x1b\x92\x16\x13\xec[\xb6\x1c\x1aZ\xae\x5c\xc5q\
+\x88(\xf1\xcbZ\xd0(\x09\xd5\x03\x09H+\xc8\x14\x0b\
+\xd5+\xf3\xab;?\x1c\x05\xe5\xb9Y\xbc\x7f\xbd>S\
+\x85+\xae^\xbd\xf2Mrr\xa9g\x80 \xa1h\xa1\
+\xca}\xf7\xdd\xb2ve\xcaT\x18%^aP`e\
+\xe6s\x09\xf8\x1d*\xcf\x8d\xe2\x0a\xbc\x87/\xe3t\xba\
+8{\xf6\x1c\x22\x05\xd5\x1f\xaa\x9e\x7f\xcaF\x0f\x85G\
+\x05\xe5\x10\x81\xa2E\x8b=\xba~\xfd\xde\xde\x84\xd0P\
+A\x02y\xf0\xc1\xeeI\x0d\x1b6\x99\xa5\x14\x117V\
+\xe9\xff;\x10\x011\x84\xc1}\x07\xd3\xb9mgf\xbf\
+\xfb>\x22\x12~\xaa\xbb)\xf8'\x02\x0d\xa1;\xa5\x88\
+\xa8\x8a\x15+\x8f\x9e>\xfd\x83\xda\x05\xd5j\xff\xe3\x8f\
+\x03c*T\xa8\xf4\xea?@\xcd\x7f\x14D`\xff\xde\
+\x03\xbc7\xed=\xb6o\xda\x85\x12A0h\xd0\xbc\x01\
+/\xbd2P\xaaT\xad\xa2\xd4\x7f,x\x93\x9fz\xba\
+q\xcf\xf8\xda\xb5\xab\x8b\x93\x93K=\x0ax'y\xbf\
+\x11\xd2\xab\xd7\xc0\xf2e\xca\x94{\x01\xc2\x0f\xe6pU\
+\x09\xa1\x95V\xe0U\x10\xee\x02\xf1\x88ym\xdf\xba\x83\
+\x17\xbb\xf7f\xfb\xa6=\xe6\x84\xae\x14\x0a\x8d\xed\x1bv\
+\xd0\xb3\xdb\xf3\xea\xe8\xd1\xa3\xde\x91\x12X\xd7\xdfQT\
+\x12\xf0\x7f0\xcd\xc1\xcf\xfc\xcb\xfa\xfe.R\xa4h\xc7\
+O?]\xd8\x12\xcb\xc0\xb0\x0a\xc4\xde\xad\xdb\xb3\xcf\xd8\
+\xec\xf6b\xd6!\x9f\x1fCCUJ`Z\x00\x15b\
+y\x98\x1f\x0e0\xf3\x1a\x06A*\xc8\xe9t1~\xd4\
+[8u\x85#\xa9\x0c\x95{\x8e\xe1\x96!\xb3(~\
+O\x0fpD\x91\x9d\x91\xc7\xd4\xf1S\xfdi\x96\x1b\xeb\
+0\xf9^\x01t\x87\x82\x90\xfc\x90\xd0e\x05\xec\x0d\x1b\
+5\xee\x0dDz\xf2z\x05R\xb6l\xd9B\xa5K\x97\
+\xeb\x8a\xf8*\xf7\x13\x8c\xf8_\x1e\xe6J@\xcb\xfc\xf2\
+\x19\x01\xf7\x00\xca\xc5BY(\x89\x0b\xf8\x9c<7\x1e\
+\xc3\x10\x0e\x1d<LJ\xca\x19t\xd1i>|<u\
+\xefnO\xcd\xe6Mh\xde\xf3y\xaa?;\x08]`\
+\xe7\x96=\x5c\xbbz\xcdG+\x05\xd0\x18\xd06k^\
++=\x81yB\x95\x09\xe2\x07\xfee\xadW\xb1\xa2\x09\
+\x1dz\xf6\xec[1H \xfd^\x1a^?:&\xa6\
+Z~\xd2\x0d\xe0\xa7\x8f\xb1\x04Tj\x08\x17/^f\
+\xcb\xe6m\xb2y\xd3\x169q\xe2\x94\x88!\x12H`\
+\x10\xc1\x01D\xfb1\x05$;'GV\xad\xfc]\xde\
+\x9d\xf1\xbe(M\x83\x08;I\x15+\x9a^\x87\x01J\
+W\x94k\xd8\x18C\x0c\x0c\x1d\xae\x5c\xb9\xeaGk\xa8\
+\xde\xbbt\xe9\x12\x090\xcf\xfc\xfbG\x18a\x05v\xb0\
+p2)\x08\x94\xa6\xc5\xdc\x7f\xff\xa3\x9dp[\x5cv\
+w\xba\xa3a\xfd&\xed\xc4\x90\xf0\xd3\xe0\x0d\xc4\x22D\
+\x84m[w\xc8\x9cY\x1f\xa9\x1d\x9bw\xa0\xd0\x14\x18\
+\x18\x86N\x89\xd2\xc5y\xf2\xb9'\xe4\xd1n]\x95\xcd\
+f\xf3+\xe3\xe7\xd4\x89p\xf2\xc4I\xb1;\x1c\x94)\
+[\x06C7\xd8\xb2i\x0bK\x16-e\xd5\xca\xb5\xe4\
+f\xe7(M)\xec\x9a\x0d\xc9\xcb\xe6\xf2\xa1]$V\
+k\xec\xc6\x05\x17v\xaeE\xb39\xb0\xd9\x95$&&\
+B\xa0\xbfi\xa1\xfb\xf0\x91#\x8c\x1a5R\x89 \x1d\
+;\xde\x83R\xc11\x17\x11\xe1\xd4\xc9\x14Y\xf1\xeb\x0a\
+u\xf4\xf0a\xc9s\xe6\xaa\xa2E\x8aI\xe3fMh\
+\xdd\xae\xb5\x8a\x8c\x8c\x0c\xcb\x8f\xfcxe\xe5i\xa92\
+e\xdb\x00\xb3\x81,O\xd6\xb8\x1d;N.,^\xbc\
+D\xfb\x10\xe8n\x08D\x84\xcf>\xfd\x82\xf7\xa7}\x80\
+\x86\x1dD0\x0c\x17\x1a\x0a\xa5)w\xafr\xd1\xe8\xf6\
+\x86L\x9c9\x89\xe8\xa8h\xbf\xa8\xbd\x1b\x09_\xcd\xfb\
+\x8ai\x13f`S\x8a\xd6\xedZ\xcb\xe1\x83\xc78}\
+\xe6\xbc\xd2\xec\x0e\xaa%'\xd3\xa1C\x1b\x9a\xdd\xd6\x90\
+a\xfd\x87J\xea\xc5Te/T\x98\xba\xcf\x0e *\
+\xb1\x02\x97\xf6\xaf\xe7\xf0\xb7_\xa3\xe7\xe6\xd2\xb8EC\
+y{\xce4\x90\xd0\x9dl\xd3\xe6M2x\xd0 \x95\
+\x9d\x93\x8b\x88\x8b\x01\x03\x06\xc8\xbf\x9ezF\x89\x8fO\
+dfd2s\xf2L\x96|\xff3\x86.^z\x11\
+\x03\x11\x83ReK0t\xf40nk\xd9\xfco\x19\
+\xc9Y\xd9Y)\xf5\xeb\x95o\x94\x91\x91q\xd1\x83'\
+\xe9\xd0\xa1K\x9b\xe2\xe2\xe2+\x051\xda}/(\x80\
+\xfb\xd3\xa2\x9f\x183|\x02JE`\x8f/F\xe5N\
+\x8fQ\xacJ2(E\xea\x89c\x9c^\xf6o\x9cg\
+\x8f\x22\x86\x93V\x1d[2~\xcaD\xaf\xa0LY\x88\
+\xec\xdd\xbd\x97W\x87\xbc\xae._\xb8\x8aM4te\
+P\xb1re\xe9\xd0\xf9.\xdauhK\xf9\xf2\xa5\xbc\
+\xa6\xec\x1f\xeb7\xf1j\xbfW\xd1]\x06b\x98\xbe\x87\
+\xd24\x04\xc1\x10\x83\x0f\xbf\x99M\xadZ5}L\x0c\
+\xa0\x19`\xfb\xf6\x1d\xf4\xeb\xdf\x9f^\xbd^\x94n\x8f\
+?\xae\x94\xa6\xbc\x19\xb3\xb3s\xe8\xfb\x5c\x1f\x0e\xec9\
+\x82R6\x5c\x86\x81\xadp\x12\x9a=\x12#\xe3\x0a*\
+'\x13\x85\xa04\x83\xd1\xd3\xde\xa0]\x87\xf6~|*\
+\x08\xfc\xf9'\xaen\xff\xba\xb7\xce\x9a\xe5\xcb\x0f\xd8\x00\
+\xaa\xd5\xae]\xf2\xe9\xee/\x0c\xd2l\xb6\xc8\xf0(\xc2\
+c\xce\xc8\xc8\x90\x01}^VyNE|\xa5*\xdc\
+\xfd\xd6l\xca\xd6kJ\xa1\x12\xa5(\x5c\xa2\x14\xa5\x92\
+kR\xbe]g\xae\x9c?Gv\xca1N\x1c9N\
+\xf5\xda\xd5)_\xa1\x22\xe9i\xe9|\xb7\xe0{\xc6\x8f\
+\x99\xc4'\x1f}\xa6\xb23r\xb0)\x1bJS\xb4\xbd\
+\xebv\xde\xfd\xe8m\xd5\xa0a\x1dU\xa4p\xbc'x\
+\x0c@\x99rei\xd8\xac\x11)\xa7\xcep5\xf5\x0a\
+\x22\x06\xd1\xb1Q\x92\x5c\xb7\xa6:\x7f\xee\x1c\xc9uj\
+pKr\x0d\xb7I\x1c\x9a\xf4R\xa5J\x91\x98\x98 \
+\x0f=\xf4\x90R\x9a\xe6'\xb8wg\xbe/\xab\x96\xaf\
+U(\x1b\x85nm\xc2mC'S\xfb\xf1\x9eT\xbb\
+\xa7\x0b\xe5\xefz\x04\x8a\x96$\xed\xd0N\xc4\xe9d\xc3\
+\x9a\xf5t\xe8|\x97\xc4\xc7\xc5\xab\xbf6T\x94v\xe1\
+\xec\xc5\xc5k\xd7.?\xae\x00\x1a5j~\xeb\xc2\x1f\
+V\xec\xd2\x94\xd2\xac#\x22pt\x04\xc8\xc1\x13\x89\xe6\
+\xbb\xef\x162\xe9\xcd\xb7\xc1f\xa7\xf3\xdb_\x10\x97X\
+\x11\xc3\x00\xc3=W*\x056M\xe1r\xe5\xf0s\xbf\
+'q\x9e\xff\x93j5\xabR\xb1z\x15Y\xb9l\xb5\
+\xca\xc8\xca%6.\x9e\xbb;\xb5\xa7\xf3\xfd\x1d\xe5\xc4\
+\xb1\x93\xb8\x5c\xb9t\xbc\xf7n\x15\x1d\x1dU@c\x84\
+\xb7'\xbd\xc3\x82y\xf3\x99\xf9\xf1\x0c\xa9U\xbb\xb6z\
+\xb0\xd3\xc3T\xa8\x5c\x8e\xd9\x1f\xbdoVN\xe8Q\x0d\
+\xb8\x1dJ\x7f\xb8|\xe92\x0f\xdf\xf3(yN\xa1T\
+\xf3\xd6\xb4\x1a0\x16\xa5\xd9\xd1u\xd0\x054\x05J\x09\
+\xa7\x0f\xee\xe6\x8f\xe1=\xd1t\x9d\xbb\x1e\xec\xc0\x887\
+G\x85\x9c.\x0aJS\xc07\x0b>\x7fr\xc8K=\
+\xbfvO\xea\xe2P\x16aX3\xe6g-x\xcc\xd2\
+]\xdb\xf7\xa2)E\x91[jQ\xa8xE\x5c.0\
+t1\xd7.\xbd\x88\x04\x9b\x16E\xf9;\xef\xe3\xc8\x97\
+\xb38t\xf0O\xf6\x1f8\xae*V\xab\xcc\x83]\x1e\
+\xe0\x9e{;\x10\x1f\x1f\x0b\xa0\xea\xd4\xad\x19\xa6F\x8b\
+\xc5d\xaat\xd3\xc2\xd2\xc0i\xb8\xd0\xecv\x15\x19\x15\
+\xc9\x9dw\xdf\xc9\x82o\x16\x90\x92\x92B\xb9r\xe5@\
+\xf9b\xbfAVd\x88:\xd6\xac^'yNC\x89\
+\xc3A\xd3\x1eC\x10\xec\x18:\xe8\xba`\x08\x88\xbb\x83\
+\x95K\xaeKJ\xbb\xfb8\xb3\xec\x07\xd6\xacX\x8b1\
+\xc6@\xb3\x05\x87\x07C\xd5\x11\xc8k\x9b\xcd\xe6\x00\x94\
+\x06(\x093\xf1\xdd\x88\xd9\x86@j\xeaUD\x0cb\
+\x92J\xa2\xbb\x08\xf6?\x0c\xd0\x0dp\xe9B|\xa9\xb2\
+\x18\x9a\xa04\x1b\xef\xcd}G\xbeY\xf8\x99<\xda\xed\
+A\xe2\xe2b\xf35\x1d=\xf7\xeb\xe9\xe9<\xf7\xec\xd3\
+\xec\xde\xbd\xd3\x9bn\x18\x82\x81`\x18f\xae\xfb\x1e\xec\
+\x8ca\xc0\xd2\x9f\x7f\x95\x90\xad\x0f@\x1eX\xd7\xe1\xc3\
+\xc7\x01(R\xf9\x16\x22\xe3\x8a\x99\xfe\x8f\xeevR\x0d\
+\xf3\xae\xeb\x82\xee\x12J5n\x83\x8e\x90v-\x83k\
+\xd7\xd2n\x84c!A\x13s(\xfb\xc4\x19\xcaX\x0f\
+\xd5\x90\xc0t\xc0\xee6c%'\xd3\xfb\xdc\xea\xa7\x80\
+\xa5!\xd9\xe9\xa0l\xc4\x15\x8e\xa1N\xbdZJ\x14\xca\
+j\xd3+\x14J)\xac\xff\xdc\xa9\x08\x0a\x97K\x97\xec\
+\xeclq\xb9\x5c~\xa3\xc5\x10\xf1N\xeeU\xaaV%\
+9\xb9\x06K\x97\xfc\xa4t\xc3@\xf0\x05\x1c\xcdf\x04\
+*\x0f\xe5}n\x00\xce\xdc<%\x228\xa2\xe2\x11\xc3\
+\xf3L\xbc\xcf\xcd\xfa\xc0\xa5\x83=&\x1e\xd14@\xe1\
+\xd2\xf5\xf0\xfc\x0a54C\xf4x\xcd\xef\xb9Xz\x8b\
+X\xee\x05\xa4W\xaaRQ\x14pq\xffN\x149~\
+\x93\x8e!\x82n\x18\x88\x08\x9aM8\xb3u\x0dJi\
+T\xaaR\x09\x9b\xdd\xee%\xca4\x9fT0\x1d\xb8{\
+\xbf;c\x91\xa2\xc5\xd4\x97_\xcfW\x0d\x1a4\xc2\xe7\
+\xb4\xb9MRK4\xb1c\xe7\xbb\xe5\xd4\x9f\xa7Y\xb3\
+z\xaddff\x05D\x81U\xc0@q3\xdb\x8d\xaf\
+x\xc9$\x10!\xfd\xf4Q\x94\xcd\xf0\x0a\xddO\xa8b\
+v\xb0\xb4\xe3\xfb\xd14;Q1Q\x14K(*\xd6\
+\xc8@H\x9e\x86\xe2\xa7E0A\x0a/\x9c\xda\xc8O\
+\x95t\xe8\xd8N!:\xc6\xf54v-\x98\x83#R\
+\xd0\xdc\x13\x90\x88[\xe9\x02\x17\x0fl\xe0\xe2\xd6M \
+B\x9b\xf6\xad-=$\x90A>F\xe5\xe6:\xf9\xf5\
+\x97_q9]\xf8\xb5\xd6\x0a\xee9J\xd3|\x02i\
+\xd7\xbe-v\xe5`h\x9f\xa1\xea\xfe\xf6\x9d8}\xfa\
+\xb4\x98B1/]\xd7\xc9\xcbs\x92\x95\x95\xcd\x95+\
+W8u2\x85\x03\xfb\x0e\xb0c\xcb\x0eq\xe5\xe5\x81\
+\x089\xe7\xcfrv\xe7\x1a4+\x97<$\x08\x88\xe4\
+\xf0\xe7o\x0bQ\xa2h\xd0\xa4\x01\x9afS7\xc2\xb3\
+P<\xf7\x8c-\xbb71\x5c\xee\xb0`.\xd4\x02\xd4\
+HN\xa6\xd3\xbdw\xc9o\x8b~SG\xbf\xff\x1ag\
+f\x1e\xc9\x0f>\x8d#6\x01\x9bM\x91\x9b\x9dF\xca\
+\xfaE\x1c\xfa\xeaS\xec\x08%\xcb\x95\xe4\xbe\x87\xee\xf7\
+\x96\xf7Xk\xc1\xa0\xd8\xbae\x0b\x83\x06\xf6\xe7\x8b/\
+\xbf\xa2A\x83FA\x14\x80gr\x07qO\xde\xce<\
+'\xf3\xbf\xfaV\x89\xae\xb0k\x91d]s\xf2\xd2\x0b\
+\xfdI,\x91@nn\x1e\x19\xd73\xc9\xb8\x9eAV\
+f\x0e\xb9\xd99\xb8\x5cN\x10\x1b\x9aR\xa0\x94\xd2\x94\
+\x86M\xb3\xa3)\x1b\x9b\xa6\xbcI\x9b\xb1\x85)\x5c\xbe\
+\x1e\xae<\xbc\x86\x8c\xee\xbc\xc6\xb6\xf7\xc7\x92s\xfe\x1c\
+\x88\xc1\x93\xcf=\xe17'\x85\xe7Z\xfe`/\xe0y\
+>\xe0o\x07\xbc\xf4\xca`u\xfa\xc4i\x0e\xee\xda\xcf\
+\xe9\xa5\xdf\x91\xf2\xeb\x8fD\x16/\x036\x1b\xd9\xe7S\
+\xc0\xe5\x02%\xc4\xc6\xc72\xf2\xcd\x91DFDX\xc8\
+\x0bo\xbc7k\xde\x9co\x17\xfe@rr\xb27\xcd\
+TQ\xc1\xb4\xe8.\x17\xbbw\xee\x96Ic'\xaa\xa3\
+\x87\x8e\x13\xe9\x88\xc2\xd0A\xd94\x92JU&2*\
+\x9a\xc2\xc5\x22)W\xc1NDd4\x11\x91\x118\x22\
+\x22\x88\x8d\x8e$*:\x0aG\x84\x0d\x87#\x92\xe8\xe8\
+H\xc9H\xbb\xca\x07\xd3\xdfQ\xae\x8ck,\x1f\xf4\x02\
+%\x9a\xdfN\x91[\x1a\xa2\x22\xa3\xb8\x9er\x8csk\
+\x97c\x5c\xcf@0\xe8\xd2\xfda\xea7\xac\x8f\xe0\x19\
+\xeb7\xe2\x8c\x84\xceW\xa0@<\xc5B\x15\xb7\xa6\xc5\
+\xc4\xc40m\xceL>~\xefC\x16}\xf3\x03\xce\x5c\
+'y\xe7O\x80\x02\x0d\x85(\x93\x891q\x11\x14.\
+Z\xc8\xd4\xfa\x02\x81\xabHA\xd3\xadR\xd4\xa8\x91l\
+\xaa=e\x19\xfaV\xbdk3\xe7\x8f\x0f\xdf\xfb\x90\x1d\
+[w\xabb\x89\x892~\xfaxU\xb6lY~\xfb\
+\xf97\x1a6m@\xf3\x16\xcd\x03w\x1e\x04\xd5\xe7I\
+\x11A]\xbdr\x85\x05\x9f\x7f\xcd\xa5\xb3\x17\xb1\x09\x5c\
+\xde\xb0\x8eK\x1b\xd6z#1\xa2\x14\xca\xa6\xd1\xfd\xb9\
+n\xf4\xe8\xf5\x9ci\x86#^\xbf'\x1c\x9f\xfc[\x17\
+\x0c>\x95\x15\xf2\xb1\xff\xb3Py\xaciQ\xd1Q\xf4\
+\x19\xdc\x8f\xae\xdd\x1f\xe3\x8f\xb5\x7f\xf0\xd3\xc2\xc5\x1c\xdc\
+w\x90\xb6\x1d\xdb\xd1\xf9\x81{8\x93\x92\xc2\xb4\x09\x93\
+\x19\xd4\xa7\xbf\x9a9\xfb]J\x96*\xe5O\xad[\xbf\
+gegKLL\x8c\xf2:u*\xb8.O\x82!\
+\x06WRSES\x0e\xb5k\xdb>\x1ez\xf4\x11y\
+\xb1oO\xe2\x0b\xc5\x81@\xb5\x1a\xd5\x00\xbcF\x01\x06\
+\xa1\xf7PX\x90_K\xbbJ\xff\x17zs\xf6\xdc\x05\
+no\xdb\x822e\xca\xb0\xfa\xb7\xd5r\xf5R\xaa\x12\
+MQ4)\x81&\xb77\xe5\xe1\xc7\x1e\xa6j\xf5*\
+>\xe2\xb4P{]\xc2\xf3.\x14\xe4+\x90\xbf\xb4'\
+C 1)\x91\xce\x0f\xde\xcb\xa5K\x97\xd9\xb3{\x1f\
+\xed\xef\xb9\x9b\x06\x8d\x1b\xd0\xa0q\x03\x0c`\xda\xf8\x89\
+\xbc\xd4\xab\x0fo\x7f0\x87\xa4\xa4$K\xafR\xacZ\
+\xb5R\x86\x0e\x1e\xca\x82\x85\xdfR\xa9re\x13\xa1\xa8\
+ bD\xe0\xe0\x81\x032e\xc2D\xb5\x7f\xefA\xa5\
+i\x0e\x86\x8f{M:\xde\xd3I\x05\xc6\xc6srr\
+P(\x22##C\x08A\x81E\x05\xa6\xa7\xa53\xe0\
+\xc5>\x1c=t\x92\x96mZ\xf3\xc6\xe4\xb1D8\x1c\
+\xb4\xb9\xbb\x1d/>\xf1\x22\x0f<\xfa\x80\xbc\xf4\xcaK\
+\xca\xe6q\x00\xbdZ7\xb40\xf2\xe7a\xf0\xd8\xf1\xf7\
+C\x02.\xdf\x1a\x80\x84|\xeeony\x98`\x9a\x97\
+\xa6\x8a\xd2p\x19:\xba\xa1{\xa6_\xee\x7f\xf8\x01\x06\
+\x0c\x1dL\xca\xa93\x0cx\xe1E\xae\x5c\xbd\xe2\xb6\xc4\
+L4\xb5\xeb\xd4\xa3o\xff\x01\xaaL\x99\xb2\xa6_\xe1\
+q\xf7\xbd4\x09Y\xd9\xd9L\x9b<\x95g\xbb?\xc3\
+\xf1c\x7fR\xa5Ju\xc1\xd0)S\xa6\x8c\xd7\xa7\x11\
+\x05\xe2\xf6/\x96,\xfeA~Y\xba\xc4\xc7\x18\xab\xea\
+S\x1ef*222e\xc0\x0b}8\xb8\xef8w\
+\xdc\xdd\x81\xf1S\xc7ID\x84\xc3\xdbD'\x06\xca\xa6\
+\xb0\xd94\x13\xb7\x17\x87\xf2\xa3\xd1\xca/\xafY\xee\xf7\
+\x1c+\x91f&=P !\xa5\x17^\xb6~\xf9D\
+|\xad\xc4\xa2_\x94\x0d]\x041\xdc\xb6<\xa6Jz\
+\xa8\xeb#\xf4~\xa9\x1f'O\x9e\xa6\xff\x8b/p=\
+\xed\xba\xe9\xd8\x89\x90\x90PLu\x7f\xba;v\x87\x8f\
+\x11\x9eF\x19b\xb0~\xdd:\xe9\xfa@\x17\xf9\xfa\xcb\
+\xf9\xb4j\xdbV-\xf8\xf1{\xa9\xdf\xa8\x81r\xb9M\
+Y\xe5\xde\xb8d\xf2D\xd8\xbbg\xb7\xcc\xfdx\xae\x9a\
+3{\x0eG\x8e\x1ev\xab9\xfff\x89\x08Y\x99\x99\
+\xd2\xa7GO\xf6\xef;\xcc}\x0f?\xc4\x98\x09\xa3\xb0\
+\xdb\xed\xca\x08\x18\x01\xba\xe8xZc.\xe5+<\x8e\
+\xa7\xcf\xe1\x0c\x9c\x1fT\x01l\xf4\xe5\xf79\x86\xde\xd1\
+\xe01\x81=k\x18\xca}\x11\xf22\xa5\xac|2\xf1\
+u;7\xb1\xe6\x1eX\xff\xce!<\xfedw\x9ey\
+\xf1\x05\xfe<z\x8a\x01\xbdzKNv\x8ee\xa0\xf8\
+\xa8\x177\xc3\xae\x5c\xb9\xc2\xf0a\xaf1\xb0\xcfKJ\
+\xd755u\xe64&L\x9e@Bb\xa2\xd2\xdc\x8e\
+\x82\xa1\x8b{\xd25\x1bx\xf9\xd2E\x999}\xaaJ\
+M\xbd\xc6\x95+\xd7\x18\xf7\xc6H.\x5c8\xefW\x83\
+!Bff\xa6\xf4{\xbe7\x87\xf6\x1fWw\xdf\xdb\
+\x99a\xc3\x87\xb8C\xf9>\x1a\x0c\xc3P\xba\x9b\xe9\xde\
+H\x82\xbb\x87\xeb\xba\xc1\x1b#_\x97M\x1b7\xf8\x06\
+\x88\xe7\xf2\xfeV\x01|\xb3\xf0\xda\x22\xac\x90\x8e\xa1W\
+@\xfeyCB\xa0\xd6\x0a\xf9<\xe0\x81G(\xcf>\
+\xff\x1c\x8f=\xf5/\x8e\x1c8\xac^\xee\xd7\x8f\x9c\x9c\
+\x1c\x8b@\xf18q\xb2d\xf1\x12\xba\xdc\xff\x08\xcb\x7f\
+[\xcd\xc3]\x1fc\xc1\xbf\xbf\xe1\xf6\xd6-}\x08M\
+'\xc4\xc2@\xf3\xaf\xc4\xa4\xe2j\xce\xc7si\xd7\xbe\
+\x1dm\xefh\xcb'\x9f\x7fE\xf1\x12%}t\x08d\
+\x5c\xbfN\xff\xe7{\xb1\x7f\xef!\xd5\xea\x8e\xd6\xbc>\
+\xfa\xd5\x90\x01B\x0f^q\xab\x1ek\x073\x5c\xba\xec\
+\xdb\xb7\xcf\x14v \x0f\xc20\xd0\x8fo\x84r\x0cC\
+\x97\x0b\xf1\xcc=\x14n\x08\xccam\x84\x92\x94\xfby\
+\xef\xfe\xbd\xc9\xce\xcca\xf1w\x0b\xd4\x88\xa1\xc3\x980\
+m\xaa\x19RA8u2\x85\xc9oNd\xd3\x1f\x9b\
+\xa9\x9e\x5c\x93\xe9\xaf\x0f\xa5v\xddZ~s\xb6\xe9\xa4\
+\x8b9gY\x94\x86\x87J\xa5\x14\xcf=\xdf\xc3\x5c*\
+V\x96)S 3#C\x06\xbc\xd0\x97\x83{\x8f\xaa\
+\x16mZ1v\xd28\xec\x8e`O\xc0\xc3<\xa5\x8c\
+\xa0\xb5t\x00{D\x84\xfa\xe6\xbb\x1f\xdc\x1a\xe1\xefA\
+\x08?$P\x0f\x86gf\xfe+%\xee0\x85\xe7\x1e\
+f\xf4(`\xd0+\x03\xc9\xcb\xc9f\xd9\xa2%\x0c\xeb\
+7\x88\xb2\xe5\xcbQ4!Q>\xff\xe83\xa5\x1c\x11\
+\xea\xa5\xa1\xaf\xd0\xf5\xf1\x07\xb0\xd9l><b\xb9\xb9\
+C\xcaVu\xe7\x8e\xa6\x00P\xbe\x82\xb9\x10j\xa5!\
++3S^\xea\xddO\x1d\xdcw\x94&-\x9b\xc9\xf8\
+)ob\xb7\xdb\x95\xf8I:\x04\xc5\xa2\xfb\xfe\xb6\xf0\
+Hy&\xf6|\xf9\x16n\xed\x12<c\xc4\x22\x90@\
+J\x02\x7f\x07RhE\x18z\x9c\x8a\x18~^\xb5\x84\
+\xc8jj(\x8d\x97\x87\x0f\x93C\xbb\xf7\xa9\x9d\x1b\xb7\
+\xb1c\xc3V\x04\xa5\x1a\xb7i\xc9\xa0W\x87H\x89\x92\
+I\xbe\x88p )\xde\x11\xe8V'(\x0c\x11\x7f\xb6\
+\x04\x90\x9d\x99\x91\xc9\xe0\xbe}\xd9\xbf\xfb \x8do\xbb\
+\x8d\xb7\xa6O\xc4\xe6\xb0+_^\x111D)M\xf3\
+\x96\xf5\xac\xfe\x1b\xe21\x8d\xfc\x11\x8b\x08N\xa7\x13\x87\
+\xc3\x11\xca7\x0c\xc1\xa7@\xfe\x9a\x11\xf3\x10*+\x9c\
+\x12\xf4p\xc4\xe3\x13\x84\x18\xbb\x96F#\xa63\xa6,\
+:\x17\x81u\xbf\xff\xce\x9a\xe5+\xa9\x5c\xad\x0a\xf5\x1b\
+7\x92S'Nqh\xff\x01\xb5\x7f\xcf^u\xf6\xf4\
+i\x94\xb2\xa1\x94\xa0\xec0`\xe8\x00\x92J$\xa9\xc0\
+Q\x11\xd4.\xcf\x96p\xc3_\xc7\xfb\x91\xe468\xb2\
+3\xb3dH\xdf\xfe\xec\xdbyP5l\xd2\x8c\xf1\xd3\
+\xc6\xe3p8\xfct\xcd\x85\xf3\xe7\xf8\xfe\xdbo\xa4w\
+\xbfA\xdeM\x0fJ)A\xa1\xc40\xbc\x06\x8c\xb5\x8c\
+\x880\xe2\xd5!\xbc5e&~\xa3,\x90\x8dA\xe1\
+\x0e\xf1K\xfb\x0b\xc1\xc5\xd0\x82\xd8\xb2y\x03\xe7\xcf\x9e\
+\xe1\xde\xfb\xbbXF\xa4\xf2\x11!\x90z\xf92\xc3\x87\
+\xbc\x02\x86\x02~\xc50\x0ce\xe8\x8a\x22\x09IT\xaf\
+Q\x9d\x07\x1e{T~^\xb8D\xb9\x9c9\x18\xb8\x18\
+>d0\xd3\xde{\x9fBE\x8a\x84U\x8e`\xca\xc3\
+\xacN\xb9\xfd\x96\x00\xf0\x08#;[\x06\xbe\xd8\x87}\
+{\x0e\xaa\xfa\x8d\x1a\xca\x84\x19\xe3UTT\x94_>\
+\x04N\xa7\xa4\xf0\xe5\xc7_\xa8\x98\xa8B\xd2\xa1S'\
+\x15\x11\x19\xe1\xd5\x86\x86av3?\x86\x09\xfc\xb4x\
+\x89\xac^\xb9V\xad_\xbb\x86\xe6-[\xf9z@\x08\
+\xa2\x83\xb4\xa1@\x08\x95\x15\xd0\x02\x0f\xe3U\x80~\x08\
+\xd4\x19\xee\xdb\xaa\xe5\xcb\xd8\xb9c\xabt\xbe\xbf\x8b\xf2\
+U\xac,\xe5\xc0\x5cT\xd2\xd04\x1b\x88A\x9f\xc1}\
+\xe5\x8e\x0e\xedIH*\xa64s\x9c\xab\x7f\xbd\xf8,\
+\x00\x9b\xd7o\xe4\x8d\xd7^g\xe0\x8b/2\xfd\xfd\xd9\
+\x14.R$\xd8[GH\xbf\x96&W.]R6\
+\x14\xd7\xae]\xc50\x0cQ\x9e\x0dV\x9e(\xb0@n\
+N\x0eC\xfa\x0e`\xdf\xee\x83\xaa~\x93\xc6L\x9a9\
+IEEG\xf9k}\x81\xec\xac,\xbe\x9e\xfb\x95r\
+\xd8c\xf9\xf4\xfd\xb9\xea\xa3\xf7>\xe2\xf5q\xaf\xabJ\
+\x95\xaa\x09n\x13\xde\xca\x03\x97\xd3\xc9\x84\xb1o\xf0\xcb\
+\xcf\xbf)\xbb-\x86\xa1\x83\x87\xd2\xad{7z\xf7\xeb\
+\x1f\x9a\xb5\xf8\xbft\xe4\xf3\x15\x02TV\x08\x91\xf9\xa8\
+\x0cJ\x0f\x96\xfc\xe0a#p\xb9\x5c\xca\xaf*\xe5\x0d\
+Ga\x00\xb1\xf1q8\x22cH(VD\xee\xee|\
+\xb7\xea\xf2DW\x85\xdb\xf2\xf1\x84\x98\xa2c\xa2\x01h\
+\xdd\xfe\x0e\x06g\x0fg\xca\xd8\xb1\x0c|\xe1E\xa6\xcf\
+q\x0b\x05\xb8|\xe9\x22\xdf\x7f5\x9f\xb5\xcbWq\xe6\
+D\x8a\xb2\xd9\xecD(;c_\x1a\xce\xd4\xc2\x13U\
+\xd3\x16\xb7\xf1\xc0\xe3\x8fP\xbbn]1@9\xf3\xf2\
+\x186p0\xbb\xb7\xefSu\x1b\xd6g\xe2\x8c\x89D\
+\xb97OXG^\xea\xe5\xcb\x0c\xea\xdd\x9b\x94cg\
+\xb1+\x07b\x17\xbav{\x5c\xee\xbe\xe7^u\xe4\xd0\
+a4\xd1\xd0\x94g^1\x85b\xb7;\xe8;p0\
+v[\x0c?/Y*\xcf\xf6\xe8\xc9\xbf\x9e{Zy\
+\xd5{\x81v\x97\xffs{\xf8G7\x06\x9e*5M\
+#\x22\x22\x22p$\xe3]\x86\x15X\xf1\xdb\x0a\xc9\xcd\
+\xcdSc&\xbf\xa9\xaaU\xaf\x1eT\xa9\x04 \xbd\xe7\
+\xbe{\x00%S\xc6\x8cUCz\xf7b\xfa\x07\x1f\xc8\
+\xaa_\x973{\xea;*7;\x0f\x85\xc2n\x8fD\
+\x0c\x1d\x11\xc1n\xb3\xe3\xcc\xcce\xed\xaf+Y\xfd\xcb\
+2ZwlG\x9f\x97\x071\xe5\x8d\xb7\xd8\xb5y\x0f\
+5j\xd6\xe4\xad\x19\x93\x88\x8a\x8e\xc6\xbd\xc8\x88X\x98\
+\x96\x90\x98\xc8\x87\xf3\xe6qp\xdfA\xf9\xe4\xbd\x0f\xd5\
+\x9e]\xbb)\x96PH\x99y\x95RJ\xa1)\x8f\xc3\
+\xe8+W\xa4hQ\x86\xbc:\x94\x13'\x8f\xf1\xec\xf3\
+\xcfy\xcd\x8b\x9b\xe1\xa8\x11\xa8\xb2n\xa4h(c-\
+\xdc\xe4\x09\x98!\x13\x8f\x85%\x06?|\xf7#Uo\
+\xb9\x85\xaa\xd5\xab\x15\x5c\x11&\x9eN\xf7uR\xce<\
+'o\xbf5\x91\x9e\x8f=\xa5.\x9e\xbd\x84Rv\x5c\
+J\x11wK\x13J5hN\x5cbq\x94\x12\xb2R\
+/qi\xff.2\xf6n\xc0\xee\xcca\xdd/\xab\xd4\
+\xe6\xdf7\x92\x9b\xabS\xb1REy\xeb\xedI*6\
+..\xa0*\xf1SY\x0eG\x04\xb5\xeb\xd5Q\xaf\x8e\
+\x1d.\xcft\xed\xae\x96\xfc\xb8\x98G\x1e\xef\x86\xa6\xd9\
+\xd00,\xbe\x86\xff\x1eU\xbb\xc3\xce\xb4Y\xb3\x10\xc2\
+o\x18\xf1\xea\xf2|\xe0\xa6\x04r\xa3\xf9<\x95\x1b\x86\
+I\xb4f\xb3q\xf8\xd0a\x0e\x1f8\xa6\xfa\x0e\xea\x1d\
+D\xda\xfe=\xbb\xa9T\xa5*111\xc1\xb8\x04\xee\
+\x7f\xf8>\xf6\xec\xd8\xc1\x9a\xdf~\x07\x9b\x03G\xc9\x8a\
+4\xed9\x8225\x93\x11\xc3\xdcl\xe0\x85\xfb\x1e\xe3\
+\xca\x85\x8b\xec\x9f\xf7\x0ei\x9b\x7f\xc1\x99\xe3\xc4f\xd3\
+\x187\xf3-U\xa4XQ\xdfl\x18\xd2x\xf5\xfd.\
+^\xa2\x84\xba\xf7\xe1\xfb\x99?\xef+\xb6o\xddB\x89\
+\x92\xa5\x11\xcf\xa1\x0c\xee\x06\x06\x96\x8b\x8e\x89Q\xf9\xf1\
+\xe7Fx\xe7\x1f#\x90\x80+\x1c&\xeb\xf3\x802\x9e\
+`\x9c\x00\x86\xa1{\xbd\xe5_\x7f^Fdd4\x1d\
+:u\x10\xf0\x9d7q==\x9d\xa7\xbau\xe1\x8b\xcf\
+>\x0aK\xc2\xc5\x0b\x97\xd8\xb8n#\x86\xb2\x11W\xad\
+\x16wM\xf8\x882\xc95q:!\xd7\x09N\xddw\
+\x19NEBR\x09Z\x0c\x1cC\xa9\xfbz\xa0\x8b\x81\
+\xe1\xd2\xf9u\xc9\x12\xff&H\x88+\xa0Y]\x9fx\
+\x9c\x98\xe8X\x16}\xf7\x03\xbb\xb7\xef\xc4\xae4\xd2\xae\
+\xa4\x91\x9b\x97\x17\xb49\xe1/\xe9{/(<\x93\xba\
+_\xf8=\xa8\xc7\x84a\xbc\xf7O\xcb\xe8\x14|L\xf6\
+<7t\x03\x85`\x18.Y\xfe\xcb2\xea5\xaa#\
+\x85\x8b\x16U\xd6ht|\xa1xf\x7f\xf29\x8f=\
+\xf1\xb4\xb9\xc5\x06\x0bs\xdc\xf7/>\x9eKN\xb6\x0e\
+\xd1q\xb4zy\x02\xb6\xc8\x18\xf2\x5c\x82\xcb\xbd\xb5\xc8\
+0\xdc\x1b\xf3\x0cs#\x9b\xae\x9b\xab\x94\x0d\x1f\xefI\
+\xe1\x86\xad\x11\xe0\xfb\xcf\xbe\x22\xed\xda\xb5\x90\xa1\x0f+\
+x\xeb\x15\x88+TH*U\xaa$\x1bW\xacg\xc6\
+\x1boa\x17\x07\x7f\xac\x5c\xcf3\x0f>\xca\xf6\xcd[\
+\xc4/ \xeb\xe1a\x88\xcb\xcb\xb7\x80\xde\xe6\xb7\xbc\x11\
+\x18~\x17w\x84\xd6w7\xd3B]\xd6\x99\xc4\x97\xcf\
+R\x89a\x86K\x9cy\xd9\xd85\xc5\x8e-[UZ\
+\xeaU\xee\xe8\xd0\xce\x7f\xc9Y\xcc\xb2\x0d\x1b5%>\
+\xbePp\x07\xc0\xdc\xb0\xb0\xe2\xd7\x95\xa0\x14\x95\xee~\
+\x08{t\x22.\x97\xa9\xa6\xcc\xed\xaa>a\x88an\
+^\xd3uS(b(\xea\xfek\x10N4\x9c\xd9N\
+\xd6,_\xe5\xd7\xf9L\x9a=\x93\x9c\xaf\x0d\x9e\xdb\xcc\
+\xf1\x13\xd5\xe1\xdd\x07\x95\x86\x0d\xd0PJCC#\xf5\
+\xdce\x86\x0fx\x99\x83\xfb\xf6\xb9\x05\xec\x8ex{y\
+\xa3\xdcx-\xbc\xf4,\xfdz\xf9\x08>\xd5\x1d*\xfc\
+\x8e\x7f\xdc\xc9\x13\xdf\xf7\xfe\xc6\x12\x9b\xc2\x13N\xf7\xdd\
+=\x8d0\x0c\x83\xc5\xdf/\x94\x9e]\x9f\xe0\xdf_|\
+\x83\x1d;?~\xf9\x1d\xd1v;\x8d\x9b6\x0a\x0a7\
+\xfb\xfd\xad\x02\xee\xc0\xd1C\x87$'+\x07\xc3pR\
+\xb6\xc9\x9d\xe8\xee]\x90\x86[=\xea\x86\xa0\x8b\x98w\
+\xc3\xfd\xdb\xfb7\xc4\x97(C\x5c\xb5:\x80\xc6\x8eM\
+\x9b}Z\xc6\xdb\xb3\xfd\xd72<\xe4\x1d\xd8\xb3\x97\xdf\
+\x16\xfd\x0a\x9a\x9dB\xf5[\xd0\xf8\xcdoh4\xf9\xdf\
+\x94\x7ff4\x12\x1d\x8f\x9eg\xa8w&O\xb3\xf0\xc4\
+\xca/3\xd8\xe9\xdbv\x84\xf9\x1b\xfc\xd3\xc4\x97\xe6\x81\
+\xfc\xfd\x10+\xf5A\xfa\xcc;\xb7\xf9\x95\x985q\x0a\
+?}\xfb\x83\xb2)\x0d\x11Su\xa0)p\xb9\xf8\xf2\
+\xe3\x8f\xe8;t(~K\xb2!\xaa\xb5\xde\xcf\x9d9\
+k\xbe\xf6\xa3EP\xa8d9\xc4P\xee\xc5,\xb7P\
+\x0c\xcf\x16R1=v\x85\xd7[\x17\x14*\x0f\x12j\
+\xd4\xe2\xcc\xd1\xddl\x5c\xfd\x87\xea~\xff\xc3\x18\x86\xe0\
+2t\x0c\xa7\x0b\xdd0p\xb9tt\x97\xcbt\xd9\x0c\
+\x03\x05\xb8\x9c:J\xb3C\xa18n\x1f\xfa&J\x22\
+\x11\xa0d\xb9RDD+\x0e\xcc\x1e\xc1\xc1\xbd\x07\xb8\
+|\xe9\x12I\xc5\x8b\xfb\xf3(\x88\x9f!~\x07\xa5\xe7\
+\xeb\xa9\x07\x82?\xdb\x05\xd8\xbfg\x0fUo\xb9\x85\x88\
+\x08\xf3uv\x11\xd8\xf6\xc7\x1fj\xc9\xc2E\xd8l\x91\
+\xc4&7\xa1D\xd3\xbb0t'\xe7W\xfd\x9b\xbcS\
+\xfbX:\x7f\x11E\x13\x92H,\x9eDVF&Y\
+Y\x99\xe4\xe4\xe4\x90\x97\x9bGnn\x1e\xd9\x19\x19\x92\
+\x99\x99\xa9\x9cy\xb9\xe8\xba\x0b\x85\xc6\x85\xb3\x17\x95\x12\
+\xd0\xec6\x94f7_\x9c\xf1\xea_K\x14\xd9\xd3\x0b\
+\x0d\xdc\xefm\xf9&\xdd\xc8\xc2q\x88R\x18\xa2\xc8\xc9\
+t\x82\x08\xa2l\x80\x1d\x85\xe0\xb0;\x88t(\xecv\
+;v\xbb\x9d\x08\x87\x9d\xd4\xcb\xa9\xe4d\xe7P\xa4R\
+\x05\x94\x8aDw\xb9\x9dW\x1d\x92j6b\x9f{(\
+]8\x7f\xc1-\x90@~\x09V_%\x14\x1f\xfd\x9f\
+\x87\x0c.\xe6\x17\x1e\xf6!9}*EF\x0e\x1bA\
+\xbb\xbb\xeeT=\xfb\xf66\xbdW\xe0\xa7\x1f\x96\xa0i\
+\x0eb*U\xa3\xf5\xf0\xc9\x8880\x80Jm\xeeb\
+\xfdkO\xe1:w\x82/\xdf\xfb\x14]t\xaf.\xb5\
+\x86WL\xd7\xcbM\x87\x12\xaf\x85\xa64\xd0s\xb3p\
+\xe5\xe6\x80\x8ar\x8f\x0e\xf7\xbc!\x96W\x04\xdd3\xb6\
+\xb8}!\xcf\xc9<\xce\xeb\xe9\x88\xa6Q5\xb9\x1a\xb3\
+\xe6\xce\x09\xe6[\x88\x8493g\xb1\xf0\xcb\xefH?\
+~\x08ed#\x12\xed\xae\x0f\xb2\xce\xff\x09\x9aIy\
+Bb\xa2\x05E\xb80\x93\x87\x7f\xd6\xdf!\xf43A\
+\x9ez~c\xce\xbb\xca\xc1\xcf\x8b~V\xd7\xaef\xb1\
+z\xc5*y\xb0\xebC\x94(QZ\x01\x9cM9\x03\
+\x9aA\x89\x86-1\x0c\x87\x97\x84\xa8\xc8H\x12\x1b\xdc\
+\xce\xd9\x9fNR\xb5f2O\xf7}\x01\xa5yD\xe1\
+9\xac\x06\x94\xd2\xb0\xd9l\xd8\xecv\x1c\x11\x0e\xecv\
+\x1b'\x8e\x1dc\xe2\xf0q\x80\x93\xab'\x0eQ\xacR\
+]\xb3\x94W\xabZ\x84\x81\xefO\xb37\x0b\xca\x01\xa9\
+\x87\xf7\x22\x02\x15\xaaV\xf4_\xdc\x0aj\xa2/\xa1\xe5\
+\x1d\xad\xe5\xfby\xf3\x95+-\x93m\x1f\x8f\xa1\xeeS\
+\xaf\xa1l\xd1\xa4\xa7\x1c\xe0\xc0g\x93\xd04;\xd5j\
+T\xa1x\x89\x92\x96\xe8n\x08\xbd\x1eVw\xf9\x8bQ\
+\xb7\xaa,\xa7\x7f{\xc2\x82'K\x8f>=\xb9z\xf5\
+\x0a]\x9fx\x9c\xe2%J{C\xd4\xb1\xb1\xb1 p\
+=\xe5\x08\x9a\x06\x86\xcb\xd4\xe9\x9a\x06\xce\xf4\xf3\x88R\
+\x94\xad\x5c\x96\xfaM\x1b\x04\x8d\xe4\xc0\xf5\x0bO\xff*\
+S\xbe,1\xf1\xd3%#\xc3P'V-\xa4x\xb5\
+\xba\x18N,\x9d\xd17i\xf8u(\xf1\xf4\xe6\xe3\x5c\
+;r\x08\xbb\x08\xb5\xea\xd6\x16\xc3m\xee(T\xb0O\
+m)^=\xb9\x96\xba\xb5~m\xf6m\xdf\xc7\x99\x15\
++8\xf7\xfbZTd4zV\x1a(;v\x87\xe2\
+\xf9~}\xcc\x08\xb3\xa5\x5c\xd8\xa5\x90\x1b\xe0+\x04\xad\
+\xa9\x87\x1aN\x81U\x98jf\xd0+/S\xbeb\x05\
+\xef\xe6b\x03h\xda\xa2\x19\xca\x80\xcb\x9b\xd7pn\xdb\
+R\x1c\x11`\xb3\x0b\xa77/\xe5\xc2\xfaU B\xed\
+\x06\xf5B\xae\xd7\xfb\xccP\x1f>\x00\x9b\xdd\xce]\xf7\
+uD\x01\xe77\xfc\xca\xb5\x93{\xb0i\xc1\x94\xf9[\
+\x89\xe6\xa5\xd9\x0c\xf6\xce\x9b\x89\x1d\x88\x8a\x8d\xa0e\xdb\
+6\xee\xb7\x1b|\xc2\xf0\xd4+\x02.\xdd\xc5\xae\x1d\xdb\
+y\xef\xed\x99\xf2\xecc\x8f\xb3k\xc7\x1e\x22\xa2\xa3\xcc\
+5\x1a\xdd\x89\xcaJGC#\xaep\x1c/\x8f\x1eN\
+\x9d\x06\x0d\x10 7'[V\xfc\xb6X\x5cN\xa7\xf8\
+(\xb3R\x18\xf8;0\xcd\x97n\xf7\xcf\x10\xea\x1e\xf8\
+\xb7\xbb\xa0\xdd\xeeg.\x02\xdc\xf3\xc8C\xacX\xfa\x0b\
+g\xffLa\xe7\xd4\xd1\x1c(\xf9)\x86\xae\x93{\xe9\
+,6\x84\xf2U+\xd0\xae\xe3\xdd^U\xeay\xff\xcf\
+o\xe6R\x1e\xa1\xf80?\xfatw\xb5f\xf9\x0a\xae\
+\x5c\xba\xcc\x86\xc9/\xd3\xe6\x8d\xd9\xd8\x0bUDG\xdc\
+\xaf\xa4yLr7\x18\xa6\xaa:\xb0`*\xd7\xf7\xef\
+D\x13\x83\xee=\x9f'&:\xc6\xdfJT\x90\x97\x97\
+\xcb\xaem\xdbX\xbfv-kW\xaf\xe1\xd2\x85T\x8a\
+&\x14Wm\xda\xdd!}\x06\xb5T\xb5\xeb\xdd*g\
+SN\xab\xc5\x0b\xbec\xd9\x8fKi\xd6\xb6%\x03\x87\
+\x0f#\xaeP!/\x9e\xed\xdb\xb6\xa8W\x87\x0cc\xd6\
+\xecx\x9a\xb5h\x1b\xc0)\xff\x13\xe7\x82x\xe9\x9dV\
+\x02'\xf5\x1bPY\xa1@\xb9\xe7\x00\x04\xa2\xa3c\x18\
+\xf7\xf6\x0c\x994b\x94:\xb0}7\xce\xf3'A\x81\
+\x0d\xd3\x83\xbe\x9cz\x91\xb3g\xceP\xaeBE\xbf\x17\
+SBi\x5c\xafF\x12\x88\x8f/D\x8b;\xda\xb0x\
+\xc1w\xc8\xf5TV\xbf\xf6,5\xff5\x90R\xcd\xee\
+\xc1\x99knS\xf28O\xcan#\xfb\xc2a\x0e\x7f\
+=\x8d\xeb\x07\xf6\xa3)\xf3\xb5'\x1b\x8a\xef\xbf\xfc\x8a\
+v\x9d;\x11\x1d\x1d#[6nTkW\xadb\xe3\
+\xba\xf5\x5cKK'\xaeP\x22-Z\xb5\xa6m\xfbv\
+4jR\x8f\x88\x08\xef*\xa2\xaa\x5c\xad*w\xdc\xd3\
+\x91\x9f~XB\x99\x8a\xe5\x88\xf58\xb1nB\x1b7\
+m\xc1\xa4\x993i\xdc\xacu\xbe|\x0c\xfb`\x82\x0d\
+\x86\x00\x00\x15pIDAT\xc8\xf2\xc0\x1e\xfc\xc4\xe3\
+=z\xec.\xeb\x09q\x05CBb\xa2\x9a\xf8\xfe;\
+\xb2o\xf7n\xbe\xfeh\xae\xda\xb9y\x1b\xff\xea\xdbG\
+*U\xad\xa8\xc6\x0c\x19\xc6\xa8\xc1\x83\x982g\x0e\x09\
+\x09I\xee\xb5\x12\xcfJx\xb0j\xf4<\xfb\xf1\xdb\x05\
+\xfc0\x7f>E\x8b\x16E\xcfs\x92}=\x83\xfd\xef\
+\x8f\xe5\xe07\x1f\x91P\xa7\x19\xd1%\xcb\xa34\x07\xb9\
+i\x17I;\xba\x8b\x8c\xc3\xfbPh\x88\x12\xaaT\xaf\
+\x22'\x8f\xfc\xa9>\x98\xfa\x0e`0\x7f\xee<2\xb3\
+3\xc9\xcdsR8\xa1\xa4\xb4\xbd\xeb>no\xd3J\
+\xd5kP\x07\xbb\xc3\x16\xd2\xdf\x02P\x9aM\x5c\x22\xca\
+\xa9;\x03t\x87i.\xb7i\xdb!\xc0(\xba\x11\xb0\
+Z]A\xe1\xf7\xd0\x94\xf8<\xd8\xd0\x95\xb9\x97\x84\xc5\
+\x10\xf7Kr\xe6\x9bP\xaaf\x9d\xba\xd4\xa8[\x8f-\
+\x1b7Q\xa5\xc6-\xaa~\xa3z\x0c\x1c\xf9*SF\
+\x8fa\xf8K/1\xe5\xfd\xd9\xc4\xc4\xc6Y6R\x07\
+\xe37\x0c\xe1\xdby_\xf2\xd1{\xef\x92\x94T\x9c\x89\
+\xef\xccD\xa11s\xdc\x9b\x1c\xda\xb5\x0f\xae^\xe0\xf2\
+\xea\x1f-\xb4\xfa6\xb79\xa2m<\xf4\xc4c<\xf6\
+\xf4\xd3jp\x8f\xde\xfcy\xe8\xa8\x99\xc7P<\xd4\xed\
+I\xd5\xf4\xf6\xdb\xa9yk2\x9e\xa5JO[\xc0_\
+\xa9X\xb9\xa2\xa3p\xb9t\x1f\x1bU0\xdd\x7fM(\
+\x10\xbcb\xe8&\xc8\x1a\x96\xb6\x96\x09\xb5\x93\xc2\xd4\xf9\
+\x22\x03{=M\xdd\xfa\x8dx\xbaG?\xbf!k\xbe\
+\x8ci\xe0\xd2]\x08\x8a6\x1d\xee\xe2\xe2\x85\x8b|>\
+\xfb}\xc6\xbe\xf6\x0ac\xa6L\xc7\xe1p\x80\xa5\x81\x1e\
+:D\x84\xaf>\xfd\x94\xcf>\xf8\x90\xe2%\xcb0\xf9\
+\xdd\x19\x94,]\x16\xa5`\xd2\x9c\xd9\xec\xde\xb9\x83\xd5\
+K\x97\xb3w\xdbV.\x9f\xbb\x88\xeer\x11[(\x9e\
+j\xb5j\xd1\xf8\xf6\xdbhug[\xe2\x0b\xc5\xb3f\
+\xc5\x0aN\x9f>\xe3^\x914@\xd3i\xd2\xa2)5\
+k'\x03(?\x0b\xc9:}\xba\xb9\xee]\xa3w\xc7\
+|\x0cC\xf7\xaa\x0b?k7\x84\xdba=\xa14\xe4\
+\xd4\xe1\xe7\xee\x05\x8e\x90`s\xde\x1fA\xb8tP\xf1\
+\x85\x8aP\xb8H\xb1\x80\xfd\x13\x9e^%\x88\xe1Y\xb0\
+Pt\xed\xde\x9d\xab\xa9\x97Y\xb4`>3&\x8cc\
+\xf0\xf0QxO%\xf7X_\x86\xc1\xa7\x1f\xcc\xe6\xeb\
+O?\xa7L\xb9\x8aL~\xefm)^\xbc\xb8\xf2\x85\
+\xbc\x15\xb5\xeb5\xa0N\xfd\x06\x88\xc0\x07\xd3\xa6\xf1\xe3\
+\xfc\xf9\x8c\x9c1^j\xd4\xaa\xa3D \xe3z:\xe3\
+G\x8dd\xd5/+(Y\xb24\xcf\x0f\xe8CBR\
+\x82L\x1e9B\x8dx\xa9?c\xa6\xcd\x94Zu\xeb\
+y_O\xb1v\xb8\xa0].\xd6\xf6\x88\xee\xd9H\xe3\
+\x97\x1eR\xc1X\xf3\x85\xe0\x9f\xb5\x9c\xee\x16\xfcM/\
+P\x05\x83\xe2\x8d\xb7fB\xf0\xa1\xa2(\xa50\x10t\
+Om\xee\xfc=\xfa\x0f \xf5\xd2eV.]JR\
+\x89\x92<\xf5\xfc\x8bx\xcc-\xc3\xa5\xf3\xde\x8c\xe9\xfc\
+\xf8\xed\xf7T\xa8\x5c\x95I\xb3fR,1A\x85\xea\
+\x10\xde4\xbb\x86!\x06N\xa7K\x89\xc0\xee\x9d\xdb\x19\
+?r4\x97/\xa6rg\xc7\xbb\xa4\xff\xcbCTl\
+\x5c<\x80zc\xc6L\x86\x0f\xe8\xc3\xc8\xc1\xfd\xd5\x1b\
+Sg\xc8\xad\xf5\x1a\xfam\xe3\x08\xdfL\xf7\x9c&7\
+\xaf\x94n\x06\xc2\xbf\x8e\x10*-\xbf\xcb\x02\x9e$\xcf\
+F3_4\xd4\xbc4\xcd\xc6\x90Q\xa3\xa9\xdd\xa01\
+\x0b>\xfb\x94eK\x97\x98K\x02.\x9di\xe3'\xf0\
+\xe3\x82\xef\xa9Z=\x99)\xef\xce\xa2XB\x82\xbf\xe9\
+\x15\xaaj\x01QBvN6\x9f\xcc~\x8f!}\x06\
+\x90\x9d\x95+\xc3\xc7\x8d\x95a\xa3G\xab\xe8\xd8Xo\
+@\xb2F\xadZ\x8c\x9e:\x0b\x01F\x0d\x1e\xa0\xf6\xee\
+\xda\xee\xeb\xa9!\xda\xe4\xfd\xd3\xed.x,\xca|\xf9\
+\xf0W\xd2\x82\x04\x12\x08\x7f\xa3\x1b\x08\x96\xde\xab,\xbb\
+\xdf-mqDD\xf0\xda\x9b\xe3)S\xbe\x02\xefN\
+\x9a\xc0\xbe];yg\xf2\x14\x96-^B\xdd\xfa\x0d\
+e\xd2\xbb3)\x5c\xb4\xa8?\x19V^\x88\xaf\x0e\xa5\
+\x14\x9afg\xca\x98q|=w\x1e\x0d\x1a5b\xce\
+\xbc\xcfT\xeb\xf6\xed\x14\x22,\xf9a\xbe\xbb\xb8I\xc7\
+\xaduk3z\xf2,\xc1\xd0d\xd4K\x03\xd9\xb7k\
+W\xe8\x13\xf3-B1'\x8d\x10j L\x99\xbf\x94\
+F\xe0{\xea\xff\xd0\xe5_\x99\xa5[[*\x12\x81\xf8\
+B\x85\x19=\xe5mbb\xe2\x191\xa0/\xbf\xfd\xf0\
+#\x8dok\xce\x9b3\xa7\x12\x1b\x1f\xef\x9b\xd7<\x97\
+G\x08\xdet\xc1\x10!-\xed\x1a(;y9N^\
+\x1e\xf9:\x13fL\xa7D\xc9R \xc2\xfe\xbd{x\
+o\xfad2\xae_\xf7\xae\xce\x89@\x9d\xfa\xf5\xd4\xab\
+\x13\xa6\x22\xbab\xe4K\xfd9\xb4w\xaf\xf9\x9ez`\
+[\xf0\xd2\xeb>\xa3:\xdc+\xdc\x7f\x93g\x81\x02\x09\
+\xe4c\x08M\x142=\x1cb\xb3\x11\x9e~\xa7B\x14\
+0[_\xa2tI\x9a\xde\xde\x06\xa7S\x88\x8d\x8ba\
+\xd8\xd87p8\x22\xbc\xeem\xe0\x9a\xb7\x0f\x8dp\xe9\
+\xc2y^\x1b\xd8\x87e?/A\xc4`\xd8\xd8\xd1\xb4\
+\xef\xd4\x190G\xe5\x81\xbd\xbb\x99<f\x14\xe2\xb23\
+a\xd4\xeb\x9c?{\xc6\xb7\xe4*\xd0\xa8ic5\xf4\
+\xcd7\xd1]:\xa3\x06\xf5\xe7\xf8\x91\xc3A\xeb\xe4\x9e\
+\xfc\xe6iA>\x22\xac\xfd+\x1c\xef\x02\xf9\x17\x98'\
+0\x0d\x02F\x88\x15Y(\xe4\x05\x0aL\xcceU\xcf\
+01w\x01\xf9\x16\x94\xc43\xf6\xdd6\xae\x88\xf0\xd5\
+\xc7\x1f\xf1\xcb\xe2\x1f(Q\xaa\x14\xd9\x19YL\x19;\
+\x12\xdd\xd0\xbd\xfa\xc8\xaa\x9a<\x09b\x18\xac^\xf6\x1b\
+=\x1e\x7f\x94\x1d[\xb6R\xa2D\x19\x10\x9d\xe8\xa8\x18\
+o8g\xcf\xce\xadL\x1a3\x82\x8b\xe7/\xa3i\xd1\
+l\xdb\xb4\x8d\xd9oO#+3\xc3\xab\xbaD\xa0i\
+\xcb\x96\x0c\x1d7\x81\xbc\x5c\x17\xc3\x07\xf4\xe6\xc4\xb1#\
+~gD\xfa:\x82\xf2\x9ab\xe1\x84\x11N\x08\x12&\
+O(\xa1\xe4\xbf\xeb\xe4&/7\x0b-\x0d\x0e$\xc3\
+\x17w\xd2\x0d\x9d\xf7gLe\xde'\x1fS\xbfIs\
+f\xcd\x9bG\x9b\x8e\x1de\xeb\xda\x0d|<k\xa6\xf7\
+\x157o9\xf7\xef\x8c\x8c\xeb\xbc\xf5\xc6(\xc6\x0d\x7f\
+\x8d\xa8\xe8\x18\xde\x984EZ\xb4\xbd\x03\xc3\x10t\xd1\
+\xbd\x86\x7f\xedz\x8d\xf8\xf8\x9b\x7f\xd3\xf9\xa1.\x22\x22\
+\xbc\xf4\xfap\x19\xfd\xd6Tbb\xe3\xbc4\x09\xe6\x82\
+\xd6m\xb7\xdf\xce\x907\xc6\x92\x99\x99\xc5\xf0\x81\xbd9\
+y\xe2\xa8e\x9d\xc5\x9f\xa5\xc6_\xe1\xcd\x8d\xf06H\
+ \x12\x5c.Pz\x05\x81\xcf{5/C\xd7Q\x98\
+\xef\x06z\xf1\x08\x18\x86!S\xc7\x8da\xd1w\xdf\xd1\
+\xb0i\x0bF\xbe\xf5\x16\x91\x91\x91\xf4\x1e6T\xd5\xaa\
+\xdfP\x16/\xf8\x86E\xdf~\x1dD\xf3\xde]\xbbx\
+\xf1\xa9'Y\xf1\xeb\xaf\xb4\xba\xa3=s\xe6}E\x93\
+\xe6\xb7+C\xcc\x1dS\xa2{\xdf\xfes\x13\xa4\xf1l\
+\xef\x17T\xc5j\xe5i\xdf\xb1\xa3\x7f\xdb-\x11\x02\x11\
+\xe1\xb6\xd6\xad\x198b\x0c\xe9i\x19\x8c\x18\xd8\x973\
+)'\xfd\xeb\x17\x11\x0ds\x8b\x8b7\xa2\xec\xed\x82\xe1\
+GF o\x0b\x82\xa0\xc3g\x02\x91\x22\x96\xe1k\xc9\
+\xe7\x97&\x96\xcb\xbdv\x9aq\xfd:W._\xc4\xa6\
+ '#\xd3T5b\xbeC1q\xf4pV.\xfd\
+\x95F\xcdZ0b\xc2x\x1c\x11\x11\x08\xa6\xe5\xf5\xea\
+\xf8\x09T\xa8\x5c\x8dOf\xcdd\xeb\xc6\xb5\x80i\x0e\
+\x7f\xf1\xe1\x07\x0c\xe9\xdd\x9b\xeb\xe9Y\x0c\x1d1Z\x86\
+\xbf9\x81\xc2E\x8a\xfa\xa9\x15\xcfJ\x87\xb5\xf1\x8e\x88\
+H\xc6O{\xc7\xfb@yu\xa6o^\xf3\x8c\xe6\xd6\
+\xed\xda\xd1{\xc8k\x92v\xf9\x1a#\x06\xf4\xe3\xdc\xe9\
+\x14A \xed\xeaU6\xaf[\x87C)\x8e\xed?\xc8\
+\xef\xcb\x96\xf9\xb6\x14Y,\x8f\xd0s\x9d\x85\xb7\x12\x9e\
+w\x1e\xf0\xdb\xe4\xe0\x11@`\xe4]\x05\x14\xf2\x97\x18\
+>/[\x84};\xb7\xc9\xfcO>Q\xfbv\xeeA\
+\xcf\xd3qhv\xde\x197\x9e\xc5\xf3\xe7\xcb}\x8f=\
+\xaa6\xad_\xc7\xba\xe5\xbf\xabf\xadZ3l\xcc\x18\
+\x1c\x11\xfeG\xcc\xc7\x17.\xa4\x86O\x9e\xc6\xd0\x9e\xcf\
+0e\xf8p*T\xae\x06Jc\xef\xae=\xd4\xac[\
+\x87!\xa3FQ\xaaL\xe9\xa0\x88\x80I\x9f\x16\x92\xce\
+BE\x0a{\x09\xf5\xef\xb5\xbe8\x87\xa7\x5c\xfb\xce\x9d\
+Uvv\x06\x9f\xce\x9c\xce\xeb}z\xa9\xc6-Z\xb1\
+j\xe9Rr\xb3r\x95C\xd99\xb1\xff\x08S_\x1f\
+IDT$wt\xbe\x87\xa7z\xf7\x226.\xde\x12\
+\x9e\xf6\xdd\xfd>t\xe3~\xee\x8d\xb0\x08~\x0bd\x1e\
+\xf3\xc7\xdfS\x0f\x81\x14\xe5C\xe6e~\x18a|\xff\
+\xc5\x172o\xf6\x07J\x19\x96}G\x86\x01\xa2q\xf2\
+\xe0Q5s\xd4XP6\x1a\xb5h\xce+c\xc7\xba\
+G\x86\xffx\xd6u\x9d\x8b\x17\xceS\xb6\x5c%\x0el\
+\xdf\xc9\x91=\x070\x04\xba<\xfd\x94t\xef\xd9\x13\xcd\
+f\xf7\xad\xbc\x8a\xefK7\xfe\xab\x7f\xbeQr\xe5\xd2\
+\x05\xa2\xa2\xa3\x89\x8d+\xe4\xdf>KV\x11\xc5\xd7\x9f\
+\x7fLtt$\x0fty\x82\xfb\xba<\xc6\xb5\xabW\
+\xf9\xe1\xf3y,\xfba\x11\x88\x86\x18\x82\xcb\xa6\xb0\x89\
+\xc2\xa64\x8c<\x83\xdf\xbe\xff7\x07\xf7\xeed\xdc;\
+\xef\x13W\xa8\xb0_<\xce3\x1aP\x96\xce\xacB\xa4\
+\x05\x80\x7f\xf8=\xd4\xc4\x11J9\x06\xfc\x16`\xed\xca\
+\x15|\xf6\xde\x07\xcafs\xe0\xb4A\xe1z\xed)\x5c\
+\xa5\x0eJ\x83\xec\x0b\xa7H\xdb\xb1\x12\xdb\xb5\xf3\xa0 \
+>>\x1a\x9b\xdd\x8e\x18f\x971t\x9d\xdd\xdb\xb6\xb1\
+f\xc5r\xd9\xb2~\x9dJK\xbd\x82C\xb3\x99\x87a\
+\xa2\xb0Eh<\xfe\xec\xb3J\xd3\xecA\xf5{\xd4M\
+H\x10\xa1\xcf\xb3OQ\xf3\xd6[d\xe4[\xb3L\xce\
+\x07\xe51yx\xe1\xfc91OgP\xca0\x0c\xf6\
+\xef\xdc#JE(\x97\x18D\xdf\xd2\x8c\xe4\xceO\x13\
+[\xa2\x0cb\xb8\xb8v\xf2\x08\xa7~\xfe\x0c\xe7\x9f{\
+H9t\x82\xa9\xa3G1j\xeat_d6\x5c\xb8\
+8\xbf47\xfc\x8d\xd3\x80\xbcm&//\x97\x8fg\
+\xbd\x8brD \xf1\xc5h:p:\x89\xe5\xab\xe2r\
+ob\x13%d\xdd\xff4\xfb>\x1eC\xce\x9e\xf5\xac\
+\xfde\x19MZ\xb5&\xa9xIV\xfe\xf23\xebV\
+\xae\xe2j\xeaUl\x9aM\xc5\x17.\xca\xbd]\xbb\xd1\
+\xf4\xf6\x96\xac\xf9u\xb9\x1c9p\x88G\x9f\xed\xae\x1c\
+\x11Q\xde\x86z:\xba\xcfI\xf4\xac\xd8\x04\xd8(J\
+\xd1\xed\x99\x1eT\xac\x5cI\x89\xc5\xcb\x16\x0b\x0eOW\
+\x1d0\xf4u\xa5\xdc\xeb\x8f[6n`\xff\x9e\xbdJ\
+a\xa7\xe4\x9d\xddi\xd0\xad\x0f\x82\xc2i\x98G\xd2\xc6\
+'\x95\xa4T\xbdf\xec\x9a3\x9a\xf4m\xcb\xd8\xb9~\
+\x13;\xb7n\x91z\x8d\x9a\xa8P\x81\xb1@\x19a\xc9\
+\x12\x98\xfe\x0f\x04\x17\x85?\xd6\xae%\xf5\xf2U\x04E\
+\xfd\xe7^\xa3X\xf9\xaa\xe4\xe9\x06\xba\xcf)!6\xbe\
+\x10\x0d{\x8de\xc3\x88'P\xa9\xe7\x98\xf2\xda(t\
+\xd1\xd14;\x9a=\x82\xe6m\xdbq\xe7=\x9dh\xd4\
+\xac)\x9e\x93\xaf\xeb6jh\x06(='\xf2[\xfd\
+\x00\xcf\xcc\xe8{\x0b\x10\xefq\x17\xe2SZ\x9d\x1fx\
+\xc4M\xa6 \x96Sl\xbc\x07t\xfa\xb5\xc4\x1cA\xeb\
+W\xafFiv\x1c\x09e\xa9\xd7\xedE\x0c\x94\xd9\xb9\
+t\xd3bT\x026\xcdN\x9dg_e\xcd\x81\xcdh\
+Y\xe9\xfc\xb6h\x11\xf5\x1a5\x09\xcb\xc7\x1bM\x0f\xb9\
+\x84\xeb'\xe4\x02C\xa1\x8a]\xdbv\x8aR6\xe5(\
+V\x9a\xe25\x9b\xe0\xd2\x0d\x0c]G\xc4\xf0\xcd\x11\x86\
+`\xb3GR\xba]\x17N}\xfb6\x1av\x92\xeb\xd5\
+\x93\xd6\x1d\xef\xa6y\x9b6*>>\xde[\x91\xb7\x07\
+\x8b(\xaf:\x0a\xd8\xdd\xe1\x9d\xd8\xc4\xdc\xdb\xaby\xcb\
+\x98\xff\x89\xd7\x913\xb1y\x0d\x16oc\xc37\xec\xcc\
+\xc9S\x00$$7\xc0\x10\x1b\x86ax/O\x1f\xd0\
+\x95\x8e-\x22\x9a\xc4\x06m\xb9\xb4~\x11G\x0f\x1cV\
+\x9e\xb5O?\xb4\x81\xf3o\xb8gn\x08\xa9\xb2$\xec\
+\x8f\xd0\xb9\xaf\xa6^Q\x001Ie\x10\xdd\xf4\xa4\xcd\
+\xb7U\xdd\xc7x\x02\x8620P\xc4\x95\xaa\x8c\x81y\
+\x9c\xea\x88\xa9\x93UTt\xb4\x1b\x8b\x04`\xb5\xd0\x1d\
+ju\xccb\xba\x18\x86\xe1\xaf\xac\x949\xaf\xf8>\xc7\
+g9_\xde\xdf\xcc\xf2\xe3\x89\xee\xca\x93\xe3G\x8e\xaa\
+\x0bg\xcf\xa1\x94AD|Qt\x97\xee\xf59<\xaf\
+y\x1b\x16\xacQE\x12\x11M#;;\xc722\xc3\
+4$\xbf\xf9\xd8\xbddd\x07P.\x97\xf9b6\x9a\
+\xff\xd2\xb6U\xf9\x85\xeaTnk!\x22\xd2\xbd\x9d\xd4\
+\x99\xe1f\x90\xd9\x08\x8f\xefa\xe5\x843\xfb\x0a\xd8l\
+hv\xf7\xcb\x9f7\x02!:\x85U\x80\xba\xcb\x85R\
+\xe6\xd9Yb1i\x82x\x110\xf9\x8b\x08\xd9Y\x19\
+\xb2w\xe7.\xb5y\xdd\xef\xb2e\xc3F\xae]\xbe\x82\
+\xdd\x1e\x89R\x90s\xf1\x84\x89\xd7\xfb\xba\xb5\xe0=\xa0\
+\xc0\xadB\xb3\xaf\x9c\x06\xcdF\x91\x84D\xff\xca\x0a\xe2\
+\xa3\xf5o\x01\x97+O\xc0\x14\x88\xa4\xe7\x5c\xd7u]\
+\xcf\xb3\xdb\xb4\xc8|\xa5\x18\xe2\x99BQ\xb9jU6\
+\xae^\xcb\xf5\x13\x07\xc9K\xbb\x88-6\xc1\xd7\xab\xf0\
+XA\xa6\x89\x9a\xba{#\x1a6J\x94)\x8d\xc3}\
+\xf4\x91\x95\xbe\xdc\xecl\x22\xa3\xa2\xbc\xa7\x94\x86\x92\x86\
+\x07\xf3\xd5\xd4T\x16\xcc\xfd\x94\x0d+\x96\xe3P6f\
+\xbc1\x9af\xad\xdb\xd0\xe5\xe9g(\x9aP\xcc\x8d\xd7\
+3o\xb8\x19i\x08\xe7\xcf\x9ea\xeb\xc6\xf5lY\xbf\
+\x81\x83{\xf6\xa8\x9c\xecll6\x87B\xb3Q\xaa|\
+e\x1c\x9a\xc6\xb9\xd3)\x5c\xde\xb9\x11#\xf3\x12**\
+\xc1\x17F\xf1.%\x18\xb82\xaeqi\xc7z\x10\xa8\
+\xdb\xa8\x91\xb9\x85<\x9c\x05\x15\x8e\x8f\xeeQ\x9c\x96\x9e\
+\x9a\x05\x88\x1d\xe0\xec\xb9s\xd9\xce\xbc\xdc4[\xb4#\
+p\xd7\xf0\x0d\x80\xd0\xf2\x8e\xb6\xf2\xcd\xc7\x9f*e\x18\
+\x1c\xf8z\x06\x0dz\xbdIn\x9ea\xc6\x97t\xdd#\
+\x162R\x8epu\xdbZ\x94@\x8b;\xdaY&i\
+\xcf(RL\x9f0\x92\x87\x1f}\x82j\xb5\xeaz\xbd\
+\xeaPm\xbbp\xf6,\xaf\xf5\xeaEZ\xea544\
+l\xa2\x91\x99\x9a\xc6\xf2\xef\xff\xcd\xa6U\xbf\xcb\xb8\xf7\
+\xdf\xa3T\xd9\xb2\x0a\x04C\xd79z\xe8\xa0lZ\xb3\
+ZmY\xbf\x9e\x94\x13'MA)\x0d\xcdf\xe7\x96\
+\xda\xf5\xa5Q\xf3\xe6\xea\xb6V\xad\xa4l\x85r\xea\xcc\
+\xa9S\x0c{\xf6ytg.;\xe6\xbcA\xc3~\xe3\
+1T\x8c\xfb\x85 \x93\x83zN:\xfb>\x1c\x83r\
+\xe5\xa1\xd9\x14\x9d\x1ez\xe0/\x1bF\x0ad\xf7\xce\xed\
+\x17\xc1\xe7N\x95\xfei\xf5\xb1\xa5\x89I\xa5\xeb\x84Z\
+\x80\x09g\xa2\xf9F\x9c\xf0\xd1\x8c\xe9,[\xb8\x08D\
+(R\xaf\x15\x95\x1f\xe9\x85\xa3p\x09\x5c\xba\x0b\xdd\xe9\
+\xe4\xe2\xa6_9\xbbx.Fn&E\x92\x8a1\xf3\
+\xf3\xb9D\xc7\xc6\xfav\x9d\x18\xc2\xbaU+\x98:~\
+\x14\x95\xabT\x96\xa1#\xc7\xa9\x92e+\x00\x81\x1b\x84\
+\xccs\x80_\xeb\xd3\x8bc{\x8f\x80R\xc4U\xaf\x8f\
+\x16\x9fD\xee\x99\xe3\xe4\x9d\xde\x8b\x86\xa2R\xcd[\xe4\
+\xa9~\xfd\xd9\xb0r\xa5\xda\xb0z\x15\xa9\x97.\xa1\xd9\
+\xec\x80\x22&\xbe\x90\xd4k\xd2D5h\xda\x84\xfaM\
+\x9aR,\xa1X\x90k\xb9\xe8\x9b\xaf\xf8\xf2\x9d\xf7\xd1\
+\x94\x86\x8a+B\xe9;\x1e\x22\xaalM\x5cyyd\
+\xa6\xec\xe7\xe2\xba\x9f\xd13\xd30D\xe7\xb1\x9e\xcf\xd1\
+\xf5\xa9\xa7\xdc\xbc\x08\xfe\x1aCA\x1a+7';\xfd\
+\x91N\xc9-.\x5c\xb8\xb0\xd7\xf3\xac\xe8\xdc\xf9k?\
+H\xbe\xb5\xd1#\x05\x8a3\x0c8\xf3\xf2\x980l(\
+\x07\xb6n7+\x13ED\xe9\xaa`s\x90s\xfeO\
+\x943\x17\x03pDG\xca\xc8\xe9S\xb9\xa5V-\xbf\
+\xf3Z\x0e\xee\xdb\xcb\xc4Q\xafq-\xf5\x1a:N\x1a\
+5k\xc2\xaboL\xc6\x11\x11\xf8\xc1\x06\xe1\xe0\xde\xbd\
+\xbc\xda\xab\x0f6\xcdN\xa5\xae\xfd)\xd3\xf2~P\xe0\
+r\xe9\x1c[<\x97\xcb\xbf|\x84\xa6\xccuvl6\
+\x0c\xd1(Q\xbe\xbc4n\xd9B\xd5o\xda\x94Zu\
+\xea\x88#\xc2w\xd0\x8c\x9f\x87\xed\xa9E\xe0\xab\x8f?\
+d\xf1\xdc\xcf\xd1\x94\xcd\x12\xf9\xf5\x1cdf\x1eHq\
+\xdf\x13OH\xf7\x17\x9eW\xbe3\x83\x0b\x5cS\x0c\x82\
+\x8b\xe7Sv\xdf\xdb\xaezg \xc5cee\x1f8\
+\xb0s\xcb\xdf\x11\x88#\x22\x82W'M\xe6\xdbO?\
+e\xe9\xfco\xc5\x95\xe7T\xcesG\xcdyF\x04\x1d\
+E\xcdF\x0d\xe91p\x00\xe5*\x96\xf7\xac\x88\xba\x9b\
+\xa0\xa8Q\xab6\xef}>\x9f!/\xf6\x90\x07\x1f\x7f\
+\x82v\x1d\xef\x09y\x86\x8b\x88\xe2\xf0\xfe\xfd(\x9b\x86\
+D\xc5S\xa6\xd5\x03 \x1a(!\x22\xd2N\xb5\xfb\x9e\
+\xe6\xd2\xef\xdfBn\x06\x15\xaa\xdd\x22\xcd\xdau\xa0q\
+\x8b\xe6\xaaB\x95JV\x8f\xde\xdc\xc1b\x18\xccy{\
+\x22\xcf\xf7\x1b\xea\xf6}\xfc\xe7\xac'\x9e\xebI\x9d\xfa\
+\x0dd\xe1g\x9f\xab\xfd;v\x09\x86i\x86+\x87M\
+j7l\xcc\xfd\xdd\x1eWu\x1a6\xb0,\x89\xde\xbc\
+0\x00N\x9f\xfas\x07\x90\x0e>\xb37\xef\xebO\xde\
+Y\x7f\xcf}OdFFF\xc7\xfe%\xac\x80\xc3\xe1\
+\xa0[\xcf\x9e\xdc\xfb\xe8\xa3l\xdf\xb8\x893'N\x92\
+\x97\xe7\x22\xa9TI\xa9\xdd\xa8\x81*W\xb1\x02x_\
+\x9f2\xad\x14k\x13\xa2cb\xe85x0\xb7\xd4\xac\
+\x13\xf2\xf8[q;\x13y9\xee/\x96j\xe2\xf5;\
+\xc0\x9c\xaf@!6\x07\x86\x18\xdc\xf7\xc4\x93\xaae\xfb\
+\xf6(\x04\xcfWK\xbd\xeaBD\xde\x1a\xfd\x0a\xebV\
+\xafP)'O\xc9\xabc\xde\x22\xbeP\x11%\x96\xc0\
+\x9d \xdc\xda\xa0\x91\xaa\xdd\xb0\x11Y\x99Y\x5c8{\
+^\x1c\x0e\x07\xc5K\x974\x0f\xacq\xe7\x0a\x8c\x1e\xdf\
+\x1c\x88\xacZ\xbeh\x15\xeeo\x19z\x04b\x9c:u\
+\xe8\xe4\xc9\xe3\x87\xfe\xa8\x9e\x5c\xaf]p\x19\xf7=\x5c\
+\x9d\x01\x8a1\xbepa\xd5\xfa\xee\x0e^\x0b\x0273\
+\xccC\xc4\xccLJ\x85\xeeX\xb5\xea4\xcc\xe7\x83\x90\
+\xa6\x00\xaa%\xd74\x83\x96\x19\xd7H\xdd\xbf\x81\xc4\x9a\
+\xb7\x9b\xde<\x06\x17v\xac\x86\xectD\xa0l\xc5\x8a\
+^\xab\x08\xf0\xcdWb\x9e<Q\xa7aS\xfeX\xb7\
+N\xdav\xe8HL\xac\xfb\x831n\xff\xc6\x7f'\xa7\
+\x22:&ZU\xacR\xc9\xe2[z\xdar\x93\xdfp\
+\x09\xe0\xe5\xe5\xcb\x17N\xfc\xf0\xed\x87[1\xdf\x0a\xf1\
+\xfb\x16\xab+22\xda\xd1\xac\xf9\x9d\x9d|\xa4\xdf$\
+\x04\xcd\xfa\xfe\xcc\xf04 \xf4\xf6H\x0b\x8e0\x8e\xb4\
+G\xe3$\x96(\xce\xe6\xdfW\x91\x9d\x96A\xea\x8e\xdf\
+1D';-\x9d\xf3\x1b\x97pv\xc9\x5c\x94\xe8T\
+\xafs\xab<\xd4\xfd)/U\xde\xba}D\xaa\xea5\
+j\xa9:\xf5\x1b\xd0\xace[\x94\xf5`\x16?\x82-\
+s\x83\xf2%\xfb\xf0\xfd\x0dP\xf0\xfb\xf2\x1f\xe7\xae\xfc\
+\xed\xdf?\xe3\x1e!\xca\xff1\xb7|\xb3h\xc7\xe7\x15\
++\xd7h\xfc\xf7j\xfa\xcf\x80wO\x14p\xea\xcfc\
+\x8c\xe9\xdf\x9f\xec\xf4L\xacR\xd7\x05\xe2\x13\x8a0f\
+\xd6,1\xcd^\xdc\xbc\xf4\xf7\xd4|\xa11e\x0d\x93\
+\xfd\x8fB\xda\xb5\xd4sOvi\xdc\xf5\xd2\xb9s\x7f\
+\x00.\x08\xfeZqNffF^\xcb\xd6\x9d\xeeR\
+\x1e7\xba u\xe5\xce\x13nOpX[\xf9F\xc1\
+\x9d?\xd0\xf1-R\xb4\x18\xb7\xb5\xbb\x93\x8c\x8c\x0c\xae\
+\x5c\xbe\x82K7(\x92T\x9c\x16w\xdd-\x03G\x8e\
+ \xb1Dq_\x11e\xf9\x1a\x9c\xb8C1\xd6\xde\x1f\
+\xca&\xbd\x91\xf6\xdd \xed^2\xb0\xe2\x10Y\xf4\xfd\
+\xdc\xf7W,\xfd~1\x90a\xcdc\x05\x05T\x9a\xf8\
+\xf6\xb7\x13Z\xb5\xbd\xa7\xebMq.\xb4S\xfd\xf7 \
+,NO\x0f7\xe9\xd3].\x9cyN\x22\xa2\x221\
+\x8f\x8c\xbd\x91^t3\xf5\xdd\xe0\xf3\x9b\x80\xe3G\xf7\
+n}\xe2\xc1\xe6=\xc1\xb9\x1b\xdf\xa1\xa4\xc1\xdf\xf3\x06\
+27\xad\xfb\xe5\xec\x1d\xed\x1fnV\xa8p\xb1\xa4\x7f\
+\xa6\xfa\x7f\x1a\xfc?\xde\xa2i\x1a6\xbb\xdd\xfd\x22\xa9\
+\xa7\xe7\xff?\xd0A7\x08\xe9\xe9WR_\x1f\xf2\xe4\
+\xab\x97.\x9c\xde\x0c\xe4Z\x9f\x85\x12\x88\x9e\x97\x97\x97\
+\xb6s\xc7\xfa3\xad\xef\xb8\xef\xf6h\xdf\xbe\x99\xffz\
+\xf8\x0f~\xaf\xfb\x1f\x83\xdc\x9c\xac\xaci\xe3\x07\x8f\xd9\
+\xb0\xe6\x97%\xc0\xd5\xc0\xe7\xe1\xc2\xady\xa9\x97/\x5c\
+<x`\xd7\xb9\x16\xad\xeen\x16\x15\x15\xf3\x97}\x93\
+\xff)\xf8_\x22\x8c\xecwg\x0c\x9f\xf2\xe3w\x9f|\
+\x0d\x9c#\x84\x02\xcc/\xfe\x9du\xee\xcc\x893{v\
+lHi\xdc\xacm\xbd\xb8x\xef\xd6\x8d\xff\x83\xbf\x00\
+\x19\xe9i\xd7\xa6\x8e\x1f<\xe9\xc7\xef>\x9e\x07\x9c\x82\
+\xd0\xfb\xbb\x0bZ\x90\xc8\xbcp\xfe\xf4\xe9e\xbf}\x7f\
+0\xb9f\xbd\xd2%KW(\xab\xfe7t\xc5\xff.\
+\x90\xe3\xc7\xf6\x1f\x1e\xf1r\xf7\xb1\xeb\xd7\xfc\xbc\x10H\
+\xc12\x89\x07\xc2\x8d\xac\x10eegf\x9c\xf9\xf9\xc7\
+y{\xf2rs\xb2*W\xadY1:&6\xee\xff\
+\xe4R0df\xa4__\xb4\xf0\xd3\x85\xaf\x0fz|\
+\xd2\xd93'W\x02\xe7\x0932<p3\x5c\x8d\x00\
+\xca\xc6\x15.\xdc\xb0G\xaf\x11\xf7\xdfq\xe7\x03w&\
+\x16/]\xe2\xff\x04\xe3\x0f\x22B\xc6\xf5\xb4\xf4\x8dk\
+\x7f]\xff\xd1\xbbc\xbeKI9\xfe\x07\xf0'nO\
+\xbc \xb8Yn* \x16(\x13\x11\x11\x93|\xd7\xbd\
+]Z\xb4iw\xffmU\xab\xd7\xa9\x96\x98X*A\
+\xb3\xdd\xd8\x9a\xacu\xf9\xf5/~\xcd\xf7\xbf\x0a\xc40\
+HK\xbbr\xf5\xcfc\x07\x8eo\xde\xb0b\xeb\xc2\xf9\
+\x1f\xacIO\xbf\xba\x17s\xaeH\xa7\x80Qa\x85\xbf\
+\xca\x0d\x05D\x01E\x81\xd2`+W\xb6|\xc5\xb2\xf5\
+\x1b\xb7\xaaT\xb6l\xa5\xa4B\x85\x8b\xc4\xdbl\x11v\
+\xff\xd1\xe3\xd9;\xe59j\xc6L\xfb\xdf)\x10\xc1\xe5\
+r\x19\x99\x99\xe9\x99\x97.\x9c\xbd\xbcc\xeb\xfa\x13'\
+\x8e\xef;\x95\x97\x97w\x068\x0b\x5c\x06\xb2\xb8\x09A\
+x\xe0\x9f\xe0\x86\x068\x80h\xf7\x15\x85\xa9\xde\xfe7\
+r\xfaf@0\xe3O9\x98\xcc\xcf\x01\xf2\xc8g\xc2\
+\xbe\x11\xf8\xff\x00\xd6\xc2\xc0\x07$4y)\x00\x00\x00\
+\x00IEND\xaeB`\x82\
+\x00\x00\x1b\x18\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00@\x00\x00\x00@\x08\x06\x00\x00\x00\xaaiq\xde\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00\x1a\xcaIDATx\x9c\xe5\
+{wx\x14\xd5\xf7\xf7\xe7\xcc\xee&\x9b\xde\x03\x09!\
+\x84\x9e@\x82\x09\xa0\x12z\x17E\x8a\x08|E@\xa5\
+(\x84P\x02R\xa2H\x91& \x1d44\x11\xa5\x83\
+\x88t\x95jH\x80P\xa4\x07\x03!\x09\x81\xd0\x92@\
+z\xd9\xdd\x99\xf3\xfe\xb1m\xb6$\xf8\xfb>\xfa{\x9f\
+\xf7y\x0f\xcfd\xef\xdc\xb9\xf7\xdc\xd3\xee9\xe7\x9e\x19\
+\x80\xff\xcf\x81\xfe\xee\xb8\x94\x94\x9b\xcd|}\x03\xba(\
+\x95\xcaH\x01T\x8b\x14\xe4\xf0\xafR\xf6?\x04Ib\
+\x1d$\xe9\xb1N\xd2\xdd,(xq\xaay\xf3\x86)\
+\x00\xa4\x97\xcd\xabV\x00\x1d;vT\xaeO\xd81\xc4\
+\xd9\xd5m\x92\x83J\x15\xc1\xff\x18\xb9\xff>\x88:]\
+Fiy\xd9\xea\x83\x07\xb7\xac\x9b4iRyU\xe3\
+\xaa\x14@r\xf2\x95\xc8:\xc1\x0d6\xa9T\x0eQ6\
+\x0f\xd9j\xa6\xf1^\xdeo\x94\x96u\xbf5\x1e{T\
+\xd8\xc3W\x1dT3N\xab\xd3\xdd{\xf2\xe4\xc1\xc7-\
+[\x86\x9e\xb2\xf7\xdc\xee\xb4+\x972\x06\xd4\x0c\x0c\xd8\
+L\x029\x83_:\xdc\x0e\x05\xd6\x92\xf8o\xb8\x91/\
+l-U\xd8\x19c\x8f>\x06\x08 \x22\xed\xb3g\xcf\
+&GD\xd4^m=\xc9\x86\xa2\x0b\xe7\xd2\xfe\x13\x1c\
+Rg+\x00\xa5\x1e\x05\x81\xc0v\xc9\xb1&\xc6<V\
+\xff[\x15{\xd68\xaa\xeb\xab\x82-\x8b\xfe\xeaDE\
+2\xfa\x9e<}\xf2idd\xc8r\xf9\x14A\x8e\xf8\
+\xd0\xa13-\x82\x82\x8371\xa0d\xd3(\xb6a\x85\
+m.\xb6\x1a\xcbv\xc6X\x12\xca\x00\x98\x81J\x8d\xd6\
+.\xde\xea\xd6\xb3\xee\xb77\xd6\xf2^OO\xcd\x1a5\
+\x17'&\xdexK>\xde$\x80\x90\x90\x10u\xd3\xa6\
+\x11\xdf\x91@\xce\xf8\x97\x81\x19\xd0juX<\xefk\
+\xf4h\xd7\x037\xaf\xdf\x02\xff/xX\x06\x14!u\
+\xeb\xae\xff\xec\xb3\x05>\xc6>\x85\xb1q\xf4\xe8\xd9\x8f\
+}}\xfdF\xd8\xdb\xbdVH\xaa\xdd\x91U\x996\xcb\
+:\x0b\x0b\x0a1r\xd0(\xa4$^\x84N#\xe2\xc0\
+\x9e\x03 \x058\xaaes\x02U\xbf\xbe\x1d\xa6\xaa\xf4\
+\x06\xf6\xfc\xb0B\x10\xdc\x82\x83Cx\xdd\xba\x95'\x00\
+\xb3\x058\xfa\xd5\xa89\x8e\x0d\xf6#7#f\xc3e\
+h\x83\xcd}r\xbb\xb4~f\xd2(\x03\x92\xd5\xb8\xef\
+\xd6m\xc6\xfd\x9c<D\xc6\xaf\xc0k\x8bw\xc2\xfb\xd5\
+\xce\xd8\xb0z\x13=~\xfc\xc4\x12?,\xf1\xc9\xe90\
+\xb6aM\x8b\xbc\xcf\xaam\x9c\xe7\xeb\xe77\xb2m\xdb\
+\x9e\x9e&\x01l\xda\xf2K\x0b'\xb5s\x98\x09\x8f\xf5\
+\x82\xb0lK\x12#\xf5\xd6_\x9c\xf4\xc7Y\xbe\x93\x96\
+\xce\x92T\xc5\x9e\xb7Z\xbc\xbc\xbc\x82\x8f\xff~\x92O\
+\x1e?\xcd\xde\xe1MP\xff\xf5V\x08\xac_\x17\x11\xef\
+\x8f\x80\xc4\x02\xee\xa6\xa5\xdb\xce\x07p\xfd\xfa5\xb6G\
+\x07KU\x08\xc7\xdeXY[\xa1P\xfa\xcc\x9c9\xbb\
+\x07`\xf0\xf4\x8d\xeb5\xecV\x85\xd3\xb6\x81\xdb\xa9\x7f\
+\xf1\xacisq\xff^6\x11\x18\xcc\x12\x1a5i\xc0\
+s\x97\xcc\xa1\x90\xba!F\xa1\x03\x00\xce'\x9f\xe3\xc4\
+SI\x88n\xdb\x0a\xc7\x7f;\x85\x13'\xce\xa0NH\
+0y\xb8{\x22+\xf5\x06\x0a\x1f\xa6\xc1\xc9\xaf\x0e\xb2\
+\x8e\xef\x05H@H\xbd\x10}\x081\x03\xaf_\xbf\x8e\
+\xb6m\xdf\x8a\x85_-Bttk\x13\xfe\x94\xe4\xf3\
+\xbcu\xd3v\xdc\xbb{\x17\x0e\x0e\x8eh\xd5\xa6\x15F\
+\xc6\x8e ?\x7f\xbf\xbf\xc5\x87\x97\x8fw7\x00;\x95\
+\x00\x14jg\xe7W\x8c\x88\xed\xed\x1d#<|\xf0\x10\
+cF\xc6\x91\xa8tE\xf8\xf0O\xe1\xe4\xed\x8f\xe7Y\
+\xf7\x90yh\x1b\x8d\xf9`4\xb6\xee\xdf\x0e///\
+03\xfe\xbct\x85\xe7|1\x8f\x0ar\x8b\x90t\xfa\
+,\xfa\x0e\xe8\xc7\xdb\xf6\x8c@\x9d:\xb5\xf0\xe8a\x0e\
+\x8f\x1e\x12C'\xc6\x7f\x08\x89\x04\x80\x19-\xa3\xa3\x10\
+\x14T\x8b\xac\xfc\x0a\xbd\xf6z4\x12\xcf$\xa1a\xa3\
+F\xcc`\x02\x03\xdb\x7f\xd8\x815_'\x109\xb9\xc1\
+\xb9N\x13T\x96\x97\xe0\xe0O\x87\x91t2\x11\xeb\xb6\
+\xafG\xad\xdaA/\xf5SNN\xce\x11\x00T\x04\xc0\
+\xe1\xfa\x8d\x9c?\xbc\xbd}ZU+2\x06fN\x9f\
+\xc3\xc7O]\xa0\x9e+~\x84\xda#\x00\x123\x04\x81\
+\x90\x9b\x9e\x8a\xc4i\xc3\xf0f\xef.\x08i\xd8\x80\x7f\
+\xda\xb5\x8f**\xb5h\xd7\xae5?\xcf\xcb\xc7\x84\xa9\
+\xb1\x14\x5c'\xd8\x02]aa\x116\xac\xda\x80\xb3g\
+\xcebT\xdc(^\xb6x9\x1d>~\x10*\x95\xca\
+zY\x94\x96\x14\xb3\x8b\x8b+\x01\xc0\xa3\x9cG<\xb0\
+\xf7`\xf2n\xda\x12m&}\x05\x95\xb3+\x18\x8c\x9c\
+\xebWpi\xc1xD\xbc\xd2\x88\xbf\xdd\x9c\xf0\xd2\x8c\
+\xab\xac\xac,\xbbQC\xef\xa6J\x00\x02\x03\xea\x97\xee\
+\x00\x02.]\xb8J\xb5Z\xb5\x85\xda=\x00\xa2\x8e!\
+1 \x11\xc3\xb7^\x18\xbc\x9a\xbd\x86\xa3\x07N *\
+\xba\x00c'\x8eE\xa7.m\xa1P(l\x08\x11%\
+\x09EEE\xf0\xf4\xf4Dx\xf3\x08\xdcL\xbd\x89\xee\
+ou\xa7\xbd{\xf6!11\x11\x9d;w\xb1q\xfd\
+F\xe6\x01\xe0\xf7\xa3'\xa0c z\xfc,\xa8\x9c\x5c\
+\xa1\xd3\xea)\xaf\x15\x1e\x85\xbc>\x83\xf1\xe7\xee\x8d\x94\
+\x9b\x9b\x07_?\xdf\x97\xf0C\x8e\x00\x14\xe6D\xe8e\
+\x99\x06\x03\xe5e\xe5P9:A\x92\xf4\x9e\x9d%@\
+\x92\x00\xad\x0eP\xb9:\xa3n\xa3\xbaX\xbd~\x19u\
+\xee\xd6\x01\x82B\x01\x06\x19\xb6\xb4\xfeb\x10n\xde\xbc\
+\xc1k\x13\xbe\x01\x00H\xcc\x10%\xfd\x02o\xf7}\x1b\
+G\x0e\x1ea\x96\x85!yT\x92\x0c\xa4<y\xf2\x8c\
+T\xee>P\xbb\xfbB\x12\x19\x92\x04\x88\x12\xa0\xd3\x01\
+\xee!a`A\x89\xbc\xbc|3\xfdv\xf8\x90\x83`\
+\xcd\xbbu\x98\x91{\xd0z\xf5\xeb\xf0\xd3k\xe7!\x08\
+:\x13\x03\x92\xc4\x10+K\x90w\xf3*\x1a\x866\x94\
+%4f5J\x00$C6\x16\x11\x11I\xd3\xe2\xa7\
+\x9bC\x97\x01\x7f\x97\xae\x9d\xf9\xcf\x0bW\xb1k\xdb.\
+\xae\xd4T\x9arJ=\xe3d\x0a\xa7\xfe\xfe~\xd0\xbc\
+\xc8\x85\xa6\xf4\x85\x05o\xa2\x04\x14\xde\xbf\x03\x12\x08\x81\
+\xb5\x02\xb9\xda\xa8 \x13\x82\xd2\xb8\xca\xdf\xc9\xc4>\x1a\
+9\x14\xf1\xe3\xe3\x91\xb2j&\x9a\x0c\x8e\x83\x83\xbb/\
+\x0as\xd2\x91\xbau\x05\xb8\xb4\x18\x03\x06\x0f\x80\xfe\x1c\
+`\x8bo`\xff~\xd8\xbac\x17\x1cT\x0e\x80\xf1t\
+A\x00\xe9y\xc3\xa3G\x8fI\x90TX9\x7f5R\
+\x92\xceq@\xed@*-)Cqa\x09J\x8a\x8b\
+QR\x5c\x8a\xd2\xd2r..(\x22\xa5\x04\x5c\xfcf\
+.^\x9f8\x1f\x0c5\x18\xc0\xf3{\x97\x90yh\x17\
+\xdauj\x03WW7\xaa\x92\x1f\x83'4>W\x1a\
+\xa5\xf8w\xa0u\xbb6\x14;)\x16\x1bV\xac\xc3\xc9\
+\xa4\x13`\x95#X\xa3\x01\x04\xa0\xff\xe0\xfe\xdc(\xb4\
+Q\x95\xceg\xcb\xf6\x9dP\xa9\x1c\x0c\x1a0\xacH\x84\
+\xca\x8a\x0a\xac]\xbd\x8e\x0f\xec=@\x91-\x22\xf1 \
++\x1bm;u\x83\x93\x8b\x0b\x1c\x1d\x1c\xa0rt\x84\
+\xa3\xa3\x03\x9c\x9c\x1c\xe1\xe0\xa0\x22G\xb5\x9aw\xfd\xb0\
+\x85\x0e\xef9\x88#\x1f\xf7\x82{\xa3pT\x16\x15\xa2\
+\xe8\xee_\x08\x0a\xa9\x85\xc9\xd3'\x81Mj\xb0\x03\x86\
+\xa5\x8d\x95\x12\xa5U\xffKa\xe0\xd0\xf7\xd0\xa6c;\
+\x9c\xfe\xed$6%lB\xaf\xf7\xfb!0\xa8&6\
+\xad[O\x9d\xde\xe8\x80\xa6\x11\x11&\xb5\xbe(x\x01\
+\xb5\xa3#;9;\x93^\xf3\x96\xf0\xec\xe9S\xceL\
+\x7f@\x0dB\x9fb\xdb\xcf\xdb\xd8\xd3\xcb\xd3H\xb5}\
+\xea\x19\xb8{\xf7\x0e\x1d\xff\xfd8\xba\xf6z\x03yO\
+r\xf9\xda\xa5sT?\xac\x11\x0f\x1c;\x8c\x06\x0c\x1e\
+\x00'g'\xa0\xca\xb3\xa8\xad L\x16\xc0\xc6\x00i\
+\xec\xb0\x97`\x1bH\x0b\x0c\x0a\xc4\xfb#\x86\xe2\xbb\xf5\
+\x9b\xf1f\xdf\x9eh\xd4\xa8\x01\xdc=\xdd1yl\x1c\
+\x96}\xbb\x1aaM\x9b\x02\x00\x8e\xfdv\x9c}|\xbd\
+\xa9s\x97.f\xe4\x0c<~\xfc\x04_/X\xc4\x7f\
+^\xfc\x13a\x11\xa1\xfc\xe5\x82Yd\xdc\xa0\xa5\xa5%\
+\x9c\x95\x95IM\xc3#d\xb4\xe8\x89\xc9\xb8w\x0fc\
+G\xc6\xe2\xad>}y\xc2\xe4X\xcay\xf0\x08\x03z\
+\x0e\xc4\xfa\x1d\x1bd\x12#\xdb\xedl\xe2\x8b\x0d\xb8\xcc\
+\xac\x09\x16w\xd5xK\xb9\xe4\x8cf,\x91\x00I\xd2\
+\xbb\xb7\xee={`\xf4\x84q\x984v\x1c\xd2\xef\xdc\
+\x013\xa3\xff\xc0\xfe\xd4\xb1sgH\xcc`f\x88:\
+\x11\xdb\xb7n\xe3\xa1\xef\x0dE\x93\x88\x08\x9a4u\x0a\
+D\x91\xc9\xb8lAa\x01/\x5c\xb0\x00\x8b\x17.D\
+vv\xb6\xcc\x8112329fx\x0c\xbf\xfb\xde\
+\xfb\x18\xffi,\xe9\x9f1\xb4\xac3\x93M\x04Q\x14\
+!I\x92\x0d\xcd\x86\x016\x91N\x09\x18<\xed\xdf\xdd\
+\x032\x912\x08\xcc\x06\x7f\xcd@\xafw\xfa\xa2\xbcB\
+\x8b\x89c\xc6\xf17\xdf\xadGP\xed`2Z\xd2\xdd\
+\xbbw0w\xf6<\xa8\xd5.\xb4a\xf3&\xd4\x09\xa9\
+\x8d\xdf\x0e\xffN\x92\x81K\x06\xe0\xec\xec\x82\x1a5\x02\
+\xa8\xa0\xb0\x08j\xb5\xdaDg\xd6\xbd\x0c\x8e\x1d1\x06\
+o\xf7\xedC#c\x86\x99\xfa%\x89I4N&\xbd\
+\xe6\x7f\xfc\xe1{\xf6\xf4\xf4\xa0\xbe\xef\x0c\xa8\x96\x03\x0b\
+'h\xc4\xf1?\x05&\xbdf\xe5\xc2\x1b8h\x00\xca\
+K\xcb)\xee\x93X\xac\xdc\xb8\x0e\xde\xde^\xd8\xb4n\
+\x13\x0e\x1d<\xc2\xa3\xc7\xc5P\xef\xbeo\x9b\x08`C\
+\x847NW(U\xf4\xc9\x98\x18<{\xfa\x04>~\
+\xfe`\x06\xb2239v\xf8\x18t{\xeb-\xc4N\
+\x8c\xb5`\xc0\x18(\xd9\xb4g\x81\x0f?\x1aIFE\
+WK;d\x020\xd7|\xece\xceU\xdc3\xc0,\
+\xc2\x5c\x032\xf6\x01CG|\x80'\xd9\x0fx\xc8\x9b\
+\xfdH\xe5\xa8\xe6\xf6=\xbaa\xfb\xde\x1d\xe4\xe1\xe9n\
+\xb1\x0a\x1b\xb6\x86\x91!\x00\x10\x14J\xd4\x0c\x0c\x023\
+\x90\x9d\x95\xc5\xe3F\xc4\xa0s\xf770q\xea\x04\xe8\
+\xad\x85\x19D$'D\x14%R*\xc9D\xa6N'\
+B\xa9T\xa0Z0l\x13s\x14\x90\xab\xd1^ \x87\
+\xbe\xb0TVZ\x06g\x17\x17\xc3\x10=\xfb\x15\xe5\x15\
+\x989\xf53\xa8T\x0a\xf6\xf1\xf3GzZ:e\xdf\
+\xcb\x22\x85\xd2\x01\x12\xeb\xa8\xff\xfb\xef\xc2\xdd\xc3\xdd\xd6\
+\xd2\x0c\xd9\x90\xb5\x15\x11\x01Y\x99Y<nd\x0c\xda\
+u\xeaB\x13\xe3\xe3 I\xfa\xbc!\xf1\xf4)\x12u\
+:\xee\xd8\xb5;\x11\x11\x13\x81DQ\x84B\xa10\xf0\
+%\xf1\xa2\x05s\xe9\xf3\x19\xb3\xab\xe5\xdf\xc2\x09\xda\xcd\
+\x04M\xf7dj\xdf\xbd\x93\x86%\x8b\xe7\xb11S$\
+\x22\x80\x09\xb9\xb9\xb98\x7f\xf6\x22.\xa5\x5c\xa1\xc6M\
+\xc21\xf1\xb3x\xec?\xfd\x1b/Z\xbb\x12\x13\xbf\x88\
+\xc7\xd4q\x13\x90\x9e\x96f\x91\x89\x15\x17\x97\xf0\xc3\xfb\
+\xd9\xd0TT \xf7Y\x1e\xb3L8\xd9\xf7\xb31n\
+\xe4\x18\xb4\xe9\xd0\x91\xa6|1\x85\x8d1]\xa3\xd1\xe0\
+\xe4\xaf'yN\xfc\x1c\x9a0*\x16\xe5\xe5\xe5&\xab\
+c\x00\xe5\xe5\xe5\x984~<\x1d\xde\xff;V._\
+n\xcb\x97\xec2\x82\xc9\x07T\xbdi\xcc\x0f\x1a6\x0c\
+\xc5\x8c\xd9_\xe9=0\xc1d\x89\xa5ee\x5c+\xa4\
+\x0ef\xce\x99A\x8d\x9a\x84\x1a\x830\xbd\xd22\x0a\xaf\
+P\x14\x94j5\x7f\x1a;\x8e\x96~\xbb\x06\x8e\x0ej\
+\xfev\xc9J\xba\x98|\x9e\x88\x01\x02a`\xd7^\xd4\
+8<\x14#\xc6\xc5p`\xed \x8a\xfbd\x02^o\
+\xdd\x86&O\x9f\x0a6\x05A\xe0\xc6\xb5k\xd0iE\
+(\x14*\xf4\xec\xd3\x8b\x9d]\x5cI\x80`\xc8;\x08\
+j\xb5\x13\xe2\xa7\xcf\xc0\x973f\xf1\xe81\xb1\x86\x1c\
+\xba\x0a\xael\xf2\x80*X\xaf\x1a\x03Lqu\xdf\xee\
+_\xd0\xb7\x7f?j\x14\x16j\x8b\x88\x81.\xdd\xbb\x92\
+N\xabC\xfc\xd8I\x5cY\xa6E\x99FB\xcd\x8e\xfd\
+\xe1]?\x14D\x8c\xc2\xec\x0cd$\xfd\x8a\xcfb&\
+\x92\xbb\x97\x17\x9a6\x8f\xe2i\xb3\xe2\x89\xacbvT\
+\x8bW\x11\xd5\xe2UZ\xf6\xd5\x12\xbep\xfe<\xbd\xd2\
+\xa29\x88\x19D\x02$\x03\xb7\xfe5k`\xe1\xb2\xaf\
+\xa1rp\xa0*u*\xc3i\x7f\x0b\xc8\x06T\xb5=\
+\x00\x80%\x09Z\x8d\x06\x89\xa7\x92\xa8k\x8fn\xa6\xf3\
+\xcd\xac/\xe2QVVf1\xafU\xdbhhE\x22\
+\xf6\xaaA]\x97\xeeDtL<\xeau\xee\x8b\x90\x8e\
+\xef \xea\xa3O\xd1q\xd5\xcfp\x0f\x8fF\xd1\x8bB\
+\xbc\xd1\xfb\x0d\x22AaZO2\x5cF\x5cCG~\
+Hg\x13\xcf\x22\xf7i.\x04\x00\xa2(Zl[W\
+77\xaa\x8a'ke\xeb\x13!\xeb\xdaZ5\x97$\
+#\x0a\x92\x883\xa7\xcfp\xd3fM\xd9\xdd\xc3\x9d\x8c\
+D\x0c\x1c4\x04j''\x0b\x81\xed\xf8a;\x8a\xcb\
+\xb4h3\xedk8\xfb\x05\xa2B\xa3?F\xebt\x0c\
+\x9d\x0eP;\xb9\xa1\xf5\x94%P\xfa\x05b\xd3\xea\xb5\
+\x16\x0cYh\x8e\x01'gg\xf8y\xfa\xf2\x84\xa1\x9f\
+@Mj|\xd8\xe7?\xb8u\xfd\x06\xdb\xd2K\xd5\xf2\
+b\x12\x80\x042\x0c68<&\x99\xf3#\x1b\x0bx\
+\xf40\x87\xd7.[\x01\xd2\x898~\xe0\x08u\xe8\xd8\
+\xce|\xfab \xacI8`\x15\x8c\x93N\x9fa\xbf\
+\xa8VP{\x05C\xa3\xd3\x1f_E\x91\xa1\x13\x19:\
+\x9d\x04\xad\x0e \x85#\xea\xbc9\x08\xf7\xeff\xe2Q\
+\xceC\x86=\xc2\x01lX\xf1\x0dr\x1e<\xa5\xdao\
+\x0dEp\xff\xb1(\xd4(0kR<\x95\x95\x95\x9b\
+\xf9`C\x92f\xe2\xc9\xd6\xc1\x03\xa60(\xebb\xc3\
+\x1f\x13\xf1l\x0a\xbd\x0c\xe0I\xce#\x8e\x1d2\x9c\xca\
++%(=\x83P\xfc\xfc1~\xdb\xb7\x0f]\xdf\xea\
+\x0eA\xa1\x80\xa6\xb2\x12\x1a\x8d\x06\x95\x15\x15\x5cR\x5c\
+LZ\xad\x06\x92(\xf1\xb3\x9c\xc7T\xb7e\x0f\x88\x86\
+\x22\x8a(\xb1>\x8d6Y\x95\x04f\x01\x9e\xf5\x9b\x82\
+I\x811\xef\x8f$A)@\x14E\xe8D\x09\xa2N\
+\x07H\x12\x08\xfa\x22H@\xc7\x1e\x88\xfc`\x02\x18\x80\
+Oh\x13\x5c\x5c\x10\x83\xab\x97.#\xba][k\x9b\
+\xb1\xdc\xcfV\xec\x1a\x04 ?=Y\xbe\xda\xc8{\x96\
+\xc7\x8b\xe6\xce\xa7\x99\xf3\xe7\xc0\xd5\xcd\x0d\xbb\xb6l\xa7\
+\x0aR\xa2\xfd\xd2-p\xf4\xaa\x81\xfb\xa7\x8f\xe0\xaf\x0d\
+_\xe2\x9d\xf6\xddQQY\x09Q\x94\x0c\xbeQ \x81\
+\x04\x90>Z\x90\xa0\x10 i5\xfaR\xb6\xc4`I\
+_L1\x88\x18$\x09\x00$H\x92\x0e\x12\x09\xf8 \
+f$\x1a\x85\x85\x9a\xf2/\x22\x82R\xa9\x84R\xa9\xc4\
+\xd4\x98\x09\x80\xb6\x0c\x92\x08\xe8D\x06\x09J\xb0~!\
+\x83+\x94\xbboc\xdb\xda\xa5\x0bf\x01\x98\x12\x11;\
+\x09P^^>\xe5\xe7\x15rqq\x11\x5c\x5c\xdd\xe8\
+\xe9\xe3\xa7p\x09\xac\x0d\x17\xef\x00H\x0c\x04\xbd\xde\x11\
+\x7fm\x98\x83Q\x13\xc6\xa1}\xd7N\xa6\xd3\x16\x01\x10\
+\x14\x02\x94*\x15\x94\x0a\x05b\x06\x8f@~\xdaU\x08\
+\x82\xde\xfc\xcd\x06\xa6O\xb0$\xe8\x85\xf2<\xed*$\
+0\xdaw\xed\xcc^^^6\x91\x00\x00:\xbd\xd1\x85\
+\xf7\xef\xdeK.>\xcb!\xb8\xf9\xe3\xc1\xf1\xbd\xf0\xf6\
+\xf3Ad\x8b\x96\xb2Z\x03\xcbx\x97\xa9\xde \x03\xd1\
+P\x11\x10,\x90\xb3\x91t\xb3\xa4\x1a\x87\x85b\xd5\x86\
+\xd5T#@_\xb2\x0ek\xda\x04\xc5\xe9\xb7\xf1\xf4\xca\
+q\x88\x95\xa5\xb8\xfb\xf3Z\x90 \xa0Y\xcbH\xb8{\
+y\xc2\xc3\xd3\x03\x1e\x9e\x1ep\xf7\xf2\x80\xab\x9b\x1b\x1c\
+\xd5j(T*t\xe9\xd9\x9d\x0b\xef^G^j2\
+\x04Y&\xcb\x86-&\xb1\x04m\xd9\x0bd\xfd\xba\x1b\
+\xe1\x91M\xe1\xe9\xedEL\xc6r\x9a^Ii\xb7S\
+\xb11a-\xa7\xa4\x5c\xa4\x80\xa0`\xce\xdc\xbf\x0b\xf7\
+\xb6\xae\x86\xbb\x92\xf1\xe5\xe2\x05ppt\xc4\x95K)\
+\x5cX\xf8\x82\xc1\x06>\xacyb2\x5c2\x0b\x80\xc1\
+i\x98Tg\x9cd\xe8rvq\xd5k\x8a\x81~C\
+\x06\xe1\xda\xc5K|m\xe9t\x92\xa0Odj\xd7\x0d\
+B\xad`C\xd9[\x9e\xa6\x1b\xa5\xcf@\xbfA\x03\xe9\
+\xe8/\xbf\xe0\xf2\xaa\xcf\x115v><B[C\x12\
+\xcdip\xc5\xf3\xfbH]7\x1b\x5c\xf4\x1co\xf4\x1a\
+\x8e\xe2\xc2\x22\xb8\xb8\xba\xe1\xe6\xb5+\xf8\xe3\xe4I$\
+'&\xc1\xc3\xcb\x1f\xdd\xdf\xec\x81\xa5\x09k\xd8\xdb\xd7\
+\x9bn^\xb9\x86\xf8\xd88l\xdc\xb3\x0d\x82!l\xde\
+\xba\x99J\xee\x9e^pw\xf76\xd3c\xb2~sM\
+BN\xa2:\xe9B\xce9O/\x9fH\xbd>\x8c\x0f\
+\xcc\xfb\xc6\xf4\xc6\xdf`J\x92$\xe1\xd2\xb9s<\x7f\
+\xda\x0c\x1a\xff\xf94>\xbcw/\x854\xae\x87\xf1S\
+\xe3e\xeb\xc9\xb4\xcc\x8c\xdd\xdb\xb6b\xf7\x0f[\x10X\
+3\x00\x99i\xf7\xe0R?\x1c\xee\xf5\x9b\x01\x0a%\xca\
+\x1ee\xe0\xc5\x8d\x0bP\xa9\x04\xd4kX\x8f\xd3\xae\xdf\
+\x22W\x0f7@)p`\x9dz\xe8\xd0\xb53Zw\
+hG\xfe5|-\x88\x7f\xf8\xe0!\x0f\x1b0\x88\x8e\
+\x9d?#\x93\xbd\xa5\x0f\xb3\xa6\xc5\x08\xe5\x15\xe5O_\
+\x8d\xf0j,\x98\xccP\xc6\xbc\xb9\xcf,\x12\xadV\xc3\
+\xbbwlff\x06H\xc0\xab\xad\xdb\x90$\x10\xea6\
+nD3\x97,\xc2\xb5\x8b\x97\xb1\xfd\xfbM\x90X>\
+\x9f!1c\xeb\xa6\xef\xb1\xeb\xc7m\xf8j\xf5*,\
+\xfdn\x03\x86\xc7\x8d\x81\xbfP\x81\xa7\xc7v\xe0\xf1\xe1\
+\x1f\xa1z\x92\x81\x9e\xef\xf6F\xc2\x8e\xcd\x08}\xa5\x19\
+\xb1\xa0\x84F\xa3\xc1\xa2\x845\xb4l\xedj\xea\xdd\xff\
+\x1d\xf2\xf3\xf35\xfb)2$F\x0ch%\xd1Xq\
+7\xd1k\xcd\x0f\xdb\xfb\xc7\xb2\xd3\xa0\x11Yu 1\
+\xa8\xb2R\xcb\xc6\xf4\x9a\x01\xe8\xc0\x10E\x11\xee\x9e^\
+\x98\xb7r%&\x8e\x1c\x01\x1f\x7f?t{\xab\x97\xde\
+\x12\x98\xb1)!\x01\xbf\x1d:\x82\xa5k\x1388$\
+\x84\x00\xa0\xcf{\x83\xd0\xe7\xbdA8y\xf4(\x0e\xee\
+\xd9\xc5\xcb7}O\xf9yy\xf8z\xee\x5c<\xcf}\
+\x8e\xd9+\x16\xe1\xf2\xf9s<w\xeadZ\x9c\xb0\x8e\
+\xbd||MJ\xb4\xa4\x93!\xb1\x08I\x92\x88H\xc0\
+\x7f\x03\xa6Y6\xc9\x02[\xde+\x95*\x0c\xfe\xf0c\
+\x92\x8f'\x22CI\x0c\xf0\x0f\x08\xc4\x9c\xe5+\xb0q\
+\xd5J\x5c\xbd|\x11\x92\xc4X\xb3d)\x8e\x1f=\x86\
+\xa5k\x13\x10\x1c\x12B\xf2-\xc8\x00 \x10\xb4\xa2\x96\
+\xce\x9e9\x83\x8f\x87|\x80\xe0\xba\x0d\xf9\x9b\x1f\xbe\xe7\
+\x16\xaf\xbf\x86O\xe2\xe2(\xb2U4\xa6\x8c\xf9\x18\xcf\
+\xf3\xf3li\x02\xf4\xa1\x0flR\xa0\xcd;\x00+\x1e\
+\xac\x9f\x99\x04\xc0\xa6?\xb0\xcc\x81\xe4\xfd\xd6]z\x09\
+\x18\xccI\x8f\xb0^\xc3\xc6\x98<k\x0e\x16\xcd\x98\x8e\
+\xe5\xf3\xe6\xe1J\xcaE^\xbe~-j\xd5\xaem\x9a\
+c&V\x9f\x5c\xdd\xcf\xc8\xc6\xda\xe5+\xf1\xc5\xbc\xb9\
+\x18\x1d7\x8e\x0e\xef\xdfC\x1a\x8d\x06\xcc@\xcc\xc4\xc9\
+\x88\x88\x8a\xc6\xb411x\x9e\x9fo\x15\xad\x00K\xcf\
+-\xd7d\x15<X\xe7{\x90\x15E%\xcb\xe7\xa6\xb6\
+d\xaf\xcdr\xa1\xc9\x17g\xb4h\xd5\x1aa\x11\x918\
+}\xf47|\xb9\xf4k\xf2\xabQ\xc3|\x8e\x90qp\
+\xf3\xdaUl\xfdn\x03|k\xf8#a\xcb\x16\xbc\xd2\
+\xbc\x05\xfe\xbc\x90\x82-\x1b\xbe\xc3\xdaU\xcbQR\x5c\
+\x04\x00\x18;u2\x85\x867\xc3\xf4\xf1\xb1(*(\
+\xb0\xcc\xe5I0Q\xccV\x97\xbd>\x8b\xe7\xf6,\xc0\
+f\xa0QZ\xc6\x05M\x1a\xd4\x0f6j\xd2T\xd6\x02\
+\xb0y]\x02\xeeg\xdd\xc7\xeb\xed\xdb\xf1\xb7K\x16A\
+\xa7\xd3\x99B\x1d\x83\xa1\xd3\xe9\xb0i\xed\xb7\x98>)\
+\x8eC\xea7\x80\xb3\x8b\x0b\xd4NN\xd0j4\xc8\xce\
+\xca\x80\xa4Sp\xde\xb3\xe7())6\xe0%L\xf8\
+|:\xea5\x0a\xc3\xf4\xb81(..2\xd0f\x8e\
+W\xc6\xca\x94\xcd6\x90)\xab\xaa\xb3\x80\xad\x0f\xb0\xda\
+;\xd6\x821\x8fg@\xd2\x99\xbc\xa9$IX\xb5x\
+!'\x9fN\xc4\xc25\xdf`\xd2\xec/\xa9\xb2L\xc3\
+k\x16\xcd7y\xe7\x9c\x07\x0f1\xfe\xe3\x11\xb8~\xe5\
+*'\xfc\xb8\x8d\xa2\xdbw\x82(J\x00\x01J\x07\x07\
+\xf4\xee\xff\x1e\x06\x8d\xf8\x90&\xcf\x98\xc1\xfe5\x03\xcd\
+\x8b\x11!\xee\x8b\x19\xa8\x19\x14\x82\x19qcQZR\
+b\xa0\x8dY`\xc9Tv\xb7\xd0\xae\x1d\x1e,L\xc3\
+\x00\x0a\x00\xca\x0f\x87O\x1a\xa9V;\xd7\x94{Z\x9b\
+\xc8i\xae\x89\xf2\x95\x0b\xe7\xe9\xa7-\xdbp/\xf56\
+4\x15\xe5\xf0\x0b\xa8\xc9?\xae_G\xb7\xaf\xdf\xa2\x85\
+\xab\xd7\xc0\xcb\xc7\x07\x0a\x85\x02\xad:t\xa0\x1d\x1b\xd7\
+\xe3aV&\x1e\xde\xcf\xc6\xa2Y\xb3\xd1\xa3O_L\
+\xfal:\xb9\xb9\xbb##\xfd\x1en\xdd\xb8\x8e\xb7\xfb\
+\xbdkZ&,<\x02\x0e\x0e\x0e\xa4\x8f\xde\xe6\x0c\x8e\
+@\x88\xee\xd0\x89/&'\xe3\xd7}{\xe1\xe8\xe8D\
+?~\x9b\x80\x82g\xf9t))\x09E\x05\x85\xa8\x1f\
+\x1a\x0a\xa5RiK\xb3u=\x97\x00\x9dV[\xfa\xdd\
+\xba\xc5k\xcc\xef\x05\xe4\xa6 \xbf7N6Hq\xdd\
+\x92\xa5\xf8\xf5\xa7}`\x12 8\xb8!\xf1\xe8q$\
+\x1e\xf9\x9d\xdc\xbc\xbd\xb0r\xdb\x16xzy\xebS[\
+I\xe2;\xb7oS\xcd\xc0\xda8\xb6\xf7 \x04\xa5\x0a\
+\x0b\xd6\x7f\xcb\x0d\xc3\x9a\x90Ay\xb0\xac\x08\x13$I\
+\xc4\xf9\xa4Sh\xdd\xbe\xab\x95\xa2\x08?\xef\xd9\xce\x8d\
+\xc3\x9a\xd0\xd4y\x0b1j`?^\xf9\xe5<Hj\
+\x0fr\xaa\xd3\x0c\x0f\x9e\xe6\x22+a\x03\xce\x9d:\x89\
+y\x09\x09pvv\xb1d\xda\xda\x91\xcb\x9c\xa4\xd2\xfa\
+\x81\x0d\xc8\x04\x92|\xea\x14\x0e\xef;H>-\xbb\xa2\
+\xf1\xc08(]\xddP\xf6\x22\x0f\xe9\xdb\xbeFq\xea\
+9\xdc\xb9u\x13\x0e\x8ej\xfcq\xec\x18\x92O\x9d&\
+\xb5\xda\x09\xed;w\xc6\x8b\xfa\x85\x1c\xde\x22\x8a\x1a\x86\
+6\xb1\x08\xa3\xfa7\xc4f[\xab\xa8\xa8\xc0\xb9\xe4d\
+\xb4\xee\xd0\x8d\xc1Lr\xa5D\xb7\xed\x0077w\xbe\
+r\xf1\x02\xbd\xc8/!\xdf\xe8\xde\x88\xfcp\x1a\xa0T\
+B'\x8a\xc8<\xb6\x1b\x99\xbb\x96c\xfb\xfa\x8d<\x22\
+n\x02\xc9\xebaF#\xb0n[\x08\xc0\x1e\xef\x16r\
+`\xc6\xa1\x9f\x7f\x81\xca'\x00-b\xe6Bd\x82(\
+\x89p\xf3\x0f@\xe4\xb8\x858\xf7\xd9@|5\xe5s\
+(\xd5\x8ex\xadC\x07L\x9b7\x1f\x91-[B\x10\
+\x08\xe6\x84\xdc\x84L\xe6T\x04\x93\xffqrr\xc6\xc4\
+i3\xc1\x92D\xfa7=fU\xd5\xa8\x19H\x00\x90\
+|\xea4\x04WO4\x1f\x11\x0f\x11\x0ahu\x12\x08\
+@\xfd\xee\xef\xa1 5\x05'\x0e\x1f\xc1\xf0\x09\xe3-\
+\xcf$\xb0\xb4p&+\x0b\x90'\x06U\x03!;\xf3\
+>{\x85F\x93(\xea30\x96DC: \xc0=\
+\xac\x05\x90q\x19\xdf\xec\xdc\xce\x0e\x8e\x8e\x16\x9a\x06\xcc\
+\x05\x15s\xe8d\x88\x22C\x80\x99Q\xb3\xa3\xd5\x1f\x03\
+\xadI\xca\x7f\xf6\x84\xb3\xd2\xef\x91s\x8dZ\x10%\x01\
+\x92$\x82%\x09\x0c\x09,\x02\xee\xf5\xc2\x91q#\x99\
+*\xca+\xa0vr\xaa\x9a\x15\x19\xbf\x06\x01\x88\xe2\xcb\
+L\x80\xc1pqq!Mq>\x98%\xd9\xe2z\xd0\
+\x96\xe4\xc3\xc7\xcb\x13r\xe6mlO\x86K\xab\xd5\x22\
+\xebn\x1aJ\x8a\x0ap\xf7\xf6m4\x08\x0d3?7\
+\x1d\xbaD\xdcIM\xc5\xe5\xb3g\xf9\xd2\xb9dd\xa6\
+g\x90\x92T \x17W@\xd2@\x92\x04\x80\xf5tH\
+\x00J\x9fd\xc0\xdd\xcb\x1b\x8e\x8e\x8e6k\xda\xf0#\
+I\x22\xa0\x0f\x83Rey\xc5\x8b\xea\x92\x06#\x9e\xd7\
+\xa2[sQ\xea%\x14g^\x07A\xff\xc1\x93N\xd4\
+\xa1 3\x15\xc5\xb7\xaf\xa1yt\xb4io33~\
+\xd8\xb0\xca\x14\xcb\xcd\xb8\x18\xc5EE\xf8t\xd80\xfc\
+\xbag\x1f\x8a\x1e\xe7!~\xd8\x08l^\xbd\x86\x99\x19\
+\x15\x15\xe58\xf7\xc7)^9o\x0e>\xea\xdd\x0b\xd3\
+F\x8dFJ\xd29D\xb5jG\x8b\xd7m\xe4\xf8\xaf\
+\xe6\x83J\x8aqg\xe72\x10\xf4o\x82%\x00O/\
+\x1fG\xfe\x95$t~\xf3M6\xbe(\xad\x8e\x9f\x8a\
+\xf2\xf2B\x00\xa2\x12\x80\xf8\xa20?\xc3?\xd0\xf23\
+6[ \x0c\xf8h\x08]J\xfa\x037\x96\x7f\x0a\xff\
+v\xbd\xe0P\xa3\x1eJ\x1f\xa4!\xff\xfc\xef\xf0\x0f\xf0\
+\xe7\xbe\x83\x06\x99R\xd3\xad\x1b\xd7\xe2\xa7\xed;\x91\x9f\
+\xfb\x8c'~>\x8f\xe4{r\xfb\xc6\x8dx\x94\x93\x8b\
+\xba\x83&C\xe5\x13\x84\xc7\xc7w\xe0\xf0\x8e\xed\xf40\
+3\x83o]\xbdF\x22\x88\x22Z\xb4\xc0\xa0\x91\xa3\xb9\
+Et+\xf2\xf3\xf7'S4\x04\xd0s\xd0\x00\x1c\xdd\
+\xbe\x0b\xf9W\xcf\xc2\xa9vcT\xe4>B\xd9\x93,\
+\xd4\x0bm\xc4\x83F|T\xed\xfb\x00#\x14\x97\x14f\
+\x02\xd0(\x01\x88\xf7\xd2n\x9ek\x1c\x16\xf5\xc9\xcb&\
+\xb9\xba{`^B\x02~X\xb9\x8a/%\x1e \x9d\
+N\x0b\x85\xca\x01\xad\xbbt\xc2\x07\xb1\xa3\xe1\xe4\xe2b\
+\xa8\x07\x12\xde\x1d\xf2\x11\xb223yT\xdcg\x16\x0e\
+\x89\x99p\xe3\xcf\xab\xf0h\xf6:\x02\xdb\xf5\x05\x88\xe1\
+Y7\x14)q]\xa1\xd5\xe80n\xe6l4o\xf5\
+\x9a\xd1\x8fPiI1~\xd9\xbd\x0d}\x06\x0e6\xe1\
+\xf8 f,\x1a\x865\xe1c\xfb\x0e\xe0\xc9\xc3t\x04\
+\xf9\xfa\xa0y\xefQ\xe8\xfd^\x7fR\xd9\xf9\x12\xc5\x1e\
+<\xce\xb9\x9f\x02@K\x00\xe0\xe9\xe9\x19\xb2\xff\xf8\xbd\
+?\xd5N\xce^\x7fk6\x00Me%\x8a\x0a\x8a\xe0\
+\xe9\xed\xc5\x82BA\xc6b\x84\xdc\xf9\xea\xb4ZV(\
+U\xa6w\xb9l\xf0\x82\xf1\xa3G#\xa7D\x87\x96\xd3\
+6\x81\x99Q\xf4\xe0.n|5\x0cc\xbf\x98\x8e\xf6\
+o\xf4\x90\x17\xa3\xb0\xff\xa7\x9d\xbco\xd7V\xcc_\xb6\
+\x06A\xc1u\x89m\xbc\xb5U\x96CU~\x1dd\x02\
+Q\xd4i\xa7\x8c\xffO\xeb\xe4\xd3G.)\x00\xa0\xa2\
+\xa2\xa2\xbcU\xdb\xee\x0dk\x06\x04G\xfe]\x01(\x14\
+J8\xb98C\x10\x04\xb2\xad\xc4\xe8A\x10\xac?\x94\
+\xd4\x9f\x09\x1c\x1c\x94H9\xb8\x1f\x85\xe9WQ\x9c}\
+\x0f\x0f\x0fl\x80\x9b\x9b\x13\x8f\x988\x09*\x95\xca\x84\
+\x8f\x19\x08m\x1aAm:tA\xcd\xc0 2\xd7\xf6\
+\xe4\x97\xdc\xd3\xbe\x8cu=d\xa4\xdf>\xb1b\xd1\x94\
+\x04\x00\x1a\xe3Kt1'\xeb^N\x977\xdf\xfd\x8f\
+R\xe5\xa0\xb6\x9e \x97\xb1e\xdb\xfc!d\x15Y\xa7\
+\xcdx\x00\xa8S\xbf\x01<|\xbc\x91y\xf9\x02\x8a\xd2\
+o 4<\x8c\xc7\xcf\x9cA>~~\x86\x9dnt\
+%\xfa_gWW\xb2f\xce\x1c\x5c\xec3oM\x8f\
+\xf1W\xd2i5\xeb\xd7|91\xed\xf6\xd5T\xebY\
+\x0e\xf13\xbf\xf9\xac\xcf\xc0\xe1\xb3P\xcd[\xd5\x7f\x06\
+\xac\xf3\xb1\xaa\xfa\xfeyH:}x\xc3\x94q\xfd'\
+\x02(\x05d\xffc\x04\x80\x98\xf4\xc7\x91\xdb\x91-\xda\
+4\x08\xacU7\xcc\xfe\xf4\x7f\x0a,\xcb\xe2\xf2C\xcf\
+\xbf\x09\xe9wn$\xc7|\xd4-\x0e@\xae\xb1\xcf\xfa\
+;\x92\xd2\xa3\x07\xb6]\x88j\xd1\xb6a@\xad:\x0d\
+\x89\xfe}\xa2^\xee\xb2\xfe\x19\xb8\x9bv-e\xc2\xc7\
+\xbd?\xa9\xa8(M\x97\xf7\xdb\xfb\x90\xa6\xe0\xc8\x81m\
+I5\x02j9\xd5\xad\xdf$B\xa1P*\xed\x8c\xf9\
+\x7f\x06DQ\xd4\x9d9}\xe8\xa7I1}&\x94\x94\
+\x14\xfe\x05\xab\xfc\xb0\xaa/\x89\x0a\xcf\x9c:\x9c\x9c\x96\
+z\xf5V\xad\xdau\x03|\xfc\x02\x02\x04A\xf8\xef\xca\
+\xae\xff\xd7\x80\xa5\xbbi\xd7\xaf'\xac\x9c9'a\xc5\
+\xcc\xa5\xa2(f\xdb\x1b\xf52\xfbS\x00\x08x\xa5y\
+\x9b6}\x07\x0c{\xbb^\x83\xf0(\xff\x1a\xb5\x02]\
+\xdd<\xdc\x14\x0a\xa5\x92\x0cEQ\x8b\x10\x01\xfbfm\
+\xf3q\x97\xac\xdfDL5[\xce\xf4\x86Z\xf6k\x9c\
+\xc3\xcc\x90DQ,+/)\xc9}\xf2\xf0iVF\
+\xda\xf5\xa3Gv\x1eI:y\xe84\x80\x07\x00tU\
+\xe1\xfd\xbb\x1bP\x00\xe0\x0c\xc0\x07\x80\x1f\x007\x00\xaa\
+jg\xfc\xef\x83\x0e@\x09\xf4\x0e.\xdf\xd0~\xe9\xff\
+\x1e\xff?.\x13j\x8e#\xd0C \x00\x00\x00\x00I\
+END\xaeB`\x82\
+\x00\x00\x03u\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00\x03'IDAT8\x8d}\
+S\xcdO\xdbu\x1c~>\xbf__~0\xb0\xa5\x85\
+\xd2\xf2bC\x98\xeb\x868j\x8a\xc8\x90\x8dM\x0f\x9a\
+\x1dM<\xf1\x07\xcc\x83\xc6\xc3\x92\x9d\xf4d\xccb\xf4\
+\xe2\xf4\xe2k\xccbL4\x99\x17_\x0ef\xca\x81\x8d\
+1&BYD\xa0B\x81\xd1\x96Y\x0a\x1d/\xed\xaf\
+\xed\xef\xfb}<l'b\xf6\x5c\x9f'O\x9e\xe7I\
+\x1e\x01\x80\x99\x99\xb4\xbf\xa5%\xf4\xa6i\x9aq!L\
+<\x16ZS$Y(T?\xee\xed\xf5m\xcb\xccL\
+\xda\xdf\xda\x1a\x9e\x14\x91\xd8ai\xc5\xae\xc0\xb6m\xf8\
+\xfc\xbe\xffsZ\xced\x0a\x83\x86\xdf\x1fx\x8b\x90\x18\
+\x09\xdc\x9d\x9d\xe7\xc6\xbd,\x1dG3\xbd\xb2\xce\xcb\x1f\
+]\xe5\x87_\xfeHB\x98\xcbmro\xf7\x80\xab\xe9\
+uj\x02\x9a\xe8\x0e\x06\x1b/\xba4\x91 \x81\x95\x95\
+5~\x9e\xdc\x17\x95K\xe2\xd5D;C\xad-xy\
+8\x8e\xdb\xb7\xa6\xa0\x14\xc5k\xd5\xf1\xf2W?\xa1X\
+\x17\x967^\xb0y\xac\xe7\x98h2\xe1r4M\x97\
+\x06\x02\xc1 \xac\x7fo\xc0\xadK\x1c>{ZJ\xa5\
+\x03\xdav\x05S\xb7\xa7q\xfd\xd71\xfa\xfc>\x1c\xdc\
+\xcf\xc0\xf0\x0b\x9fh:\x01\xad\x01G\xd3\x94\x85\xa5\xe2\
+\xcf\x1e\xcb:\x0f\x02\xb3\x7f&\xd1\x14\xf0!\xbb\x91a\
+Ss\x10k\xe95D\xa3OBCa\xb7\xb8\x87H\
+[\x04\x85\xadm\x1c\xef\x89\xa1\xbe\xfe\x88T\xab\xf6\xef\
+\x86\x22\xa04Qs\x14J\xe52\x17\x17R\xdc}\xb0\
+\x8f\xd5\x7f\xd2\x08\x06\x82X_\xbd\x87\xe2\xce\x1e\x22m\
+\xedX\x98_DM9\xb2\xb8\x98\x82\x22\xa14\xf0\xc8\
+\x00\xa0\x18\xd0\x9ap{,\x0c\x0c\x0f\x89\xb8-|\xbf\
+n\xe1\xb7R\xa7ln\x16\x10\xe9\xec\x94\xe2\x83\x12\xd6\
+\xd2Y\xf6\x9e\xec\x83\xd2\x80C\xc0\xa54\xa0\x09\xe42\
+9\xfe0\x91BH\xcab\x88\xc9\xb9\xb9E4\x8c\xbc\
+(\x8a\xc0\xd2\x8d\x09\x8c\x8f\x8dc2\x99B\xb0\xbdC\
+\xaa5E\xd3eB)\xc0\xa5\xd4\xc3\x04G\x1a\x1b1\
+\xf2T3jN\x95\xf1\x81~\xd9/\x95\xb80\xfd\x1d\
+\xf2\x85\x22\xb1\x9fE}c\x82\x97.^@zy\x99\
+v\xb5&\x96a\x82\x04\x0cE\x0d\xa5\x01\xab\xbeA\x9a\
+#m2t\xee%\xf9\xec\xca'\xec\xeb\xef\x97\xc1x\
+7c\xed\x0d8{\xfe\x15lo\xe5\xe1\xf2x\xe1(\
+-n\x8f\xf5\xb0\x82&\x5c\xfa\xd1\x06\xcaq06\xfe\
+\x07'nN\xe1\x99D?\xae}\xf3-\x9f;=\x8c\
+\x9e\x93}\x12\x0a\x87I\x12_|\xfa5l%\x88=\
+\xddK\x8f\xc7+\x8a\x80\xa1\x1cR\x13H\xaf\xac2\xdf\
+yJR* m\x1dQ\x8c^x]L\xd3-\xf9\
+\xdc}V*U\xfc\x95\xbc\x8b\x0d\x09\xcaN\xd7\x19\xac\
+\xa4\x96\xa1\x09h\x0dm\x94+\xd5yM \xda\xdd-\
+\xa7\xdcY\xbe6\xd0E\x98\x06l\xdb\xe6\xf5\x9bI\xfc\
+2\xb9\x84\xed\xad\x1dD\x8f\x1e\xc5\xe8\x99\x1e\x8eXY\
+v\x1f?!\x9a@\xc5\xb6\xff\x96\xf7\xaf\x5c\xebx~\
+\xe8\xdc\x1d\xaf\xb7.|\xf8-\xbb\xc5\x22j\xd5\x1a\x83\
+\xa1\x169\xcc\xd5\xaa\x95\xfc\xf4\xd4\xad\x01\x01\x80w?\
+\xb8\xda\xd5\x1b\x1f|\xdb\xeb\xf6>+\x86a<\xee\xcc\
+$t\xadR\x9e\x9b\x9b\xbd\xf3\xde;\x97FS\xff\x01\
+\xd6\x09\xb2\xdc\xae\xc2\x95W\x00\x00\x00\x00IEND\
+\xaeB`\x82\
+\x00\x01\x13\xf0\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x01\x00\x00\x00\x01\x00\x08\x06\x00\x00\x00\x5cr\xa8f\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00 \x00IDATx\x9c\xec\
+}w\xbc]E\xb5\xffw\xcd\xde\xa7\xdd\x96\x06!!\
+\x81\x04\x08\x04\x90*\xbd<\x08\x84\x12x\x02\xd2\x94\x22\
+\x22E\x05E@\xc5\x06\x0f\x9e<Q@\x01\x0b\xa2\x80\
+\x14A\xaaJ\xefEDz/\x82\x88\xf4\x16\x08\x84\xd4\
+[\xcf=g\xcf\xfa\xfd1}\xce\xde\xe7^\x9eX\xde\
+\xe7\xc7|>\xf7\x9e]\xa6\xacY\xb3\xd6w\xad\xa9\x1b\
+\xf8(|\x14>\x0a\x1f\x85\x8f\xc2G\xe1\xa3\xf0Q\xf8\
+(|\x14>\x0a\xff\x1f\x05\xfaW\x13\xf0O\x08\xff?\
+\xd4\xf1\xa3\xf0\x8f\x0d\xfc\xaf&\xe0\x1f\x15\xfe\xaf+\x07\
+\xe9\xbfD\xff\x0a\xfd\x97\xe8\xdf\x8f\xc2G\xe1\xc3\x0a\xd2\
+\xfbc\xef7\xf3\xde\xff\x9f\x0b\xff\xd7\x00\x80\x00\xa4P\
+\x0a\x9e\x02H\xaf\xbb\xee\xee\xed;\xbb\xc7\xac4i\xe2\
+\xc4\x09\x02X\xafT.-KD\xdd\x22-\xaf\x90&\
+I\xa5\x94&\x10\x89\xc6\x02FX\xe3\xf8^\x22\x1f6\
+X\xff\xc5\xef\xe2\xf4#\x85\x91\xe2\x9b\xf2?\xec|?\
+\x8c\xb4\x7fO\x19\xff\xdb\xf0\xaf*\x13\xaa\x5cfF\xd6\
+\x94\x18n6\xd1\x18\xae\xbf#\x08\xfdY\xd6\x9c\xc7R\
+>\xdf;\xd8X\xf4\xfe{o\xff\xed\xd1G\x1f~\xee\
+\x84\x13\xbe\xfa\x1c\x80\xa6\xf7\xc7\xde\xdf\xbfu\xf8\xbf\x00\
+\x00\x89\xfe\xab\x1d~\xf8\xd1\x13\xf6\xdc\xfb\xc0\xbd\x96[\
+f\xc2\xccJ\xb5\xb6\xd3\xb81=\x93\xfd\x88y\xf2\xd2\
+\x02\xcb\xbe\x92\x8fF\xc0\x8a\xe2\xf8\xcf\xf3\x14\xd7\x13\xa4\
+\xc2`\xd2\x15\x01\xcfH4\xe6\xd5%\xfem\x97&.\
+\xc7\x84v\xe9\xdb\xd18\x12\xc0\xc6e\xe4\x05\x9f\xbe<\
+Zc\x1e\xe7]\x8f\x86\xb6\xbcx\x86.#4\xc2\xb9\
+\x98y\xd1L\x18\x18\xaa\xd7\x07\xfa\xfb\x9fh2\xdf\xfd\
+\xc4c\x0f=|\xe0\x81{\xdc\x03`X\xff\xfd[{\
+\x08\xff\xae\x00`\x94>\xfd\xe9O\x7f\xbd\xd9\x86\x1bo\
+\xbc\xe7\x84q\x13\xb6\x9b0n\xec\xaa&B\x0c\xady\
+\xed\xec?\x03\xa0\x9a\x80r\x22\xc6\x99\xe4\xc5Et\xcd\
+h\x95\x8e\x98\xb8\x22\xa5\xf0C\x91\x00\x8fF\xb9\xdb)\
+\x9c\xef\xb5\x8cDO\xfc\xbc\xc8\x131\xf7\xed<\x95\xd1\
+\xd6\xcf\xe7\xa3\xc9+\xef\xba\xa8^~\xdey|\xf3\xe3\
+\xf9 \x92\xc7\x8b<\xd0a\x80(\xbf\xe9\xe3\xaa\xc5\xec\
+\x1b\xac\x0f\xd7\xfb\x96.\xb9g\xee\xbb\xef^\xbf\xfd\xec\
+\x0d.E\x08\x06\xffV\x9e\xc1\xbf\x13\x00\x98>|\xf5\
+\xf0\xc3\x8f^\xee3\x9f9t\xefI\x93\x96?\xbc\xa7\
+\xabs\x9a\x1f\xe9\x03\xc3\xa8a\xb7\xdfZ\xbe\x90\x00\xad\
+\x82\x9f\xf7\xdeo\xb2X8\xcdo\x1e`\xc8\xe8Y\x8e\
+\xa0\xb5\xd0\x11+K^\x9e&\xafv\x0a\xe7\xdf\xe7\xd5\
+\xcf/+V\xc88\x0d\xa2\xf8y\xf7E|\xf5\xcb\xc8\
+S\xca\xbc\xb2F\xf2\x04\xf2h\xf7\xcb\xc8kG\x13\xc7\
+\xb4I\x1c\x0a\xf8_\xa4\xfcEN\x93\x9fu\xbd\xd1\xe4\
+\xfe\xde%W<\xf4\xc8CW\x1ex\xe0\x1ew\x03\x18\
+\x02\xd0\xf0j\xf6/\x0d\xff\x0e\x00@\x00J\x00\xca\xe7\
+\x9e{\xf9:[n\xbe\xd5\x11c\xc6\x8d\xdb\xb7\x9c&\
+-:g/\xdaYn?\xf8V<V\xb8X\x88}\
+A\xc9\x13`#PyV\xdfW\xc8X\xb9\xfcZ\xb6\
+s_}\x1a\xf2\xa4Kz\xd71\x8dE\x8aFQZ\
+\x9f\x0e\xff:\x06\xa2\xb8.\xb1\xc5/R2_\xb9\xda\
+\xd5\xcd\xcf\x97\x90O3\x0a\xf2\x8e\x81\xa0\xc8\xe2\xe7\x01\
+f;\x80\xf6C\x0c\x82q(\x90\xb7\xbcf\xf3\x7f\x97\
+\xf6\xf5\xbf1o\xde\xdb\xbf\xd8b\x8b\xb5\xce\x050\x08\
+5^`\x06\x16\xff%\xe1_\x0d\x00e\x00\xe5_\xfe\
+\xf2\x92u\xb7\xdej\xd6\xb1\xcb,\xb3\xec\xce\xe6\xc5\x88\
+>\x92\xd7\x08\x96\xf1\xed\x14\xcc\x7f\xe6\x0b/\x10\x0ac\
+\x91%\x8f\x81#\x16\xb6X\x98\x8a\x14\xb1\x08\x84\xe0\xa5\
+\xf3\xf3\xcf\x03\x8e\xb8\x1eE\xcc\xca\x8b\x97\xe7\xee\xfb\xc1\
+\xe7K\xdc\xdd\xf0\xe9\xcb{\x1f\xd3\x99Wf;`\xcb\
+\x03\xd6\xb8=c\x00\xf2\xeb\xea\xc7\xf3\xe9\x8b\xcb\x1b\xc9\
+\x80\xe4\x01\xaa_\xa7\xbc4E\xed\x99\x93e}\xa8\xbe\
+\xf0\x8d7_?m\xcb-\xd7>\x1b\x0e\x08L\xf7\xe0\
+\x9f\x1a\xfeU\x00\x90\x00\xa8~\xff\xfb?Ye\x8f=\
+>}\xd2\x84\xf1\xe3w\x19\xd1\xc2\x03\xadJ\x90\xa7\xb8\
+yy\xc4\x0dWd\x91b\xf6\xc7\xc2KQ\x1a\x13\xf2\
+\x14$.?\x16\xc4\xd8\x95\xcf\xb3\x9c\xc8\x89W\x04*\
+\x88\xde\xe5\xf9\xac>=&?\xa0\x15\x98|zL\xfc\
+X\xa9\xf2\x94>~V\x04\x921]y4\xe7\x8d\x0b\
+\xe4\xf1\x22\x06\x04_Y\xe32\xfc\xbc\xe3\xae\x99\x89g\
+~\x8b\xbc\xba\x98\x1f\xfe}\xbbx\x91\xc1\x02\x80z\xbd\
+\xbe\xf0\xa5\x97_\xf9\xefm\xb6Y\xefR\x00\x03P]\
+\x83XZ\xfe\xa1\xe1\x9f\x0d\x00\x04\xa0\x0a\xa0v\xff\x83\
+\xcf\x9d4}\xc5\xe9\x87\xa7i\xa2\xde\xe4\xb9\x83@\xab\
+0\xc6\x88\xdc\x0e,\x8a\x1a2\xaf\xac<\x812\xf9\xf8\
+\xd4\x17\x01N^M\xfd\xeb\x22\xc5\x88\xadmQ>~\
+\xd9\xb1\xe54!\xf6\x1a\xfc\xfcGSF\x91\xb7\xe2\xe7\
+]\xa4d~}\xf2\x001\xa6\xcd\xbf.\xa27\x8f\xce\
+\xa2:\xc6m\x02\x14\xb7Q\x9e\xd4\xc7\xe5\xb7\x93\xbb\xb8\
+>>\xbf|\xfa\xe3\xae`\x1ex\x0a`\xf1\xe2\xa5\x7f\
+\xbb\xf7\x81{\x8f>\xf4\xa0=\xee\x87\x1a#\xc8\xd0\x9e\
+\x13\x1fZH\xfe\x19\x85xeU.\xbc\xf8\x9a\xbd~\
+\xfe\x93s\xaf\x9c\xb8\xec\xc4\xed\x84\xd0\x1c2\xcc+r\
+\xef\xf2\xac0\xa24E\x03b\xed\x1a(Oy\xcc\xb5\
+(\x88\xd3\xcej\xf84\xc5\xf1c\xda\xfd\xf7yy\xc5\
+\xde@Q\x99#Y|?\x1f\x13\xf2x\x1b\xe7\x97\xf7\
+\xce\xa7;\x9e\x05\x18\x8d\xf2\xc6e\xfb\xefbK[\xd4\
+\x07\x8f\xf9\x18\x03\x08\xa2\xfb\xbcw@>\xbf\xda\x01\x13\
+\x90_\xef\x22\x192\xf5)jc\xaf\x8e\xb5je\x99\
+\x993V\xfb\xcc^{\x1f0ex\x98\x9fy\xfa\xe9\
+G\xfb\xf1O\x02\x80\x7f\x86\x07@\x00*\x00:\x1e~\
+\xe4\x853V\x9e6\xed@+\xcf\xf1Ho\x91u\xf4\
+s*r\xed\xf2F\xd4\xdbY\x95\xd8\x92\xe6\xbd\xff\xa0\
+\x8e\xd8h\xe8GD\xa3o\xd9\xcd\xbb\x91\x94\xc9\xcf/\
+\x0fTb\xcf\x22\xf6j\x0c}y\xfc\x8a\xaf}\xba\x81\
+|\x9e\x8c\xe4\x09\x15\x81TQ\x9c\x22\x0f+\xcf\xca\xc3\
+{\xd6\xceC\x8b\x0dE\x11`\x8eDc\x1c7\x8f7\
+\x1f\xa4k\xea\x01\xb4\x000T\x1fz\xe3\xba\x9bn\xf8\
+\xf2\x11\x87\x7f\xe6OP\xe3\x03\xff\xd0A\xc2\x7f4\x00\
+$\x00\xaag\x9du\xd1\xfa;\xed\xb4\xeb%]\x9d\x1d\
+\xd3\x18(\x16\xbc<\xca\x8a\x90z\xa4\x06\xcbK\xe3\x87\
+v\x0a\xd0.\xdd\x07\x09\xa3\x11z\x9f\x9e\xd1x'q\
+\x1e\xf1\xfb<\x85\xfb\xdf\xf0\xcc\xa7\xa9\x08L\xdb)]\
+\x5cN\x9e\xe2\xb5S\xf0v@\x0f\x14\x83z\x5cn\x9c\
+>/\x8c\xe6\xbd\xc9\xb7\x1d\xb8\xc4\xf9\xc5\xdd\xcd\xbc\xee\
+X\xee\x18\x03\xe3\xe5W^>m\xf3\xcd?v\x0a\x80\
+>\xa8\xb1\x81\x7f\x08\x08\xfc#\xbb\x00)\x80\xea5\xd7\
+\xdc\xb5\xff\xac\xadg_\xde\xd1Q\x9b\xc0F\x00F\x82\
+\x1d\xcd\x9c<\xef\xd3\xba\x8by\xc25R\xc8\x13\xce<\
+Z\xda\xb9\xcfq\xbc<Wp4\xf9\xc6\xf4\xb6\xb3\x9e\
+&\x0a\x8d\xcc:\x06@\x9e\x90\xda\xfb\x22Z\x22\xba\x82\
+\xe6i\xc7\xa3\xa0@\xe4+\xdd\xff&\xc4\x0a\x96\x07d\
+#)k,#\x1e-my\x98\xd7\xde\xa3\x05\x87\xa2\
+\xd0\xce\xe3(\x9a\x99!\xc2\x84\xf1\xe37\xff\xdc!G\
+l\xb8\xe0\xfd\xc5\x0f\xfe\xe5/O\xf4\xe1\xff\x18\x00\x94\
+\x01\xf4\xdc\x7f\xff\xb3\xc7\xae\xbd\xf6\xba\xa7\x94\xd24\xb5\
+oFP*I\x00q(\xb8\xb1\x97l\x98i\x9fE\
+\xcce/\x8d\xe5k\x1b/\xc0>\x8e\x84#h\x9b\x22\
+\x9a\xb5\xd2@(\xba}\x97\xbb\xc5\xe8z\xefH\x00\xcc\
+\x1em\x11\x0f\x90Sf.\x09\x11?\xad\xa1\xd1|$\
+(\xa1\x8f\xd3\x9b:\xf9u\xf3\xf9f\xe9&\xaf^\x91\
+B\xc9\xe8\xfdH\xd8n\xcb\xa4(\xff\xe8\x9a#@g\
+\xf2@\xad(\x90\x96\x9d6Q,\xef\xe1\xe8\xf7y`\
+\xda\x83\xc1 xL\xd3\x7fL\xde\xf3\xb8^m\x8a-\
+Zwd\xe5\xd8\xd0\xad\xefY\xffvv\xd4V\x9a5\
+k\xdb]\xc6\x8c\x19\x7f\xc7\x9f\xfet\xc7R8\x91\xfe\
+\xd0\xc2?\x02\x00\xaa\x00\xba\x1e\x7f\xfc\xe5sV\x9a\xbe\
+\xd2\xe7}\x86\x19aQ\xdd\x00\x06i\xc935b0\
+\x04\x08L\xba\x09\xa26`\xcdj\xdf\x9b\xb2B\x1b\x0b\
+\x16\xa2q\xc5X8t\x83G\xdd0[\x0e\x83r\x17\
+\x93\x05\xc2\xe3=#6\x8a\xc7 &0\xf9\xf5\xf2<\
+>\xa3ll\x84\xcf\xf1\xa1\xc5C$\x97.WhM\
+=\xcc3\x1dIx|\xcb3\xa6&>qX'\x0b\
+\x04\x14\xa6\xf1/d\xae\x22\x86\xed\x15\xe4\x05\x07*\xc2\
+\x8bm\xe2\x1b\x1a\x02>s\xd8V\xa6\x9e\x8e~\x95\xde\
+\xe4F\xde\x9a]\x9f<\xab\xc8\x1e-q;\x1a\x99\x0a\
+=v\xd2\x0a\xef\x19#\x8f\x9aQk\xa0&&\xee\xb5\
+\x18\xba\x82^\x8d\x01\x19\xf3N\xa7M\xcb\xa51\xeb\xaf\
+\xb3\xfe\xa7\xa6\xcfX\xe3\xe9[n\xbef.>\xe4\xf5\
+\x02\x1f6\x00T\x01t=\xfa\xc4\xabWM\x9b:e\
+\xa7@\xa05\xf7\x99\x00\xc1p\x0dH~\xa3\xf9\x80\xe0\
+\xab\xb2yNA\xb7\xca\xe6\xed]\xfb\xd6.2\xc8\xad\
+\x91u\x88\x07\x8f\x03\x94\x8f\xe2\x1b!\x12\x14z\x18\x8e\
+J\x0a\x92\x05\xbf\x9e\x95\xf1\x05\x8a(\x7f\xf6\xc8r\x83\
+(\xa8K\x5c\xff\x18h\x82k\x0f\x18\xcc3\x91\x93\xde\
+\xf2H\xb7\x8f)\xa3\xd0\xe4\x90\xdfmm\xads\xab\xb2\
+\x19Ec\x90 U\x86\xd7\xf6\xaa]\x95\x01\xb0\xb1M\
+[\x92\x03\xd8V\x1eSn]\xe0)Y\x08\xfe\x91:\
+\x13\x05\xed!\x22^\xc5mK\x86f\x0a\xdb\xd1\xd4\xc1\
+W\xea\x18|}\xe6\x858\xea\x01(+\x9a\x0c\xdd\x82\
+\x81\xa4\x94\xd6V]e\xb5=\xd6Zw\xe3\xa7\xaf\xbf\
+\xf6\xca\xb7\xe0v\x1c\xfe\xdd\xe1\xc3\x04\x80*\x80\x9e\xa7\
+\xff<\xf7\xba\xa9\x93\x97\xdbR\x02\x80\x8c\x85=\x7f\xaa\
+8\xcf\x0a\x0b\xafy}\xcbo\x10?v\xbb\xe2\xfb@\
+\xa9#%V\x8d\xa3R\x08\xef]\xbebi\xa1\xcc\x01\
+\x82\xf0^)\xaa\xaf\xa4~<\xdf\xca\xc6\x1e\x81\xed\x0a\
+ \x14(\xf2\x848\x04>\xe7\xa1\xb0\x17\xdb\x17r\xf2\
+\xee\x8b\x14\xd3\xe7G\x5cw\xa3\x90d\xdb\xc1\x17r\x97\
+?\xe7\xb4\x84\xa1\xc6*\x8b}G\xca\xc3\xcb\xb5\xd6.\
+\x8e\xdf\xde1\x90X/1\xaaOX\x0e\x22~x\xe0\
+\x16\x81\x95{\xeb<\xcb\xd8F\xf8m\xe2?k\xbd\x8f\
+\x00\x0c!\x7fB\x80\xf6y\x1b\x9a\xb3\xbc\xf2\xd34I\
+W\x9a\xbe\xd2\xa7\xd6Zw\xe3\xc7\xaf\xbb\xf6\x8a7\xf1\
+!\x81\xc0\x87\x05\x00U\x00=\x8f>\xfe\xeao\xa7N\
+^nK3\xd8\xe7\x5c\xd8\x90\x09\x80Q\xd0\xb0\xa1c\
+\x0b\xec\x1a?FL'|\xbe+\x15\x0a\xbcs\xed\xcc\
+\xb3pj9\x14\xec<ZL\x8c\xd8\xca\x8b(N\xac\
+~q\x1e\xe45\xb7\xaf\xc0\xd0\xd7\x84\x98\x07!\x05\xad\
+c\x9c1\x9d\xc6T\x86u\x8b\xad\x11\x10\xd2\x13\xd6\xbf\
+u\x8d\x8f\xcf\xdb\xb0x?\x7fWo\x01\xe3\xd9\xe5)\
+\x99\xdff\xbe}\xa6 F\x9cg+\xffL*\x07\x13\
+Ec\xc0\xf9\xd6\xd7\x85\xb0U\x1c\xf7U\xf5ZS\xf9\
+\xca\xdb\xaa\xb6\xce\xab\xf5\xbd\x01B\xabB\xfbe\x09\x84\
+@\xea\x1b\xae\x18\xa4\x84\x10Xq\xc5i\xbbM_y\
+\xe6\xa3\xb7\xder\xed\xdb\xf8\x10@\xe0\xc3\x00\x80*\x80\
+\xce\x87\x1fy\xe1\xdc\xe9+\xae0Gz\xa2\xe6W,\
+\xcf\xe5)n\x1a\x15'\xb6>\xe6:nZ_\xe1}\
+\xb5j\xf5\x0bZ\x91\x9b\x837\xe1U\xab\x92\x87\xa0\x92\
+\x97g\xab%\x0a\xf36\xf7\xe4]\xb9\xb4\x0e\xee\xfcr\
+\xd9\x13\x98|\xc0D\xee\x13x\xef\xf2\xf8\x16\x87\x18\xa6\
+}:b\xcb\xef\x03W\xbeU\xcb\xe3C\xa8\x12\x14Q\
+\x15r\xc8\xcf\xa3U~L>y\x1eM\xabb\xb6\xbe\
+\x8f\xa5%\xa4\xdc\xcf\xa1U\x86Z%\xa4\xbdw\x10\xa7\
+\xf2[\xdf\xf7`\xfc{\xf6\x12)C\xaa\xfc\xc1R\x9a\
+\xa4\xab\xcd\x98\xb9\xc7\xa4IS\xef\xba\xf3\xce\x9b\xe7\xe3\
+\xef\x1c\x13\xf8{\x01 \x05\xd0u\xdf=O\x7fg\xc6\
+*3\x0ea6\xeel+SBe\x8d\xc41\xe0o\
+\x8b]\x8bB\x11h\x84\x8a\x91\x1f7\xc4\xfc\xd6\x8e\x84\
+K\x95\xcf\xd1\xf6c\xc0q:\xca\x89ST\x8e\xb3 \
+a^E\x8a\xdbZV\x9er\xfb9\x14+[k|\
+?/\x1f\xf4Z=1_\x95b0km\x91\xf6\x8a\
+\x15*n\xe8+\xb4\xa6s\xf9\x17\x8d\x02\xc4\xf1c\xa3\
+\xe4\x97V\xac\xb4\xed\xf2.\xa2?\xbf\xbd\xc3\xd0\xea\xfd\
+\xc4\xf9\x18\x9a\x04\x85\x9eY\x9a&\xe9\x9a3\xd7\xdc\xa6\
+T\xae\xfc\xe1\xfe\xfb\xff\xb4\x18\x7f\x87'0\x12\x95\xed\
+B\x02\xa0\xe7\xf2\xdf\xde\xb1\xf7\xd6[ny\x8e\x10B\
+\xb9\xfd\x96p\xd7|y\x85\xfan7\xf4\xb5\x1f\xdfw\
+\xfbZ\x1b,\xce\xc7\x0f\xb1-.n\xdc\xa2\xf8\xa3\x09\
+\x04\xdf.\xc7\xaa\xec\x0b\xb0)\xc3\xafK\xa8,q\xe9\
+\xed\xbd\x09\xff];aw\xb1\xe2n\x12\x17\xc6\xf5\x83\
+\xaf\xe6\xb1\xd73z>\xb5\xe69\xdata'!\x9f\
+\x0fE\xb4\xe7\x87\xb0M\x5c\xca\xd62B\x90i\xe7\xf1\
+\x8d\xae\xdc\x90\xda\xe2\x90\xc7\x1f#;\xadm\xbddi\
+\xef\xdff\xce\x5cv6\x80\x05P\x07\x8e|\xe0\xb5\x02\
+E+\xaeG\x93\xae\xe3\xe4\x93\xcf\x5c\x7f\x8bM6\xf9\
+\x99]\xd3\x0f\xa0\xd5\xa1m\x0dyn\xb7\xb1\x19\xe6\xa9\
+\xdf\x9f*J]d\xa5G\x17/\xcfV\xb7Z\xc9\x98\
+\x8a8w\x8e\xd2\xc2{\x1ec\xba\x9fK\x11M\x5cx\
+\xd7\x1a7\xb4 \xb1\xa5%\xef\x8ds*\xfdkD\xa5\
+\x85\xceg\xe8'\x85\x81\xa24~\x1eq\xbeq:\x97\
+\xa6\xa8\x85C\xba\xdb\xb5\xa4?z\xd2J]L[\xab\
+1\xe2\x9c2|:\x8be8\xbf\xf3\x11\x07\x86\xe3x\
+^|.\xa05\xa6E\xc7\xd4M\xc2\x00\x98\x08cz\
+\xbag>\xfe\xf8\xcb?\x030\x06\xeaL\x8d\x0f\x8c\xca\
+\xff[\x0f\xa0\x03\xc02\xaf\xbc\xb2\xf0\xb6\x8e\x8e\xce\xd5\
+\x1d\xed\xce\xee\xb7f\xdf\x0e\xfd\xf3\xac\xf0\x07w\xa3\xda\
+\xc7\x09\xbd\x8d\xe2g\xed\xf2\x01\x8a\xe3\x8fT\xbfv\xe5\
+\x8c\xf4\xac\x1dO\xda\xd1Q\x14\x7f\xb4!V\xae\xd1[\
+\xef\xd1\xd1\xee\xd3\x93\xd7\xf6#\xf1\xbc(\x9f\x22\x1aF\
+J7\xdav\xc8\xcb#\xaf\xbe(\x88?\xda\x90_\x9e\
+]\xf6\xc0J\xdb\xee\xbd\xefOG\xee\xbd\xf7\x8e\x97\x01\
+X\x82\x0f8&\xf0\xbf\x19\x03\xa8\x00\xe8y\xe0\xa1\xe7\
+OYn\xd9\x89\xb3\x99c\xcbS\xe4\xd8\x8e\xc4\x88\xd8\
+\x92\x16\xe5\x95\x97n4\x0d\x13\xdbnB\xb1\xb0\xf8\xf1\
+\x11\xc5\x8f\xeb3\xb2\x0b\xdd\xeaS\x8cT\xdeH`\x14\
+\xd3\x11\xc7\x8fy\x98\xcf\xbbF3\xc3_\x9e}\x0e\x8b\
+\x97\xf4b\x99\x09\xe3C\xea\x19z\x81R\xe8M\xb4\xd2\
+<R]\xf2h\x89\xeb\xd2.N\x11\x10\xe4\xe5\x9f\x97\
+wQ\xdav\xe9bZ\x8ad\xb8\xa8\x9db\xbe\xc5\xf1\
+G+3\xc52`<>\x02a\xd2\xa4\xe5\xb7e\xc6\
+\xf5\x0f?|\xdfb\xb83\x05F\x15>(<%\x00\
+z~\xfd\x9b\xabw\xd9a\xf6N\x17\x11)\xd7\xdf,\
+\xa3t\xa1\x08\x04F\xb2\x9a\x7f/\x02\xb7\xb3xE\xc2\
+\x8b\xe8}Qhu?GG_;\xe1\xf5\xe9\x18\x8d\
+r\x8d\xd6\x0b\x18\x89v\xe0\xd9g\x9f\xc7\xd7\x8f<\x02\
+\xef\xbc\xfa.8\x91Xu\x9dUq\xe6\x99\xbf\xc0\x94\
+)\xcb\x17\xd0\x17\x87\x91\xf8\x97\xc7\xe7\xa2:\xfd#\xc2\
+\x07\xf1\xd0\x8a\xd2\xe6\xb5KQ(\xaaS\xde=0\xfa\
+6,\xe2\x977>A\xc0\x82\x85\xef?\xb3\xd6\x9aS\
+v\x82\x1a\x0f\xa8\x8f\x82\xe0\x5c*F\x0a\x9d\x00&\xbe\
+\xf6\xda\x92?V\xab\xd5i\xec\xf3\xc9\x12\x98WD;\
+w\xa8H\xb1\xfc\xf7\x1f\x04I\x8b\x1a\xa0\xc8El\xa7\
+\xd8>\xfdE\x82<Z@\x19\xa9\xbc\xd1\x84\xd1\x08I\
+kY\x1c\x15\xd9\xdb\xdb\x87]\xe7\xec\x84\xde\xf7\x06 \
+S\xbd2SJt/W\xc5\xadw\xdc\x8dZ\xadb\
+\x97*\xb7\xd2\xda\x0e\x94\x8a\xc0-/\xfdH\xf9\x14Y\
+\xec\xd1*\xf2H27\x9ar\x8a\xd2\x8f&\x8c\x06\x1c\
+\xdb\xbdo'o\xad\x86\x80\x04\xf0\xe0\x03\xf7\x9e\xb0\xfb\
+\xee\xdb\xfd\x02\xc0R\xb8\x83G\xdb\x86\x0f2\x08X\x01\
+\xd0y\xd7\x1f\x9f:\xaef\x94\x1fh\x95.GR\xce\
+\xbd\x1f7\xcf\x15C\xc1{n\xf3\xcc\x5c\x9b\xbf\xbcr\
+\xe3k?^\xec\x0ar\xce}\x1c7\xcfM\xcd\xfb-\
+\x02\xc4\xd1\x0ap;A\x19\xc9{q\xca\xef\xff\x11\x01\
+\xb7\xddv\x07z\xe7\xf5C\xa4U$\x5cE\x82\x14\x89\
+H\xd1\xff\xde0\xbev\xe4W\xb1h\xd1\x12\x9bV\xb6\
+\x1dW\x1e\x0d\xaf\x8b\xea\xdb\x8e\x071\x9f\x8b\xda\xd0\xfc\
+\xb6\x93\xc1\xd1\xc4+*'\xaf,\xff7/\x1f\xff7\
+\xce\x93\xa3wE\xa1\x1d\x98\xe6\xe9\x03\xc0\x12\xf8\xf8\x06\
+\x9b\x1c\xb7\xeb\xae\xfbN\x81Z\x9b3*\xdd\x1e-\xbc\
+\x09\x00\xdd\x87\x1dv\xf4Z\xc7\x1d\xf7\xfd\xfb\xfc\xcd}\
+\x8e\x90v\xee\xddH\x95ng\x9d\x8b,k\x91\x05\x89\
+\xe3!\xe7y\x11\xda\x17\xa5+\x8a\xf7A\xac\xd3\x07\xa1\
+\xad\x18\xe9G\xceW\xddK\x09\xafk\xc6\x10\x82p\xff\
+\xfd\x0f\xe3\xdc\xb3~\x85\xbf>\xf4\x14D\xb9\x02&\xa1\
+\x07\x81t\x1a\x96\x90\xb2\x89JW\x15\x9f\xf8\xf4n8\
+\xec\xb0/\xa0\xa7\xa7\xdb\x95\xc4\x80\x10\xed\xda\xa5\xa8\xfd\
+cz?\xa8\x95\x1f\xad\x87\xd0Ni\x80\xf6\xf4\xc6e\
+\xe5\xdd\xe7Y\xe4\xa2\xfa\x15\x85\xa22\x81\xd6\xfa\x7fp\
+\xb9|s\xee\xdb\xbf\xdbx\xc3\x95\x8f\x02\xb0\x10\xaa+\
+\xd06\x8cv\x10\xb0\x02`\xdc\xb9\xe7^\xf6\xe31c\
+\xc6\xac\x92\xcf\x80<\x0b\x8a\xe8\xbd!6\xef]\xbbg\
+\xf1u\x91\xf7@(\xce+\xa6\xa9\xc8*\x155`\x91\
+E\xf3\xd3\xb4\x03\x85\x98\xb6\x91\xdc\xc0\xb8\xac\x22o\x22\
+\xff\xde(>\x11\xf0\xd6\xdcwp\xf4\xe1_\xc5\xf9?\
+;\x07\x8b\xe7-DZ\xaa\x00\x94\x00$\xd4f\x183\
+\xd8'\x08\x09\x08\xd9p\x13\xcf>\xf64.\xbd\xec2\
+LXnBs\xcd5\xd7P\x1b\xd6\x08\xde2\xd9\x91\
+\x80+\x8f\xc6\x91\x14\xb0(\xdf<\x9e\x14yjE2\
+Y$\x17y\xeev\x1c\xf2\xda\xb8H\xf9\xe3ty!\
+\x0fP\xf2\xe8\xcc\x93\x99\xf8=\x82\xb8]]]\x1f\xab\
+\xd5j\x7f\xba\xf7\xde\xbb\xde\x81;v\xbc0\x8c\x06\x00\
+\x12\x00\x9d\xdf>\xee\xa4-\xb6\x9b\xbd\xe3\xb1\xf9\x04\xc7\
+\x95\xcb#\xb8\xa8\x11\xf2\xacF;EB\xf4\x1c9q\
+\x8b\xf2\x8fC\xb1\x02\x85\xcfb\xf0\x19-\x18\x15\xe5[\
+\xc4\xb7\x22O\xc7\xa7\xa3=\x88\x85=2e\xf5\x0f\xd9\
+\xe7@\xcc\x9f;\x1fiZA\x92\xa4\x80H@\x22Q\
+\x8a\xaf;\xfa$\x005\xa7\xaeAA$@\x83\xf1\x87\
+[\xef\x10\xf3\x17-\xc0\xd6\xb3\xb6r{\xe6)\xe6\xc9\
+h\xeb\x9f\xc7\xb7\xbc\xba\x8c$3\xa3\x09y\xe5\x17\x95\
+\x99GsQ\x9ey\x80Q\xa4\xb8~\x88\xe5&\x8e7\
+\x92\x17\xec\x97\x95G\xab\xba\x17\x04\xac\xb0\xc2\xf4\x89\xe7\
+\x9c\xf3\xd3\xdb\xa0\x8e\x14\xcb\xd0&\x8c\x06\x00*\x00\xc6\
+\xfe\xec\xa7\xe7\x9d\xda\xdd\xdd=}\xe4\x0a\x171\xa7\xa8\
+\x02#)x\x11\xc0\x8c\xc4\xa08\x8f<\x01\xf3\xcb\xcd\
+\xcb+.7\xaf\x8c\xa2:\xe4\xe5S\xe4\xd2\x15\xd1\xda\
+\xce\x9b\x88\xf3\xa0\x96\xe1\x98\x97_y\x0d\x87\xecy\x00\
+R*CP\x02!JJ\xc9E\x0a\x80A`\x08H\
+0\x91\xda\xf7\xae\xd3\xab]|*\xefR\x92\xe2\xe9\xc7\
+\x1fG\xa5\xa7\x8a\x8f\xaf\xffqo,!\xaf\x1d\xe2\xd0\
+\xae\x8eE\xf1b\xf9\xca\xf3\xa0\xf2\xfe\xf2\xf2\x8fe\xa4\
+H\x01\xdb\xb9\xfd1]y\xe5\x8c\x14\xb7\x084\xe20\
+\x92\xac\xb7{\xe6Bww\xf7\xca\xd5j\xf5\x9e{\xef\
+\xbdk.F8Nl\xa4\x81\x82\x04@\xf5\xdb\xc7\x9d\
+\xb4\xd1\xe4\xc9Sf\xe5W\x86\xed\x9eq\xd6\xf7\xc5\x0d\
+\x1a>s,\x88\xbd\x80\x22F\xb56\x82\xbf\xf0\x88\xbd\
+\xe7\xf9\xc2`\xc4\xde\xd1\xce\x11]\xdc\x92\x97\xcfp\xb3\
+\x9e\x8b\x90\xb7\xc4\xb9U\x888\xba7\xe9\xc2z\xb8X\
+!_\xc3\xb4\xae\xae>\xdf\xfc\xfd\x03\xfe`\xdf\x92\xa5\
+Kq\xd8\x01\x87\x22\xadT\xc1\x94\x00I\x09$J@\
+R\x06A\x02Y\x03\xf5\xe1a43\x89l\xb8\x01\x99\
+5]\xae\xac\xba\x05\x82\x04\x04\x12\xd4\xca\xdd8\xfd\xbb\
+'\xe3\xd1G\x9f\x84\x10\xfe\xc1\x1f>\x1f\xf3x\xe0\xdf\
+\x87\xbci\xbf\x19\xac\x9d\xa5k\xe5K\xab\xa2\xe7)j\
+^~\xa1\x9c\x85*\xd9\xda~\xad|7\xd7\xfe\x1bB\
+k\xfd\xc2\xdfx\x09\xb7\x93\xb5\xb8\xed[)rt\x85\
+\xba\xc1A]\x08{\xee\xb9\xdf\x91\x00z\xa0\xf6\xeb\x14\
+1zD\x0f\xa0\x0c`\xc2\x19\xa7\x9f\xfb\xad1cz\
+\xd60\x99\x9bSS\x1c\xae*\xc5\x11^E\xc2=\xff\
+\xad\xbb\xfaa\xaf\x9dp\xfb\xaa`Of\x89\x00D\xea\
+x\xee\xacE\xd2\xcf\xfc\x1cMy\xaeT\xb7\xb4\x98Z\
+h\x08w\x1d\xe4o\xabq\xa5\x99\xbb\x90&\xd7\xe8\xa1\
+\xb51\xf9\x87{\x1c|H!\xb8}m\x08x\xc4\xf6\
+\x9f\x0aL\xaet\xc7\x7f\xbd(52\xff\xa7}\xff4\
+<\xf9\xf8\x9f!\x92\x12\x12\x91B\x90:\x06\x84e\x03\
+}Y\x8a\xee\x0dfc\xd9m\xf7\xc4\x98\x8fo\x85\xda\
+\xea\x9bAN\x98\x01\x1e\x1c@c\xc9<\x88\xc4\xc8\x0c\
+C\x9dq@HKe<\xf3\xdcS\xf8\xf4\xbe\x9f\xd6\
+\xe718\x15\xf0\x0f\xea\x08[\xcb\xf1\xd6\xc9\x83k\xa3\
+\xb0\xed\xbdzz9\xb9\xb6t\xe9}a\x0f\xd5>\x94\
+3\xf7\xdcW1\xdfp\x84\xed\xef\xd4\x93\x10\xcaRH\
+\xa3\x04AD\x90g\xe42\x84\x9cVz\xfc2\x81\x90\
+NCW,\xa3\x86\x8f\xfe\xf6*\x9f\xe3\xbe.\x98X\
+\xb5\x8e\xce\xe9\xbdK\x97\x5c\xf7\xc4\x13\x8f\xb4]\x17P\
+\x88\x0c\xfa\xdd\x98m\xb6\xd9a\xe6\xaf/\xba\xfa\xa1R\
+)\x0d*\x0b\x00\xc2\x13zw@\x85\xaa\x9a\xd9\x1bn\
+Jm\xdd\xb3\x1d\xde\x85Lq1T^\xad@ab\
+\x9a\xb2L\x0a\x03\x1c\x86\xad\xe1\x81\xb5\xbe%5\xf4\x9b\
+\xd2]\x1c\xb6\xa9C\xcbk(\x15\x01\xc0\x99\x86\x80\xc7\
+\x07S\xb6\xef'\x18\x90\xf4\x94\xdb+\xc3\x02\x9eV\xe4\
+\xdc\xd9U\xe1\xcav{\xefu\x9bH\x97`\xe1\xc2\x85\
+\x98\xb5\xd16\xa8uu#\xe1\x04@\x09\x0c@\xca\x06\
+\xb2\x8e\x09\xd8\xe0\x1b\xa7\xa3:n907AB\x80\
+\x99\xd1h\x10\x86\x06\xeb\x98\xff\xd4cx\xf7\xfa\xd3Q\
+\x1a\xea\x87HR02\x00\x84L6\xd1\xdbX\x803\
+\xcf\xf9\x15fo?\xabE\x9a\xfc\xe3\xbe|\xe1\xf7\x95\
+\xc5\x01\xb5\x89\xe9\x03\x85{n\xa4\x814\x0f}\xf51\
+w>\xdf\x0c'\xfd=\x8b&v\x08\x06\xee\xce\xc9V\
+\xabo\xd0\xba\x89\xcb\xf7\x1e][\xc3\xcb\xcd\xdc\xf9\x87\
+\xb4\xb8gN\xa6\xcc9\x182(\x8d\xb4^\xc5~A\
+\x0cJ\xbe\x1f\xe9x#\xe0\xf3\xc6\xc9\xebK/\xbfr\
+\xc9V[\xaey,\x80\xf7P0#\x10\xcf\xe7\xf9\xa1\
+\x0c\xa0v\xd4Q\xdf\xda\xabRJ\xc1V\xa0\xb5\xb20\
+\xebs\xefZ\x1d\x98x;p\x8cw\xbe\xf0\x98t\xe1\
+\x87n(\xe8\xb4\xf8\xca\xde\xba\xaf\xcdXa\x061\x81\
+\xc8\xd8\x08\x87\xc8V\x81\xf5{w\x1e\x9fi\x14\xb6\x08\
+\xee\xe8%\xb0=\xf1\x12\x00St\x5c\x14)\xabK\x0e\
+H|\x00\x89k\x18\x8a`l=\xc9\xe5\x91\xa3\xf8$\
+B\xd7\xd2(\x96\x22\x86[\xd2\xdct\xfd\xcd(W*\
+\x00\x13X\x00\xc4\x12\x94\x08\x0c\xa3\x869g^\x88J\
+i\x02*e\x81$\x01\x8c?\xdf\x14\x00\x04\xb0\xe2\xc7\
+v\xc5\xdb\xeb\xaf\x81\xa7N<\x14\xc9\xf0\x00\x88\x12$\
+`\x80\x04:J=\xb8\xe1\xc6k\xb0\xdd\xf6\xb3\xbc\xd6\
+5<qu\x96\x924\xcd\x8a}\xea\x90S_\xa9\x1c\
+gB\xbb\x15J\x86\x03P\xcf\xb7b\x9d\x83\xb7J\xc9\
+\xf7\x13\x15O\x1dL\x18\x93\xe4\x03&\xc7\xb4\xb0\xf3\xae\
+b\x05w\xcf\x148\x0b\x22+\xfb\xaeN\xce\xf8\xf9\xde\
+\xa8O7{y\xaa6\xf7\xed\xbe9\x13\xd1\x01\x054\
+\x0f\x9d^\xf8\xdeP\xe8O[\xa9e(\xf9\xd6\xf5\x9d\
+\xb6\xc2\xd4\x9d\xa7L\x99r\xda\xdc\xb9s{Q0\x16\
+\xd0n\x0c\xa0\x04\xa0s\xf5\xd5?\xb6'\x9b\xcc\xd9\xb0\
+S\xb5\x023i\xfdp\x98j\x88\x93\x96,\xf3\xde<\
+wn\x8eQ|\x069.\xb1S~\xe2\xd8Q4\xe5\
+\x1a:\xcc\x19\x81:\x061\x98\x9dK,\xadh8\xda\
+\xa5\x84R\x1a\xa93\x92\x1a\x10\xc0:_\x824'2\
+\x92\xa2\x87l\x83\x19\x05\xd5\xe0\xa2\x87\xc5\xa5\xad\xa9\xe7\
+\x0dx\xcb$\xfd<U\x9d\xfd\xbdd\x9e\x93jL\x84\
+\x80\xb2\xf6\x02V\xd0\x83\x03N\x19\x80T\xb4Gz\x08\
+\x10p\xff\x03\x0f\x22-\x95\x91\x92P{\xc9\x8910\
+\xb0\x10\x1b~\xe9;\x988q\x22\xba\xbb\x13T+\x84\
+RJ(%@)\x01j\x04T$06\x01V\xdb\
+pUL\xfb\xf4\xd70<<\x08f\x89L\x03\x00q\
+\x82'\x1f\xf9\x0b\x9aY\xe6\xd1n\x06\x1f\x15?\x19F\
+\x08\xb5m\xb3\x08\xe0FN\x5c\xff\x98\x5c;I\x07\x80\
+,u\xfb\xe8\xbc\xd9\xfb5I\xf3\xbdE\xb2\xcd\x16\xf0\
+\x14\xa4X%\xdds\x93Z\x9a<\xa5/\xbd\x9e\x1c\xc1\
+\xf0\x98]I\xe6\x04V\xf6\xc4\xd6\x8ba\x1dv&/\
+\xbd\xa3\x13\x1e'\xec3vrA\xcc\x10\x82\x03k\x10\
+v\x9d\xa0\xcb\xf7\x8c\x06\xb36n\x04b\x82\x94\x84R\
+\xb92\xfe\xc4\x93\xce\x98\x03\xa0\x86\x02c_\x04\x00\x09\
+\x80\xea\x09'\x9c\xbcvw\xcf\x98\x95\x18\xac\x94\x8b\xc8\
+)\xbd\x91H\x22\xa7\x98\xd2w\x87\xfd\xc0\xaeaX\xbb\
+,\xac\x05C\x9a\xf7\x8a\xb1L\xec\x8c.k+\xeb!\
+#\xeb\x83\xe6\x08\x00$C\xb2S=\xd2g\x90Yl\
+5\x82\xa4\x95<V\x16f\xf7\xcbz$S\x09\x9e\xd7\
+\x973\xa7\x99\x92\x01\x1a\xf5'\x0d\x16\x9bi4#<\
+l,\x049\x05\xf5FI\x9d\xb5\xd2\x90b\x8e&\xd6\
+mj,\x97q\x09\x11\x80\x1ar\x95\x9e\xd9\xc02\x83\
+\x99\xf1\xd4C\x8f\xab\xbcR\x00,\xc0$\x81\xa4\x1b3\
+\xe7l\x0b0\x82s\x10\x01 \xd3\x88k\x9e\x97\x86\x81\
+\x8f\xef\xb5\x0b\xb0\xcc\x0c\x10g\x96\x9f\x89HQ_\xd2\
+\x87\xb7\xde\x9a\xab\x15\xc6\xb7\x8e\xa4\xeb\xac\xda\x88\x94D\
+k\x05s\xcal\x81P*^[\x9bl*\xec\xd7M\
+\x86 Jp|4Z\xc3\x1e\x1d0\xf2ah\x92\x9e\
+\x8d$\x80\x84\x81\x0d\x0dF\xachTX\xcdv&\xc4\
+\x1csn\xf2`\xd2\xad\xcb\xe4</\xf2\xda\x8e\x15\xdf\
+I\xd3$\xb5!\xb3\xedI\xd0e\x19\xe0\xf0F2\xd8\
+\x9c\x0al\x0c\x9c\xf3>\xd9\xff\xc0\x83\xd5\x13\x9fG\xa6\
+n\xce\xa0\xb0\xf1\x08\xb5\x1el\xb6\xf1\x16\xdbA\xcd\xe4\
+\xe5n\x17.\x02\x80\x14@\xc7\xc6\x9bn\xfd\x09\xf2\x06\
+\x9e\xcc\xf6C\xd6\x0d\xaek\xea\x94\x9b\xb4\xb2Ig\x05\
+\x99\xbd\xc11\xc3 x#\xc9\xd1\xc7\x11\x8c\xa56\x95\
+$\x83\xea\x86\xd9ZX\x9d\x81\xd5B`\x18\xee7\xaa\
+f\xc8H!\xec\x94hR\xa5\x7fM\xd6\xba\x18Et\
+\xa0\xc70^\x8bAb[$i\x9aHU\x8c\x89\x94\
+u3C\xf5\x9e\xc0[\x80\xf2,!$\xacPq\x9e\
+\xe2k\x85w'!\x13\xee\xbf\xff\xa1\x8c\xa5\xd0\x83~\
+\x00\x12\x09\xce\x1aH'MC\xa5\x9a\xda\xd3\x99M0\
+\xca\x9fI\x1f\x04\x81Z\x87\xc0\xa4\x8f\xad\x83\xe1\xac\x09\
+k\xb1(A\xc6\x8c\x05\xef/\xb4D\x93\xae/\x1b\x05\
+\x16\xaeM \xbc^\xb3u>u\xbdI!\x91\x7f\x82\
+\x94\x09}\xfd\xfd\xee\x86\x1c\x9fX\xd7\xd2\x5c\x992\x0c\
+\xc3\x8d\x8c\x18\xc0\x04\x0c\xaf\xe1l\x8cwm\xe2\xf8\xef\
+\xed\xaf1\x1eFt\xb5\x85\x85\xe1\x93d[W\xe3\x11\
+0\xa0\x95\xdc\xab\x8c\x06A&E\xabQz\xd3\xbe\x06\
+\xd3m\xd7F\xeb\x99mS\x13\xc1\x02\x06\xfb\xcef\x8c\
+~F\xf1 4\xa0t\xf7\x8c\x9b=f\xcc\x98\xf1P\
+]\xfaQ\x03@\x15@u\xc6\x8c\x19\xffa\x9d_6\
+(n\xb8\xa8\xcbd\xf2h \x98\xe5bl\x0f\xea7\
+\xee\xbdQPr\x02b\x98\xef-,q\xfaj\x10@\
+\x97k\xf37\xaf\xc8\x16g\x1fj%a0$\xab?\
+\x03`\xcdLbIoo\xf6\xe6[o\xe2\xaf\x7f{\
+\x11o\xbc\xf9&\x96\xf6\xf5\x0e\xf7\x0f\x0e\x81\xe0\x0f#\
+z\xad'\x1d\x9a\xda\xafm\xe8B\x99\xc91\xdcWf\
+]\x7f\xcb\x15v\xcfI\x0b\x8b\xb5d\x96\x87p\xc8\x02\
+-\xc8F<#\x855uc\xd6\xe31Dx\xf5\x95\
+\xd7q\xd1\x05\x97\xf2>{\x1d\x80\xaf}\xfe\xa8\x84\x88\
+\xec\x1a~i<\x1aA(\x89\xb0L\xd6\x00\xe3O\x1f\
+\xcaL\xaf\xff'`8\xcbP2\x0b\x864\xbf\x99\xc9\
+\x11D\x14\xb6\x97\xfdB\x88\x8e/\x8d\xecxm\x0d\xc3\
+#\xc7S\xd3\x9d\x03\x01\x0f>\xf4@6g\xce\x16h\
+fM\xa6\x80\xef\xb0nz\xac`\xf6\x9d\xf9\x18C\x8c\
+r\x1e\xbf\x1d\xaf\xfdgQ\xdc8\x9d\x05\x16\xe5E\xd8\
+z\x9a/\xb8\xb0\xf1\x14M\x02\x0f\x04\xc8\xc9\xa5\xe5\x83\
+\xc7B\x93\xc6\x82\x071\xc8\x00\x8b\x063\x10\x05_{\
+\x82\x06 e\x84\xb4av\x8e\x0e \x94\xa7\xc5\x0c\xa4\
+IB\xa7\xfe\xe8\xec\xed\xa1t\xba\xa5\x1b\x90\xd7/H\
+\x00\x94v\xd8a\x97\xa9\xdd\x9d\xdd\xab\x06\xfe\x84\xff\x15\
+\x07p\xb8\x0d\xd8:\x0a\xd1\x03\x93\xce\xffR\x06\x00\xe7\
+\x02(\x81g\x03\x14\xf6SJ\x04\x08( \xb1\xcf\xd8\
+\x00\xa4CfS\xa6V|\xf3N\x10aio/n\
+\xb9\xf96\xdcq\xeb\x9dx\xe9\xaf/\xe2\xbd\xf7\xe6'\
+\xc8\x08\xe5R\x8aFV\x87 Q\xee\xe8\xec\xc4\xc4\xc9\
+\xcba\xb5\xb5W\xcev\x9a\xf3\x89d\xd3\xcd7EW\
+gG\xc8\x11\x83\xba\x86nc\xc1\xa0\xe9\x84\xe9\xfb\xc2\
+2$\x90)\x82\x02\x13\xe3\xb1D\x0c\xf7\x1c\xdc\xd6\xb4\
+Q<\x86\xaa\xdb\x1bo\xbe\xd5\xbc\xe1\xfa\x1b\xd3[n\
+\xbc\x1do\xbe\xf8*\x90\x08JKjS\x0f{s\xf5\
+\x0a\x8f\x04\xf8\x9d\x97Q\x1fjBP\xaa\x96\x86Ee\
+\x08(/ \x11J^\xd3\x14\xe8{\xedY IT\
+S\x10!\xcb$\x98\x19\x1d\x86?\xd6B\xb2\x15^\xcb\
+\x1bc\xc2\xccs?\xd8\xf7\xbe\x22\xa98\x97\x5c\xf2\xeb\
+\xe4\xddy\x0bq\xd1\xaf\xcf\xa7C\x0e\xfd\xa2\xad\xb9W\
+\x19\xa7\x80\x1egl^\xc6\xc8\xf8_=\xe10\x9b8\
+\x10Q\xfe\x8b\x9c\xc0\xf1\x17a\xacg\xe8\x99l\x86\xf6\
+L\x22#a\x8b\xa1P~<\xb9Q\xa0\xc9\x084\xde\
+\xc8L\xb4\xef>\xd0\x03\xcdC\xeb\x89i\x1e3\x01\xeb\
+\xad\xb3\xdez\x95J\xe5\xf7\xf5z\xdd\xec\x12\xb4\x99\xe4\
+\xd5\xbc\x02`\xd9K/\xbf\xf5\xf0Y[ms\xac\xe3\
+\x92!\xd8$c\xf7u\x0c\xf7B?\xf3(\x8b\x99\xdb\
+\xa2\x19\xf1=\xc2\x06\xf6\xf1\xc4\xd48x\xaf\x22Hc\
+=\x09x\xfd\x8d\xb9\xfc\xab_\x9eO\xb7\x5cw3\x9a\
+u\x89$M \xec\x04\x9c\xc9\x8e!\x05\x83$\x03R\
+\x82\x88\xd1\xc8\x9a\xe8\x1a\xd3\x8d=\xf6\xdf\x0b\x87|\xfe\
+`\x8c\xd1\x1bab\x05u\x99x\xf4\x17\x19\x11#\x90\
+^\x04c\xc5b\xc1\x93\x9eu3Y\x1b\x85\x07\x80\xf7\
+\xde\x7f\x1f\xb7\xdet\x1b\xdf~\xeb\x1f\xe8\xa9G\x9fF\
+\x9a\x085g/\xd4`\x9f\x00!I\x94\xf7\x95\x94\x08\
+Y\xa6\xac\x15K\xa0\xbf\x7f!\xe6\xfc\xe0\x02\xac:k\
++\x0c,\xd1\xe5y\x8bD\xed\xae?\x02\xa8\x04,x\
+\xfby\x5c\x7f\xd0'0\xa6c\xa2\x1d\xa1\xce\x9a\x198\
+\x91\xb8\xe7\xf1\xbbP\xadT\xe2J:o\xcf^{r\
+\x10\xc4\xc9QN\x00\x7f{\xe1E\xec\xfe\xc9\x9dPJ\
+J\xa8v\x94q\xe7\x1f\xeeCwW7\xc2@\x0e@\
+|\xc5\xf13\x8b\x15%\xe0\xabJ\xf7\xfe\x82Ex\xfe\
+\xb9\xe7\xf1\xecS\x7f\xe1y\xef\xbeE\x83\x8d\xc5\xc82\
+B\x92T\xd0S\xeb\xcaV^yF\xb2\xfaZ\xabc\
+\xf55\xd6@\xad\xea\xd75&\xc7\x8d\xcc\xab\xc2\xa2:\
+\x9a\xcdS\xbe'\x13\x08\xb5wo\xd7Z\xc334>\
+\x8f8z\xe0\xf16\xfe~\x9b\xc7\xd7\xfe\x81\xc1\x05\xab\
+\xad:n\x16\x80\xb9P\xa7\x06Y\xad\xcd\x03\x80\x8eJ\
+\xa5\xb2\xc2\xddw?\xf9\xbdi\xd3V\xde\x9b}\xa4\xf6\
+\x91,\x17Cb\x02\xbd(\x04\x04\x9f\x82\xb1\xf4\xc7\xcc\
+\xf0\xf3\x8a*\xe9\xdfze\x18\xe5\xcf2\xc9g\xfc\xe8\
+'t\xc5\x05\x97\x82\xa8\x04\xa2D\xaf\x5c\x13\x10f\x06\
+\xd6tt\x01\x10I=(\xa5\xf2cd\xca\x12fM\
+\x94\xbb\xaa\xf8\xaf\x1f\x1c\xcf;\xcf\x99\xd3\xc6<\xc4\x0d\
+\xda&\x10\xf4x\x88\x0a\x02\x84\xe7\xff\xf6B\xf3\xde\xbb\
+\xeeO\x86x\x00k\xce\xfc\x18m\xb5\xf5\x7f M\xdc\
+\x12\x13A\x84F\x96\xf1\x1d\xb7\xdeE7^{\x1d\x1e\
+}\xe0q4\x9a\x19D\xa9\xa4#\x08\xfbe\x1b\x01\x00\
+R\xa2\xdel\xa2B\x02\xa5\x92Z\xf6+\x13\xa9\xfa\xa1\
+\xb2\x89\xe1\xda\x18\x1cq\xe7]\xe8_\x00dM\xa5\xf4\
+~\x17C\xea>\xfc\xb8i\xc0E{}\x06\xcd\xd7_\
+\x00\x8b\x14\xa4\xd1A\xca\x0cko\xba&\xce\xbb\xf0W\
+!\x90\xfb g\xaf\x11\xb6\xb5@h\x18\x02\x85\x05^\
+~\xf9u|\xe1\x0b\x07\xe2\xfd\xf7\x16\x82\x04  0\
+m\xe5I\xd9%\x97\x5c\x9dtvt8\xef\xc7\xef\x00\
+\xdb\xac\x22\xa1\xf7\xf5\x80\xd9\x96\xd6h6\xb2+/\xb9\
+J\xdc|\xd3\xf5\xf4\xd7'\x9e\x85\x94\x8c\x04\x04\x94R\
+\x94H \x93\x99\x1a\x97\x90\x12,\x19RJ\x8c\x990\
+\x1e\xb3\xe6l\xc3\xfb|f?Zs\x8d\x99\xf9\x0d\xeb\
+W\x89\xda\xd5\xd3\x07E\x9f\xeeH)HW&~n\
++i@0\x87\x16\x9b/\xb9\xa8\xc48\xf8\xbd\x7fh\
+P\x00\x00 \x00IDAT\xa0\xbd\xb6\xbb\xf5\xd6\x1b\
+\x9f\x85:0\xa4\x19\xa5\x08r\x18\x03`\xea_\x9f\x9f\
+\x7f{Ow\xf7\xe4\x80\xd9\x1e\x92\x06h\x1f\x13\xe07\
+\xb6\x9b\xb8\x0d\x1b,\xb2\x8a\xad\xe4\xc4\xa0CQtu\
+c\xfaoo\xbe9\x17G\x1c\xfe%\xbc\xf6\xfc;(\
+\xa7%\x08A\x10\x22\xea\xe1\x04<V\xdd\x05And\
+\xd8\x8c\xa0\x92>V\xad\xde\xe8\xc7.\xfb\xee\x89\xe3\xff\
+\xfb\x04\x94\xd2$\xf0\x04\x0a\xbd\x82\xa0.a\xfdL\x9a\
+f\x96\xe1\x7f\xbe\xfb=\x5cs\xd9U\xca\x8a#\x85\xe4\
+a,;q9\x1c{\xe2\x09<k\xbb\xad\xe8\xd5W\
+_k^w\xd5\x0d\xe9\x0dW_\x8b\xf9\xef.@Z\
+)\x03HA\x1a\xd0\xe0\x1d\xc4\xda\xa87\xc1\xdc\xc4&\
+[n\x8em\xb6\xdb\x16\xcf>\xf9(\xee\xba\xf9.\xb5\
+\xf1\x07\xda\x0b `xp\x10\xe3\xd6\xdb\x1c\xfb\x9f\x7f\
+6\xfa\xde\x07\x9a\x0d\xd8m\xc3R\x02\xe5n\xa0\xdc\x01\
+\xdc\xfd\x83\x93\xf0\xd2\x0d\xbfC\xa9\xd4\x83\x8c\x9bH\x00\
+\xb0d4\xb2:\xbe\xf4\x8d#\xf9\x90C\xf7#F\x8e\
+0\xfb\x9f`\x0ad\xd7\x17t\xdd\x10Z\x19\xfa\x06\x06\
+\xf0\xeb\x0b.\xc4\xf9\xe7\xffRmR\x225\x0fJ$\
+\xd1\x18nb\xc2\xb8\xb1\xf8\xc2\x17\xbf\x84O\xee\xbe\x87\
+\xb3\xc4\xb1W\x15\xe9\x068T\xfcL2.\xb9\xe82\
+\x5cr\xc1EX\xf0\xce|\xa4i\x09\xa0D\x0fZ\x0a\
+\xd7]\x02\xa0\xfc0\x06I\x80\x05Cd\x12\x19Kd\
+Y\x13[\xee\xb0\x0d\xbe\xf9_\xdf\xc2\xd4\x15\x96\xd7\xaa\
+\xe0\xcb@\x8eu\xa7X_|\xe3\xe9\x01\xa6\xe5M;\
+}\x80\x9d\xe6\x0b\x0cb\x10!\xcf3\x02H\x00\xb7\xde\
+v\xd3I\x07\x7fn\xcfs\x11-\x0a\x8asI\x00\x8c\
+\x1b7n\xdc\xccg\x9e}\xfb\xbe@\xc0}\xf4\xb2\x05\
+P\xd4\xf0\x05\x1e@a(r\xe3\xe2<b\xc44?\
+\x8a\xc1\x7fy\xeeo8\xf4\xc0\x83\xd0\xe8\xcf\x90P\xc9\
+*\xbe\xb2\xfc\x04)Y\x0d\xde\xb06y\x1aP\xcc'\
+\xa6L\x96\xcc\x8c\x84\x18\x19\x08Rf 4\xd1l6\
+1s\xa3\xd5p\xd1\xc5\x97\x22M\x13=\x1a\xec@@\
+Q\x17Ne\x8c\x04\x0e?\xf8\xc1\xc9\xb8\xfc\xc2\xcbQ\
+.\x95u\x83\x0a$\x04\x08\xcaPo\x0ca\xad\xf56\
+\xc0\xb3\x8f?\x85R\xb9\x02IB\xed\xdc3\x03\x95\x89\
+\x02\xa2F3\x83\xcc\x04\xb6\xdcz3l7g\x0ef\
+\xcf\xde\x10c{\xbaAD\xe8\xed\xeb\xc3\x9cY;\x02\
+u\xa1\xfb\x84\x0c\xb5\xf5\x97Q\x1f\xea\x87\x9c\xb8\x0a\xb6\
+=\xe6\xeb\x18;}\x1dT\xba\xc6\x82\x050\xb8\xe0M\
+\xfc\xedO\xf7\xe0\x85\xdf\x9f\x07^\xb2\x18\x95\xa4\x13z\
+\x05\x00\x043$Kp\xca\xb8\xed\xde\x9b1vL\x8f\
+W\xdd\xa2z\x862@\x02nfEsmi\xdf\xe2\
+\xe1\xcd6\xd9\xb0\xcc\x92\xd0Q\xeb\x04X\x80S\xb2\xf1\
+d6\x0c\xc9\x19\xfa\xfb\x17b\xe6\xaak\xe1\xc6\x9bo\
+\xb7\xdd!\xc7{gX,IF\xf9\x09x\xf5\x95\xd7\
+\xf1\xf5/}\x15o\xbc\xf2\x06\x12\xa1\x14_\x90\xff)\
+g(\xc2,\x81\x02B\xd7\x9b\xa1\xbcK\xb32\x85\xc0\
+\x18\x96\xc38\xfc\x98\xc3\xf0\xf9\xcf\x1ff\xe90+E\
+\x02c\x97\xab\xccm\xf4\xc2\xf02R\xde\x16}C\xde\
+o^9\xbe\xf1\x04\x9e}\xe6\xc9Kv\xdcq\xb3\x13\
+\x01\xbc\x03`\x00\x1e\xa5~(\x03X\xf6\xc4\x13\x7f\xb4\
+\xc3\xc1\x87\x1eq\x81h\x99$(p\xcb\x0bC\xac\xc4\
+\xed\x00\x22\xafrh}\xe61H\x82\xf1\xd6\xeboa\
+\xafO\xee\x0d9l6\xaf\x94t?/\x01\xc9\x0c\xcc\
+\x8c,k\xa0\x99\x0d\x81\x0049\x81(\xd7\x90d\x0d\
+\x88\xac\x01\x08\x09!JH\x922\x98\x08\xc22\x9f!\
+9\x83\xe4\x0c\xc3\x8da\xac\xbc\xfe4\xfc\xf6\xb7\xd7\xa8\
+\xa6\xb6k\xe1\xe3\x15Y\xad\xf5rK6\x95\xfb\xda\xdb\
+\xd7\x8f\x0d\xd6Y\x1b=\x95et\xdf]@\xe8\xbe\x9e\
+\x04\xf4\x979\xa5ZBK\x02\xe0D}.\x9b\x04\x9a\
+\xcd\x0c\xc3\xcda\xac\xbb\xc1\xa6\xd8~\xcev\xf8\xc4'\
+\xb6\xc1\x84\x09\xddA+\x99\x0fl^y\xe5\xef\xf8\xf4\
+\xff\xfe!\x95\xcb\xb5\x80\xe7j\xd6Lbhx\x10i\
+y\x0c\xd09\x1e\x92\x80\xc6\xa2w\x90\x88\x06*\xa5\x1e\
+0\xb3\x02@A\x90,!@\x18\x18\xee\xc5Q\xdf9\
+\x12\x07\x1d|`\xb1\xeb9\xa2P\x02q\xff|\xe1\xe2\
+\xc5\xb8\xf0\xfc_\xe3\xf2\xcb/\xd3\xa0,\xc0I\x06\x96\
+\x8cf\xa3\x89rJ\xd8w\xbf\x03\xf0\xe5\xaf|\x85\xcb\
+\xa5\x84\xd4\x94\xab\xf9>`+\xd0\x1a\x8f\x90\x09\xb8\xed\
+\xc6\xdb\xf1\xcd\xa3\x8eAgZ\x03\x92\x92Rr\x10\x12\
+\xc0M\xdb\x06\xdft\x87Z|\xa6i$\x98\xae\xbb\x99\
+\xfb\x03\x98\x9b\x18n\xd4\xb1\xd9\xb6\xdb\xe0\xa7g\x9f\x81\
+\xd4\xf3\xc4\xf2\x011O\x96\xcdu\xc4\x9b\xa2\xfb\xd8\xdd\
+\x8f\xbb\x12\xa3\xc8wi\xef\xe2\xfb\xd7X}\xd2a\x00\
+\xde\x04\xd0\x8bhT\xc2\x84*\x80\xe5/\xfa\xcduG\
+\xce\xdev\x87\xa3,\xb2\x15*,\x0a\xde\x15\x85<\xe5\
+\x8e\xc9(b\x8c\x1fC5\xfc\xe2\xc5K\xb0\xcb\xce\xbb\
+ap\xc9 \x92\xb4\x04F\xaa\x17\x03\xe9Fi\x0cb\
+\xb0!Q[e\x03,\xb7\xfe\xe6\xe8\x9e\xb2\x1a\xaa\xdd\
+\x1d \x02\xea\xc3\x12\xf5\xc1A\xd4\xdfy\x0b\x8b^x\
+\x02C\x7f\xbd\x17\xa8\x0f\xa0\x5c\xe9p\xe5\xb2\x84T\x1d\
+h\xd4y\x10[\xce\xd9\x0a?\xfd\xe9\x99\x01\x0d\x00\x02\
+\x05w\x1d\x8a\x10\xcc\x0dp\xdc~\xc7\x1fp\xcc\xe1_\
+G\xb9R\xd5\x80EHY\xcd\xb3g`5/\x931\
+8!\xa0I\xc8\x18\xa8\xd7\x87\xb0\xee\xa6\x1bc\xbb\x1d\
+\xe7\xf0N;\xff\x07\x96\x1d?\x96D\xe2\x14\xc9\x07#\
+\xff\xf7+\x87\x1d\x8d\xc7\xee~P\x1d\x00\x12pWS\
+\xca\x04;\xac\x9d\x94\xf4\xb5\xb4\x9b\x9bL\xc8\xa4\xc4Z\
+\x1f_\x03\xe7\x5c\xf4\x0b$Bx\xc0\xe7{?q;\
+\xb7k\xcb\xf0=\x831\xef\xdd\xf7\xf0\x85C\xbf\x80y\
+\xf3\xe6\x81\x04!\xcb\x9aX\xe3c\x1f\xe3s\xcf9\x87\
+:j\x9a~O\xb9\xe2\xba\x9av0\x0e\xe9\x0d\xd7\xdc\
+\x84c\x8f\xfe\x06\xba;\xc6@P\xa2\x5c~\xe1\xad\xa7\
+\xd4\x9e\xa0\xe4L\xb5q\xa6Vt\x964/(\xa2\x99\
+ AD\xc88\x03g\x19\x9ar\x18ko\xbe\x16~\
+u\xfe\x85h=!+\xe6E\x91W[dPG\xeb\
+=\xe4\xe5\x91\x17\x07\xe8\xed\xef\xaf\xaf\xbe\xda\xf8-\x01\
+\xbc\x0a`\x11\x0a\x00\xa0\x1b\xc0\xe4\xdbn{\xf8\xb8\xb5\
+\xd6^\xf7\xb3m\x07!r\x09\x0d\x83\xdb\xac\x123 \
+\x8f)\xa3\xa9d\xa8x_8\xe4p<\xf6\xc0\xe3H\
+\xd32 \x12\x80R\xe8\x09-\x0c\xf7/Ae\xe5M\
+\xb0\xc9\xe1\xdf\xc6r\xd3WF\xa9,\x90\xa4d\xbb\xce\
+\x89P'%\x0c\x0dK,\xec\x1d\xc6\xfb\xaf\xcd\xc7\xbb\
+\x0f\xdc\x82y7\xfd\x12\x1di\xaa\xf6\xcc\xdb\xd5\x1a\x19\
+2nb`\xb8\x17\xa7\x9cu:v\x9a\xb3\xb3\x9b;\
+&XA4\x06\xc5\xe7\x90\xe9.\xbc\xfa\xeak\xcds\
+\xce:/\xb9\xf7\xce;\xa9\x9e1\x04\xcc\xcc\x84\xfe\x93\
+\x19X$z\xc5e\x86\xa1\xa1a\xac8}:v\xdf\
+\xf7S\xbc\xcb\xae\xdb\xd32\x13\xc6\x00\xc1\x80%\x07\x1c\
+\x8c\x1b\x92@\xc8$c\xbf=\xf6\xc7\x9b/\xbc\x8a4\
+)\x01\xa9\x00\x98\xc1\x99\xdf]1\xf6P\xb5\x93]\xa4\
+\xc5z#\x8f 4\x1a\xc3\xd8\xfd3\xbb\xe1\xdb\xc7~\
++\xb0\xb0\xc4\xae~\xa3\x0b\xed\x94\x01x\x7f\xc1B\xec\
+\xb2\xd3\x7fb\x98\x1bH\x88q\xdf\x03\x0fq)M\xe2\
+ID;\x9fc<\x01\xeb\x11h\xd7\xff\xbe?=\x80\
+\xc3?{\x08\xba\xba\xc6\x82\x92\x04\x02%\xaft5\xc8\
+7\x5c\xef\xc7@6\x8cZ\xd7x\xd0\xf8\xa9\x10\x95\x1e\
+5h\xccC\xe0%\xefbx\xe1\xbb n\xa0Z\xee\
+P\x00\x02\xdd\x85$\x82\xe4\x0c\xcc\x19\x9a\xcdal\xba\
+\xdd\xe68\xf3\x97g\x05F`D\xd7\xbc\xa5\xc5Fc\
+D\xdb\x19M_/\x8a\xf4Ub\x9du\xa6n\xba`\
+\xc1\x82\xd7\xa0\x00`8\xce\x85\xa0\xf6\x0fO\xbe\xff\xa1\
+\x17.\x98\xbe\xc2\x8a\x9b\xb9\xac\xf2\xddqW\x8d\xd6B\
+\xc3\xb4\xc5\x157\x9b'\xfc\x8d \xad\x22\xe2\xed\xc8\xd2\
+}\x9a?\xdcq7\x8e:\xfchTk\xddH\x84F\
+x$\x002\x0c\xf4-\xc5\xcc}\x0e\xc3\x96\x07\x1d\x06\
+H\xb7\xe3Y\xea\x09\x003\x9eh\x0f\xc4!`\x90\x81\
+\xa5K3\xbc\xfb\x97\xe7\xf1\xf4\x99_Ci\xc9\xbb(\
+\x95*\xea%7U\xa3C\x02\x95\x0cw=t?\xaa\
+\x95Jn\xad\xfcg\xbd\xbd}\xf8\xc3\x9d\x7f\xe4+.\
+\xbe\x9c\x9ey\xe6)tT:\x01J\x90P\x02\x10\x94\
+\x07\xc0\xa9\xb2@\x1a\x0a8\xcd0<8\x88\x1f\xfe\xfc\
+G\xd8f\xbbm\x02\xf7\x9e\x15\x03\xd4\xb5.\xc4lN\
+\x89\xdb\xde\xd0Q\x1f\x1a\xc6\xf1\xdf\xfe\x1f\xfc\xe9\xe6;\
+P\xa9\xd4\xd4\xeb\x04\xe0L\xb3,cHu\x10\x98[\
+F\xcb\x0c&\xa1\x86\x0e\x08\x90\xdc@\xf7\xf8.\xdc|\
+\xd7- \xa1l\xbe\xaf\xf8\xbe-\x86nK\xb7i\xc9\
+)\xacW\x0b\x1b+\x1cFc\xfc\xf8'?\xc5\xd9\xbf\
+8\x0b\xdf>\xf6X\x1ct\xd0\xe7Z\x17\xe90Z\xc6\
+\x1a=\xb6\xa0\xaf\xb7\x0fs\xb6\xdb\x09\xcd\xfe\x06\x04R\
+\x08\xa1gLH\xa83\x0f\x1bu\xf45\xea\x98\xb0\xf1\
+'0}\xdbO\xa1\xba\xcc\xf2\xa8v\xd4P\xaa\xa4`\
+!\x91I\xc6\xc0\x92!\xd4\x17\xce\xc3\xc2g\x9f\xc0\xbc\
+{~\x83d\xd1|\x94+\x9d\xb0 \x00 \xe3&\x08\
+\xc0@}\x00\xdf8\xe9\xdb\xd8o\xbf\xfd]7\x81\x9c\
+\xef\x1cRj<\x9ex\xe3\x93i/\xc7E\xbfc\x19\
+\xa6)\xd2\xbb\xd0\xf3\x8c\x033\xf0\xdd\xff9\xfe\x8b\xe7\
+\x9d\xfb\xa3\x9b\x01\xcc\x87\x1e\x08\x8c\x01`<\x80\x15\x9f\
+{n\xde\x05=c\xc6\xaeg\x10\xd3\x17\xebV\x5cQ\
+\x84:\xa7\xd0=7\xe7\x03\xf8\xdbb\xc9\xfe\x0f\xe3\x87\
+\xcc\x88\xab\xae\x82\xd4\x82\x9e5%\xef\xbc\xc3'h\xe1\
+\xfbKATBB\x02\x94$\x90\x19\xd0\xdf\xbb\x10[\
+\x1c\x7f\x06\xd6\xdbi\x07\xd4\x97\xba\xcaC[f\xc9n\
+\xa9\x82\xb7\xd7F)\x83\x00\x06\xea\xc0\xa2\x85Kp\xef\
+\xf1\x87C\xbe\xf5\x1cJi\x05\x82X{\x01\x19\x9a\xd9\
+0\xe6|zG\x9c\xf8\xbd\x93\xedrR\xdf\x09\x16\x00\
+\x1e{\xec\x09\x5c\xf6\x9b\xcbp\xcf\xdd\xf7\xa0\xde?\x8c\
+\xa4RFBj@.!e\xfb!\x84^!l>\
+\x10\x0d@0\x1a\x8d\x01\x1ct\xc4\xa18\xfcK_\xd4\
+\x1e\x85\xaa\xb3?\xfej\xeb\xe4\xb5\x1c\xe9F\x89\x07\x89\
+\x95 \x0a\xdc}\xf7}8\xe3\x9430\xef\xd5\xb7Q\
+-\x97B\xef,\x15\xc82\x07\xc2K\x07\xfb\xb0\xd1f\
+\x1b\xe1\x99G\x9fE\xa9\x94\x22\xe3&z\x07\x17\xe0\xaa\
+\x1b\xaf\xc5\xaa3W\x0b\xda\x92(\xf4\xef\xcc\xafO^\
+8D\xeaK\x80\xef\xca\xab\x0a,Z\xb8\x18\x87\x1c|\
+\x00~\xfb\xfbkPJ\x93\xd6:9\xc7\x0bDd\xd7\
+N\x98W_?\xf2\xeb\xf8\xd3\x1d\xf7\xa0T\xa9\x82X\
+@\x92@\xca\x092H\xd4\xeb\xbd\xa8\xce\xd8\x02\x1b\x7f\
+\xf1x,3e\x12\xba\xc7\x08\x94+\x84\xe6\xb0\x9a\x16\
+5\xc4R\x024\x09X\xb4\xb4\x8e\x85\xf3\x06\xf0\xf6\x1f\
+\xaf\xc6\x9bW\x9d\x89\xcerI\xd7F\x8d\x09H\xddE\
+\x1c\x94\xfd\xb8\xfe\x8e;\xb0\xe2\x8a\x935y\xe1\xdc\x80\
+\xaf+F\xcd\x9d\xee\xb8x\xb1.\xb1+\xcd\x0eX\xc7\
+Zcv\xb2\x8a\x80\xe3\xe1\x12\x025)\xc7\xf8\xfdU\
+\x97\x1d\xf1\xedo~\xe9\xd6z\xbd>\x17\xc0\x90i\x1b\
+\xf89\x96J%\x01!\x96\xd3\xce\xaf%\x84\xbc\x862\
+\x1b\x22\xdcn\xbbP\x1a\x1dz\xf9\xb2h6\xb8\xf8P\
+\xe1R\xbb\x15\x9dN4\xac\xcb\xe6\xbd\x07\x80[o\xba\
+\x8d\xde~k>H$\xca\x02B)\xff\xd0\xf0R\xac\
+\xf1\x99\xc3\xb1\xd1'<\xe5\xd7\x95\xf07\xcfe\xec\xca\
+l\xb2\xdbg\x81\x0c\xe8,\x03\x93\x96\xed\xc1V'\xfc\
+\x04\x8d\xce\x1eH\x99!\xd3K[\x09\x84$Ip\xd3\
+\x95\xb7`\xa1^\x0foz\x95\x83\x03\x83\xb8\xee\xea\xeb\
+\xb1\xd7\xee\x9f\xc2\xe7>} \xfex\xc7}h6\x04\
+\xca\xd5\x0e$B\xadIHH\x80\x9808\xd4D\xa3\
+\xde\x04I\xa5\xfcB(an4\x86\xb1\xc2*\xcb\xe3\
+\xb0\xc3>\x0f\xbb_\xc0\xe7\xac\x012O\x09\xa0]q\
+\xf6,\xa3\x05T\xfd\x5c\xb2\xc4\xd6[o\x81ko\xfe\
+=\xce\xbc\xf8l\xcc\xdeu\x0e\x96\xd3\x1f\x00a\x10d\
+S\x8dtw\x8f\xed\xc0'\x0f\xf8d\xf3\xa6\xbbn\xc0\
+\xf9\x97\x9c\x8d)3&\xa9|\x05P\xabu\xe1\xea\xab\
+\xaeQ\xebZt\x01nq'YYqB\xae\xfe\xfb\
+\xdf\xbbw\x02ll\x7f\xbc\xdb\x13\x187~\x0c\xae\xb8\
+\xf2\xf7\xcd4i\xa3\xfcd\xc0\x9c\xed3\x06\xf0\xfc\xf3\
+/\xf0m7\xdd\xa6\x95\x9f\x80D\x9dh\x94Q\x86\xc1\
+\xc1%\x98\xb2\xe3\xe7\xb0\xdb)gc\xfa\x1a\xcbc\x99\
+\x89\x09\x08\x84\xe1!\xa0\xd1\x00\x9aR\xcbB\x064\x87\
+\x011\x0c,S\xab`\xc6j\xe3\xb0\xfa\xde\x07`\x83\
+\xe3\x7f\x8d\x81r\x0d,3\xd5\xea$ D\x0a\xa2\x14\
+\x15t\xe0\xf8o\x1d\xcb\xae\xd6\xce\x88y[J`<\
+]_\xb9c\xc7\xdd\xa9\xb8\xd9\xe9\xea\xb6\x1a\x13\xd8\xe3\
+\xa7o\xf1]\x9e\x12\xbe\xf2\x87\xf3S\x95Je\x9aN\
+n\xf5\xde?\x11(\x05\xd0)\xa5\x1c{\xe4Q\xdf\xf9\
+r\xb9TN}7\xc6\xa9\xa4C\xa8p\x8e\xc0[\xaf\
+\x1f\xfc\x9a\xf4\x0eB|\x94\x0cf\x86\xa2T\x01\xac\xe8\
+\x1bA\x84\xef\x7f\xff\xfbX\xbcp\xa9\xde\xf0\x92@$\
+\x84f\xd6@e\xf9U\xf0\xa9\xd3\x7f\x88\xa5\xf3]F\
+v\x85\xa5\xf9\x17\xb9\xca\xb6\x1c\xd6cD\x0c$\x82\xd0\
+5\xb6\x13\xe9\xc4U\xf0\xf2\x1f\xafC\xb5T\xd6e\x03\
+`\xd5\x87\xac\xf5tb\xc3\x8d7\xc4_\xfe\xf2W\x9c\
+u\xe69|\xd2q\xdf\xa5[o\xbe\x15K\x16\x0e \
+M\xcb`!T\xd7D(\x078k2J\x95.l\
+\xbb\xf3l\xfe\xef\x1f\x1cG\xff\xb9\xdb'\xb0\xb8\xb7\x17\
+\x8b\x97\x0cBr\x13\x1d=]\xd8i\x8f\x1d\xf0\xa33\
+NC\xc9,\xf4\xf9 !\xee\x8b\xe4E!`\xca\x94\
+I\xd8v\xbb\xadP\xe9\xae\xe2\xc1\xbb\xee\xd3\xabU\x19\
+K\xfa\xdf\xc7\xefo\xbd\x16;\xec0[t\xf5t\x03\
+\x0ctT;p\xc7\x9dw MJ\x90$1\xef\xad\
+\xb9\xd8{\xdfO\xa3\x94\xa4^yFJ|\xcb\x1e\x1a\
+\x06#;\xb1K\x9cG.\x01H\x93D\xd8\xe6\xd1Y\
+\x05+\xcc}\x00\xf4\x12\x1e\xfb\xf5ci\xd1\x82\xa5\x00\
+% J\x95\xba\x10\xa3\x7f`\x09\xd69\xe2{\x98u\
+\xe8!H\xf4\xe1\xa7Y\xe6\xc9\x86G\x88O\x13\x01\xa0\
+\x0c\xe8\xae%\xa8.7\x09\x137\x9d\x8d\xbf\xdd\xf9;\
+\x94\x9aM\x90H!Yu\x9e@\xc0\x1b\xaf\xbfB\xeb\
+n\xb8!VXq\x05\x8f\x1b*\x97\xd0w66\xde\
+\xc1_\xa87\xa1\x17\x95\xe7\x7f;\x80\x09\x0d\x84\x01\x8d\
+\xbc\xf7D\x84\xb9\xef\xcc{\xe6\xf7\xbf\xbd\xf8a\x00\xfd\
+\xd0\x1f\x0e\x89\x87/\x05\x00\x91$i\xd9\xf4\xdfB\xa2\
+\x9c/\x00\xb8\xd1\xefV\x07\x10\xf0\x1b\xdf\x85p)\x8d\
+\xef\x12\xb9T.\x0fS\x05\x01\xb6\x87J,\x5c\xbc\x04\
+\x0f=\xf0\x08z\xba&\x00H\x90$@\xc6\xc3\x18\x18\
+\xe8\xc5._\xfd\x0e\xfa\x17)2\xfc9\xe7\xcc\xdff\
+\x9a\xc1\xf6\x99\xd5B \x02\xf4\x9a\x10R\x87\xdf@\x08\
+@H`\xf5\xad\xb7\xc2K\xb7\xef\x80\xfe\xc7oG\xa9\
+\x5c\xd3\xd3t\x84\x94J\xf8\xfd%\xbf\xc5\x9d\xb7\xde\x89\
+\x97\xff\xfa\x02X\x08\x22QB)\xed\xd0\xa7\xedjl\
+g\xc2\xd0\xd0\x10V\x9a\xb1&v\xdfkg|z\xbf\
+]\xd1\xd5Q\xd3\x9b\xd6\x08\x1bl\xb0\x162)Q\x1f\
+np\xb5\x5c%u\x88\x06\xdb~o\xe0&\xc6\x8eV\
+\x1c\x8c\x1b\xcc!h\xfb\xcd\xc3\x00@\x8c\xa6dd\x99\
+\x84\x94\x12\x99ZB\x08\x80 \x84r$\xa5\x9e\x16\xdf\
+a\xe7\x1d\xf0\xc3SNEcX\xd9\x92\xf7\xe6\xbf\x83\
+\x07\xee{\x10\xdbn\xb7\x8d\x1a'\xb0\xd9\x9b\x9e\xabo\
+\x8b\xe2\xf6\xe4\xa8U\x8dM3\x94:\x8f\xb1Ev8\
+\xbc6u\xf2\x1d\xa4W_y\x1dO>\xfc\x04\xd2j\
+U\x95\xa9\xc1\xbc\x99\xf5c\x85m\xf6\xc2\xac\xfd\xf7D\
+\xdf\xa2\x88e\xc6s\x02\x80L-T\xd5_\xb9\xd7\x1e\
+\x86\xb2\x90\xc4@O\x19(O_\x11\x9b\x1e\xf3#\xdc\
+\xf7_\x07\xa1\xa7k<\x04\x99\x15\x02\x09:*\x9d\xb8\
+\xf4\x92\x8b\xb0\xf9\x96\x9bXz\xfd\x1a\xb9CcZ\xbb\
+\xbe\x1c\xc4s\xd2\xef\xbf\x0b\xf5\xc3\xe7\xb9\xe3\xba\x1f/\
+\x04\x16uU\xabu\x94\xe1N\x9c\xb0\xe5\xf9A\x00(\
+\xa7iB\xde\xd2p8\xeb\xeeH2o)x\xeb!\
+Ntg`#\xec\xc9\x18X\xf1\xbb\x0b\xceY21\
+\xa4\xbd\x02\x1e}\xf81\x94\x92n\xcb*\xd6\xac\xed\x9a\
+:\x03+o\xb2\x1e\xb2\xe8\xd3\x88\x99'\x8ff\x87\xa0\
+$\xd7\xf0\x19\xb3v\x81a7\xc9\xc8L\xfd\x95\x08X\
+s\xaf\x031\xa47hH3bO%,]\xda\x87\
+\xd7_~\x13I\xb9\x86\xa4TC\x92\x94\xd5B\x13\x10\
+\x9a\xc3\x0d\xd4\xeb\x19\xfec\xf6\xd6\xb8\xe0\xb2\x0bq\xd5\
+\xf5\xe7\xe3\xe0\x83?\x85\x8eZM/\xbfU\x92\xa7\x16\
+\xa2\x09\xd4\xaa\x15\x22\xc1-n\x7f`!C\xb6\x17\x06\
+\xd6\xf5\xc8\xe0\xbapAZ}\xddh\x0c\xa1IPK\
+^\xf5\xa6z\xa9\x0f\xfa0\xb3\xa8\xd5J\x19\xdb\xed\xb0\
+=\xc0\x0a\xccJ\xe5\x0e\x5cu\xd5\x15\xe1\xa2Lv\xc3\
+V\xce4\xb8\xff\xe1\xb3\xd8\xe1g\xaf*\xb1Z\xe8\xbb\
+\x22\xd0\x8b\xbc\x80\x9bo\xb8\x19H\xcb`$\xd6+a\
+0\x06\xb9\x8a9'|\x03\xbd\x0b\xdd~\x07\xab\xf8f\
+\x9bqS\xcb\x85d\xb5?\xc2\xf8\xd1\xe6R\xcbC\x15\
+\xc0\xca[o\x8d\xc9\xdb|\x0a\x8d\xe1\x01\xb7\x8c\x9c\x08\
+\x02\x09\x1e\xb9\xf7\x11\xf4\xf6\xf6\x07\xb52\xb5\x94h\xf5\
+xB\xa84\xe5\xf9\xa0X\xe4'y{\x0f\x82\xeb|\
+\xd1\xb0\xbaG\xb2\x84\xe8\x1c\xd0\x961\x00\x00\x94&I\
+\xd4\x5c\xe6\xb5iJ\x7ft O6[\x09V\xff)\
+\xaat\x88kN$\xcc\x81\x09\x1c\xc4\x013\xfe\xfc\xc4\
+\xb3\xa8TJj\xf3\x0b1$\xd7\xd1\xc8\x06\xb1\xc2\xc6\
+;\x22\x1b\x0c\x89\xb1n\xbfW\x1a\x03-\xeb*\x18\xca\
+EG\xe6\xda\x9eY-\x95\x9d\xb2\xe6Z\xa8\x8e\xd7\x83\
+;D\xc8H@R\x02B\x0a\x015](H\x9d\xab\
+7P\x1fB\xb9\xd6\x85\x83\xbe\xfcy\xdc\xf3\xc8\xed\xf8\
+\xf1O\xbf\x8f\x8d6Z\x0b\xa5T\x1d\xa9\x16,\xbc\xd7\
+\xf51[{\xcd\xc1'mt;$\xd8\x8f\xa8\xbc\xd0\
+\xdc\xefBs\xc8\x02]\x0f\xe8\x15\x88\x80$\x06\x04\xa3\
+\x89a\x88\xb4\xecg\x09\x06\xb0\xcfg\xf6Eo\xffR\
+P\xa2\x0c\xc7\x03\xf7<\x88E\x0b\x17\xa3e\x93\x97\x9f\
+\xbfw\x1d\xc2\x82\x81\xf8<\x8f143\xa3\x0d\xa6]\
+\xee\xfa\xe3=\x10\x22\x01@z\xb5\xa0\xc4\xd0\xf0bl\
+|\xd01H\xa9\xdb\x8d\x05e\xd0\x87\x91\xa8\xf4\x99\xf4\
+\xe4\x02\xb0@\x90I%\x0f\xfe\xb9\x10R\x02\x95\x06\xb0\
+\xe1\xa1_F\x83\x13\xb0]3\x01H$\xa8\x0f\xd5\xf1\
+\xd4\x93O\x05*\xdc\xda\x1eJ\xd2[\x81\xd2\x0fN\x1b\
+\xfc\xd1\xff\xd6\x9c8\xbavf\xd6\x8f\xa7\x0f\x7fG\xb9\
+\x14\xf4\xea\x09\xc8?\x0f@\x84\xae\x8a\xef\xa8\xf8\xe8\xed\
+\x9e\xe6#\x94_\x990vXeg\xfd[\xdd?\xf2\
+\xca\x22\x80\x08o\xcd}M7\xb4\xaa0\xc9\x14Y}\
+\x18\x13W_\x15\xcd!\x15SJ\xbd\xd1\xc5\xdb\xed\x96\
+\xe9u\xfe\x06\xf9\xf3\xb6\xdcJ0\xb2&\x833\x97G\
+\xa5#Ay\xf2\x0cHd\xd6\x1dW\x1dT\xf5e\x1d\
+\xd9\x90\xa8\xd7\xebX\x7f\xf3\x8dp\xfa/~\x86\xbb\x1f\
+\xb8\x11_9\xf2\x10\x8c\x1f\xdb\xedYt\xe7\xd6\xc7\x81\
+\xa2_E\x87\xe3\x87\xff\x17\x04v?ZV\xc3|\x18\
+v\x01[\x84\x15\xda\xfbq\xe0\x03\x00)U0\xd0\xdf\
+\xd7R\xc4j\xab\xcd\xc0J+\xaf\xa4w\x0e&`)\
+p\xdd\xb5W\xeb3\x0b\xfc\xd6\x8a\xbdD\x0e\xae\xc3\xa1\
+_\xa7\xfcN~\xc2!\xc1\xa8\x9am\xc3\xd0\xe0P\xf6\
+\xe23/\x80\x84P\x03\xaaP\xa7\xf24\x9a)\xd6\xd8\
+i\x0e\xea}\xadi\x98\xa3\xae\xa1\xcf\x1f\xfd\x9b\x99M\
+f\xa6\x16\x1a\x04z&OE\xf7*\xebB\xcaL\xb7\
+\x15\x81D\x82\x8a(\xe3\xb1\xfb\x1f\xce\x91\xfd\xb0\x05I\
+\xef7h\xad\xa7\xdf\xfd\xf5\xfd\xe2VN\x84\x1de_\
+'s*\xa5a$\xcb\x9a-\xa7\x80\x17\x1c\x08\x92\xe7\
+\xac\xc4\x95j%\xdf\x14\xe5\xe2\xb5:x\xee\xae\xb5i\
+\xf3\x1c\x99\xc0*0\xd0\xbbtH\xa7M\x94\x00#C\
+\xd6\x04:&.\x87,\x0b\xdd<\x13\xa4\xd9\xe4\xa3\x8b\
+e\x9d\x97\xb1\x04\xa6;`\xa7\xd3u|0\x902\xd0\
+\xb3\xc24\xc8f\x03\x94B\x9f\xea\xa4\xc4\xb9\xdcQ\xc6\
+!G\x1e\x82\xdb\x1f\xb8\x95\xcf\xf9\xd5O\xb0\xe3\xf6\x9b\
+!\xd5SW\xd6\xb2\x9bz\x90\xabu\xe8?\x85J\x9e\
+\xa1Ua\x017\x1d\x14\xcc\x00\xc0\x01\x12\x01x\xe5\xe5\
+\xd7\xf0\xcdc\x8e\xc1Y?;\x13C\xf5\xba\x1a\xac\x8e\
+8-\x015}\x96\xe9\xf5\xfdP\xe7$*\xcb\x07\xbb\
+\xbb\xd0\x96O\x84}\xf7\xdf\x07\xc3\xc3j\xffHRN\
+q\xe3\x0d\xb7\xd8\x19\x00s\xcam\xae[\xe2\x01\xbe?\
+\x16`l&\xbc\xb7\xfe\xbd\xef\x1b\xf8|\x0ag\xa5\xdc\
+\xf3\x17_|)\x81Hlj5\x8e\xd2D\xd7\xf4\xd5\
+\xd0=\xb6;\x90\x05\xa3\xc4\xd2\xd3\x13s^\xa05\x10\
+\x1e\xa0J\x8d\xaeR{\x0a\x99\x04J\x09a\xf2&;\
+\xa0\xd9\xac\xc3\x1c\xc7\x050\x90\x94\xf1\xe6\xdc\xb99\x1a\
+\xe2\xeb\x82\xbf{\xc0\x19\xd4\x90'\xa1\x01\xcd\xf3\x0b}\
+\x8d\x0b\xc1\x83\x22=\xf2=\x83\xd6P\xb0\x86\xd1\xcd>\
+\x86\xc8\xe5#\x95?\x8b\xe9b\xe4,\x86\xf5H\x8e\x97\
+\x05\x99|LE\x8dH\xb9412\xf6\xf7\x0d\xc2:\
+\xbc\xa4\xe2\x08\x12Hk\xb5Bsa?\x94\x99\xffZ\
+\x95\xc4\xb0[\xb0\xed\x03\x00IFH*\x9dv\xb1\x8e\
+\x1aX&4\xeaC8\xe2\x9bGa\xff\x03\xf6\x82:\
+3\xcc\x1d\x84j{\xc5\x94\xc7\x81\xd0\xca\x18.\x9br\
+\xd5\xba\xbcp.\x18\x08\x07\x03\x83\xf1\x19\x9d\xd1\xc0\xc0\
+ \xf6\xdfw7\x0c\xd53d\xd9 \x16-^\x88\x13\
+N\xf8o\x0b\x02ak\xf9W\xa4\x06\xbf\x92\xc4\x02\xa5\
+\xcfq\x06\xb0\xeb\xee\xbb\xe0\xf4\x1f\x9e\x0e\x96\x04A\x09\
+\x9e\x7f\xf6Y\xbc\xf5\xd6;<u\xcad2S\xa8\xe4\
+\x9f\x8d\xe0\xb9\xb6N\x16|\xab/\xe0\xd3`\xdb\xdd[\
+\xb0!}&E<4\xfc0\xaf\xdfy\xe7]\xa4v\
+\xe6\x84 \x99\x91eu,3}m\xefd$\xd7k\
+\xc9Y[d/,\xb0\x1a\x92\xa0\xc0Q\x80\xacG)\
+\x87\x81\xf1k\xac\x81\x17$#\xd5\x89\x88\xd5>\x86\xc5\
+\xfa\xcb\xca.g\xbf\x22~\x9dC\xef \xdcS\xa2\xea\
+\xc1\x1e \x84C\xe5\xbe\xff\x14\xf3\xdd\xd7?\x13\xf2t\
+U\x85\x02\x0f ?Akc\xc6\x155\x15\xf3\xc5;\
+\xf4\x08\xfc\xa1@'\xfe!,\xb8<#\x1b@\x8cF\
+\xa3\xe9\xf2\xd3fH\xb8\xb3\xa7UJ\x83\xec\x99\xea\xdb\
+\x0bjm\xf4\x9c\x8a\xd9\xb4zI<X\x02I\x0a\x90\
+\xec\x07'fY\x93\xea*4\xb3\x0cSW\x98\x0ch\
+h\x90\x11w\xac\xb5\xe2\xb0y\xd4\x9f\xea\xa7\x12A\xef\
+Ls\x87~H\x8f\x8b\xf6\x00\x1cR[\x80\xed\xa1I\
+:>\x91\xd0\xdb\x83\x81\xa7\x9ex\x0a\x83C\x83\x00\x04\
+\xca\x95\x0e<p\xdf}J0\xa3\xd6\xf2\xddJ\x09\xa1\
+\xf7:(\x01\xcc\xb2&\x8c\x00\xf9\xe3\x06\xdd=\xdd\x98\
+\xb5\xfd\xb6\xea\xd8+\x22\xa4\xa5\x0a.\xbe\xf8<r\xd6\
+\x0f\x08\xdb\x8f5G|\xa1'=\x08\x0b=\xe8(\xc1\
+\xfaO\x1a\xc57\x0a\xea\xfd\xc6\x8a\x0f\x84B\xcb\x00\x06\
+\xfa\x0748\xda\xa3\xa3\x90\xd5\x1b\x187q:\xb2\xa6\
+k{c\xfd\xe3\xe0/\xdf\xb6\xd2\xe6\xc9\x8c\x01\x01\xc9\
+\xac\xba\x05\x19\xd01a\x1c\x92RE\x8f\x8d\x98\xc6\x92\
+\xa8\x0f\x0d{F+\xdf\x8f\x09WM\x84z\x14\x8ai\
+l\xc1\x1d?\x9d\xf2{<\xf66\xb2\x85k\x11E\xf4\
+\x9b\xcfK\x8f\x8e\x80\x15\xdeo\x04\xc7A6\xb1\x9d\x8b\
+\xb3\xcf\xd3@\x9d\xcep\xbc0\xaen\x0d&\xf4\xf4t\
+Fe\x10\x98\xeb\xc8\xfa\x96 \x0e\x22\xd1\xee.\x87\xb9\
+\xe7\x06\xa3\xf8^\xa3\xebM\x85\x18\x98?\x0f\xa5D\xaf\
+\x9ec\xb5\xf6*\xc3\x10&N\x5c\xb6e\xda\xcdZe\
+\xd6\xb5\x8b\x950\xde\x8a\xea-N\x10V\xd9\xa1\x97\xe5\
+\xfa\xe0\xa8\x08S'\xf7\xea\xe7\xd6o%\xac:sU\
+d\x19P\xae\x941\x5co`\xfd\x0d\xd7\x03\xd0\xda\x8a\
+\xec\xb3\x97%\xec\xf7\x9c\xacbx\xd6\x9b\xb5\xd20\xe3\
+\x93\x9f\xdc\x05C\x03C\x0a\xbc\x84\xc0m7\xdd\x89,\
+\xcb`\x17\x87I\x06s\x8evyme\x0f*\xd5|\
+P\x9f\x1f#\x0b~\xa6|a\x80\xcf\xcb!h\xa7\xe8\
+\x9e\x00u\xb2\x13\x00\xc9\xcalKH$z\x13\x94\xf5\
+jr\x84@\xb2S%\xdf\xab\xb0\xce\x88'\x0f\xae\xfb\
+\xc0\x90TB\x96e\x00\x09\xb0\xfe\x08\x82\x1a\x0b\xc8\xab\
+?\xbc\x12t<\xf6e\xc0\xbc\xf7\xda\xda\xbcoQ\x9b\
+xH\xd7\xcb\x87\xc27!\xc0\xe4[\xc0\xe21\x00\x8e\
+\x893\x1a\xe2\x17\x14Ym\xce\xf3\x1c\x22\x11\xb4\xe6\xd5\
+\xb33\xbe\xe1W6\xce#O\x83\x84\xd6\xacq\xcb\x8c\
+\x81=\x8d\x18P\xcaTJ\xb1\xf4\xc5\x17P\xaa\x04\xe7\
+d\xa8\x1c\x12\x97kK\xc8\x93W\xbf\xd6\xda\xdd\xee\x7f\
+\xe5o\xe0\xa4\xac\x1b\x9b\x01\x09\x94+5t\x8f\xe9\x84\
+\xf5f<A1u\xb2\x0e\x1c\xeb\xf5\xf0\x16\x1d\xf2&\
+_Lb\xca\xd1T\xdf\x1c\x91\xd7\x0e\xea{\x03\x0c`\
+\xe2\xc4ep\xc5\x15\xd7\xf2\xecmv\xc0\x17\xbfx\x04\
+N:\xe9T\x98O\x1f\xb4(\x0d\x00\x991\xd4GT\
+T^R\xc0\x0d\xaeF\x98LL\xd8x\xd3M0q\
+\xd22\x9a\x04\x81\xf9\xef\xbd\x8d'\x9fx2\xa8\xb4Q\
+\x12\x0e\xe8\xf7\x05Z\xb9\xd2f\x94\x1e`\xcf33^\
+\x80\x91=\x07\x10\x01\x7f\x22\xf60\x01\xb5\x8e\x9aZ{\
+\xc1j\xe4\x97\x00$\x22\xc1\xc2y\xaf\xa3\x94\xea\xb9}\
+MB\x90\x1d\xb3w\xbe@\xd4\x0c\x1e\xdb\xed\xa02;\
+\x89\xcf\xfa\xde\x87\xd4\x07\xeb\x98q\x13f\xa0\xbb\xa7'\
+\xca)\xf6p\xf5\xf4\xb5\xed2\xf9\x00\xe1\x19X\xc3#\
+\xbb\xd0\xca\xd3\x97\xc0\x00\x02\xbe\xe5\x0fu\xd2OG\xc8\
+\x13\xf8\x02\x00 \xdd\x07\xe3\xf8\xb1ke\xaf2A:\
+\x1bQ7\xb0\x1f\x83\xd9}Q\x85\x0cc<\xd7\x1dz\
+\xb1\xa3\x07$n\xbcT\xc5_e\xb55Y\xea\x83\x1b\
+\x94\x00\x13*i\x0d\x7f}\xf8.\x94\xbc\x03cL\x90\
+\x92[\xce\xc1\xd7\x19\xa3\xa9\xfdA\xd7\xad\x88\xaaK\xc0\
+{o\xbc\x8e\xde\xf7^B\xa2\x05%\xd1\x07-N\x9c\
+\xb8\x1c\xa6,?9L\xe0\xb7\xa5Wqa\x0f\xb2\x14\
+Z\xa0\xcc\x04\xb4\xdf\xb8\xaa~\xd2\xec\xc0\x01\xbb%\xca\
+\x867\xe6\xe8i\xd2\x150\xee\xa0\x1e\xc0\xfb\xd8\xdak\
+\xd2\xc9?<\x19_9\xf2\x08\xf5yo_\x8bM^\
+\x1e\xb0\xd8\x89$\xe1y\x131\x80\x93j\xc5j\xa5\x82\
+\xed\xe7\xcc\xe1,\xcb@2E\xad<\x06\xd7]wM\
+8h\x00\xa3$na\x90\xaa3;\xb3jO\xec\x15\
+\xd6\xc88\x90\x12\xeaO\x03%\xeb)\xb9\x80\xaf1\xaf\
+\x01L[i\x1a\x86\x1aCp\xb6\x1cH\xd32\x16\xbd\
+\xfe\x94\x95\xf0\xa2M\x8b\xeat\xe5\xd6\xac\xad\x98{\xcf\
+\xec\xd8K\x09X\xf0\xf43(%n\xdaT\x81\x85\xc4\
+r\x93'\xba\x11\xe4@\x11\x0d\x83\xa4\xcb0\xd8m\xab\
+\xf5E\xfa\x03v\xfa\xdal2\x02\xe0\x8c\xa2\xe1\xads\
+\x95\xd8\xdc\x9bx\xb6\xbd]\xfc8\xe4\x02\x80\xfaR\x0b\
+i\xd7\xc6L\x9f\x11$\x0b\xfba\x0eC\x92]\xd5m\
+\xd0\xd1\xb3T\xe6\xeb;d\x1a:\x10\x12\x09)}k\
+\xc6\xa0\xc0\x85$\xdd\x00\x14\xcc\xdbo\xb4\xe1\xda\xd4\xa8\
+\xf7C\xf5!\xb5\xfb*R,\xf9\xf3\x03X\xba\xe0=\
+\xa4%e\xf5\x8d' D\xc1\xec\xb2\x00R!\xd0h\
+4Q*\xa5\x0a\x04\x22\x80\xec\x18Gx\xe6\xcaK\xd0\
+U\xeb\xd2\xc0\xe4\x06Xf\xac\xb9\x8ar\x7f9\x92\xce\
+\x10\x0f\xd5\x1a\x01\x220\x0b0K\xdd\xef\xd7\x96E\xf3\
+A]K\xab\x8cFo\x95\xb3\xe1\xad\x15\xb0J\xe1}\
+\xbd(Z\x9c\xcff\x84\xdb\x17@_\x0e\x01\x0f\xa4\xf5\
+s\xc9z\x8cA\x13\xe6\x03\x98\x05 \xc6v;nE\
+Y=\x03\xe9\x8d\xcc\xf7\xdf}?\x0d7\x86\x9b^n\
+6O5\xbb\xa0\x96O1y\x82\xaa+'YYA\
+\xc9nY\xac\xc2\x07iga,\x1e\xe5i\xa7\x87\x9d\
+S\xa6NA\x22\xd8~\xd4E\xb11E\xffK\x7f\xc5\
+\xc0`S\xcb\x01\xe2\xb3H\xd4\xfe\xfeh\x1d@T\x8d\
+\xd0\x80A\xa5Oj\xc0\x1b\x8f\xdc\x8d\xb4\xd2\x09\xed\xdb\
+\xa96\xcc2\xac\xb7\xc1\xc7\x89I\xa8q!\x96\xba\x1e\
+l\x01\x96u;\x81\x18R[w5\x06\xa2v_\xaa\
+\xfe\x0f`\xbex\xe2\x8e\x931\xae\x8f\xf4\x80Q\xc2n\
+\x04\x81Z\xa2\xce\xda\xdbR=C\xfd!\x13;(6\
+Z\x0f\x80\x00\x22\xbd&\x89H\x0d\xfe\x18\x97\x9d\x95\xe2\
+\x0a\x18Y!m\xb0\x8d+\xa5Xf\x0d\x19`\xbf\xac\
+b>#\xa6\x94Z\x9d\x95#Y[E&\xcd\x10-\
+ \xba\xe3n\xe6t\x0d\xf3\xd6^w-\x8c\x1b;\x06\
+\x04\xa9\xd6\x00\xb2\x84\x80@\xb9\x94\xe0\xa6\xef\x9d\x82\xae\
+\xf1\xca\xb9\xb0[}\x1diAh4$\x1aY\xa6\x95\
+_\xfdB8o )\x03\xef\xbe\xfa:^\xbc\xe5r\
+\x88T\xcd0\x98\xbd\xe7Y\x96a\xd66\xdbX\xdfD\
+#_Kw\x8b\x8cG\xc4\x8aNc|\xed@i0\
+5a\xba\x12\x8a\xd7f\xc5\xa0?.\xe1\x7f\xf8\xc1\xc4\
+!kU#\xb7\xc3\x14\x96Sw\xd3Rd\xdek\x17\
+\xa9\x94\xea\xfel \x08:;\x066\xd8`\x03\xac\xb6\
+\xf6t\x10g\x00\x12\xf4.X\x8a]\xb7\xdf5\xfd\xcf\
+m\xe6\xe0\x8b\x87\x1e\x8a\xc7\x1e~\xcc\x9e\xbak\x88`\
+#\xb4\xfa\xda(:\x00\xfd\xe1\x0dO\xcd\x98\x15\xb0\x19\
+\xa5\x01!\x1e\x09\xd4x\xa5\xd6jd\xea\xbe\xa3\xd6\x89\
+\x95g\xae\x0a\xe1\xadyP\xbbC\x97\xe2\xb5{\xff\x80\
+r\xd5\xd5\xc8\xef\x22Jf\xbdn h\xb6\xdc`\xbb\
+\x10\x00\xde\x7f\xfd\x0d\xf4\xbd\xfc\x18H\xa83\x17\x89\x95\
+!\x18\xe6!||\xc3\x8fk4\x00\xd4\x87\x19u}\
+IX\x8fK\x81\x839>F{\xa8\xfa\xac\x01\xf3\xe1\
+\x18I\xc2\x9e\xed\xcf\xd0\xb3\x18\xdaCvfHh\xce\
+\xe9\x8f\xe0\x12\x94\x11\x00\xe9\x9e\x22\xeb\xe5\xcaz\xb5g\
+\xdc?F\x01\x00\x90\xd7PR\x7f~\xcb\x8cn\xb0\x16\
+\x0a3x\xa2>\x22\xa1\xd1\x8d\xd5\xc8\xb4\xd4\xd4H\xfd\
+Q\x03{\xca\xaa\xa9\x90N\xcb\xea\xf8W\xd81K\x9d\
+\xa1\xf9^\x9b\x9d\x8f\xf7\xac\x5c\xb9\x5c\xc1\xb6;o\x0f\
+\xd9l\xaa>\x1c\xd4\xd1Y\xa5r\x15\x0b\x1e\xbd\x19\x7f\
+\xf9\xd3\xa3\xa8\xf5\xb46vk7@\xba=\xed\x16!\
+\xa16\xba\x00\xe8^\x0e\xf8\xe3\x0fN\xc4\xb8j7\xec\
+\xe7\xd0XBM?J\xcc\xdan\x96\xe7\xaa!\x14T\
+\xe3\x9e\xf9\xa0\xa8F\xf6\x94\x5c\x90q\xed\xd86\x22\x0c\
+R{\xde\x8e\x9bA\x10\x96\xff\xb6\xdb\xe0\xb9\xc9-\x92\
+K\xde\x85o\xc2<\xfaH\x7f\x95GK#H\x08\x0b\
+V.\x1e\x07i\x98\x80\x1d\xb7\xdf\x99\x1bYS{+\
+%,\x98\xbf\x18\xef\xcd{\x1fO>\xf0\x14\x0e\xdeg\
+\x1f\x5cy\xc5\xc5 \xe3~RX\xb6m{\xeb\x22\xdb\
+\x87\xda1p\xc4Rt\x0f\xcd\x07\xe5A\xa9\xc16!\
+\xd4\xc6\x1a\x10c\xa3\x0d7\x80\xb4\xe7\x9c\xb3\xda\xd9Y\
+\x1d\x8f{\x7fy\x1a:\xc7;\x83\x10\xf7j\xe3\xfb8\
+pDBm<\xf0\xcc\x05\xbfD\xa9\xac\xbe\x8d\xe0d\
+\x96\xb1\xf2\x8cU\xb1\xc2\xd4)\xf0\xdd\x16\xf3!\x1d\xa3\
+\xa8\xc6c\x00\xa4\xfd\xa2\x95\x84\xb0\xde\xb60\xee\xae\xd1\
++2\xcb\xcf\x8d\xf5\x96\xda\xc2\x01`i\xbf\xccd=\
+i\xa1\xea/4Z\xb1\xfdvZ\xbcaX\x85\xdcu\
+\x00\xc6\xf5f\xddoU\xed\xa8\xae\x05\xd8\xba,\xb6\x1f\
+J\x02\xac?'\xe3>\xa7\xa4\xaal\xbb\xf3,\x9c'\
+a\x1a\x82X\xa1\xa4A?\xe3!\x04\xc6\x91\xd54\x95\
+uO\x05\x0e\xfd\xe2!\xb8\xfa\x8a\xdf\xa13\x19\x03;\
+\xf2\xca\x84\xee\xee\x1e\xdc\xfe_Ga\x85\x1b\xaeF\xc7\
+\x98I\x18X\xa2A@\x1a7\xcb\xf1\xb0\x94\xa6h4\
+3\xcdO\x81F#C\xa2?\x821n\x22p\xff\xd9\
+\xe7b\xe0\xd5'QM\xbb4\x15\xce-\xddi\x8f9\
+\x187v\x1cZGd\x9d\x07\x13<\xb2Gf\x9b~\
+\x99b\x8a\x99;\xb7\xf5\x14B\x0fp\xea\x5c\x08\x98?\
+\x7f>\xbe\xf3\xcdoc\xc9\xe2\x858\xf0\xe0\xcfb\x97\
+]\xf6\x08\x1b\xcb\xcf?\x98U1\x04\xc4q\xfd\xd7\xac\
+\xceA\x00\xd0\xcc\xea(\xa5\xde.\xbf\xc0.\xba\xfa|\
+l\xdd\xb5\x08\x19#\xa5\xd4\xe6/\x89 \x91\xa1\xb3:\
+\x16\xa7\x9cp\x0a\xd6]o\x13\xcc\x5cc&\xec \x06\
+\xbb\xe993\xa8e>\xdc\xced\xfc!\xb3\x0e@\xb9\
+\xceCCu\xf4\xf7\xf5C\xca\x0c\x0b\x16,B_\xef\
+R,]\xb2\x14\xfd\x03\x03\x18\x1a\x1c\xc2P\xff\x10z\
+\x97\xf4rsh\x88\xfa\x07\xfb\xf0\xc4\xa3OB$\x1e\
+\xff\x09\x10H \x17\xcc\xc5\x1f\xce\xbe\x00\xdb~\xfe`\
+,\x99\xaf8\x94y+D\xd5\x81'\x96\x1d\xf6\xde\x18\
+\x0csv\x04\x03(u\x00\xaf>x\x1f\xde\xbe\xf7\x06\
+T:\xc7\xdb\xee\x1f\x13!k\x0ec\x87\x9d\xe7\xc0-\
+\xfe\xd2'+Y\x86J\xcbW\xda6\xb4r\x00\x00 \
+\x00IDAT\xb6\xae)\xdc\xa7\xd54o\xdc\xb7\x14\
+9\xf4\x84\xc8\x8c\xa5\x90N\xa3\xbdj\xed%\x9b1\x22\
+cT\xd4\xb4N4;\x97\xd3\x05\xc8_\x08\xe4o0\
+'\x80!\x01V]\x01\x97\x85\x06\x07\x92Z\xe9\xb5p\
+\xdb\x02\x8d\x0f\xee\x08p\x9f\xdb&+\xb8\xe6\xb8\x106\
+i5x0\xeb\xe92&\xb5\xe6\xdf\x16+1y\xf2\
+$\x1c|\xf8A\xb8\xe4\xec\xcb\x90V*\x90\x19\xebS\
+\x81\x08\xddY\x03\xbf\xdem\x1f\xec\xfe\x8b\x0b1u\xcd\
+\x95\xb0\xe4=\xdd\x90\x82 \x1b\x9a\x16\x01e\xc8\x89\xbc\
+U8\x04N\x81q\x93\x81\xbb\x7fx*^\xbe\xfe7\
+\xa8\x95\xc6C\x12\xebs\xf1\x19,$\x9aY\x03_\xff\
+\xc61\x0eq} \xb4A\xdf\xdb\xcf\xb4h~Xs\
+\xa2G\x82\x19\x8eG\x1e0h\xf3\x0a\x10\xe3\xebG\x1f\
+\x8dG\x1e~\x08iZ\xc2W\x8f:\x0ck\xac\xbe\x0e\
+f\xac\xba\x8aSR\xf7)\x18\x84\x80\x84\x88&v@\
+\xc1\xa4\x94E\xb8%H\x95\xb4\x86f\xb3\x19\xb4\x97M\
+\xc9\xac]{\xc2\xbd\xf7<\x08a\xf7\x93(\x10\x13\x00\
+\x12\x08\x105QIk\xf8\xc5\x8f\x7f\xce_?\xf6\x1b\
+\xd4h\xd4Q\xaf718\xa06i\x0c\xf4\x0fb\xc9\
+\x92%X\xbch1\x16.zW)t\xffR,]\
+2\x88\xa5\x8b\x16\xa3\x7f`\x00\x03K\x07\xd0\xdb\xd7\x8b\
+\xe1\xfe\x01d\xa9J[\x11\x9d -\xeci\x92\xa0)\
+\x19\x22\x15\x00'\x04\x96\xa8\x88\x14\x9c\xa4\x8a\xc6\xcc\xb8\
+\xca\xca\xaf\xec\xae\x8d\xc1S\xbf\xfc1V\xf8\xd8:X\
+u\xf3\x0d\x15\x08\x18]\x88\xbd\x01\xddt\xc2\xc3Q\xf3\
+\x97\xd6\x80\xfa\xc0[\xb8\xef\xc4\xa3\xd0\xd11\x1eM\x22\
+\x10K\x90>K\xb0\x89&>{\xd0\xfeZ\x05X\x1b\
+4\x03z\xa6\x89\x5c[\x1b{\xc6\xda3l9]\xdb\
+\x82\x87'OD\xb0'\x18\x93\x06Pv\xe5\xa9&Q\
+me\x06\x03\x99\xb5\x8e\x1a\x99\x8aB>\x00X\x0b\xe0\
+Y2\xb0\x1dt\xb3VA\xb0\xfd$Qx\xe6\xb3\xe1\
+\xa0\x07\x06\xa6\x22\xfe\x07$\xe0\xedd\xf2\xbd\x81 .\
+i\x84v^\x07\xb3\xc0a_:\x82o\xbf\xfeVZ\
+\xf4n/D* 2\xed\xa3$\x02\xdd\xd9\x00\xae>\
+\xf4\x00\xac\xbe\xcf\xe1\xd8\xe2\xe0=Q\x96U\x0c\xf6\x01\
+\x22\xd1c\x0b\x9a\x9f\x09)\xb7\xa8\xda%\x90\xd6\x80w\
+\x9f\x7f\x027\x1d\xf5=4\xe7\xbd\x81\xce\xd2x4\x05\
+#\x95\x8cL\xbbe\x8dz\x13G\x1d\xf7\x15tww\
+{\xf4\x98\xe0+\xa2\x07|\xec\xaf\xf3\xf3='\x9d&\
+\x18y7\xbf.\xce\xdc7\xe7\xa2RU\x9dXjT\
+\xb0x\xf1b/n\xa4\xe0\xf6yl\xf9=\xe57\xf7\
+\x04\xc8L\x22I]2\xc5fG\x0b[\xab\x05\xd4\x87\
+\xeb\xf8\xc5\xcf\xce\xc2E\xe7^\x80Z\xa5\x1bL\x84\xc4\
+\xac[\xd4g\xe61\xa7 0\x1e\xbb\xef\x01\xdam\xce\
+\x0e\x90C\x0cN$\xd2R\x82f#\x83\xcc\x18B\xa4\
+H(Q+\x0fAH\xcc\xa87%\x80\x90 d\x00\
+'\x10i\x19%\xae\x22\xed\xe8\xd2\xdbr\x85\xf6\x16\x08\
+e\xa9\xbex,\x12\xbd\xb7\x9e\xd4\xb0\xa4\xe2\x1c93\
+\xae\x8d\xc9\x98Z\x07n8\xfaPl{\xe2i\xd8`\
+\xb7\xed\xb0\xe0M\xd7%0\x1fG\xe5\xcc\xb3a\xd2\xb1\
+A\x02\x18\xb7\x0c\xf0\xd6s\x7f\xc6\x1d\xdf:\x0c5\xaa\
+\xa2I\x80`V\x83\xb4\xc4h\x0c\x0f\xe2+\xdf\xf82\
+:;;=`\xf6d\xc1\x02\xaf\xf7H\x03\xb7\xe9n\
+; \x17^\x1a?\x0f\xd3\xc6zE G\xb2g\x07\
+V`=\x05+\x82V\x9eF\xeb\x01\xf8\xd6\xc4X)\
+\xbf\xdff^\xf8\xf3T~\xf0\x88m\xc9\xcf<\xb7\x15\
+4\x0dE\xee]\xb0]\xcf\xe4\xc3A^i\x9a\xd0\xcf\
+\xcf?\x17\x9f\xdcig\xf4\x08e\xa9\x85\xd7?\x1e[\
+j\xe0\xf5+N\xc7K\xd7\x5c\x80Uv\xde\x07\x93\xb7\
+\xdc\x0ac\x97\x9b\x8ar\xa9\x86\xa4\xaa\x98\xd7\xcc\x86\xb0\
+\xe4\xad70\xef\xd1\xfb\xf0\xea\x9d\xbfC\xdf\xdb\xaf\xa1\
+\xab<\x1e\x15QC\x933\x88\x8c\x91i'\xa1\xc1\x12\
+\xd3gL\xc5~\xfb\xed\xe7\xe1\x9a;\x8c\xc9\xd9\x9c\x02\
+\x9e\x00p.\x99\x8f\xecf\x9d\x83\xaf\xa4\x1a(X\xe2\
+\x98o\x1d\x83\xaf\x1cq\x18\x84\xa8`\xd7]w\xc7\x86\
+\x1bo\x10\x81\x8a\x07\x049\x1f\x5cap\xcbJ7\xd2\
+\xc2+t\x97\x8d\x84D\xa6\xe7\xcf\xad\x05\xd3\x95$\x01\
+<\xf1\xf8S\xf8\xdeq'\xe0\xf5W\xdfB\xb5\xd2\x09\
+\xd8\x19\x03S']<\x01\xcc%4\xb9\x89\xb2\xec\x00\
+W\xd8\x8aNR!e,\x08VY\x13\x08\xb79\x95\
+\x01p\xea\xb1F\xd5\x8bX\xef\xc9'\x80Y/\xc8&\
+\x09\x92z$\x1cj\xd3\x0e1\xec\xc9J\xd5\xb4b\xeb\
+i\xe6\xd2\xc7\x95K\xb8\xf7\xb8/\xe1\xf5G\x0f\xc2\x0e\
+\xdf<\x02\x8cn\x0c.VVZ\xb2\xc2\x1f\xdf\x01c\
+\x02\xaa=\x00\xa8\x1fw\xfc\xf0\x0c\xbcq\xf3o\xd0]\
+]\x16R$j\xb7\x1c\x80\x8c$ \x19+\xce\x9c\x86\
+\xcf~\xee\xb3\xb6m\xd5\x7f\xf2+\xe6\xda*\xd2\x0d\xbf\
+\xa5\x10\xa7\x09\xf4\xc2\x0b\xb1\xa7\x10\xe8\x8a\x96\x0d\xdbM\
+\x87\x07F\xad\xa1\x00\x00l\xc7=*\xd0\x04\xafO\xe7\
+\xc4\xca#\xc0\x04O\xc9s\xad\x95\xb9\x15\xe1\xf3\xf8>\
+\x00\x0fW\xfe\x8a\xd3V\xc0\x0f\x7fr&\xbeq\xc4\x91\
+\x18\xdb1N{Rl\x01\xb1R*\xa1\x22\xfb0\xf7\
+\xda_b\xee5g\x83:\xc6\x80\xc6L\x84,\x97\x01\
+\xd9@\xf3\xbdy\xc8\x06\xdf\x07Q\x09\xd5R\x15\x9d\xe5\
+\xb1`\xbd\x1dG\xc0yl\x92$Hd8\xed\xe7?\
+\xd6+\x0b\xd9\xae\xc8\x93\x1em\xe1Ipq=c~\
+E\xeeX\xd0\x8f7hM\xd8\xf9??\x81Uf\xdc\
+\x85\x05\x0b\x16a\xd3\xcd6\xd2\x86Dz\xe2\xe3\xe5\xc9\
+\x80\x84:\xb5@\xf7\x0a-\xf7(\x8em0C\xa8z\
+$,\xd0\x18\x1e\x82q\xdc\x08@_\x7f\x1f\xce\xfa\xd9\
+\xcfq\xc5\x05\x97\xa2T\xa9\xa2T\xaa \x11\x02\xc8r\
+\x9cI\x02\xc0\x89\xe2Y\x96\xaam\xd3R\x02H \x84\
+P\xe74P\x06\x01\x81&K5X\xcc%\xd7\xbf\xae\
+T \xa9\xa4\xbeu\x08FJ\x12\x9d\x9deTJe\
+\xd4\xba\xd48Lgg\x15IB(\x97JH\xcbU\
+\x94J%\x94\xaa]\xe8\xac\xa6\x5c\xa9\x96\xa8\xa3\xab\x83\
+\x1b\x83\x03\xf4\xbb\x0b\xceGgM\x8f\xddX\x85\x03\xba\
+:\xc6\xe0\x9d\x9b/\xc19w^\x87\xd5?\xb9/V\
+\xdev6\xc6\xac\xb8:\xca\x22\xb5\x0b\xc6\x88\x80\xfe\xa1\
+&\xfa\xde~\x11\x8f_r\x1b^\xbd\xedw\xa86\xeb\
+\xe8\xaaMR\xfc\xd3\xae\x82D\x13\xc4\x84\xfe\xfa\x00N\
+=\xed\x14\xf5Q\xd6\x80\xc3\xa4\xdct\xf6\x19\x14\x83B\
+\xe4-\xc6\x8a\xdfbt\xfd<<\x03\x1d\xe8\xa0_\x9e\
+g$\x0a\x0eVh\xe3\x01\x98?\xdf\xd2\xf8\x85\xf9D\
+\xe7Y6\x13b\x17\x98\xa2\xeb8?D\xd7>=&\
+h\xcbI\x8c\xedv\x98\x85\x93\x7fr\x1a\x8e\xfd\xf2\xd7\
+1\xb6g|\xe8'\xe8\x01\x934U\xcbx\xa9\xd1\x0f\
+\xf9\xdeKJ\xb9\x85r`\xb9\xda\xe3,\x8b\xed\xf20\
+\xfc\xae\x99\x14\xc0EW\x5c\x8a\x15V\x9cb\x07\x8cT\
+\xfcpD\xc4lsi]\x1a\x1d\xf3\x22\xfe\x8d\xeb\xe6\
+\xf2`\x00\xab\xcd\x5c\xcd\x0a\x85oc\xbc\x9aj\xb2\x15\
+/\xd9\x8c:\x1b\x87JB\x0d\xe8Z9\xd1\xb3.^\
+\xb1\x0dYGS\xbag\xd7_w\x03\xff\xec\xf4\x1f\xd3\
+\xc2w\x16!-w(w\x9b\x81\xc1z\x032\xcb\xd0\
+\xd3\xa1\xbe\x0edgR\x08\xc8\xb2\x0c\x93W^\x05\x9b\
+n\xb55\xa3T\xa3\x9e\x8e*j\x1d%\x94*]\xe8\
+H\x19\xb2c,:E\x13\xb5\x8e*\xca\xe5\x0aj\xb5\
+*\xd2\x92@GGI}\x19I\x08\xa4)P\xa9\xd4\
+\x90\x96\xcaH\xd3\x12J\xa9\x1a\x84\xf6\xc7G\x8dN\x13\
+\xa9\xd5\x8c\x9c\x81\xc8\x9c\xd7F\xc0\xf4\x19\x13\xf0\xc3\xe3\
+\xbf\x8f\xce\xd2XWA\xed\x16W\xd2\x0eTd\x86\xd7\
+\xaf<\x0f/^\xf9s\x94\x92\xf1\x90\xcbOE\xa9{\
+\x19\x10%h\x0e.\xc0\xd0\xdc\xb7!\x07\xdeGG\xb9\
+\x13\xdd\xa2\x04Ie\xc8L{H\x82 X\x22\x81@\
+\xef\xd0R\x9cz\xe6\xa9\x981ce\xeb\xffI\x0b\xbc\
+\xbe\x17\xeb+h\x8eE\x0f\x8c\x82Dk\xb71\x86\xef\
+H'\xdbz\xcc\xfaY\x8b\x11W\xa1\x00\x00\x8a,\xbb\
+?\xb2\x18[\xf4\xf8\x99\x1f/\x0fP\xfc\xb4@\xc8\x1c\
+\x13/F\xc7(o]\xa99\xff9\x07\xdd\xddcq\
+\xfc\xb1\xdf\x00/\xcaT\xffR{\x03NM\xf4\xc2\x8b\
+$\xd1\x1e\x82\x1aU%d \xe8i0\x09\x08)\xed\
+9y B\xbd1\x80\x13O\xf9>VYm%m\
+\xd1\xf4\x1a\x88\x88\x9f\x22\xa8_<\x16`x\xe7\xd7-\
+\xaf\x91\xfd\xfa\xbaFf=\xafL`5\xb5\x5c\x08 \
+l-\xb8\xdf\x14j,W\xe7\xa3\x9f'I\x0a\x16n\
+\xcfy3\x93\xa8\xd5\xaax\xf7\xbd\xf7p\xfc\xb7\xbe\x83\
+G\xee\x7f\x98\x12QE\xa9Zu\x16)a|\xe3;\
+_\xc3\xc7\xd7\xff8\xbe\xf4\xf9\xa30\xb8\xb0O\xcd\x9c\
+0\xa3\xde\xe8\xc3\xc4\xe9\x93p\xd1\xe5\xbf@gG\x87\
+Z\xc8\xaa\x07\x8e\xcd\x00\x14#\x5c\xb7\xd4\x12\xec`\x96\
+\xde\xbe\xed!\x94%\xdd\x183\xdf\x0b\x16zPL\xb7\
+\xe9^{\xef\x83\xf7\xe6-\xc2o\xce\xba\x10U\xbb<\
+\xd4\x97\x04BZ\xeeD\x19\x1d`\x96\xa0y\xaf\xa3\xf9\
+\xf6\xab`\xa8}\x0e= p\xc7X\x98\xc5W\xc6 \
+\xa8Z\xa8\xbd \xbd}}8\xf5\xe7'a\xc7\x1df\
+\xab\xa5:\x12n\xa6V\xcf,\xe5\x8f\xfd\xc4V:0\
+Yp\xbeU,\x0f\xc5\xfd\xf8\xd6\x93Sc\xe3\x90\x07\
+:*\x8c0\x06\x10;z\xb1\xf2\xfb\xca\xe9?\x8b\xbb\
+\x08~\xdc\xbc\xfb\xa2\xe9\xb4\xa2\xeb\xd0J\x82\x81-\xfe\
+cc\x5cy\xcd\x0d8\xe3\x94Sq\xd7\x0d\xb7\xa0\xa3\
+\xd2\x85\xf8\xa3\x15\xe6\xb3_\xec\xb9\xd1\xb6\x7f,\xa5Z\
+\xb2+\x94\xf2\x0b\x22\xc8L\xa2R\xeb\xc0\xf1G\x7f\x13\
+\xe3&L\xe0\x8d6\xde\x90X\xb2\x1d\xbe0=\x155\
+\xe3\xe2\xf3,v\xf1\xe2)\x19\x9f\x8f\xf1\xaf\xe1\xb9t\
+\xdc\x22\xbdd$`\xa9\x9f\x9f.Cgc\x87l<\
+\xc3\xc1\x82\x03\xb2\x92$u\x9b\xe7\x88\xd0Q\xe9\xc09\
+?\xfb%\xfep\xfb\xedh\x0e3\xca\xa5N\x98\x11\xc2\
+F}\x10\x1bo\xb11N>\xedd\x8c\x1f?\x1e\x00\
+p\xe3\x1dW\xe3\xcaK~\x8f\xe7\x9ey\x16\xe5\xae\x14\
+\xdb\xce\xde\x0e\xb3\xb6\xddZ\xcd\xc6\x00\xca\x1e\xeaO\x93\
+\x93^\x90Qd\xffl\xf0\x94\x94\xac\xcbj\x88\x16\xee\
+\xd6\xe3\x8fz+\xd5\x06~\xa1\x5c\xee\xf9\xf3\xe7\xe3\xb6\
+\xebnAI$hB\xa8-\xbb\x9e\xac\xdao)\xe8\
+\xb6P\x86\xc1q^y\x18\xda\x92\xb3\xe9L)\xdad\
+\xb3\x81\xea\xd8*\xce;\xef\x5cl\xb4\xd1\x86\xb0g\x02\
+\x11\xdcT\xb3\x08\x08E\xcb\xc0o.\x08\xc4\x86\xce\x7f\
+\xe6\xa7\xb7\x05\xa0\xc5\xda\x937z\x19\xf0-\x074t\
+h\xe3\x01\x00\xa1%\x8b\x09\xf6\x83#\xc8\xec\xf1\xa7\x80\
+pcgb\xf7\xd5\x17\xfa\x10\x1d\xcd7_\x5c\x99E\
+(\xe7\xe8\x5cv\x99\xb18\xf9\xb4\x93\xf1\xd4g>\x8d\
+\xb3\xce\xf89\xfe\xfc\xc8\xd3\xa8\xa5% I\xedr\x1b\
+\x9b\x83\xb6$\xacw\x8a\x98u\x06\xfd\xf5!tT{\
+\xc0\xd9 D\x9a\x80\xa5D\xa5\xbb\x03\x87\x1d\xf0Y:\
+\xff\xf2\xcb\xb0\xee\xfa\xeb\xb6\xb0\xc7Q\xe3#o\xec!\
+9@\x0d\xd6\xc63\xa0?\xb1\xe3\xf1&\xe4Q\xb4B\
+\x1a\xa1\x90x@\xc0\x8e\x9e\xa0h\x8fV\xe78\xa9\xa5\
+\xd7\x0c\xb5\xac\x97\x92\x1an\xbf\xf9\x8f \xaa@\x94T\
+\xd9Y#C\xad\xb3\x86\xef\x9er\x22\xcf\x993\x9b\x14\
+\xab\xd4B\x9ejG\x0d\x07}\xf1@\xe5\x95\x98)'\
+\x98E>N\x81I8\xc2,\x88\x01\x08\xb1\xd9\xd5\x83\
+axbP\xcc\xcc\xabK\xe7\xe9\xe6\x198}\xdd\xdb\
+\xdb\x8b\xcf\xed\xb3\x1f\x16\xbe\xbd\x18\xa5R\x05\xa4'\xf2\
+\xcd\xc6\x1f\xd6\x8b\x89\x88\xd4T`\xa2\xe9\x932\x945\
+{\xe0\xad6\xeb\x92\x19\x03C}\x98\xb3\xdb.8\xee\
+\xbb\xdfDwW\xa7Z]g\xc8\xf4\xf8\xef>\x84\xe2\
+\x83\xb9o\x0c\xfc\x0a\x84\x86\xd2\x0d%\xfb2\xe4\x1bc\
+?~\x8e\xab\xd7\xe2a\xfa \xd0:\x0d\xd8\xfa\xc4>\
+\x16\xb6h\x1fm\xd5\x9d[\xbc\xa2V{\x07\x0e+\x14\
+\x03M\x85\xc8\x8b\x1bZ\x7f\xff\x1bt\xec1\xc0\xb1&\
+O\x91T>zqi\x10\xc7P\xb2\xdez\xeb\xe1W\
+\x17\x9f\x87\x8b\xaf\xbd\x14\xfb\x1c\xfe9L_cuP\
+\x9a\xa0\xd1\xa8\xbb\x12I\xf5\xede\x06\x0c\x0e\xd71q\
+\xea$l\xb3\xd3\xf6\xb8\xf8\xdaKq\xed\x1f\x7f\x8f\x15\
+f\xac\x88f\xd6P\xb44\x81ZW\x17\x0e?\xe8\x10\
+\xbc\xf6\xeak\xdaK\x08\xaa\x12q\x885\x97L}\xf4\
+\x12NV'\xf12X/\xf9\xd45b\xa8\xfb\xa8\x15\
+\xecA\x92\xc6\xc4\x08\xb7,\xcbp\xdb\x94\xa3F\xc7)\
+\x1f\x1f#\x83\xc1`\x94\xcbe\x1bG}\x93(\x85H\
+\x12=*\xcf\x18\xe8\xef\xc7\xae\x9f\xda\x057\xff\xf1z\
+\xcc\xd9y6\x99m\xd5\xfe\xaaIU\x07\xb3\xcf\xdf\xb4\
+\x08\xf4\xc8:\xdbU\xa4\xe6\xe0Q\xb3\xcc\xd5\xec\x13\xb0\
+\x7f\x0c\xf5\x91\x0d\xc3\x13\xc3\x0f\xd3}0\xf8\xa6g\xc8\
+\xc8\x09b\x10\xfa\xfb\xfbp\xe0g\xf6\xc1\xbbs\xdf\x03\
+\xa5%H\xbdC\xb0\xd1\xacc\xe5\xb5W\xc5\xc4\xe5'\
+\xa1\xd1\xacC\x22\x81r\xf7]Z\xe5-\x0a\x98\xbd\x18\
+jzQ}Mh\xc9\xc0B\xac\xb5\xc1Z\xb8\xe4\xea\
+\xcbp\xf2\x0f\xbf\x8b\xae\xae\x0e\xb7I\xa9\xa0G\xeb\x0e\
+\xbbQ\x87\xc9\x1a\x82\xd9\x8b\xe8\xaa\x96\xaf\x86\xd2jV\
+80\xecQ\xed\x995\xe1\xdd\xbb\xc3u\x9c\x0c\xe6\x97\
+\x91\xbf\x12\xd0f\xa3&\xb9\xfcC\x1d}gV\xda\xf7\
+F\xcd\x9d\xfb+\xbck\x82\xb0\x0a\x22u\x85\x1d\xc4(\
+\xb6\x18{\xef\xa7spb\xaa!4;\x0d\xc6\x9a\x92\
+\x9d'\xe1\x1fC\xb1\xda\xea3\xb0\xda\xea3p\xd8\x97\
+\x0fE_\x7f?^z\xf1\x15\x1c\xf3\x95o\xa2\xd9;\
+\xa8\xe8\x97\xc0\xb45\xa6\xe0\x07\xa7\xff\x08S\x97\x9f\x0c\
+\xb2\xd2E\xf8\xd5\xa5\x17\xe2\xb0\xfd\x0f\xc2+o\xbc\xa6\
+\xea\x9e\x01\xa9H\xb0\xff\xde{\xe3\xc2K.\xc1\xcc\xd5\
+WW\xe5\x1a%b\x09I\x22\xe0\x97\x15$\x00`\xaf\
+\xf1\xadq!\xd8e\xb0\x0c\xbb\xc6C\x01\xa8:\x17\xc8\
+\xe8~h\xd9E\xc0\xcd\xd0\x89\xd4\xe7\x09\xc0XR8\
+O\xc5(W&\xf9\xd9\xa7\x9f\xa5L\xea\x05TPK\
+\x83I\x12\xb2\xe1&\x96\x9b2\x09?9\xe7\xa7\xbc\xca\
+*\xd3\xc8L\x15\x9a.\x84\x0fRnY\xaf\xffL\xd7\
+\xc1S\x8c`\x09Bt\xef\xf3#\xb8\x8e\x1d>\x86\xf5\
+\x00\xd8\x8f\xa7\xcbZ\xda\xbb\x14\xfb\xef\xb3\x17\xe6\xbe\xfc\
+\x0e\xaa\xa5\x0eP\x92\x80\x88\xd1\x1cnb\xcb9\xb3p\
+\xea\xe9'c``\x10\xb7\xddr'n\xb9\xf6f\xfc\
+\xf5\xa9\xe7\x00d(\xa7\xea$!i7+\xa9\x0f\x93\
+\x0e4\x071s\xed\xd5\xb0\xc5V[a\x8fO\xed\x8e\
+I\xcbMrN\x89\xf4\xea\x01\x8fN\x18\xb06R\xa9\
+\xe6c\x08n\x90\xd9?\x06\xccX{\xf6\x1a\xca\xff\xea\
+\x86\xd0\x1ag\xba\xabf\x98\xd1g\x8dK\xe5y\x98\x9e\
+ap\xe4I\xc4X\x05\x14\xc0\x82C\x15\x87,\xfe\x80\
+\x86RDE\x86SG5%\xe6<M\xa9\xad\xb4\x01\
+\x0fG\xb6\xca\xcd\xf7-\x0cy.\x95S{\xe7\xc8\x18\
+\x817p`r\xb0\xbb\xc9t^l\xf2a\xa1-\x14\
+\xd0\xd9\xd9\x8du\xd6]\x07S\x97\x9f\x84f\xb3\x89L\
+J\xc8,\xc3\x84\x09S1u\xf9)6O\x06\xc0\xc4\
+\xa8T+8\xeb\xe2\xf30e\xca4d\xc3M\x08Q\
+V5\x97\xc0A\xfb\xee\x87\x97^zI\xf5\xfb5\x91\
+fa\x87\xab\x15\xdb\xe6\x88\x18\x0b\x08\xe0\xbak\xaf\xc1\
+.;\xef\x8a\xaf\x1d}$/^\xb4\xd0>7~\x03\
+\xd9\xc6\xf7\xe1\xd0\x88\x134\x9f\xc8\xf2\xc9@1\xa0\x14\
+\xd3\x94\xe5{\x19$\x80\xa7\x9f|\x0a{\x7frW\xba\
+\xe47\x17B\x94\x12e\xf9\x92\x14\x00\xa1\xbf\xbf\x17\xfb\
+\x7fa?\x5cw\xdb\xd5Xe\x95i\x04\xc0\xee\xf9\xb0\
+\x8d\x00D=\x9c\xc0\x97W@\x13\x8c\x81R+\x0b\xe2\
+\x89%}\x1dd\xe9\x83\x82\xbf6\xc6K\xc7Pe\x0d\
+7\x86\xf1\xb9\x03\xf6\xc5\xdb/\xbf\x85J\xb9\x06\xd2_\
+\x15j42\xac\xbb\xd9\xc68\xf5\xf4S\x01\x08tt\
+tb\x8f=w\xc3y\x97\x9e\x83\x1b\xef\xbb\x917\x99\
+\xf5\x1fhfRy \xa4dp\xd7}\xf7\xe0\x13\x7f\
+z*n\x7f\xf0\x0e\x5c~\xd5\x95\xff\x8f\xb5\xf7\x8e\x97\
+\xa4\xa8\x1a\xbf\xbfU\xdd\x13\xee\xbd\x1b\xd8\x00H\xceQ\
+AA\x1f\xe3\xf3\x88\x80\xa0\xa8(A\x01\xc9\x99\x95\xa8\
+\x809b\xc0\x84\x02\x12%HF\x10\x10\x01y\x08\x02\
+*JPr\x90\x9cs\xdae\xe3\xbdwf\xba\xeb\xbc\
+\x7fT\xec\x9e\xb9\xcb\xf2\xbc\xbf\xfa\xec\xdd\x99\xe9\xae\xae\
+>u\xea\xa4:u\xea\x14\x07\x1dz \xcb\xbdc\xb9\
+\x80\xcb\xd0\x8f\xba!&\xc9\xf50^\x92t\xd5\xf3Q\
+Tg\xa9\x06\xf7cm\x92\xeb&\xa8F\xfb\x9c\xff4\
+A\xed\xfa\xbc\xc4iNAS\xa3\x1b\xcf\x8d)\x0fW\
+Q;\xa0X&\x8f\xc9\x8b$0\x22\x15\x1d\x87{\xad\
+gu?\x8f\xab\x9a\xee\xa6\xcf\xf4\x892)\xee\x8f\xaa\
+\xca\xb5(8\xbcT\xf4\xc5\xef\xa1\xaa\xd6\xc3A\xec\xb7\
+Q\x06\xeap\x1c\xe0\x89\xb20v\xa5_\xdc\xb6\xca\xd2\
+\xc4\xe1\x08\x9a\xc5\x11\xfb\xf0\xa4I\x9cq\xe1\x99\xac\xb4\
+\xea\xea\x14E\x0f\xads\xc0\x1e\xfc\xb1\xdf\xae\xbb\xf1\xc2\
+s\xcfA\xd8\xfd&\x0eA\xd1~\x92 \xcc\xec\x96X\
+\xbb\x93E\xf3\xc2s/\xcaW\xbfr\x04\xcf<\xfd,\
+\xd7_\xfbWu\xf0\x81\xfb\x91e\x81c\x92)\x96\xd7\
+\x14\xe9t\xca\x0erz\xe8\x96\x7f\x87\x8a\x83\x14\x18\xca\
+c\xf4\xd5\xd7^\xe5\xe0Y\x07\xb2\xebN\xdb\xf3\xe2\xb3\
+\xaf\xd0j\x8e\xa0D\xa3]\xdc\xeb\xc2\xb1\xb9\x9cq\xc1\
+\x99r\xd8W\x0e\xb5S\x81\x8a\xc3\xb9\xcey\xf5iY\
+\xfcf\xa3\xc8S\xd3\xbdj!\xd8\xe5\xdb\xfe&+\xcd\
+\x8a\xbb\x91\x0a\x0fE\xf4\x1b\xb8\x9c\x0c\x02\xf4z=\xf6\
+\xdcuW\x9ez\xf8I\x9a\xcd\x11D\xe5\x08\x19E\xaf\
+\xe0\xfd\x9b|\x84S\xce<\xde\x09\xd6(\xc3\x8c\x81i\
+\xd3\x96R\xab\xae\xb62\x9d\xb2\x08\xaa\xa71\xdc\xe2\xb0\
+#\x0fb\xd3\xcd?\xc2\x8c\xe93\xe3t\xad\xbec(\
+e~I\xbe\xbb\x98\x0a\xaf c\x9a8O\xb3\x1e\x06\
+\xab0\xa3\xda\xf2\xf6p\x1aI\x92\xaa3\xff\x8c\x7fU\
+\x1cd\x0fJT\x92T\xeeU\x81\xee/\x13\x08\x80\xaa\
+\xc6\xaf\xd88\x8eY\xa5\xc2\xb4\xb1f\xb4\xd8\xea\xf6\xd1\
+\xa0%\x10\xdf\xbd\x14@\x8f,/\x09'v`\xd4\xdf\
+X9\xab\xb0O[E\xf4\x94b\x07\xdd\x88\xa1(z\
+\x91&U\xe5\x01\xc00<2\xc2)\xe7\x9e\xc1r+\
+\xad\x88\xe9\x1a\xb4\xb1\x94\xd8\xe9t\xd9m\xa7\x9d\xacO\
+ \xed\x97\x89z_\x92\x01\x0av#\x86'\x1e\x7f\x5c\
+\xe9,'\xd3\x19y#c\xde\xbc\xd1\xcaf\xa5J@\
+\x91W\xdf\xc6\x0f\xb3o?\xa5@k\x81\x04g\x9c\x22\
+\xa6\x0a7F\xce8\xe3t\xb6\xfe\xf8'\xb9\xedo\xb7\
+1ix:\xba\x91\xa3\xb0\xa7\x14+\x04LAQv\
+Yg\xfd\xb5\xa3\x22\xa9{\xddU\xfaC\x88\x0e\xa7p\
+\x13\xa5\xe0\x84\xe3\x8fCg\x91|\xc3\x9f\xf6\xf9\x0b\xbd\
+I\x92\xa8\xf4\xba6M/\xe8\xc8\x181\xa0\xcdF\xfe\
+\xf5\xba]v\xdf\xf1\x0b<z\xdfC\x0c\xb5&!\xaa\
+\x01\x0a\xca\xc2\xf0\xce\x8d7\xe4\xb8\x13\x7fiqb\xac\
+\xb1\x96\x9eRl\x10\x0aS`$K\x0e\x05)\xe9\x16\
+\x85\xc3g\x5cU\x890%(OIYc\xa7s\x15\
+\x9a\x8f\xca\xac\x8aH\xff=z\xb1*+>\x89v\x8f\
+\x0aN\x85\xfa)\xa2\xa2\x22L\x15B|G\xf4C\xd4\
+\xdf_\x01\xfd\xad\x8a\x03 1+\xa3\xbd\x936\xec;\
+\x15\x01\x8e\xcf\xa7\x18\xab#Dc\xf7\x00\xf8\xdf\xa9`\
+\xf1&\xbf{\x7f\xa5\xad\xf4\xbd\x89\x97\xcb{\x88\xfc\xa0\
+\xd55\x91n\xba\xe83\xa7i\x05\x94\x91\xea\xbe%\xbf\
+\xd0\xec~/\xb5\xd4$~w\xc1Y\xac\xbc\xfa\xaa\x94\
+\x88er\xa5\xe9\x8ev\x98\xb5\xd7\x9e<\xff\xdc\xf3U\
+\xc2\xf5L\xeba\x07R\xfb\xf5\x7f>\xf6Q\xd9`\xc3\
+\x0f\x9an\xa7K\xb7\xd3\xe3\xf0\xaf~\xd5\x81h\xad\x08\
+\xf1\x0c\x1fV\x09\xd2\xf1H&\xf4\x9eP\x8c\x0a}\xf4\
+}\x02x\xfc\xb1\xc7\xd9q\xbb\xed\xd4\x89\xc7\xfe\x06t\
+Ns\xb8\x89\xce2\xb4\xc9(z\xd6,\xf5\xe3\xa5\x80\
+\xa2W\xd4\xcc\xa0\x04\x1fuz&\xe2\xd9\xfbB\xfeu\
+\xeb\xbf8\xf6\xd7\xdf\xe5\x85\xe7^t\xa9\xb6\xaa\xe3d\
+7\xbf\x88k'!\xc8\xd4n\xf6fDp\x129\x1a\
+H\xad\x0em\xf7&\x1c\xb0\xc7\xde<\xf6\xf0\x13d\x8d\
+\xe1\xc0\xfcE\xcf\xf0\xd1\x8f\xff7\xa7\x9ds\xb2\xe8z\
+\x82\x93J'\x14\xa5A\x84\x12\xa3,\xe5\x8ew|\xca\
+\xf9\x04.\x95\xc0\x14\x11\x12\x9br>\x9bx\xd7\xe7}\
+\x88\x9e\xb2x\xd3\xeb\xe9*/\xc49{\x9c\xd8F\x84\
+L4\xf7\xaa\xc2\x13\xbcs\x12\xad\x09\xeamI?\xbb\
+Ol\x01\x18\x02\x91\xa5\x1b\x0d\x06\xbd\xbc\x02X\xc5m\
+\xeb\xffST'P\xbe\x8e\xfb\xf3\xc8Mm@O\xd4\
+\xc6i\x1b\xe5\xb5`\x0a\x82g\xb8\xa4\xa3F\xbb\xd7%\
+\xca\xcc\x7f\x8a\xa2\x91\xd9\xf7{\x8fs!\x05h\xbf\xe1\
+\xa8\xbaT\x15T\xa9\xd8\xcc\xb8'\x9eu\x1a3\x96\x9b\
+\x866\x009Z\x14\xf3\xe6\xcde\xdf\xddv\xe1\xb5\xd7\
+^\x0b\xcc\xd0\x87&\x8f\x07\xe7\x85\xcbT\xa6.\xba\xec\
+l}\xe9U\x7f\xe2o\xb7\xdd\xc2f\x9bn\x1e\x1dt\
+\xbe[8\x0d\xa9\xc5\x01\xaf\xaa\xf8W\x80h\x97B\xaa\
+J:\xa3\x8b\x16r\xf4\x8f~\xc2\xb6\x9f\xfa\x1cO>\
+\xf1\x1cyc\x98\x5ci\x94hz\xdd.k\xac\xb3\x9a\
+\xec\xba\xcfNt;E\xd8M\xd6PM:\xe3\xe3a\
+L\xad\x89\xad\xaa24|\xaa\xfe_\x0a.\xf9\xc39\
+2y\xca\x0a\x9c\x7f\xde\xe9T\x84\x88\x92J\xb6\x9e\xd0\
+\x15\x17T\x1f|E\xa1Y\x1d\xc7\x1e\xa20u\xc3=\
+>\xdea\xd6^\xfbq\xff=w\xd3\xc8\x87\xdd4F\
+\xd1\xe9\xf4\xd8f\xc7/\xf0\xcb\xe3~N\x9eg\x11a\
+\x15\x9e\xf3B\xd3\xfe,\x11J\x0cF\x09E\xd1%\xcb\
+\xb2jB]I\xa7`\xb1\xb98N\xd4\xae&\xca\xcb\
+\x10\x85H\xe0)\x22^|\xfd\xba\x92\x0e\xe3\xacj\xbf\
+]\x03\xa6V7(GC\xdf<0<\xafH2\xbf\
+\x862X\x00\xb8\xfd\xf9v\xb14\x91\x82~\xe4\x8c\xc2\
+\x85\xa4\x05\x06\xa9HW\x7fM9\x04\x04O\x94\xffS\
+\x15\xad\x15\xebH\x0d\x8f\x9e\xc1\x9d@\xf0\xf1\xb9\xa9T\
+\x17\xd7\x0d/<\xb4qB72\xa2\x01\xb4\xf7\xb8\xab\
+\xbc\xaaM\xb0\x89\x194\x96\xd9<I[0%\xd1\xec\
+\x8ai\xd3\xa6p\xe2i\xbf\xa3=\xbd\x816\x82\xd1\x9a\
+Lr\x16\xcd_\xc0^\xbb~\x9e9s\xde\xb0`y\
+Y%\xb8\xb4hQ\xa1{\xd4h\xa5Yw\xdd5\x99\
+9}Z\x92\xe3\xd4\x9b\xba*\xbar\x8c\x8b\x86H\xc3\
+=\x9d\xcc\x13\xa9\x9a\x91\x1a\xb8\xfd\x96\xdb\xf9\xc26\xdb\
+r\xc9\xef/fxd\x88\xac\xd9@iE!\x0a\x9d\
++\xbe\xfe\x9d#\xe4\xdc\x8b\xceWS&-E\xcf\xd8\
+\xa57?\x1d\xea\x95\x91!\x95\xc3BH\x86B}\x88\
+T\x22\x1f\x15sf\xcf\xe1\xfa\xeboP\xedF\x93?\
+^\xf6G\xe6\xcd\x9f\x17\x15\xbb\x7f\xc6\xcbj\xdf\x9e\xfb\
+n\x87R\x22EjO\x7f$J\xcc\x9a\xfdEY\xca\
+\x01{\xee%\xf7\xddq\x17\xcd\xc6\xb0\x9b\x22h:\x9d\
+\x92\xbd\x0f\xdc\x9f\xef|\xffH\xe7\x9c\xb5S\x22On\
+\x81|\xc5\xed\xd3\xd7\xb8\xf0\x0b\xaf(\x04Q\x06cl\
+|\xa8M\xd4\xe1\xfd1\xe2hF9~\xaeY\x8c\x91\
+\x94\x12f\xd4Q@xA\xe0\x85:Xz\xf6+^\
+:\xb9o\x9c\xaf(E\x9c\x7f.}_\xe0M\x89\xef\
+p\xb4\xe1N\xaf!0R@\xfe\x92Z\x00\xe1\x01\xa2\
+\xd4P\xe9w'eB|\xa6c\xd0t\x10E'\x92\
+J\x11\xf3t\x81?|,\x22\xc2$\xd0x\x81#A\
+C\xe0\xce\xaf\xb3\xf0\xa4\xaa\xd2#'\x11\x1c(\x8b{\
+\x0f\x97\xc3\x95}V\x91\xe9\x8c\x22\xd1i\xa6(mv\
+\x1c\x1f\xb5\x86#F\x87XK\xf4Q\x85\xac\xb4\xe2r\
+\x9cw\xf1\x95L\x9ai5\xaah\x8d\x901\xf7\xf5\x85\
+\xec\xb1\xf3\xe7\x997o>\xd1'[\x9d\xb5E\xfd`\
+\xbf)\xf1\xec\xeb\xeb\xc5O_|\xa8\x8e'&{\x8a\
+Ol\xcfO\x8c\xe7\xcc\x9e\xcb\x81_\x9a%\xfb\xef\xb3\
+\x07\xaf\xbe<\x9bFs\x08\x94\xf5\xeew\xc6:|\xf2\
+\xd3\x9bs\xdd_o\xe0\x0b;\xee\xa6P\x8aF\xb3\x81\
+O\xe3m\xdc\xda\x96q\xf3\xdf\x90)W\xa50\x05\x14\
+F(\xc52\xc3\xc2\x85\x0b\xf8\xf2A\x07\xd3h\x0cc\
+h\xa0T\x83\xfd\xf6\xda\x85\xeex\xa7\xaf\xffAa\x89\
+\x15w~\xf6\xab\x93\xebA98\x06\xb6\xc2SQ\x94\
+F\xf6\xdb{w\xee\xbb\xe3\x1e\x95\xb5\xda(\x9d\xa3\x80\
+nO8\xfc;_\xe5\x90C\xf7\xb3p\x19\xef\xb8\x93\
+H\xca\x81l$.\xe5\xa5N\x01\x8b\x81d\xcb\xbeW\
+\x05\xcaS\x19J\xbb\xfc\x96:aH\x9f\x84\xc3\xd8m\
+\xc9\x12:h\x22\xb3\xa7X\xf0\xe4\xae\xbd\x96p\xd3\xdf\
+\x90,\xc7D\xbeI\x19\xbe\x22\xc9\x12d\x85\x15\x17!\
+X\xca\x9e.\x8c\xb7.\x9c\xf2\x5cb\x0b \x98cR\
+\xad&\x10\xcc\xb3\x8a\x16\xf5\xd2\xcb]7\xd8\x97y\xc0\
+\xbc\xca\x0a\xda\xdc\xb5\x99$\xa8\xb0#\xe0?]\x9b&\
+\xb1\xc5\xbc\xb4\x0b~0/QS8\xdd\xd7\xc4\x11\x17\
+q\xe5\x06R\xdb=\xec\x85\xb8\x93\x81\x8d]\x0d\xa8\xac\
+1S\xd5vao\xb5X\xa9\xbd\xec238\xed\x9c\
+?\x91\xb5\x0b\x94\xca\x10\x9d\x01\x19\xb3_Y\xc0>{\
+|\x91N\xa7S\xc1\x8c\x1d\xe6hFz!`j\xa0\
+\xd7\x95J$\x1fc\x19\xbfR\xcf\x19\xa6Js\xd9\xa5\
+\x97\xf0\x89\xcd6\xe5\xd6\x7f\xdc\xa6\x9a\x8d\xa9\xe8\xbc\x81\
+V\x8a\xb2(Xv\xd9\xa59\xe7\xf7\xe7p\xd4\xd1?\
+edx\xd8F\xaf\x19h\xb6s\x87jO\x98\xca\xad\
+\x88\xf8~*\xa7\xc7\xaa\xa9\xa4\xc41\xae\x00\xa64r\
+\xe9\x1f\xfe \x9f\xdejs\x1e\xfc\xcf\x7f\xc82\x1bL\
+\xa4t\xc6SO\xbd\xc8N;n\xcd\x03\xf7\xdf\xdf\x17\
+\x92\x1d\xf8\xdc\xb5\xecq\xa1\xbc\xdf\xc0\xcd\xdd\xd3\xf1(\
+\xcbR\xf6\xdbk7\xee\xbe\xf5n\x95\xb7\x86\xc9h \
+@\xaf\x0b_\xfa\xf2A\xec\xb6\xdb\x0e\xb6?A7\xa8\
+\xe4\xff\xf8\xde\x1a\xca+EA\xd8b\x1c\x9fI\x18\x17\
+\x08SQ\x972(\xea\x1e\x890;\xc1\x15\x15Y\xc2\
+\x98\xbe\x7f\x81\xc6\x9d\x100\x9e\xc7T$\x04\x85\xd3^\
+\x89\x12\x0e\xca\xc0Y\x10:\xb1\x1a<\x7f\xa69\x22=\
+\x0b\x89\xe2m\xf8\x00\x5c\x03\x9e\xe8=\xb0)\xa6BU\
+\x9dH\x1e\xe5\xb4\xb6J\xee\xe9\x04\xbbb\x7f\xfb\xf0P\
+%\xd62\xd0R\x05%8\x90\x12p<r<\xb2\xc2\
+vIb'S\x10\xfbv?Eg\x8cr\xf9\xd1b\
+\xe8yt\xe2\x0cZ<\xb1\xd1kN\xa0\xb9x\xf3\x95\
+\x96_\x96\xd3\xce\xbe\x94l\xa8$\x13'\x04\xb4\xe6\xc5\
+\xa7_b\xf7\x9dw\xa4\xdb\xedZ\x90]\xde\xb6\xeaB\
+\xa8\xff\xe2\x16\xa7\xea\xcbL\xf5nW\xe0\x91`\x91\xbc\
+\xf8\xc2\x8b\xec\xbd\xcb\xae\xfc\xe8\xbb\xdf\xc3\x94\x19y6\
+D\xd6\xb0\xab\xc2\x9d\x8ea\xdfY{\xf3\x87\xcb/c\
+\xa3\xf7\xbc\x1b-\xa9]\xa1\xec\xb4'\x9cjc\xcd\xe8\
+\xd2\x94\xc4\x8d\x0e\xf1\xed\xba\x8fL\x84\x9bn\xbc\x8e\xad\
+\xb6\xf8\x88:\xfa\xc7?P\x9dN\x87f\xbb\x81VY\
+\xb0\x1e\xb4R\xbc\xf0\xfc+\xec\xba\xf3\xb6\xec\xb5\xdb\x17\
+x\xf0\xbe\x07\x06\xf6\xb1\xbf\xc3\xd1\x9f\xe1!.K#\
+\x07\xec\xb5\xb7\xba\xff\x8e\xfbU\xab5\x99\x5c\xb7 \xd3\
+\x14=\xcd\x01\x87}\x89\xfd\xf6\xdf\x15\xbf\xaf?6U\
+\x15 \x83^V\xba:\xa5\x97{\x1aP*\xd0\x85v\
+\x91\x97A\x9d\x04>\xf0\x8a'\xfa\x8c4\x8a\xc7\x1e}\
+\x929\xb3\xdf\xb0S\x04\xaf(\x03\x1f\xf9\xefQ\xe0\xc6\
+9{r-hr\x88s,\x1d\xaf\x8b\xa9v\xca\xaf\
+\x0e\x19\x5c\x1doy8\xde\x0a\xdd\x95\xb7c\x01x\xe0\
+\xd3\xa8\xbc\x888\x07m\x22Q\x92\xe9\x80\xd7\xd4B|\
+a\x10\x04\x89\x94K\xb5w\xf0\x98z\xd3*\x0a\x14\x09\
+\x1dq\xa3\xa2<\xd2\xd2\xa2\xbcJqR\xd8\xde\xd7J\
+\xbb\x01\xac\x0b\x03B\xc8g\xb0J\x82\x86\xaek\x80\xf8\
+\x19<\xeen\xd0\xd6Yg5\xce<\xfb\x12\xc6LA\
+N\x03P\xa8,\xe7\xd9\xc7\x9f\xe6\xc0\xbd\xf7\x11q\xa1\
+}\x13\x12\xa1\xd2\x84\xa9Q\x0d\xcb}\x10\xbb\x09\xb4O\
+\x9fv\xf2\x09\xc7\xf3\xe9O|\x82\xfb\xee{\x88fs\
+*:k\x82\x86^\xa7d\xa5\x95\xd6\xe4\xea\x1b\xfe\xcc\
+\x81\x87\x1c\xc2P\xbb\x95\xccec1\x05\xe8<\x0bm\
+\xdb}\xfc\x9e@|\xe4\x8d\xfd\xac\xc7\x90\x09\xf0\xb1\x8f\
+m.\x07\xcc:\x8c\x99\xcb\xac@o\xdc\xa0\xc4\x1d\x97\
+\xee\x05@\x9e\xd3\xeb\x18&O\x9a\xc2\x86\xef\xde\x98\xe5\
+W|\xc7b\x97\x9c\xb4\xd3jv93Bj\x8c\x91\
+C\xf6\xff\x92\xba\xe7\x8e;i\xe4#6_\x80V\x14\
+\xbd\x92/\xee\xbd3\xfb\xce\xda\x8b\x18\x0d\xfavJ\x8c\
+\xb93\xb8\x13\x80\x93\xf3\x1a\xb4\xf2\x9a\x15\xa7]\x1d\xfd\
+\x06\x87\xb8\xa5\x01{\xcc\x1b|\xed\xc8/\xcbg>\xf5\
+A>\xf4\xfe\xf5\xb9\xee\xfa\xab\x13fs\xfc\x13x\xc5\
+\xd1\xb7\xc7sen\xef\x99\xdf1y\xaa\xc9S\xa6v\
+\xc2!\xf6\xd9\x8f\x97k\xdf[\x0a^\x18$\xf4\xdd\x87\
+\xf7\x89\xd0\xe3t\x13\xb8\x80 \xf1\xda7|\xc71\xa3\
+\xe9\xbbn\xc4\x05BH\x5c\xb3\xae\x9c\x9d\x17\xcc&?\
+g\x8a\x12;.\xa3\xf8PI]C\x90N:\xef\xda\
+\xf5\xce\x1e\xd7\xa6mE\xb9v\xbdi\xa0\x89\xde\x5c\x13\
+\xfa\xe5\xfb\xba$\xc5\xce^\x9c\xa9\xa7\x04\x11\xc3\x9ak\
+\xac\xca\xe9g\x9d\xc3X\xb9\x80\x8c\x0c\xa55\x8d<\xe7\
+\xa1{\x1fP\xdf:\xe2\xeb\x98\xb2\x14\x1f\xdb>\x91\xa6\
+\x1f\xf8\xae\xca{\xbd\x86\xd0<x\xdf\x03\xec\xb0\xed\xb6\
+\xfc\xee\xd43\xc8t\x9b,k\x82\xb2\x0e\xacF6\xc4\
+\xe1_\xff\x1a\x97^u>+.\xbflp\x12\xf6\xb7\
+]\x13\xa2*\x1dS\x1cNl\x9b\x131V\x965\xd4\
+\xf6;~\x91+\xfe|\x15G|\xf5k\x8c-\x1cG\
+e6\x1f\x9d\x22c|Q\x87Y\x07\x7f\x89\x9bn\xbe\
+\x8d\xc3\x8f\xfc\x063f,\xbdX<[\xa7[\xf5}\
+eid\xd6\xde\xfb\xa9;\xffq\x0b-\xe7\xf0SZ\
+a\x8a\x82\xcd\xb7\xfa\x18_9\xf2\x90\x10z\xf6vJ\
+\x106\xb5I\x97\xa7;\xe3\xe6\xef\xc6\xf1Nu\x11,\
+\x98\x8d\xee\x9f\xe2\xc1\x07\x1f\xe2\x8a\xcb/WC\xede\
+h5\xa7r\xf4\x8f~PY\xf2\xf4\xa77\x11\xfe7\
+!\xcd]T0\x12V\xa2\xbc\xa5\xeb\x83\x89||\x8b\
+\xf1\x9c\xe4\xa7\xb3\xa1\x0fD\x98,2\xf1q:\xf6\x0d\
+\xb5\x98\x8e\x14\x17\x83\x10d0\xc1D\x09zX\xd9?\
+\x8f:\x0b\xb0J\xd6\xd4c\xb4\x93\x7f\x97\xc2 \xca\xbb\
+y\xfc\xcc\xd5%\x98\x0c\xb5U\xf2\xe9\x03\x1b\xc1\xa6\xdb\
+\xf2\x82\xc8w]\x87\xa7\xa4\xd2y\xb1L\x10\x06%\x22\
+\xd5\xb3\xbb\x7fNk\xed\xf2\xb0K\xf2\xfc\xdb\xd3 \xd6\
+\xd0\x881\x8c\x1b\xbdg=N>\xe3Bz2\x8e\xa6\
+\x81(M\xa3\x91s\xf3\x0d\xd7\xf3\x8d\xaf|MEa\
+\xf7\xf6\x08\xd5\x0a\x0e\x8b\xd9E\x8bF9\xfaG?a\
+\xa7\xedw\xe4\xe9'\x9fCg\xd6\x09\x86\x12\xba\xe3]\
+\xde\xff_\x9bq\xc5\xb5\x97\xb3\xfb\xee;x\xccO\xdc\
+.nU$)*8\xdcT \xb9\x89\x92H\xd86\
+\xecT\xa4\xdd\x1eb\xe7\xddv\xe3\x17\xc7\xfd\x9c\xd1\xd1\
+\xf9\x88\x11\xc6\xc7\x17\xf2\xa3\x9f\xfd\x90Y\x07\x1eL\xb3\
+5\x94\xcc\xcb\x17\xd3\xd7\x0a\x8b@Y\x94\xb2\xff\x1e{\
+p\xe7-\xb7\x93\xb7\x87\x90\xac\x01JS\xf6J6\xfd\
+\xe4f\xfc\xf4W\xbft\xf4\xb1\xa4\xe2;}\x99&F\
+\xa1\xd6a\x88\x99\x9d\xd2|\x121\xd1G\x12\xca\xeb,\
+\xd7\xa9S\xa6H\xc3\xe5m\x14)Yi\xa5\x95\x9c\x1b\
+\xc3\x9f\xd4#\xa1\x05[\xaaLkjt\x18\x8e\x02\x11\
+\x7f\x04\x8b\xe7\x0c\xef7\xab\x0a\xae\xb8\xb0\xe2\xc3\xc4c\
+pp\x8c\xa2\x1dL\x11\x13[e\x12\x8d$/\x19U\
+\xd0\xb4\x8a8[\x8e\x1bm\xfbg\x8a~\xbe\xed\xbb\xe5\
+@\xa9\x04\x8b\xa7\xfb\xfa\xa2\xf3\xce\x88\x0a\xc2\xc0;\xa2\
+\x92p\x1fR\xe9i\x92\xc1\x90\xa0\xf5c-\xe5\x04\x84\
+\x02\x8cq\xd2W)\x9b\x0b\xaf\xb4\x9a\xbc?\x92\xea\xad\
+J\x14\x86\x06\xe1\xbd\xef]\x9f\x9f\x1e{*\xa3\xa3\x0b\
+Qbw\xa2\xe5Y\x83\x7f\xfe\xed/\xfc\xe8\xbb\xdf%\
+\xd3\x1a\xa5}\xfa\xf4\xb7j\xday\xaa\xc5\xa0\xb4\xe6\x96\
+\x7f\xde\xc6\xf6\xdbl\xcd%\xbf\xbf\x98v{\xd8\x86$\
+\xab\x0c\x8c\xa1\xddj\xf2\xf3\xe3\x8e\xe5\x943~\xc6\xcc\
+\x99K\xe1C\xa7\x16W\xfc\xb8\x9a$~B\xc2\xbdT\
+\xc0\xa6\x22}\xf1e\xcbOl\xc5{6\xda\x88^\xaf\
+\xe0\x83\x1f\xfc\x00[o\xfd9\xb7T\xf96\x84\x9e[\
+'\xedv\xbb\xcc\xdaw\x1fu\xef\xedw\xa9v{\x18\
+tn5rQ\xb2\xf1\x076\xe6\xa7\xc7\xfc\x0c&\xb0\
+n\x96\xa4\x18\xc7\xe4\xf1\xc8p\xcbB)[E\x03\xde\
+[\xa2\x9e\x8d\xbd\xa5\xe9\x94\x22\x8a\x15VZI\xfd\xec\
+\xe7G34\xdcd\xc5\x95\x96\xe3\xa7\xbf8\xdeY\xbf\
+U\x13=\xe5\x02\x94\x82\xc8\xfe\x00\x00 \x00IDA\
+T\x9f=(n\xe8\xaaN\x03\x8dW\x5c*\xf2[\x8c\
+\xf1\x8f;M#\x95\x9bp58i\xc3U/&\xdf\
+N P\x221\xbc\xf6\x0e&Hxy\x92\xfe\xc8I\
+2/m|I\xcd&\x0f\xac\xdf\xe8\xe2\x7f\xa5\xef\xf0\
+\xdd\xf1\xc0\xd9\x8e\x18\xe785I\xfd\xd8\xa2\x97\x92\x84\
+\xa7\xa3\x14\x0fp\xb8S}m*p\x07\x95[\x82\xac\
+\xae\x19\xbc\xbd\xe2\x07S\xa1\xd9d\x93\xf7\xf3\xcd\x1f\xfe\
+\xd4\x99\xc2\x0dD5hdM\xae\xbd\xe2*\xbe\xf7\xad\
+o\x85\xfe.N\x06X\x1e\xb0\x8e\xa8y\xf3\xe6\xf1\xf5\
+\xc3\xbf&\x07\xee\xbb/s^\x99O#o\x859\xf0\
+\xd8\xd88\x9f\xdev[\xae\xfb\xfb\x8d|\xe2\x93\x9b\xba\
+\xa3\xc2\x96\x1cf\xebLM\x9eQ\x89\x1eQ*\xc1\xdf\
+[\xb7\xeb\x85\xc9\xde\xfb\xec\xcf\x9bs\x9f\xe6\x8b\xbb\xec\
+\xee\xa6\x81o\x0f\xa7F\x14\xbd\xa2\xcb\xfe{\xee\xc5\xdd\
+\xff\xfc7\x8d\xd6dT\xd6@\xab\x06R\x18\xde\xf7\xa1\
+\xf7r\xe2\xe9'\xe1\xb1\xfe\x7f/)\xeb\xf8\xff%\x09\
+HL7\xb1\xdb\xe9b:E\xc5\xab#\xf1t,|\
+\xea3\xdbq\xf3mwq\xf5\xf5\xff`\xc5\x15W\x22\
+\xd2y\xb0\x17\x92\xc9h\xbaM\xc8\xb6\x99\xe6\x96\x8c}\
+s+T\x09\x8f\xf9(%O\xe5\x15\x8b%LmL\
+\xf2F\x927\xf7\x97\xb7H\x09\xe6\xd11\xd1\xfd\xd4t\
+\xf6\xbe\x80\xb0N\x87\x97L\xd5\xa2\x13\xe0j\xf3\xaf`\
+\xf4\xdb\xefqoaj>\xa7s\x1b\xdb^\xd5\x0c\xac\
+\x0a\x9bT\xa7\x81M\x19%\xc6\xc2)Z\xb9yr\x15\
+\x96\xb7W\xaa\xf8\xd9\xee\xf3[\x812\x1c\xf7\x93\xa3\xdd\
+v\xdf\x06\xcd\x86\xe2\xba+\xaeb\x95UW`\xef\xfd\
+\x0ft\xfb\xe0\xa1\xb6:\x16\xbc\xfbZ\xc3\xc5\x17^\xcc\
+\x09\xbf\xfc5\xe3\xe3=\xd5jM\xc2\x9f\xe0Q\xf4\x0a\
+VXie~~\xec1\xac\xff\xce5\xa9\x9e\x1d\xf6\
+\xf6\xe0VIn-Q%h76\x95\xadn\xfdc\
+5\xb8h>\xf2\xd1\xff\xe6\x0b;\xee\xca\x87>\xf2\x11\
+\x96\xdc\xb3b\x8b1 \xa6\x94\x03\xf7\xdd\x9f\x07\xefz\
+P5\x87F\xd0:\xb7y\xfa\x8a\x82\xf7~\xf8\xbf\xf8\
+\xcd\xa9\xc7\x87\xcdK\xff\xff\x8b;\x1d\x09\x03\xe4he\
+(\x8a:=\x06\xe8\xc23\xf1n\xbfu\xd4\xc8c6\
+$O\xfb6\xdc:\x0a\x11{\xbf\xba\xa0\x1bK\xb5\xbd\
+\xd4\x02\xf7\xed\x08\x0aU\xa3\xff0\x85\x16\xdf\xa2o7\
+\xaa\xf0\xd4\xab\x97\x96\x09\x04@\x15\x8c*p)\xd5\xa6\
+\xd7R\xe65\xb5z\x1e\xa0\xb4\xce\xa0\xe2\x85\xc7DH\
+I;V\x87\xab\x0e\xeb\xc4D\x12w`\x99\xc4T\xfb\
+\xff#\x04\xaapl\xb7\xfdg\x18]8\xca\xc9\xbf\xfe\
+)M5\x04\xbaA\xab\xa98\xf5\xb8\x13Yg\xcd\xf5\
+\xf8\xc8f\x1f\x0b\x02 =\xc8S)\xc5\xe3\x8f=\xce\
+\xd1?8\x9a\x07\xee\xb9\x8f,o\x905[v\x80K\
+h\xb5G8\xf4\x88\x03\xd8a\xe7\xcf\xd3\xcc\x9d\x97\xb7\
+\x0e\x85D\xc12\x08K\xc1\x0dj\xdc1TeA\xff\
+\x99q\xe9SU)\x95\x8awjwD\x14?\xfd\xf9\
+\xf1o\xc7\xd7\x19\x9cl\xbd^\x87C\xf6>@\xdd\xfb\
+\xef\xbbi\x0d\x8f\x80\xcaQJS\x16\x05\xebm\xb8\x1e\
+'\x9cz\x9c\x03sqc\x9b\xd2\xd9\xe0:\x89\xc8\xb3\
+t\xe0\x96=\x83\x03\xbb\xb2\xe4]o\xab.\x08\xfc\xf7\
+:}\xa7\x82\xa4\xb6\x1a\xd0G\xdfu\x98SKX'\
+\xdf\xd3\xc9A\xbd7\x91\xaf\xea\x22$N\x5c\x06\x97\xc5\
+\xe4\x04\x8cLR-u\xa4\xf4;%\xfa\xdbJ\xdb\x1c\
+T7EJ\xfd^\xfa\xdc\xa0\xb6\xab\xfe\x84\xfev\xfb\
+;o\x8c\xf3W(\x83\x98\x22\x9c#\x81#F\xad\xeb\
+\x86\x98k\xc9\x10\xce\x9aG\x0d\xee\xb1\xf7J\xef\xba\xc7\
+\x8e\xf4z=~w\xec\xb1\xe4\xad&J2F\x1a\x93\
+\xf8\xceW\xbf\xc9\x0f\x8e\xf9)C#3Q\xd2e\xe9\
+e\xa6\xb3\xeaj\xabR\x1a\xe1\x8cSN\xe3\xb4cO\
+\xa6\xd1j\xd2j\xb6@\xd9\xbd\xdfE\xb7\xe0\x7f\xb6\xd8\
+\x8ao}\xf7\xcb,\xb3\xb4=\x92\xac\x8e\x11q\xff\x85\
+t\xfd\x89 H+\x85\xd0\xf4\x01\x18U&\x12Y\xad\
+\xe5*F%\xc4\xc1\x04\x81\xe3?\xfd\xf4F M\x97\
+P1B\xd3g\xbc\xaf\xe3K\xfb\xcf\xe2\xfe;\xef\xa0\
+5<\x19T\x8eFQ\x94%\xeb\xbd\xfb\x9d\x9c~\xce\
+\xa9\xa2\x83\xd7R\x06\x8e\xcd`\xc5\x94\x8c\x95T\xf1\xa3\
+\xfc\xdcZ%&t\xa6\x12\x8bj\x90\xe8\xac[E\xfe\
+{]9\xa64[\x17\x0au\xdc\x0e\x18\xa4P\x06\x09\
+\x9cz\xddA\xf0\xd5\x97\xef'\x9e.\xbd\x85\x05\x90\x9a\
+\xf5\x13u\xb8\xce\xb8u\xf3\xe3\xad\xa4\xb5\x7f\xcf \x8d\
+\x9e\x96zg\xea\xef\x18\xc4\x12uIk\x10SB&\
+\xd8\x95_'5}8\xa7'b\x07\x92\x8f\xa3\xf0\xc1\
+_J\x134wXZu\x9f>\x94\xd5\xc7j\xa0\x0d\
+{\xee\xb3\x0b\x0b\x16\xce\xe6\xa23\xce\xa6\xd5j\xa3z\
+\x0az\x86\xaf\xce:\x08eT\xa8\xff\xc9\xcfm-\xaf\
+\xbd\xf2\xba\xba\xef\xae\xbbh\x0f\x8d\xa0\xb5\xcdU\xdc\xed\
+\xf6x\xc7\x0a\xcbs\xe4w\xbf\xc5&\x1f}\x9f\x85_\
+l\xd6\xe2t\xb2\x15\xa2\xb6S\x86K\x84Z8\x01\xd7\
+1\xa8O\x06Z\x8a\x84s9R\x1d3XHG\xbc\
+k\x15G,}_\x18\x8dD\xc8\xa4\xdb6\xfc\xef\xf4\
+\xd3\x98R\x8e<\xf4pu\xdf\xad\xff\xa2=4\x09\x94\
+F+EQ\x1a\xd6\x5c{\x0d9\xed\xecS\xc8\xb2<\
+\x0clx\xde\xe1Y\x05a-\xf8#\xc8\x95\xc7\x89\xab\
+\xeb\x05\x91\xef\xf7@u\xe2\xac\xa9\xa2,j\xf6\xd3\xe2\
+\xe8{q4\x9b\x8a\xa8\xfa\xf5%\xe1\x9f\x89\xde\xb58\
+\xe5<X\x08N\x0c\xe3\x12\xa5\x05\x1f\xe4\x9c\xa87:\
+H\xd2\x0c\xd6\xbeo\x05P\x7f;\x8b\xab\xe7\xeb\x0e\x12\
+6u\x22\x96\xbe ,!I^\xa9\xaaLC \x83\
+\xa4\x9d\x9a\x86M\x05|\xd8\xd1\xec5\xaf\xabt\xe8\x97\
+\x0f\xe3\x99G\x9f\x91{o\xb9E\x89\xd6(\xa3\x99\xd4\
+\x9aB<D\x12\xfeq\xcdM\x0a\xadi7\xeda\x16\
+%\xc2\xe8X\xc1~\x87\xec\xcf\xee{\xed\xc6\xa4\x91V\
+\x80?0\x8e\x83\xc1[\xac\x0a*{\xb8\x02\xe3%Z\
+\xd9\xdf\xf3\x9d\xf3\xdb72\x91\xb87\xab\x86G\xfb\xbe\
+4K\xaf\xfdm\x0f\x89\x8d\xef\xf5\x16\x91r\x8f{\xe1\
+\x86\x10\xa3SI\x84' R\xca\x97\xf6\xdb\x97;o\
+\xb9\x9d\xe1\xa1I\xa0s\x149E\xaf`\xf5\xb5\xd7\xe0\
+\xac\x8b\xcf&\xcf\xe2\xae\xbetj\xe1\xfb*\x0e\x19\xa2\
+\x08)\xc8\xc34HEX\xd2\xf7\xfa\xb1\xf5\xbey\xc0\
+\xbaX\xca\xc5\xe9\xca\xb4\xd4\x95\x9c/&\xe6Mtc\
+\x12\xf1\xfdVL_\xbf\x07\xfd\xed\xa7\xd7\x06\xf9%\xea\
+u\x06\x09\x90jY\xcc\xdaW\xdaH\xfa\x12U\xbb\xe6\
+\xeb\xa4fG\xbd\xc3\x13\x01:\xa8\xe3\xf5\xe9\x80\xae\xd5\
+\xad#>\xfd\xbe\xf8\xa5<\xa5\xa0(K\x0c\xa5\xf3\x9a\
+\x8b\x1b\xf9\x88 \x853o\x9d\xd6\xf7\xc9;\xbd\x19\x19\
+\x98\x1f*~\x95t:\xeei@\xc4.;\x1e\xfd\xeb\
+\x1f+=4Df\xecQ\xe6\xf6h-m\xcf\xc8S\
+\x1a\x9d\xe5he\xb3\xd5v\x8a.\xcb\xaf\xba2\x17^\
+~\x81\x1cx\xf0\xbeL\x1ai\xe2\x93l\x06\xc2N\x04\
+M\xd8\xbc\x92\x12y\x94W\x95a\xf0p\x81`\xa4\x0c\
+\xdb5\x22\xc7\xd6\xc7L\xbb\xcb.qg\xe8\xa3\x84\x06\
+E\x9c\x16\x96\xd8\xcc y\x1c\x83\xbf|1\x1cq\xd8\
+\x97\xd5]\xff\xbc]\x0d5\x87\x10\xd5\xb0\x9a\xda\x94\xac\
+\xba\xf6\x9a\x9cu\xf1Y\xe4\x99V>@&\xdd\x19,\
+I\x9bi\xf6\xf0>\x7fh\xed\xfd\x01\x00/\x10\xb3\xc4\
+\xfe\x11AJ\xa9\x08\x99\x89\x95\xcf\xa0\xeb\xd1\x09\x17\xe0\
+\xe9\xab\xa6\x98\xd8\x22\xf0\x80\xd5\x99\xb5\xce{o\xb7,\
+\xde\xb2^\xcc2\xa0/\xe9\xb0M$\xf9\x12\xacV\x9e\
+Y\x9c&\xaf\xdf\xf3\xe1\xbe\xa6V\xbf\xfe;}\xb6\x8e\
+\xa8\x89\xe7\xae`\x07$S\x0a)\xb1\x0e0\xb0\xeb\xf2\
+i\xcc4\xc92\xdd b\x9a\x88&*/r\x9f\xae\
+\xd9v{\x98M6\xdd\xd4f\x9e\xc1.\x03en'\
+\x9bR\xd1>\xefu;\x1c\xfc\xb5\xc3\xf8\xfd\x1f\xcfg\
+\xbd\xf5\xd7R\x22v\xb5\xa0\x8f\xa9\x93\xd7T\xb4b\xc2\
+$\x03\xad\xd4J]\xbbh\xebW\x02\xb5V\x14\x15\x06\
+\x1f\xdc\xa7\x18\xed\x19\xeb\x0c\xf0EVK\xcd\x0fV\x14\
+\x05G\x1cr\x187_w=\xed\xf6$\xc8ZdJ\
+c\x0a\xc5*k\xad\xcdY\x17\x9eA\xb3\xd1p+\x03\
+\xf19!\xb5\xae\x92\xbe*;\x95x\xe3\xf5\xd7*\xd7\
+\xd3]\xb5iQ~\x8e\x90\xae\xc7:D\xf4\x8a\x82~\
+\x057\x00\x11\x83\xee8\xa6\x7f\xe4\xe1\x870\xc6\x9fA\
+^\xd7\xf8\x13Y\xd1\xd0\xcf\xacu\xfa\x1e\xc4C\x83\xf8\
+\xd1\xdf\x1b\xc4'\xd52\xa1\x0f\xa0\x0e\xaa\x0f\x95\x89\xc7\
+a\xda\x1a~\xcd=\xae\xbdK\xd2\x85t\xd5>]\xfc\
+Ks\xe0\xbb\xf5\xf9\xc4\xa4I\xdd<I\xae\x93\x81\xd0\
+I\xe5\xa9\xd8n\xfa\x7f\xfa\x8cQ\xa03qa\xd6n\
+),\xc9\xd8;Q\xe0\xca+/\xbf\xc0\xfc\xf9\x0b\x19\
+\x1aj1s\xe9e\x19\x1e\x1e\x1e\xec\xedV\x80)y\
+\xe5\x95\x97y\xf8?\x8fr\xfb\xcd\xff\xe0\xc1\xfb\xfe\xc3\
++O?\x07\xb9\x0e\xd9w\x0db3\xd7\x1a\x17\xa0\xa4\
+\x84\xf57~'\xbb\xec\xb1\x8b[&\x9c\x80\xab&\xd0\
+p\x13\x96\x09xY\xc0\xf9\x1a\xdc\x0f\xa3\xd0\xf4*\xf6\
+\x9b\x1a0\x85\x0b\xf9\xfe\x16S\xac\xb7\xde\xb6R\xef\x86\
+\x98\x92#\x0e9\x8c\xdb\xff\xfeW\xda\xed\xa9\xa03\xcb\
+\xfcF\xb1\xc2j\xabr\xfa\xb9'\xd2n\xb7\x06\x8f\x83\
+L\xd0e\x81\xb1\xb1Q\xb5\xc3v\x9f\xe0\xb2+o`\
+\xda\xb4\x19\x0e\xd6Z\xa7\x1dX\xd6jI7\x9f\x09(\
+C\xbb5L\xb7\xd3!R\xaf\xcfU\xdd\xafE\xabx\
+\x8a\xf7\xc6\xc6F\xd9\xe9\xf3[p\xfeE\xd7\xb2\xe1\xbb\
+7\x08/\x8d\xe1?\x83J\xa4\xd7*\xdf\xf5\xbf\xcf~\
+\xf7t\xde\xdf\xaa\x09\xad\x09\x9e\xff\x16g;L\x98\x16\
+<\x06\x19TA\xd0\x03\x9aK\x83z\xab\xdd\x22\x80Y\
+\x91\xa9\xceV\x92\xe4Mi\xc7Rdx\xdb\xc0w4\
+Mvl\x95\xb8\x0a\xf3i\xe5\xcf\xc4S\xe9\xfb]O\
+\x1c\xc3\x97\x89IoA\xf1\xd3\x17\xd3G\xd8\x02\xbc\xf6\
+\xca+|\xfd\xb0\xaf\xf0\xd0\xdd\xf7\xe1g\xed\xad\xe16\
+[\xef\xb0-\xb3\x0e:D\x8c)\xd5\x9c9sx\xea\
+\xc9g\xf9\xcf\x03\xf7\xc9S\x0f?\xa2\x1e~\xe4\x09\xe6\
+\xbe\xf6\x1a:\xcf\xc8\xf3\x9c<\xcb\xc9\xf2\x1c\x85\x0aI\
+3m~\x12\x17X\xa5A\x19\xe1\xa1\xff\xdc\xcf3O\
+=\xcd\xca\xab\xad\x16\x18\xe0\xffb\xf4\xbdU\xb1\xd3\x1c\
+M\x09\xe4n*\xa4D\x10\xd5\xa8\x09\xecAZ\xe7-\
+J\xd8\xba\xd1\xcf\xadb\x0c_;\xfcH\xb9\xfd\xef\x7f\
+Uys\x18\xa534\x19\xc6hV\x5c}5\xce8\
+\xffdFF&\xf5m\xc9}\xcbWj\x98\xfb\xe6\x1c\
+^\x7f\xf95\xf6\xdbk\x07\xfep\xf9_D+\x1d\xf6\
+\xd9U\xf4`\xd2t\xf0\x1f\xba\x94p\xa6,B\x05\x83\
+r\xa9\xde\xedCi\x14\xaao\xd3\x88B+\x09\xe1\xbe\
+J\xc3u\xd7^\x8d\xa8\x9c\xcb/\xbb\x80\x0d\xde\xfd\xb3\
+\xc0\x131\x98\xce\xff\xf2\xb1\xaf\xd5\xa0\xa4\x89<\x04Q\
+\x11\xa6\xb1\x01Q\x10P\xa9\x9b\x0a\x948\x96\x83t\xca\
+\x04\x02\x00\xbct\x11\x00q\x00\xab\xd8\xa0\x0e\xcc\x18\xb7\
+$\xf8\xf6-\xc3F\xado\xb3\xb8Jd\xe6\x94\xf9\x92\
+]\x7fi\x0c\x9f\x00\x18\x8bT\x03.\x15@\xf4@\xe3\
+\xcc-\xb4\x04\xeb?0\xb0\x170*A\xaa\xf3\xf0e\
+:\x998\x87\xfe&kWIY\xb4`\x1e\xfb\xee\xb6\
++\xb3_y\x83\xc6\xc8p\xf4F\x88\xe1\xea\x8b\xff\xc8\
+\x95\x17]\xae\x8c\x94t:\x1dZY\x13\x9dgJr\
+\x8d\x96\x8c\xf6\xc8\x08\x0aM\xe6&\xea:9\xfaZk\
+{\xe0\x84\xd5\xfc\x16\x96\x92\x82\xdcd\xec\xbf\xe7\xae\xfc\
+\xfe\x8fW0m\xfa\x0ck\xa5\x12\x97\xdc\xfe_\x15\x11\
+h\xb6r\xcaN\x87\xbc\xd1\x8a3 \xf1f\xab\xa3\x00\
+\x11\xb4VK\xce\x90~\xa3\x9a\x01\xa5\xaa{\x1fJS\
+\xcaA\xfb\x1e\xc0\x1d\xb7\xdc\xa2\xdaC#(\xd5p\xcc\
+\x0f+\xac\xb24g\x9cw\x12\x93&-\x01\xf3+;\
+m\x12\x0c\xe9\xb0\xbd\xf1\xfalPM^x\xea\x15\x8e\
+<\xf4 \xf5\xeb\x13O\xa9\xa6\x1d$N\x0b,\xb9\x88\
+\xcd\xd4\x0cng\xa8\xa6(\xc6]\xbf\x1d]\xaa\xc8\xaa\
+\x03\xdc\x1f\xa0\xa4zX\x0ap\xd3\x0d7\xd0\xce\xa7r\
+\xed5\xd7\xf0\x8do\x1dE\xa3\xd5r\xcfHBw\xca\
+n\x0e\xd3\x89@pmx\x9a\xf5\xab;~\xdf\x8c\x9f\
+\xa9\x86}\x02T\x95dU/\xc7\x15\x91\x0aG\x0d\x98\
+\xf0O\xe85S\x0e\xe6\x80\xb9\x8aY\x1d\x99\xd2k\xd7\
+\xd4\x01R\x114I\xbf}\xfcuT\x0e\x02&\xd1\xe0\
+\xf8wY\x8d\x14\xb7\xec\x86\x1e\xc7\xe9\x80\x82\xf1\xf1Q\
+.:\xff\x1c\xae\xbe\xf2r\xfa\x22\x0e\x057\x7f\xb4\x1b\
+\x96\xfc\xb1\xe1\xa6t\xd1\xdd\x0e\xd8L'\x16B\xda\x7f\
+\x05\xe7\x9fu>\xaf\xbd\xf4:y\xde$S\x0d\xb2\xac\
+A\xaes\xb2\xbc\x01\xbaI\xdeh\xd0l\xb4\x18\x19\x99\
+B\xden\xa3\xf3!\x1a\x0c\x91\xe9\x06J71\x921\
+\xd6\x15t\xa3\xcd\x7fm\xfaaV]w\x1d0\xca2\
+\xbdr\xbb\x13\xc5Xg\x5c\xd6@2\xe8,\x18\xe7K\
+{\xef\xce\x9bs\xe7\xf5g\xc5\xfa\x7fT\x82\xaf\xc0\x98\
+\xb0\x8c&n\xab\xab\xdd\xc5\x19\xeb,)\xf3k'\xd9\
+\xa3\x1f\x22\x11\xb0\x22\x1c~\xf0\xa1\xea\xae\x7f\xde\xaa\xda\
+M\xcb\xfcJe\x88Q\xcc\x5c~&\xa7\x9c\xf3;F\
+&Ovy\x03\xdf\xa2x5^\xab\xfa\xd8\xc3\x8f\x90\
+g-\xb2,\xe7\xd6\xbf\xdd\xcc\x8f\xbf\xff=\x8c)\xc3\
+\xd6\x19o\xe7\x05\x1e1\xc9\xde\x15\xb1'\xfe*\x15\x9d\
+\x9e\xfee>Y\x8c\xe7\xb4\x90\x9f\xc3\xff%p\xfc\xe7\
+\x81\x07\xe5\xe6\x9b\xfe\x8eV9eGs\xf2\x09\xc7\xc7\
+\x9bR{gb\xa5\x86\xad\xfe\xe2-R\x9f\x06\x8e8\
+\xe5\xf2\x9a3\x09\xf96\xde\x81\x932\xbf\x1b\x03o\x0d\
+\xfb\xff&\xc2\xec`\x1f@\xd0\xae\xb8\x0d@V\xfb#\
+\xc9\xfb\xfdQV\x22\x018\x09\xdc\xe9\xd8\xdb/\x0fy\
+\x8d\x1c\xf0\xeaU\xb3\x1fH\x15\xdb\xd3D\xc0\xbdTQ\
+T\xf3~\xbaG\xf6\xd9\xf3\x0b\xdc}\xd7\xbf0\xa6\xe0\
+\xc1\xfb\xbf\xcc\xd7\xbf\xfd\x83\x88\x90\xd0\x97h^\x09\xca\
+\xe5\xdf\xcf-\x9c%\xa0\xf2\xaa\xe7\x9a\xa8\xbd\xee\xbd\xf7\
+n{\x84V\x96\x93\xab\xcc\x82\xec\xfa\x98k\xec\x9a\xbc\
+\xb1\x16\x01\xa2)\xca\x1e\x85j\xb0\xda\xdak\xb1\xf6z\
+k\xb3\xeez\xeb\xb0\xc1{\xd6g\xad\xb5\xd7\xa4\xd9\xc8\
+\x11S\xc8q\xc7\xfcV]q\xfe\x85h\xadPe\x8f\
+I3\xa7\xb2\xcaZ+\xf3\xd0\x9d\x0f\xa2\xb4}\xc7\xcb\
+/\xbc\xcaW\xf6\xd9\x97\xe3\xcf\xfc-S\x96\x9a^\xc9\
+\x11\xf1\x7f)\xf5\xc1W\xc0\xf8x\x97\xa1v+\xfc.\
+\xa5 o\xb9\xb9\xf7\x12*\xfc\xb4A\x83#:\xaf\x95\
+\x1d\xb3\x94\xc6\xc8\x91\x87|Y\xddr\xe3M4\x87F\
+P\xbaa7E\x95\xc2\xd2\xcb\xcd\xe4\x82\xcb\xff`\x86\
+\xda-\xfd\x96\x8e\x05\x0f\xa8\xd7\x9ei\xffD\xf1\xf0c\
+\x0f\xc8\xa4\xf6$\xa5\x94B\xe7M\xae\xbe\xecJ\xee\xbd\
+\xe3^\xb5\xe5V\x9fd\xcdu\xd7\xa1=4Bw\xbc\
+\xcb\xe8\xf8\x22\xf9\xe4\xa7\xb6TZe\x98\xc4\x0f\xe0\x95\
+\x9b\x09!\x9a\x8em\xb4\xd7\xd6\x0c\x92;\x01\xae;o\
+\xbf\x83\xaf\x1d\xf1e52<\x15A\xc8r8\xff\xdc\
+\x0bYj\xfaT\xf6\xd8\xe7\x80 \xc5\x8dDb\x0e\xbb\
+b\xfd\x9a\xa9O\x95W\xd1\xe6D-\xe0\x13\xc4\x06>\
+\x8c+C\xd6b\x06\xeb\xd7r0{\xc9\xe7\x8e\x1b\x1f\
+\xa4\xed'\x10\x00*\x00\x12\x0f\xb2\xb4\x90XbT\xc4\
+5\xa4\x94\xb3%\xf9HL\x02\xcf\xe4\x9e\xe1+\xc14\
+R\xed\xacgF\x95\xc0\x91\x22\xc2B\xc1\xdc\xb9s\xb8\
+\xf3\xdf\xff\xa2\xd5\x9a\x8cR\xc2\x05\xe7\x9f\xc6W\xbf\xf9\
+]wx\xc7\xc4\xc4\xe4\xcdie\xe2{=x\xa9y\
+\xa7p\xd3\x05mO\xcf\xb1\xf2P#\x99#\x14g\xf6\
+,\xbd\xec;x\xffG71k\xaf\xb3\xae~\xe7\xbb\
+\xd7c\xe5\x95W\xa0\xdd\xcc\xdd\x8e\xc3\xb4/\x06\xa53\
+u\xf8\xd7\x0ed\x8f}w\xe4\xb9g^f\xeaR\x93\
+Xy\xd5\x95hd\x9a\xa3\xbe\xf9=n\xba\xfa:T\
+\xc3\xa6/y\xea\xd9'\xd8g\xe7]9\xeb\xa2\xdf3\
+i\xf2\xd4\x90\xdb\xe1\xedL\x07\xc2Z|\x8a\xef\xea\x96\
+\xcaPQS\x92\xa5\xf8\x88J0j\xbeA%\x19\xe3\
+\xca*\x84\x13\xfc\xdf<\xe2\x08\xf5\xcf\x1bn\xa0\xdd\x9e\
+l\xd7\xf95\x98\x12f\xbec&\xe7]\xf6{\x86\xda\
+\xcd\xc5dL\xa9w\x08RA\xe1Q;\x7f\xde<n\
+\xbc\xfaoJ\xa9\x1c\xb4F\x1bE3o\xf0\xdaK\xaf\
+\xf3\xbbS\xce\xa6(\x0bP]:\xbd\x05|\xef\xe8\x1f\
++\xedN0\xce\xc2\xf6Zk2W\xa6\x90\xbes\x9e\
+N\x8cc\xd0\x1a\xaco\xce\x9d\xc3/~v4\xd7\x5c\
+y\x15C\xc3\x93mZ4i \xa6\xa4\xd9jr\xf2\
+oN\xe5\x86\xebn\xe0\x88\xaf\x7f\x93\x0d7\xda\xd8\xed\
+Cs\x06|\xaa\xd5\xb4Dz\x97$\xcc;0\xbf\xbf\
+\x94j\x02\x89\xca\xd13;\xa9\xb2\xb4\x83\xee\xcf8\x18\
+dI\x0e\x16\x00*\xfdRej\x09o\xf4U\x12\xc0\
+\x81\xca\x0e3-\x84\xac\xc2H\x12\xf0\x17\xe7(\xa1\xed\
+\x80X'(\xe2K\x93\xb037X\xc0\xd4\xa9\xd3Y\
+{\xdd\xb5y\xea\x89\x17\x11\xe9\xb0\xc5\x96\x9f\x94,\xcb\
+\x94?\xca\xaa\x12)\xe7\xf1\x13\xf2\x19Xk .<\
+\xa8d\xa1\xd9\xf6IP\xac\xb8\xd2J<p\xf7\x83v\
+@\x94;\xdf0Y1\xc8\xf2\x9cS\xcf;\x83\x19K\
+\xcf\xd0Th&m+\xe9\x9b\x9b\x93M\x9f1\x83\x19\
+3\xa7#.\xbb\x90A\xf1\xed\x1f\xff\x80W_}\x9d\
+\x07\xee\xbe\xcb\xe6\xd5\x03^{\xe5%v\xdb\xf1\x0b\x9c\
+w\xf1%V\x08\x88\x0b\xc3\xd5\xd5\xe6}\x09\xafK\x98\
+1\x085\x15Q+R\xb2p\xfe\xfc\x10\xef\x10\x1c\xbe\
+:#$\xb9L\xc7E%\xc6\x98\xaa\xbd7\xe9\xa3\x7f\
+\xc6\xe2_\xf8\xe1\xf7~\xc4\xdf\xae\xbd\x91V\xdb\x06\xf9\
+\xa04\xa6\x14V^u\x15N;\xef4F\x86\x87\xc3\
+Kj\xf2\xa6j\xed$Q<u\xb9:\x7f\xc1|\x0e\
+\xdd{?\xca^I\x9e5\xec\xb2j\xe6\x98\xd9\x18\x1a\
+MMCi:\xbd\x82=\xf6<\x88\x1dv\xda\xcd\xe2\
+\x1dIr\x22(\xf7\x9a\x9a\x94\xf3\x9b\xa5<R\x8d\x83\
+\xc5A{\xda)\xbf\xe1\x8c\xd3ND\xca!\x86'M\
+\x22S9Jr\x17\xa9\xe9>\xb5\xf0\xc4cO\xb2\xd3\
+\xf6\x9fc\x9d\xf5\xd7\xe7\xf2\xab\xae\x8eJ*\x15&i\
+h\xa5K;W\xd1L\x81w\x9cD\xe8\xcb\x1d\x98\x8c\
+W\xe8\x92T\x11f\xfam\x80\x09,\x00\x89\x0d\xf4\x0d\
+BrM\xa0\x9a\x89\xb4\xd2\x08\x95L\xc1\x95Q\xads\
+Ej\xc7H\xd2\x01\xf0\xe6Ku\xca`\xeb\x5cx\xf1\
+5\xfc\xf0\xfb?b\xe6\x8ci|\xf9\xabG\xa840\
+\xc4\xf3v%^\xca\xcd_\x04\x82\xe3\xcb8\xafK\x1d\
+t\x80]\xf6\xdc\x9d\xcb.\xfe\x13C#M/\xb3\x03\
+#\x95\x9d\x1e{\x1f:\x8b\x19KO\x0f\x0c\x93\xe2<\
+4\x93tG%\x5ci|V#\xb1\xedj\x9dq\xec\
+\xa9'\xb2\xe7\xce{\xf0\xdcS\x8f\xd9\xc0\xa0\xac\xc9\x9b\
+\xaf\xcea\x8f\x1d\xbf\xc8\xe9\xe7\x9f\xc7t\xef\x18Lp\
+Y\xb3\x91\x82\x1c\x0b\xf2R\xc1\xa2\xf9\xf3\xb8\xed\x9f\xb7\
+s\xdf\x9dw\xca\xd3O>\xa1\x9ez\xeaiF\xe7\xcd\
+'\xd3\xee\x94\x5c`j{:\x07\xee\xba7\xebn\xb0\
+.+\xac\xb2\xa6\xbc\xff\xc3\x1fT\x1bm\xf4.F&\
+M\xae\xc4\xf7\x87\x15\x14\x15\x95S\xa5\xc3N@}\xff\
+[\xdf\xe6\xea+\xae\xa4\xdd\x1c\x0e\xcc\xaf\x80e\x96_\
+\x8e\xd3\xce?\x9d\xc9\x93&9<\xf4\xd3o\x95L\x14\
+)\x09\xf9?\x0d\xfc\xe9\xb2\xcb8\xf9\x98_3>\xd6\
+%\xcf\x9ah\x95\x85\x9c\x15J\x81\xc92\x94\x08EQ\
+\xf0\x89\xcf|\x86#\xbf\xf1\xb5\xb0\xf9J\x81K\x10\xeb\
+\xb6\x93+Ci\xc4.\x0fV\x98\xa9&\x8e\x12\x0b\xe4\
+\x93\x9f\xfe,s\xdf\x9c\xcf\x0d\xd7]\xcf\xc2\x05\xa3\xa8\
+<CaO[\x12]\x82\xd1\x94\x85b\xe6\xb2\xd38\
+\xea\xe8\x9f\xb1\xc9f\x1fE\xab\x86#\x92D\xfb)\xaa\
+\xc4Ra3\xe9\x87G\xd5\xeaB\xe4\xc3\xb0\xc9\x22\x91\
+\x0e~\xd0t\xbf\x0d0\xf1^\x80T#K\xe5\xc2\x80\
+\xba)\x19\x0e\xa8\xe7Gd\xa2\xa9B\xac\x94t\xc0?\
+\x9c\x98B\xb5\xa6'O^\x8a\x9f\x1f{\x8c[R\x8b\
+\x8f\x0d\xb2V-\x08\x96t|\x8e@\x05he\x97\x0f\
+\x021\x13\xad\x87,kTv\x0b\x8a@Q\x94\x14\xc5\
+8\x9f\xd9n\x1bv\xdb{\xf7\xbe^\xa7\x02\xb8&\xe6\
+*;+<\x11\xc6\x9e\x0b\x8dF\xc6\x19\xe7\xfd\x8e\xfd\
+\xf7\xd8\x8f\xa7\x1f{\x80<ka4\xbc\xf1\xea\xab\xcc\
+\xdaew~{\xc1\xb9au (&\xdfF*\xe9\
+5\xcc\x9f?\x97+.\xfb#\x7f\xff\xebM\xdcs\xfb\
+]\x0c\xe9&:\xcfU\xc3\x05\x1e\xe5\xba\x89r;\x01\
+,l\x8a\xb1\xf9\x0b\xb9\xe7\x1fw\xf0\xef\x9boW\x97\
+\xfe\xee\x1c\xca\xac\xc9\x07\xfe\xe7\xfdl\xb1\xe5\x16l\xb9\
+\xf5'i4[q\x0e\xea\xfb\x95X\x04\xe2\x98\xff\x98\
+\x9f\xfd\x82\xff\xbd\xe2\xcf4\xb3a\xc8\x9a\x01\xdbKM\
+\x9b\xca\xe9\xe7\x9d\xc6\xe4I#}\x1a?Ud\xe1\x8e\
+\xa7\x97\xa4\xa3\x0a\xf8\xcf\x03\x0f\xf0\x8b\x9f\x1e\xc5\xc3\xf7\
+<\xccP{\x08\x9d7\xac\x18\x13\x8d\xe8\x08\x90O\x02\
+\xb7\xc2\xaa\xab\xf3\x83\x9f\xfcX\x10\xeb\x1a\xd3\x0e\xf0\xcc\
+\xce\xf1R\x02A\xa5\xe6\x92W\xbb}\x0a\xcaB\xb9\xf2\
+\xca\xab\xf2\xb5o\x7f\x87\x03\x0e>\x94\xcb\xffp\x05g\
+\xfe\xf6\xd4\x901\x5cI\xc6\xd8\xf88\xbb\xef\xbb3\x07\
+\x1e|\x88d\x99;/\xad\xa6\xc4*\xfc\xe5\x998\xa5\
+\xf3:;M\xc8j\x9e\xa7j\x1c\x90\xbeoI\x97\x01\
+\xfb\x8b\xc7~\xca\xc4\xb5\x17\xf4\x05['\xc3\xeas\x9e\
+W\xdaH\xd94\x01r\x229S\xf7\x07\xb8\xe2\x8f\xaf\
+N\xa0\xacX=i\x0f\xac\x80\xd4\xf8,\xc0\x82\xb3\x04\
+jKV\x9eQ\xcf;\xfb,ZCml\xce\x81\x82\
+\xf5\xde\xf5N\xf9\xf4g\xb7V\xefz\xf7z\xac\xbe\xc6\
+\x9aQ#V\xb14\xd0\x8c\xf5\xf7&\x8aU\xf4\xf5\x87\
+\xdaMN;\xf7\x0c\xf6\xdb}?\x9e~\xf4~\xb2F\
+\x132x\xf5\xb5\x97\xd9w\x97]9\xfb\xe2\x8b\x994\
+eJ0\x8a\xea/\x9c\xfb\xe6\x1b\xfc\xf6\xa4\x93\xb9\xf2\
+\x0f\x97\x93\xf5 \xcfs\xa6\x0eO\x05\x5c*\x89$\xea\
+\xd1\x0a@\xfb[\x8b Ja\xb4\xa1\x81\xa6\xe1\xf2\x0f\
+\xdc\xf7\xcf\xdb\xb8\xf7\xe6[9\xee\x97\xbf`\xc7\xddv\
+e\xe7=vexd\xb2\x859A\xb8\xd8\xc1\xe0\xb8\
+_\x1f\xcf\xc5\xe7\x9dG3\x1bB\xe7M|F\xe1\xe9\
+\xcbN\xe3\xcc\x0b\xcef\xfa\xf4i8[\x8az\xa90\
+?\xf5\xc6\xe3\xfd\xd9\xb3_c\x99e\x96\xe5\xc5i/\
+3\xbe\xa8\x83R\x8a\x5c\xe5h\x9f\xdd\xd9\xa5\xa1\x13-\
+,\x1c\x9d\xcf\xd7\xbf\xff\x1b\xb4\xce\x94qm\x19'\xad\
+2\xb7\x7f_+\x9b\xba+S\x8a\xb8\x057\x81\xcfK\
+\xb7\xbe\xd1\xb2\xb4<u\xca\x14\xf6\xdcw7V^u\
+\x05\xbeq\xf8\xd7i\x0f\xb5\xe8\xf6J\xf6?h\x7f\xf6\
+\x9b\xb5\xaf\x95\xf5B\xa8_\xedM\xad\xdd\x81\xf4\x9fL\
+C*p\x0c\xb0\xa4\xebm\xf6\xf1f\xb5,>x\xbe\
+\xaeK'\x88\xce\x8a\xf7\x06z\x98j?\xeb\x88\x5c\x8c\
+e1\xf0Eu\xc1\x11\x99\xbf\x8f\xe1\x06\x81\xeb=\xb0\
+\xb8\xe9B\xe5\x5c\xc2X\xca\xb2\x94\xeb\xae\xbe\x11\xef0\
+\xea\x95=~}\xf2\xb1\xea\xb3\xdb}\x96\xd5\xd7X\xb3\
+\xbe\x02\x14\xcaD\x02z\x22x\xd2\xfb^8\x0c\xb5\x9a\
+\x9cv\xce\xe9\xac\xb8\xe6\xba\xa6,\xba`2\x94\xcey\
+\xe3\xb5W\xd8g\xb7\x9dY\xb8`^\xa4?\x9c\x83G\
+J\xb9\xe8\xecs\xf9\xd4G\xb7\xe4\x7f/\xfe3-Z\
+4\xda\xc3\x90\xb7\xaci\xec\xf7 `EA\xe63\x12\
+\x07\xc0\x95\xbb\x9e\x91\xab\x8c,k\xa0\xb3\x06y\xde \
+o6\x90\xb1\x82\xf3O:\x83\xcfn\xbe\x05\xd7_}\
+\xb5\xa8\xf0\xfe\xc8\xfcg\x9d\xfa;.<\xfdl\xda\x8d\
+\xc9\xe8\xbc\x19\xa2\xed&M\x9d\xccq\xa7\x9e\x18\x98\xdf\
+LH\xe8uL\x0e.\x9b|ls\x8e9\xee$\xae\
+\xbc\xe1z~r\xec/\xd9f\xe7\xede\xe9\x95\x96c\
+\xb4\xbb\x08%\x19\xde_cC\xaf\x0d\xd3\xa7/e\x05\
+\x8e\xa96\xab\xb34\x93\x94]\x22n4\xd2\xf7\xba\xef\
+\x03\xf2\xe9\xc7\x0e\xc4{\x9bm\xb19\x1f\xf9\xe8\x07\xe8\
+\xf6\x0cY^\xb2\xf7~{\xd5\xe4\x5cj\xe7L\x84\x80\
+z\xbf]]\xa9_\x1b\xa4\xe2&(\x8bYay\x0b\
+\x0101\x83\xfa\x15\xcd\xea]S\xab\xf3Vm\xa7\xa5\
+\x1eG\xb8\xa4\xcf\xbd\xc5\x9d\x0a7*\xcb\x08n\xae\xa0\
+\x95\x22K6\x84\xa4\xe5\x9a\xab\xafU\xf3\x17\xce\x07\xc0\
+H\xc9\xc7?\xf1)F\x86G0\xf8\xe0\x8f\xc1/\x1e\
+\xc8\xe8\x891d\x1bd\xc2\xc5}?=\x18n79\
+\xe7\xc2\xf3\xf5\xeako\x881\x1dDr\xb4n\xf0\xda\
+s/q\xc0\xee\xbb3\xde\xe9\xba\xd7h^x\xf69\
+\xf6\xddi7u\xf2/O`(o\x93\xe5M\xcb\x80\
+n\xb3\x91(\xbb\x8ci\xb5\xa4\xddn\xebW1L\xaa\
+U\xfc\xee\x22\xbfYIk'\x10\x1ah\x95\x937r\
+\x18\x17\x8e\xfa\xea\xb7\xd4\x01\xbb\xef\xce\xab/\xbf\xec\xe6\
+\xd2p\xe6)gp\xfa\xf1'2\xa9=\x99L\xdb\xf7\
+e\xa2\x98\xbc\xd4R\x1c{\xea\xafXe\x95\x95\xf1Y\
+n\x07\xf5=\xee\xe9\xafN\x8c\xfaK\xbc62<\xc2\
+\xc76\xdb\x94\xaf\x1cy\xa4\xba\xf0\xf2\x0b8\xe5\x82\xb3\
+hMiYGi\x06b\xa0\xd9\x1c\xe2\x9a\xab\xafD\
+\xa1\xc2\x8a\x88G\xb4R~%\xc0\xa5\x8a3\x02\xbaA\
+ur\xb68\x1eH\xc5\xb6\xad\xb6\xd3\xae\xbb\xb1h\xd1\
+l>\xf3\xb9O\xa0t6\xa0\x03\x83\x08\xa7\xdfV\x94\
+\xbe:u\xe1\xd1\xcf?\x83\xde\x90\x96A$\xf7\x16\x02\
+`\x90\xe9\xaa\x03\x91\xda\xd7\x0ef\xdc\x98\x82[\x85\xe7\
+#:\xe3\xb5\xea\x9b\x94#\x92\x81q\x16\xe0\xeeE\xb4\
+GS>t$\xf5\xfe\xd5\xc7\x11\xa10B\x8c\xb0q\
+p\xd4-+\x14\x7f\xb8\xf0\x02\xbb=W\xec\x8a\xc5\xf6\
+;l\x1b\x99\xdb\x8fA\xeaa\xac\x8f\xd3\xe2\xee\xf7#\
+\xabR\xec)@B\xab\x99q\xea9\xa7\xb3\xd2\xca\xeb\
+PJ\x0fD\xa3\xf3&/>\xf5\x1c\x87\x1fx\x80\x88\
+\x11\xee\xbf\xe7n\xd9\xf3\xf3;\xf3\xdc#O\xd1l\xb4\
+\xd0\xbaa\x13\x90\xe2\x18Y[#\xbc\x14\xa1SvX\
+8\xb6\x80y\xa3s\x98?:\x97\xf9c\xf3\x98?\xb6\
+\x90\xf9\xa3\x0bX\xb0h.\xe3\xe3\x0b\xe9\xf5\xc6\x03\xda\
+\x94\xd2.\xf3\xb0\xdd\xc5\x98\xab\x1c\x8df\xb89\xc4c\
+\xf7<\xcc\xae\xdbo\xc7\xa3\x8f<\xc2\x85\xe7\x9e\xcb\xd9\
+'\x9e\xc2P{\x04\xbb\x9f_\x03\x9aN\xaf\xcb1'\
+\xfe\x82\xb5\xd7Y\xd7F\xdey$\xfb\xc12\xe9O\x9f\
+$\xd3&\xbeJi\xcc\x84\xfb\x83\xd8\xc7\xed\xabP\x8a\
+wm\xb0>?\xfc\xd5\x0fY8\xf6&RXS>\
+S\x9a\xab\xfe\xf8'\x90\xd2\xf6\xcbwNC\x9e5+\
+\x83\x14\x03\x85\xd2\xfc;>\x12P%\xef\xec\x1f>;\
+\xdc\xc2\x86\xef\xd9\x88\xa5\xa6\x8dp\xe0\xa1_E%0\
+\xa7Y\xacc\xe8o\xcc<\x98f\xfe3\x95vU\xe5\
+\xd9\xf4^\xb5^u%\xc5\x7fKE\xc5\x12\xc7\x01\xd4\
+i5\xed\xb4q\x01\x05\xe9\xb1N\x83\xe63\x1e\x1c\x1f\
+\xc3\x5c\x9d\xad\xc4\x0d>\xa9rL\xbb\x10Q\x13\xdd1\
+\xde\xa9\x13\xd3\x8az\x1d\x98\x0c\xa3\xefej\xd9'\xe6\
+*R\xc4\xceh\x8b\xc6\xfa\x14\xe9\xd9g\x9e\x91\xfb\xee\
+}HM\x99l\xe7\xceK\xcd\x5c\x9a\x0d\xde\xb3A\xec\
+\xdd \xe5\x94bZ%\x7f\xa9\x10\xa8\xafK\xa6\xd2\xab\
+\xfe\xac\xc3\xc7H\xbb\xc1)\xe7\x9d\xc1\xac\xdd\xf7\xe1\xa5\
+g\x9e\x22\xcbs\xb2f\x8b\x87\xef\xb8_}y\xbf}\
+y\xe4\xc1G\x15\x85\xa0\xf2\x06\xe2\xdd\x9bn\xda\x22F\
+\xe8\xf5z\x8c\xf5\x16P\xd2`x\xb5w\xb3\xd4\xf2\xeb\
+1y\xc6r0\xd2\x0es\xe0\xcct(\xe6/dl\
+\xee\xab,|\xf99\xc6_y\x02Y4\x87L\xe74\
+\x9b\xed\xe07\x10g5\x19)\xc9u\x8e\x8c\x0a\x07|\
+a\x17\x1aY\x93vs\xc4Y\x0e\x16\xf8\x85\xe3c\x9c\
+t\xd6\xc9\xac\xb3\xfez\xce\xca\xa8\xf5\xd3\xe1 \xa2H\
+j4\x12\xd1\x15P-\x8e\xd0UbL%Af\x02\
+l\xb4\xd1\xc6l\xf6\x89-\xe5\xdf\x7f\xbb]\x91[d\
+\xce~c\x0e7\xdet#\x9bn\xb6\x058\xf9\x0f\x84\
+-\xd8~\xd3\x93(c#\x14\x13\x10\x07QgJ\xcf\
+\xa9N\xd6(\xda\xad\x16\x7f\xb9\xf9vi7\x9b\xaa:\
+\xf4\xd5L}*i;\xdd\x0b\x00\xb1ou[\xa0\x0a\
+G53`\xf5\xd3\xd6\xd3\x81S\xfa3s\xfa\xb2\xd8\
+\xdd\x80\xb1\xa9\xd8\xf1*Jb\x8d8\x90qo\x80L\
+P7\x8a\x86x\xb5\xae&m{\xd5\xfa1'pU\
+\x0e\x9b\x04\x86>\x09\x9d\x00\xa2\xb4\xa2(\x8a\x18{\xe4\
+V\x05\x02\x8c\x02(\xc5Y\xa7\x9d\xa2FF&S\x16\
+\x0a\x95\x19\xb6\xdcj+7uH^\xe0\x89\xd9SC\
+*^S\xc6\xae\xee4\x8e\xf5S\x012\xe8Zrk\
+\xca\x94\xc9\x9cz\xee\x99\xec\xbf\xf3\xfe\xbc\xfa\xe2\xd3\xe8\
+,#kj\x1e\xba\xe7!;w\xd7\x19\x8a\xbc\xc2\x14\
+eY0\x7f\xecu\x9a\xcb\xbc\x87U7\xdb\x81\x19\xef\
+\xfa\x003\x96_\x86\xa9S\x9b4\x1b\x19Y\x96\xc7U\
+\x097%\xe8v:\x8c\x8du\x98\xf3\xc6\x02\xe6<\xfe\
+\x18\xb3\xef\xb8\x81\x05\xf7^G\xc3\x8c\xd3h\xb4\x9dt\
+5\xa4G\x85\xe9<\x8b\xd8Wv9m\xac\xd3\xe3\xa4\
+sN\x92\x8d\xde\xf7^U\x99\x04\xa7\xcb,\x0eO\xe9\
+rvZ\xaa4\xe7\xb6\xb5(b\xa4\xa1\xff\xcf\xe14\
+\xd4Wp\xe4\xb7\xbe\xae\xb6\xfb\xe7g\xd0\xc6\xc6\x05\xe4\
+\xad\x16\x97\x9e\xff{6\xdb|\x0b;4N\x08d9\
+\xe0\x1c\x7fJ\x0aT\xa9b\x16\xa8\xa4\xf9A\xacX\xef\
+\x92\x87J\x144\x1d\xf3\xa7\x9bq\xea\xc2-%%\x7f\
+m\xe2\xa2\xb1\xa9o\xab\xc7\x80\xd4uF\xaa`\xa3\x85\
+\x10\xc5\xc5\x12\x07\x02U\xcd\xac\xc1\xccU\x97\x8b&\xb9\
+S\xd5\xd3)\x09T[\xa8\x22\xa4\xce\xd4\xb1~\xf5\x7f\
+_\xbb.0j\x9e\xe5\xf4\xe8d\x07l8\x80A\xc5\
+iK\xde\xb4\xcbT~Y\xb6\xdb\x1d\xe7/\xd7\xdc\x8c\
+\xa2M\x96\x97,\x1a]\xc8\xe7\xb6\xd9\xb2_<\xa7\xea\
+\xc9\xdby\xa9)R\xefr\x9d\xf9\xfb\xd4[\xad\xdd\x0a\
+u\x18\xa6N\x19\xe1\xd7\xa7\xfe\x92\xfdw\xdf\x8b\xd1y\
+\x0b\xc9\xc8\xed\xe8\x99,tW\x8b\xcd&46>\x0f\
+3yy\xd6\xdb\xf1;\xac\xfe\x91\xcd\x99\xb1\xec0\xc3\
+\xed\x0c\x9dA\xb7c\x19\xa0,\xe2\xb8\x09B\xa6\xa1\xdd\
+h1\xa9\xddf\xc6\xcc\xa9t\xd7X\x8e\xd9\x1fz?\
+\xb3\x9f\xde\x83Wo\xbe\x8a\xd9\x7f\xbf\x90\xa6\xea\x91e\
+-\x1b\xca+\x06\xdc\x86\xa6p\xcc\xae)\xe9\x94=~\
+t\xdc\xcf\xd8\xe8}\xef\xb56W\xbd?aGU\xda\
+\xf7\xba\xfdWE]\x18\xfb:\x01\xd6\x85\xab\xeb\xd0\xb4\
+\x19\xd3\xd9\xf6\x0b;r\xf9\xef/A\xe7\x1aM\xc6\xdd\
+w\xfe\x9b'\x1e}\x8c5\xd6^;\xd0\x83=\x09\xad\
+\x0cM\x94\x08\x99J\xa9\xad\xce\xf4\x11\xb2\xaab\x8bu\
+\x07\xedg\xed'\x89~eW\xa7\xffj\xfb\xd5\xa4\xe1\
+U\xf1\xd4o\x11\xd4\x05\xd5\xa0\xf6}Y\xac\x0f\xa0\xba\
+\xbf?\x8e\xd8 \xe4\xa8\xbeo)C\xd6\xa9\xbc\xaa\xee\
+\xa4r\xfd\xadJ\xbf\xb1c\x7f\x0d\xe8\xa0\xaa}\xfa\x15\
+\x00\xb1\xc6\xb2\x06\xb2$\xea\x12\xe0\xda?_G\xaf\xe8\
+\x91\xe7\xa0\xc8X\x7f\xc3\x8dYi\x95\x95\xea\x80\xf6\x9b\
+\xf0\xaey\x9bZ\xcb\xd0\xe9\xf5\x12\x90U\xbf`\xa8\x9b\
+\xfd\xf5\xeb5u!\xc0\xf2+.\xcf\xafN<\x8eN\
+g\x1c\xa5\xb5\xf5x{\xc3D)\x0aJ\x16.\x98\xc3\
+\xf4\x8f\xec\xccV\xc7\xfc\x89\xf7}nkV^m2\
+\xc3m\xbb\xeb\xae3\x0eE\xcf\xfa\x18\xbc\xd9\x1c\x84c\
+\x09RB\xaf\x10\xca\xae\xd0D\xb3\xdc\xf4\x11\xd6\xfd\xaf\
+u\xd8`\xdf\x83y\xd7Q\x97\xa0Vz\x1f\xdd\xf1\x85\
+\x16,\xe7,\xf4*\xd3&\x04-8\xf0\xeb\x87\xb1\xc9\
+\xe6\x9b\xc4\x15\xab\x94\xe1\xeb\x82\xcd\xa3g\x00\xf1\x0f$\
+\xd7J\x1b\xaaz\xdd\x0ba\xf7}\xcf\xfd\xf6Fe\x82\
+\x18\x85\x12M\xbb=\xc2\x1f/\xf9\x83\xb5\x22\x5c\xdf[\
+\xed\x06\x22*\xa1!\xa2&\xa8\x00>\x18\xb2A0\xf6\
+\x1b\xe5\x83h_\xa8\xf2\x89/U\xc7z\xfdz\x15\x8e\
+~\xf1\xd3\x0f\xcf {\xb9Z\x16+\x00\xa4\xf6\x82\x89\
+\x9b\xaa;\x02\xebu\x07\x19x\xbe\x13\x83\x8c\x9a\xd8\xee\
+\xe2A\x1d\xe0\x80\x14\x9flS\xd2j\xa1\xf4\xba\x85\xdb\
+N\xean9\x0d\xea#\xecn\xba\xfeZZM\x9b\xec\
+\xa3\xd3-\xf9\xd4\xa7\xb6\x0ca\x0b!o^\xd8jI\
+d$\x17@\xf6\xda+/\xb3\xdb\x8e\xdb\xf1\xb1\x0f\xfe\
+\x17\xbf\xf9\xf5\xcfm\x1d-q:0\xc8\xde\xad-O\
+\x05BO\xde\xe1\xcb\xc5\xe7]H\xab1\x8c`w\x15\
+\x0a\x1a\xa3\x15Fz,\x18\xef\xb0\xc1A\xbfa\x8b\xc3\
+\xbe\xcb\xd2\xef\x98\xcc\xd0PFY@\xafg\xffLa\
+;Z\x96Bi\xeckK\xc7\xfc\xa5\xb8?\x97+\xb5\
+,@\x0a\xc8z\xc2;&\xb7Y\xfb]\xab\xb1\xf1\xb7\
+\x8fc\xfa\xa7\xf7e\xc1\x82\xd9\xd4\x09[\xc4\xa0\xb4\xe2\
+\x86\xb1\xef\xb7{\x00\x00 \x00IDAT\xab\xff\x8c\
+q9\x17\xd2\xbf\x90u\x99\x18\xad\xb8\xe4\xa5\xf6.\x8f\
+S\xd7\xa6?a;\x15\xf8S\xa6N\xe6s;l\x8b\
+)K\x10\x8dR9\x7f\xbf\xf1\xaf\x14\xbd\x22\x18\x86S\
+\xa6NG\xa4\x1b\xdb\x8dsCB\xb8\xedb\xd9gI\
+`\x1e\xa45\x18\xf0\x09\x83\xfd\xf4*\xb9\x9e\xf2\xcb \
+\xb8\xea\xc2\xe6\xada\x7f\xcbU\x80%+\x8bcvE\
+?\xa3\xa7u\x07\xd9\x11i'S\x9b{q\xefu\xc4\
+\x86\x04)n\x8f\xa6\xaa6i\x9c\x130ss\x7f\xeb\
+)\xb7'\xf1\xbc\xf4\xfc\x0b\xdcq\xfbC\xe4\xba\x811\
+9\xad\x96\xb0\xcd\x0e\xdb\xf8-\x00I\x90\x96\x84\xf3\xee\
+\xfc|\x12\x00\x0d?\xf9\xe1\xf7y\xe8\xa1G\xe8\x15=\
+N;\xe5\x04\xae\xbb\xe6\xcf\x03`\x8c+\x0f\xc6\x81[\
+\xf9]\xfb\xf3]\xbf\xe3\xb6\xdb\xb9\xe6\xca\xff\x85\x86]\
+\xaa*U\xee\xf2\x09\x94\xcc\x1f/\xd8\xe4\xfb\xe7\xf0\xde\
+O}\x92\xf60d\x99}\xb6,-3\x9b\xc2&C\
+)\x04\x0aqL_BY\xda\xac@\xbe/\x22\xd0s\
+\xc2\xc1\x18[\xaf(\x84\x86\xd2\xac\xb8\xf4$6\xd8\xe9\
+\x10V\xdf\xe7'\xcc]\xf8:U\x9b\xdc\xe2\xe7\xd1\xfb\
+\x1f\xe1\xe2\x0b\xcf\x8dG\x0dHu4\xc3\x88V\x1e\xad\
+K\xbf\xc4:\x94X9}\x9dI5~\x02{\xa0(\
+\xa3\xd8\xe7\x80\x03)\xa4\xe3\x86F\xf3\xc6\xeb\xafr\xff\
+=\xf7\x83\x9b\x1d\x0e\x0f\xb7\xc8\xf3&\xca\xadr\x0ce\
+\xed\x00\xa9\x0d\xfd\xf7\x83E\xad\x0c\xa2\xe5%a\xbe\x94\
+\x18\x97\xc4\xda\xad\xb73\x11\xbf,\xee\x9d\x10\xd9\xbc\x9f\
+\xdd\x97L\x00\xf4\x0d\xd6\x92\x02\xef\x1f\xae\x0c\xfd\x80R\
+\x97ju\xf3\xe9\xad\xdf\x99\x0e\xbeO>\x12\x12\x8f\x18\
+\xafu\xac\xbd\xefOfU@\xa6\xed)\xf1F\xe0\x1f\
+\x7f\xbd\x99\x92\x0eE\x09:\xeb\xf2\xd1\xcd\xb6\xa4\xd9j\
+i\xbf\xdb*\xec\x1f\xf0\xae\x04@\xd5\x8e\xe4z\xe3\xb5\
+\xe7B\xf0\x90\xd29\x8b\x16,\x9c\xa0\xaf\x04BLh\
+| f\x8c\x82n\xb7\xc7\xd1\xdf\xfb1\xc3\xc36\x86\
+\xbeT\xdanI\x06\x16.\x1ce\xf3\xef\x9f\xccz\x1f\
+~OH\xd0\x19\x18\xbf\x14\xc4\x08%.\x11\xba\xd7\xc4\
+\xca-Q\x89\x84\xdc{a\x94\x1c\xe3\x87x\x07g\x11\
+h`\xd9\xe99kn\xb9=\xeb~\xe9X\xe6\x8e\xcd\
+\xc1\x00\x85k\x07\xa5\xc8\xf2\x06\xbf=\xee\x04\xc6F\x17\
+\xe1\xbb\x15\x84\xa4P\xd9\xab\xe1\x93}\xfa=\xef\xfe,\
+A\x9f\x00\xd5[\x0a>/\xa2\x17\x9c\x0aB\xd6\xdft\
+\xdfU\xa0\x1e\xc7\xbc\x93&\x0d\xb3\xd7\xacYt;\x1d\
+\x8c(\x86[S8\xe7\xcc\xdfr\xcf\xdd\x0fp\xe1\xd9\
+\xe7s\xc1\x99\xe7\xa1E\xdc^\x80\x8c\xa2\xd7\xe3\xbe{\
+\xef\x8d\x91\xe8\x03\x04t|[\xbd,N#\x0fb\xd4\
+%\xb1,\xde\x8a\xcf\x96T\xa0\xf8z\xfdJt\xf1\x02\
+\xa0\xc2\x87\xaa\xa6\xba\xe8\x97\x8e\x8b\xb3j\x16G\xe5\xf5\
+H\xa5\xb0x*\xb5O_\xdfsv\xb5~\xaaYR\
+\xff_\xe0Qe\xe8\xf5 S\xe0}\xa2n\x06\x80V\
+p\xf5\x15W\xd1j\xb4\xc82C\xa7\xdba\xd3\x8fo\
+\x82?xI$\xd1:\xbemq\xc2&\x01\xff\xa0C\
+\xbfM\x96\x1b:\xddy\xbcg\xa3\xf7\xb3\xf56\xdb\x86\
+\xb9\xb6\xb7P\xbc(\xaclyH\xe6\xe4\xa9\xc8\xf4u\
+/\xbf\xe4Rf\xbf\xf6\x066b\xcf\x06\xe9\x14\x06:\
+\x9dEl\xb0\xf7\xb7y\xe7G?Dg\xccim\xcf\
+\xc0\xc6\x99\xfa\xce\x05!)\x0e\x93\xb1\xf0\x86\xa9\xcf\xfc\
++N\xd8\x99d\x98\xb5\xf3\x95\x98\x12fN\xcdYk\
+\xf3O\xb1\xc2\xa7\x0fb\xb43\xdf\xa5\x13S\x94b\xc8\
+\xd1\xd0\x85\x13\x8e9\xae\xb2k\xd1\x8fC\xb2\xb7\xa7J\
+\x02i\x7f\xa5\xfaY\xaf\xe8\xd7\xccM\xda\x0d\xa9\xd5w\
+\xf8\xdca\xa7\x1d\x18\x99<\x82M\xc6\xa1y\xf0_\xf7\
+s\xc4\xee{r\xea\xaf~\xc5\x7f\xfeu\x17\x19\xcd\xf0\
+\xecpk\x0a_;\xe00v\xdez{\xae\xba\xf42\
+\x902N\xc3\xfcx\x99\xea;\xedg\xc2|i\x92\x8e\
+\x81\x0c\xf16J\x9d/\xea\xcdT\xc6r\x10\xb2 \x8c\
+\xee\x04\xeb\x80o-\x00\xfc\xc4Wd\xb0@K\x1d0\
+\x83\x80\xd4TG>\xfdK\xa76\xc0@\xea\x08B(\
+\xe9\xa0\x22 ]$\x011m\xcbSuE\x18)L\
+\xd9\xad\xecmo(\x8d\x11\xc5\x83\xf7=\xc8\xe3\x8f?\
+\x83\x88\xc2\x18C\xab5\xcc&\x9b~8M\x0e\xd3/\
+cUMF\x09\xfc\xf7&\xff\xc3\xdfn\xbb\x8f\xebn\
+\xba\x83s.\xbc\x88F\xb3\x15\xba*\x92\x08&\xcf\xd9\
+i?\x07M\xef\x04\xc6\xc7\xc6\xf8\xdd\xa9\xbfE7[\
+\x08\x19Bf}\x12e\xc1\xf0\xea\xef\xe5\x83{\xee\xc4\
+\xe8\x02\xd7\xc5\xd2kT\x9b\xf1\xd7\x88\xf3v\x07\x1aQ\
+\x88O\xde\x82%h)\x1da\x1b\x97o \x15tN\
+\xa0\xd8\x5c\x8a\x12\xeaM\x1fi\xb0\xd1\x1e\x07\x91\xad\xb0\
+>e\xd9u\xce~\xeb\xf8\xcdU\xce\xff\xfe\xe12\xde\
+x\xfd\x8d\xc1>\xb4\x84Vt\xa2Y\xb5\x22\x1c\xe2\xe1\
+\xe9\xb9\x82\xaf\x80\xf7\xf8C\xd2\xf1N\xa6\xd8^G\x0d\
+O\x9a\xccjk\xae\x86.@\x19\x0d*C\xe7m\xeb\
+G\xd1\x99\x8d\x96D\xd3\xc0\x06O\x0d5\x87x\xfd\xf9\
+\x17\xf9\xe5\x0f~\xc6\x9e;\xec\xcc\xd3O<f\xa3+\
+$\xbeO\xd2~\xa4\x0a\xca/\xc5\xa4\xfc\x90\x06\xa6\x05\
+\x9c\xaa\x0a\x0e\x06\x8dy\xe8S\xfa\x9c\x7f\xb6^\xfa\x88\
+\xbf\xfe\xfe\x9a\xc2L\xca\xc4\x02\xc0\xef\xe3WR\x11p\
+\xd6\xdd;(\xfdg\xed\xc5\x95\xc1v\xd4]\xd7\xdc\xe9\
+\xd6\x01\xef\xbcK\x18A\xdc\xfb+\xef\xf1\x08wm\xa6\
+\x12?-u|\xd8:B#\xf3M\xda6\xbc\x09\xff\
+\xe7+\xff(\xcd\x5c\xa3\x94PJ\xc9\xc7>\xfe1t\
+\x96\xa9\xd0\x8e$m\xd6\x05\xa0$\xe3#\xd0j5Y\
+n\xb9\xe5PdU<\xa5\xf2\xad.L'\xb2\x16\x15\
+\xfc\xe5\x9a\xebX8\xafkc\xfaQd\x19\x14e\xc6\
+\xf8\xf8\x226\xf9\xea\xb7)\x16\xc4y\xbe`\xb5~\x89\
+\xd3\xe6iC>\x03\x8dO\x8c\xeaV\xc0\x8c2\x18c\
+\x10c(\x8dM\x8eZJ\x22\xdc\xb0B\xc4[\x08\xa6\
+\xb4\xab\x09\xd3F\xdal<\xeb(\x16\x8ewA\x04\xa3\
+\xe2\xb9\x07:\xcb\xb9\xf4\xa2\x8b\xd0\x13\xa42\xd2~J\
+\xa5\x1d\xe3{\xfa\x10m\x7fk\x1bt\xa4\xb0\xbf\x95\x02\
+-\xf6\xe0T\xa5\xdc\xd4\xab\xae =\xed8\xc61E\
+\x87\xc3\xf6\x9b%\x0f\xdfy?\x99\xb6\x1bu\x15:$\
+x\xb1\x11\x93q-<s\xf3\x0a\xadrZ\xcd\x9c\x97\
+\x9ex\x9e\xdd\xb7\xdf\x85\xfb\xef\xbe'\xec}\x00G\x97\
+i\xe6Y'TQ\xe2r<T\xc7Q<\xe1$)\
+\xbd\x82\x90\x13\xef\xf9w\x0f\x04\xcb\xda\xf5\xcf)\xd0\x90\
+?\xc3\xcf\x09= !*\xc9o/W\xa1\x0d\xf1\x02\
+\xc974h\x1c\xfa/\xd9\x07\xfdV~\x03.!\xa7\
+\xbd\x1e\xd2\x83\x05\xb3\xd2\x11U\xe8\x88\x05\xc6\xb8\x0e\xc7\
+\x15\xb0\xb8F\x99\x8e\x9dI\x08$d\xf5u\xfdP^\
+\xd0(\xdcq\xd3\x11\xa1\x15'MM\xab\xc4~\x80\x88\
+\x09f1\x0a\xc6\xbbv\xf7\x98\xce|\xe7\x0deYp\
+\xf3\xf57+\xbb\xb4f\x9f\xdb\xea3\x9f\xae\x9a\xcc\xe9\
+\xa0\xd6-\x8b:b\xc5\xf7Q\xfa\xe1\x1a0\x08u\xb8\
+\xebZ\xf3\xea+\xaf\xa4\xd1j\x92\x0eWY\x8e\xb1\xcc\
+\x87\xb6\xe1\x1dk\xadJ\xaf\xe74>N[;\x8dn\
+\xe7\xce\x16p\xef\xe5\xf7}2\x02\x85\x18\x8a\xb2\xb4\x9a\
+\xd8\xc3k\xb0B\xc0\x0b\x07CP\x06a\x0aSZ&\
+\x94RXm\xa3\x0d\x99\xf9\xe1m)\xba\xe3\xc1\xd2\xb1\
+\xbb\xe23\xae\xbd\xfc\xcf\xd1r\xab\xe1\xd18K\xc2\xe6\
+6Pq\xd5Fbv\x1e\x9b+\xd2M\x99|bY\
+\xa3\xb0\x89-\x5c\xb2\xcb\x14\xbf\xe9\xf8(\xe1\xe0\xbd\x0e\
+\xe0\xc1\x7f\xdf\xadZ\xcdV\xb8i\x17\xfd\xec\x9c\x1fH\
+D\xb4\xc5m\xa6\x14Z)r\xc9@\x0b\xed<\xe3\x80\
+=\xf7RO=\xfeDm|\xbdR\xf3M;?\x86\
+;z^\xf0x\xb3BM\x94 \xda\xc6\xaf\x18\x97D\
+\xc7\xd7\xf4\x87\xd4\x18\x01\xd1\xd8X[?\xb5t\xf3\x1c\
+\xcf\x1b!\x1d\x8d\x1f\x0b\xe2\xb8\xc4D\xac\xaa\xa2k}\
+h\xf9\xa0MM\x83\x05\x80\x1b\x0c\xa3\xec\x1a\xaa?\x13\
+\xc0\xdd\xb4\x1d\x12\xe5\xa4\xbb\xd8\x0du\xca\x84Y\x82Q\
+\xc9\x88\x1b+\x08\x8c\x16[\xd7\x0d\x9d\xd7\xf8>v\xc6\
+:}t\xd4\x92&f\x12\xb6\x12\xd4\x87\xac\x80xi\
+VgN\xffJ+\xad\xc2-\xffiJE\xa6l&\
+\x18{8\x87\xa6\xd9\xd4<\xfa\xd0\x7fxs\xce|2\
+4\xca\x18\xa6N\x99\xca\xbb7zg\xe4\xc9\x9a\xa6\x99\
+P\x10,\xae\x0c\x10\x12}\xdf\xeb\xc2\x0cX\xb8p>\
+\xf7\xdd\xf9\x80\x0d[EP\x99\xa6,\xa1\xdb\xe9\xb0\xe1\
+\x17wd\xfcM\x10\xe7\xb0\x13c\x99\x1c\xaa\x82\xd5N\
+=\x1c\xd7K\xc4\xa4\x95\xe3\x16\xe1\xa5\xd8qI\x9d]\
+\xbe]\xfb\xdd&t\x95\xd2\x12yY\xd8\xe9@V\x0a\
+\xeb\xef\xb4'\xe3\xe9\x83\xca\x9et<\xef\xd5\xd7y\xee\
+\x99g\x09s\xae\x0a\x83F%j\xdc\xd4\xc2(\x09\xb0\
+\x89\xe8 D\xc5\xe7\xa5t\x8f\x1be\x9c2\x95\xfe)\
+\x9f\xfb\xfe\xfbs\xce\xe1\xa1{\xee\xa3\x9d7@\xe7\x80\
+\xc2\xb8Pe\xad@\x9b\x12St\xe9\x16\xe3\xf4z\x1d\
+\xa4\xf4!\xe2>\xaeA\x91\x93\xa3M\xc6p6\xcc!\
+\xfb\xedGg\xd1Xh_\x04\x8cvp\x8a\xf7\xebh\
+'\x5c\x9d\xe2s)\xc3\x95\x13\x0e\xde\xf2\xb4J]\x12\
+A\xe2\xc4\x99\xb8\xd4\x88\xca\xc4U&\xef\xadr\xc8R\
+\xa2\xa2O\x07\x85(\x15\x84\xbc\xcf\x14c\xe2~7{\
+O\xe3,\xf9~G\xc0\x84\xa1\xc0A +kG\x1a\
+\xe5%\xa8\xbb\x86Mm\x9d\x12\xac\xd5\xee\xaa\x96\x95G\
+A\x90x^Bx\x02\x8c\xd20\xe4\x0c\x10k\x0e\xda\
+@>+\xe9%\x95\x98\xc1S\xa6PZb\x10OT\
+ (L<\xc4\x13\xcd\x9c7^\xe7\xc1\x07\x1e\xe0\xdf\
+\xff\xfc;\xaf\xbe\xf0\x22Y\xa3\x8d\x98\x12\x8d\xe2\xc9G\
+\x9e\xe4\xa4_\xfc\x9a\xa1f\xcb\xf6\xcd\xc0\x07\xff\xfb\xbd\
+\xb4Z-\xdb\x06\x84C%\xfbL\xff\xd0\xe9\xda\xefz\
+\x11\x92\xfd\x06\x9e\x19\xc4\xf5\xcfT\x97\x9bk\x82\xe2\x8e\
+\xdb\xfemMS\x01\x9d{+\xa8\xa0\xb5\xcc\xaa,\xb3\
+\xce\xfa\x94\x0b$\x98\x81eM\xd9\x06\xa2\xf1\xb4\xe1R\
+|W\x0f\xdd\xb0\xc0)oJ:\x89l|\xc8\xaf\x86\
+\xc2\x1d^\xa2]\x96fS\x0a\xfe \xdd^\x09+\xac\
+\xbb6j\xe9u0\xf3\x9f\xc1\x9e\xeck\x1dn\xa2\xe0\
+\xee;\xefb\xc5UW\x19 \x00]\xa7\xeb\x0c\x1c<\
+\x80\x09\xb1&\x19n=\xe3\xa4\xb8J\x13\x91\x02\xbc\xf2\
+\xd2\xcb\x9ct\xcc\xb1LiN\xc2(K\xe2:k\xd8\
+\x84\x9fE\x87\xb1^\x8f\xe6\xca\xeb\xd3^v\x0d\x1aC\
+S\x00\xe8\xbd\xfa8\xddg\x1f\x043N\xa6\x9b\x01o\
+\x19\xf6\x9dcs\xc7\xf8\xe9\x0f\x8f\xe2\xa8\x9f\xff,\xfa\
+#\x9c\x92J\x13\xf1\xf8$\xba\x18+\x10\xbcb\x0c\xb3\
+\xd7\x90B\xcf\xa9\xb3d~-iLs0\xeb\xed\x0f\
+\x13\xf0\x12Q\x14\xf8 >m'\xc5B\x98\xee\xa9d\
+\xda1\x886'\xce\x0a\xec\xde\xa6*\x8c\xe7\xc7-\x19\
+\xbc\x1a\xc0J\x84xr\x89\xbb,\xb5\xba\x03_\xe9(\
+O\xc5\xc3?\xc4s\x8e/\xde\xec\xc2%T\xf4\x0c\xe5\
+\xda\x0f^z\xec&\x8f\x9b\xae\xff\x8b\x5c~\xf1\xc5\xea\
+\xa1{\xef\xc3tz4\xf2\x16\x0d\xddt\xe9\x9f-\x8c\
+o\xbc<\x9bW_\x99M\x96eN\xdb\x94|x\x93\
+\x8f\x86v\xd3\x8cg)~\x22\xc1*\x8f\xb0\x04\x0f\xf5\
+\xef\x03\xb6mHD\xe3@\xe6w\xd7\xee\xbf\xe3\xdf\xd2\
+h6\xad\xa2.\x05\x94\xa1W\x8c\xb3\xfc\xfb>N\x86\
+]\xb3\x07\xaf\xdc\xab\x5cf\xdc\xceG\x9f\xe97M\xf1\
+]:A\xaaQ\x94\xa5\xd8\xa9\xa2\xb2\xfd\xd1JaJ\
+\x03*\xc6\xfd\x07m\xec\xe6\xbb\x05\x12\x1c\x86\x8d\x1cV\
+\xfa\xef\xady\xe9\x8a_\xd3nf\xa1\x9d\xa6np\xeb\
+-7\xf2\xd9\xcfo\x8f\xb83\x1eb_\x07\x10CJ\
+[\xe9\xb5\xca\xfd\xe4\x9a\xd8~\xa79f2\x05\xa7\x9d\
+p<#\xf90\xa5\xca\xd1Z\xdb4\xdd\x08\xdd\xee(\
+\xea\x1dk\xf0\x81\x03\x7f@s\xc6r6'\xa0Vt\
+\xbaB\xb7\xdbcl\xf6<^\xb9\xf1\x0f\xcc\xbd\xf5\x22\
+\x86\xda\xc3\x94>G\x02 \x99\xe6\xa6k\xaee\x8f\x03\
+f\xb1\xda\xea\xab&4\xe0}d\xca\x0a-G\x13j\
+\x00\x8d\x8a\xf2\x9fi0\xb0\xb8\xe9\x0d\x91\x9e\x92u\xc8\
+\x90\x88\xc8?\xe1\xdf\x97\xd6\xc5\xa7\xec\x8fi\xe6<\x7f\
+V\x83\xf9\xfa\x0d\xfe\x89\x93\x82\xfa\xb9}\xfd\x9e\x93\xd2\
+*\x91Ni\x12O\xa9|&Z\xbf2\x80\x92\x08\x19\
+\xd7h\xf8*\xb1\xae\xaa\xfd\xf6\xcc\x9e\xb6\xe9;\x1a\x98\
+\xdf\xb0`\xfe\x5c\xbe\xfb\xd5os\xdf\xad\xb7\xabF3\
+'C\x935\x87B\x12\x0c\xed<\xa3F)D\xd9\x0c\
+8\xca8S4\x13\xde\xf9\xceu\x11\xf1\xbb\xd7\xadY\
+\x16\x0f\xcf \xe9O\x12G<\x90\xf1\xfb~TqL\
+\xf2,T\x9fw\x8f\xbd\xf0\xc2\xcbJ+?\xc4\xd6\x94\
+,\xbbc,\xb7\xd1\xc60f5\x8dM\x22\xab\xc23\
+v\x06T\x158\xc1P\x12\xeb\x04\xb4\xa7\xfbJ\xf0\xa3\
+\x18m\xcd\x04\x9d\xd9U\x10\x15r\x06\xd8'\xb5\xd2\xf1\
+\x10\x0c\x1d\x9d\xdd\xca@o\x14V\xf9\xc8{y\xeer\
+\xcb\x8d%B&\x82\xd69\xf7\xdfz?R\x16\xa2\xb2\
+,\x9a\x90u<V\xd0SW,*\xd2@\x8aN\xa7\
+\x18\xfc\x19\x8f\xb6\x9a\xe1\xd9g\x9f\xe3\xa6?_\xcb\xf0\
+\xd0\x14;\xd6*\xa7P@\xb7\x83^~\x0d\xb6:\xe1\
+<\xcc\xa2\x8cV\xa3A\xd6\x88\xaf\xef\x01\xa3\xcbLc\
+\xea\x0a\x87\xf0\xe2\xaa\xeb\xf0\xfc\x85?\xa052l\xa7\
+\xc0N\xa9d\xaa\xc1\x1f\x7f\x7f\x11G|\xeb\x1b\x0e\xf6\
+\x08\xabe\x99\x84I\xe3\xc5\xa8\xb2\x93\xa0\x05I\xfaR\
+\xe1\xb2\x8arqB\xbd\xba~\xdb\xc7+\x81\xeb*\xd6\
+\xf4 \xba[\xd2)@\xc2\xa4\x83KM\xd2H\xe5V\
+\xbfj[\x9c\x06\x95\xf4b\xda\x065\x8dX{I\xe8\
+|*'\x0c/\xbf\xf4\x22\xb3\xf6\xd8\x9d\xd17\x16\xd2\
+h6]\x90\x87\xf5\xf6j\x15%\xa0R\x0a-B\xa9\
+u\xc8\xf5\x8f\x08\xbaT\xfc\xf0\x9b\xdf\xe6\x97'\x9f\xc0\
+\xd0\xd0d+\x04D#~\x89\xcc\xbd\xcb\xca\xa3x6\
+R\x18\x86\xb4\x1b\xaaz!\xd0\xed\x80\xf1\x1e\x88\x1f\x05\
+\xcf?\xf7\xbc\xdd\xed\x17LB\x05\xd2`\xc6\x9a+S\
+\x14v\xb0\xc5y\x85\x95@!\x12\xe5\xb17;\x83\x89\
+,`L\x85\x16\xed\xc6(\x09\x09KK\xb1\xce$%\
+\xfe\xb8,\x97=\xd7\x8d\x95w-\x18\xdf8 \x850\
+}\xf5\xb5 kc0d\xa1\xa3\x8a\xdex\xc1\x11\x07\
+\x1d\xa6f,;\x05\xa5s\x941tz\x86\xd2\xf40\
+\xc6`LI\xafWP\xf6z\xf8\xf34{\xdd\x92\xd2\
+\x8c\xd3\xed\x81H\x8f^\xb7\x04SP\x94\xd6wS\x1a\
+\x03\xa6\x8b\xd8\xa8\x03\x84\x02\x05\x14\x9d\x82\xd9\xaf\xcfa\
+\xa85\x82\xd1Vs\x1b\x00S2\xdf\x8c\xb3\xf3oN\
+FI\x1b5\xec\xfa\xee\xc6]\x01M\x81\xf6H\x83\xc9\
+\x93\x9bL\xf9\xecv,z\xe11\xde\xbc\xe5\x02\x1am\
+\x1bx\xa5\x8c]\xd9\xb8\xf5\xef7s\xf87\xbf\xd1?\
+\xa3A\x08\xe7\xa0Wdo\xf2\xbb\xce\x932\xe0Z\x9d\
+\x9f\x06W\xea/\xa1J\xaaT\x93\xe7\xfa\x88\xcc\x96\xb7\
+\xb4\x00\xfa\x00O\xb5\xf2\xa0\x9bui\xd5W/5\x99\
+\x13\xf1\xe9K\xe5=\x894\xab\x08$\xc7\xfcB\xdc\x22\
+\xaa`l\xb4\xc3\xc1\xfb\xec\xc5\xe8\x1b\x8b\xc8t\x0e*\
+\xb3\xc4k\x8c\xdf)o\xe7\xb6\xc1zI\xac6#h\
+{\xbc\x0dO?\xf0\x18_\xda{\x17\xce<\xef\x12\xb2\
+\xbc\x85R\xd6\x12\xf0\xe6f\x80 \xfc\x96\x90\xb7?\xa4\
+?\xf4\xf9\x08\x8c5\x14\x82)\xe7\xdfW\xe3\xfcp\x98\
+l\x82.\xad\x0co\xce\x9dm\xe7\x98\xa5\xc6\xa7\x8bV\
+\xf90CC\xd3\xac\xe7_T\xc0\xaa5l\x92\xf10\
+\xd5\x910\x8e\xb9\xc5#/-\x92\x8c\x8e\x0b\x014\xa2\
+hhk\x07\x99\xb2$\xcf\xb2(\xb3Kk-\x88\x83\
+}h\xf2\x10\xcd\x99\xef\x80\xf9\xaf`m'\x05\xa2h\
+d\x19\xf7\xdf~7\xc6\x94\x94\x06\xa4\xeaR\xb6{\xf0\
+\x93<\xf8F\x09:\xb0\xae;\x02\xcc!D\xa9\xe0\x12\
+C\x5cT\xa7\xc6:\xe3\x1adH\xa6id\x0d\xbb\xc3\
+\xcb\x8e\x0a%\x05\xe3\xdd\xf9\xac\xf5\x99=\x18\x9e\xbe4\
+cs\x22I\x85\xf1P\xce\x98+\xa1\x890ur\xc6\
+\xfa\xbb\x1e\xc0M\xb7^J\xc3\x1d\xfa\x82\x12\xb4Q\xbc\
+\xf0\xfc\xb3\xbc9\xe7u\xa6\xcfXz\x00_\xa6\x08\x1f\
+`\x12\x0e\xba\xe7\xf9 \xb5tS\x012\x88q\xfb\xa5\
+O\x95_e@\xa5\x09\xe4\xc7\xe08\x00\xdf@\xdf\xcb\
+U\xb5O\xber\xfa=<\x97|V HzUO\
+'\xeep\xe4\x1d\xd6\xa6~c\x02)&b\xb5\xf3\x0f\
+\xbf\xf9u\x99\xfb\xf2\x5cTf\x8f\xe6\xd2Y\x03\xe3\xcc\
+\xfe\x9e\x94,\xect\x19+a\x11\x0d\xc6z6\xc3\xaf\
+\x16\xef\xe0J\xb3\x05+^z\xf8E~r\xd4wm\
+\x04\x5c\xb2|\xe2\xf7\x17x\xe1\x83U\xaaq\x1f\xb9\xc2\
+\xad2\x10\xd6\xb3\xbd\x9bFc\xeb\xf9umo\xe9#\
+n\xdd;s\x9f\xeeo\xfe\xbcy\x22\x1d\x03\xc6%\xae\
+p\xcb\x9a\x8dv\x8b\xbc=\x14\xc2w=\x0a\x8d[\xc0\
+\xf7\xc1:\xe1\x9e\x03X\xbb\xf0\xdf\xcan\x1c\xe7n\x0e\
+u\x8d;(\xd4\xc1k\xc4\xa5\xeeVN\xf3\x0a\xeeD\
+%\xebS0\xa5\x0d%\xce2\xa1\xbd\xcc\x0c\xbb\xc3B\
+)\xb7\x94\xa50\xda\xa62\xcb2w\x94Z\xde\xb2y\
+\x06\xf3\x06y\xa3A\xa39D\xa3\xd1\xa4\xd1\x1c\xa6\xd1\
+\x1a\xa2\xd9\x1a&o\xb5\xc8[C\xf6~\xd6\xa2\xd1h\
+\xd3\xcc\x9b4\xb2\x16y6D\x9e\x0d\xd9\xeb\xf9\x10Y\
+>DC\x0f\x83n\x91\xd1\xb0V\x06y8\xf4C\x8b\
+\xd05\x0bY\xe3\xe3\x9b\xb3h\x9ee\xf2df\x13\xe2\
+%\xca\xc2\x8a\x9c\xd2\x80t\x85\x99\xcb\xcfd\xea:\x1b\
+S\x16\x05\xe1\x88:\x95\x91\xeb\x16\x8f>\xfc\x04\x81\x17\
+*4\x99\xac\xb5{\xdaN\xa7\x0a\xe1B\x1f\x13%\xc4\
+<\x80q\xeb\xfe\x92z\x0c\x84\x1aP\x07!$\xbe\x08\
+M\xbe-\x1f@\xcd\xc9V\x87\xbfn\xd6\x84OOM\
+\xc9g_%\xf7=\xad\xef\x98J\x80\xb1\xd1\x05\x0c\x0f\
+O\x01$2\x9a\xefx\xa2\xfd\xc5\x81\xa94\xdc|\xd3\
+\xdf\xf9\xc7M\x7fSC\xad)h\x9d!n\xb3\x8fR\
+0\xda\xeb1\xb4\xce\xff\xf0\x8eU\xdfIk\xfa4\x00\
+z\xe3=:\xcf?\xca\xc2G\xff\x05\xf3_\xa6\x112\
+\xdfX\x8c5\xf367^~5\x9f\xddv\x076~\
+\xdf\xfb\x22\xec\x0a\x8c\x18\xca\xb2d\xd1\xc2q\xba\x9d1\
+\xc6\xc6\xc6\x19\x1b\x1b'\xd3\x8a\xb1\xd11\xba\xdd\x82\xd1\
+\xb11\xc6G\x17b\x8cbl|\x94y\xb3\xe7\xc8\x82\
+\xf9o\xaaE\x0b\x160:6F\xb73N\xaf\xd3\xa3\
+\xd7\xed\xd1\xe9t(U\x89\xca\x05\xd5\xb3\x096\xba\xe3\
+]f\xcf~SIQ\xa2\x1b\x8d\x90\xc968Yu\
+\x5cF\xf5\xcc\xaf\x95\xf5\x16\xd7\xcfF\xb0\xf8r\xcf9\
+3\xc6\x98\x98nEU\xa2\x5c$\xc4~\xf8\xc3`\xb5\
+\x80h\xeb\xf7)E\xc8\x9c0\x10\xb1\xc14\xe2,\x8b\
+\xbc5BGJ\x94n\x10\xbcr\xc6z\xd2K4\xd9\
+ \xa5R\x01\xd2\xc2\xa5\x95\xb6\x81I\xbe\xb2\x81\xaa\x83\
+\xb3J\x8f\x99\xf2\x8b\x17\xb9#\x08\xffz\x9b\x144+\
+\x14#\xcb/O^\xda}\x0b\xa5\xa3\x1fo%{\x1a\
++M\xb2\xc90\x83\xa5VY\x9fW\x1e\xb9\x9d\xac\xd9\
+\x0a\x87\x89(-\xcc\x99\xfdz\x05\xe6\x08\x8f\x89\xbf\xc3\
+'\x91\xd6=S\xfae\xbb\xc0\x13\xaa\xca7I\xdf,\
+0~\xb1\x1c*I'*<_7Gj|;A\
+\x99\xd8\x070\xe8\xc7\xa0p\xdct\x8d\x03o\x8fO\x04\
+\xd4\x80\xef\x89\xb3\xd13\xec^;\xef\xc4N\xbb\xec\xc6\
+v;\xec\x14\xd6\xb7\x01k\x02:i\x10|\x10\xcaj\
+\xc53N:\x91\xe1\xf6d\xc8\xeca\x17\x99\xe4\x08\x86\
+E\xa3\xa3\xac\xb5\xc7\x0fX\xf9\xc3\x9b\xd2n\xe6\xe4M\
+\xbb\xc4c\x10\x16\x8d\x8d\xf1\xc6S\xcf\xf3\xd25\x17\xb0\
+\xf0\x9e?\xdb\xf4W\xee\xb0\x0c\x04&\xb7\x97\xe2\x87G\
+|\x9b\x15\xd7Z\x85\xb1E\xa3\x8c\x8f\x8d\xd1\xebtX\
+\xb8p!\x9d\x85v\xfdX\xb9i\x83\x18\xc3ho\xcc\
+j!g\xf9(\x97d3C\xa1\x95\xb6\x13\x89L\x07\
+\x5c\xd9\x03A$\x1c\xac\xa9T\x16\xccx+\x062\x94\
+n\xe1}\x13\xde\xd2\xf3'\xe3\x06\xd7\x85\xdb!\x93*\
+\x8b0\xa3\x90\xb8W\xc1\xb8\x13><\xc3Je\xec\xa2\
+\x96R\xfe9\xab\xe6]\xd2\x04g\xc7(\xeb8\x14g\
+\xb5\x88x@\x14R\x8c\x07G\x89\xef;\xa2\xc8\x87\xdb\
+6_\xa0\xe9 bPYN#\xcb)D;\xc1\x05\
+\x13'\xad\xb2\xa5\xd5\xb2G\x97gz\x88V;Cg\
+\x19\xcd\xbcI\xb3i\x8f^\x07{^\xe3\x9d\xb7\xdd\x11\
+\x9e1\xce\x1fR\xd2C\xc6\x0d\x8c\x80\xf4\xecT\xc2w\
+\x9d\xd2\x91\xa0\xebC\x89\xb5h\xb4\x11D\xb9]\x97\xb8\
+\xdd\x95\xa5r>\x11\xa7(\x02?\xd4\x14\x9c\x13\xd6\xd5\
+\x92Z\xbb\xa9\x06\xf5\xb7\xd3g]\x9bq\xbd1yG\
+\x8a\xa7T0\xa4\xe6Hb}T\x84\xc7\x12\xc7\x01\xa8\
+\xda\xa7\x05\xd8:\xbf\x5c\x83\x81\xff\xbc43\xc93\xde\
+\x80L\xb5~\xbd=\xaa\xdf\x1dA]q\xe9\xe5<\xfb\
+\xccK\x1c\xfb\xf3\xe3\xd9l\xcb\xad\x982ej\xac)\
+^T$M\x08<\xfc\x9f\xff\xf0\xf8#O1ix\
+\xd8vX\x83\xa1`|l\x11\xef<\xf0{\xbc\xe73\
+\xdbR\x8c\xdb\x07\xfc\x06\x17\x80f\xbb\xc9\xe4\xf7Ne\
+\xd9u\x8f\xe2\xde\x932\xe6\xff\xebO\xb4\x9aC\xce>\
+\xb7\xf3\xd0\xce\x82E<v\xe7\x03\x18)\x82\x16*E\
+\x81V\xe8\xac\xe9\xb2\xe3X\xd8\xa7\xe6C\x80\x8d\xfaR\
+\xa5U\xcfV`y\xd3\xab*\x10+\xbf2\xbbe\xd5\
+{'\xb4SK~\xf2 \xd8e\xb4\xac\x14z\xbdE\
+\x94E\x81VY\xf4\x1d\x98\x88\x94\xd4\x9d`\x1c\xce\x94\
+\x88\xb5\x1aJS\x83\x02\xe7\xbd\x86\x90\xe1')J\xab\
+`]\x80\x9d\xef+7E1\xe2\xd6\xfb5(Q\x8c\
+\x8d\xcdC\xab<\xce\xec\x0c\xf4L\xc1\xcfO8\x9e\x0d\
+6\xd8\xc0\x1e\x88\xeah%\x1c\xcd\x98\xbe0\xe8\x8f\x12\
+T\x96Pa\xe2\xb3\xc1\x05\xd7\xf8\xb0\xe6Z_\xf7\xd9\
+\xe1\x8b\xbc\xf8\xe4K$\xc6\x1c:\xd7\x8c=r\x07S\
+>\xf09\xca\xaex^\xb7q\x13\x8et\x05\xec2\xab\
+'\xd9\x0cF_y\x12\x9d\xe7\x11\x0a)\xd1Z3c\
+\xe6L*\xda>\x8c\xa6G\xa8\x1d\xb3A\x0cW\xad\x9b\
+\x0a\x0b\xc7/2\xa0N\x85\x1f+=\xae]\xf7u=\
+\x8f\xa6|\xe9a\xaa\x96\x09\xf6\x028\x86\xf7\xe6v\xc2\
+\xea^V\xa7\xd9\xf9\xacN\xa8f\x002\xc9\xf3\xbe\x03\
+1\xeb\xab\xbd\xe6]:6\x9f\x9c\xe2\xae\x7f\xdd%\xbf\
+\xfc\xf1/h\xb7\x86\xc9r\xcd\xf7\xbf\xf9MJO\xe1\
+\xe9\x5c&\xc1\x81\xd6\x9a\x1b\xaf\xb9\x96v\xbb\x85h\xed\
+\x1cn\x82\x91\x82\xc9\xeb\xbc\x8f\xf7\xef\xfcy\xba\xe3R\
+\x7f,\x94\x060i\xa4\xc9{\x0e\xf9.2}\x15\xa7\
+%\xfd\xe0\xd9\x90\xd1Lg\xe4Y\x8b<k\xa0\xddg\
+S5\xc8u\x83\x8c\x9c\xa6n\xd0\xd0M2\xdd$\xd3\
+\x0dr\xd5$\xcb[d\xba\x85\x0e\xa9\xb8s\xb4\xca\xec\
+\xa7\x9b\x17+\xdd@\xeb\x9c,\xcb\xc9u\x03\x94\xb6)\
+\xb5\xb1\xf5\x95rN\x01\xe2\x0a\x84R\x8a\xa2\xbb\x88\xb1\
+y\xafZ\x94\xa8~}\x12\x0c\xcc\xa0\xfa\x05\x94F\xbc\
+\x05\x00xG\x86\xf7\x0f\xf8Xi/G\xc4\x1f\xb7\xe4\
+Z\xb3\x1e{k\xc2\x8a\xb2\xab\x03\x94\xd6\xa9\xaa\x8cP\
+\xf6\x04\xde|\xdd.\x9bi\xbbJ \x22\xa0{\xac\xbb\
+\xeeZh\xefL\xf4\xd4\xe4\x9c ^\xa7\x09\x04\xc6\xf6\
+a\xbaN\x14\x06\xba\xb14f}\x0b\x82O\x0a\x1b?\
+\x15\xc2j\xeb\xad\x06\x94.\x1a\xd5\xb62\x94O\xe3\xde\
+?_\xc2\xd4\x99\xf6\x9d\x99\xf8\xb3\x03\x09\xfcQ\x1a\xe3\
+N\x06\x86R\x0c\xa6\xe80\xfb\x91\xdb\xc8\x1a\xcd\xc0\x05\
+\x06\x83nd\xac\xbc\xfa\x1a\xa1\xed\x88\xfb\x98\xa4\xd6\xf3\
+\x82T\xbe\xd7$\x9dg\xd6\xa0\xcf|\x18O\x9c\x1e\xa4\
+\x1c\x14\xdbO\xfcQ\x15\xf6\x8d\x96\xb1\x85\xd4\xd7\x81\x09\
+\xd9|\xa2;\xd1\xd0\xf0M\xf9\xc1\x8bM\xc6.Y\xa0\
+\xbc\x90H\x22\xfe];1\xcd\xf3\x04\xb38\x04\xe1\xf7\
+\xe7^\xc8\xc1\xfb\x1e\xa4\x1a\xcd\x16Z50Fs\xf7\
+\xbf\xeff\xf7\x1d\xb6\xe3\x99\xa7\x9f\xaa\x0a\xb9\xca\xb3\x86\
+'\x1ey\x86\x90\x9a\xca\xc1\xb1p\xd1\x9b\xbc\xff\xb0\xaf\
+0>\xc7\xc2Y\x1a\x5cLt\x15eZAC\xc1\xf0\
+p\x9b\x95>\xb1\x0b\xe3\xddE\x89\xf3\xd1\xe1B\x84\xa2\
+\xecQ\x96\xa5\x0d\x195\x16+\x22V;\x96\xc6\x1e+\
+]\x1aCiJJS\xd2+K\x9b\x80\xc3\xd8\x1d/\
+=\xc9(\x8c\xb6\xe6\xa3@Q*\x8aRQ\x9a\x8c^\
+\xa1]\x8c;6[\x8f\xb8\xd4\xe8\x8e3\xb4\x0b\xad\x15\
+l<\xb9R]\xde|\xe6\xb9J`ME6\x8a\x84\
+\xac<\xe0\xb4xYV4)X\xcd\xef\xcd\xfd\x80\x13\
+\xaf\x04\x8d\xb7\x98\xa2U`\xfcr`\x11_j\x5ch\
+\xf0\xe8\xfc7Y\xf4\xdakVp\xa0\xdc\xec\xb0d\x95\
+\xb5V\xa5\xd9j\x07\x86\x13cMl#1\x0f\x81E\
+\xa6\x15\x18\xc6$\xf9\x09\x0cn\x93\x12\xc9\xbe\x0e\x13\x84\
+\x91\xdf\xef\x80\xfb\x14\x05\x9bn\xb6\x05\x8b\xc6\xe6\xa3\x8c\
+A\xb4\x1d\xf0\xac\xd1\xe4\xf9;n\xe2\xe9[\xffA{\
+\x08T&\xc1Y\xab\x00S\x9a\x90@\xa5(\x0cCS\
+4\x8f\x5cu!\x8d\xde(\xa8\xdc\x9e\xf6\xe7\xba\xbc\xf2\
+\x1a+\xb3\xec;\x96\x89[\xa7kd\x992zT;\
+^\x01V\x0c\xd7P\xbf\xbf\x0d\xafR\xa3\xe2t\xea\x08\
+cE\xae\xab\x17\x15o\x142n\xc3\x93{.\xaa\xed\
+\xba5`\xcb\x84S\x80\xb8\xb8T\x97C\xfen\x042\
+\x8a\x86T\xe3\xc7h\xa7j\xc2\xce\xc8\xc9\x1eY\x8f=\
+\xfc\x08'\xfc\xf2x\x86\x86\x87\xd1.tS\xe9\x02\xa3\
+\x85\xa7\x9f~\x86s\xcf<I\xbe\x7f\xf4\xafT\x8c\x80\
+\x8a\xd8\x12\xe0\xf5\xd7^rk\xfc^M\x96dj\x0a\
+S\x97_\x87\xc2\xe5\xba\x13\xa8H \xe3\xd6\xf5\xbd9\
+\xd8@\x98\xb9\xde\x86<\xa7s'\xb8\xdc\xce6cX\
+\xff\xbf>\xc8\xa7\xb7\xdd\x9a\xa2\xb0&[\xae\x15\xe1\xcc\
+\x07\xef\x93\xa8\x99\xb4\xf6\xb7\x04X}\x1c\x8c\xces\xb2\
+\x86\xa6\x997\x00M\xbb\xd5\xa2\xd9n\xa2\xb2&\x8d\x86\
+\xa6\xd1p\xd1kZ\x93e\x19\xdf;\xec+<\xf5\xd8\
+sA\xda\x8b24t\x9b\x17\xee\xbe\x875\xde\xff!\
+F{\x83\xb3!{=R\x18\xe3v\xde\xe9\xbeC@\
+\xeaF\xa6\x92t$}\x9e|\x1b\xd1&J\xa1\xfc\x8e\
+*'\x07\xec\x96\x0f\x83\xca2\xde|\xfc\x01t\xde\xf5\
+s\x03\x94\xb1\xf4\xb1\xcc\xb2\xcb\x05\xa1T)\xf5\x9fK\
+\xe0\xb0\xea\xeb\xe4\x80\xfb\xef\xdex#\xa6.5\x95\xa2\
+cP.8J\x89b\xda\xa4\xe5\xf8\xd37g\xf1\xa5\
+\xab\xfeJ!Kc:\x84\xf9\xbf\xd6\x9a\xa2gC\xb2\
+'/\xa3y\xe9\xde;y\xe4w\xc7\xd0\x1a\x99\x1a\xb1\
+!Pb\xf8\xf8'\xb7&F\xea\xf5\x1b\xa51\x0e6\
+\xe5\x19qu=CW\x191\xdaY\xd1:N\xd3\xde\
+\xfb\x12S\x8b\xa7\x1e\x13\xe9\xfb\xdf+\xe5\x90\xf3\xc2\x89\
+\x8cA\x13\x92\x09\xb2\x02{\x80\x07\xdd\xab\x92[\xda9\
+\xef\x98\xb3\xa1\x8e\xaa\x82\x8c4g\xa9Or\xec\xdbY\
+{\xbd\xf58\xefO\x17\xf1\xad\xaf|\x877^\xb5\x1e\
+V\x9d\x09\xdd\x8e\xe1\xe0C\x0fg\xe7\xbd\xf6\x88;x\
+\xa1\x8f\x10\xc6\xc6\xc7\xad\xe9\x08\x96*K\x83\x1a\xceQ\
+yn\xdd\xbe\x03\x8a_\xaf\xd7\xc9\x14]\x8fL\x81F\
+\xc31nf%\xaf)\xd9\xe0\xbd\x1b\xb0\xd9'>\x86\
+\x9b\xa9\x04\xa1\x06\x04\x87Z\x0c\xd5\x8e\xd1\x8f\x95\x19\xaa\
+'F\xbc\xa9\xeb\xea\x18\x09\xda\xbd\x02\x1f6\xce\xfc}\
+\xff\xfda\x1e{\xe8I\xb2<\x0f\x9b9\x1a\xed\x16\xaf\
+\xdf\xfd\x17D}\x89\xcc\xc7\xf7+\x92\xfd\x1b\xd6|\x17\
+1\xd6K\x0f\x881!qG\x18;\x07\xbb\x16I\x0e\
+r\xae\xae\xd3\xa7\xf8BUOE\xf2\x0e\xd9\xf6T\xc5\
+#\xd7_\xc3P6\x03k\x16\xd8\x11/L\xc1\x06\xef\
+~We\xbcR5\xf0\xff\xbc\x08L\x9a<\x95\xcd>\
+\xb3\x85\x5c{\xc9\xd5J\xab&8\xe6Eg,U4\
+8s\xa7m\xd8\xf6\xe7'0c\xbd\x8d\x19\x1f\x13\xf2\
+\x9e\xb5V\x86r\xcd\xa27_\xe7\xee\xd3\xcf\xe6\xc9\xab\
+\xceb\xf2\xf0Rt\xb5uJh\x04\xa3\x0cJ\x0b\x9f\
+\xdbn\x1b*\xabQ)\x8e\x12m\x5c\xede\xb4\x9a\xd3\
+\xba\xf1Z={\xf6\xc4\xb2.rfj_\xd4y\x12\
+\xa8)\xe5\x89\xda[\xcc\xe9\xc0\xb50\xde\xda\x8b\xebP\
+\x85\xed\x9c^\x03za\xe0\x99\xc1\xabHI$`h\
+NX}\x8dU9\xef\xd23\xd9e\x9b=\x983w\
+6\xe3c\x1d\xbeq\xd4Q\xf2\xe9\xcfn\xa1&\x8c-\
+r\xefn\xe4\x8d@\xa0\xbe\x9a\x19\x9fOw\xee\x1b\xb4\
+ZKW\xe2\xc5\xfd\xb2a\xd2M\x94\xb1\x1b\xc6T\xd9\
+\xa1\xec\x8e!m\x97'N\x14\x9d\xb2\xcbRKM\x0e\
+\xf0\x8a\xc7\x8dr/W\x89\x8d\x942}\xb4\xfcl\xd1\
+\xe2\x9e\x93\x0a\x9cv\x03\x99\x8f\x07\x8f\xcf\xfa\x1a\x1f\xda\
+\xe4c\x9cu\xd2\x99\x0c5r\x0c.\xbb\xbbj\xb0\xe8\
+\xf9Gy\xf5\xf9\xe7\x996m\xa5D\xb0\x84&\xdd\x96\
+q\xbba\xcb\xa3\xdehe\xe7B.\xd2\xcf\x17\xe3\xc1\
+s\x9d\x0c\x9aF9\x97\xafX\x9cy\x02\xd7\xda\xee\x11\
+)\x8dAe\x8ar|\x94\x17o\xbd\x8e)C#\x88\
+)l\x8e\xc5\xc2`4\xac\xbe\xd6\x9a\xae?\xc4\xcf\xc4\
+\xbd0\xf1\xec\xf4\xffVD`\xefY\x07\xa9k\xae\xbc\
+\x12\x0a\xdbW\x11+\x94T\xd6d\xd2\x82q\xae\xd8g\
+'\xa6-\xbf\x16\xc3\x1b~\x88\xf6\xd4\xe5Y\xf8\xe6k\
+,|\xfa_\x8c\xbd\xf0(\xb9\xc9\x19\xce\x97\xa2\xac0\
+\xaf\x9d\xe2\xed\xbc\xcfnL\x9d\xb6T\x12fMU\xb8\
+%\x1bv\xfc\xcd>\xb2u\xf7\xd3U,\xd2\xef\x9eM\
+\xea\xe6YR\x12\xb6\xa9\xe0\xf2\xffR&\xc6\x7f\xba\xdf\
+Y\x1cDa\xf1\x9dJ\xc7\x13\xab>\x02\x9d\x02\x95~\
+\xaf\x03\xeamUQ\xff\x1fwo\x1dnWq5\xfe\
+\x7ff\xf6>z\xef\x8d\x13,\x04I\x83&P\x9c\xe0\
+\xee.\xa5\xb8\xbbS(V\xa1P\x9c I\x08\x10(\
+^\xdc\x8a\x14\xb7\x02\x85`!\x14m\x91@\xb0\x00I\
+Hr\xfd\x9c=\xf3\xfbcf\xf6\x9e\xbd\xcf>7\x81\
+\xb7\xef\xf3>\xdf\xdf\xf0\x84\xbb\xcf\x96\x915\xcbf\xcd\
+Zk(\x14J\x5cp\xc5\xf9t\xfc8\x97\x15W\x1d\
+\xcd\xb6\x19\xe2\xd7\xa4\xec6\xf1\xdf\x85\x17^\x9c\xb4\xf2\
+%\x81\x1a_\xbf\xf96\x85\x8a\xdd\xae\xc2\x10\xbap\x7f\
+\xad\xd7\xa6\x91\x0eP(\xc1\x9c\x8f\xdf6\x11w\xd6\xe2\
+\x16\xa9\x88\xba\x8a\x186|I+\xadE\xbc\x13\x11\xc7\
+\x1e\xa8\x84\xf0r\xb3\xb5\xf8\xf00\x9c2\xfe\x1d\x8fM\
+%\x01;\xb1\xbb\xb8eV#F\x8e`\xe0\xe0\xc1\x10\
+\xb9\xd5\xa21\x14\x95\x8a\x927n\xb8\x86\xfe\x83L\xf0\
+\x0e\x96\xc9\xc5 \x8fCpe|H'\x9a\xd8\xa8\xe8\
+\xd6\xffZ'\xab\xc3\x5c[\x8du\x09F\xe9x[M\
+E\xda8\x05Ih\xe9'\xf9\xf0\xb1\x07(\x1a\x8b \
+R\x07\x04nb\xa2\x1a\xbf\x5cs\x9dx\x7f\xc2\x08\xce\
+D\x11]\x10\x9c\xf5Q\xca7leQMk\xbb\xc6\
+\xd6\xd0\x7f\xe0 \x8e=\xe5dzju\x1bkov\
+X4\x1a\x1d\x14h\xa9\x0c\xa46\xeb;f=s\x1f\
+_\xdcw9s\x9f\xbd\x131}:\x15\xfa\x11\x86\xad\
+D\x18X\x07v\xc7\x04-\x18\xbc\xc8`\xf6?\xf4\xc8\
+\x98V\xb5\xd7\xc1xe\xe5/\xf2S\x9d\xf3\x07#\x92\
+\xdf)J\xf7>k\xe6\x86\x1f\xe3M\x86\xd1d\xdd\x8f\
+s\xea\xcc\xbdG_\x9e\x801\x8b\xc1-\x10\x13b\x85\
+4q7t\xd6\xae\xc7\xe3N:\xb5@\xe4\x03\xc8\x0d\
+\x02\x181r\x19v\xd9k[\x8e=\xe1\xd88\x99\xa7\
+\xbf\xd9\xe1\xad\xf4\xe3\xce\x8f^m%\xe3\xd8\xa2\x8c_\
+\xbc\x94\x82\x96r?\xa6\xdct)a\xaby/\xc0\x10\
+\xbdMK\x80\xa8\x9b\xbd\xdd\xc0\xd6\xa3\xc2\x0e>\xba\xfb\
+jJ\x85\x018?^\x81\xa2Ww\xb3\xd4\x88%l\
+W\x0d\xa0\xe3\xf5\x88'\xd9\xdcv[\x9c\x93\xcf\x12p\
+\x9c\x99X\xbb\xf7t\x12s\xaf\x9dS\x9e\x8e\x918\xa9\
+\xcb\x8c3\x0c\x036\xd9v+\xadtd\x18\x9b\x9d\x86\
+\xb0T\xe5\xbbW\xee\xe7\x9b\x8f\xffCX\x80@\xa6\x15\
+A'\xe1\x0dq\xeb\xc6\xf9\xd7\xe9\xe3\xd9\x12\xb8z\xd6\
+l\xed\xc5\x0dHA\x16/\x03$J\xb7\xf3\xd6\xf5\xe3\
+(W\x06\xd8\xf6\x94I5.\x14\xebm>\x86j\xb9\
+$\x93\xe4\xa2\x96\xf3j\x15/\xa5<>\x9a\xa2\x97\x06\
+\xba\xf1\xfaj\xbb\x9f\xce\xa0\xec\xde\x110\xfd\x8b/\xf8\
+n\xc6l\xcb\xe9\x05\xe6\xb4`\xb7\xfdi\x0dg\x22\x80\
+B\x89R\xa1JP,\xa3D\x183M\xff@\x1b\xa1\
+ (EL\xbc\xf1&\xc20L\xb9\xb9\xa4\xd0\xd7\x1b\
+G\x9cD\xc5gq\x8e\xf8}\xefW\x85G\xbc\x22\xf9\
+\x8b\xf7\xbbA\xe9\xce\xd6\xe9\xae\x05)\xb5\xa1\x81.=\
+B\xf2\xca\x02h`\x02\x13nF\x9a\xbbdG\x8fw\
+\xdf=\xf4u\x15\x9f\xa1\xe4\x0d\xc4zGi\xe0\xd4\xb3\
+\xfe\xc0\x8a\xa3G\xa7\xde\x8e\x8d\xc5x\x80\xb6\xd7\xebm\
+\xbc\x91M\xe8`O\xc7\xd3\x1a\x19\x14\xd0\xb3\xa7\xf3\xe2\
+U\xe3\x188\x0c\x9bR\x8a\x18\xd3E`\xbb\xd1\xc7\xa0\
+o\x00\x00 \x00IDAT%\xa0eqx\xfe\x9c\
+\x0b)t\xb6\xe3\xf2' L\x16\x9d\x85\x87.\xce\xa0\
+!\x0b\xa7 \x92\x95D>\x18\x1c\x93\x92\xc4\xb8g\xe3\
+b\x12\xf1\x9c^\x196\xbar\xc4J\x11\xa0\xb5`\xf7\
+_\xef,:\xbb\xe7!\xad\xea)4\x14\x08h\xadT\
+x\xe2\xfc\xf3\xe8?4\xd9&\x941\xfe\x08\x02\xeb\xc2\
+*\x11V\xdb\xd1\xf13K\xe2Vj\x9a\xac\xc1N\xf5\
+wL\xc3\xf5\xcah<\x8d\x22\xa9e\xa8\xe0\xe5\x09W\
+R\x0e\xecf\xae\x8a\xcc\x18\xb4\xa2\xb3\xa7\x83\x1dw\xdd\
+\xdb\x86\x1d;\xc0H\x0b\x0bI\xb66G\xdc\xd9\xfb>\
+\x8c\x9d\x847U\x1au\xceDJF\xfa\xb3O>\xe4\
+\xd6\x1b\xfe\xc2\x11\x07\xec\xc3\xde\xdb\xef\xc4_'\xddD\
+\x18\xda\xb8\xfex\x9f]\x9a-@;\xce@\xab\xf8Z\
+\xa2l\xd2\x14\xb7Q\x09\x8a\x08Q\x14\x5cv\xcd$\x06\
+\x0f\x19\x1c\xc7{\xe41(\x97\x87Q\xc6\xf8\xe3\xdeH\
+\xe9S\x1e\xb1\x0b\xbcX\xdftm1!{\xcfS\xde\
+\x83\xa4\x9f\xc7\xcd\xd8\x8bL\x93)\x0e\x9a)\xcdm\x00\
+\xa9\xd2\xcc\xa1\xc1\xef\x5c\x96\x17\xba\xceg\xa64\xeel\
+\x96\x0c\x12\x06\xd2\x88j\x8d\x9f\xfb\x92`\x85Q\xa3X\
+f\xb9\x11L\xffx\xba\x85\xab@*\xa8\x96\xdb\xf8\xf4\
+\x8e\xaby\xbe\x5cf\x83#\x8e\xa0k\xb6\xa6\xdem\x1c\
+@\x84\x80R+\x08:x\xe4\xb4K\x98\xfd\xcf\xc7\x08\
+K%\x84\xb6\xebF\xa5@\xd7\xd9v\xb7]\xcc\x11\xdb\
+\xda\xdf\x04\xcd\x1dm\xbc\xa3\x90z\xe0\xackvI%\
+\x9d&\xa52\x0c\xdc\xab#;\xe2\xc5\x87/\xcd\xe6;\
+l\xab\xff\xf9\xd4\x8bB\xd8@\x97:\x8a\xa0\x10\xd2\xfd\
+\xc5\xeb\xbcp\xc3}l|\xf0n\xcc\xfaZ\x98\xe4\x1d\
+\xda\xcc\xb5K\xe4\x11\xf7UJt\x14\x19B\x8c\xdb\xd4\
+v\xaa\x12\xfb\xb3B{+@\xed\xcd\x8e\xcb\xd5\xa0)\
+UC\xbe\x9c\xf2:\xd3\x9f\xbe\x9b\xd6\xd6A\xc8(B\
+\x05\x82 RDZ\xb3\xe4/\x86\xb1\xd6\x981\xb9\xd3\
+\xef\x8a\xf3\xb6\xc8\x12~\x83\xe0\xcb\x91\x1bQ\xbd\xce[\
+\xaf\xbf\xc1sO=\xc1\x1b\xaf\xbd&>\xfbt:\xc5\
+bH!(\x10\x96L\xe8\xb7\xb6\x8eUu\xa5\xe8\xea\
+\xed\xa4\xa5\xdc\x86\x10&J\xd0\xcc\x93]\x0ei\x8d;\
+\xfbQ\xdbX\xfe\xce\x9e\x0e\xd6\xd8`C~\xfb\xbb\xdf\
+\xb2\xd0\xc2CS\xeb\xec\xac\xf2\xfb\xe3\xcco\xf5-7\
+\x5c/\x22Uc\xb7\xdd\xf6\xac/5r\xc5\xd0i\x91\
+\x89u8\x83\xef\x22;(\xa7\x19X\xc6\x10c\x82e\
+\x8dqP\x1c\x19z\xf3!i\xeb\xd7\xd9{\xf6\xfd\x1c\
+2\xf6yE\x11X\x08\x18\xf9\xde\xc7=\xcf\xe5\xa3z\
+N\xc7\xe2{~Uy\xa8\xec\x03\xc0'\x1b\xff\xfb\xe4\
+\x99\xaf\xd6ek\xc9\x22\x88\x00\xde\x9c\xfc\x0a'\x1fq\
+$m\xa5\x81&S\x90\xd5\xb6\xa4\x82\x8e\xeey\x84\x0b\
+\xff\x82Q\xfb\x1e\xc7\xe0\x95V$(\xb6\xd29s\x06\
+\x9f=\xff\x0c\xd3\x9e\xb8\x8bj\xad\x13\x19\x84\xc6M\xd5\
+\x86\x17j\xad\x08ZB\x1ex\xea\x09\xc2B\x89\x1cs\
+NC\x91\x22\xeb\xb3M\x0el<\x18h_\xd2\xf6]\
+f\xcf\x9c\xc9\x0e\x9bl\xcc\x80\xca\x10\xb4\xb4kS\x09\
+:\xaa3\xaf+`\xc3s\xaef\xf91\xab\xd3>\x0b\
+z#mUd\xeb\x8ba\xd7\xef@\xb2\xdd\x16\xaf\xfd\
+\xad\xb4\xb3\x8c\xcf\xdd7\xc7\x8b[/@\x0cS51\
+\x91\x12Q\x10\x14\x0a3y`\x9f\x1d\xa9\x96\xca\xa0j\
+\xf1\xe1G\x91\x88\xe8\xea\x9c\xc7\x85\xd7\x8cc\xcc\xba\x1b\
+\x18F*d#\x08\x16\xa4x\x13,16\x99\x7fM\
+}\x9b\x07\xef\xbd\x9b\x97\x9e\x7f\x999?\xce\xa5P\x0a\
+M\x94A`\x16s\x02\x93\xc2\xa4^\x8b\x184hQ\
+F\xaf\xb1\x82^o\xc3M\xc4\xe8U\x96\xe7\x91\x07\x1f\
+\xe1\xc9\x07\x1f\xa4k\xf6\x5c\x0aa\x18\xefbXp\x00\
+\xd0Q\xab1b\xd42\x1c|\xe4Q\xac\xbb\xc1z\x0d\
+G\xc77\x90\x9e\x80\x93\x8e>\x80\x7f\xbc\xf0\x02 \x18\
+<\xb8\x85[\xef\xfc;\x0b/6<\xe7\x0b\x9f\xd0q\
+\xaa!i\x1c\xc9\xa3\x9d\xc41\xad\x91V\x9a\xf5\xcc1\
+\x8c\xe4\x9d)o\xbe|\xc7\xbe{nz>0\x1d\x98\
+\x07\xa8&\x1a\x80\x1du\xec\xc6\xea5\xd6\x90\x22'\xdb\
+\xf9<\xd5';H\xa7\x92eu\x93D\x16\x98\x18~\
+w\x88G\xaag\xa9\xbf\xeez\xf5\xb5\xc6\xb0\xc3\x1e\xbf\
+\xe2\xa9{\x1e\xa2P\xa9\x18\xd7We\x04pK\xb9\x0d\
+\xfd\xe37L\xbd\xf4DdPA\x07!Q\xbd\x8b0\
+,\xd0\x12\x14\x916\x1b\x90\x00\xa4\xf5\xbe\xe9\xac\xf5\xf2\
+\xfb\xd3~G\xa1X\xb2\x1ep\xf9\x90\x02\x9f\xf03L\
+\xcdq\xec\x14<<\xf6%\x5c\xc6\xa5\xf93\x81\x81\x83\
+\x07s\xe2\xe9gq\xf5\xd8K\xa8\x14[AhD\x04\
+\x1aIK\xa5\x87g~\x7f$mW\xde\xca\xa2+.\
+O4\xd3\xf8\xeaH!\x88RI\xfel\x9b\xca\xed\x0f\
+[\xf5^\x1bYi\x8c|\xce\xe1\x08\xcc\x16\x98\xf0z\
+/\xa0((\x95g\xf3\xd0\xe1{Q-\x84\x88\xa8\xd7\
+\xce\xa05dF\x9a1\x9bm\xc4\x98\xf56@G\x86\
+e\x18\x17c;\xc7?\x85\x11\x08\xe8\xeah\xe7_S\
+\xa7\xf2\xe4\xe3\x0f\xf3\x8fg^b\xce\xdc\x99\x84a\x95\
+@\x04\x94\xab-\xb8E\x97V\x9a\xa8Vc\xe9\x91+\
+\xb2\xee\x86\xeb\xa9\xcd\xb6\xdcL.3b\x18\xa5bQ\
+8g\x99\xa3\x8e?\x8a}\x0f\xda\x8f\xd7_~\x99W\
+\xff9\x997_|\x89\xae\xf6\x9e8\xfa1\xac\x16\x98\
+x\xd3U,\xbb\xc2\xca\x08\xa1\xec\xe1\xa1\xe9\x92&~\
+\xa3\x19\xbe\xfb\xee4\x8a\x85\xc1hj\xcc\xf8\xf6\x07>\
+|\xff\xc3\x0c\x030B%\xe6\xdah\xd2\x1a\x81\xc3\x19\
+3+\x19k\x87w\x0f\x0f\xa7< \xc5u\xfbx\xe7\
+1\x0b\xc7\xdcsJ\xf3X\x00\x91%`w\xe9\xa9\xf6\
+\xce\x84\x1ew\x5c4\xbe\x0f4x\xc9\xa4\xea\xcd\xaaB\
+i@\x18\x8f\xd4\xec.ic\xd1\x02N:\xedt>\
+\xff\xf4\xdf|:\xf5?\x88\xa0\x10\xf3*%\x8cwT\
+\xb5\xd2j\x0c[:B\x94\xca\x16\x5c\x91\xcd\x90c\xc6\
+\xa6\xa5\xf1F[q\xd5Ql\xb2\xcdV\x96\x80\xf2\xbb\
+/S\xeb\xad\x9cU\xac\xa7fb\x09-\x89\xbcs\x8c\
+N\xb0\xa0N0\xbb\xef\xf5k^}\xe9U\xdey\xf3\
+U\x0aa1\xde6\x0cT\x81\x01\x95^\xfev\xfc\xde\
+lv\xe1\x8d\xac\xb0\xce*\xfc\xf0\xadN\xc0.M\xb2\
+S3mI[1[v\xda\x96\xf0\x9eX\xff\x04e\
+\xd7\x9e\x11P\xe9/\xe8\x9e\xf1\x09\x0f\x1cq0-=\
+\x8aH\x0a\x02\xab\x198uW\x075N\xff\xe3\x1f\x0c\
+\xf1k\x80(\xd6\xaa\xec\x8c&\x8dg\xb5c[f\xfd\
+\xf0=/>\xfb,/\xbc\xf0$o\xbc\xfa&=\xbd\
+\xbd\x84a\x05)$\xe5r\x7f\xfb\xb1q\x17\x8ezk\
+\x0c\x1c\xbc0[\xef\xb8\x03\xdb\xee\xb4\xa5^j\xa9\xe1\
+\x22\x90Z\xba\xdd\x1a\xe5\x8dYiMKk\x0b\x9bl\
+\xb5\x15\x9bn\xbd5\x97\x9c}\x0eO=\xf4\xb8\x0d\xee\
+\x81\xb6\x01\xfdX~\xc5Q\xf1\xd6i2\x87}\x14\x01\
+\xa3V^\x9a\x97\x9e\x9fB\x10jd\x102z\xd5U\
+\xedCO\xb0\x09\x8fN\xdc\xdes*F\x04\xef\x1bm\
+5/\xd1\x88xq\xbe\x07oA\xef\xefk\xbbo\xb4\
+G\x8f\xf1\xf3F#\xc0\x02\xd8\x00lG\xdd\x06\xbaN\
+<\x00S\x0e#\xb1\x98\xf0\xd4\x13+q\xcc\xaf\xbc\xc1\
+\x92s\xcf\x01\xdf\xd4#\xc0\x22\xd0\xfc\xe5\xa4\x0c\x03.\
+\x9dx\x1d'\x1fq\xac\xfa\xe4\x9d)\xb2T0\xa9_\
+\xfc=o!d\x0a\xe1\x0c\x9fL\xd6\xb9J\x1b\xe9\xf7\
+\xe1\xd4wxs\xf2\xab\xac\xba\xd6:\xb9J\xbc\x14\x8d\
+\xc0L3\xb0F\xd5.V9\xb5\x8ea\x19\xcf\xd7|\
+\xc6\xe6^\xfa\xf3\xd8\xf39b\x9f\xfd\xf9\xfe\x9b\x19f\
+\xbf=2m\x08\x02\x06T5/\x9cu0?\xec{\
+\x0a\xeb\x1f\xbe\x17\xb3\xbf\xb2\xb1\xfc\x8e\xca\x8409\xc3\
+cU_$;\x1ax\xa1\xc6\xe6\x17\xca9/\x05\x82\
+\xfe\x0b\x07\xbc\xff\xe0\x8d\xbc\x7f\xfdX\xfa\x85\x03\xa8\x0b\
+\xe3\x00\xael=&}P\x9d\xed\xf6\xd8\x89\x01\x03\x06\
+\xc7~\x1f\xce#\xd2\x19\x18\x8d2\xa5\xc0\xa6yw6\
+\x93\x1f\xbe\xfb\x9e\x17\x9f{\x86\x17\x9ey\x9a\xd7^{\
+\x0d\x84$P\x92\xa0\x10R)\x9a8\x0f\x10h%Q\
+Q\x9d\xb0e0\x9bn\xb4.\xdb\xed\xba\x03+\x8d\x1a\
+I\xb5R\xb2S\x9d,wR\xb0\xf3\x8a\xd3z\x08\x02\
+c\xa4\x94Fs\x89T\xcd\xb4a\x97\xa0\xfe\xb6jn\
+\xd1\x0a!$g\xfe\xf12\xfeT;\x91\xef\xbe\x9d\xc1\
+1']\xc6\x80A\x0b%\xf3\x8c\x85\xbd\xa5\x1fe5\
+\xb3\xd4\xb2\xc0\xd9\x0a<\x1a\x89\x83\xaft\x12\x88\x95?\
+ \x7fi\xe0{\xc3&\xa3MV\x1d\x8d*M\xbe'\
+\xa0N\xef9\xc7\xbe|\x96\x08\x8d\xea\x93YS\x92v\
+.q\xa1\x1b\x0e\xd1\x9c\x14O\xe2\xdd|Y\xaf\xe2V\
+\xa4%P\xed\x01Oi\x13#\x8e\xaf\x09\xe4i\xd5@\
+\xb1Td\xfc\x8d\x93\xe4_o\xbe\x91\x1b\xaf\xb8\x9c\xd6\
+B\x7f\x08dcN\x05\xad\xad\xc5_ mL\xbb\xd6\
+\xd8\xeb:a\xa9\xc4i'\x9d\xcc\xc4\x1bod\xc4\xb2\
+#QZ\xa6\xf9g\xdc\xb6\xce\xf4\xd1L\xb4\xb6\xc8\xa1\
+\xb2j\xb4\x97\x91\xc7\xc1\xc3\xb1G\x15\x8b\xec\xc6q\xb9\
+6\x9f{\xfa)f~k\x02\x81dd\x98\x97\x14\xce\
+mY\xd0\xaf\xa4\xf9\xf0\xe6?\xf0\xf9K\x8f\xb1\xfei\
+g2d\xc9\xe5\xe8\x98\xad\x89\x22k\xd8t\x1eQ\xb6\
+\xeb\xe9\x985\xf3Ki\xeb\x04\x1cJ\xda\x06\x05\xcc\xfd\
+\xcf\x14\x1e\xf9\xc3\x9f\xe8\x9d\xfe1\xad\xa5\x81DJ[\
+7j\x9bJL$\xb2\xfd\xad\x97_\xe3\xfe\xbbo\xe7\
+\xc3)\xffb\xd6\xecY\xb4\xb6UXm\xcd\xf5\xd8a\
+\x8f]m\xbd\x09\x13\xfej\xfa\xe7<\xff\xd43\xbc\xf8\
+\xc2\xb3\xbc\xf3\xfa\x14\x820\x80\xb0HQ\x16\x81\x00\x8a\
+\x96\x08\xec\xa1\x86\xd5\xea 6\xd8lc\xd6\xdfz+\
+\xc6\xac\xbe\xbc\x09\xdf\xb6\x0a~\x9c\xa1\xda\x9f\x9b\xbc\xe2\
+\xbd#D`\x96Jv\xcf\xb6^W\x89\xdfCVK\
+\xcf\xcc\xbbczZk\x06\x0f\x19\xc4\xb8kn5\x10\
+\xb4\x84l\xf0\xc1\xe2\xbd\xc3\x01\xad=<N*6\xfd\
+\xb7\xae\xe96\xf6\x22q\xc6O4D\xa7I\x8138\
+K\xaf\xad\xb4p\xf6\x8b\xc3\xbb<\x0f\xcf\x5c\x06\x90l\
+\x94xHkU\x8ax\xcd\xe81\x013\x14\xdf\x01R\
+$\x9d\xc4\x22i\x5c\x9b\xf6\x88A\xda\x01'\xd2>\xf9\
+\xed*N\x06\x14\xab\xcb\xde2\xda\xeb@29\x02\xf6\
+;\xf0 \xd6_\x7fc&];V\xbd\xf5\xecd)\
+\x95\xa4X,\xdb~)\x5c\x9e@\x80\xce\xde\x1eF\xad\
+\xb5\x1a\xc5\xb0\xc8;\xff|\x95\xb0X\xa2\xa6\xeb\x84\x91\
+\xe6\xb4c\x8f\xe1\xc6{\xee\xa3_\xff\xfe\x89YD$\
+\xfd\xd4\x96\x08\x04NK1\xb0r\x13\x97\x0a\xc0\xb1p\
+\x14N{\xd0\x09\xa3\xd3x\xb9\x0e|\x09\xe6]\xbe\xfa\
+\xd2\x8b\x5cx\xd6\xefii\xe9o5\x07\x113\x99 \
+2\xfb\x8d\x0aMk\xcb\x00\xa2/\xa6\xf2\xf8a;2\
+`\xcd\x9dXm\xbf}\x19\xbc\xcch@\x12uB\xad\
+7\x89|\xd3\xca\xce\x9b\x0bq\x96E\xc2V\x83*s\
+\xff\xf3\x16\xcf]>\x9e\xef\xa6\xbcD[y\x08\x95\xe2\
+@\xa2(\xb2n\xd7\xce\x9dY'j|\x10\xf0\xc37\
+?p\xdd\xf9W\x9a\xfb\xc2Dr\xfe\xe3\xc9g\x98\xf2\
+\xd6\xeb\x1c}\xe2\x89|\xf1\xf9\x17\xbc\xfa\xd2?\xf5\x1b\
+\xaf\xbc(>|\xff\x03\x8a\xe5\x12R\x87\x94J\xad\xb6\
+}\x880\xee\xcd\xb5\xee^\x86.:\x82\xb5\xd7[\x87\
+\x0d\xb6\xd9\x96\xb5W]\x9eBA\xc6\x84\xe5\x80\xa3|\
+8y\x0ah\x03\xe1z\xbf\xa50\x1a\x8e!dI\x84\
+BE\xb5\x18\xc7R\x19\x8cs\xbe7s\xe3\xd6\xd8\x8e\
+Y8X:\xa1\x97\x8e\xdf\x8b\xebv\x7f\xe3\xba\x8d\xe0\
+p\xc2\x22\xe6<\xda\x85\xf8\x88\xb8=\xdf\xae\xaf\xe2\xb3\
+/\xfc%\x96\x88\x99\xbcc\x06\xf1\xaeNN\xc9e\x00\
+n\xc3+v\x88\xf0\x91\xd4\x11\xb7G\x00\x09\x8c\x12_\
+h\x9f\x098\x22\x88\x9d+2u\x80?\x7f\x22\x06\x90\
+\xc7*\xe2w\xd3\xa9\x8f\xb3\x13\x92\xbe\x5cj\xc4\xd2\x9c\
+\x7f\xf1\x049{\xf6,\xde\x9c\xfc:o\xbd\xfc\x22\xff\
+x\xfay\xa4\x96D\xc68@\xeb\xc0\x01\x9c\x7f\xc9\x05\
+\xac4zE\x94\xd6\x9cu\xd2\xc9L}i2A!\
+@\x09M\xe7\xdc\xb9\x1cw\xe8~\x5c\xfb\xd7{(\x17\
+K\xa9\x06\xd21\x0fi\x8b\xbe\x93\xee\xa9{\x161\xd2\
+\xe3v\xef\xe1!v2\x06\xa7\x14L\x9d2\x85S\x8f\
+;\x96\xd6\xaa5\x00\xdax\x8a\xeey\xf3\xa8\xb6\xf6G\
+\x8b\x08\x15h\x82\xc8 dX,3 (\x10M}\
+\x8a\x7f\xbc\xfe0\xe1\x90\xe1\xb4,\xb7\x1e\x8b\x8f^\x95\
+\xb6\x91\xcbR\x1d\xd8FP\xe8GX,\x10i\x8d\xea\
+\x9dE\xe7w\xb3\x987\xed3\xbe}\xfbyf\x7f\xf4\
+\x1a\xd1\x8f\xdfS)\x0c`P\xcb\xe2h\xadL&0\
+!\x10\xd2\x84\xcc\xa2\x95\xd9V,\x84H-\xe2\x08\xc4\
+ \x0c\xf1O\xa2)\x85!/?\xfe\x1c\xffx\xe2\x05\
+\xeaQ\x0fA \x84\x90\x01-\xd5~f\xf4B\xa0\x85\
+D)sr\xd3\xf0\x91\xab\xb0\xde\x06\xeb\xb3\xc5\xd6\xeb\
+\xb3\xcc/F\x12J\x0b\x0d\x91F\xfc>%~\x1e~\
+x\x12]i\xe3\xd2\x5c\xd7\x11R\x99X\x08\xb7|h\
+\xb0\xcb40\x0f3.e\x99\x90\xd3 \x1d3\xf0\xe3\
+c\x9c\xe2-E2\xefNb\xbbqd\xe7\x1c\xd7\x87\
+\x0c>%\x94\xe3\xfa!\x92:\xe2\xb6\x1a\x89=\xa6\xa9\
+\x05]\x02\xf8\xcdd\xa5\xba_\xd2A>\x0bV\xf2\xde\
+o\x18\xa8\x07\xc4\x14\x07\xc4\x93\x98\x9e4\xf65\xe7\xac\
+\xd6\xac4\x0c\x1c8\x88\xcd\xb7\xde\x8a-\xb6\xd9\x86O\
+>\xd9\x87\xe9\x1f\x7f\x0e\x81FG\x8a\x95\xc7\xac\xa3W\
+\x5cyE\x11)\xd3\xb7s\xc7^\xca\xa1\xbf\xde\x9b\x19\
+\xd3\xbe@\x04\x01ZH\xbe\xf9\xe2+\x8e9x/\xae\
+\xbb\xe5^;\xd9}k\x99~\xb4\xa4\x7f/;\x9el\
+\xa0F\x8c\xd8\xf6\xa6\xc6x\xee\xbe\xfc\xfc\x0b\x9c~\xf2\
+\xf1TKUt\x10\x10'z(j\xae\xbc\xf5f\xfe\
+t\xe6It\xcd\xacS\x88\xc2\xb8\x1e!@\x0b\x89\x08\
+J\xb4T\x8a\xd0>\x9b\xda\xeb\x7f\xe3\xdf\xaf\xdccB\
+\x98)\x12\x96J\x86\xf0\xea\x11\xba\xd6\x83\xa0\xcb\xe4\xee\
+\x0b+\x94\x83\x90\xa0<\x14\xa5\x22\x9b#A\x1b`J\
+m\x5ce\x03E\xad\xbb\x8bu6\xdfP\xff\xe1\xbc\x0b\
+\xc4Vk\x8d\xa1\xa5\xd0\x06B\x10!\x90h\x02!c\
+\xe9\xacC\x85\xd0\x10\x04\x15\xab~\x9bS\x88T$\xa8\
+\xab\x88\xa1K\x8c`\xc3\xad\xb6d\xc7\xed7\xd6\xc3\x87\
+/.\x14\x820\x10i\x98\xe0\x09\x11\x7f%\x98\xd5\x04\
+3x\x90\xa5\xe5\xf8ZJ\xb4[\x92\x09\xe8\xe8\xee4\
+CL\x89\x1e|\x22\x88\x0985\xa7\x19I\x9d+\x08\
+cB\xd5\x8ds\x9d\xf9\xc6\xd5\xe9\x8f\xd9\xa7\x1b_0\
+g\xef\xfbm\xa4h\xad\x09\x89\xe6z\x02j\xef?\xff\
+\x9e\xff\xac/\x86\x90\xd7\x09\x7f\x10i\x06\x93\xee\xbc\x7f\
+/\xdd\x1fsB\xads\x93\x85\xc4\xdd\x16M\xec\x1a\xda\
+\x8c0\xcd\xcaA\x99,:D\xd6\xfbM\xa3{\xeb\xd6\
+ta<\xe1\xa5\x0c\x98p\xd3\x0d,4|(f\xfb\
+* \x90\x05\xbe\xf8\xe8\x0bN;\xfe\x84\x98\xe1\xc4\xff\
+<\xb8\xf8\xe3m\x06\xd3\xecD7L\xac\x1b\x0bfM\
+\xf8\xfcS\xcfp\xca1\xc7\xd0\x12\x96\xd1\x81\xb4\xedk\
+Z\x07V\xb9\xe6\xe6[Y\xe9\x97\xabp\xdd\xed\x0f\xb0\
+\xf2:\xeb\xd0\x1du\xa0mN=\xa1\x8d\x84\x08\xa5[\
+\xafJ\x08\x0a\x94J-T\xcb\xad\xb4\x96\x8b\x94\xd0T\
+Q\xb4\x86\xd0V)Q-\x0f\xa0Tl#\x08B\xd0\
+\x98\xfc\x07v\x0dk`d\xd8\x9a\xb2\xb9\x11\x8e9\xeb\
+d\xce\xbd\xe4rQ,\x96\x18\xbd\xf2\xaa\xd6\xeb/9\
+\x84S\xbb}y\x9b\x10%\x08B\x02\x11\xa2\xeb\x9a\x9a\
+\x0aYn\xe5\xd58\xe4\xf8\x93\xb8\xf1\xfe{\xf4\x1d\x0f\
+\xde\xc4\xb1\xc7\xec\xcb\xf0\xa5\x16\x17H\x10B\xc7IH\
+\x85\x93\xac\xdaz\x13{8\x90\xd5\xcc\x1bd\x9c\x15\x12\
+\xfe\xbbN\x96\xaax\xf5`\x96\x03\x09\x1e\x10\xf3;\x5c\
+\xfdN\x0b\xcf\xd0Dv^\x9b\xbd3\xbf\x92G\x07y\
+\xcf\xb3\xef\xba\xb6\xb3t\xe7\xae\xd3\x82\xa7\x91\xdc\x7fR\
+0V3\x86\xd0\xec\x9d,14\xfb\xa6\xd9=\xbf\xc4\
+\xc1\x86v\x16\xb5SA\x93\xc6\xe2\xa3\xa5]\xfc\x80\xef\
+2\xe1&U\x8b\x90\xc8\xad\xc1tDO\xdd\xe1\x88C\
+V\xa8T[\xb8p\xdc5\x94\xfa\x97L\xec\x00\x92\xa0\
+\x18\xf2\xd6k\xff\xe4\xd2s\xcfM\xce\xbd\xf7\x90\xa4\xd9\
+8\xb2\x13\xda\x17\xbc\x22t\xca\xe3\xec\xf1\x87\x1f\xe5\xac\
+\x93N\xa0_K+*,\x98\xed\xaa:\xf4\x1bXe\
+\xe2\xcdw\xb0\xc4R\xcb\xa0\x81~\xfd\xfas\xde\x15c\
+9\xf6\x8c\xdf\xa3\xab\x11=\xf5\xae8\xfb\x0f\x18-\x22\
+\x90\x10\xc4i\xb5\x15\x02\x85\x14\x0eJ\xf6=!\x10D\
+H\xadpg\x86;\x17W\xad#\x10\x8a\xb9]?\xb2\
+\xeef\xebs\xdb#\xf7\xb3\xd3n{\xa3\x22\x93\xee{\
+\xf51\xeb\x98\xac:B\xa0\xa54\xff\xdcu \x91\x81\
+\xa4\xa7\xde\xc3\xa8\xb5W\xe1\xcc\x8b/\xe0\xbe'\x1fb\
+\xfcu\x13\xd8\xfb\x80\xddXz\x99%\x84\x0c\xec\xb2O\
+\x91$\xda\x88\x19\xad\x8e\xe1\xecr8\x08\x12\xd8\xc7;\
+\xab\x16\x07p\xcb`a\xeb\xf2\x18\xb6C\x86\x84\x88l\
+j0\xa9\x8d}\x03\x1do\x98\xf8\x99\x9e\xf3\xe6\xd2\xbf\
+\xd7Lc\xfd\xa9e\xbet\x90#(\xb3\x02;\xab\x89\
+$\xef7.\x01~\x12\x03\xf8\xa9\xe5\x7f\x0a\x8c\xa4\x9e\
+D\xcdWQO\xf4\xe3\xac\x19tv\xcc1Qn\xda\
+\x1d\xceA*V\x1d\xed\xa9\x86:\x99\xc4\xde\xba2[\
+a\x185,\xaa\xf7x\xdc=9\x5cs\xb1\xc5\x17\xe5\
+O\x97\x5cA\xa7\xea\x22 @FP\x94\x01\x7f\x7f\xe0\
+~\xee\xbc\xed\xa6\x04\xe9\x1cb\xf5\x01\x83\x05\x1a\xa3&\
+>\x0eOkx\xf2\xd1G9\xe7\xb4\xd3\xa9V[Q\
+Ah\xce7\xa8C\xeb\x80V\xc6^\xf3\x17\x86\x0c\x19\
+\x0c\xb6\x0b.\x17\xca\xf6\xbb\xed\xc4-\xf7=\xca\xd6{\
+\xee\x82.+\xda\xbbf\xa3\xed\xb1\xdfN\x92\x1by\xe7\
+7\xec\x98\x80\xc6\x98\xdf\xb4g\x896}\x8fT\x9d\xb9\
+]\x1d\xac\xbe\xf1\x1a\xdcx\xcf\x9d\xfc\xf1\xa2K\x18<\
+d\x11\x94\x8ab\x80\x8f\x5ci\x85\xf8\xa4\xe1\xac_\x83\
+1^G\xfc\xfa\x90\xfd\xb9x\xfcx6\xdabc\xfa\
+\x0f\xeco\x0e\x03\xd5\x98\xdd\xa5\x0cn:\x8fi\xc7\xd0\
+\x05\xd6\xa0\xac\x93\xb9v\xb99\x9b\x15A2\xef@\x12\
+\x8b\x16\xcf\x9b\x9d\x1d\xa7%\x910\x1a\xac\xbd\xc1\xaf\x7f\
+A\x05\xd7OY\x12\xff\xd4\xf2S\xb4\x89\x05y\xf7\x7f\
+\x95\x01,h'\xe6W\x1c\x92\xf7\xf4tp\xc6I\xc7\
+\x04[n\xba&\xbf\xdaeK\xa6\xbc\xf6\xb2\xc9\xb2K\
+Z]\xf3\xed\x01\xf1?'-0\xd6R\xa5\x15ZB\
+T\x8f\x1a\xbe\x03\xc3\x08F\xffr\x15.\x1aw-\xed\
+]?\x22e\x88\x08\xcc\x91R\xd7\x5cv9O>\xfe\
+H\xe2\xe6\xa1\x13I\xf3sJ,\xa1\xac\xd4y\xf8\xbe\
+\xbb9\xef\xf7\xbf\xa3\xa5\xad\x829\xdeJ\xa3j0d\
+\xd1\x85\xf8\xcb\x9dw\xb0\xc4\xf0aM\xdb\x1c0d \
+'\xfc\xf6\x0c\xeey\xf2yN8\xfbO\x0c\x1b\xbd,\
+\x1d=\xdd\xf4\xf6v\x91\xecT81h=\xc8\xe2\x83\
+\x04,#\x10\x9a\x9e\xa8F{O\x17\xc3\x96\x1d\xc1~\
+\xc7\x1c\xce\x83\xcf?\xc69\x17_\xc6\x88eWDE\
+&\xcd\x92!\x90\x80\xb7^\x9f\xcc\x85\x7f\xfc\xb3IZ\
+\x82\xd5\xbe\xb4\xcb\x1d\xa9\x88t\x84\x96\x9a\x07n\xbb\x8d\
+w\xde\x9e\x920M\x9d\xc0:\x86Ef\xee\xe2\xfb\x22\
+yO\x08b-\xec\xa7\x01:\x817@ M+\xb1\
+\x96\xa8\xa3&\x1f\xfe\xff\xb7\xcc\xd7\x11(K\x18\x0b\xf2\
+\x9e\xbb^\xd0o\x17\xa4h\xe0\xb5\x97^\xd2O=\xf5\
+\xa0\xa8T\x16\xe6\x87\xeffs\xc9\x05g\xf1\xd7\x07\x9f\
+oX\x07\xfa\x5c\xbe\xa1\x1e\x11\xa0\xb59\xfbV+\x88\
+\xbc\x94A\xd9\xd7\x95\x825\xc7\xac\xc9\xa9\xe7]\xcc\xd8\
+?\x9cN\xa5\xdcf\xb2\xc7\x14\x0a\x9c\x7f\xfa\x19,\xba\
+\xd8\x12\x8cZy\x95\x18\xa1b\xc3\xe4O(\xca\x97|\
+\x1a\xee\xfe\xebm\x5cy\xe1\xa5f\xc7!0\xden\xf5\
+^\x18\xba\xe8\xc2\x5c}\xcb\x8d\xb4\xb5\xb5%\xea,\x09\
+\xf3pj\xab+\xa5J\x81\xedw\xdd\x85\xedw\xdd\x85\
+\x1f\xbe\x9b\xc9\xcb\xcf\xff\x937^{\x9e/?\xf9\x82\
+\xd9\xdf\xce@\xd7=\x9f\x00\xbb\xad7\xa7\xbb\x9b\x11+\
+\x8eb\x99\x11\xcb0z\xcdUYg\xbdu\x19:t\
+p\xc2\x5c\x93\xd3W\xd1@\xad\xb7\x87I\xe3\xaf\xe2\xce\
+\x1bo\xa6Zm#\x08\x0a\xb1\xc5\xdbx\x12&\xebu\
+\x81YJ\x9cx\xe0\xa1\x8c\xbf\xe5\x06V\x5cy\x95$\
+N\xc0\xf9N4\x9f6\xd0?\x93\xe8\x9b\x15\x01Q\xcd\
+\x9cG\xaf\x95D\xc8\xc8\x86oG:\xce\xdf\xf6\xff@\
+Y\x10\x1a\xeb\xeb\x9d&\x8e@\xc9Z\xdb}\xe8\xce\x9e\
+\xf4\x09\xdbYx]\xe8k\x9cy\xc7\xbd\xe7}\xef\x22\
+\x1c\xfd\xef\x1d\x97\xf7\xe7U\xe7\xd5a\x11\xa9\xa6\x8c\xeb\
+\x8eRF\xd5\xacT\xaa\xe9J\xb3\xa3\xf6\x8b\xc8^\x9b\
+\x0c<B7\xae\xe3\xb3e\xeb\xed\xb7a\xe6\x8co\xb9\
+y\xc2\x15f\xbfZ\x84T\xcap\xca\x91G0\xe1\xa6\
+\x9b\x19\xb1\xecrq{.\xd7\xa0\xbf\xac\xb0;\x8eq\
+\x84]|\x16\x8a\xdf\xae\x84;o\xbe\x89q\x97\x5ch\
+\xa2\xd6\x82\xd0\xec\xd1G\xb0\xcc\xf2+\xea\xb1\x13/\x17\
+\xad\xad\xadM\xf5)\x9f\x11\xc4!\xcd\x16\xfe\x0b\x0d\x1d\
+\xccN{\xec\xc0N{\xec\x00Z0o\xde\x5c\xee\xbe\
+\xf5f\x1e\xba\xe9\x0e\xe3\xa3\xa1av\xcf\x0f\xdc\xf7\xf4\
+sz\xc8\xc2\x0b\x0b\xb7}g\x13\xe9`\xf6\x98\x8d\x09\
+I\xdblH\x9f|\xf4!\xe7\x9cu\x06\x9f\x7f\xfa9\
+\xe5J\x0b\x220i\xbc\xa5\x86\x8e\xaev\x96^v9\
+F\xad\xb6\x02\x1f\xfd\xebC\xf5\xd5\x87\xff\x96\xb2P \
+\x0a4\xa5\xb2\xe0\x84C\x0e\xe3\x82\xf1W\xb2\xc6:c\
+\xe2\x03J|&\xd0\xb4x\xeay<^\x99\xe0I\xac\
+\xb6\xdb\xeb\xbe\xea\xd2\x90d`\x92\xc6\xb2\x18\x89:n\
+{\xde\xc7?M>cO\xe5Gp\xf4\xe2\xda\xd5\xde\
+<\xf8]\xf7\xc6\xe0\xdc\xb0}\x07\xd1x\x0c\xe4\xdf\xcb\
+\x13\xae~\xf8\x99\xc37\x07\xa3l}\xd9\xd2\x94\xa7:\
+\xc7*\x0dI\xa2\x1bOu\xb3;B\x8d\x1e\xf0V\x07\
+\xf4\x09\xd9\x7f\xe6\xbew\x7f\xa5S\x7fu\xd2a\xb7~\
+w\x80t\xb9(7\xde|\x0bV\x18\xb52==s\
+\xa9\xd5\xe7p\xf2\xe9\x17h\x97\xdbo\xbe\xc5{\xa7\xae\
+\x95\xb1\xf5\x0a@\xd5\xfa\xc4\x14e\xc7\xb8\xdf\xc1\x07\xb1\
+\xe3\xde\x07\xd2\xa3;\x09\xec9tR\xd59\xf9\x88\x83\
+\xf9a\xc6w\x0d\xdf\xb81\xbaqHH\xc7\x92g\xda\
+\xbca\xe2\x04\xae\xbc\xf0B\xaa\xc5~\x08Y@HA\
+T\xd7,\xb7\xd2\xca\x8c\xbf~\x82\xe8\xd7\xd6\x9aB\xfc\
+\xa6\xc3\xb4\xf0w\x9a\x85\xc2\x83/\x80\xd0\xf4\xeb\xd7\xc6\
+\xa2\xc3\x16\xa7\xae\xebDRQ\x93\xbd\xd4uD\xb1\x5c\
+\x16\xda\xba\xe8*\x8c\xc4OB\x9c4Z\x98\x0d\xb2\x9b\
+&]\xc5~\xbb\xee\xca\xf4i_\x12\x86edh\x8e\
+\xd9\xed\xea\xe9f\x89\xe5\x97\xe6\xea\xbf\xde\xc2\x8d\xf7\xdc\
+\xc6\xc9g\x9c\xc5\xd5\xb7\xde(\x7f\xb9\xe9Ft\xab\x0e\
+k\xe3\x10\x14\x02\xc5)\x87\x1f\xc1\xeb\xafLF\x08i\
+\xb6\x22\x114\x18\x02H\x90\xd7Oj\x14c\xbfuc\
+\xd4\xde\x8b.\xf3\xf3\xfc\x98\xbaoJ3p\x13(\x9b\
+\xcf\xc0\xc1LY\x22\x16\xa4m\x12\xfeR\x22f\x12\xca\
+\x13\x8a\xb6\x01\x19O\xb6\x87\xcb\x90\x9cF\x94\x22\x8e\xe4\
+]W\x5c\xa6c\x87\xe3\x0e\xafbEL{cQ\xc4\
+;d\xa9C\x89\xbc\xf7T#x\x9bl\x03z\xd2+\
+{?F^\xcb\xc1|\xe6\x10\xffq\xdf\xabd\xb0\x9e\
+\xd3T\xb2\xde\xb5\xdf\xfb\x04\xa13\x00\xd1^]B\x06\
+\xdct\xc7\x13\x5c}\xfd]\xfc\xfd\xd9\xa9\xac\xb4\xca*\
+\xa2\xa1\x93}\x15\xbf\x8f\xf6\xffQ\xbdw\xbeR\xc7M\
+\xc4q\xbf9\x91\xd1\xa3\xd6\xa2\xa6z\x906\x97Po\
+w\x0f'\x1e}0\xb5ZO\xea3\x17\x84\xe7&\xdc\
+m_\xc5\xcc/~O3n\xecX\xae\xbbj\x02-\
+-m\xc80D\x04\x92Z\xad\xce\xe8_\xae\xc2\xe5\xd7\
+O\xa0X.\x198\xb9:\x16t\xb8\xd9\xf6\xbc>E\
+\x91=\xe0O\x1b\xbf|\x08\xa8G\x91e\x16\xc6h\x88\
+\xcd\x8a\x0c \x84\xe4\xeb/\xbf\xe0\xa8\x03\xf6\xe1\x86\x89\
+\x93\xa8V\xdb\x90a\x810\x08QJ\x13\x14\x05\x7f\xbc\
+\xe4B\xae\xbe\xf9/,?z\x85\x18\xa62\x089\xf7\
+\x92\x8bXs\x93\xcd\xa9E\xdd\x08;\xa1\xd5j\x913\
+\x8f?\x96\xf7\xdeyG\x0b\xacSK\x8e\xacry0\
+b\xe4\xf6`+0]\x8f\x19\x9c\xca\x18\xfdh\xce\xdb\
+\x95\x86\xa0PH\xe8U\x80\x08\x12\x04qq\x00\xb1\xbf\
+\x81#@oW\x01\xa7mYc\xa4\xab,\xc6q2\
+\xc2\xd3\xb6\x13\xd3\x82N\xdeu8\xe6\xfa\xa6l\xfdB\
+'\x0c\xc9Wt\x1d\x1c\xdc \xe3\xf0\x02\x9d\xd4\xe1\x14\
+\xd1\xbe\x18b\xbe\x06\xa03\x97\xca\xfbg\xbfr\xf9\xf5\
+R\xea\x96\xd7\x01\x1d\x8b=\x07\xe1\x04\x11\xfd\xb5a\xea\
+\xb9\x03\x80\xaf\xbe\xa5\x88\x16\x0aA\xc0\xda\xebo\xc8\x22\
+\x8b.\x96:\x1csA\x8a\x06\x02\x19\x10\x88\x04(\xf5\
+\xc8s\xcdmV\x1cG\x15\x82\x8b\xaf\x99\xc8\xb0%\x97\
+E\xd7#D\x18\x80\x90\xfc\xf0\xe57\x1c}\xd0\xbe(\
+\xd5\x98\x828V\xc5\xdd\xf8S\x1c>\xe2\xa2\xb3\x7f\xc7\
+]7\xfd\x85\x96J\x1bA\xa1\x84\x08\x04\xb5\x9ab\xdd\
+\x0d\xd6\xe3\xb2I\xd7R\x08\xc3\xd8H/\xc4O\x1bo\
+_\xc3\x01\xa8\x09sV/R!\x91tut\xa4T\
+\xd8$u\x97\xe4o\xf7\xde\xcb^;m\xcfG\xef\x7f\
+L\xa1\xdc\x82\x0e\x0a\x84\x22\xa4\xa7\xb7\x93\xe5F-\xcb\
+]\x8f<\xc2&[ljF\x9c\xe9\xa4\x14\x82s/\
+\xba\x84U\xd6\xdb\x98\x9a\x0d\x1f\xd6RQ\x084\xc7\x1f\
+\xb4\x8fx\xed\xe5\x97\xac\xaa\x9a\xa3\xac\xfaR4OZ\
+*oL\x9e\xda\xeb\xb4\xc8\xbe\x00&<\xa3\x9fF\xa3\
+#\x910M\x0f\xb7R\xd9\xb6D\xeaOj+Xx\
+}u\xcf\x9cdF[r\xd0\xc9\xb7\xbe#\x9b\xbfd\
+t\xf5\x0b\x12A\x19\xd3Xv- 2\xfd\xf3\x9f\xe1\
+\xf9\xc64Y\x074_\x02\xb8\x0b\x7f\x0d\xe1\xb8\x8cJ\
+\x8d3A\x18\xe9\xbd\xe3XO\x13F\x10\xab\xa4d+\
+J\xea\x8f\xdb\xcc\x0c,\xde\xbe\xf9\x89EK\x10B$\
+\xd6di\x90{\xfe\x1f&\x13\x17\x04\x01W\xdet=\
+\x03\x87\x0e\x85\x9a\xb2\xc9(\x04_\xfc\xe7c.:\xfb\
+\xec\x06@\xfb\xcb\x81\xd4\xfd(\xe2\x0f\xbf\xfd-\x0f?\
+\xf8\x10\x95r\x7f\xa4,\x02\x92\xa8\xa6Ys\xed\xd59\
+g\xecX\x13X\xe2\xe0G\x06\x97\xe7\xb3\x05\xd6\xe7p\
+bF\x1c\xc5\x9cPQ\xb3\xcf\xdc6\xa1Q\xf9\xbb\xbb\
+:8\xe7\xcc\xd3\xb8\xf0\xcf\xbfG\xca2\x22,\x22\xcd\
+\xd9E\xf4\xf4tq\xdcoOU\x13o\xba\x896\x1b\
++\xd1\x04|\x08\x01\x17_y%\xa3\xd7\xd9\x84\xeeZ\
+;BI\xb4T\x94J\x05N?\xf6(\xa6\xbc\xf9\x9a\
+\xce[g7\x8c3\x87X|&\x01\xc4\x81u}.\
+\x0d5(\xe1|\xfe\x00-\x1a\xd3\x9ee\x85T\x86\xb8\
+}\xbf\x02\xdf\xe6\x10\xdbz2\x01\xb0\xb1\x86\xe0k\xbd\
+\x1e\xc3\xca4\x1d3\x90\x94\xe0pN\x10N(yL\
+0\xee\xb3\xcf\x80\x5c\x139\xea?\xf4\xa5\x018\xa2\xcd\
+\xac\xb1\x1a{\x99\x19D\xde\x80T\xba\xbe\x14\x17\xcb\x12\
+\x7fv \xfe}O\x8b\xf0\x11\xa1\xaf\x92\xaa\x22\x82B\
+\x01t=\x81\x90\xa6\xde\x10>\xda\x0co\xdck\xd5J\
+\x95\x09\xb7\xfc\x95\xca\xe0\x8aI4JH(\x03\x9e{\
+\xfc!n\xff\xcb\xa4\xf9\xd6\xa5\xa2\x88\x93\x8e<\x9a\x17\
+\x9ex\x92j\xb1\x15\x19Jd(\x89j\x11\x9bo\xbb\
+\x05\x17\x5c9>\x99\x98\x8cj\x97\xd2\xeb\xdc\xef\xf9\x8c\
+\xbf\xd9o\xad\xcd9\x86\xee\xc0\xd1z\xad\x1e\xeb\xd0B\
+J\xde\x9b\xfa6\xfb\xee\xba\x0b\xcf>\xfe4\xe5R\x7f\
+s\xe4\xba\x08\x88\xea5\x86\x0d\x1b\xc6\xad\x7f{\x80=\
+\xf6\xdaK*\xef\x88\xf1\x18q\x9b\x00\xf0\xa2q\x97\xb3\
+\xd2\x9a[\xd3\xab{\x10\xca\x8c\xb2\x5c)p\xea\xa1\x07\
+\x89)o\xbd\x96\x1a\x8f\x86D\x88\xf45(HR\xe6\
+\xf9\x8f-\xf3X\x10a!l\x02Q\x15\x8b\xf3\x9c6\
+\xfd{\xae\xbd\xac\x95\xcf]Z-\xa2\xa1\x0e\xf7/K\
+\x07Y\x9a\xc9\xcew\xb6\x1e\xf7,\xfb\xad\xff~\x16\x96\
+9\xa5\xb9\xf8\xcb\xeb\xbc_\x84\xf7/\x8b\xa0\xb9X\xdf\
+\xa4\xae\xec\x00\x9b\xb5\xe3?\xcb{'\xa7\xbb\x0e6)\
+\x0dF\x14\xb1G\xcf\x19\x7f\xb8H\xa4\xaa\xf7\xe7\xc5\xaf\
+'\xdb\xce\x80\x01\xfd\xb9l\xe2\xed(\x02\xe3\x90$\x03\
+\xc2b\x91\xeb\xaf\x9a\xc0\xd3O<\xd2\xd0Mw]W\
+u\x8e?\xecH\xde\xf8\xe7\x8bT*\x15d\x18 d\
+H\xbd\xa6\xd9b\xdb\xcd9\xfdO\xe7\x22\x03\xaf\xbd,\
+\x93\xf4\x07\xe6W,\xd2\xaf\xe0\xbd\xa6\x1a_3\xd7\xd6\
+re\x9eIj\xb5^\x932@)\xae\x1b\x7f9\x87\
+\xed\xbd/\xb3f\xcd#(\x96\x90\x84\x04\x02\xba\xbb:\
+\xd8c\x9f}\xb8\xe1\x9e\xdb\x19>|x\xbc6\x8f\x94\
+\xf6\x9c\x8eT\xec\xcd\x97\x85C \xe0\xb2\x09\x973r\
+\xd9\xb5\x0d\x13\xd0\x12\xa1%\xa5R\x85\xdf\x1cr\x10o\
+\xbe19\xf5MS\xe1\x93G0\xd9\xdf\x19\xe6\x91E\
+i\xe9r\xc3\xfb\xd5\xe6\x11[\xde@|Bv\xbf\xf3\
+\x082\xafd\xdb\xc8.\xee\xf3\x18\x9e_w_\xf4\x90\
+w\xddG_~\xda\xcej\x1e\x00\x9aMB\xde \xf3\
+\xae\xfb\xd2\x02\xb2\x04\x90\xf7,\x0bl\x91~\x9c2_\
+\xc4}\xd3\xb69\x85\x94f\x06ck\xaf\xd7\x95\xc4\x02\
+\xeeY\xd3\xbd\xa6\x96Xr1.\x9ex\x1d\xdd\x1ds\
+\x90\x04H\x1dP*\x179\xff\x8c3\xf8\xf0\xfd\xf7\x12\
+\x1c\xb1\x1f\xd5\xa3\x88\xa3\xf7?\x84)\x93_\xa6\xa5\xa5\
+\x15!B\x84\x94D=\xbdl\xbd\xc3\xce\x9cv\xf6\x9f\
+\x88\x17\x9f\xf3C\xa2,\xbctzJ\xfa\x12>q\x91\
+\x02m\xdd\x9f\x05\x01JG\xcc\xf8\xe6k\x0e\xdf{\x0f\
+n\xbd\xfe\x16*-U\xa4(\x10Zc`\xb9\x12p\
+\xd1\x84\xcb\xf51'\x1f\x1f\x9f8d\x1aS\x98\x9cA\
+\xd6/^\x084Qz\x1d\xed\xf5)\x0c\x04W\xdc0\
+\x89\xa5G\xaeA\xaf6\xc6S-\x15\x95r\x85\xdf\x1e\
+u\x14\xef\xbe\xf3v\xfc\x8d\xc0\xd3(\xfa\x12\x14y\x83\
+\xf5>sm\xa7\x9c\x9f\x85gy\xf3\xabm\x82S\xb9\
+%\xafO\xf3\xd3X\xb2\xef\xf5%\xd0\xf2\xde\xcd\x1b{\
+_\xcc\xb0\x8f\xd27\x03\xf8\x99k\xcc\xb8\x13~=\xcd\
+\xb8T_\xed\xcdo\x92\xf3\xde\xb1\xbf\xfdy\x15\xd9\x0b\
+m\xf3\x19\x09I\xe4\x90T'\x04\xef\x9b.\xa0Q+\
+\xf0\xcb\xa8\xd1+p\xf2\xb9\x17\xd3\xd93\xdbH3\x04\
+\x95R\x893O<\x86\xf6\xb9?\x826\x0e1:\x8a\
+8\xee\xa0C\xf9\xe8\xed7ikm\xb5\x9e\x85\x92Z\
+W\x17\x87\x1cw\x14\xa7\xfe\xe1\x94\x05\x1f{\xce\xf3<\
+\xa5\xca\xd7h\xb2B\xc3\xbdi\x03\x91\xa9\xb4T\xb9\xe7\
+\xb6[\xf9\xf5v;\xf0\xc5\xa7\xdfR,\x97)\xc8\x22\
+R@wO7k\x8cY\x93;\x1f\xf9;\xebn\xb0\
+\x91p01\xcc\xcd\xd48}\xda4~\xf8n\x06\xc6\
+\xff\xdc\xe9\xc6*n3\xcb\xd3\x8a\x85\x90q\xd7Ob\
+\xa9_\xac\xa1jQo\xb2\x1c\x08$'\x1dr(o\
+\xbc\xf6J\xfe\x16\xf3O\xf5\xb4\x22\xcd\x0c}XH\x81\
+t\xde\x7f\xdaFX\x8a<K\xeb\x82\xe0\xe1\xcf-?\
+\x87\xc6\x16D8,`\xe9\x9b\x01\xfc\x97\x1aY\xe0z\
+\xfe[\xed\xd9\xba\xf2\x91\xde\x14#\xf1\x9c\xa1&\xbfa\
+\x7f9\x98\x95\xae\xbe\x07\xfd\xb6\xdbm\xc7>\x87\x9dH\
+Wm.R\x07\xe8\x00z\xe6\xb5s\xf2A\x87P\xaf\
+\xd5\x10\xc0\xefO;\x8b\x0f\xa6\xbcI\xb9\xa5\x15!C\
+\x84\x14\xf4v\xd59\xf1\xac\xdf\xb3\xd7\x01\xfb7\x1c8\
+\x91\xb7\xf4\xedc\xa8\x0dD\x16K\xe7\xccsW\xa4\x0c\
+ll\x80\x89\xda\x0bE\x89\xe7\x9f|\x81BXD\x06\
+\x92@\x04DJS(I~w\xfe\xf9\x5c8~\x1c\
+\xad--)i\x8a\x06!MF\xa53N9\x82k\
+\xae\xba\xc8\x84\xd8j\x85;\x91 o\x0cF\x1b\xd3\x94\
+K%.\xbbv\xa2\x5cz\x99\xd5\x8d\xfd\x01\xd0\x81\xa0\
+\x18\xc2\x19\xc7\x1c\xcf;S\xa7\xa6\xbe\xd1\xf6\xbb\x9fS\
+\x9a)\x0f\xee\xd4$\xad\x94I\xb1\xf6\xb3j\xff\x1f\x94\
+\xf9I\xf3\x05\xfd\xe6g\x96\xff\xf5X\x80\xff\xab\x92\xb2\
+\xd2\xe6\x14\x993\xd3~\xf0P\xba\xb2\x9ck\xe7>o\
+/\x0f>\xe2H\xb6\xda\xf9\x00zU\x0f\xb2f\xc0\xfa\
+\xcd\xd7\x9fs\xd6\xf1\xc72\xe1\x92K\x99\xfc\xcc\x13T\
++mv\x1b2\xa0^\x8b8o\xdc\xe5z\xc7\xddv\
+lh\xca\xb7\xde\xcew\x9c\xa4\xc7\xd9\xf0M\x0e\xf5k\
+ \x08LZl#P\x03\xa4\x08\x91\xb2\x80\x0c\x05\x08\
+MW\xe7<\xb6\xdbuK\xee}\xfc\x09\xb6\xdafK\
+srpf\x09\xe4\xa8\xe5\xcbi\x9f\xf0\xd1G\xff\xe2\
+\x91\x07\xef\xa1\xb3\xa3\xd3.\x01\xd2\x16\xa8\x981\xd9\xbe\
+(\x0b\xb9\xb6\x96\x16\xc6\xde8I/\xba\xd4\xca\xa6J\
+e\x0c \xa5Ps\xe2\x81\x07\xf1\xee\xd4\xa98\x95\xe3\
+\xe7\xe2}v\x89\x9d\x82\x85\x8b\xed\xb7\x9eZ\xffM\x19\
+\xf4\xffB\xf9\xaf0\x80\xbe\x96\x1f\x0b\xa2\xf9\xffO\xdb\
+\xcc\xde[\x90v\x5c\x0e6)\xba)\xe2h\x00\x00 \
+\x00IDAT\x12\xa5P\xfb\xe2\xcd3\xee4\x9c\xc3\
+\xe0\xd6\x07\x9e\x85Mk\xcd\xc9g\x9c\xca\x88eF\xa3\
+\x02\x15\xbf\xf0\xfe\xd4\xb7x\xf8\xae\xdb(\x96\xcb\xc8\x82\
+\x89\x8d\xef\xee\xee\xe6O\x97\x8ee\xed\xf5\xc6\x08\xbfJ\
+ggp\x18\x9b\xcdJ\x95;\xe6<&\xe7\xd4\x13\x91\
+}W')\xc0\xc0Hi!\xbc\xb3\x035\xb5^\xa8\
+\xb6\x16\x18{\xed5\x9ct\xfa\x1f\xa9V*V\xd5o\
+\xd2\x11\x05\x8f=\xfa(\x95J\x7f\x8aa?\x1e{\xf4\
+\xbe8e\x98\xff\xaev\xfd\xf2\xfa\xa4\xec\xcd\xd6JQ\
+\x8c\xbd\xee*\x06\x0c]\x02Q\xd7 B@R)K\
+\x8e?\xf8`>\xf8\xd7\xbb\xf1\x96Z\x03\x13\xca\x83I\
+\xe6w\xdc\xa4\xaf\xb6Afb\xfd\xc4\x9a\xf3\xaf\xf3\xa7\
+<\xcb\xe2e\x1e\xbd\xfc\x5c\xdaXP\xfaj\xf6\xacI\
+B\x90\xb4\xaaK\xe6Zg\xfe\xe5\xd9Lt\x93\xf7\xf1\
+\x9e\xe9\x9c\xe7\xfew\xcc\xe7\xbdf\xef\xa7\x06\xe2}h\
+\x88%Y\x97*\x0dQ\x94\x11\x9f\xf1\x021\xa7\x9e\xbc\
+N\xb8\xdb\x1a\x84\x10\x8c\xbd\xfeZ\x06/:\x0c\xd0\x08\
+\x02\x84\x0e)\x05-&\xdb\x80\x06!4\x97\x5cs5\
+\xebl\xb4^|hiL\xf8~\x1b\xdeR\xb4\xd9N\
+X\xec\xda\x99\x97\xbf.U\x8f\x0d\x05\xd6\x1a!\x05\xdf\
+|1\x8d{o\xff+Qj\x8f]P\xabw\xb2\xea\
+\x98\xd1\xdc\xfe\xd0c\xac5f\x8c\xe1oYM*\x86\
+\xa5\xb9\xd1>o\x0e\xf7\xdfq+eQ\xa1\x5c(r\
+\xd7-7`[D\xe3\xe5\x13p\x1c\xc4wc\x15\x8e\
+\x09h\x06\x0dl\xe3\x92\xab&\xb2\xd0\x12#\x10Q\x84\
+\xb0\x89I\xabE\xc1\xc9G\x1c\xc4'\xff\xfe(\x19\x96\
+\xce\xc7\x83,\xac|\x9bN\xac\xddy\xf3*\xe3\xed\x16\
+\xd0*B\xca \xe5l\x95\x87\xf3\xd0\x00\x8a\xdck\x9f\
+\xd7\xf8|8\xbb\xfb\x97-\xfe\xb7\xcd\xe6\xddo\xcb\x97\
+Y\x22\xe7\x9d\xf91\x97\x05\xd2\x00\xf2\xb6\xee3B\xa0\
+\x81\xa8]\x87|\xa0d\xf1\xd4\xaf\xcf\x7f_\xe6\xdc\xcb\
+\xb6\x9d\xb7\xa9\xe03\xa3\x94\xf0\xcb\xd0x\xbc\xd7-\xdc\
+\xd7~\xe2\xce\xcc\xa0\xb2\xd8\xe5\xd7\x99\xb3\x8c(\x97+\
+\x5c:\xf1:z{\x951,\x09\x89F!\xb5@\x14\
+4\xe3o\xb9\x85U\xd6Z\x034I8\xaf\x8fe\xee\
+\xaf{\x96i2F\x8c\xcc7\xa9\xc3w\x9c\x0d\x0e\x0c\
+\xe19\xdaS\x8a\x9b\xae\x19\xcf\x1e\xdbo\xcd\x17\x9f}\
+l\xec\x15\x16\x16=\xb5n\xf6>\xf4`.\x19w-\
+\x95J5\xe5{\xee\x8f5N\x7fe}\xbcO?\xf1\
+\x18z\xbb\xeb\x04a\x01!Cf~;\x9bk\xc7\x8d\
+E\xf8\x11Q\xb6\x03\x1a\x95\xdc\xf2\x8c\x15\x0e\xd4\x8b\x0c\
+[\x94?\x8f\xbb\x94\xd6!\x0b\xd9w\x0d\x81\x06Zs\
+\xf2\x91\x87\xf0\xe5\xf4/\x93~8\xcd\xabq\x0a\x1a\xa7\
+\xc7\x7f\xcf\x0ay\x85&,\x16\xe3\xf7\x85\x14(]O\
+1\x177\x82\xec\xb4\xfbS\x96g\x1f\xf2\xa7!+\x0c\
+]\x17\xb2S\xee\xee;\xfc'\xf3<\x8b\x8eY&\xd2\
+l\xd7\xa7\xd9oW\xe6\xef\x09\xe8\x95,qe\x89\xdd\
+\x07\x98\x0f@\x9f0\x9b\xb5\xe3\x0f\xcc\x1f\xac+y\xd6\
+\xec<\xc0\xa7\xfa\x96g\xd1\xd1\xb5\xf4\x98\xa4\xe9Y\xcc\
+\x0b\xb2\x1c\xa9\x19\xbbnXX&\xef>\xf7\xe4\x93f\
+\x8bI\xda\xb3\x00\x02\x89\x12\x82JK+\x83\x87\x0em\
+\x1c\x5c^]\xf6:\xce\x7f\xd9l\xb0\xde\x0c\xc6\x0c\xc3\
+[\x96\x98\xd7\x04\x1f\x7f\xf4!\xfb\xee\xbe57]}\
+--\xe5\xaa\xe9\x97\x08l\xc0\x8a\xa2\xabg\x1e;\xef\
+\xb1\xb7iB{u\xf9Kym\x12\xbc\x04R\xf0\xee\
+\xd479|\x9f=\xf8\xe0\xed\xa9\x84\x95\x22\x04\x05d\
+X (\x95\xb8\xeb\xd6\xdb8\xf3\xc4c\xf8\xfa\xcb/\
+\xf0\x01+\x9c\x9bp\x16It\xd2\xd4b\x8b/\xc6\xa5\
+\x93\xae\xa3<\xa0\x1f2J\xb0-\xea\xea\xe6\xd8\x83\xf6\
+\xe6\xdb/\xa7'L \xbd\xca\xc8NC<\x96\xdc\x87\
+\x08\xb4\xf2\xe3\xff\x15\xe8\x82\xdd\x15I\xd7\xd9\x0c\x0d\xdc\
+Td\x85Q\xf6\x9d\xbc\xeb>\xd0\xa7\xe1\xbd\xac\xabA\
+^}v\x04\x0dB\xf8gi\x00\xcd\x085\x8f\x90\xf3\
+\xa4\xb3\xdf!H\xd3\x95\xa6q\xe0\xcd\xda\xce\xd2b_\
+\x03I\xbd\xd3\x84]j\x01\xb5Z\xf2\xae@Z\xd54\
+\x83IyP\xf68\x9cv\x16\xa9,\x83Qp\xc7\xcd\
+7s\xed\x15\x17S,\x9aPemE\xa9\xa6N\xfb\
+\xec\xd9\x9ct\xc4\xbe\xd4z{b\xd5\xbc\x01\xb0y.\
+\xbey\xdaH\xa6\x9f)\xe2\x07\x5c\xf6\x1f\xa5\x22&]\
+u\x19\x07\xed\xb9+\xdf\x7f=\x8br\xa9\x84,\x06f\
+y\x22\x9c\xb5>BjIwWWc\x7f\xbc\xc9\xea\
+\xea\xea\xe2\xe9\xc7\x1f\xe5\xd8C\xf7\xe2\xb8#\x0ef\xda\
+'\x9fQh\xad\x80\x96\x08\x1d u\x81@H\x82\xa0\
+\xc4\x1b\xff|\x95=\xb7\xdf\x863N<\x81)oL\
+\xb6\xc1G\xe4#\x90N_.\xb6\xf8\xe2L\xbc\xf9v\
+\xcaCZ\x90J\xe2\xd0\xb4\xb7\xab\x9d\x13\x0e\xd8\x9f\xef\
+\xbf\xfd&-ZuCW\xcd\x10\xf2`\xe61P!\
+\x838\x0eD\xab\x84\xd4\xb2\x84\x98E\xa5\xec\xf4\xe4\xa1\
+\xc2\x82\xe0k\xb6\x8e\xecu\xae6K#S \xe7\x9d\
+\x05-}.\x01r\x05\xe8Ol`~\x1c\xe8\xa7\xd4\
+3\xbf\xf6\xad0\xcb\x7f\x90\x22ja\xf3\x07:\xfe\xad\
+\xd3\x126\xdb\xa8#J\xfb/N\xae\xa8-\x11\xdbw\
+\x1e\xb8\xf7\x0e\xfe2n,\x95b\x09\x88\x8c\xe5<\x8a\
+\x10Z\x10\x10\xa2\xb5\xe4\xabO\xbf\xe4\xac\x93\x8e\xb7\xfd\
+\xf1\x12F\xe6\xcdt_%\xab'\xea\xa4?.\xf7\xdb\
+\x0f\xdf\xcd\xe0\xe0=\xf7\xe0\xaf7\xdc@\xb9\x5c\xa5 \
+\x03D)D(Io\x8fF\xe8\x00\x10\xd8#\x02\xa8\
+\xd7\xfb\xce\x88\xf3\xe8\x03\xb7s\xde\xd9'1u\xea\x14\
+JB\x10\x86\x012\x0a\x09\x08\xe3\xe8H\xadC\x02Y\
+\x800\xa4X*\xf2\xdc\xb3\x0fq\xc7\xcd\x13\xe8\xe9\xee\
+\xce\xa7\x0a\x7f\xc9\xe5\x95\x85\x16\x1e\xca\xa5\x13o\xa34\
+`\x00R\x19UG*\xc9\xbc\x8e\xb9\x9c|\xd8\xc1|\
+?\xe3\x9bFu0S\x9a\xe2J\x0a\x17\x8c\xf1OH\
+\x8dPf\xf7b\xbe8\xd6\xe4~\xde\xdff\xfd\xc8\xf2\
+\xf1<\xd04\xabkA\xdbX\x90\xd2'\x03\xf8o\x10\
+\xeeO)\xff\xe3\xf6\x9c\xf4kR\xb9\x00\xea\x91O\xc0\
+\xb2\xf1\x18\xa9\xf9u$\xef\x99\x84[\xaf\xbb\x96q\xe7\
+\x9dG\xb1ZA\x85\x01\x1aIw-\xe2\x94?\xff\x89\
+\xb6\xfe\xfd\xc0\x1e\xd5-\x85\xe0\xed\xd7^\xe3\xb6\xeb'\
+&\xd2\xc7\xaf{A\x1c\x00|\xff\xf3\x94\x045\x1f\x0b\
+$\x8f\xdc\x7f?{\xef\xb2=\xd3?\xfb\x94B\xa1L\
+\x10\x14 \x94\xa8\x1e\xc5\x22\xc3\x17\xe2\xd0\xe3\x8f0\xe1\
+\xbf\xf6\xf8r)D\xac\x99\xf8\x9d\xf2\x11n\x8f}\x0f\
+\xe5\xe1\xa7_\xe7\xd8\x13Ne\xc8\x22K\x10\xd54\xa1\
+,`\xce\xe93\x87\x94\x04&8\x82\xae\xee\x1e6\xdc\
+xS\x1e\xfc\xfb?\xb8\xe8\xaa\xdbhik\x8b%u\
+Sxf\x98\xc0\x12K.\xc6\xd8\xab\xaf\xa3\xff\xc2\xc3\
+,\xb3\x92\x88@\xf0\xc3\xcco9\xfe\xd0}\x98\xf9\xfd\
+w}3\x81fp\xd4\xd9\x1f\x02!\x02\xb4\xcc\xab\xe4\
+\x7f\xbf\xfc\xdf\xb4j\xca\xcfw\x05\xfeo\x96\x05\x9a\xa8\
+\xf9T\xe1I\xbf4g\xd4(\xef\x9e\xdb\xa1N\xb6\xb5\
+\xd2\xab\xb8D~\xe6w\xc1\x9c\xf6\xe2\xa7z\x16\x8c\xbf\
+\xe8\x22\xae\x9f8\x8ejK\x15\x17\x0e\xdb\xdbS\xe3\xbc\
+\xf1\xe3\xd9x\xcb\xad\xf9\xdd\xe5\x97\xd2\xd5\xd5\x89\xd4\x12\
+D@\xa9\x10p\xeb\xd5\x93x\xe6\xc9\xc7\xeci@I\
+\x1f\xd3;/\xe9\xd65$Qn\xf1:\xdf\xf1\x0d\xf3\
+nwW\x07\xbf=\xe1\x18.>\xe7\xf7\xe8H#\xc3\
+\x82\x09[\x06\xba::\xd8f\xd7\xed\x98\xf4\xd7\x07\xa9\
+\xb6\xf6\xa3\x10\x16\xec8\x04\xbd\xbaf\xd2\x81\xdb6T\
+\x5cg\x923\x0f\x05\xad\xfd\xfa\xb3\xc7\xbe\x87r\xeb\x03\
+\x0fr\xd4)\xa7\xd1]\xeb5i\xc0\x85\x91\xd2\x0a\x85\
+\x94!W]\x7f#g_r\x19\x8b\x0c\x1b\x8eT\x89\
+f\x96\x08|\x15\xf7\xdb\xc1\x5c\xe7\x00|\x89e\x86s\
+\xf15WS(\x17\x11\x84H%\x91:`\xee\x0fs\
+9\xfe\xd0\xdd\xe9h\x9fc\x83\x99\xb4]n\x91\xd2\x86\
+\xdc\x0c\xfb\xb3\x9dj\xc7jbn\x0d\x95\x974c\xbe\
+\xe5\xff\x8az\xff\x0b\xe5\xa71\x80\x9f\xa2\xa2\xf6\x05\x94\
+,\x90\xf3\x16U\xfeuv/0\xa7\xfeD\x85\xb2\xa9\
+\xabR\x84l<\xd2\xb4V\xf1\xb6\x13\x90\x9cA\xa8]\
+\x9aL\xc3\x0cDL\x90>9b#\xc5\xdc\x1e\xb7 \
+R\x11\x7f>\xeb4\xee\xbb\xf3\xafT\xcbmha\xf2\
+\x03\xf4v\xc3y\x13\xc6\xb3\xe6\x98\xb5\xd1\x1a\x96[a\
+%\xfe0~\xbc\xee\xee\xe90.\xaf\x22\xa4X\x0c\xf9\
+\xf3)'\xf1\xd6\x9b\x93i<\x84\xce\x9dQ \x92\x1c\
+\x09n\x8c\xd6\xaa\xafp\x0c\xcf\xf4\x5c\x22x\xe3\xd5W\
+\xd9s\xc7\xedx\xe5\x1f/Q*W\x00\x93\x8e\x9b^\
+E\xb1\xa5\xc0E\x13\xaf\xd1'\x9e~6a\x10\x22\x04\
+6\x01\x889\x0dY\xa0\xa8\xd5\xebq7\x84\x8diu\
+\x89\xc4q0\x8d\xb3q\x04\xec\xfc\xab\xdd\xf9\xdd\xf9\xe7\
+\xa9y\xdd\x9d\xa6'\xa2Fo\xad\xce\xf9\xe3&\xb0\xf2\
+j\xab\xa6v \xfciwPt\x7f\xdd/C\xc44\
+\x88\xc4E\x16\x1b\xca\xe57\xdc\x8a\xaa`\x03\xaf\x04H\
+\xf8qF'\x87\xef\xbb+sf\xcf$a\xednN\
+\x0d.\xb8\xc3\xb4\x14\xee\xe8,\xac\x900\x88\xe5\x12\x94\
+\x08\x17\x13\x92\x0d\xf8\xc8+\xff\x0d\x82O\xa6\xba\x91\x1e\
+\x9a\xbd\xdf\x97\x96\xb3 }\xceyg\xc1\x18@vs\
+\xd5\xff\x97}\x9e\xb7`\xc9>\xcb\xb3b\xe4u\xd2-\
+\x8e\xb2\xfb\x82M6g\xa5u\xefsR\xcd!U\x8c\
+\xc6BB\xd4\x89\x04\x1b\x00\xe3\xb1\x09mX\x87\xb5\x08\
+\x98k!m\xeaqCx\xc9qg\x8aH\xd59\xe6\
+\x80\xfdy\xfa\xb1G(\x95+\x08)\x91AH\xbdW\
+s\xe9\xd5\xe3Xc\xed\xb5\xecV\x9ea&\xebm\xb4\
+\xbe8\xe4\x94\xd3\xa8\xf5v#\x95Qg[[[9\
+\xf3\xa8\xa3\xf8\xe2\xb3i$\xe7#\x1aR\xd7\x90:R\
+^J'5E<&7\xf4Z\xbd\xc6U\x97]\xc4\
+\xf1\x87\x1f\xc2\xbc9\x1d\x94J!\xc8\x02\x22\x90tu\
+w\xb0\xdef\x1bs\xc7\x83\x8f\xb3\xf6\x98\xf5E\xccP\
+\xbd\xa93@\x94\xa0\x13C\x9d\xd3L\xd2\xfa\x88\xb0\xda\
+\x93\x11\xe9Ji6\xdclS\xb9\xed.\xdb\xd1[\x8f\
+P\x0aV_{M\xbd\xf2/G\x9b\xa8@[\xb7\xf2\
+\xeaHo\x93e\x9c\x02\xdc\xdbZ7X\xef\x87/=\
+\x9c\x897\xdeK]*\x84\x08\x8c6%a\xeews\
+8\xf6\xa0\xbd\xe8\xea\xea$\xd1'\xdc\xcc'\xe2\xc0\x1c\
+N\xe2v\x01%ha\xb2\x1b[hk%\xed\x09H\
+Mp\xd1\xfdN\xccF\xf9\x84\x9b]\xd2\xe49&\xf8\
+\xef:\x1bg_\xf5e\xb7\xb8\xfc\xfe8z\xc8\x1am\
+\x81\x0c\xb0s\x05\xf8\xfc\xc3\x81\xf3\x06\x9cg\xa9\xce\x03\
+\x98{\xc7'Z\x9a\xdc\xcb~\x9bWo3\x06\xe1\x00\
+\xa91\xdbz)\x03\x9f\x88Q\x01@i\x13\xb7\xe6*\
+\xf4S\x8b$\xe8\x93\x1c\x1c\xea\xce\x8b\xf3\xff\xab\xd7\xea\
+\x1cw\xe0A\xbc\xf7\xee\x14\xaa\xe5V\x82 D\xca\x80\
+\x9e\xae^.\x1c\x7f%+\xaf\xbe\x16\xd8d\x13&\xb5\
+\x941\xb4\xed\xb1\xf7\xafYw\xcbm\xa8\xa9\x1e\x84=\
+\xdf\xbe\x10JN;\xe6@\xe6\xfe8\x8bD\x8a\xe9\x18\
+q\xdd\xa9\xc5\xee\xa0\x8f\xf4\x1b\x82o\xbf\xfe\x86C\xf7\
+\xd8\x9d\xbbn\xbb\x8dJ\xb9B \x03\x10!(M\xa4\
+4\xbf;\xe7B\xce\xbe\xe8RZ[Z\xcd\xa1\x1b^\
+n\xa98!\xba\xb5EDQ\x94r\xeaH\xce4v\
+\x87{\x03^\xfb\x02\xa3\x8a\x1cv\xf4\xb1\xf4\xf4\xce\xa5\
+\xbb\xa7\x8b-\xb7\xddA\x98S\xa4\x9d}\xc3L\x8e\xd3\
+\xce\xdc\xf7\xc2z :F\xe3\xdb/\xdcD+\x1f\xf7\
+\x80\xe1\xc3\x17\xe3\xca\xeb\xeeF\x89\x9a\xc9\xc9(\xcc\x92\
+e\xd6\x8c\x99\x1c\x7f\xc8\xaf\xa8\xd7j8\x8d(\xcd\x06\
+\xb0i\xb6\xcc\xc0\x14\x0a\x841\xd0\x22\xa2$b\xc1\xed\
+T\xb8\xe5\x83/\xc0\xb2\xfbvy\x1a\xa9\x7f\xdf_Y\
+\xba\xfb\xb2\xc9{\xe4\xbc\x9b\x87\xeb\x09\x08\xf3\xb7*\x5c\
+q\x8cGz\xd7MJ>\x03\xc8#\xfel\x07\xb2\xef\
+\xbagy\x12:\x8f\x89\xf8\x03\xc8\xbe\xef\xea\xc8n\xb2\
+\xbaw\xfc\xbfx\xefk#5\x93\xc3L\x93\xc6\xb4\xed\
+kTW&\x15\xb2\xcdk\xafU=V\xa7\xcd7\xf6\
+4{\x81\xcd\x8d\x97(\xa9\x00=]\xdd\x1c\xbd\xff>\
+\xbc7\xf5MZ+m\x10\x14\x91B\xd2\xd3]\xe7\xd2\
+k&\xf2\xcb\xb5\xd6D\xa0\xe2\xacE\xce6\xe1\xea>\
+\xe3\x9csX\xf1\x97k\x22\x94\xc3\x08\xe8\xf8\xb1\x9d\xe3\
+\x0f\xdd\x9f\xf6ysH\x82h\x9c\xb4w\xa7\xcc&\xda\
+\x8dS_\x1f\xbc\xfbN\xf6\xdei[\xa6\x7f\xf5%\xc5\
+b\x09\x19\x14\x10\x01\xf4F]\xac\xbd\xee:\xdc\xf7\xd8\
+Sl\xbd\xc3\x0ehe\x0e\xfb\x88\x99\xa2 >\xc8\x13\
+m\xd2`\x09)\xcc1\xdc>\xbc\xdd\x89#\x1e\xe6&\
+x\xe9H\x0c\xfa\x0f\x18\xc4\xfa\x1bo@\xb1\x12\xb1\xe1\
+f\x9bx\x0eL>B\x98\xb9\x88Y\xab7\xd7B$\
+\x12\xc5\xcd\x99%\xdb\x865\xf9\xc8e\x97\xe2\xa2\x89w\
+\xa0\x85\x02\x22\x90\x01\x81\x10|\xf3\xe9\xd7\x1c}\xc0\xce\
+6\xa8H's\x1e\xcf\x9d/~E\xdc\xc7\xc0.\x01\
+\x02\xab\xd1\xa01IR\xb4](\xb8\xd3\x91\xfc${\
+nh~\xc6\x9f,\xa3\xc8\xd2\x0d\xa4\xe9\xc0\x07\x0f\xde\
+\xbdl=\x09\x9a$u\x90y\xc7\xd5\x95-Y\x01\xab\
+\x1b_\xc9g\x00\xd9\x81A\x92\x04\xd1\xab,E\x8b\x16\
+\xc6:\xdb\xa8W\x9f6\x9aW>g\xf3\x8b\xc7|\xb1\
+[\xee\xda\xe2`\xec\xfc\xe1\xe3\x95\xd77\x1d\xb3\xbe\xa4\
+a'\xb3\xb4\xd0\xf1~\xb4kV\xba3\xeb3l\xd7\
+\x1d\xed\xec\x93\x5c\xad\xa7\x8b#\x0f\xda[\xfd\xfb\xddw\
+i\xa9\xb4\xa2e\x91@Bow\x9dK\xae\x99\xc0*\
+\xab\xad\x9e\x92:\xe9\x194\xfaE\x10\x06\x9c{\xe58\
+\xdd6d1\x0aQ!\x1e\xf2\x0f_~\xc3\xb9g\x9c\
+b\x89A\xc5}H\x8b\x0e\xd3\xef\xf6\xb9s9\xf3\xc4\
+\x93\xb9\xf4\xcf\xe7!)\x10\x04E\x10\xc6\x8d\xb5\xa7\xb3\
+\x97\x93O\xfb\x83:\xe7\xb2q\x0c\x1c8\xc0j/~\
+Q1\xfcM\x18\x84\x81D\xa442\xf0\xe6\xd7\xcd\xb5\
+\x0f\xe0\x06\x8c6\xf0VZ\xb3\xed\x0e\xbf\xe2\xa8\xe3O\
+#\x08C\x12\xae\xaes\xbfI\xbe\xb5\x7fc\x04r\x7f\
+\xd3\x08\x985\xdc\x8d\x1e\xb5,g_:\x89\xf6\xf6y\
+\x08%\x0c\x13\x90!\xdfL\xfb\x9e\x13\x0f;0\x89,\
+\xb4\x06\x85\xc4\xe0k\xf4\xedx\x89(\x85\x22Pv\x0f\
+\x03*\xe5*\x91M9\xef\xf7\xd1\xb1\xbe\x18\x96\x99\xe9\
+\xd5\xbeP\xcb\xd3\x1a\xec_\x1f\x22*K[\x0e\xb7%\
+i\xba\xf3`\xd4\x10\x8f\xe1\x836\xcb\x18\x5c\xf1\xb5\xe4\
+\x05^\x02(\xe2l\xab\x0d\x02\xdbuT\xd8{\x82$\
+\xf3\xaf\xfb\xed\xf7S\x10\xa7jv)\xee\x14\xc4\x99Q\
+\x95\x07 _\x19\x00\x83\x9b\xda&m\xf1s\xea\x93\xa9\
+\x0b\x9d\x91\xb4\x9e\x9f\xac\xd6\xc2\xaa\xf1\x86\xfbtu\xce\
+AJA \x8c,\x92\xc2\x18\xd04\xa0\x94\x93B\x09\
+\xe4\xdc\xb1\xcf]\xeds9l\xdf=\xf9\xe4\xbd\x8fd\
+Kk\x7f(\x14\x09\x03\xa8u\xd7\xb9p\xe2\x04V^\
+uu\xcf\x83\xce\x97\x9c\xfe\xec\x18\xed\xa2\x5c\x0e\xc5\x95\
+7]G8\xb0\x95 2\xee\xa82\x90Ly\xed\x15\
+n\xb8\xfa2\xab\x06\x0b\xcb\x0c\x1cC1\xc8;\xf9\xa5\
+\x97\xd9\x7f\xb7\xdd\x99\xfc\x8f\xe7)W\xaa&\xa3\x10\x82\
+\xa8\xaeXr\xc9\xa5\xb9\xfd\xe1G\xd9q\xf7\xdd\xa5\xb4\
+\x88\xaf\x1d\x17\xf5\x08\xcc\x87\x99\x8a\xb5\xa5d\xd4Z\x10\
+\x9f\x03\xd1X|\x91\x94L\xde\x98\x8d6b\xc7\xdd\x7f\
+\x0d1\xc3\x91\xdes\x0b\x0b\x91He\x9f\xc1\x1b-\x00\
+\xf2\xe0e^V\xb1DV\x98~\xaf\xbe\xe6/9w\
+\xfc\xcd\xba\xa7\xa7\x13i\x93\xec\x05Z\xf0\xf9\x87\x1fq\
+\xca\x11\x87R\xeb\xeeD\xc7\x92>\xdd\xaaD\xf2\xcd\xf4\
+iL}\xf3\x0d\x0aH$&\x8fC\xd4\x13q\xf7\xcd\
+7\xf3\xc6+\xaf\xf0\xe3\xac\x1f\xad\xe6\xe0\xc6!->\
+\xa8\xb8\x0fZ'p\xca\xd2\x80\xf2p\xda'\xbe\xec\x19\
+\x97q\xceHoN\xdc\xf71\x1d\xa9\xe4[M\xf2N\
+j\x0a\x5c{\x22\x81m\xccp|f\x94)\xb9\x07\x83\
+(\x7fb\xb4\xd7\x7f\xed\xa4F\xc2\xf5\xb4\xeb\x98#N\
+\x9dt\xa0a\xdd\xe4\x06\xee\xddv\xf5\xaa\x0c\x80\xe2\xcf\
+\xfc\xb5\x8cH\x7f\xe7\xb2\x0b\x1b`k\x8b|.\xc4U\
+\xa0\xea=tu\xcc\xe3\xa3\x0f?\xe5\xa3\xf7\xdf\xe7\x8b\
+i\x9f0w\xd6w\x14\x8a%4\x10\x120\xfd\x93i\
+<\xfe\xf0\xdfX{\x83\x8d\x180\xa0\x7fL\xf0\x8e0\
+\xa4\x90\xb4\xcf\x9b\xc3\xe1\xfb\xec\xc4\x8c\xcf\x7f\xa0\xb5\xb5\
+?B\x86\x04\x08:\xdb{\xb8\xe8\xea\x09\xfcr\xf5\xd5\
+I\x085O\xc5IC^k\x184x0\xe3n\xb8\
+\x85\xc3\xf6\xd9\x01\xd9\x15\xa0dD\xb9P\xe1\x8e\x1b\xae\
+c\xf8\xd2#\xd8|\xeb\x9d,\xa3\x94\x08\xa1\xd1\xaa\xce\
+\xf5\x13\xc6q\xdbu\xd7S)\xb7P(\x951\xca\xad\
+\xa0\xb3\xbb\x9d\xfd\x0f=\x92\x03\x8f>\x8a\xd0F\xb3\xe8\
+T\xbb\x99k{\xa9\x84%977\xb1\x0a@|`\
+\x85c\x0fi\xc3\x8f\xcf\x04\xbc\x0a\x1a\xfc\x87\x13\x1d7\
+\xc6\x9fL\x8ft\x06\xc7\xbc\x83\xba2u\xf8{\x11\xa6\
+\xed\xf56XG\x9cy\xc9\x04u\xc1o\x8e\x97\xa5r\
+\x19\x85F\x0a\xf8\xe4\xfdw9\xfa\xa0\x03\xf5\xb5\xb7\xdd\
+&\x90%\x1c\xf2t\xb6w\xf0\xc0]w\xf0\xecc\x8f\
+\xf1\xe9G\x1f\xd0Zn\x93\x22\x0c\x10\xda\xd8S*a\
+\x85;'M\xa2\xb7\xd6C$B\x96\x1f\xb5\x12ko\
+\xb0!;\xee\xb1\x1b\x83\x17\x1a\xea-m\x14\xda.f\
+\xf2z\xab3\xd3\x1f\x0b\x06\xe1\xd1\x8b\xf6\xb0\xc2c\x16\
+\xee\x9c\x0cw\xd2S\xfc\x9enl\xcb\xddk\x10\xd2\x96\
+\xbbdi7\xaf\xf8L\xbe\x08,\x04\x8c|\xeb\x83\xae\
+\xe7\xe262\xf8k\xc3\xa6\xd1B \x95N\xf2\x9e\xdb\
+gn\xa9\xe4&\xd61v\xa5\x93\x89v#I\x94\xdd\
+\x0cc\xd0iT3\x95\x0b\x842\x09,\xa5\xce.\xa7\
+\x14JI\x04\x0a)\xa1\xbb}\x0e\xff\x9a:\x85G\x1f\
+\xfc\x1b\x93_\x9dL\xfb\xec\xd9\x94d@\xa9\xd4\x8fB\
+\x10\x10\x01B\xda\x13\x82\x95\xa2\xa7\xa7\x9b\x9aR,5\
+ri\xb6\xd9u\x0f\xb5\xe5\xf6\xdb\xc9~\xfd\xfb\x030\
+w\xce\x5c\x8e>\xf0W|\xf7\xf9\x0c\x0a\xa5\x0aB\x86\
+Hi\xb6\xd0.\x9a0\x9e\xd1k\xac\xeeqL78\
+_/\xf3\x7f\xeb\xcc3\xc9\x07\xef~\xc0)G\xecK\
+\xe8T\x1d\x00\x15\xb0\xe6\x06k\xd3\xd3\xa9Yv\xf4\x0a\
+l\xb8\xf9\xa6\x8c=\xf7|>\x9c\xfa\x0ea\xb1l\x05\
+\xaaD\xd5\xea\xf4\x1f:\x90?^t9+\x8cZ\xd1\
+J\x15\x9f\xe3\xa6 \x1c\xdf\x13\xc0C\xf7\xdd\xc3\x84K\
+.\xc7\xa5\xfen\xef\x9e\xc5Mw?\xca/\x96\x1b\x99\
+>\xf1&.\xd9;y\xf5\xe7\x8d3)\xbe\x0d,.\
+\x1e\x9e\xa4\x97\xfb\xfe\x9bYE\xd5\xafA\xf2\xd8\xdf\x1e\
+\xe2\x8a\xf3N\xa55\x18D]\x18\xc3^T\xab\xb3\xe4\
+/\x96\xe3\x8a\x9bo\xa1}^\x07\x7f\x19?\x8e\x7f<\
+\xf58\xf5\xee\x1aa A\x07H\x114t3\xce\x10\
+\xa4\x22\xd0\x9a(R\xf4\x00\x1bl\xb6)\xfb\x1fq\x04\
+K\x8f\x1c\x99\x1a\x9f\xa3\x07\xbfKn,\x22\xf3,\x0b\
+\x11\x07A\xc7\x08}\xbc\x86F\xe6\x98\x07\x81,\x9d\xc4\
+\xe9\xe7\xedC_8\xbf\xfd\xf6+w\x1c\xbc\xd7\xa6\xe7\
+\x03\xd3\x81y\x90\x22\xdf\x84\x01L\xf9\xa0\xeb\xb9<[\
+\x1d\x99\xc1d'\xd2\xbd\xd8L\xf6\xe4\x16\x91\xf9\xa6I\
+=\xa9\xd7S\x9dR(\xab\x7fI]\x8b^\x7fur\
+0\xf1\x8a\xb1|\xf2\xdeG\xb4\x16\xca\xc8B\xc9\x1e\xf5\
+fTj\xb7\xff\x0c\xc9\xca\x1c\x1d\x19\xcb\xb0V\xd4j\
+u\xc2R\x99\x9d\xf7\xdb\x9d\x9d\xf7\xdc\x8f\x13\x0e=\x88\
+\x99_~GP(\x1a\xe2\x17P\xd7\x11\x97\xff\xe5/\
+,\xbb\xfc\xf2^\xcf\xb2\xd3\x94O\x04i\xf3\xac\xe9\xd7\
+\x8b\xcf=\xcf9\xa7\x1cAkq\x00\x1ae<\xd2j\
+\xa6\x1d)%==5\xaa\xa5\x0aJ\x84(a\xbe\xeb\
+\xee\xe9d\x83-\xb7\xe2\xb7\x7f\xfc#\xd5J\xd5\x93\xd4\
+>\x10}{H\xbaO\x0f\xdf{7\xe3\xc6^\x81T\
+\x8a@\xc0\xdc\xeeY\xdc|\xd7C\x8cpcj\x10i\
+yc\xf1\xebl\xa2\xfdH\x81\xf3\x82LI\xbc\xbe@\
+\xa4\xd3\x0f\x9d\xaf\x86\xc2Tg\xba#lR\x17\x03\xc3\
+\xbbn\xbf\x8d\xbf\x8c\xfb3-\xa2\x9f\x81\x91\xd0\xe8:\
+\x0c^d(s\xe6tRko'\x08\x9c\xc7\xa2\x17\
+\x06\xeck(^\xdf\x0d\x11\xd9\xd3\x8f\x95&R\x8a\xce\
+\xde^v\xdag/\x8e<\xf97\x14\xbdH\xc2\xb8\x02\
+w>\x9e?\xc4<\xd0\xf8\xd7\x92\xe4Th\xf7Xx\
+ \xc8\xf9\xd4]d5\x03w?\x9f\x81\xc3\xbf\xa6\xbc\
+r\xc7\x81{\xa7\x19@\xae\x0d\xa0\xc1x\xe8\xd2\xe7\xb8\
+\x81\x08\x8f\x08S/&\x1dss\xd30\xe9M\xca|\
+\x19\x8c\xab\xaf\xe1\x81\xd9\xdf\x8dz;\xf4u\xe3'\x04\
+g\x9ep\x0c\xdf\x7f\xf2\x15\x03[\x06R,\xb7P\x08\
+C\xa4\x08L\x06X@\x0bi\xd4d\xfbO\x0a\x89\x10\
+\x01\x81( E\x81R\xb1\x84\x88\x22\x1e\xb8\xe1v\xf6\
+\xd9bKf\x7f3\x93B\xa1\x1c\x13\xbf\x120\xf6\xba\
+I\x19\xe2\xf7\x07\xd80U\x99\x92\x18(\xcdqT\x8a\
+\x0d7\xd9\x98_\x1fr$\xb5z/R\x07\x04Q\x08\
+\x81\xa0 \x8b\x04\x14\xa8\x96Z\x10\x22\x04-\x90Z\xd2\
+\x1b\xf5\xf2\x9b?\x9d\xa3\xfep\xc1\x05&t\xd7\xc7\x8a\
+T\xbb\xf9\xc4\x0fX\xeb\xba\x99\xe9\xf8\xffn\x09\x90\x07\
+\xf8\xa6{I\x22\xf3\xd7C\x12\x88\x09\x22U\xa5\xdf\x86\
+\xce\xf9'\x93\xfa\xdc6\xa8\x90\x92\xde\xde\x9e\xe4\x10\x97\
+\x98)\x99\x95\xee\xaf\xf6\xda\x87\xfd\x0e?\x9d\x0e=\x17\
+\x84F\xaa\x00)\x05?~7\x0b\xd5\xd5E\x10\x96L\
+\x12V\x11$\xecJ\xa4\xd5xw\x1d`\x98K(\x02\
+$!\x22(\x10\x84\x01m\xe52\x8f\xddu/\x87\xed\
+\xb5+s\xe7\xfe\x98\xe8\xd6\xae\x02O\xf7\x8f\x87\xe8\x8f\
+\x13\x1a\x11[\x91>\xb6\xdcU\xe3\xbd\xe3\xd3P\x0c&\
+\x9d\xbe\xe7\x83<\xa6W?\xed\x95\xc8\x9f\xc1\xe6~\x00\
+>\x1e\xe5\x1c\x98\x90z/+\xf8\xc8p>\xff\x9b,\
+]8\xdd\xdf\x07\x8cN\x03$W\xb0z}\x983s\
+\x06'\x1fq\x8c\xb8\xf3\x86\x1b\xa9\x06\xad\xc8B\x19\x11\
+\xd8l\xb7B\x9a\x13\x81\x85\xc9\xc6\x83\xd6\xd4\xb5Fx\
+\x93\x15X\xcd\xc00\x83\x10\x19\x84\x14\x0a\x15\xca\xa5V\
+\x0av\xaf9\xd0\x9aH\xd7\xb9\xec\xfaI,\xbf\xe2J\
+4/\xf9\x84\xef\xd6\x81\x91\xd2\xb1\xc3\x89\xe1\xf4\x9a\x0f\
+\xdf\xff\x80\xaf\xa7}c\x02j\x84D\x12P\xd0E\xa4\
+\x10\x1e\xf3\x12\xe8\xa8\x97E\x97\x19\xca\x0d\xf7?\xc06\
+;\xec(E|2f\xa6\xad\xcc\xdf\xdc~i\xcc\x92\
+\xca\xba\xfd\x06\xb2@d\xad\xe7y\xf3\xd9\x17\xaah\x15\
+y\xdf\xc8t\x1dys\x98\xedR\xf6Y\xcaf)\xe8\
+\xe9\xe9\xe2\xb7\xc7\x1d\xc6n[l\xc0\x85g\x9ff\x93\
+w4\xf6k\x9f\x83\x0e\xe0\xe8S\xce%\x8a\x14:\x10\
+\xe6\xb0\x15!m\xd4\x1f6\x0d\xb8\xf9\xe7pA+E\
+-\xaaQ\x8fj\xa8(\x8a5\x02\x03s\xe3\xa7\x10\x00\
+\x81\x08AJJ\xc5\x90Y\x9f\x7f\xcb1\x07$\x1e\x88\
+\xb9\x12\xde\xfd\xcd\xd2G.\x00\x9b\xdc\x17\x99k\xbf\xfe\
+f\xcf4\x09\xbdf\x93Z\xe6\x94\xe6\xc7\x837\xed\x94\
+\xd5\xc1\xf24\xbe\xbc\x8eg\xdf\xcbr\xc2\xd8h\x903\
+\x98>\xeat\xd5vw\xcd\xe3\xe4#O\xe2\xab\x8f\xff\
+Mk\xa5\xcdJs\x89\xdb\xa3\xd6vJ\xb5\x86\xba2\
+\x13-\xa4@h\xe3\x11\x16\x84!\x08\xbb\x1eD\x19\xa4\
+ @\xa3\x09\x84\x8c\x95\xe8\x9e\x9e^N\xbf\xe4\x02F\
+.\xbf\xbcMw\xadm\xea\xab\xa4\xf8\x0aw\x8c\xc3\x9a\
+x;JH\xc3lj\xbd5>\xfb\xfcs\x9e\x7f\xe2\
+\xef<\xff\xf8S\xcc\xf8r\x1a\xd5b\x950H\xb6\x05\
+\x11\x02\xa9\x8d\xaa\xaa\x84D\xab\x88\xc5F,\xc3\x84[\
+n\xa3P\x08\x13\x18\xe4\xa8{\x9e2\x16K!\xff\xa4\
+\xdaF&\x0c2\x08\x12O\xb8\xbc\xb9\xf0\x18\xb9\x7f\xeb\
+\xed\xc9/\xf1\xecS\x8f\xb0\xc2J\xa3\xd8l\x9b](\
+\x96[\xd2s\xd6\x8c8\xfcv\xb2\xedy\x04$\xb4\xe6\
+\xfe;\xef\xe5\xe5\x17\x9f\xa1P\xa8\xf0\xf0\xdf\xeed\xd4\
+*k\xb3\xdd\xce\xbb&\x12\xcf\x80\x0b\x09\xac\xb3\xde\xba\
+\x5cs!F\xf3\xd3\xa0\x84]\xfaY\x7f\x07)\x04\xf5\
+z\x0f\xf3\xba\xe7\xa0\xa2\x10\xd9o\x08a\xb9\x84@\xa2\
+j5\xa2\xce\xb9\x84Q\x17\x22\x08(\x17[\x10v\xf7\
+B\xe0\x11K\x00?N\xff\x91\x13\x0f\xdd\x9f\x89\xb7\xdc\
+C\xa5Z\x8d\x0f\x91\xcd\x1d\xdf|\x04XS\x9c\xcf\x83\
+K>wo^\x04\xa4\x0d\x03\xe9\xd2\x9c\x01d+\x89\
+\x1b\xce\xe8&y\x92>\x0f#\xb3E\xf7q\x1d\xabT\
+\xae}\x91\xd2Bb\xa4Fq\xd6\x89\xa7\xf2\xf5'\xff\
+\xa6\x5c\xaa\x18no\x8f\x98\xd6\x00\xca\xc4\xc3w\xf6v\
+\x10\x94\x07\x11\x0e]\x8ab\xcb\xc2h\x02\x82\x00\xea\xdd\
+\xb3\xa8\xcd\x9eA\xf7\xdc\x19\x04\xbaF\xb1XE\x8a\x00\
+\x17\x14\x1a\xaf\xd6\xb5F\x88\x88Zm\x0ehPZ\x11\
+;\x1a{L \xde\x91\xb0\xe7\xa4;\xc2\x97R\xd2\xd3\
+[\xd3\x1f\xbc\xf3\xaex\xee\xc9G\xf9\xe7\x8b\xffd\xc6\
+\x97\xd3(\x17\x8a\x14\x8aE*-UP\x01\xc2nI\
+\xc5\xcb,[\xb3\xb0\xf5,\xb4\xf0`sV\xa0W|\
+\xe7L\xc7t|\xcfi\x1fhi\xab\xbf\xb6GsK\
+\xcf\xef\x91\x05\x9aG\xf7\xca\xe7\x9f}\xc2\xd1\x87\xef\x85\
+\xa4\x8d\xde;nb\xde\x9c\xb9\xecq\xc0\x91FMo\
+\xc6\xd0\xb3u\xe6!u\x8a8\x04\xed\x1d\xdf+!B\
+\x09\x10\xc8\x22\xed\x1d\x9d\xe6\xdc\xd2\xc8\x0c6f\xb4h\
+\xce>\xf5\x14U*W\xa4\x90\x12%AD\xa0\x09\xac\
+\x17F\x9d\x1f\xdb\x7f$\x1c\xba\x02\xc3\xb68\x96\xd6\xa5\
+W\xa0\xd4\xbf\x1f\x85J\x01\x19H\xa2\xba\xa2\xd6>\x97\
+\xeeY\xb3\xe8\xfc\xcfT~x\xf3\x11d\xfb\xf7\x94K\
+\xadFs@Z\x18KBQ\xe4\x87i38\xf3\xa4\
+#\xb9|\xd2-\x09\x5c}Z\xf0\xc7\xdc\x17\x5c\xbd\xb1\
+\xc6\xf4\x95\xf7\xfe\xfc\x88\xbf\x19\x9d9\xef\xcf\x9c\x92\xcf\
+\x00\x9a\xa9\xefy\x8d\xfcT\x8e\xb4 \xa5A\xea$Z\
+B\x0cc\x01\x0f\xdds'S'\xbfB\xb5\xd2\x8a\x16\
+\x01.'\xbd\x96\xa0\xeb\x11\xed]\xb3\x08\x86\xfc\x82\xc5\
+6\xfc\x0d\x03\x97]\x99BK\x1bR\x0a\x8a\xa1B\x88\
+:\xbd\xb5\x88\xa8V\xa3}\xc6\x8ftO\x7f\x9fo_\
+\xbc\x8d\xa0\xfd\x07*%#\xc5bw\x14\x01\xe5\xb0\xc4\
+\x85g\xfc\x9e\x15VZ\x8d\x85\x17\x1fn4\x05m\x88\
+S!\xe2\x95\x8c\xdbd\x97\xc2\x04\x0bM}s\x0aO\
+\xfc\xed>^~\xe1%1w\xcel\xca\x85\x22A1\
+\xa0\xad\xc5h+\xd2\xaa'\x12\x81\xf3\xbc\xd3\x02\x88\xb4\
+]\xb7\x09\x94\x10(Ug\xb9\x95F\xc7\xe0\xc8\x9e\x84\
+\x1b\xef;;\x1c\xd2\x16\x9f\xec})\x15\xcaS\x97\x95\
+\x8eL\xa0\x90\xdb\x9b\x8ftj\x1b\xb0\xe9\x9cx\xe5\x99\
+'\x9f \x0c\xfb#eHX\x5c\x98\xa7\x9fy\x84_\
+\x1dp\xb8N->\xe7\x87\x17\x0b\xf0\xfc\xc0#\x8e\x13\
+\xcf>\xf1$_M\x9f\xc6\xc0A\xfd\xd8y\xf7]\xe3\
+\xad2\xb0\xb0\x90\xf0\xd8\x83\x0f\xf3\xd9\xbf?\x92\xe5R\
+\x15\xa2 \xc6\x95Hj\xea\xdd\x9dt\xc9\x22\xcb\xecs\
+)K\x8e\xd9\x90~\xfd\xaaT+%\xec\xd0\xe3\xaeh\
+\x09\xb5Z/\xf3\xd6X\x8b\x85\xb7\xdc\x93\xef'?\xce\
+\xf4G\xae\xa0-\xa8\x10\xca\xc0\xb8\x11\x09\x09\x01\x84Z\
+\xf0\xde\xebSy\xfc\xa1\x07\xd8z\x87]\x9a\x8f\xa9\x0f\
+\x15<\xf5\xbe\xbf\xd4v\xf4\x97'\xfd\x7fNi\xf2m\
+>\x03h\xa6\x9a5+\xff\xd3\xce\xf5U2\xf5:\x06\
+\xd9>o\x0e\x13/\x9b@\xa9\xdc\x82\x96\x81\xc5\x06\x13\
+\xd3]\xef\xeef^\xbd\xc6\xf2{\xfe\x81E\xc7l\xc7\
+\x80\x01-\x14\x8b\x05\x82@\x12i\xe3 \xe3\xd4\xdd\x08\
+E4B1o\xe6H\x06\xaf\xb99\xdf\xfe\xe3\x1ef\
+<s\x03\xfd*\xad\xb1\xe1\xd0\x1c\x9f\xa1\xa9\x16Z\xf8\
+\xdd\x89\xc7p\xfd=\x8fX\xe9\x9cx\x0b\xa2\xa5\x89\xb0\
+\xab\xf72\xed\xd3\xff\xf0\xf0\xfd\xf7\xf1\xfc\xe3\xcf0w\
+\xd6\x0f\x84\x85\x0a\x85\x82\xa0\xb5j\x18\x90\xf4\xd6\xee\x12\
+\x81\x8e\x22\x22\x01\x85\x92DwG\x08ir\xf5%\xe0\
+\xd7T\x07\xf7c\xb7\xfd\xf67\x9a\x81UMb\x1em\
+\x19B\xbc.\xf6\xd6\x88\x8e8\xb4\x961\x83\x88\xfd$\
+\x22\x85\xb4\xa1\xc2&\xff^\x93\x84 M\xe6w\xf4\xe8\
+U\x88\xa2N\xa4\xecG\xad6\x8fu\xd7\xdf\x12d\xf8\
+\xd3sk\xcf\x07\x7f\x8aaQ\xdc\xf1\xd0\xdf\xf9\xe2\xf3\
+\xafXl\xf1ET\xa1P\x94q&'\xfb\xa7\xbb\xbb\
+\x8bk.\x1fK\xb1T\x06\x9c\x83\x8e$\x92\x9a\x9e\xee\
+y\x04\x8b\xaf\xc9Z\x07\x9c\xc9\xb0e\x97\xa1Z\x0c\x8c\
+\x13\xa96\xf1\x06*\x8e\x884 (\xc8\x02C\xfa\x0f\
+\xa0\xdf\x80\xfe\xf4\x1f\xb27\xfdG\xae\xce\x87\xd7\x1eO\
+\xa9c\x9e\xd9\x86\xc5\xcc\x89\x14\x92j\xa1\xca\xc4\x8b\xc7\
+\xb2\xe9\xd6\xdb\xa9b\xa1\x98o(YP:j\xf6]\
+\xf6z\x01\xe1\x96\xfb~\xa64\xb7\xec4\xeb\xc8\xcfy\
+\xdeW\xe9\xcb@\xe23DMBl\x02n\xba\xf6Z\
+d\xbd\x06\x81M\xeb$\x03\xb4\x14\xd4z\xba\xa9\x0fX\
+\x8c\x8d\xce\xbd\x9f\x95w\xdc\x9b\xe1\xc3\x06\xd3\xdaRB\
+x\xc4\xaf1\xd9q\xb1\xc4X\x0cC\x16Zl!\x16\
+_v\x09\x96\xd9\xe9 ~q\xf4\xb5t(c\x14R\
+\x08\xebql\x16y3\xa6}\xcd\xcd\x93\xc6\xa5l\x97\
+h\xc1\xb4\x8f?\xe4\xaaK.f\xbf\x9d\xb7\xe7\xd0=\
+v\xe7\xf1{\x1f\xa4\xd6\xddE\xb5\xad\x1f\xc5R\xc1\xe4\
+\xe1\x0fB\x04\x01\x9a\x00\xad\x02\xeau\xc9Jk\xac\xcd\
+\xc9\xe7_\xccmO>\xc9\xcd\x0f\xff\x9dQ\x1blH\
+Wo\x0f\x11\x02\x85\xa0\xa64\x03\x86.\xc4EWM\
+2kM\xab\xf3;\x95S[+\xb2l6\x93\xced\
+\x93Q-\x95VH\xef\xa3\xa8^G\x86\xc5\xfc\xf9\xc8\
+\x08&\xf7s\x8du\xd7\xe3\xa0\xc3\x8eG\xd7\x0bl\xbd\
+\xdd.\xec\x7f\xf8\x09\xd9\xd7s\xfb3\xdf\xfau\xba\x1d\
+sl[\xc0\x92K\x0e\xa7\x10\x16\xa5qB\x13f\xe3\
+\x1c\xc3\xd0\xee\xbd\xf56\xba;\xbb\x90\x84h\x1d \x08\
+\x89\xa4&\xea\xed\x22\x5c|\x1d\xd6;\xf5J\x96^~\
+\x04-eC\xfcQ\xa4\x89\x94ay\x91\xd50\x952\
+\xf1\x96\xc60\x18\x11*\x180\xa0\x95\xe1\xab\xad\xc2\x9a\
+g\xddAo\xffE\xa8\xd7\xba\xed\xd2\xcf,7C!\
+\x89::\xb9\xf5\xfaIfJ2}o6\xce\xffJ\
+Y\x90\xfa\xf2l\x12M\x1e\xc7~\x00oz\x8e@\xf3\
+\xad\xfc\x7fK\xf2g\xea\xf7\x83Bf\xcf\xfc\x8e_o\
+\xb3\x1d\xe5b\xc5F\x85\x05@\x80V5\xe6\xd6{\xd9\
+\xfc\xa2\x87\x198t\x11\x8a\xa1\xc9\xf8\x13\x01*JB\
+L#\x97\x03\x0b\x12G\x09\xbb\x96\x97\x05\xc9\xec\x1ff\
+\xf3\xcd\xd4\xb7\xf8\xe4\xda\xa3i+\xf7\xc7\x1c\x02\xae\x88\
+\xb4=\xf8\xb2\x08\x93\xee\xba\x9bZM\xf1\xc2\x93\x8f\xf3\
+\xc2\xd3\xcf\xf0\xef\xf7\xdf\xa3T(\x12\x16\x0a\x80\x84 \
+\xb4\xebq/*NCoo\x8d%G.\xcfF[\
+l\xc9\xd6;l\xc5\x90\xa1\x83\x13DW\xc6H\xf5\xd6\
+\x1bo1\xf9\xf9\x17TGWM.9b\x19\xb6\xdb\
+y\x1b\xaa-\x96\xf8\x85\xf1\xd3nJ\xf0\x99\x92\x0a\xa6\
+q\xcb\x0d)x\xe0\xce;\x98x\xe58t$\x08\x02\
+Mw\xe7<\xae\xbf\xe7\x01F.;\xb2\xcf\xfa\x8c\xea\
+mT\x10\xb3\x1e\xd6\xd4ju\x8a\xa5\x22\xa8\xc8\xba\x5c\
+\x9b\x1d\xc5<\xdc\xc8[\x22\xfbu\x9b-?ML\xe4\
+\xb6\x0d\xedm\x8e\x0b)\x12\xff{\xeb}v\xd0\xce;\
+3k\xe6,k\xf1\x17\xa0\x02\xb4\x88h\xafGlz\
+\xd1\xdf\x19\xb2\xe8\x10B\xcc.\x8cS\xf9#\xbb\x8c\x8b\
+\x94\x0b@J\xbc\xe7\x02\x99\x04II!P\x12\xbe\xfd\
+\xe0\x03^;ww\xda\xc22\xc8\xd0\xd8Z,NP\
+\x0a\xb8\xeb\xe9\xe7T\xa1P0F(\xb9\xa0\xd2\xb5\x09\
+|~\x82\xea\xaf3\xaf7+S\xa7\xbcr\xc7\xc1\x19\
+?\x80\xdc%\x80\xdf^3\x83ebxin\xe4M\
+\x0d(\xa7n\x0b\xa7\xd8\xd8\x965;4sh\xf8\xdb\
+}\x0f\x22E\x80\x0a\x8cO\xbf\xeb\xc1\xdc\x8e\x99\xac{\
+\xfaM\x0c\x1e\xb6(\xd4\xec\x96\x9b&\x8e/W\xda8\
+t\xc4\xa1\xeeV\xdch\x93 \xd0 VM\xb3\xd0\x90\
+\x81\x14\xd7Z\x97\xee\xe9G\xf1\xf5\xa3WS\xa9\x0c\xa0\
+\xae\xcd\xfe\xb0\x12\x12\xd9\xab8l\xb7\xdd\xe9\xec\xe8$\
+\x08\x03\x0a\xc5\x02\xad-\xfd\xac%ZZGni|\
+\xea\xd1\xf4\xf6\xf60p\xd0\xc2l\xba\xed\x16l\xb3\xd3\
+N\x0c_z)\xc0\xf6Iy\x90\x13\xa6\xbf\xab\xae\xb1\
+*\xab\xad\xb1\xaa\x14\x08\x1b\x99\xe6\xc7L\xa4\xd1\xcay\
+y\xf9\xf4\x10?\x8b\x81\xe7\xa9\xcb\x18\x0d=,\x84\xd4\
+ku\x0a\x85\x10\x97\x1e#o\xbe\xd2Q\x04n\xf9 \
+\xe3\x87\x1am2\x0bE\xda,3\xb0\xa6\x0c\x9d|\xef\
+\xf7)W\x01\xd0\x99\xbf\xca6d\x09^\xbb\x87\xce\xcd\
+\xd9\x053\x08\x01\x0a>\xff\xe4?|\xf1\xe54Z+\
+\xfd\x89O\x10\x01\xba:\xe6\xb0\xf2qW0t\xf8\x10\
+t\xaf\xa6\xae\x936\x1c\xf1\xc7\xe3T*\xb6\x87\x08L\
+(\xb5t\xb9 \xfc\x97\x1d\xe7\x00\x00 \x00IDA\
+T\x00\x11i\x86\xad\xb4\x12\xdfms4\xd3\x1f\x1eG\
+\xa5\xdc\xdf\x1aU\xcd\x88\xe6\xce\x9d\xc7\x1b/=/\xd7\
+\xdbt\x8bxc\xabY\xc9\xe2\xb9\xfb\xebGX\xc4v\
+\xbb\xb4\xe2\xd6\x94\xce\x9a\xdd\xf3i+\xaf4\xdd\x05\xf0\
+mZ\xb9.\x9c\x99F\xf2\x8c\x96\x8e4\xb3^\x85~\
+\x1bn\xe0\xfew>\x93I\xea\xd5\xc6\x1d\x18\xcd\x8bO\
+>NX*\xe1o\xce\xf4\xd6\xbbhYf-\x96\x1e\
+3\x86\x9ev#\xe5\x94U}\x952\x91\x5cJ\xdbu\
+\x9e\xd2(\xa1\x094D\x02\xa4\xd2h)\xe3\xd3\x82z\
+j\x9a\xd6\xd6\x0a\xcb\xeft\x00\xdfL~\x9ah\xee\xd7\
+\x04\xb2\x04\x22\xb2\x1aC@\xa8%\xad-\xfd\x12'\x1c\
+\x85U\xefA\x07P\xab\xd5\xd0B\xb0\xf6F\xeb\xb3\xf3\
+\x9e\xfb\xb2\xcaj\xa3\x8ctr\xa1\xa5\x0d\x906#\x16\
+\xd8\x00&+\xad\xf3#?\x92_>\x13\x8e\xef9\x18\
+\xc6\xcdx\xeb\x15\x9f\xd8\xea\x02]pk\x7f\x99\x9a\xe0\
+x>\x5c\xf0`l;\xf0\xdb1\xb3\xa73}\xd4J\
+\xc4t\xe8\xe6\xdf\x9f{\x1f'\x1a\xbdS|f\x95\xe9\
+\xbf\x86\x98{\xeb\xe4\x9d7'O\xa6\x18\xb6\xd8\x13\x8e\
+4\xa8\x00%\x22\x18\xfc\x0bFo\xb1\xb9\xc1\x07\xfby\
+\x04\xb1s\x11X\xb5_\xd9\xcdb\x9dd1p\x16y\
+m\xe7Ch\xa39,\xb7\xf3>L\x7f\xf6\x0e\x88\xba\
+Q\xb8|\x06\x92J\xa1\xc4s\xcf>\xad\xd7\xdbt\x0b\
+\xe1\x832;/)\xd8f\xde\xc9\x19q<e\xee\x9f\
+\xef|\xed\xd7\xd7W\xf1\xbf\xcf\x96\xa6\x1a\x80O\x80\xd9\
+\x09\xf4;\xe3s02\xef\xf9R)K\xe0x\xd7\xbe\
+w_\x96\x09\xc4\xa8e\x0fn\x9c\xf1\xcdW|\xf2\xd9\
+\x7fhk\x1d\x048\x97NMoo\x17k\xfd\xfa\x18\
+j].\x0e_\xc7\x0c@\xdb\x138\xcc\x9c*3.\
+\x0d\x1a\x11[\xf1\xa5R\xd6\xf0f0\xbd\xde\x1bQm\
+\x1b\xc0J{\x1e\xc7\xdb\x13N\xa0\xa5ZD\xe2\xb2\x09\
+\x8b\x18\x17\x85CF!\xa8Euz\xea\xbd\x8c^s\
+m6\xddz;6\xdal\x03Z\xdbZ\x13b\xf4\x8e\
+\xe5r\xaa|\x16\xf0\xdaj\x02\x09gi\x80\x96\xd1T\
+2\xb0J\x11U\xfc,\xc3\x1a\x8cN\x1b\xbfSW\x11\
+E\x0c\xdb\x09\xbc\xae\xc4\x0c\xdb\xd7\xc0lU\xa9\x18\x8c\
+x\xdb\xcac\xd9\x22\xd9\x03\xc8C:\x0d\x89\xfa\xbe@\
+%\xc3\xfc\xb4\x7f\x0f\x90\x9a\x7f\x7f\xf4!A!HT\
+\x0f\xa9\xa8\xf5t\xb0\xec6\x87\xa1#\x91\xc2%w4\
+\x9a\x11\x0cV\xea;We\x01J\x18\xfc\x906\x8aT\
+H\x01J\xc5\x87\x9eV\xfb\x0dd\xd8F{\xf1\xe5c\
+WQ\xaa\xb4\x11a\x9c\xb5\x90\x8a\xf7\xdez_(m\
+v\x80\x5c$\x9e\xd7\xf3\xf8\xda\x8d KCd\xae}\
+\xcd\xda'\xfef\x1au\xb6\xfe\xbc\xbf\xd9\x92\xcb\x00\xb2\
+\xf2&\xb5\x1c\xb1\x17y\x9c([G\x1es\xd0\x8e^\
+\xfc\xe7\xba\xf9\xa0\xb2\xf7\xdf\x7f\xe7C\x0a\xb2\xea=Q\
+f_\xbe:\x8ca\xab\xadE\xd4c\xef\xc6\x92\xcef\
+\xd5A'\x19\x80\x95Q\xfb\xb5;\xc0^h\x94\x10\xce\
+\xa6d\x99\x85 \x8a\x14\x0b\xaf\xb5\x11\x85\xfe\x8bA}\
+\x1eJ\x9bu\xafq\x19\xb2\xed\xab\x88\xb9=\x9d\x8cX\
+n4\x9bl\xb39[l\xb7\x1d\x83\x06\x0dN\xd3]\
+\x0a2\xce\x84\xef\xe2\xd2A\xc4Pv\xdf\x18r\xd6\xee\
+\x8c='\xea\x11\xf6 \x934aj\x1aa\xda@(\
+\xee\xa9\x85\xbf\xaakd`(ZI\xa7{x\xf3\x8c\
+\x7fa\xee\xba\x0c=q[qc\x9e\xa2\xafE\x12\xeb\
+\xee\xc3\xc0\xa3\xc2$\x95\x88\xaf\xf4\xce\x0fU\x9b\xdf\x9f\
+\xf1\xc5t\xab\xae\xabX\xf3\x8b\xa2\x1a\xfd\x7f\xb1\x02\xb5\
+^\xa8\xeb\xf4$\x98L@\x961\xd8%\xa1\xd9:\xb5\
+I\xcf\x84Ic\x16\xe0\xd2\x84Y& \x04Qo\x9d\
+\xc5\xd6\xdf\x9c\xcf\x1f\xbb\x06\xe7\xeba\xb6\x83%3\xbe\
+\xfa\x94\xce\x8e\x0e\xaa\xad\xad\xb9aX~q\xbf}\x1a\
+j\xf6\xbe&\x9f\x9e\x808L\xdeW\xc2\xb2\xdf\xe7\xb5\
+\xefJ\xbe\x06\xe0\xe9\xfd\xf1\xfc\xbbm'\xdbX*\x8c\
+\xc8\x9f\xffl'\x1d\x8d\xc9\x84\xd0\xe3:u\x22\x04=\
+<K\xad;\xb4H\xd7\xff\xc1\xbb\xffRaX\x94\xc2\
+\xb3\x1e(\xd5C\xff_\xacBP\x94D]\x91\xad+\
+\xe6\x00^\x9b:\x11\xae\x9eu\xccq{\x04$\xce\xa0\
+\x02\xa9\x05\xe5j\x89\xca\xf0Q\xf4\xfe\xfb%D`\xe3\
+\xc6\x85A\xb6R\xb5\xcc&\xdb\xed\xc2\x8e{\xee\xa9\x17\
+Yl\xb1$\xcdL3}\xcb\xb4\x96\xfa\xd5\xdc\x97P\
+&\xe7\xd9\xd97}\xb8\xc6\xb4\x95\xd1\x9e\xfa\x9al\x7f\
+\x92\x946y\xf0\xfd#\xc5\x84\xdf\x86\xaf\x844v\xc3\
+k#\xcd\xbcb\x1f\xa0\xec\xb7\x1e\xa670<\x5c\x9e\
+\xc3fD\x9e\x14\xab\xaf\xa5\xdeoo\xef\xb4\x1aU\x18\
+\xa7\xfd\xd2Q\x91\xf2\xe0\x85\x89\xea:\xc5\x84]\x1e\xc0\
+$\xc5\x9aC\x15\xb3\x0c\xd2h\x84\xd2\x08)\xa9[\xe4\
+5\x87\xa8\x9a\xa5\x8e\x10\x82\x96\xc1\x8b\x12\x16J\xb6\xeb\
+\xce\xc3PR\x07\xe6\xfc8\x87\x96\xd6V/x9\xd5\
+\xf9x\x82D\x86hS\xaf\xf9D\x0d\xa9\xf3\x0a]\x7f\
+c~\x9a3\xd91-\xe5\xf5!S\xf2m\x00Y\xcb\
+\x9cg\xa1\xf3\x897\x9eG_\xc7\xf2u\x1a\x91\xfc\xf6\
+\xf7\xae!\x83\x5c\x99\x1eZ\xfa\x8a\xbd\xbc|f2w\
+\xd6,\x89\x14h\x22\x02Q\x02\xeaD\xb5\x1a\x03F\xac\
+\x00\xdd:\x9eX\xbf(\x9c\xd7\x9bm\xcc&\xf8\xd4\xd6\
+\x9b&68k\xab\x1e\x0a\xc3\xf1\x15\x10\xd6$\x83F\
+\xae\xccW\xef=\x83\x0c\x0a\x04\xc2\xc4\x11\xf4\xd4z8\
+\xec\x98\x13\xd9f\xa7]\x0dFg\xe3%\xfa(\x0ey\
+\x13\x84w\xc0lb7NY\x87\xeceV'\xcc2\
+W\x0f\xf6y\x18\xa0T\x0da\x13e:\x84\x8c\xdb\x88\
+\xe1\xe1\xda\x16\x09\x01'A\x8c\xe9\xf7\xec\xb5\xce>\xf7\
+\xebL\xdd2\x84\xecJ#,\xdc/30\xa1\x9do\
+&\xf1_G%3\xbe\xf9\x0e\x11\xc8x\xf9\x11i\x85\
+(\x96(\x0f^\xc84\xad\x94\x99\xff\xd8s(\xce\x11\
+e\xb6w\x85]\xe7\xa3\xec\xb2G\xdb\xf8\x06\x11\xe3D\
+\xa4\xcc\xb6\xa9\xaak\xaa\xfd\xda\x08\xca\xfdPQ\x87\xf1\
+\xe3\x90\x80\x12H\x02\xda\xe7\xceK\x13`\xa2\xa8\xa6\xe8\
+\xc41\xc9\x0c\xf8\xd2\x9a\x97\xa39\xe7\xcb\xe1=\x8f\x99\
+GV5\xc8\x9b\x17_\xd9\xca\x94\xbew*|=\xc5\
+I\xe2\xacE/\x87\xd8S\xa2\xa8at\xb8\x00\xae\x86\
+\x81\xa6\x80c\xeb\xd6\x99Auu+\x84p\xc9#\xed\
+\x01\x9c*\xa2Pj#jB\x84JE\xf1\x84;M\
+ \xce\x1a\xe4\xdc\xea\x94\xf2N\xb0U1k\x15ZS\
+i\x19\x8c\x92\x112\x10I\x0e\xfa\xa8Fo\xcd\x9a\x8c\
+r\x16\xb5v\xd1\x91\xdb\x1f\x97x<A\xe8F1\xa0\
+Q\x06\x9e\xd9\xb5V\x16^\x22\xfd(\x17\xf6\xa4\xdf\x03\
+\x93\x00T\x88\x1c\xc7\x9f\xbc9\xcf\x82U'}\xd2\x9e\
+\x08rK\xad\xb8m\xef\xbd\xe4S\x0b\xd7\x1c\xd4K\x12\
+\xb9:\xf8Y)\xaf\xc9\x81\xa5 \xaaw\xf2\xf1\x07\xef\
+\xd1\xd9\xd5\xe9\xa1\xa3!h\xa94a\x18\xa2\x22\x9f\xf8\
+5\xbe\xc8\xd4`sH\xe2\xfe\x17\xf7\xcf\xc0\xc0\xaa\xaf\
+\xca\xec\x93DQd\xdd\xc0\x81B\xd1$j\x11\xae\xc7\
+\xc2\x0a\x15\xd24\xe2h&O\xb9q\x82\x11\x12c\xab\
+\xebXZAJ\xea\xf5\x89:\xaf\xe4\x19\x1f\x1c>\xe4\
+\xa0c\xdf\x9e\x80>\x925C&\xbf\xb3Y- \x8f\
+;\xf9\x12\x22\xbb}\x90\x1dX\xac\x0a\xa9\xc4\xbf\x5cD\
+8\xff<3\x19\xe6\xa5R\x81\x5c!\x1c)g\xb9\xb7\
+\x93\xdf$(\x22n\xd0\xabD`\xd6\xb3ue\x0e\x14\
+T\x02sL\x95\xd0\xd4\x89(\x97E\xe6\xebd@n\
+M\xed\xf6\xca]\x8d\xfe\x00\x8d*\x9b\x1e\xb6\xf0\x9e\xa5\
+\x9c\xfbS\xfb\xde^Uy\xf3\x92\x85\xbd\xc3}\x9c\xe6\
+\xa3\xe9\xed\xb2\xeb`\xebH\x94\x1a\x87S\xbf\x94S\x8c\
+4NF\xfbY\x8f|-\xc6\x1f\x95\x0fNw\xcb\xb7\
+\xf3\xc49\xf9b\x98I[\x9f\xe73\x11_%\x0c\xa3\
+V\xef\x81ZW\xfd\xed7&\x87o\xbe\xf66/\xbd\
+\xf823\xbf\xfc\x9a\xb6\xd6\x8a\x87\xeb\x1a\x94 \xea\xed\
+Du\xcd#\xa8\x0c\xb2\xcf\xd2\xdb~&\xaf\x90\xb0j\
+\xbe\x01\xa8R\x02)\x12\xe6o4\x00OP\xd8~D\
+*\xa2\xa7s.\xd5Bh\x05\x94\x04UG\xa1\xa9T\
++\xe9\xf1\xe7\x11\xbeO\x1fy4\x96C\x03\x0d\xf3\x9d\
+5\x9f\xe4\xa1X\xd6J\x9f#\xee\xf3S\x82\xa9\xbaI\
+\xb9\x9c\x87`\xd9N:\x84\xf4;\x9a\x1dDv0y\
+\x1do\xc6t\xb4\xb9\xa9m\xe0J\xb9\x22\x88\xb4\x88O\
+\xa3Q\xdaZ\xef{\xdb\x09\x846\xea\x9f\x90F\xea\xfb\
+\xc1\x15J\xfd\x7f\xed\x9dw\xbcU\xc5\xb5\xf8\xbf3\xfb\
+\x94\xdbA\x9a\x80  \xd8\x01;E\x14\x11k4j\
+|\x1aRM\xfc\xf9b\xc9K^\xf2\xf3\xbd\xf8\x125\
+\xe5\xc5\x9e\x98\x98\xa2\xc9/\xb1\xc4\x96\xc4D\xa3\xb1\x1b\
+c\xac\x88\x22(\xa8\x11\x0b\x8aJ\xef\x17\xb8\xdc{O\
+\xdd3\xbf?f\xcf\xde\xb3\xf79\xe7\xde\x0b\xa2\x90\xe4\
+.>\x97\xd3f\xcf\xacY\xb3\xda\xcc\xacY\x13\x1c\x14\
+\x8a#fWm+P\xd5\x1a\xad}\xb2^\x9a\xfc\xe6\
+\xb5\x08\xcfl\xf1!\x05\xda7G\x83\xd3\xa9\xe6\x90\xb9\
+\xdd\x9cz\x11\xb9D\x8d.\x9a\x7f*XJ\x14aP\
+\x8dK\xaa\xc8\xfa9\x15\xc6-tW\x10\x13\xbehm\
+\xc1\x0a_\xa9\x943\xd5I\x8d\xd0\x0a_\xf8D;\x04\
+vNn\xab\xb1\x22\x14)6{\x18\xca\x1d\xd4\xe8;\
+\x91\xec\x0c\xee\xa0\x1a\xd1S\x0e]T\x8c\x1e\x86W\xcd\
+&r\xa9\x98\xc3/\xb4\x97g\xcf\x9a\x9dz\xe9\x85\x17\
+xv\xe6\xf3\xa9\x8dkW\x92M\xa7\xc9f\xeb\xc9\xd6\
+\xd7#\xb4u\xff\x15J\x05*)U \xb7\xf2}\xea\
+F\xf7\xc3\x0f\x0ff\xb9\xa44g5\xc2\xbeim,\
+\xba;\x0eU\x8c\x85\xd6\x8ab{+\xaa\xb0\x11\x9d\xee\
+\x1btI\xa2\xd0dRY\x9a\xfb4G}\xae6\x0d\
+r\x95yRP\xab\x09q5yI\xcaeu\xfb\x12\
+{NKP\xa5bE\x7f\xaa{\x00\xaaT\xc0Ke\
++\xbe\xaf\xc6\x8c\x95{O\xd5\xbd\x86\xee\xea\xa9\xf6\x1b\
+T\xb8\xc0\xfd\x07\x0c'bc\x93\x03.\x93\xc9\xd2\xba\
+\xf8e2\xe93(\xe6\x09\xe3\xfc\xa3\x8b\x1e\x026N\
+\xb8\xea6.\xc0.\xee\xd8\xef\xc2\xa6\x85@d\x05\xeb\
+\xdf\x9eC&\xdd`,\x946g\xdf5\x9a\xbe\xfd\x9a\
+*\xf6\xda\xe3\x82\x13YJ+H\xd6\xea\x19{'\x83\
+ \x1c{\xba\xd0\xb8E!\xef\xd8\xd5\x9fj\x96!j\
+\xb2:\xbd\x83\xcf\xd6e\xd5\x8ep\x09@\xa4\xb2H\xfc\
+@\x01\x09\xb4_ S\x97\x0d\x85:9\xc3\x88]\xa4\
+\x1a\xd9\xda\x18b\xa1GP1\x9d\xd3Q\xaf\x85@h\
+\xdbG\xf7z\x13\x93\xacS\xa3\xd1\x85v\x7f\xf9\xaa\xb5\
+\xde\x8b\xcf?\xcf\x9c\xe7g\xf1\xea\xcb/\xa7\xda7n\
+\x22\x9b\xf2Hg\xebhn\xeacr7x2\xb8x\
+U\x82\xd4\x94\x14xR\xa3\x94 \x93j\xe0\xbd\xe7\x9e\
+a\xe8\xf8C\xd8\xdcV\xc4\x932\x96\x8b!\x22\x93\xc0\
+\xa6\x88G\x07\x8a\x1f*\xf8\xc1\xd2!\x95N\xb1j\xfe\
+Kx\xc2\x18$\xe3$\x98\xd4\xf2\x03\x07\x0f\xa3\xa5o\
+\xffh \xaay\x00\xd5\x0c]2\xda\xaa\xc2\x00&\xc6\
+;\x09I\xa3\x9b|V\x83\xd0P\xf6s\xb9\xe4\xa3\xd5\
+\x14\x80\xef+'\x94\xb3\x96VI\x22\xd4\x95\x16\xeaN\
+\x19\xd4`^K\x1ca\x8f\xb5\x09\xd8}\xaf1\xe8\xb2\
+\x82\x94\xc6l\xc8\xf9\x08\x99\xa2\xf5\xe5\x17\xe8,\x14\x91\
+\xd2\xc3\x0f\xae\xbc\x8a\xb4{\x95fu\xc4\x9a\xee\xe7d\
+\x99R{\x8e\xfc\xa2\xd7\xa8\xaf\xcb\x82\x10xx\xf8\x94\
+\xd1\xc2g\xc8\xf0\xa1Ni\xbb\xaa\xec\xceo\x8c-\x8b\
+\x1cYw\xe3/\xba\xc50\x12+\x1d\x88AP\xb2'\
+t\xac\xa1\x1c\xc2\xa0\xa7X\x11#|o\xbf\xf9\x06\xf3\
+\x9e\x9fI:\x936vVH\x1a2-\xfc\xe6\xda\x9f\
+p\xcc\x09\xa7\xb0\xef\xf8}h\xd9\xa9_L<#\xf7\
+?\xea\xafI\xaa!*\xf0\xb2B\x14\xb5jk\x08\x94\
+\xadS\xa3\x00T\xb9D\xc7\xe6\x8d\xbc\xf9\xc6[\xcc\x9b\
+=\x9b\xe7\x9f\x9f\xe9-{g9Z\xe5H\xa7\xb3d\
+2Y\x9a\x9bZ\xc2CT\xc2\x89\x83\x0eC\xad}\xf0\
+\x04\xe8\xb2@\xa6 \x9b\xa9g\xc9\xcc\xfb8\xf4\xdc\xaf\
+\xe0\xc9T\xa0\xfc\xa3S\x9bV\x11\x98\x0c\xd7\x8e\xa7h\
+\xbd\x05\x9d\xe8m`$\xea\x1a\xd3\xbc\xfe\xe7\x1b\xa9k\
+\xe8\x1b\x1e\xaaBJt\xb1\xc4~\x87\x1c\x80\xb0AU\
+\xc9\xf1q=e\x17jy\xc2\xd5<\x80ZPM\xd1\
+T)\xe2\x97*\xd7|R\x892\x00\xb2T.\xadO\
+g\xea\x87Vh \x0bI\x0dSM\x11\xd4\xb2\xea\xd5\
+\x04\xbd\xab\xce\xb9\xa0a\x8f}\xf6\x01\x94I\x05-\xcc\
+M\x16Bx\xf8\xc5\x0d\xacx\xf6QFN=\x91B\
+A\xa0\x94$\xcc\xab\xdf\x95\x02r\xab\x0f\x98@\xa92\
+B\xa4\xc8\xd4\xa7Y6w&R\xe7\x80z\x84RA\
+\x08\xa9\xa6\x7f\xbf]\x190pp\x8c\x08\x91\xdeJ\xda\
+F+\xe8\x12\x9b\xe5>\x8al\x8d\xb6\xc0\xdc}\x81\x98\
+%\xadE\xbb\x9ad\xd2\xe1\xff\xb6\x98\xaf\x14O=\xf2\
+(w\xff\xfeV\x16.X@c]\x93\x93\x80D\x93\
+Ne\x99?\xf3\x19\x9e\xfb\xdb\xa3\xe8T\x86cN8\
+\x89\xcf\x7f\xe9K\x0c\xdee\x17\xecr\x5cR\x05h\xed\
+.\xd2i\xa7E\xed\xfc\xefN\x15\xec,QR\xe8l\
+cs\xdb\x06\xe6\xccz\x9e\x17g\xcfe\xde\x8b/\xd1\
+\xb6~-\xe9\x94$\x9d\xce\xd0P\x9f\x06\x915\x07\xb6\
+\x10H\xe9\xae\x97\x98\x0c?\xaa\xac\xc8\x15r\xb445\
+!|\x1d${\xf5\x83}y\x81W\xdc\xc0\xdf\x1f|\
+\x80\x83O\xfd$\xad\xad\x05\x04\xd1j~\x08\x09\x8f\xa0\
+\x9aa\xb0\x89B3\x99\x0cK\xe6\xce\xa2\xb8\xe2m\x1a\
+\x9aZLo\xccqB\x8a~\x81)\xd3\xa6a\xb3\x05\
+\xc7\xc0\xda\x83\xf8 U\x7f\x9f|\xae\xabr\xd5\x14G\
+\x17\xf5u\xb6\xb7\xafK>\x91T\x00\x0a(o\xd8\xb0\
+!\xd7P\xdfR\x03+*\x19\xb1+\xeb\x9f\x84ZH\
+W\xab\xdf\xe5\xe0\xe0\xb9!Cwa\xd7\x11\xa3Y\xbb\
+b9Z\xca \xa3\xac\xa2\xae\xbe\x99W\xee\xf8\x7f\x8c\
+>\xfacx%\x13\xaa\xe3\xfb6r%\xde\x90\xeb\xe6\
+\x87y\xf1\x95I\x87%d\x0aa\x8f\xe2\xa6\xe1\xf5;\
+~ACv'\xc2Ks\x02\xf7\x7f\xfc\xa4\xfdL\x1c\
+\xbdN\xba\xc6\xeej\x80\xb9\xeb/\xd9\x9d\xc5\xef-b\
+\xf5\xf2%L8\xec(\xa2\x90\xa2*j\xbc\x16\x9d\xbb\
+\xa0\x9d&\x12?\xfby\xd9\xfb\xefq\xd5w\xbe\xcd\xa2\
+\xd7\x16\x90\xad\xcb\xd2\xd2\xd0\x82 \x05\x98HH\x89Y\
+KQ\xa4i\xccz\xa0\x153\x1f~\x80\xbf>p?\
+\x9f\xfd\xf7/q\xc69g\xe3\xd95\x10\x22\x05\x17\x09\
+}\x1c\xdc\xd8\xbb\xb0GJS\xcc\xb5\xb1t\xc9\x12f\
+>\xf1\x0cs_\x98\xcd\xc2\xd7\x16\xa0)\x91\x12\x192\
+\xd9\x14\xcd\xcd\xc6\xca[J\x08\x93\xc7\x0b\x00\x9f\x14f\
+LA\xa6R\x8c?\xf0@&M\x9e\xc4AS&S\
+W_\xc7y\x9f\xfc\x14\xb2PBIIJ\x9b\x10\xef\
+\xc6l#\xaf\xddz\x0d{O\x9bJC\xfd :s\
+\xe6\x06d\xdf/\x87.\xbe\x16\x12mc\x03\x12\xfd0\
+\xe74\xfcP\xe1\x90\xd6\xcc\xbf\xfeJ\x1a\x1a\x9b#j\
+k\x81\x12>}v\x1a\xcc\xc1\x87NV\xb13@[\
+j\xe0\xe2D\xec\xfe\xb9\x9e\xd6+\xcc\x14\xe0\x9d\xf7\xde\
+\xe9\x0c\xbe\x09\xd5Q\xc5\x14 \x95J\xa9R1\xb7\x0c\
+\xc1\xe8.\x19\xb0\x1a\x1254T\x8c\xb5\xb7\x94\x18\x89\
+\xf2B\x08\xa6\x9d0]\xdd\xf1\xff~#\xbdT\x1dR\
+)\x90\x92\x14\x82R\xdb\x0a\xe6\xde~\x13\x87\x9fu.\
+\x9b6\x02\x98\xc1v\xc1\x0a\xbc\xaf4Z\x95\x912\x85\
+\xafJ\xc14\x83\xf0\xbbLC\x9a\xb7\x1f\xbe\x1f\x7f\xc3\
+\x12D\xb6\x11\xcf^v\xa9!\x97\xef\xe4\xb8\x8f\x7f:\
+\xb0\x16\xd5b\x22]+X\xd9\x99__{\x15\x0b^\
+\x9d\xc7\xedw>DK\xbf!\x8e\xea\x88\x9eN>U\
++=t%\xb9\x9c\x00\x17\xe0\xf5\x97\xe7q\xc1\xb9\xe7\
+\x92\x91\x1e\xd9\x86F$\x9e9\xd4Dt\x90E\xa3\xcd\
+\xd1V\xad\x01s\x5c\xd6\x93)\x9a%\xdc\xf3\x9b[\x98\
+;k\x96\xfe\xe9\xcd7\xebT:%\xb5M\xad%#\
+l#\x85`k\x03\x90h\xbfL)\xbf\x99\xbf\xbf\xfc\
+\x12\xcf<\xfe\x0csg\xbf\xc0\x9a\xe5+\x90\x9e\x22\x9b\
+i\xa0\xa1.\x8b\xa4\xde\xb8\xd0D\x81=R\xc8 ]\
+\xad\xc4W\x8a\xb2\xafhl\xaa\xe3\xa0\x09\x07q\xc4\xb1\
+\x1f\xe3\xe0\xc9\x13T:\x9d\xb6!\x0c\x08\xe0\xd43>\
+\xc5\x1f~y\x03\xa9L\xbd9\x8c\x09 $\xcd\xe92\
+\x0f_\xf6}>{\xfd\xb5\xf8+\xd3\x94\xca>\x96/\
+\xb4\x0d\x0fwh\xaf\x82\xa8A\x0d\x81\x8bo\x92\x886\
+\x0f\xa8\xe3\xf1\x8b\xcf'\xdd\xd1\x0a\xd9\xb4iU+\xb4\
+P\x94\x0aEN\xff\xc2'H\xa5\xd3\xd2\xdd1\xb1\x95\
+V\x1b\xb7n\xc72\xc1\xf7\xe1\xbd\x1b\xdd\x80\x1b\xbe\x13\
+\x939\x01\xab\x96/y\x1f(\xb8\xe5E\xe2}\xfft\
+:=\xf2\xda\xeb\x1f\xf8\xf6\x81\x13\x8e8%\xe9\xd9\xbb\
+\x0a\xad\x1a\xf2\xddM\xff\xad\xb8@uf\xaf\xb6\x16\x12\
+\x7fo\xba\xb7i\xc3F\xce<\xe5\x13\xe6\xdeyi\x92\
+6\x1ak\xa1\xd8\xbcq3\x13.\xb9\x951\xfb\x1f\xc8\
+\xe6\xcd\x8ab\xb0\xf2i\xefxSZ\x1b\x0b S(\
+?\x8f\xf4\xeaP\xaa\x84Y\xdc3\xd7Ze\x1a\xb2t\
+\xacZ\xc1\xb3\x17\x9dAK6\x83\x12\x1a\xbba\xact\
+\x99\xbe;\x0f\xe0\xa6\xbb\xee\x0e\x0f\x9f\xb8s\xe5x\xbf\
++{\xb1\xb9u='\x1e9\x19-\x8a|\xff\x92\x1f\
+r\xd4\xc93\x12\xe5\xa2L\xb5.\xb8\x03\x1b\xa3\xbf\xf3\
+hD#\xf3\xc3\x8ae\xcb8\xf7\xf4\xd3HK/<\
+2\xed\x81\xf1\x9c\xac\xc8\xe92J\xdb\xf0f\x10:\xbe\
+X\xe8k\x1f_iF\xee\xbb\x0f?\xbe\xf17A\xe4\
+\xa0\xc6W\x02)\xb5;u6\xad\xfb\x8a\x8e\xb6V\x9e\
+\x7f\xeai\xff\xb9\x99O{/\xce\x9eK\xae\xa3\x9d\xba\
+\x94\x87\x97\xae\xc7\x93\xc2d\x1erq\x97\x02\xadex\
+\x0c\xb8\xac}J\x85\x22\xbb\x8c\xda\x9bI\x93\x0ff\xd2\
+\xd4#\xd9s\xdc^d2Ygz\x15)\x1d\x81@\
+\xf9e\xce\x9e\xf1o\xb4\xaf\xda\x00\x9e\x17!\xa54\x85\
+B;\xde\xe8\xc39\xf9\xea+(\x17[\xe8\xec(\x07\
+I@\xcc.\x80\xaf\xec\xa1\x9f\xe81\xfb>\xd3\x90F\
+\xf8m\xcc\xba\xec\x9b\x14\xde\x7f\x0dYWg(\xe5\x9b\
+9\x9cF\x91\xca\xa6\xb9\xe3\xe1\x07U&\x9d\x95*\xe0\
+\xe2h\xb7$>\x8d\xaf\xf5\x1e*e!)+\xf6}\
+2\xcc\xd8\xbe\xba\xbb\xc3\xf6Y%\xc2\xb4\x09\x9c0m\
+\xd4\x8c\xb6\xb6\x0d\xf3\x0a\x85\xc2J\xa0\x13*=\x00]\
+*\x95\xfcM\x1bV\xadtgq\xc9]\x0b\xb7S\xc9\
+\xad|[^&~w\x91r!)\xf4IBD\x84\
+\x8a\xecd\xdf\x9d\xfa2\xe3\xac\xcfq\xc7/o\x22\x9b\
+\xad7\xd7\x87\xa1\x10\xbe\xa4\xa5\xa9\x91\x17.\xfd2\xfe\
+\xc5\xbfb\xcf\x89\x07\xb2i}:\xd0\xf6Q\x9dB\xa6\
+P\xaa\x0c\xc2\xbcJ\x99\xa6\xec\x03\xc2\xa3\xa11\xc3\xc6\
+\xa5Kx\xe1\xb2\xf3hN\xa7\x10Z\x99S\x83A\xef\
+\x0b\x85\x1c_<\xef\xab\x08O\xa2}m\x986\xa4H\
+4,\xee|Xk\x81\x14f\x81\xef\xf7\xb7\xddH]\
+}\x13\xa9\xb4\xe0\xd6[n\xe0\xf0\xa3\x8f#\xd3\xd0\xb7\
+\xa6#U\xc1D\x8e%\xb0\x9eA4\xf1\x88\xd6\x16r\
+\x1d\x1d\xfc\xcfyg\x05w\x22\x98\xc4\xa7\x1e\xc6\xe5\x95\
+R\x83\xd2h\xbfLY\x95\x91\xda\x9cw\x97B\xa2\x84\
+Fh\x19\xba\xe0\x1e <\xc5\xfb\xaf\xbd\xc6\xed\xd7\xff\
+\x82/\x9e\xf7U\x93='@H\x08\xd0\xbeb\xdd\x9a\
+U<\xf6\xd0#<\xf7\xecL\xdez\xf5\x15\x14E/\
+#\xeb\xc8f2d\x9a\xfb\x86\x03+\x85\x8c\xa2\x181\
+\x13 \xa1\xa1P.\x91I\xa5\x19\xbd\xf78\x8e8\xfa\
+(&M=\x5c\xef<x\xa0\xb0\xbcd\xfa\xe8\x1e\x5c\
+\x8e\xb8D\xa3\x90^\x8ao]v5\xff\xf9\xb9\xd3\xe9\
+S\xdf/X\x114\xca\xac>\xdbHa\xd1,\xee\xf8\
+\xcc\xc78\xf0\xcb\x97\xb1\xfb\xf4\xe9\xe47):sf\
+\xcc\x94.\xc5xRkA*\xe3Q\xd7\x94a\xe9\x9c\
+Y\xbc\xfc\xcb\x8bh(\xf9\xc8l\x860\x96D\x80V\
+>\xb9\xc2f\xbey\xd1\x95x\xe9\xacL\x9a\x81\xe4\x8e\
+_2\x9c\x03*c\x84B\x05\x9f\x98\xb9\xba\x0a\xc3\x95\
+\xa9\xa4Q\xae\xe0\x9d\xe0\x8b\x5c\xc7\xa6\xcdk\xd7\xae\xda\
+\x84\x89y\xae9\x05(\x03\xa5\xf7\xde}g\xc5\xf4\x00\
+\x81Z\x96\xa7\x1a\x93V\xebhX6\xa8\xcf\xfe^M\
+\xeb\xb9\xdf\xd9\xf0\xdc\xf0>4\xa7\xab\x0a\xc1\xe9\x9f=\
+\x93\xbf\xdcs'\x9d\xad\xa5\xc0I\x0b\x9e\x92\x1e}\xd2\
+%\xe6]~\x1e\xad\x9f\xfa\xbf\x1c8c\x06\xa5B\x9a\
+\x5c;h\xcaA:\xb0\xc0\xf5\xf7\xcd\xa2\x9eT>\xe9\
+\x86z\xa4\x9fg\xc1\x9d\xb7\xb1\xfa\xe1\x1bhIg\xcc\
+\xfc\x10\x1f\x15d\x07F\xf9\xecs\xd0\xfe\x1cq\xcc\x91\
+\x84\x97\xbauG\x1dM\xb0\xbf,yq\xe6\xd3\xfc\xe9\
+\x8e;\xc8\xd65 \x84f\xe9\xb2\x15\xfc\xe2\xc7W\xf9\
+_\xf9\xafoz\x99\xc6~\x81\xfbn\xa3\x03\xe3\xeaR\
+\xbb\xf5\x11\xb7\x00\xeeX\x98\xb9\xad\xe0\xa6\xeb~\xca\xc6\
+\xb5\x1b\xc8f\xea\x11\xda3\xa7\xd9\xcc\xf1\x16\xca\xa5\x02\
+y_\xd04x8^\xc3N %\xe5\xf6N\xd4\xfa\
+\xc5P\xea@yvK\x0eLvbI*\xe5q\xf7\
+M7s\xd0\xa1S\xd4\xd8\xf1\xfbK\x10\xacY\xb9\x9c\
+'\x1f{\x9a\xe7\x9e|\x94\x05\xf3_\xc6K)\xb2^\
+\x1d\x8duu\x08\x1a\x03!\x04\xe9\x05ui\x93\xdf@\
+\x09\xb3\xceP,\x96\x188d\x18\xe3\x0f\xd8\x8f\xc9\xd3\
+\x8ed\xff\x83\x0e\xa0\xbe\xa9\xc1\xf6Q\x00a\xa8\x94\x8a\
+\xf5\x92\x18GXq\x1a\xb3\xf7\x9e\x9c\xf1\xb5\xaf\xf3\xc7\
+_^K\xa3\xec\x1b\x96T\x02\xb2\xd9z\xd2\xaa\xcc\x82\
+k\xbe\xc6\xc2;\xc71\xe6\xa4O3\xf0\xa0\xa9\xa43\
+}H\xc9\x8c\xc9g\x00\xa8b\x89|\xe7\x06\x96\xcf~\
+\x81\xc5\x8f\xfe\x9e\xf2\xeawh\xca4\xa0R\x12\xe1\x07\
+k:\x02\x10&\xb7\xc4\xfe\x13'q\xe4\xf1\xc7%0\
+2\xd3\x19\xcb\xc3a(\x0aq!\xae\x18[\x97\x8b\x1c\
+%_\xcd\x13\x08\xfb\xe6\xf2\x80\xc3\x0c*\xfe\x91\xd6M\
+\xadk\x80\x1c\x89\xbd\x88\xa4\xa7\xd9\x0c\x0c\xa9\xafo\x1a\
+\xf7\xd4\xdc\xb5\x7fJ\x1eB\xa8@\xd2y_M\x03U\
+\x05\xa7P\xb5\xe3\x8dP\xbb\x8ed;\xef\xbc\xf9:\xe7\
+}v\x06\xfd\x1a\x06 \xa5\xddD\x0bl\xafR\x14\xf2\
+\x9d\xf8-C\x18q\xea\xd9\x8c\x9az,^\xb6\x19\xbf\
+X2\x07D0\x1e\xbf\xe7eh\xdf\xb0\x8e\xc5\x7f\xbb\
+\x8f5O\xde\x89\x97o%\x93\xae\x0f\x8e\x06\x07\x0e\x9d\
+6\xf9\x03\x8aJs\xeb}\xf7\xd0o@\xffp\xb58\
+\xdc\x0a\x8a;\xe6\xb1\xcf\xebV\xad\xe2\xb6\xebo\xe0\xc1\
+{\xef\xa2\xa9O\x03f\x01\xce\xec\xffwvnf\xe8\
+\x90a|\xe9\xdc\xb39t\xfa\xc7Hg\x1b\x89\xdfp\
+\xdcS\xfaF\x94\x5c\xb5l\x19g\x9e|2\x0d\x8dM\
+ Sx\xcafKV\x14J\x9d\xf4\xddk\x22\xc3N\
+>\x87LK\x13~\xc9X\xe4|{'\x9d\xab\xd7\xd2\
+\xb9p6\x1b\xe7\xfe\x99\xb4,!\xcd\x15\x19\xa0A\xe1\
+\xa3\xd1\x8c\xd8sO&\x1du\xb4~\xfe\x89\xc7\xc5\xdb\
+\x0b^C\x95KdSu\xe0I\x93,3\xb0\xf2\x96\
+\x02Zx\x08\xe1c\x22\xf9|J%\x9f\xbd\xc6\x8e\xe7\
+\xc0)\x93\xd5\xe1\xd3\x0e\x93#G\x8f\x89s\xa3\xb3}\
+\x1b7'Ig\xd7U\x90nx)\x5cv\xe1\x7f3\
+\xe7\x89\xbf\xd1\x94\xe9K5\xd0ZQ,\xe6A\xa4H\
+\x0d\xd8\x15\xfa\x0cD+\x85\x9f\xeb\xc4\xefXOy\xe3\
+JRB\x90\xcd6\x04\xa7WE\x90\x91(\x98v\x08\
+s\xe6\xa4\xff\xb0\x01\xfc\xf8\x86\xdbhiivk\xa7\
+\x92\xa3\xbb\x86$\xf7\xb8\xc2\xdc\xd5\x98\xbb\x82\xef\x1e\xdd\
+\x8eO(\xcd\xfb\x17_x\xfa\xfe\xff8\xeb\xf8+\x81\
+\xf7\x80\x0d@\xd1\x96u\xa1\x0e\x18\x9aJ\xa5v\x7f\xe0\
+\xf1\xb7o\xee7`\xf0\x90d\x85[\xd3\xb1\x0f\x02\xdd\
+\xd5\xf1\xe8\x83\x7f\xe6g\xdf\xfb_\xfa6\xf45l\xe0\
+\x12#\x98\xf7\x97J\x05d\xba\x89\xec\x1e\x87\xd0\xb0\xeb\
+8\x1a\xfa\xb4\x90\xcb\x15\xe9\x5c\xbd\x84\xce\xc5\x7f'\xb7\
+t\x01\x0d\x19\x8ft\xba\x1e\x85\x04]6\xd6\xdf\x0e\xb8\
+\xd6\xb4\xe77\xf1\xddk~\xaa&\x1fq\x84$\xf0\x02\
+\xa5L\x8af\xa5~\xff\xcb}w\xf3\xc3K/G\xca\
+\x12\x0dM\x8dH\x9dB\xab\x14B*4e|\xbfL\
+\xd9/\xb0\xb9}#\xa3v\x1b\xc1-\x7f|\x9cT&\
+\x8a\xc1\xaa\xf0)\xaa\x12D;\xaf\x92\xeb\xaf\xfd1\xf7\
+\xff\xeeN2\xd9z<!P:\x85\xf4 \xd7\xd1\xc6\
+.\xc7\x7f\x89\xb1\xa7\x9fC\xb1T@J/\x9c^!\
+%\xf9\x92Og\xebf6.~\x97\xf7n\xf9\x06u\
+\xe5\x9cI\x89\x15\xe4]P\x98-\xafR\xa9\x88\x97I\
+\x07!\x00\xe6\xc0\x82\xcd\x86\xe4[a\x91\xc1\x82\x9aR\
+x\xd9f\xc6\xee\xb7\x0f\x07N:\x8c\x89\x87Of\xe0\
+\xceC\x9cED\x17\xff$\xfd\xaaM\x1ek\xd1;Z\
+\xfaRZs\xd1\xd7\xbe\xc2\xebsf\xd2\x94\xe9\x97$\
+V\x0c\xcc:\x80\x01\x19\xacM\xd8U\x1d\xe5\xc4Hk\
+\xad\x03E\xa0(\x95|\xfa\xef\xd2\x9f\x1f\xfd\xea&\xfa\
+\x0f\x1cH\xdc\x9e\xbb\x13\xb6\xad\x83\x1e\x09}\x0f*q\
+\x17\x0d\x7f\x7f\xdbu?\xfd\xe9\x0f.\xf8\x1d\x91\x02P\
+P9\x05P@\xa1\x5c.w\xae]\xb7ji\xff@\
+\x01\xc4\x5c\xcc\x1a\x08T\xfb>9\xac[\xe2\x1d$\xeb\
+\xa8\x05\xc7}\xfcT\x0aE\xf8\xf5\xe5\xdf\xa5OC?\
+\xd0D\xf3\xe4\xc0\x22e\xb3\x0d\x80\xa2\xbc\xf096\xbe\
+1\x93\x0dJ\xe1\x0bMJxd\xd3\x192\x8d\x0dh\
+!\x83#\xb2>J\xca0\x98E\xa3i\xcfm\xe0\x82\
+K/c\xf2\x11GJ\x93\xf7\xce\xae3\xb9\x03\x1dX\
+\xa60\xf9\xbea\xda\x09S\xa6r\xfag\x16\xf1\xc8}\
+w#u\xda\xcc\x81e\xe0\xe2k\x93\xcd\xb8\xa3s\x13\
+S\x8f<\x86Sg\x9c\x89\xb0\x0bXU\xfa\x1f\x1a\xc8\
+\xaa\x10\x08\x8a\xf2y\xfc\xbe\x07I\xa53\x18\x07Z\x90\
+\xf2\x04\xc5B\x8e\xfe\x07\x1f\xcf!g}\x85\xb6\x0d>\
+\xe9t\x9d\xb9\xe7P\x01\x94\x11RRW\xe7\xd14|\
+g\xfa\x0e\xedO9\x7f\x09\x8bo\xf9\x1auui\xa4\
+28I\xcc&W:[\x87\x16\x1a/H{\xa6=\
+\x89\xd0\xe6\xf8\xac\xd6\x9aB\xb1\xc0\x80\xc1\xa38\xe4\xb0\
+\x89\x1cq\xf4Q\xec\xb5\xafY\xc0\xd31E\xe5\x82]\
++\x09\xeec\xd0 \x10\x08\xe9N\xb1\x5c\xa1O.\x91\
+\xb9\xde\x81\x89\xe0\xbc\xe2'\xd7\xf2\x83\x1f\x5c\xcds\x0f\
+\xdcN\x93\xd7/\x16<\xe4\x82\x94^\xa5\xcd\x0e\xe6\xf9\
+2\xf0\x00\xa3\x8dZE\xbe\x90g\xcc\xf8C\xf4e\xd7\
+\x5c%\x9a[Z\x22\xbaWL\x03\xb7\xde\x00V\xb3\xe4\
+\xee\xe7\x1e\xd5\xab\xe3e_{y\xf6\x22\xcc\x14 \xb6\
+-\x96TU)`'`\xe4\x15W\xdft\xf6Q'\
+|\xee\xec.\x9br1\xd9\x16\xe6\xbe'P\xa3\x9d\xbf\
+=\xfc\x00\xd7^r)\x8d\xe9\xfa\xca\x1f\xa9$\x5c\xf4\
+>x\xa7\x09g\xe0\xa1\x05P\x8a\x5cIq\xe1\x0f\xfe\
+W\x1d>\xfdX)Q\xc1\xde\xb0HX\xff$$\x97\
+z \x97\xeb\xe4\x9aK\xafb\xf6\xd3\x8f\x91\xca\xa6\xd1\
+\xd2\xa7\x94\xf7\x19\xb9\xfb(\xfd\xbd\xcb\x7f(\x06\x0d\x1d\
+F\xec\x80\xecV\xd2s\xd5\xf2%|\xf1\x94Sil\
+l\x02\x912w\x1c\x09\xc1\xe6\xce<\x1f\xbf\xe5q\xca\
+\xa5F\xa3\x16\xec\xed\xc8\xc20\xb6\xb9\x92L <\x89\
+\xe7\x09r\xa5\x12/\xfc\xe4\xfb\xe4\xe7\xdfC6So\
+\xd6\x04\x84F\x04\x09?\xcc>\x02h\x09e_\x91/\
++F\xee\xbe\x17\x07M\x9e\xc2\xb1'\x1e\xa3w\x1d5\
+JT\xee\x8d\xd4\x9a0\x9a\xa3\xd9J\x99\xf5\x99R\xa1\
+@]Cp7\x83\x8c\x0bw\xf5\xfa\xaa\x7f\xd6\x1a\x1e\
+\xba\xf7.\xfd\xeb\x1f^.\x1aeSh\xe1\xbb\x02\xd7\
+\xeb\xb3\xc2\xaf1w8\xb6\x17r\xfc\xfb\xf9_e\xc6\
+\x19gV]\xd0va\x8b\x86\xefC\x96\x9d\xce\xb65\
+\xab\x8e\x9c<\xe2\x1c\xe0\x0d`\x15\xd0a[L\xf6\xc3\
+\x07J@\xee\x96\x9b\xae\x9d\xdbm\xee\xa6j^\xdc\x87\
+\x0d5\xda9\xea\x84\x93\xb9\xf6\x8e\xbb\xe83|\x10\xc5\
+b!\xd0\xc7\x22\xfcs\xd9(\xe6\x91h3\x9fS6\
+;P\xc0\x8c\xb9b'\xa3\xf6\xde\x97\xeb\xffx\x07S\
+\xa7\x1f+%&\x87\xbc\x902\xc1\x94V)\xb8`\xcf\
+\xf1FP_\xdf\xc0\xc5W^\xc2\xd1'~\x9cb\xb1\
+H\xb1Xb\xdfq\xe3\xf9\xf9\x8d\xb7\x8bAC\x87\x03\
+\x89\x03\xb2=\xa4g\xb2\xd8\xd2\xf7\xdfG\x0a\x93\xe8S\
+\x0a\x15\x5c\x14R\xa2i\xf7\x83I77\x07\xd7\x9a\x09\
+|\xdfX\x5c{\xe25\xdc\xccT\x1a\xedCZx\x8c\
+<\xe64\x0a\xbe\x8d^\xc4\x9c\xc9\x97&\xf6>W\xea\
+\xa0 \x05\xa3\xc7\x1f\xc4\xe7\xbf\xf2\xdf\xdcr\xff\x03\xfc\
+\xe2\xb7\xb7\xf1\xef_=\x87\xe1\xa3FV\x11~K\xaf\
+\xe8U\xa9@\xb8\x82\x8c\xcdR\xc2oo\xf8\x09W|\
+\xf7\x1b\x01\x8d\xcd\x09=[>\xb9*\xae\xe3\xd7D\x93\
+T\x12B\xc0I\xa7\xce\x10\xb7\xdc\xfb\x18c\xa7\x1cF\
+[\xe7\x06\xfcr<.\xc4\xd4kia<\x18?\xd8\
+.\xd6ZS\xf6\xcb\xb4\xe7:\x187i\x227\xdds\
+o(\xfc1\x5c4$cAv\x14\xe1\x07X\xf4\xde\
+{\xef55\xf5\xdd\x8c\x89\x01(\xb9-Vl\x03\x06\
+\x05\x8a\x0b\xdf|ye\xeb\xfa\xd5+\xed:@U\xf8\
+\xa8\xac~\x0f@\xa0\xd9u\xd4\x08~q\xfb\x1d<r\
+\xef\x83\xdcy\xf3oh[\xb7\x8el*\x03\xc2*\x01\
+{\x12\xcd\x0fu\x9b\xb5\xf8J\x9bh\xb8\x5c1\xcf\x98\
+\xf1\x07\xf0\xf9/\x9d\xc9!S\x0e3\xc1\xbb\xca\xdc\xeb\
+'\xa5\xb1\x04\xc8(\xdcS)\x11%\x9a\xe8\x0e4|\
+\xf9\x1b\x17\xe8'\xffv\xafh\xdf\xac9\xff\xa2\x8b\xf0\
+\xbc\x9e\xdd\xceV\xbb\xdf\xa1\xc7\x8a\x94\xb0j\xf9*\xec\
+5VV\xb4U\xb9D\xf3\x80\xd1\x94s\x16g\x1d\xa4\
+\x15\xb7\xd3\x16\x0d\xc27\xb4\x90\xe6\xe4\xa5\x06\x1a\x06\x0e\
+\xc7\xcb4\x22(\xe3\x0b\x85\xa7%(M\xaa\xa5\x91+\
+~p={\xee3F\xa53\x19\x19\x85\xcf\xaap\x1b\
+\x12\x08=\x0c#\xc8\x06?\x93xU\xa1\xb44\xeb \
+\xca\x8c\x8a'\xa1\x90\xeb\xe0\x0f\xb7\xff\x9eb\xb1\x93\xa7\
+\x1f{\x84#\x8e9\x81`\x19\x01)\xa3z\x81p\xfc\
+D\x90\xcc\x83`\x8dN&\x86B\xa3\xe9\xbf\xf3@\xbe\
+s\xf5U\xac_\xfb\x0d\x1e\xfc\xd3\x9f\x99\xf9\xd7\xc7X\
+\xfe\xde\xdbd\xd2u&\xfd76\xfa\xd0l3\x96\xca\
+e\xca(\xc6\x1ex\x08\x13\x0f\x9b\xa6\xa6\x1d7]\xf6\
+\x1f8\x18)\x95S\xafcHD\x85\xfa\xee9|\x04\
+\xf2\xf3\xea\xfc\xd9/\xb6\xb7ol\x07\xf2$n\x7f\xa9\
+\xc6}eL\x90@\xdb\x9b\x0b\xe6\xbdx\xe8\x11'\x9c\
+T\xb3\xe6\xed)\xfc5\x94\x8f\xf4R\x9cx\xda'8\
+\xe6\xa4\x13\xf4\xdcgg\x89\xa7\x1ey\x84\xd7\xe7/ \
+\xdf\xb9\x99t\xb0B\xa8\x10\x81\xa6W\x08\xe1\x91/\x97\
+\x19<b4\xe3\x0f\x1a\xc7\xf1'\x9f\xc2\x1e\xfb\xec\x89\
+a\x1d#\x08\xf1\xe9\xa34\x89C\x840\x89I\x84\xa0\
+\xa7\xf2\x0f\x90\xc9d\xc41'\x9e\xc2+/\xcda\xe7\
+\xe1#?\x08\x05Bp\xadQ\xe7\xc66\xece?*\
+\x88?P\xaa\x8c\xd7P_\x85\x5c\xc1\x5cZ\x04\x07\xff\
+\x95D\xfb\xca\x9c\x11\xf4\x02\xab\xebe\x8d`\x04+\xab\
+\xbe\xf6\x196j\x0cc\xf7\xdb\x07\x85\x96\xd6\xfb\xb1\x09\
+4\x85\x88\xe6\xe76j\x10\x083\xda\x18\x015\x1f\xb4\
+6\xe75\xac\xe2\xba\xe2\xa2\xf3\x11RQW\xd7\xcc\x0f\
+.\xf96\xcd\xcd-\x1c8\xe9\xb0\xb0\x8f\xee\x05\xa7R\
+\x12\xe4m\x11\xe1\xc6\x81\x94:\xba8%\xa1\x09\xb4\x86\
+~\x03\x06\xf0\x85\xf3\xce\xe6\x0b\xe7\x9eM\xeb\x86V\xb5\
+\xf0\xb57\xe4\xe2\xf7\x97\xd3\xbei\x9d\xf6K\x8a\xa6\xbe\
+}D\xff\x01;3b\xb7Q\x8c\x1a=Le\x1b\x1a\
+\xa4\xd6\x98H\x8f`\x8a\xe2:\x19v'X|\xf0u\
+\xbf\x0f\x0d\xca\xe5\x22\xd7_{\xe9l\x8c\xf5/\x93p\
+U\xaa\x9e\x06\x04\x0a\xe9t\xba\xf3\xde\xbbo}\xea\xd0\
+#N<i\x871\xf3.t\x83R&\x93\x11S\xa6\
+\x1f\xc9\x94\xe9\xd3Q\xe5\x12K\xde_\xca\xd2w\x17\xd3\
+\xba\xb1\x95b>\x07BRW_\xc7\x90!\xbb0r\
+\xf7\x91z\xd0\xa0AB\xeb`P\x89\x02j\x94\x0a\x18\
+/\xda\x052g\x054\xdd\x0b\x7f\x0d%\xf5\xa9\xcf\x9f\
+\xc3A\x93\x0eS\x12d2\x92nK!Hl\x1b6\
+\x93m1[W\x12L\xf0\x91\x16\x88T\x8a\x8e\x95\x0b\
+\xe3\xc1;\xa1u\x0e:\xa85\x1a?X<\x15\x80\x87\
+.lF\xf9\x9bP\xe94ha\xf2%\xfa\x9a\xc6\x96\
+>&\xfb\x92p\x17&M\x1d\xc6\xb2\x07\xdf\x89\x88\x04\
+\xf6.C\xe5L\xc8\x8c\x10K\xe6\xcdy\x8e\x0b\xbfv\
+\x1e\xc2\x93\xa4\xd2u \x14Z\xc1\xf9_\xfe\x12\x87L\
+:D\x7f\xf3{W\x89\x81\x83w\xa9\x901\xab\x98\xcd\
+8E6\xd9\xd4\x1b(\xa4jD\x13\xd0\xaf_?9\
+i\xea\x14&M\x05\x81\x08\xee_\xd5\xee\x1cQ\xda\x0c\
+Q\xb6\x8fV\xe9\x08\xa1\xd0\x98tjJo\xfd\xd8}\
+\x14\xf0\xfe\xa27\xe7\xe6\xf3\x1d\xeb\xb3\xd9lg\xa1P\
+(\xee\xdd\x00\x9c\x00\x00\x13BIDAT\x90\xe0\xc8\
+Z\x0a\xa0X*\x95\xda\xe7<\xf7\xc4\xd2\xb6\xd6\xd5\xab\
+Z\xfa\x0d\x1a\xfc\x91`\xfb\xa1\x80F\xa6R\x8c\x1c3\
+\x8a\x91\xa3G\x12\xa6m\x0a \xd0\xdeB)\x1d\xde\xc7\
+\x17.}X\x86\xd0\x84[BqK\xd6m\xd3U\xa1\
+\xdf\xa0AL\x1c4H\x86\xedo%X!3\xca\xc8\
+X\xde]G\x8e\xa4T*\x91\xcaf\x10\xdax)R\
+\xa6h\x7f\xf7e\xb4PQ\xb7\x84\x08\xe6\xd0Q\xf0\x11\
+\xe19}\xb3\x10\xb8\xe6\xd59xJc\x22\x095B\
+\xfb\x14U\x89\xfe\xfdZ\x82\xe9\x90\x13\x97\x17\xb8\xfa\xd2\
+\x0a\x7f\xa0H\xa3,\xacv\xb15:9\xa0\x94)\xff\
+\xf0}\xb7\xa9TFJ\x99\xca\x18\xef*\x98\x1e\xd45\
+\xa4y~\xd6\xe3b\xfe\xdcY\x1c}\xd2\x8c.\x9dl\
+k\xf1e\x90\x0f\xc0\x10\xc6\xa4\x8c\x13\xdd\x0c\x96I#\
+\x16<b\xe9\x13\x1a\x01\x113\x06F\xd9\x9a)\xa0\x9d\
+\x9a\xec\xc80\xef\xc5g_\x01r\x85B\xa1\x93\xe0Z\
+\x04\xf7\xf7j\xe8k\xcc\x5c\xa13\x97k_;g\xee\
+\xacg?|4?\x22\x10\xc1\x85\x1bA\xaf\xcd\xcd=\
+\xe0\xab`\xb57$\x8d\x0a\xb4|0\xbf\x17\x00\x1aa\
+s\xc6\x7fP4\xd86V\xc3\xea'\xf3\xde`\xb5\xe7\
+\xbe\xfb\x92Jy\xc8\x80Y\x05 \xb5\x07\xb9u,~\
+\xf2\xafd\x1b\xede\x16\xf69\xd3o\xa3\xf4\x8c\xf4*\
+<|\xbf\xc0\xe2\xbf\xdcB}}\x1f\x94\x10x\x81w\
+\xa4\xa5f\xd4\x1e\xe3\x03\x8b\xeb,\x1f\x06\xeb\x10\xc6-\
+\xd7\x80\x0a\x94\x93\x08<%\x15\xd07Z\xb0\xb3h\x5c\
+t\xe9u\xf2\xe4S?C\xbe\xa3\x80\x10\xc1]\x8fJ\
+p\xd2'\xce\xe0\xce\x87fw+\xfcq\x10\xa1Pj\
+-\xcd\xadO]\x80\xd9yppWP=\xb3\xa9\xdb\
+\x82\xa1\xed\x8e.\xfc\xb9|\xae\xf0\x8bk\xbe\xfb$\xb0\
+\x11#\xd3\xa5d\x99Z]\xf01{\x86\x1d7\xff\xea\
+\xaa'Q\xc5B\x8dr\xdb\x07\xba\x9b\x91t\xb7y\xa1\
+mh\xa9\x0a\xb7}\xc0,(\xd9\xe5\x1d#P:`\
+\x08\xb3\xed'D7#\xde\xc3\x99\xd2\xb6\x12~\xf7\xd5\
+\xbeolna\xc2\xd4I\x08\xa5\xc0\x17\xf8\xca\xc4\xf3\
+7\xd5\xb7\xb0\xe0\xd6\xcb)t\xac%]'\x82m\xc0\
+`\x1ac\xb02\x87bD\x8a\xc6~)^\xbc\xee2\
+\xbc\xfcF\xd0>\x92 \x0f\x02P*k&\x1fyh\
+@+\xdb\xed\xd0\xd1O i\xe9\x86\xc9@,\xadP\
+\xa9\x18\x1d</\xc59\xff\xf5M\xfe\xfb\xa2K(\xe4\
+\x0a\x14\x0b%f\x9c\xf1E\xfd\x1f\x17\x5c\xc0\x90\xe1\xbb\
+n\x95\xc2\x952\xf8\xab\xf1\xbbRn\x8e@M\x94-\
+\xcazI\x91\xb7\xe4~o\xfa\xb2\x15\x08m+\xd8\x82\
+\xdd\xa17^\x9e\xf5l>\xdf\xb1&\x9b\xcdv\x90X\
+\xfd\xb7\xd0\x95\x02\xc8\x03\x9b\xdeY\xf8\xea\xf2\xbf\xbf:\
+\x7f~\x97\x88t\x85TO\xcb\xf5\x04\xaa\xef\xf6TB\
+\x95^Y\x0d\xef$\xfcu,\x92\xf9\x8b\x06;\x10\x09\
+!BF\xea\x16\xa7jx\xf5\xa4\xbf\x1f\x80&\xd1\xfd\
+3q$\x8e\xfb\xf8\xbf\x91+\xb4\x81V\xa4\x14\x08L\
+\xfa\xb1&U\xe0\xaf\xe7\x7f\x8a\xce\x0dK\xc86K\xd2\
+i\x19\xe4>0\x87\x85\xb2\xcdYD\xcag\xf6\xcf\xae\
+\xa0c\xfe\xdf\xa8\xf7R\xc6\xd9\xd5\xe6\xc2M-\x04\x93\
+\x8e\x9a\xae\x9b\xfb\xf6M\xe0\x9d\x1c\xe4\x1atKN\xbd\
+\x1c\x90\xc0\xf1\x9f8\x99\xfd\x0f:\x88\xbe;\xd5\xf1\x99\
+3\xcf\xd5\x12sP\xa8v\xf0S\x0d\x14z\x00\xc9E\
+B\x03\xd1\x02\xa6\x10At\xa3T\xc1\x0eD\xe2B\xd6\
+\xc0\xc9\xe9\x11.\xdbr\x09-\xdc~\xea\xba\x98\xf2}\
+n\xb9\xf9\xe7\x8f`\xdc\xffvL\xe8o\x05&]\x89\
+R\x16\x18\x00\x8c:l\xda\x89S~t\xdd\x9f\xae\x82\
+\xc4V\x0c\xd1\x22\x8f\xbd\xa1$\x09\x15_\xd7\x08\xe2\xb2\
+\xf3\xac\xaa\xd5\xd4\xa8\xbb+\xd0\x89g\xcc\x9c\xcd~i\
+\x91\x88\x87\x90F\x8d\x11\x9c-\x08\xbd\xffp~\x18\xb9\
+\xdc\x84\xd9t\xc3\x1a\x1c\x82\xd8\xb54W<\xa5\xdb\xdf\
+D\x8b\x22\xf1]2\xda=Y\xc6\xb8\xdcI\xed\x13\x95\
+\xfa\xfa\x99\xa7\xb1\xea\x9d5\x90\xf2\x82\x0bT\x83\x87\xca\
+e6\x97\xf3\x0c\x98v&\xbb\x1c|\x18\xd9\x01\xc3I\
+e\xb3\xb4/}\x9be\xf3\x9ec\xf3\xdc\x07I\xe57\
+\xe3\xa5\xeaP(\x93\xbfO\x80Ve\x8a\xa52?\xbc\
+\xf9F\xb5\xe7>c\xc3s\xef\xd54`\xb8N\x12 \
+\x1e\xa5\xce&X\xa5\x8f4yRI\xb4\xb6n\xa4\x5c\
+\xecd\xc0\xceC\xc3u\x04\xe3m\xc8\x0a\xa5\xd1\x9d=\
+p\x1dyw,]|,Nf\x8a\x22c\x17\xa5\xb8\
+\x84\x8f\xb1S08[\xc1\x96\xd5\xeb\xb3?\x052\x90\
+\x1c\xfc\xf0\xfbZ2\xe6\xf4\xc9\xfe\xfc\xf6\x9b\xaf\xce\xfd\
+\xfci\x13\xaf\xc4\x04\xff\xac\x066QEmt\x85\xbf\
+\x04Z\x80]\x80\xb1\x7f|\xe0\x95o\x8f\xdcm\xccX\
+\x8d\x0c\x19\xdd\xc6\xbf\x04\x97\xeb\xc6:\x19\xaeL\xeb\xa8\
+!\xa5\xa3\x95T)\x13\xba@\x11[=\xd6\xc4\x05\xa6\
+B l\xbd\x09\x81\xd2\xc1o\xe1\xaa\xbd\x06\x97\xff\x85\
+\xc6\x84\xe2:\xcf\x87D\xb0\xfdr\x16w\xdcv\x933\
+\xc3\x0a\xa1t\x88\xean[)\xe7\xe1p%\xde\xa9/\
+\x06:\xf8N\xd8=\xf3\xb8rq\xbf\xd3\xaa6\x06\xef\
+\xbe\xb5\x80s>\xf5\x09\x06\xb6\x0c%\xdc\xf2w\xda+\
+\x97\x8a\x94T\x99\xa2_\x07\x80\xf4\x0ad\xbd4)/\
+\x0b\xd2Ci\xb3^\xa4\xd1h\xe1S.\x959n\xc6\
+)\x9c{\xfe\xb7\x82\x0e\xb9\xca4.f\xd6\xd3\xaf8\
+\xb2c\x17\xd1\xb4\xfb\xac\x8cv\x22\xa5[&bz!\
+\xcc\x07\xf7\x82\x0c\x9c\x16\xdd\xfd\xff$V:\xa0}\xd2\
+uW\x0eM+z\xe1\xf2\xa0-\xaf\xe3\xbc\x12\x9eV\
+H\x9cS\x0aq\xd3Q{*\xc0\xdbU@\xb1\xf1\x16\
+Q\x99p\xac!\xb6\xed\x99\xec\xb3\xddm\xadf\xc2\x00\
+.<\xffs\xdfy\xe2\xaf\xf7<\x83\x89\xfd_C\x0d\
+\x0f\xa0\xab\xd8Hk\xbc\xd2\x80\xb7f\xf5\x8a\xdc1'\
+\xcc\x98\x16Z4W\xb0\x88\x88\xe3\xd0\x22\xfcM\x06\x9d\
+\xb1\x96\xd1=/l1\xd2\xce\xc3Vp\xc3g\x1cA\
+\xd2*Q\xb9\x1d,\x87a\x82\xfb\x1c\x09\x0f\x92\x13\xd5\
+\xeb*\x19D\x0c\x95\x8a3\xd8\x15\xbf\xdb\xc1r\x18\xc7\
+\x0eX\xb2\x0e\xa1\xa3~\x8b@\xf1\xd9\x81\xb7\xf5\xc4\x82\
+f vx#\xe6\xbdX\x81r\x84\xdf\xfc\xe7\x12\xc2\
+\xfd,\xd8i\xe0 F\xed1\x86\xc7\x1f\xba\x9fl\xba\
+\x1ei\xd3\x9c\x11\xa4-\xf5R\xa4Si\xb2iI6\
+\xed\x91Ie\xf0\xa4\x17,t\xfa\x8e\x87\xa3Q\xe52\
+Cw\x1b\xa5/\xbc\xfc\x87\xc2$\x16I \xe8\x08\xbf\
+\xc5\xd5\x0eg\xa8+\x9c\xbe\x86\x97tX\xd6\xd5\x22\x14\
+\xd0\x8a\xf9\xb5\x00\x1dL\x05\x84p\xacwB\xf7i\xed\
+\x08\x81\xe5\x03\x87v!\x1duD:\xcb\x1e:\x81\xaf\
+\x15\xa8\x90\x1fUT\x8f\xbb\xbdie@;u\xbb|\
+Q1<a\x7f\xb0\x11h\xd1-\xca\xee\xb8&\x8c[\
+\xb2*+\xfc\x82\x80\xf7\x9c~i\x01o,\x98\xf7\xf7\
+_\xff\xec\xfb\xf7\x95\xcb\xc5%\xc0:L\x5cO\x85\xf0\
+C\xd7\x0a\xc0!%u+W-\x91\x87O=~\xd7\
+\x01\x03\x82\x0dYAt\x87\xa00H\xd9\x95`W\x90\
+\xac\x00\x89\xe0\x83\xed\x94\xb5J\xd2\x19\xa0\x10dB\x18\
+,\x03\xb9\x88\xb9ZWG\x1a\xd6u\x87\xec\x036\x80\
++\xb4\xa6v\xc0]3a\xeb\xb1\xc8\x09\x07\x07\x91\x18\
+\x00\xdbw\x22\x86\x08\x99\xcd\xfe.\xe2u\x03a\xf2\x0e\
+\x9c\xe7\xc3n\xb82\x114\x14Zz\xcbT\x0e\xf3\x88\
+\x90{\x1dm\x164f3\x0c\x8f\x18\xb5\x07\xcd\x83\x06\
+0\xeb\xc9\x87\xa9O7\xc6\x14t\x92\xe8\xee}\xc3~\
+p\xdb\xb1P\x9ab)\xcf\xe0Q\xc3\xb9\xec\xe7\xbf\x14\
+MMMN\x87\x92\xfe\x8b\xa8\x10\x06\xab\xc0]%'\
+\xad\x10\x87\x1c\x1f\xd4%D\xcc+Kr\xabM@\x1c\
+\x8e\xafp,\xbf\xb5\xce\xday.\xae_\xe2\x17.\xdb\
+\x22\x1a\xb4k>\xad\x00\xbb\xe3H4f\xce\x1aq\xd8\
+\x97\xd0\xdb\x8di\x0e\x87\xc7l\xd5\x22Q_\x80\x9f\xd4\
+\xf1\xbeX\xfaI\xb7\x7f\x8a\xc4\xd8\xc5ik\x15\x81\x0e\
+:\xf5\x93\xab.\xb8\xee\xed\xb7^\xb1q\xff\x9bH\x1c\
+\x00r\xa1;\x05`\xe9\xe9\xf9\xe5rz\xe9\xe2\xb7;\
+\x8e:\xee\x93GI/\x15!\xe3h,\xab\x95\x5co\
+4\x1c\x10W\x0b\xab\xb8uGE\x162\xcap\x93\xd0\
+\x8e\x8e\xc0\x0b\x881\x95\x8b\x8a%\x88\xd5\xa6\x15\xcc\xe4\
+\x08{l\x84\xac\x92\xb0\xcf:}p\xdb\x0d\x05\xd3*\
+\x97\xc4\x1c\xd6eJm\x99PE\xcf\x87{\xe4.\xb3\
+Hb\xc7.\xdc\xfe[\x5cB\xaba\xdb\x15T\x1c\xd5\
+\x88V\xf5\xa3N\xed\xb5\xf7X\x86\x8f\xde\x83\xe7\x9f}\
+\x1a].\x83La\xee$\x88\x08`2\x1f\x08\xc0\x9e\
+\x824\x18t\xe47s\xcc\xe9\x9f\xe6;?\xb8\x9a\xc6\
+\xa6\xa6\xc4`Z\xa29n\x96Co\xe1\xf6\xd3\xa5\xbb\
+\xa5\x83\xd3\x970`\xc7\xa1\x910\xe8\x10L\xff#\xcf\
+\xcc\xb5\x90\xf6\xab\x84`\xc7\xda\x0c\xa6\x17!]\xb5\x19\
+3\x97G\x5c\x83\x13\xbbm\xd7\xfe^\xadn\xbb\x98\xec\
+\xf0IL\xe0\x89\xde$-\xbb\x0b\x9a\xa8-\x17\x1f\xf7\
+\x06f)\x03+o\xf1\x0ax*&\x03\x81\xd2xy\
+\xdess\xae\xfd\xf1\x85\x0f\x03\x8b\x81\xb5T\x09\xffu\
+\xa1\xfb\xe3QQ\x1b\xe9\x15\xcb\x17\xb3\xef\xf8\x09\xfdG\
+\x8c\xdc}7\xed\x0e\xae\x88402>\xb8\x09#\x11\
+S\x16.QB\xc1p5\xb1\xf3Y\xb8\x83J\xc4$\
+a\xf5N\xdda0\x8a\x88\x9e\x09\xdf\xba\xc4\xab\xa2\xbc\
+\x5c\x0bV\x95\x0a\x22Q7\x8ev\xb7\x83\x162v\xa2\
+\xeb\x95\xc6:rQm\x1fm\x19\xe9\xd0$h[&\
+i\x196f~\xa8<\x93`>\x8f\xd8m4'\x9e\
+\xfeI6\xb5of\xe1\xdbo\xe3\x17sx2\xed,\
+R\xcaPa\x95\xb4\xa63_b\xdc\xa1\x93\xf5\x85W\
+^\xc5\xc7N9YH\x91\x90\xe2X\xfd\xc1`[\xdc\
+\x1d\xc5V\xa1D\x1d\xb4\xab\xcd\xe5\xdd&\x84\xf3>\xf6\
+\x8a3>\x09\x1eJZ_7z\xd3!G\x0c\xa7\x98\
+!s\xcc\xac\xa8\xd2^\x88\xb3\x8a\x1e\x0e\x15\x97\xd3\x96\
+\x9d\xca\x84^^\x80gl\x9a,\xa2\xefB$\xac.\
+U\x84kU1t\x1de\x15>\xe7\xe0Y(\xe6\x0b\
+\xdf\xfa\xfa\xa7\x7f\xd6\xba~\xcdB\xcc\xbc\x7f\x13A\xe2\
+\x8fZ\x90\xe4\x98Ze\xec\x8e\xc0\xc8\xa6\xa6>\xe3\xee\
+}\xec\xcd\xcb\x1a[\xfa\xf6\xb3\x83\x14j\xae8>\xb5\
+[\xab\xc5 \xd5\x1eN2@we\xe8\xa2\x5c\xf2\xeb\
+D\x99\xd8\xad\xc4\xd6\x82W\xab\xbb;\x5c\xdd\xb7\x8e\xc2\
+IF \x86\x9f\x93\x8c\x5c\x0d\xe9d?+\xd6s\xdd\
+\xa4\x96\xd1\xb0\x86\xf7*\x06\x0a5\x9f\xebd\xce\xf3/\
+\xf1\xe2\xb3O\xb0d\xd1b6lhE\x93\xa6_\xbf\
+>\xec:r8c\x0f\x9e\xc4\x84\xc3&\xd2\xa7\xefN\
+N\x87M\xa3\x95Y\x90j\xe0Z\x8d^\xc92\x8e\xee\
+\x08\xddW\x97\xa6\x8eP\xc5\x94g\xbc\xcbq!H*\
+\x85\xaex\xc6\x9d\x9b\xba\xf5\xb8\xdf%\xcb\xd4\x80\xd0C\
+\xad\xb55\x97\xec\x17t\xab\x98*\x1eO\x18\x0d\xed(\
+!\x00\xad4\x0f\xfc\xf97w]\xf9\xbd\xaf\xde\x01\xbc\
+\x05\xac\x04\xda\xa9\x12\xfc\x93\xac\xbb'`w\x04v\x06\
+v\xff\xf8'\xbep\xf4\xc5\x97\xfd\xfa\xeb\xb5\x84.6\
+p.\xe2:\xfe\xb9G\x82\x5c\x0bkw\x80\xaa\xfc\xd4\
+U\x99\x9e\x82k\xcd\x93VC'\xfbM\x9c\x91c\xf3\
+Q\x17\x9f\xae\x94^\x92\x99\xdd\xba\xaa0\x7f\x0c\x8f\x10\
+G\xe5(\x02;\x87\x8a\xda\xb6\xcc'\x84\x88\x1dk\x0d\
+/\xff\xa8@\xdc\x05{\xda/1\xef\xa9a\xe9{\xd4\
+\xff$$x\xa8j\x91.~\x8b\xb5]k\xec\xbbQ\
+\xde]~\xef\xd4Y\xc1k]AW\xca\xa4;#\xd7\
+U\xfd\xc1o+\x96\xbd\xbb\xf4\xb4\x8f\xed\xfb\xbf\xc0\x02\
+`)\xb0\x9e\x1a+\xff.l\xc9\x14 \xb4WK\xde\
+\x7f\xa74v\xdc\xc1\x03\x87\x0e\x1b5\xa2\x87\xcf\xd7\x06\
+Q\xe3}\xb5\xa2\xc9\xb2\xae\xe0\xd4z\xbe\xbb\x81\xe9\x0e\
+\xa7\xe4\xe7\xa45\xeei5\xc9:j\xf55\xe9\x15l\
+1D\x88\x85\x9e@\x0d\x1a[\xe6\xedy3[p\xf4\
+\xb9Z\xb1@\xbflS\xe8\x0a\x1dW9W\xfb=I\
+\xe3\x9etmK\xf1\xaf\xc5\xb3[\x03\x82\xaa\xbcS(\
+\xe4\x0b\xdf\xfd\xe6\x17\xaeY\xb1\xec\xfd\xb7\x80\xe5\x98\x94\
+_\xf9\x9e\xb4&\xbb+\xe0@\x09\xe3R\xac\xcf\xe7;\
+\x96_x\xfeg\xeel]\xbbbMU$\xdd\xd7\xee\
+@\xd7x_\xa5N\x9d(\x1bz\xa2:\xfa\xae\xc7\xd0\
+\x1d\xe3$>w\xd7V\xb7\xba\xa7\xab\xa9C5\xdc\xb6\
+\xc2k\xb18\x9a(67\x92\xa4\x16Rq\x9aV\xbb\
+\x1fq\xab\xa0\x9ar\x0e\xda\xaeh\xa1\xa7|R\x8b\xaf\
+\xbaC\xb9\xab\xdf]\x1a\xf7\xc43\xa9\xd2|\xb7\xe0\xf2\
+K\x17.~\x8f\xea\x0d\xeaH*\xd1\xbb~w\xdd\x9f\
+_\x9c\xfd\xd4\xeb\x98y\x7f\x1b&\x8c\xbfG\x83\xd9S\
+\x0f\xc0i\xde\x90\xadX,\x88\xf7\xde}s\xdd\xf4c\
+\xfe\xed\x10\xcfK}\xb0\xac\x16\xb0\x15\x94\xfd@\x8fm\
+7\xd8.\xf8\xf6\xd4h\x7f\x14A\xee\x1fB\x13\x15U\
+n\x07\x22o1\xe9\xb6\x01\x8eB\xc0Ks\x9ey\xf1\
+\xfb\x17\x9e\xf5G\xe0}\x8c\xf5\xb7\x0b\x7f\xdb\x5c\x01@\
+\x18\xbe\x80\x00\xe4\xb2%\x8b\x0a\x8d\x8d\x0dz\xdc\x01S\
+\xc6\x85\x16r[\xc2V\xd4\xd7\xa3G\xfe\xd1\xb4\xc6G\
+\x00\xee\x15\xe9;:lo,\xb7w\xfb`\xc6k\xdd\
+\x9a\x15k\xbe\xfc\x7f\x8e\xbd\xb6X\xc8\xbfK\xdc\xf5\xef\
+\xb1\xff\xb8\xa5\x0a\x00\x8c\x02\xb0\xfb\x8a\xde\x9c\xd9O\xae\
+\x1b\xb6\xeb\xa8\x861{\x8c\x1f\xb3\x15u\xf5\xc2\x0e\x02\
+\xff(\xc2\xffQ\xc0?\x02%:;\xdaZ\xbfr\xd6\
+\xf1\xd7\xac^\xb9\xf4M`\x19&\xe2\xaf\x9d.\xf6\xfc\
+\xab\xc1\xd6*\x00\xe54\xe4=\xfd\xf8\xfdk&\x1cz\
+\xd4\xb0A;\xef2\xb8\x97\x91z\xa1\x17>\x5c\xc8\xe7\
+s\x85\xab\xbe\xf7\x1f7\xbc4\xe7\xe9W1+\xfe\xab\
+0s\xff\xaaG~\xbb\x82-Y\x04t\xc1\xe6\x0bh\
+\xc5h\x9f\xf7\xce=c\xfaMo\xbc>\xef\xf5\xad\xac\
+\xaf\x17z\xa1\x17z\x00\xc5bA\xff\xf0\xd2\xff\xbc\xf9\
+\xb1\xbf\xdc\xf5\x12F\xf6\xdc\xfd\xfe-^\xc5\xdd\x1a\x0f\
+\xc0\x82\xc2\xc4\x18\xdb4C\xe2\xf1G\xee^<\xf1\xd0\
+\xa3\xc6\x0c\x188\xa4\xeb\xebXz\xa1\x17za\xcbA\
+\x15\x8bW_\xf9\x8d\xdb\x1f\xbc\xe7\xd6g\x80w\x81\x15\
+D\xd9~\xb6*\xda\xe5\x83(\x80\x10-\xc2<\x82\x05\
+\x1e{\xe4O\xef\x1c2\xe9\xc8a\x03\x07\x0d\x1d\xb4\x0d\
+\xea\xee\x85^\xe8\x05\xcc^\xff\x8f\xaf\xfc\xc6o\xef\xbb\
+\xeb\xc6\xa70+\xfe\xab1\xc1>]\xc6\xfaw\x07\x1f\
+T\x01\xd8\xf5\x80\xd0\x13(\x95\x0a\xfe}w\xdf\xfc\xee\
+A\x13\xa6\x0e\x1f2tD\xaf\x12\xe8\x85^\xf8\x80\x90\
+\xcbm.\x5cz\xf19\xd7?\xf2\xc0\xeff\x03K0\
+\xf3\xfeuDW}mu\x00\xc7\xb6\xf0\x00\x5c%P\
+\xc4(\x82\xf2C\xf7\xfdv\xd1\xb0\xe1\xa3\xe4\xe8=\xc6\
+\x8d\xe9]\x18\xec\x85^\xd8:h]\xbfz\xcd\xff|\
+\xed\x93\xbf\x9a\xfd\xec__\x05\x16\x11\x85\xf9~`\xe1\
+\x87m\xa3\x00 \xae\x04J\x04J\xe0\xe9\xc7\xef_\xa3\
+\xb5\xee\x18\xb7\xdf\x84\xd1^*\xfd\xc1\x83\x85z\xa1\x17\
+\xfe\x85`\xe1\x1b\xf3\x17]\xf0\x9f\x9f\xbc\xe9\xad\xd7\xe7\
+\xbf\x81\x11\xfe\xd5l#\xcboa[)\x00\x88+\x81\
+\xd0\x1b\x98\xff\xe2\xccu\xf3\xe6<\xf5\xee\xe4\xc3\x8f\x1d\
+\xd3\xd0\xd8\xdc\xb8\x0d\xdb\xeb\x85^\xf8\xa7\x04\xa5\xca<\
+\xfa\xd0\x1f\xfer\xf1\x05_\xb8k\xed\xea\xe5\xef`\xdc\
+\xfe\x15lC\xcbo\xe1\xc3\xf0\xcd%&\x8dX\x13\xe6\
+\xa6\xe1]\x80\xe1\x8d\x8d\xcd\xc3.\xfb\xd1\xed\xa7N\x9c\
+r\xec\x84\xde)A/\xf4B%h\xad\xe9h\xdf\xd4\
+\xfa\xa3+\xfe\xeb\xeeG\x1f\xbc\xe3UL>\xbfU\x98\
+\xad\xbe6\xa2\xeb\xbd\xb6\xd9\x91\xaam\xe9\x01X\xb0\x9e\
+@)\xf8+\x02\xc5R\xa9X|\xf4\xa1?,Y\xbd\
+j\xd9\xfa\x03\x0e\x9e2,\x9b\xad\xaf~\x8fw/\xf4\
+\xc2\xbf (U\xe6\x95\x97\x9e\x9d{\xd6g\x8f\xf8\xed\
+\x9b\xaf\xbd\xb4\x00#\xfc\xcb\x89\x84?G\x14\x8a\xbf\xcd\
+\xe0\xc36\xc5)L2\x91>\x98\x5c\x02\x03\x81\xe1\x0d\
+\x0dMC/\xbe\xf4\xfa\xe3\x0f?\xf2\xc4I\xe9tf\
+k\x83\x91z\xa1\x17\xfe)`\xd5\xca\xa5\xab\x7f\xf5\xf3\
+\xef\xdd\xff\xe8\x83w,\xc4\xa4\xf2Z\x89\xb1\xfc\x1b\x81\
+\xcdDA>\xdb\xfa0\xf5G\x12\xf6\xeca\xa6\x04\x8d\
+@\x7fLf\xa1\xc1\xc0\xd0\xb1\xe3\x0f\x19s\xfe\xb7\xae\
+>r\xef\xb1\x13\xc6\xf7N\x0bz\xe1_\x0d:\xda7\
+\xb5>|\xffm\xcf^s\xe5\xff\xbc\x80\x11\xfa\x15\x98\
+#\xbd\xeb0\xa7\xfa\xb6\xe9|\xbf\x1a|TR'0\
+\xde@\x1d\xc6\x1b\xd8\x09\x18\x02\x0c\x02\x86N=\xf2\xc4\
+\x11g}\xf9\xe2\xc3\xf6\xd8k\xff^E\xd0\x0b\xff\xd4\
+\xa0\xb5\xa6\xbdm\x03\x8f<\xf8\xfb\x87\x7f}\xdd\xa5/\
+u\xb6\xb7\xd99\xfe*\x8c\xe0o\x00:0S\xe7m\
+\xee\xf2'\xe1\xa3\x966\xd7\x1b\xe8\x03\xf4\xc3L\x0bv\
+\x06v>x\xe2\xb4\xe1g\x9e\xf3\xcd\xc9\xe3\x0f8t\
+\xff\xde\xa9A/\xfc3\x81\xd6\x9aM\x1b\xd6\xad\xbf\xff\
+\xee\x1bg\xdf\xfa\x9b\x9f\xce\xe9lo[\x8f\x11\xfa\xd6\
+\xe0\xb5\x9d\xb8\xd5\x87\x0fY\xf8a\xfb\x9c|\x94\xc1_\
+\x16\xb3S`=\x82\x81\xc1\xeb\xa0a\xbb\x8e\x198\xe3\
+\xb3\xe7N\x9e~\xeci\xbb\xf7\x1f8d\xc8v\xc0\xb1\
+\x17za\x9b@!\xd7\xc9[o\xcc\x7f\xf5\xd1\x07\xff\
+\xf0\xc6=w\xdd\xf8\x0aF\xc8m\x18\xef&\xa2c\xbc\
+\x9d|\x88s\xfdZ\xb0=\xfdm\x0f3-\xc8\x00\x0d\
+@3\xc6#\xe8\x8bY+\xe8\x0f\xf4?x\xe2\xb4\x81\
+'\x9c\xfc\xf9\x03'L\x9e>\xb2\xdf\x80\xc1C\xb6\xe7\
+\x14\xe1\x1f)iF/l\x1f\xd0ZS(\xe4\x0b\x8b\
+\x17\xbd\xfe\xd63O?\xb2\xe4\x0f\xb7_;\xbf\xb3\xbd\
+m\x13fA\xaf\x95H\xf07bV\xf7\xf3D\xb13\
+\xf0\x11\x0a?\xec\x18\xb9\x0f\xac\x22\xb0S\x83z\x8c'\
+\xd0\x84Y0\xec\x13\xfc\xf5\xdde\xf8n}\x8f;\xf1\
+Sc\xc6\x1fx\xe8\x901c\xf6\x1d\xfaQ*\x84\xf8\
+5\xe2\xa6M\x93GwG a/l/\xd0Z\x93\
+\xeb\xe8`\xf5\x9a%o-|\xf3\xb5\xf5\xcf<q\xdf\
+\xc2'\x1e\xbdg\x09\xd1qyW\xd8[1\x96\xbe\x9d\
+\xed,\xf8\x16v$\xee\xf50\xf8d1^Ac\xf0\
+\xd7\x1c\xfc\xf5%\xf2\x14\xfa\x00u\x0d\x0dM\xe9IS\
+\x8e\x19:n\xbf\x89#v\xea?\xa8~\xc4\xa8=[\
+\xea\xb3\xf5C\x9a\xfa\xf4-d\xeb\x1a\xfaf2\x99\xac\
+\xe7I\xe9\xa5\xb2]6l-{\xf4j\xf27\xdb\xf7\
+B\xc8\x1a\x093Ex\xd9\xe5\x87\xa9\x88>*\xcf\xc3\
+m'I\x93\xed\x05\xdd\xb5\xdfS\xfc\x92\xe5z\xf2\x9c\
+Re\xb4\xf2\xc9\x17K\xca/\x95\xda;\xdaZ\xcb\xf9\
+ba\xed\xa6\x8d\x1b:\x96-]\xd4\xbe\xe4\xfd\x85\xeb\
+\x9e\x9f\xf5\xb7\x95\xef\xbc\xf9\xcaz\x8c\xfb\xbe\x99h\x1e\
+\xdf\x16|\xee\xc8f\xb3m\xce\x15\xdd\x9d\x18\xa1\xb7\xc7\
+w\xb7\x8b\xe0[\xd8\x91\x14\x80\x05\xbbF\xe0av\x0d\
+\xacg\x90\x0d^\x9b0^B#F!\xd4\x05\x7f\x99\
+\xe0\xcf.4\xda\xbe\xf5\x9eA\xe8\x85\x0f\x02\xee\xbdz\
+E\x0cou\x06\xefsD+\xf6y\x8c\xc0\x17\x80\xb6\
+l6\x9b/\x14\x0a\x9d\xc1\xf7E\x8c\x82p\xb7\xf4\xb6\
+\xab\xe0[\xd8\x11\x15\x80\x0b\xd6+\xb0\xca\xc0\xae\x19X\
+/\xa1\x0e\xa3\x04\xec\x14\xa2\xceyO\xf0\xfe\xc3\x88v\
+\xec\x85\x7f\x0d\xb0V\xda'\xbaaGa\x14\x80\x8f\x11\
+\xf6\x12\x90\xcff\xb3\xb9B\xa1P$\x88|e\x07\x16\
+z\x17vt\x05\xe0\x82\xbd9\xcd#\xdaEp\xe3\x0b\
+D6\x9b\xcd\x00\x14\x0a\x854\x91\xe0\xff#\xf5\xb1\x17\
+vL\xb0\x89pu6\x9b-\x17\x0a\x05\x1f\xa3\x08l\
+l\xbe\xfbg\x7f\xdba\x85\xde\x85\x7fd\xe1\x10\xc4\xae\
+\xa6\x0d\x15\x83\xab(z\xa1\x17\xb6%\xf8D)\xf0\xac\
+RH\xce\xe5wh\x81O\xc2\xff\x07\xfeB~\x09\xc8\
+81{\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x09v\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00\x09(IDATX\x85\xb5\
+W{TUe\x16\xff\xeds\x0e\xf7ry\x88\x82\xbc\
+\xe1\x82 *\x88\x80\x82\x84\x98\xa2fRVh\x8e\x8e\
+\x8639\x9a\xab\xb0R\xd4\xd6\xb25\x99\xcb\xd1\x99\xec\
+EZ>\x9a\x8c2s,3\xd2\xacP\xa6HS\x90\
+\xd4\xf2\x91@\x0a\x82\xbcD\xf0\x81\x22\x17\xee\xfb\x9eo\
+\xcf\x1f\x17\x92\xd7\xaci\xd6\xaa\xdfZ\xdfZ\xe7\x9c\xef\
+\xf1\xdbg\xef\xdf\xde\xdf\xf7\x11\xfaAe\xe5\xd5\x11\x1a\
+\x8dG\x82F#\xeb\xfa\xeb\xff\x7f\xa1\xdaT\x8b\xd1b\
+(\x8f\x8e\x0e-\xeb\xddG\xdd_\xaa\xaanNrw\
+s\xcb\x91e%\xf1\xb7 \xeec\x88\xc3Q\xden4\
+>?|\xb8\xdf\xa1>\x06TU\xb5<\xed\xe9\xe9\xb9\
+\x19\xcc\xf2\xefA\xfe\x0b!\x91\xe80\xb6\xaf\x8e\x8c\x1c\
+\xfc\x0a\x00H\x00p\xfe|\xfd}\x1e\x1e\x1e\x9b\x99Y\
+f\x00\xbf\xb6\xd5\xd56\xa0\xf8X\xc9\xaf\x1e\xcf\x00\x04\
+\xb3\xe4\xe6\xe6\xb9\xa1\xac\xec\xca\xa3\x00\xa0\x00 /\xaf\
+\x819\xcc\x90A\x9d\xa3~\x05\xeaj\xea\x91\xbd*\x07\
+B\xe3\x86'n\xb4\xf0\xcc\xd93\xe8\x7f\xcf\xea\x02\x93\
+\x97\xd7\xc0\xd7'M\x9a\xf4\x95\x5cPp2.(8\
+d]\xef!\xa7O\x9d\xe1\xf7\xb6}\x80\xaa\x8aj\xc4\
+\x8c\x8a&EQ`0\xb4sUe\x15\x8a\x8f}\x8f\
+\xbd\x1f\x7f\x06\xcd\xa8\x14\x0a\x9f\x9a\x81;\xa7\x8b1a\
+\xcax\x22\x10\xe7\xe5\xe5!$$\x94\xb4Z-\xce\xfc\
+x\x96\x8f\x16\x1e\x85\xce\xdd\x1d\x83|\x06\xdd5\x90\x01\
+I\x96\xbd\x13\xc7\xa4\x1e\x96W\xacX\xfd\x80\x87\x87\xe7\
+\xcc\xee\xe4\x95\x15U\xbcf\xe3.\x1a4}1U\xdf\
+4\xd2\xd9\x03{ \x00\xde\xf9\xden\x9c?s\x1e\x19\
+\x7f\xc8\xc0\xac9\x19(=\xf4%5\x1c\xc9\xe7q\x13\
+\x93)&6\x06\x0cP{{\x07\xf4z=\xf2\xbf8\
+\x84\xcd{\x0e\xd3M\xef\x11\xf4\xe9\xf6\xf7(nD8\
+\xfb\xfa\xfb\xf5\xf0\x92\xd5b)UTU\xf5\xe4\xeen\
+'\xe0\xd4\x89\xd3\x141m6\x06\x84F\xc1K\x1f\x85\
+\xe2\x17\x0f\xe0\xa1\xd9^\xd8\x90\xb3\x9e\x88\x9ck\x94\x96\
+\x96\xf2\xbc\x85\x99(/-\xa3\xc6\xc6\xab\xcc\xec\x14t\
+r\xf2=\xc4`\xe4\x1f<\xcc\xe3Vl\x86\xca\x0a\xbc\
+\xc2\x22Pp\xf0+\x8a\x89\x8b\xed\xe9f\x89\xdc\x15\x15\
+\x80\xe8\x11\x1e`xt\x14\x1f\xfa\xb8\x90|\xa2\x93q\
+\xfbr9\x86\xeb\xfd\x91\x94\x9cHLN\x89\x94\x97\x95\
+!vT<U_\xaa\x06\x03\x90H\xc1\xe6\x9c-\x9c\
+\x90\x14O\xed\x86\x0e\x18;L|\xab\xf9\x1a\xf95T\
+A\x17\x12\x8d[\x97~F\x82>\x94E\xaf\xb4WU\
+A\x0a\x00p/\xe1%&'\xd1c\x8d\xcd\xf8\xe8\xc5\
+L\x0c\xf6\x1b\x8c\xb4\xfb'0\x03\xe4\xb09 \xcb\x12\
+\xc7\xc4\x8c$f\x86\xcdn\xe7\xaf\x0f\x16\xe2\xbe\xfb\xef\
+\x83\x9f\xbf?\x02\x83C\x10\x16\xa1\x85V\xab!\xb3\xc5\
+\xc2\xdfl_\x87vUB\xea\xd8Q4\xf3\x99e\xd4\
+\x9b\x07\x00$\xa1:\x0d\xe8\xdd\xa6?\xfa\x08\xa6e<\
+\x805\xaf\xae\x85\x00\xd3\x91\xc2oq\xbb\xb5\x95[\xef\
+\xdc!\x06!\xff\xab\x83\xfc\xc9G\x9f \xfd\xa1td\
+\xcc\x9e\x81\xa6\xebW\x10\x18\x1c\x80\xa0\xe0\x00\x5c(/\
+c\xb3\xc5\x86-;\xb7\xe2\xc1\xf4{\xf1\xdc\xea\x95\x90\
+\x15\xa5\x0f\x87\x8a\xce:\xc0\x0c\x88~\x8c\x10D\x10B\
+`\xd6\xdc9hn\xba\xceU\x15\x97`h\xeb@\xce\
+\xab\x9b88DO\x99\x8f\xff\x89\x1c\xaa \x92$\x0c\
+\xf0\x1aHD\x84\xa2\xef\x8a\xb8\xe2B5\x16=\xb5\x90\
+T\xc1\xe4`\x01\x80P^^\xc6\xbd\xd7\x87\x00\x14\x01\
+\x15\x82\x19\xa0\x9e\xa1P\x85\x0a\xc1*TU\xe0\xdb\x82\
+o\xd8\xcf\xdf\x1f\x1b\xd7\xbf\x86\xc8\x11\xc3x]\xce\x06\
+R\x14\x05\xd5U\xd5`f0\x13MM\x7f\x00%\xc7\
+\x8a\xb9\xbc\xec\x22\xb2\x96f\xa1\xb6\xe62{\xfb\xf8\x82\
+Y%\xc1\x0cwwO'O7\x08\x00\x12D\xa7E\
+\xe2\xaee&\x93\x09W\x1a\x1a\x18Lhk3\xf0\x81\
+}_b\xe8\xf0h\xe4\xe6\xedF\xf2\x84\x14\x94\x14\x15\
+\xe1b\xf9\x05\xde\xfb\xc1n.\xfa\xfa\x08\x9f9\xf5#\
+\x9f(\xfe\x1e\xe7\xcf\x95\xe3\xa9\xa5Yhk\xbbCk\
+W\xad\xc5\xc9\x92\x13`\x01\xa8\xaa\xc0\x8e\xdc\x1d\xb8\xd2\
+p\xa5\x87\x17\x84\x0a\xd0w\xc7+\x9f\x0d\x0a\xd6o\xe9\
+\xa3\x0e\x06v\xed\xf8\x10\xcc\xc4\xe9\xd3\xa7\xc1l1\x91\
+>,\x0c\x92$c[\xce[\x5c\xf2\xf3UD>\xb2\
+\x80@\x84\xba\x82=\x08u1\xf1\x86\xad9D\x923\
+Uj/\xd7pIQ1Y\xccf,~&\x0bB\
+\x15,\xc9R\x8f,\xb8q\xadyM\xbfY\x00\x00V\
+\xab\x8d\xaf\xd6\xd5\x13\x93\x04\xbf\x80\x002\x99\x8c \x92\
+\xc1\x0c\xfct\xe12\xc6\xae\xd8L*i\xc1\x82\x91\xb8\
+,\x1e\xa7\xfe\xfe\x04Ymv\xd6h5N\x12\x92h\
+\xff\xbeB&\x17-\x8d\x8c\x8b\xe3\x94{S\xfbd\x81\
+\x00\xa0\x088\x05\xd8\x85\xca\x8b\x15<4*\x8a^[\
+\xf72\x9a\xdc#a8_L\xffzw\x07,\x16+\
+\xac\x16+\xdbm6\x18\xec\x12\xa9\xd0\xc2f\x17`\x16\
+\x10,A\x1b<\x14\x9b^z\x9d\xb4:W\xb0\x10\xa8\
+\xaf\xaeA\xd4\xbc,r\xd7\xc7\xe0\xdb\x82-\x94<>\
+\xb5\xef_\x0a@\xe9\xd2@\x17\xda\x0dF8\x1c*_\
+o\xb9Ma3V\xe2BS\x0d\xc6O\x99\x8c\x80\xa0\
+@\x80\x88\x14EA\xe5\x93\xcb\xd8aj#v\xf1\x80\
+\x10\x02v\xd5\x0eKS5\x96\x7f\xb8\x95\x15E!\x93\
+\xd1\x88\xcf\xf7~\xc6\xf9\x9f\xfe\x13\xb2\xce\x83\xb2\x97.\
+Dkk+\x0f\x1c8\x88z\xf1C\x11\x90\xc1|\xf7\
+\xfb\x98\xb1I\xc4`<\x93\xfd4\xbf\xb5~)\xfc\xbc\
+\x06@\x92%\xd2\xba\xea:\xa5\xc1\x88\x89\x89\xa4\xd3\xdb\
+\x9e\x83\xcf\x84\xb9`I\xc6\xb5\xa2\xfd\xf0uQ9o\
+\xd7\xc7\xb0:\x1c\xacsw\xa7\xc9\xe9\xd3\xf0\xe0\x8cG\
+pp\xff\x17H\x1a\x97\x82\xfa\xdaZ\xf2\xf2\xf2\xee'\
+\x0b:\xd3\xb0{+=w\x9a#\x86\x0d\xa3\x94\xa9\x93\
+i\xc5\xda\x17i\xff\x9e=hi\xb9\x09\xc1\x8c\x8f>\
+\xd8\x89\xb81\x89\xfc\xf2\xcbk\x10\xddQ\x06\x9f\xca\x02\
+\x9e\xff\xe8d\x0c\x0e\x0c\xa4+\xf5\xb5\xc8\xfc\xcb\x9f1\
+'s.\x02\x82\x02I\x92\x15\xd8Y03\xa0\x0f\x1f\
+\xd2\x87\x07\x02\x90\xd4~*al|\x121\x08\x0c\x02\
+I2\x16=\xbb\x0c\xbbss\xb1\xf3\x9dw9\x22j\
+8R\xd3\xd2h\xb0\x7f\x00\xd2\x1eL\xc7mC+u\
+\x98\xcc\xbch\xd9\x12\x9e\xbbh\x11m{#\x076\x9b\
+\xdd\xb9\x16\x00!T\xea\xaf\xd2v\xf2C\x12\x9d\xae\xe8\
+\xd1\xba\x0fb\x86\xab\xab\x0e\x9e\x03\xbdq\xb3\xb9\x19I\
+))\x10\x0c\x5cml\xc4\xae\xf7sy\xdc\xc44\xc4\
+\x8f\x8e\xa7\xbf\xbf\xb0\x1a\x83\xbc}0\xe3\x8f\x8f\xd1\xf6\
+77\xc2\xeep\xa0k\x87\xec\x97\x03\x80\x10\xce\x13Q\
+\xbfi\xd8a0pcm\x0d5\xd6\xd5q\xfe\xbe\xfd\
+\x88KL$\x9d\xab\x0e\xbbs\xdf\x81_`\x08\x9a\x9a\
+\x9ay\xf6\xfc\xc7\xe9re%\xc2#\xa3\xf0\xd7\xf5\xff\
+\x80\xabN\x87\xe0\xb00L\x9f5\x87\xb7o\xda\x88\x84\
+\xa4{Ps\xb1\x82\xae56\xc1?8\xa8/\x09\x00\
+I\x15}]\xd3\xda\xda\x8a\xe5Y\xcbQ+\x85\xe2\x8d\
+\xb7\xf7\x92\xb9\xbd\x834Z-J\x8e\x16\xa1\xec\x87\x9f\
+\xd8b\xb4\xf0\xe3O>I..\x1a0\x9c\x95\xeeV\
+\xcb\x0dt\x85\xcdd6Aq\xd1a\xc7\xe7\xc7\xc9\x10\
+6\x11\xcf\xafx\x01\x8d\xf5\x0d}\xf6\x02\x81N\x0f\x88\
+^\x1e(\xf9\xae\x88\x07\xa5\xcd\xa3\x80{\xa6\x81Y\xe0\
+\xe8\xdf\xe6#xH\x04\xcf\x9a?\x9f<\x97d\xfd\xb2\
+o8\xe7I I\xc2\x88\x91\xf1$:\x03?$r\
+\x18\xde\xca\xd9J\xb1+saW\x05\xb4\xde~8\xf6\
+\xcda\xcc{ba\xdf: \xec\xc2\xda;\x04n\xee\
+\x1e\xb0]\xba\x0a\xd5\xe1\x80\xcd\xdc\x0e?\xff\xc1H\x9f\
+9\x83\xae75\xc2c\x80'\xc0\x04\xd5\xe1@\xc1\xbe\
+\xfdh\xac\xad\xc1\xe8\xa4\xb1\xec\xea\xe6\x8a\x1f\x8e\x1f\xa7\
+\xb2s\xe7\x98H\x82V8`l\xae\x85\xec\x1d\x84\xb6\
+\xba\x8b\xf0\x1b\x13\xd2'\xd4\x0evX\x95\xfa\x86\xaaK\
+\x01\xa1\xe1=:R'\xa5\xd1\xd9\x92\x0d\xfc\xf3\xb6U\
+\xe4b7a\xc9\xf2\xa7\x18\x0c\xfar\xdf>N\x7f\xf8\
+a\xe8\x87\x0c\xa5\xe2#GP\xa9\xfab\xc0\x94iX\
+\x9f\x9d\x8d\x84\xf1\xf7\x22q|*\xcfY\x10G!\xfa\
+p\x5ckj\xc2;\xaf\xbc\xc67\xee\x980f\xcc(\
+L\xb8\x7f*\xf5\x96\xda\xcd\xe6\xc6K\x04\xc0\xed\xc8\xa9\
+\x1b\x95n\xee\x9e!\xbd\x05b\xb3Z\xa1\xd1h\x18\x04\
+r\x9e\xa6\x98\x01\x22\x80q\xf6\xe4I\xbc\xff\xd9a\xb8\
+\x87\xc7b\x98\xad\x96\x17\xaf\x5cN\x00p\xb4\xf0\xdf\x9c\
+\x9a6\x19\x1a\x8d\x96z\x9d\xc0z\xc0j1\xdf\xca^\
+<e\xa8\x0c\xc0\x9e<~\xaa5(8lzW\xda\
+tA\x96\x158\x09\xbb>w\x9eH\x89\x10\x18\x1c\x02\
+_\x1d!P\xb1p\xc6c\xf3HV\x5c\x00\x22\x84G\
+D\x91,+w\xe7t\xbfkt{\xbex\xe1\xecK\
+\xb9o\xbfR\xd8\xb5\xb2\xcb\x87y'r\x87\x8dHX\
+\xf0_M\xfe\x0dQ{\xb9\xe2\xf3\xcc\x99\xa33\x01X\
+\xba\xee\x81\xe2@\xde\xfb\x05#G\x8d\xb5\xfb\xf8\x06\x8c\
+vq\xd1\xb8\xfe\x1e\xc4f\x93\xb1\xe3\xa7\xb3%\x9b\x16\
+gN\xcc\x06`\x06\xfa\x09Rddl\xe8\x82%\xab\
+\x1e\xf2\xf7\x0dJ\x90\x15\x8d\xdboA\xac\x0a\x87\xb9\xe5\
+\xfa\xb5\xf2]\xbb\xde\xcc\xaf,\xfd\xa1\x0e\xdd.\x80\xff\
+\x01\xe7^\xb9M'yto\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x12\xa9\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x002\x00\x00\x002\x08\x06\x00\x00\x00\x1e?\x88\xb1\
+\x00\x00\x00\x09pHYs\x00\x00\x5cF\x00\x00\x5cF\
+\x01\x14\x94CA\x00\x00\x12[IDATh\x81\xc5\
+Zy|M\xd7\xf6\xff\xae;f4$2#\x092\
+\xa01\x13\x95\x90\x98\xaa\x94g\xf8)\x1d_KM}\
+\x9a\xa0\x1a1\x07-A\x15\xa5\xaa\x1eM\xe7\xd2R\xa5\
+\x82JIk\x88\xe1!sD\x94\x88\x9a3\xc8po\
+rs\x87\xb3\xd7\xef\x8f{or\x93\xe6\x86\xf7>}\
+\xbf\xdf\xfa\xdc\xfd9\xe7\x9e\xb3\xf6\xdek^k\xef}\
+\x08O\x06\x14\x13\xb3E\x15\x18h\x92=!\xfe_\x02\
+\x0a\x85B\xc4\xc6\xc6\x1a\x00\xf0\xe3p\xc9\xde\x8b\x84\x84\
+\x04\xd5+\xaf\xcc\x1e\xabV\xa9\x9fW(\x95\xe1r\x99\
+\xcc\x07\x80\xb2\x99.\x7f10\x00\x98\x84$\x8a\x8d\x92\
+\xe9\x92\xc9`\xf8\xe1Rz\xea\xdeI\x93&\xe9\x9a\xc2\
+n\x92\xaa\x9c\x9c\xa2\xe7\xdcZ\xb7\xd9\xa4P(\x83\xfe\
+\x9b\xa4\xfe\xbb I\xd2\x9d\xca\xaa\x8a\xf8\xce\x9d}w\
+\xa3\x91\x96\x1a\x9b\x0a\xfd\xfe{\xf1jO\x0f\x9f\x9f\xe4\
+rE\x103\xc3\xdc\xd0\xa8\xd9>\xb7w\xb5\xd7\xe7\xdf\
+m\xf5}e2Y[77\xf7\xaf\x0b\x0b\x1f}\x12\
+\x1d\x9d\xa0h@\xb8\xed}~\xfe\x83\xd5n\xad[/\
+\x14\xcc\xffW\xf6\xf3\x1f\x01\x01\xa8\xae\xa9N\xea\xd8\xd1\
+}:\x00\x01\xd8h\xe4\xe2\xc5\xabcZ\xb5j\x1d\xff\
+W3q\xed\xea5\xec\xdb\xb3\x0f\xfcXw}r`\
+\x00\xce\xce.S22\x0a\xa7Y\x9f\xc9\x01\xe0\xf9\xe7\
+\x9fw\x1c?\xfe\x95\x832\xb9\xdc\x9dl\x90\x1bs\xd4\
+\x14-\xd4\xc4;\x82\xd9\x9c\x8e%\xa7`\xd9\xfc\x158\
+y\xec\x14rsry\xd0\xd0A\xa4P*\xcd\xef\x1b\
+\xf5o\x8a\xd8\xc6x\x8d\xe6'\x07G\xa7\xa7[\xb8\xba\
+}v\xf2dJ\x8d\x1c\x00\x92\x92\xf6\xbf\xe0\xe6\xe6\xfe\
+\x86\xbd\x1e\x8d\x07o\x0e\xd8\xd2\xb4\x1a-fM\x8dE\
+\xf0\x1b\x8b\x118n\x0a\xb2\x8f&\x93ZnD\xb7\x1e\
+\xdd\x1e3\xc2\x93\x83\x8cdN\xed\xda\xb5-\xdd\xb1\xe3\
+\xc3\xb3\x0a\x00\xe4\xda\xb2\xd5\xf3u\xb47\xc5\x04\x03\x97\
+/\xa6s\xca\x91TH\x92\x01\xfd#\xc21\xf4\x99!\
+Dda\x8b\x80Z\x9d\x9eI\x06\xe8uz\xa4\x1c;\
+\x81\x9f\x93S\xa07\x1a(0<\x1c2UK\xfc\x11\
+\x12\x8a\x92\x87\xe5\xcc6\xb2\xa8\xa9\xd1\xe1\xd0O\x07x\
+\xf2\xe4\x17\xc9*@\xbd^\xcf\xe9\x17\xd3Q[\xabC\
+\xb7\x9e=\xe0\xee\xeeF\xcdI\xcf\xd9\xb9\xc5\xff\x00\xd8\
+H\x00\x1c\x0aoV\xdeP\xab\xd4\xbeV>l\xfb1\
+\x80\xaf>\xfb\x06\x1fo\xf9\x1c^=\x06\x00D(\xcd\
+H\xc3\xa81QX\xbcr\x09@@\xb5\xb6\x86\xdfx\
+y\x1aU\x94U\xb0\xa7\xaf/\xa2\x86\x0e\xc6\x90a\x91\
+\xb4f\xd9\x1a\xbe\xa75\x91\x93W[\xdc\xbbp\x1a\xdb\
+\xbf\xdc\xc2\xdd{\x84\xd5\x0d\x7f\xe4\xc8\x11\xde\xb9k'\
+\xb6o\xdf\x0e//o\xca\xcd\xca\xc1\xa2\xb9\xcbPR\
+V\x05\x99\x5c\x01\x15\x1b0w\xf1\x1c\x8c\x9b4\xbeI\
+^\x18\x00\x0b\xd6\x8d\x19\xf3\xb4/\x05\x07\xf7ns\x22\
+\xf5\xcc}\x22R4\x81\x8b\x87\x0f\x1e\xf2\xf8\xd1/\xd3\
+\xc0%\x1b\xe1\xd9\xb9\x0f\x18@\xf9\xad\x1b8\x19\xff\x1a\
+b\xde\x99\xc1W\xaf^\xa7\xec\xac<\xee\x1c\x1a\x02_\
+?\x1f\xbc9g:YEQ\xad\xad\xc6\xae\x8f>E\
+vf6{\xf9y\xd3\xe8\x09\xa3\x10\x11\x19\xd1`\xfc\
+\xd2\xd2Rvww'\xa3\xd1\x88Ic^b\x87\xae\
+\x03\xa8\xfb\xabs\xc0\x0a%\x8a~MF\xfe\xceD$\
+\xedK\xe2\xa0\x90 \xbbz\xf9,i{\x17\x85\xab+\
+\x94 R\xd8\x0b*\x99\x19\xb9\xe4\xe0\xe5\x0b\xcf\xd0\xbe\
+0\x1a\x19\x0c\xa0e\xdb\x8ep\xeb\x1e\x8e\xe4\x03)\x98\
+\xfa\xe6\x14^\xbcb!)\xe4\xf2\x06\xfd\xf2\xf2r\xd1\
+\xde?\x00\xe1\x03\xc3QY]E/\xbc2\x19_|\
+\xf6\x05\x0f\x88\x88 [?tww'\x06\x90\x93\x95\
+\xc7%\xdaZ\x1a?\xed\x1d\x08V@\x08 h\xf88\
+\xdc;\x9f\x8a\xd4\x94_\xa9S\x88\xfd\xdc\xacV;9\
+\xca\x80\xa6\x92\x97y\x22f@\xadV\xb1T\xa3\x01\xb3\
+0\xbf\x13\x0cI0\x8c5\x1a\x8c\x9e0\x8a\x06\x0d\x8e\
+$\xb9\x5c\x0e\x065h&\x89Y0C0 \x98\xd1\
+)8\x08\xf7\xef>@iY\x193\xd7\x07\x05\x06\x81\
+\x19\xa8\xd5\xebI\xaeT\x83d\x0a0\x03\x12\x03F#\
+\xa0pi\x01I\x02\xdb\xd2\xf4'Z\x01(\x00\x1b\xff\
+\xb6\x89ulq\x96\xde\xfdz\x93+I\x9c\xf7\xfdv\
+\x0a\x1e7\x1dB\x00\x7f\xfc\xfa#j\x8a\xae!2z\
+)\x00j\xd0\xff\xbb=\xbb1\xf2\xb9\xe7\x10\x16\xd6\x8d\
+\x18f\x0d\x12\x01B0\xbc\xbd|1v\xf0\xdf\xe8\xad\
+\x05\xb3Y\xa9T\x91\xa6J\x03\xadF\x0b\xad\xa6\x06\xa5\
+\xc5\xa5l(-\xa6\xdbiG\xe0\x13>\x0a\xcc@\xe5\
+\x9d+(N?\x87\xf0\x19\x89\xc4\x8d\xe9ldh\x8a\
+\x06\x0c4f\x88\x01'''\xac\xd9\x94H\xab\xe2\x12\
+p\xec\xd0^\x08\x19A\xaa\xd5a\xd2k\x93\xd8\xd3\xcb\
+\x8b\x18\x00q}\x97\xd1c\xfe\x06'gg0\xcc\xe5\
+\x05\x11p\xef\xce=\xc4\xcc\x88eooo\xea\x1f\x19\
+\x81\x96\xad\xbc\xa0T\xa9\xe0\xe9\xdd\x1ej\xb5\x0a\x0e\x0e\
+*\xa8\xd4jxzyr\xf2\xc6\x15\xd42t\x1f\xa0\
+rDE~\x0e^\x9e2\x19\xdd{u\xb7O\xa3-\
+#\x8fK\xba]\xc2\xba\xe2\xcb\x9fv#y\xff!\x9c\
+J=\x8d9\x0bb\xb1j\xe9r\xbax\xbe7\xfa\xf5\
+\xef\x0f\x06\x90r,\x85\x07F\x0d$Ggg\xf3<\
+L\xa8\xa9\xa9\xe6\x13\xbf\x1cG\xf9\xa3*\xac\xd9\xb8\x06\
+\x01\x01\xfe\x10,\x00\x80ddS\xe6\x11\x90\x99\x9eA\
+g\xce\xa4a\xe5\xa6\xf7\xb0\xfb\xb3\xdd\xdc>\xd0\x03\x13\
+\x96l\xa3\x90\xd0`0\xd3c\x13X\x13>\xd2t\xd1\
+\xa7P*\x10\xd0\xa9#\x5cZ\xb5\x80\x7f\x87\x00\xac\xfb\
+p#\xb6n\xdc\x8c\xf4\xcb\x97 \x98\x11\xda\xa5\x0bT\
+*5X0\x84`\x9c:y\x92gL\x9d\x09!\x08\
+]\xc3\xba\x90\x7f\x80?1\x80\xc3\xc9\x87\xf8\xe8\x91\xc3\
+\xf5>B\x84\x9c\xacl^\x9d\x90\x88\x0d\x1fm\xe4\x81\
+C\xa2\xd0\xb6c \xa2FD#84\x18 \xb3\xe9\
+6]\x88\xd6\xfbH\x13\x8c\x90\x1d\xe7'\x10\x11$a\
+\xb6{w\x8f6X\xbby\x136\xacy\x9f\xf3\xf3\xae\
+\xb0\x9f\x9f\x1f\x81\x08eee\xbc(n\x11\x8e\x1f\xfb\
+\x8d\xb6n\xff\x88\x06\x0f\x1bJ\x920\x1b\xb5\xc1h\xe4\
+\x9c\xac\x1cJ\xbf\x9c\x0e\xbd\xc1\x00\x06\x90\x93\x99\xcd\x09\
+\x0bWb\xed\xa6u\x08\xec\x18H\x0c@\x82 \x8bw\
+A\x08\xe6m[6ss\x8c\x18\x9f\xd4\xb4\xac`\x8e\
+6\x5c'\x05/oo\xac\xfe\xe0}Z\xf6\xf6\x02\xbc\
+>s\x1a4UZ>x \x193cf\xa2o\xbf\
+>\xd6^`\x080\x18\x0a\xa5\x92\xe6\xbe3\x1f\xcc\x80\
+R\xa9BnV\x0e'\xc4'`\xed\x87\xeb\x11\xd0!\
+\xd0\xa6\xb0d\x086\xb3\x02\x22\xfaG\xcc\x1c\x1b\x1a\x9b\
+.\x94\x14\xd6\xa9\x1aR\x0c3\xb2\xad\x17\x03\x10,\xcc\
+a\x18@vF&Z\xb6l\xc1Z\x8d\x16\x1d;\x05\
+\xe1\xbd\xb8\x04\xea;\xe8i\xfa\xf8\xd3\x8fY\xa9T\xd6\
+\x11%\x1a\xadiT*G\x80\x80\xbc\x9c\x5cN\x88_\
+\x8e\xd5\x1b\xd7\xa1cP'2\x18\x0c\x5cRR\x0c_\
+\xdf\xb6\x040\x0bI\x22\xb6\x0cr\xfd\xfa5t\xea\x14\
+l\x1e\xd0Z\x916\xa8V\x8dM\x99\x965\xbes\xdd\
+\xfd\xf6m\x1f\xb2\xb0\xe1\xa9Z[\x8d\xd8i\xb3\xb1h\
+\xee\x02\x9c;\xf3/D=3\x1c/\xcf\x9c\x8a\xca\xca\
+G\xc8\xcb\xc9\xa1\xba1\x98Q\xab\xd3\xb1d2\xc1\xc2\
+\x0f\x00 ?\xf7\x0a/\x8b[\x8aU\x1b\x12\x11\x1c\x1a\
+L\x00\x90\x93\x95\x8dy3b\xf0\xd3\xfe\x03L \x08\
+a\x16Xaa!\x96\xc5/\xe1o\xbe\xfa\xaa\xdeW\
+\xd0\x90\xd6:\x8d4\xa9\x10\x1b\x05N\x9f\x15C\xb6~\
+\xa2\xd5V\xf3S\xbdza\xf1\x8a\xc5\xe4\xed\xe3\x03\x00\
+\x88\x88\x1e\x88\xd1\x13\xc7b\xd1\xdc\xb7\xf9\xad\xf9\xf3\xf0\
+\xe0\xee\x03|\xb3\xf3s\xbas\xf3\x16\x11\x11&]\xcc\
+\xa2q/L\xe4\x9e\xfd\xfb\xd2\xb2\xb8\xa5\xb4r\xfdj\
+\x84v\x09\x05\x030\x19\x8d\xb8t\xfe\x12t\xd5\x06j\
+\x17\xe0\xcfW\xaf\xfc\x0e\x82\x0c\xcc@\xdbv\xed\xd1\xbd\
+W\x1f\x0c\x1e:\x9c\xc1\xf6c\x17\xf5\xee\xdd\xdb\xe7\xdb\
+}g\xee\xd9C\xb0\xe5.3=\x0b\x07\xf6\xfd\x80\xf6\
+\xfe\x81\x1c\x14\x1aD\x03\xa3\x22Q]\xad\x85\x83\xa3#\
+\xe42s\x89RZR\x8a\xd8\xa93QZ\xa6E\x87\
+1\xaf\x99\x0bM\x00\xa5\xf9\xe9(:\xf89DM%\
+\xd6|\xbc\x89{\xf6\xedE\xf5\xa6b\x9e\x22\xf9\xc7\x9f\
+\xf8\xee\xdd\xdbT\xa3\xd5!<\x22\x1c\x03\x06\x0d4O\
+-\x98IFv\x99\xd8\xb7\xf7\xd3\xde\xb2:\x154\xd3\
+\x98\xcd\xebI!$\xc8\x08|\xfe\xec\x05\xf4\x8f\xe8\xcf\
+\x02\xc0\xb9\xb43\xb8{\xe7\x8e\xf9=\x80\xca\xcaJ\x94\
+\x94W#b\xe9\x16t\x990\x05-\xda\x87\xc0\xb5]\
+\x08\x82F\xbe\x88\x88\xf7>\x03\x1c]p\xff\xee]\x12\
+@\x03S\x11\x00\x9e\x19=\x12i\xa9\xa79\xeb\xc2%\
+\xfcz\xf484U\x1a6'Uk\x0c\xb6\xd3\x8c\x96\
+\xf0+\x00\x08&\x08\x98\xc3\xaf\x80\xb5\xc1\xf2\x0c(-\
+.\xe1\x93)\xc7q%#\x9b:u\x0c$\x99\x5cA\
+``\xc8\xf0g\xd1\xb6\x9d\x7f\xdd\xa0\xc7\x92S\xd8\xa3\
+g\x04Z\x04t\x83\xc1\x08\x98L\x0c\x93Q\xc0``\
+8\xb9\xf9\xc2\xff\xb9W\x90r\xf00\xa3\x91\xad\x83\x81\
+\xfd\xdf\xee\xa5\xd22\x1dq\xa7\x08\x5c\xc8\xbe\x85\x95q\
+K,B4\xd7o\xc2*PX\x9eY\xfe\x03J[\
+\x1fa\xcb\xcfz\x05\xb4\x1a\x0d\x5c\x5c]\xa1\xad\xd2\xf0\
+[\x7f\x9f\x0e\xa3\xab\x1fX\xed\x89\xcc\xb4s\xc8\xcf\xc9\
+\x85\x10\x12t\xbaZ\x18\xf4z\xd6UW\x93$I\xc8\
+\xbex\x09-\xc3\x86B\x92\x00\x93\x00$\xc9\x5cl\xca\
+\x98\x01\xc8\xd0\xb2cWd|\xbf\x83&\x8f\x1c\x07I\
+\x12\x90$\x09,\x04\x94\x0a9\xb4U\xd5\x08}}.\
+\x02\x06O\x82\xb6\xec!Rc\x9f\xa3\xf2\xf2r\xb4n\
+\xdd\xfa\xcf\xf5\xa05\xd6Z\xfe\xdb\xcd#E\x85E\xbc\
+jI\x02\xb6\x7f\xbe\x13i\xa7\xce\x90\xde\xc5\x0dQ\xef\
+\xee\x84\x10\x8c\xd3q/b\xe7\xa6\xed\xf0\xf6\xf35\x17\
+S R\xc8\x15P\xa8\x140\x1a$\x82\xe6\x11X\x00\
+B\x08\x08a\x16\xb9 \x82\x09\x02zM\x05\xbc\xfd\xdb\
+\x22i\xdf\xd7\x0d'd`\xc5;\x0b\xf9\xf6\xb5\x0c\x12\
+\x83&\xa0\xfcF\x0e\x1c]]\xe0\xe8\xe4\xf4\xd8<g\
+\x04\xa0\xa8\x01l\x12Q=\xf8\x07\x06P\xfc\xf2%\xac\
+T\xaa\xc8\xc5\xc5\x15\xc6\x8a2\x98\xb4\xe5`f\x18u\
+\x1a\xbc\xfa\xe6\x1ct\xef\xdd\x1b\x80\x99\x17\xeb\x18\xc7\x0f\
+\xff\xcc[\xb6\xec\xa0\xd0\xf1\xb3@r\xa7:\xd9\xb1\xc5\
+\x0e\xee\x9c<\x84\xfe\xbd{\xb0\x10L\x04\xb2T\xda\x8c\
+\xeb\x05\x05\xacpP\xd1\xfd\xe3\xbf\xe1\xe1\xd9h\x80\x18\
+\xffX8\x0f\x0a\x85\x92\xcbJK\xe1\xe6\xde\xa6\x99j\
+\xab.\x8f\x90\xb9\xa1\xe15($\x84\x18@\xbf\x88\xa7\
+\x11\xde+\x8c\x7f\x8b\x19\x87\xdfb\xc6C-j\x11\xd4\
+\xb93\xac\x5c\x98\xa3\xa2\xd9\x1f\xa3F\x0c#\x0fW5\
+.m\x99\x0fSu\xa99(\x09\x86\xc9P\x83k\xdf\
+}\x80\x8a\x9c\x7f\xa1g\x9f\x9ed4\x1a9;3\x03\
+[?\xd8\x88\x98\x19\xff\xc0\xd1\xc3\xbf\xd0\xf8\x17_\xe2\
+\xefO\x1c\xe6\xee\xfdza\xe1\xea\x04<;f\x0c*\
++\xab\xe8\xb7\xd4\x13T\xb7\xd6\xb1\xa5\xd5\xf2\xbf\xceG\
+\xea2\xbbU36\x1a\x22\x10\x93LF\x8b\x12\xdfC\
+\xea\xd1c\x9c\xf6\xebi\xf4\xee\xdf\x87\xd6%$`\xd9\
+\xda\xb5\x90\xdb\xae\x0c\x19\xd8\xfb\xcd\xb7h\xe3\xed\x09\x07\
+\xa5\x02i\xf3\xc7\xc3%\xb0\x0bH\xae\x84\xe6V\x01\xda\
+\xb8\xb9b\xd0\xf0\xc1\xbcn\xd1J\xf2\x09\xf0C\xdf\x81\
+Q<\xf4\xd9Q\x98=/\xc4\xba\x91A\x0c\xc0\xd5\xcd\
+\x8dU\x8e\x0e\x04\x00-[\xb5\xc2\xb8\x89\x93\xeb\xb3\xa9\
+\xcd\x5c\xb6`f\xa4\x19#<~\xec\x10\xbc||\xb9\
+kX/r\xf3\xf0\x82\x5c\xad\xc0\xb3\xe3\xc6\xa2\xb4\xa4\
+\x18\x1f\xbd\xbf\x1e1\x0b\x16\x82\x88\xc0\xcc\xf8r\xd7.\
+\x5c\xbbr\x95Wlx\x9fT*\x15\xae]\xc9\xc7/\
+\x07\x0f\xa1\xf0\xf7k<g\xcdrj\xd1\xda\x15[\xd7\
+}@O\x0f\x8d\xe6Ge\x0f\xe8\xa5\xd7_a'\x17\
+\x17\x02\xd9\xc8\xd0\x1a\x99X2\x17\x22OT\x08ZM\
+\xab\x996d\xc4h\xea\x1afM^\x04I\x080\x08\
+/O\x9b\x0eI\x12\xf8\xfe\xab/ \x04c\xc7\x87[\
+p\xf3z!\x12\xd6\xaf%\x95J\x0d\x06!\xa8K\x17\
+\xf4\x1f\x12\x05o\x7f?\xbaUT\x88Mk7\xf0\xdb\
+K\x17\xf3\xc2\xd5+i\xd4\xc4\x89X\xfav\x0c\xb4Z\
+\x8dMYd-\xf3\x18\x92\x10\xd4\x1c]\x0d\xf0\xd1d\
+\x19o\xaf\xf6\xb2i\x0c0\x08\xb3\xe3\xe2\x91\x93\x91\x81\
+\x95qq\xd0TT\xf1\x92\xf7\xde\x85B\xa1\xb4\xc9\x0f\
+\x0c\x93\xc9\x84\xd3\xbf\x9eByy\x056\xed\xd8N\xb9\
+\xd9\x97\xc9$I\x88\x1a\xf6\x0cF\x8d\x9b\x84\xe5\xf3\xe6\
+\xa2\xba\xba\xfaO\xeb\x8b'\xa1\x0b6\xf8\x8f\xd5H\x03\
+\xe2\xad\xbd\xac\x9der\x04\x06\x85 /=\x03c'\
+?O2\x99\x02,\xac\x833R\x8f\xfd\x8c\xcd\x89\xab\
+\x1198\x1aSg\xcd\xc2\xf93'\xb1s\xcb\xc7\xf8\
+`\xf5\xbb\x90L&\x0c\x199\x92\x86\x8d\x1e\x83Uq\
+oCWSSG\x1c\x91\x8c\x9a\x14`\xa3&\xeaI\
+\xc1\x13\x97(\xcc\xe6\x95\x1f3[\xc3)\xffs\xcb\x87\
+x\xf4\xa8\x1c\xeb\xff\xb9\x937\xaeZ\xc1%\xc5\x0f\xc0\
+`h5\x1a\xacIX\x8e\xb4S'1=v^\xdd\
+\xaeId\xf4p\x0c\x1e1\x8a\xa7\xcd\x8ee\x99\x5c\x0e\
+f\xc6\x881c\x119l\x04V\xc5\xcfGm\xad\xce\
+\x12x\x04[\x8f\x12\xec\xd1\xd3\xd8\xb6\xe4\x1e\xbe\xbe\xae\
+\x13&L\x9d\xdf\xe4n4P\x17\xe7\xf32\xd2\xf9\xe8\
+\x0f\xfb\xe9\xf6\x8d\x1b\xf0\xf2\xf3\xe1\x1f\xbf\xfb\x0e\xfaZ\
+\x03\xc5\xc6/D+\xb7\xd6\xd4.\xa0\x03\xb6\xad[C\
+\x80\x0c[\xd7\xaf\xc7\xf0\xe7F\xf3k\xd3gRiI\
+)\x15\xde\xb8\x8e\x01Q\xd1\xe6]\x99\xf0prrv\
+6\xe7\x10\x8b/\x07\x85vFEy%\xef\xfd\x22\x09\
+\xba\x1a=\x9d<r\x14\x85W\x0b\xc8d\x92\xd0!8\
+\x18d]\xdf7\xa6\xd1Rp\x16\xe4g\xfc\xb3\xde\xb4\
+\xec\xf8\x83`\xe0\xc7o\xf7\xf0\xe2\xd9\xf3(\xe3f\x05\
+*\x95^X\x1d\xb7\x94\xae\x5c\xce\xa0\xb7\x16,\x00@\
+\xb8\x9a\x9b\xc7\x17\xcf\x9e\xa5\x07\xb7\xee\xe3\x93\xc4\xf7\xb1\
+$1\x91\x07?\xf3\xac\xc5Y\xad\xc1\xdd\x1c\xf7\x0f\xed\
+\xff\x9e\x89d\x5c/LB\xd2'\xdbx\xdc\x8b/Q\
+\xc5\xa3*\xec\xdc\xf6)\xe4!\x83\xa8\xb2u(vm\
+\xd9\x81M+W@\xd8\xa3\xd1ro\xc0\x13,u\xcb\
+\xcb\xca\xf0\xe5\xce$\xea2k5|\xfa\x0c\x81$\x04\
+*\x8a\x0a\x90\xb3n\x066\xbf\xfb.\xae\xe4\xe4\xc2\xc3\
+\xdb\x87\x86\x8e\x1c\x89\xa5\x1b7\xb1\xa6J\x03\x1f\xbfv\
+\xe6\x90jY\xff\xc3\xb2\xb6\x00\x01=\xfb\xf4'a\xe3\
+k\x0c\xc6\x94\x99o!/;\x1bEw\x1eRD\xc2\
+Wp\xf0\xf0\x83$\x044\xc3&\xe2\xf4\xaa\xd71r\
+b6w\xee\xd6\xad\xd9}\x94\xc7\xe6\x91+9y\x0c\
+\xa7\xd6\xe4\xdd+\x1a&\xa3\x11B\x08\xb4h\xdb\x11-\
+\x9e\x1a\x00]u-'n\xfb\x18\xee\x9e\x1ed\xd14\
+\xd5\x09\xc6\x226!\x182\x90Y/\x82\xd0>\xa0\x83\
+\xc5\xc6\xad\xdb\x0b\x80\x80@^f&\x5c\xdb\x05\xc1\xc1\
+\xdd\x17&\xa3\x09\x82\x05\x5c\xbc\x03\xe0\x14\xd8\x05\x05y\
+\xf9\x14\x1a\xd6\xccq\x84\x11P\xe8t:f\x16\x82 \
+k\xf2\xe8Y\xadV\x13\x8c\xb5\x90\x0c\xb5\x10\x90Y\xf7\
+\xa5 \xd5j\x10\x1a\xd1\x8f\xdc==\x00\x00B\x92 \
+\x93\xcb\xeb8a\x00F\xa3\x01y\x19\x19\xb8[T\x84\
+[7\x0a\xd1\xbeC\x07\x8b&\x18\xfa\xdaZ\xe4\xa4_\
+\xc6\xe5\xf3\xe7\xf9\xf2\xb9s\xd0\xeb\xf4\xd0\x93\x12\xc2\xa4\
+7\x97\x1e\x92\x80Q2\xa0\xb6\xa2\x04n\x1e\x1e\xcd\xae\
+\x0ekuZIVt\xe5J\xad^\xaf\xaf\xb4\x17\xb4\
+\xc2z\xf6dwg5n\xec\xdb\x0a\xc9d\x80\xc9d\
+\xc2\xbd\xb4\xc3\xd0\x15]E\xf8\xa0(0\x80\x8a\xf2G\
+X\xbfj1\xeb\xf5\xb5\x96\x1a\xc8\x1c \xd6/]\x8a\
+#\x07\x8e\xe2^\x89\x0e\xf1S\xa6\xf2\xe5sg9\xf5\
+\xe8\x11$.\x8c\xe7)\xe3\xc6\xf2\xfeow\xa3\x8d\x97\
+/\x96m\xd8\x88\x1d{\xf7\xc2\xd3\xc5\x01\xf9\x9f&@\
+s\xfbwT\xdc*@~\xd2{pwR\xa2_d\
+\xa4\xdd\xa0*\x09a:\xf1\xf3\xc1R\x02\xa0JN\xbd\
+q\xca\xc3\xcb7\xdc\x1e\xc7\x85\x05\x05\xd8\xb4l9\x97\
+\x95U\x12\x93\x1c*%af\xdc|~zp4\x11\
+\x01\x97\xce\x9f\xc57I\xbb86~\x11\x05v4\xef\
+v\xfcq\xf3&\xe6M\x9d\x8e~\xab\xf6@\xd5\xb2\x0d\
+\x0a\xbeX\x83\x9a\xcc\x13\xdc=\x22\x12\xfd\x06\x0dB\x8f\
+~}\xe1\xe2\xeaJwo\xdf\x82_;\x7f\x00@\xf1\
+\xfd\xfb\xf8$1\x91\xf33\xb2\x00\x00!={\xe1\xcd\
+E\x0b\xe0\xed\xebcw\xab\xb1\xaa\xf2\xd1\xf5\xe1\x03\xfc\
+z(\x00\x18\xee\xde\xbd\x99\xd2\x1c#\x1dBB\xb0y\
+\xf7\xb7\xb8\x9e\x7f\x15\x92Q\xe2\xc0\xd0`rpP\xd7\
+\x1dW\xf5\xe9\x1f\x81\xd0\xaeapvia\xb5\x1c\x98\
+L&\x00\x0cR\xa8\x01\x06\xe4\x0e\xce\xe8\x13\x15E1\
+\xcb\x96\xd5\x8d\x9by\xe9\x02\x7f\x9d\xb4\x03\xeb\xb7\xee\x84\
+L\xae O\x1f\x1f,\xdf\xba\x95j\xb4\xd5,\x93\xc9\
+\xe1\xe0\xe8`\xa9\xc2\xec\xfb\xf9\x83\xfb\xb7S\x01\xe8\xe4\
+\x00P^\x5c|/z\xf8\xd8\xbf\xcb\xe5J\xb5\xbd\x0e\
+D2r\xf7\xf4D\x1boOR*\x14\x96\xc1\xeb'\
+P\xa9\xd46\xb31Z\xb6j\x8dk\xd9\x99\xb8zx\
+\x0f\x1e\xe5^@U\xf6iL\x9d;\x87\xdd==\xeb\
+\x8e\xec\xbc}\xdbRd\xf40\xa8\xd4\x0e\xf5gx\x00\
+\x94*\x15)\x94\x8a\x06\xcf\x9a\x02I\x98\xf4_\xed\xda\
+07/\xe7\xd2m+\x96|\xf3\x8e\x83\x89\xe1\x11\xcf\
+\xc45\x19\x8b\xed\x1d\x90Z\x9f7ye\x18\x0cF\xa4\
+\xfd\xf2\x0b*\x1fU\xa0\xcf\xa0Hn\xeb\xdf\xbe\xdeD\
+\x9a;\xb2m|\xf6gg\xae\xdc\xac\x0b_N\x7f9\
+z:\x00\x83m\x17\x8f=\x872\x0f\xf8\x07\x84\x0c\xb0\
++\x82\xff\x10\xcc!\xe7\xaf\xfd\x06\xa1\xf8\xe1\x9d\xbcY\
+\xaf\x8e\x18u\xff~\xe1\x1f@\xc3O8J\x16\xcfy\
+a\xca\xed[\xbf_\xfaKg\x04\xfer&\x1e\xde\xfb\
+\xa3 q\xe9\xcc\xbf[\x99\x00,\x1f\x0cX\xa1\xbc\xbc\
+\xb4\xec\xd0\xfe=\xc7\x82C\x9f\xf2\xf4\xf1\xf5\x0f\x95\xc9\
+\x1b\x1d\x0c\xfe?\x83$I\xa6\xac\xcbi\xc9\xf1s^\
+x#??#\xd7\xf6\x9d=Q9\x0d\x1e6a\xf0\
+\xf8\xc9oL\xef\x18\xf4T\x84\x9b\x9b\x87;\xa8\xe1N\
+_}\x05\xf5\xdf\xfdl\x85\x99QU\xf9\xa8\xfcfa\
+\xfe\xbf\x0e\xfd\xf8E\xd2\x91\x03_\x1f\x05\xa0i\x8c\xf7\
+8*\x1c\x01\xf8\xf6\xec\x13\x11\xdc5,\xbc\xbd\x83\x93\
+\xa3\xdal\x8d\xc2\x06\xe5I\xbfE\x13\xff\x06\xae\x19\x8c\
+\xfaZc\xc1\xd5\xac;\xe7\xcf\xa4\x5c\x03p\x07@\xb5\
+=\xdc\xff\x05{C\x0e4\xec\xd2j\x93\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x0c\xb6\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x01\xe9IDATh\x81\xed\x98\
+1n\xd4@\x14\x86\xff\x7fLa\xd1\xa5\x89\x04\x14[\
+\x8d\xad\x14i8@\x84D\x1f!R\xb1\x1c!t\xb4\
+H\x09\x07\xa0\xcc\x11H\xd2\xa0\x9c\x80(\xca%\x22\xdb\
+l\xb1\xd2\x02\x12\x0d\x14H\xd9-v^\x1a+Mf\
+\x12\x8f\xc7f\xe5e>\xc9\x85\xe7i\xde{\xbf\xe6\xb7\
+=\x1e \x12\x89DV\x09WQTk\xfdF)u\
+\x5c\xdf\x1e\x17E\xf1\xb6m.\xd5QO+#\x0aX\
+5\x8f\x5c\x81<\xcf\xbfwYHD\xce\xca\xb2|g\
+\x09\xbdjR\xab(\x8ag\xb6q\xa7\x00\x00O\x9b6\
+\xd7\x04\x92\x1b\x8e\xd0\xe3\xfaj\xc5\xfaZh>\x9fw\
+\xbd\x02\xd7\xb6q\x119[,\x16\xfbm\xf3:\x05L\
+\xa7\xd3\x9fm\x93\xfa@\xf2:\xa4\xd6\xe0-4x\x01\
+\xf7\xbd\x85z\xc3\x18\xf3UD^\x00\x00\xc9_!\xb9\
+\x82\xf6BY\x96\xbd'\xb9S7\xf5\xa9\xaa\xaa\xcb\x90\
+|m\x08Z\x01\x92\xcf\x01\xec\xd6\xb7\xa7\xe1\xed\xf83\
+\xf8g`\xf0\x02\x9c\x16\xca\xb2\xec\xa0\xc1\xfcm\xdb\xa0\
+\xd6\xfa5Ik\xac-eY~\xb4\x8d;\x05\x90<\
+l[L)\xb5\x07`\xdcv\xbe\x03\xab\x80\xf5\xb5\x90\
+\x88\x1c>4\x99\xe4\x1e,62\xc6|!Y\x86\xb5\
+\xd6\x8c\xa0\xef@\x9e\xe7\x9fQ[\xc5\x183\xae\xaa\xea\
+\xa4\x93\xae<\x18\xbc\x85\x06/ t/t.\x22\x7f\
+\x01\x80\xe4\xb7\x0e\xfa\xf1\xa6\x97s!\xad\xf5\x96\x88l\
+\x02\x80\x88\x5cM&\x93\xa0\x0d\xdb}\xf4b!\xa5\xd4\
+\x87$I.\x92$\xb9PJ\xbd\xec\xa3\xc6m\xad>\
+\x93\xff\x0b\x06/\xc0\xf9\x10\x8fF\xa3'>\x89\x96\xcb\
+\xe5\x9f\xd9lv\xe7\xc7\x9d\xe4\x86o.\x1b\xae\xfff\
+\xa7\x804M\x7f\xf8\x140\xc6\x8c\x01\xdc\xf9\x90\x91<\
+J\xd3\xf4\xc8'\x97\x03\xeb\x0bg}-\x04\xc0k\x05\
+\x5c\xe7>\x00~\x03p\xc5\x82q\x0ap\x9dE\xfab\
+\x8c\xd9\xefs\x8f4x\x0bE\x01\x91H$\xf2\x7fs\
+\x03\x8a\xd3\x7f\xab\x80\x8d~\x09\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x0c\x12\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x01EIDATH\x89\xedT\
+\xb1J\xc4@\x10\x9d\x99\x0d\xd8\x88`\x904\x16\xc2m\
+v\xa7\x89\x95_`\xe3\x07\x1c\x96\x16V~\xc1\xfd\xc0\
+\xf5~\x81\x85\xfa\x1f\x16~\x81\xd5\x15\x9a\x08\x8a\xa5 \
+Ql\x0e\xc2&c!'\xf1\x8c\xb9\xbd\x05\xb1\xb9W\
+\xcd\xee\xcc\xbc7\xc3\xcc.\xc0\x0a\x0b\xa0B\x13\xb5\xd6\
+Y\x92$\xcfq\x1cO\xca\xb2\xbc\xfd-\x8eB\x05|\
+\x81\xed\x033\xbf{\xe6\x1d9\xe7\x1e\xa2(\x9a\x88\xc8\
+\x14\x11]\xdb\x99\xe7\xf9\xc6\xcc\x8e\xda\x0e\x119\xf3a\
+w\xce=\x22~\xd6\x86\x88W\x22r\xefY\x98?\xb4\
+\xd6\x193\x8b1f\xd8\x17\x17<\x03\xa5\xd4\xab\x88\x5c\
+6M\xf3\x14\xca\x01i\x9a\x1e0\xf3\xdd`00\xa1\
+\x1c\xbd\x1d \xe2:\x000\x22\xae\x85\x0a\xcco\xd1\xf5\
+\x9c\x7f\x0b\x002\xe7\xdc.\x11\xc5D4\xf6!\xcd\xf3\
+|\x7ff\xff\xf9;\xe8\x851f\xc8\xcc\xa2\xb5\xceB\
+9z; \xa27\x00\xb8A\xc4i\xa8\x807\xb4\xd6\
+{\xd6\xda\x0bk\xed\xf62y\xde3 \xa2\x1dD<\
+\xae\xebzs\x19\x81o_\x85\xb5\xf6\xb4+\xa8\xaa\xaa\
+\xaf{\xa5\xd4\xc8Z\xfb\xd2GZ\x14\xc5\xa8S\x00\x11\
+O:\xab\x88\xa2\xf3V\xcc!\x004\xbde\x03\x8c\x16\
+\xf8\x7f\x22t\xa3\xfe\xf7\x1d\xac\x00\x00\xf0\x01\x87\xe4P\
+\xdd-\x94\xb5.\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x0b\x9e\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x00\xd1IDAT8\x8d\xd5\x92\
+1\x0a\xc2`\x0c\x85\x9f\xf6\x9f\xeb&(H\x87@2\
+y\x03Go\xe0,\x9e\xc1\x13\x88'\xf0\x0c\xd2\xc5\xc5\
+\xd1\xcd\xcd\xcd\x0b\x14\xb2y\x80N\xa5\xe0\xf2\x13\x17\x85\
+_\xad\xb6\x82 \xbe\xe9\x91|/\x84\x10\xe0/DD\
+\x03\x119U\xf5Z7\xc3\xcc\xeb\x17\xf9\xdc{\xbfr\
+\xceef\xb6\xbd\x15Uu\x06\x00.\x00\xf7Ui3\
++\xaf\xf6\xfc\x8a\xa9\x15\x11u\x99y\xd38\xc0\xccG\
+\x11\xe97a\xc3\x1b,\x82\xfa\xdc{?t\xceM\xcc\
+\xacS\x15T\xd5%\x00\xb4\x1b\xaf\xf5\x89\x98\xf9\x90$\
+I\xef\x1b\x836D\xd4}\xc7\x847\x98\x86\x8d\xa2(\
+\xb6q\x1cg\x00Vf\x96?\x06U5\x05\xee\xff`\
+\x1c\x02Q\x14\xed\xaev\x04\xa0\xc4\xb3\xd2\xb7\xeb\x03\x80\
+\x88\x9c\x88hP\x0b\xfeT\x171^8\xa6nM\xd8\
+|\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0c,\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x01_IDATX\x85\xed\x96\
+1N\xc3@\x10E\xe7\xb3.)r\x02\xba\xccPP\
+P\xa4K\xa8\x80\x83\x808@\x8e\xc0\x11\xe8\x91\xb8\x08\
+\xa12t\xa6@\x0aEVq\x13.\xe0\x92\xc2\xf6P\
+ \xa4\xb0\x0ef\xd7q\xe4\x14~\xdd\x8e<\xb3O\xbb\
+\xa3\xf5\x10\xf5\xf4\xb4\x88\x88\x8cED\x999\xf6\xcd9\
+\xd8\xa5\x90\x0f\x91\x1b`\xe6\xf3\xd0\x22EQdi\x9a\
+\xbe\xfe\xac\x01\x0c\xfe\xaac\xad}\xaa\x15\x000\x0b\x15\
+0\xc6<\x13\xd1\xd9Z\xe8\xa4\xa6\x0ej\x05T5X\
+@U\xe7\xce:#\xa2\xc4'\xb7\x22`\xad\xbd\x0c\x15\
+\xd8\xc0\xdc\xb7\xce\xfe5\xe16\xe4y\xbe2\xc6\xdc\xaa\
+\xea\xca7\x07\xff\x7f\xf2\x0d3\xdf\x038U\xd5\x1bk\
+\xed[3\xc5*!WpLD#\x00\x87mm\x1e\
+*\xb0\x13*= \x22\xea\x93\xc8\xcc1\x80I\xe8\x86\
+\x8b\xc5\xe2\xd7\xb5w~\x02\xde0s,\x22*\x22\xe3\
+6\xebv~\x02\xde\xef\x80\xaa&D\xf4Y\x96e\xd6\
+\xa6\x80\xf7;\xe02\x1c\x0e\xaf\x00\x1c\x15E\xf1\x90\xa6\
+\xe9G\xd3:\x8d_B\x00\xd7\x00&Q\x14\xcd\x88\xa8\
+\xb1\xc0\xfe\xf5\x003?\xd6%\x94e9].\x97\xef\
+k\xa1;f\xf6\xee\x0b\xf7/\xb9i \xb9\xa8+`\
+\x8c\x198\xa1\x11\xd0\xb8\x956\x0e$\xb5\x02y\x9e\xcf\
+\x9d\xd0\xd4\x1dH\xb6\x12pg6\x0f\x12k\xedKS\
+\x81\xce\x9b\xb0\xa7\xe7\x0b\xd1-q\xa1\xb2R\xafy\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0b\xa2\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x00\xd5IDATh\x81\xed\xd8\
+Q\x0a\xc20\x10\x04\xd0\xd9*\x1eer\x8d^L\x05\
+\xbd\x98\xe7\xc8Q\x04\x1d?\xac\xe0\x976bX\x8b\xf3\
+\xa0\x90@Ivh>\xb6\x01\xcc\xcc\xcc\x16,:\xaf\
+=L\xe3+\x00u\xdc\xeb\xfbH\xeeH^\xa6g\xd7\
+k\x9fu\xaf\x85\x01DD\x0c\x00 \xa9\xdb\x97\x1e\xde\
+\xbf\xf2\xdb\x1c \x9b\x03ds\x80l\x0e\x90m\xf1\x01\
+\xe6\xb6\x12Ar\x8b\x86\xe6/\x22\xc6\xe71\xc9\x96\xba\
+Tk=bF\x038\xb7\xa0\x81\xe49\x22V-U\
+|J\xd2\xa5\xd6\xba\xc1\xbd\x8b}\xe9o\x8e\x90\x00\x1c\
+Z\xba\xca\xe9\x08\x8d\xd3\xf4$\xe9\xd4P\x97\x90\xfd\xff\
+@r_JQ)E$\xf7\xbd\xf6Y\xfc\x11r\x80\
+l\x0e\x90\xcd\x01\xb29@\xb6\xc5\x07\xe8y3'I\
+\x8fn\xb2[_\xe3\xcb]33\xb3L7\xd6I2\
+8\xcb\xf1}7\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x0b7\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x00jIDATH\x89\xed\x94\
+\xb1\x09\xc00\x0c\x04\xa5\x90]\xae\xcd\x0c\xd9;\xf6\x0a\
+i=\x8d\xd2\xa40\xc1\xcdCT\x18|\xa0F\xe2y\
+\x89\x07\x99-f\xc3\xdf\xca\x01(@Q4\xbb\xe8!\
+o\xbf\xa9\x82e\xf0;\xa3\xd0\x1c\xb8F\xb3\x888\xcc\
+\xcc\xdc\xfd\x1e\xe8\xa2\xb5v~\x9b\xe9\x17H\x00\x15\xa8\
+\x8af\xfe\x90\xe77P\x7fQ\xa4l\xd1\x91\xfb\xae\x17\
+)<f\x16\x0e\xee:G\xe1\x88\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x0b.\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x00aIDAT8\x8dc`\
+\x18\xde@]]=T]]=\x14\x9f\x1a\x16|\x92\
+\xff\xff\xff\xd7\x22d\x09\x13\xa9\xae\xa2\xba\x01\x8c\xc8\x1c\
+uu\xf5Pdg322:0000\xfc\xff\
+\xff\xff\x00\x92\xd8\xb5\x9b7o\xae\xa6\x9a\x0b\xf0\x025\
+5\xb5z55\xb5z|j\x06>\x10\xf1\xa6\x03F\
+F\xc6k\x94Z0\x04\x00\x00\xfbP\x13\x8a\xa5\x03\x84\
+2\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x0b1\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x00dIDATX\x85\xed\x96\
+\xb1\x09\xc00\x0c\x04\x9d\x90]n\x22{H{\x22M\
+\xe34.\xe3\x22y\x83\x8b\xfc5*\x04\xcf!\x90P\
+J\xc6\x18\x01 \x03Y\xc9\xb8D\x87:\xea\xf15\xe0\
+\x14\x05d,`\x01\x0bL\xf7w\x1c\x98:\xeb\xbf\xa4\
+DD{jl\x9f\x80\x04\xd0\x81\xaedl\x9f\x80\x05\
+,`\x01\xf5#*K,\x8c\xf957\x5c\x09\x0a\xa5\
+\xa2E9\x0b\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x04\xbc\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x02giTXtXML\
+:com.adobe.xmp\x00\x01\
+\x00UTF-8\x00XML:com.a\
+dobe.xmp\x008\x8d\x9dT\xc1n\x9c\
+0\x10\xfd\x15\xcb\xb9\xb4j\xc1\xc6\xecj\x8b\x15\x1aE\
+\xbb\xa9\x92\x03m\x94\xac\x94^\x8dmv\xad\x00\xa6\xb6\
+7\xb0\xf9\xb5\x1c\xfaI\xfd\x85\x1a\xb2\xd0&R\x135\
+\x08${x\xf3f\xc6o<\xc7']\xc3\xf8\xadt\
+ \x97\x1bU\xa7\xf0\xd7\xc3O\x08\x94H\xe1\xcd<\xc3\
+Y\xb3\x94[u~o\xe4\xf5\xfd\xd75\xbf\xbf\xe5\x89\
+\x80'\x9f\xc1qG\xbb\xaa\xa9\xa4c\xa0\xab\xca\xda\xd2\
+.\x85L\xe8\x5cR\xbf\xee\xcd\x08\x82\x01\xe2nSx\
+\xda\xff\x00\xdf\xb3K\xb0\xd4F\x82E\x18\x05\x1cc\x0c\
+\x16I(\x05#y\x5c|\x04\x04\x93\x08E\xfe\x9d\x05\
+\x11\xa11\xa63\x02\x0e\x0f\xf4\xe1\x8c(\xe8\xd5\xea\xcb\
+!\x98\xdf\xa5p\xeb\x5cC\x11j\xdb6l\xe3P\x9b\
+\x0d\x8a\x92$A\x98 B\x02\x8f\x08\xec\xbev\xac\x0b\
+j{42\xac\xa4\xe5F5N\xe9\x1a\xf4{\x96\xeb\
+\x9dK!\x1ck\xa8\x9a\x89\xb6\xb6\xe1PO\xc8u\x85\
+:\xd6\xa0(\xc4h\x04\x0a>\xe1\x9a\x9d)\x87\xe0\x82\
+#Y\xcaJ\xd6\xcezl4a\x9b\xadv\xdan\xf5\
+?\xa8\xa7\xdfO\x02\xf8L\xb2\xec\xe5\x5c\xaajB[\
+wv\xe7^F\xdb\xf5\xbe\x91\xe8JZ\xbd3\x5c\x9e\
+\xdd\xf94\x8fz\xf7\x86.\x8ddN\x9b\xb5\xd6\xe5\xa8\
+\xd4\xe5\x98\x13 q\x18\x81w7\xaa\x16\xba\xb5\xef\xff\
+r\x90+\xff\xa5\xd0\xab6\x0fp\x1c\x10\xbc&\x98z\
+\xe1\xa2\xe4\x03\xfeD1~\x84fZ\xa8b\xff\x0c\x1a\
+\xad1\xa68\xa6\xe4)\xd4\xf7\x8c`\x8e\xbd\x0a\x16\x9c\
+\x16\xdaT\xcc\x17\xac*\xb6\x91\xa8\xa97\x10L\xc7H\
+\x97\xba\xd4\xc6\x07\xf6,\xf1@\x9de\xf4\xa2\xb6\x8e\xd5\
+\x5c^\xacR\xe8-\xa1R\x82\xe6\x09\x9b32\x8f\x82\
+d\x16\xb3 \x8egy\x90\xcfd\x11,\x8a<\x9f/\
+r\x12\xe3\x08\x8f\xfe+\xcdw\xbd\xb2\xa3\xbf\xf8O\xff\
+oF\xf9\xab\xc5\xca7\xf3\xf4\x17n`:W\xd6\x8b\
+\xb5?\xf4\xf3\xb5\xfcqX\x95\x0a\x0c]@\x19\xef\xbb\
+;\x85|PI\xc0\x83Y\xbd\xf9\x04\x1e\xfd\xdb\xad\xac\
+_\x94\xfb\x11fu\xe1Zf\xe4\xe9\xc6W\xf9j;\
+!\x9f<\xfaS\x07z^\x22zvgG\x93\x1f\x04\
+\x03|\x1cA~3\x0d1Y\xfb\xc9e\xfc\x88\xfa\x0d\
+\xb5\x8d\x86\x0f\x0b0\xb8)\x00\x00\x01\xfbIDAT\
+h\x81\xed\x961n\xdb0\x14\x86\x7fRB\x87\xf6\x02\
+\x06L\x81\xbb\xb3+c\xddKt\x95\xf7\x1c\xa2A\xef\
+\x90\xdd^{\x89\xb8\xabw\xbb3\xc1g\xf8\x04\xedP\
+H|]\x18XH\xe4H\xb2\xa8\x0a\x06\xf8-\x02h\
+\x92\xef\xfd\xe2g\xda@$\x12\x89L\x89\x18k\xe3\xe3\
+\xf1\xf8\xb1\xaa\xaa'\x00H\x92\xe4a>\x9f\xff\x19\xa3\
+\xce(\x01\x8c1\x0b)\xe5\x0f\x00w~h\xef\x9c\xfb\
+\xaa\xb5>\x84\xae%CoHD\x85\x94r\x87s\xf3\
+\x00p'\xa5\xdc\x11Q\x11\xba^\xb0\x13xQF\x08\
+Q\xd4\xf6\xfd\xed\x9f\x9f\xfc\x93\x99y\x13R\xa9 '\
+`\x8cY8\xe7vB\x88\x15\xce\xcd\xef\x9ds\xb9s\
+.\x07\xb0\xf7cB\x08\xb1r\xce\xed\x8c1\x8b\x10\xb5\
+\x07\x07hR\x86\x99\xd7R\xca\x5ck}\xd0Z\x1f\xa4\
+\x9493\xafk\xcb\x82)u\xb5B\x97\x94\x11B<\
+(\xa56Mk\x88\xa8`\xe6'\x04T\xea\xaa\x00\x0d\
+\xb7\x0c\x98y\xcf\xcc\xad7M\xd3Z\x0c\xb8\xa5z+\
+\xd4\xa0\x0c3\xf3:I\x92\xbcK\x03\xaf\x94b?|\
+\xb5R\x9dO\xa0\xa6\xcc\xaa6\xfc\xae2m4(\x05\
+\xff2:+\xd5)\xc0\xe9tZ\x94e\x19\xec\xd8\xeb\
+\x0cU\xaaU!\x22*\xca\xb2|\xa3\xcc\xcb-s]\
+\xdbg\x86*\xf5\xee\x090\xb3$\xa2\xbf\x00\x12?4\
+H\x996\x1a\x94\xaa\x94R\x1f\x84\x10\xee\xd2\x9a>_\
+b\x97\xa6\xe9\xfdX\xcd\x03\x80Rj\x93\xa6\xe9=\x80\
+\x8b\x0d\xbf\xa6O\x00\x9e\xcdf\xbf\xfa\xb7\xd5\x0f_\x83\
+['z\x82\xff\x99\xfb\xdf\xc4\x00S\x13\x03LM\x1a\
+j#k\xed\x12\xc0\xb2\xe3\xf4m\x96e\xdb\x10u\x83\
+\x05\x00\xf0\x19\xc0\xb7\x8es\x19\xc06D\xd1\xa8\xd0\x05\
+\x9e\xf1\xf6\x0d/\x01|\x09]h\xac\x00?\xb3,\xfb\
+^\x1f\xb0\xd6\x0a\x8c\x10\xe0\xe6\x15\x8a\x01\xa6&\x06\x98\
+\x9a\x18`jn>@\x9f\x1f\xb2\x84\x88*km\x88\
+\xba\x8f\xd6\xda\xc7\xa6\x0f\x88\xa8\xd7F7\x7f\x027\x1f\
+ \x12\x89D\xa6\xe5\x1f\xdf#\x05\x07t\xddWX\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x04\x1d\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x02giTXtXML\
+:com.adobe.xmp\x00\x01\
+\x00UTF-8\x00XML:com.a\
+dobe.xmp\x008\x8d\x9dT\xc1n\x9c\
+0\x10\xfd\x15\xcb\xb9\xb4j\xc1\xc6\xecj\x8b\x15\x1aE\
+\xbb\xa9\x92\x03m\x94\xac\x94^\x8dmv\xad\x00\xa6\xb6\
+7\xb0\xf9\xb5\x1c\xfaI\xfd\x85\x1a\xb2\xd0&R\x135\
+\x08${x\xf3f\xc6o<\xc7']\xc3\xf8\xadt\
+ \x97\x1bU\xa7\xf0\xd7\xc3O\x08\x94H\xe1\xcd<\xc3\
+Y\xb3\x94[u~o\xe4\xf5\xfd\xd75\xbf\xbf\xe5\x89\
+\x80'\x9f\xc1qG\xbb\xaa\xa9\xa4c\xa0\xab\xca\xda\xd2\
+.\x85L\xe8\x5cR\xbf\xee\xcd\x08\x82\x01\xe2nSx\
+\xda\xff\x00\xdf\xb3K\xb0\xd4F\x82E\x18\x05\x1cc\x0c\
+\x16I(\x05#y\x5c|\x04\x04\x93\x08E\xfe\x9d\x05\
+\x11\xa11\xa63\x02\x0e\x0f\xf4\xe1\x8c(\xe8\xd5\xea\xcb\
+!\x98\xdf\xa5p\xeb\x5cC\x11j\xdb6l\xe3P\x9b\
+\x0d\x8a\x92$A\x98 B\x02\x8f\x08\xec\xbev\xac\x0b\
+j{42\xac\xa4\xe5F5N\xe9\x1a\xf4{\x96\xeb\
+\x9dK!\x1ck\xa8\x9a\x89\xb6\xb6\xe1PO\xc8u\x85\
+:\xd6\xa0(\xc4h\x04\x0a>\xe1\x9a\x9d)\x87\xe0\x82\
+#Y\xcaJ\xd6\xcezl4a\x9b\xadv\xdan\xf5\
+?\xa8\xa7\xdfO\x02\xf8L\xb2\xec\xe5\x5c\xaajB[\
+wv\xe7^F\xdb\xf5\xbe\x91\xe8JZ\xbd3\x5c\x9e\
+\xdd\xf94\x8fz\xf7\x86.\x8ddN\x9b\xb5\xd6\xe5\xa8\
+\xd4\xe5\x98\x13 q\x18\x81w7\xaa\x16\xba\xb5\xef\xff\
+r\x90+\xff\xa5\xd0\xab6\x0fp\x1c\x10\xbc&\x98z\
+\xe1\xa2\xe4\x03\xfeD1~\x84fZ\xa8b\xff\x0c\x1a\
+\xad1\xa68\xa6\xe4)\xd4\xf7\x8c`\x8e\xbd\x0a\x16\x9c\
+\x16\xdaT\xcc\x17\xac*\xb6\x91\xa8\xa97\x10L\xc7H\
+\x97\xba\xd4\xc6\x07\xf6,\xf1@\x9de\xf4\xa2\xb6\x8e\xd5\
+\x5c^\xacR\xe8-\xa1R\x82\xe6\x09\x9b32\x8f\x82\
+d\x16\xb3 \x8egy\x90\xcfd\x11,\x8a<\x9f/\
+r\x12\xe3\x08\x8f\xfe+\xcdw\xbd\xb2\xa3\xbf\xf8O\xff\
+oF\xf9\xab\xc5\xca7\xf3\xf4\x17n`:W\xd6\x8b\
+\xb5?\xf4\xf3\xb5\xfcqX\x95\x0a\x0c]@\x19\xef\xbb\
+;\x85|PI\xc0\x83Y\xbd\xf9\x04\x1e\xfd\xdb\xad\xac\
+_\x94\xfb\x11fu\xe1Zf\xe4\xe9\xc6W\xf9j;\
+!\x9f<\xfaS\x07z^\x22zvgG\x93\x1f\x04\
+\x03|\x1cA~3\x0d1Y\xfb\xc9e\xfc\x88\xfa\x0d\
+\xb5\x8d\x86\x0f\x0b0\xb8)\x00\x00\x01\x5cIDAT\
+H\x89\xedR1N\x02Q\x14\x9c\xf71\x14\xb6\x16[\
+\x00\x81\xd2\xd8\xe8\x11\xcc\x16\x1c\xc1\xc6b\x0f`\xe5\x09\
+\xf0\x06V\x1e\xc0\xc2\xc6\x13Xiib\xa5\x091\x96\
+\xee\xce'd{bA\x5c\xc6\xc2\xc5\x80J\xf6\x131\
+\xc6\x84\xe9\xfe\xfb3o\xfe\x9b\xf7\x815*`\xa1\xc4\
+\xc1`\xb0Y\x14\xc5\x19\x00\xd4j\xb5\xa3F\xa3\xf1\xb2\
+2\x834Mw\x9cs\x97\x00\xb6\xcb\xd2\xd3d29\
+h\xb7\xdb\x8fUZWE\xf0\xde'\xce\xb9;I[\
+f\xd65\xb3\xae\xa4-\xe7\xdc\x9d\xf7>\xa9\xd2/\x9c\
+`\x1a\x89\x99%\x00\xae\xeb\xf5\xfaa\x14E9\x00\xe4\
+y\x1e\x8d\xc7\xe3\x0b\x00\xb1\xa4\xf3e\x22\x03\xf0\x1e\x09\
+\xc9>\xc9W\x92=I_&\x95\xe4H\xf6JN?\
+M\xd3\x9d\xa0\xe6\xde\xfb\x84\xe4(\xcb\xb2\xa1\xf7>\x0e\
+\xe0\xc7Y\x96\x0dI\x8e*#\x93d$\x0b\x92\xb7y\
+\x9eGA/\xc2{d$oI\x16\x92\xe6b_\xb4\
+\xe4\xabi\xde!(\xb9W\xdf\xddU\xfe\xa2\x9f\xe2\xd7\
+\x0d6BH\xde\xfbSI{\xb353\xbbo6\x9b\
+\xc7+1(\x9b\xef\x02\xb8/K{\x92B\xa4a\x06\
+%\x1eZ\xadV\x0c\x00$oBE\xff\x7f\xc9\x7f\xf6\
+\x8b\xf6I~\x1c$u\xcc\xecy\x96 \xa9C\xb27\
+\xabY\xca`V`f\x000g`f\x1d\x00'\x9f\
+t\x93\x05\xfd\xd6X\x8c7\xef\x87\xb15=\x07\xc8\xb0\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03\xbd\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x02giTXtXML\
+:com.adobe.xmp\x00\x01\
+\x00UTF-8\x00XML:com.a\
+dobe.xmp\x008\x8d\x9dT\xc1n\x9c\
+0\x10\xfd\x15\xcb\xb9\xb4j\xc1\xc6\xecj\x8b\x15\x1aE\
+\xbb\xa9\x92\x03m\x94\xac\x94^\x8dmv\xad\x00\xa6\xb6\
+7\xb0\xf9\xb5\x1c\xfaI\xfd\x85\x1a\xb2\xd0&R\x135\
+\x08${x\xf3f\xc6o<\xc7']\xc3\xf8\xadt\
+ \x97\x1bU\xa7\xf0\xd7\xc3O\x08\x94H\xe1\xcd<\xc3\
+Y\xb3\x94[u~o\xe4\xf5\xfd\xd75\xbf\xbf\xe5\x89\
+\x80'\x9f\xc1qG\xbb\xaa\xa9\xa4c\xa0\xab\xca\xda\xd2\
+.\x85L\xe8\x5cR\xbf\xee\xcd\x08\x82\x01\xe2nSx\
+\xda\xff\x00\xdf\xb3K\xb0\xd4F\x82E\x18\x05\x1cc\x0c\
+\x16I(\x05#y\x5c|\x04\x04\x93\x08E\xfe\x9d\x05\
+\x11\xa11\xa63\x02\x0e\x0f\xf4\xe1\x8c(\xe8\xd5\xea\xcb\
+!\x98\xdf\xa5p\xeb\x5cC\x11j\xdb6l\xe3P\x9b\
+\x0d\x8a\x92$A\x98 B\x02\x8f\x08\xec\xbev\xac\x0b\
+j{42\xac\xa4\xe5F5N\xe9\x1a\xf4{\x96\xeb\
+\x9dK!\x1ck\xa8\x9a\x89\xb6\xb6\xe1PO\xc8u\x85\
+:\xd6\xa0(\xc4h\x04\x0a>\xe1\x9a\x9d)\x87\xe0\x82\
+#Y\xcaJ\xd6\xcezl4a\x9b\xadv\xdan\xf5\
+?\xa8\xa7\xdfO\x02\xf8L\xb2\xec\xe5\x5c\xaajB[\
+wv\xe7^F\xdb\xf5\xbe\x91\xe8JZ\xbd3\x5c\x9e\
+\xdd\xf94\x8fz\xf7\x86.\x8ddN\x9b\xb5\xd6\xe5\xa8\
+\xd4\xe5\x98\x13 q\x18\x81w7\xaa\x16\xba\xb5\xef\xff\
+r\x90+\xff\xa5\xd0\xab6\x0fp\x1c\x10\xbc&\x98z\
+\xe1\xa2\xe4\x03\xfeD1~\x84fZ\xa8b\xff\x0c\x1a\
+\xad1\xa68\xa6\xe4)\xd4\xf7\x8c`\x8e\xbd\x0a\x16\x9c\
+\x16\xdaT\xcc\x17\xac*\xb6\x91\xa8\xa97\x10L\xc7H\
+\x97\xba\xd4\xc6\x07\xf6,\xf1@\x9de\xf4\xa2\xb6\x8e\xd5\
+\x5c^\xacR\xe8-\xa1R\x82\xe6\x09\x9b32\x8f\x82\
+d\x16\xb3 \x8egy\x90\xcfd\x11,\x8a<\x9f/\
+r\x12\xe3\x08\x8f\xfe+\xcdw\xbd\xb2\xa3\xbf\xf8O\xff\
+oF\xf9\xab\xc5\xca7\xf3\xf4\x17n`:W\xd6\x8b\
+\xb5?\xf4\xf3\xb5\xfcqX\x95\x0a\x0c]@\x19\xef\xbb\
+;\x85|PI\xc0\x83Y\xbd\xf9\x04\x1e\xfd\xdb\xad\xac\
+_\x94\xfb\x11fu\xe1Zf\xe4\xe9\xc6W\xf9j;\
+!\x9f<\xfaS\x07z^\x22zvgG\x93\x1f\x04\
+\x03|\x1cA~3\x0d1Y\xfb\xc9e\xfc\x88\xfa\x0d\
+\xb5\x8d\x86\x0f\x0b0\xb8)\x00\x00\x00\xfcIDAT\
+8\x8d\xc5R;N\x031\x10}3f\x15\x89+X\
+Z\x17t\x0b-9\x04\x14\xa9\xa0\xcd\x018\x0f\x97 \
+\x15\xd7\x08}:\x0a\xefz\x0b.\x10)Z{\x86\x86\
+\x8d\x9c\xc5\x89@A\xe2U\xf3y3~od\xe0\xbf\
+A\xc7\x1a}\xdf_\xa6\x94\x9e\x01\xc0\x18\xf3d\xad\xdd\
+\x96x\x5c*z\xef\x1b\x11Y\x8f\xb9\x88\xac\xbd\xf7\xcd\
+\x8f$\x85\x10\x96!\x84\x8f\x10\xc2\xf2T\xed\x9b\x85Q\
+2\x11\xdd\x8a\xc8\xa3sn3U\xc5\xcc/\xaa\xfa\x96\
+[\xda[\x881\xde\x13Q\xc3\xcc\xf3\xe90\x008\xe7\
+6\xcc<'\xa2FU\xef\x8a7PU\x7f\xecX\x00\
+`\xad\xdd\xaa\xaaO)\xed\x95_\xe4\x04f\xd61n\
+\xdb\xf6\xaa\xaa\xaa\x19\x00\x0c\xc3\xb0\xab\xeb\xfa}\xec\x19\
+c\xb4\xb8 \x07\x11\xbd\xc6\x18g_\xf1\x0e\xc0M\x89\
+w`ADh\x92/Dd1\x1d\xca-\x14\xff\xc1\
+op\xf6\x82\x83\x1b\x10\xd1C\xd7uZ\xe0]\xe7u\
+U]\x9d\xfb\xf0\xdf\xe1\x13\xa95zw\xdc\x11\xd6\x9c\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x04-\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\
+\x01\x00\x9a\x9c\x18\x00\x00\x02giTXtXML\
+:com.adobe.xmp\x00\x01\
+\x00UTF-8\x00XML:com.a\
+dobe.xmp\x008\x8d\x9dT\xc1n\x9c\
+0\x10\xfd\x15\xcb\xb9\xb4j\xc1\xc6\xecj\x8b\x15\x1aE\
+\xbb\xa9\x92\x03m\x94\xac\x94^\x8dmv\xad\x00\xa6\xb6\
+7\xb0\xf9\xb5\x1c\xfaI\xfd\x85\x1a\xb2\xd0&R\x135\
+\x08${x\xf3f\xc6o<\xc7']\xc3\xf8\xadt\
+ \x97\x1bU\xa7\xf0\xd7\xc3O\x08\x94H\xe1\xcd<\xc3\
+Y\xb3\x94[u~o\xe4\xf5\xfd\xd75\xbf\xbf\xe5\x89\
+\x80'\x9f\xc1qG\xbb\xaa\xa9\xa4c\xa0\xab\xca\xda\xd2\
+.\x85L\xe8\x5cR\xbf\xee\xcd\x08\x82\x01\xe2nSx\
+\xda\xff\x00\xdf\xb3K\xb0\xd4F\x82E\x18\x05\x1cc\x0c\
+\x16I(\x05#y\x5c|\x04\x04\x93\x08E\xfe\x9d\x05\
+\x11\xa11\xa63\x02\x0e\x0f\xf4\xe1\x8c(\xe8\xd5\xea\xcb\
+!\x98\xdf\xa5p\xeb\x5cC\x11j\xdb6l\xe3P\x9b\
+\x0d\x8a\x92$A\x98 B\x02\x8f\x08\xec\xbev\xac\x0b\
+j{42\xac\xa4\xe5F5N\xe9\x1a\xf4{\x96\xeb\
+\x9dK!\x1ck\xa8\x9a\x89\xb6\xb6\xe1PO\xc8u\x85\
+:\xd6\xa0(\xc4h\x04\x0a>\xe1\x9a\x9d)\x87\xe0\x82\
+#Y\xcaJ\xd6\xcezl4a\x9b\xadv\xdan\xf5\
+?\xa8\xa7\xdfO\x02\xf8L\xb2\xec\xe5\x5c\xaajB[\
+wv\xe7^F\xdb\xf5\xbe\x91\xe8JZ\xbd3\x5c\x9e\
+\xdd\xf94\x8fz\xf7\x86.\x8ddN\x9b\xb5\xd6\xe5\xa8\
+\xd4\xe5\x98\x13 q\x18\x81w7\xaa\x16\xba\xb5\xef\xff\
+r\x90+\xff\xa5\xd0\xab6\x0fp\x1c\x10\xbc&\x98z\
+\xe1\xa2\xe4\x03\xfeD1~\x84fZ\xa8b\xff\x0c\x1a\
+\xad1\xa68\xa6\xe4)\xd4\xf7\x8c`\x8e\xbd\x0a\x16\x9c\
+\x16\xdaT\xcc\x17\xac*\xb6\x91\xa8\xa97\x10L\xc7H\
+\x97\xba\xd4\xc6\x07\xf6,\xf1@\x9de\xf4\xa2\xb6\x8e\xd5\
+\x5c^\xacR\xe8-\xa1R\x82\xe6\x09\x9b32\x8f\x82\
+d\x16\xb3 \x8egy\x90\xcfd\x11,\x8a<\x9f/\
+r\x12\xe3\x08\x8f\xfe+\xcdw\xbd\xb2\xa3\xbf\xf8O\xff\
+oF\xf9\xab\xc5\xca7\xf3\xf4\x17n`:W\xd6\x8b\
+\xb5?\xf4\xf3\xb5\xfcqX\x95\x0a\x0c]@\x19\xef\xbb\
+;\x85|PI\xc0\x83Y\xbd\xf9\x04\x1e\xfd\xdb\xad\xac\
+_\x94\xfb\x11fu\xe1Zf\xe4\xe9\xc6W\xf9j;\
+!\x9f<\xfaS\x07z^\x22zvgG\x93\x1f\x04\
+\x03|\x1cA~3\x0d1Y\xfb\xc9e\xfc\x88\xfa\x0d\
+\xb5\x8d\x86\x0f\x0b0\xb8)\x00\x00\x01lIDAT\
+X\x85\xedT1n\xc2@\x10\x9c\xdds\x95<\x81\x93\
+\x8e:\xf4H\xe1\x1fNKzWyA\xc2\x0f\xd2\xd0\
+\x87\x16\xfe\x91H\xf4Pc\xf9\xfc\x84\xa4\xc2{i\x8c\
+\x84\xcc\x1d\xf6!\x12E\x8aGrs\xbb\xb7;7\xb3\
+k\xa0\xc7\x7f\x07]z\xb1,\xcb\x9b\xaa\xaa\xe6\x00\xa0\
+\x94\xca\x06\x83\xc1\xd7\xaf\x11\xc8\xf3\xfc\x8e\x99\x97\x00F\
+\xf5\xd1FD\x1e\x8c1\xdb\xd8Z\x1c{\xc1Z;e\
+\xe6u\xdd|S\x7f#f^[k\xa7\xb1\xf5:+\
+p\x90\x9c\x88\x1e\x01\xc09\xf7\xa6\x94\xca\x00\xc0w\xde\
+\xd5\x92N\x04\x1a\x92\x7f\x12Q\xa6\xb5^\x1c\xe7Xk\
+\xa7\xce\xb99\x80[DX\xd2jASr\x11\x197\
+\x9b\x03\x80\xd6z!\x22cDZ\x12T $y\x9b\
+\xb4\xb1\xf7\xbc\x04\xbaH\xde\x86\xae\x96x- \xa2\x17\
+\xb4H\xde\x86\xa6%J\xa9g_\xde\xd9\x19\x10\x91\xd9\
+%\xbb}\x801f+\x22\xb3\xba\x96W\xed\xe8\xff\xc0\
+\xb5\xd1\x13H\xce\x05\x95R\xaey\xb6\xdb\xed\xee\x93$\
+\xd1\xbe\xfc\xfd~o\x87\xc3\xe1\x87/\xc6\xcc'\xb5Z\
+\x09TUu28\xcc\xfc\xe4\x9cK\x03MV\x00\xbc\
+\x04BC\x18\xad\xc0\x01D\xf4.\x22\xb6n\xac\x9ds\
+\x93\xd0+\xeb\x9c\xeb(p\x14{5\xc6\xac\x00 \xcf\
+\xf3\x94\x99'\xa1W\x02\xfd\x1a\xf6\x04\xfe0\x81\xb3[\
+\xc0\xcc\xcb\xa2(:\x17#\xa2\xb4(\x8a\xe0*z{\
+\xc4$\xf7\xe8\xf1\x13\xf8\x06\xb4\xc3\xcc\xf8\x96OS\x98\
+\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x03A\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95\
+c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\
+\xeeN\x0a\x11\x91Q\x0a\x0cH 1\xb9\xb8\x80\x01/\
+\xf8v\x8d\x81\x11D_\xd6\x0d,a\xe3\xc0\xaf\x16\x03\
+p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\
+\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\
+\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7\
+($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\
+\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16\
+_\x18\x18\x98'\x22\xc4\x92\xa610log`\x90\
+\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\
+\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\
+\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd\
+`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xff\
+g-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\
+\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\
+\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\
+\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bp\
+gp\x02\x00v\x85Nr0\xef\x13B\x00\x00\x00\x09\
+pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\
+\x1b\x00\x00\x01\xc7IDATh\x81\xed\x98\xb1JC\
+1\x14\x86\xffxK{\xe9\xd6\xa1\x82J2uqp\
+\xf1\x01Dp\x17\xb1\x93}\x85\xba\xb9\x0a\xea\x038\xf6\
+\x11\x8a.\xd2'P\x8a/!\x88CIP\xc1\x0e:\
+\x08\xa6\x85\x12\x97v\xd1\x9c\xd2\xdc\xdcZR\xf3A\xe1\
+6\x87\xfc\xe7\x1c\xf2\xe7\x92\x5c \x12\x89D\xfe\x1dR\
+\xca#\xa5\x94\x19\xff\xda>Z+y\x15\xb5(b\x03\
+\x8b\xa6@\x05\xa4\x94\xcfy&b\x8cu8\xe7\xc7\x96\
+\xd0\xc1,\xb9\x84\x10\x1b\xb6q\xb2\x01\xc6\xd8\xbaC}\
+\xb3P!\xc6\xcb\x8c\xb1rV\xd1\xe5\xb5P\x9a\xa6\xb9\
+\xae@\xa1P\xf8\x22B\x9d4M\x9b\x99u\xa9@\xb5\
+Z}\xcd*\xea\xc8\x97O\xae\xe0-\x14|\x03\xa4\x85\
+\xe6\xc9p8\xbc-\x95J\xbb\x000\x1a\x8d\xde|\xb4\
+\x98\xcfd)\xe5\x09\x80\x9d\xf1\xdfK!\xc4\xbd\x8f^\
+\x16\xbcV\x801\xb6\x0d`\x1f\x00\x8c1\xd7\xb9T\xe4\
+H\xf0{ \xf8\x06H\x0b)\xa5\xcef\x98\xbfE\xcc\
+=\xa4bY\xe1\x9c_\xd8\xc6\xa7\xed\x81s\x8f|u\
+\x00\x0d\x8f\xf96\xac\x0d,\xaf\x850\xdb\x0a\xd4a\xb7\
+\xca\x0d\x80\xc7,\x05\xfd)J\xa9\xf6\xe4n+\xa5<\
+ZD\x0d\xc1[(\xf8\x06|\xcfBw\x00>\xc7\xcf\
+O\x9eZ\x99\xf0:\x0bQ\xf4z\xbd\xcd$IV\x01\
+`0\x18<\xd4j5\xaf\x03\xdb4\xe6b\xa1$I\
+N\x01t\x01t\x8b\xc5\xe2\xde<rL\x08~\x0f\x04\
+\xdf\x00\xb9\x89\xfb\xfd\xfe\x9a\x8b\x90\xd6\xfa\x83sn\xbb\
+\xb8W\x5c\xb5lP\xf7f\xb2\x01\xad\xf5\x8bK\x02c\
+L\x03\xc0\xd5\xcfq\xc6XKk\xddr\xd1\x22\xb0\xbe\
+p\x96\xd7B\xc6\x18\xa7\x15\x00@}\xf7y7\xc6P\
+1o\xc8\x06\xa8o\x91\xae\x18c\x9aB\x88_\xd6\xca\
+\x8b\xe0-\x14\x1b\x88D\x22\x91\xff\xcd7\xd7Dz\xe1\
+i\xb4\xc1&\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x02\x9c\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95\
+c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\
+\xeeN\x0a\x11\x91Q\x0a\x0cH 1\xb9\xb8\x80\x01/\
+\xf8v\x8d\x81\x11D_\xd6\x0d,a\xe3\xc0\xaf\x16\x03\
+p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\
+\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\
+\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7\
+($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\
+\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16\
+_\x18\x18\x98'\x22\xc4\x92\xa610log`\x90\
+\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\
+\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\
+\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd\
+`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xff\
+g-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\
+\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\
+\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\
+\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bp\
+gp\x02\x00v\x85Nr0\xef\x13B\x00\x00\x00\x09\
+pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\
+\x1b\x00\x00\x01\x22IDATH\x89\xedT=J\xc6\
+@\x10}\xb3\x11lDP\xec\xccb%Z\xc4\xca\xc6\
+\xd6\xc6\x03|\xb5\x85\x87\xf8.`\xef\x09l\xf4\x02\x9e\
+\xc0\xc2\x13X\xd9\x08\x82\xe2\xbc\x90JP\x04\xb1\x88\xbb\
+c!\x81|\x1f\x127\x81`\xf3\xbdjvg\xe6\xbd\
+]\xe6\x07X`,\xa8jA\xd2HN\xba\xe2\xdc\xd8\
+\x0f\x91\xf6\x81\xe4{J\x92s\xee8\x84\xf0(\x22w\
+\x00>\x01|\xb5\xfd\xde\xfb\xd5\xc6^\x9aQ\x139O\
+\x11\x881>\xb5r\xae\x01<\xa4\xe4\xf5\xc2\xe85\x10\
+\x91W3\xbb\xcc\xb2\xecy(\x07T\xf5\x88\xe4=\xc9\
+\xed\xa1\x1c\x9d?\x10\x91\x15\x00;f\xb6<T`\xbe\
+\x8bn\xe6\xfc\x1b\x00\x0a3\xdb\x03\xb0.\x22\xa7)\xa4\
+\xde\xfb\xc3\xc6\x1e}\x0e:ArB\xd2T\xb5\x18\xca\
+\xf1W\x0d\xde\xcc\xec\x16?\xc34.\xaa\xaa\xdaW\xd5\
+\x0b\x92\x9b}\xf2\x92k\x10B\xd8\x12\x91\x133[\xeb\
+#0\xb3*\xca\xb2<\xfb-\xa8\xae\xeb\xf6\xfd\xb4,\
+\xcb\x97.\xd2<\xcf\xa7\x8d\x9d\xb4\xecb\x8c\x07\xce\xb9\
+]\x00W\x00>\x00\xc4.\x81\xf6\xb2K\xc6\xd0\x8e\xfa\
+\xdf9X\x00\x00\xbe\x017\xe4{\x9dZ\x18\xd1\xfb\x00\
+\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x02V\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95\
+c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\
+\xeeN\x0a\x11\x91Q\x0a\x0cH 1\xb9\xb8\x80\x01/\
+\xf8v\x8d\x81\x11D_\xd6\x0d,a\xe3\xc0\xaf\x16\x03\
+p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\
+\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\
+\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7\
+($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\
+\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16\
+_\x18\x18\x98'\x22\xc4\x92\xa610log`\x90\
+\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\
+\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\
+\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd\
+`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xff\
+g-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\
+\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\
+\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\
+\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bp\
+gp\x02\x00v\x85Nr0\xef\x13B\x00\x00\x00\x09\
+pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\
+\x1b\x00\x00\x00\xdcIDAT8\x8d\xd5\x92!n\xc3\
+@\x10E\xffz\xcb\xc3\x22%\xf2\x1a\xf6\x14\x85\xbdF\
+\xd5+\xe4\x06QN\x903T&!\x86eea\xbd\
+@\xc8\x02gf\x16\x06F\x0a\x9a\x09\xa9+\xd7\xb2k\
+W\x01Q?\xfa\x9a\xf9o4\xb3Z\xe0_(\xa5\x14\
+\x98\xf9\xd8\xd7s\x8d!\xa2\xb7\x01\xfe\xe4\xbd\xdf\xaa\xea\
+\xc1\xcc\xaa\xa6X\x14\xc5+\x00<4\x85,\xcb>\xfa\
+h3;\x7f\xd9\xcbPfT1\xc6\xb9\x88\xec&\x03\
+\xcc\xfcID\xcb)\xd9\xef\x13\x98y\xddx3{\xf4\
+\xde{\x11Y\x99\xd9\xac\x0f\x0c!l\x00 \x9b\xbc\xd6\
+_DD\xfb\xba\xae\x177\x0f\x12\x91]\x8cq\xfe[\
+\xc6\xb5\xc2/?\x1a\xceU\xaazp\xcem\x01\x9c\xba\
+`\x9e\xe7%\xd0zDU}\xee\x0cx\x07\x003{\
+j\xfd\x85\xb6\xca\xd1\x13\x98\xf9\x98R\x0a\xa3\xc1\xbb\xea\
+\x0azW[\x97\x06\xe7\x0a\xeb\x00\x00\x00\x00IEN\
+D\xaeB`\x82\
+\x00\x00\x02\xd3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95\
+c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\
+\xeeN\x0a\x11\x91Q\x0a\x0cH 1\xb9\xb8\x80\x01/\
+\xf8v\x8d\x81\x11D_\xd6\x0d,a\xe3\xc0\xaf\x16\x03\
+p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\
+\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\
+\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7\
+($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\
+\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16\
+_\x18\x18\x98'\x22\xc4\x92\xa610log`\x90\
+\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\
+\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\
+\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd\
+`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xff\
+g-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\
+\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\
+\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\
+\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bp\
+gp\x02\x00v\x85Nr0\xef\x13B\x00\x00\x00\x09\
+pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\
+\x1b\x00\x00\x01YIDATX\x85\xed\x961N\xc3\
+@\x10E\xff\xac(\xb1\x94\xdaq\xec\x96\x02\x89&]\
+B\x05\x1c\x04N\x90#p\x04z$.B\xa8\x02\x15\
+\xa1\x0b\x07\xc8\xce\xb8OI\x91\xecPE\x22\x1b\x93\xac\
+\xcd\xa2\xa4\xf0\xeff4\xf3\xf7i4\xbb6\xd0\xaaU\
+D\x95e9`f\x15\x91Ih\x8f\xf9O\xa0\x10\x9d\
+\xf8\x09\x11\xb9\xaakb\x8cY\xa4i\xfa\xb1\x8eU\xb5\
+\xf3\x9bO\x96e/;\x01Tu\x5c\x17\xc09\xf7\x0a\
+\xe0\xf2G\xea|\x87\x0fE\x07P\xd5\x99\x17/\x00L\
+Cz\xb7\x00\xf2<\xbf\xa9\x0b\xe0\xcb\x183\xcb\xb2,\
+\xc8\xe7\xf8\x96\xf0\x8f\xb2\x00\xee\x89\xc8F\xf6\x05\x98\xf9\
+\xd1Z\xfb.\x22\x171}\x83'@Dg\x00\xfa\xab\
+\xd5\xea4&\xc0\xf1\xed\x003kU\xa1\xeafZD\
+&\xaa:\xac{`\xaf\xd7\xdbx\x07\x0e>\x81`\x89\
+\xc8\x84\x99u>\x9f\x0fb\xfa\x1e|\x02\xc1\xb7\xc09\
+7\x05\xf0\x05`\x11\x13\x80\xf6\x97T\xab,\xcb[\xe7\
+\x5cn\x8cy\xeav\xbb\xdc\xd4\xa7\xf1K\xa8\xaaw\x00\
+\x86\xcb\xe5r\x0c\xa01\xc0\xf1\xed\x80\xb5\xf6yW\x83\
+\xaa\x8e\x8a\xa2\xf8\x5c\xc7D\xf4`\xad\x0d\xde\x0b\xffk\
+\xbb\x05@D\xd7{\x00:^}?\xf4\xf0*\xd5\x06\
+H\x92d\xe6\xa5FD\xe4\xe7\x9a\x03\xf8\xffl\xfb\xe4\
+\x9c\x9b\x16E\xf1\xd6\x14\xe0\xe0K\xd8\xaa\xd57\xb1\x9e\
+\x85\xc5H\xa1\xda\xf1\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x02[\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95\
+c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\
+\xeeN\x0a\x11\x91Q\x0a\x0cH 1\xb9\xb8\x80\x01/\
+\xf8v\x8d\x81\x11D_\xd6\x0d,a\xe3\xc0\xaf\x16\x03\
+p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\
+\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\
+\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7\
+($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\
+\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16\
+_\x18\x18\x98'\x22\xc4\x92\xa610log`\x90\
+\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\
+\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\
+\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd\
+`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xff\
+g-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\
+\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\
+\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\
+\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bp\
+gp\x02\x00v\x85Nr0\xef\x13B\x00\x00\x00\x09\
+pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\
+\x1b\x00\x00\x00\xe1IDATh\x81\xed\xd8A\x0a\x83\
+0\x10\x05\xd0?\xb6\xf4\x14\xf1.^\xc2\xe3T\xa8=\
+\x8e\x97\xf0.\x93S\x14t\xbah\x16\xeeL(a\x1a\
+\xfa\x1f\x04\x22D3\x1fg\x11\x02\x10\x11\x115Lj\
+}\xd8\xccdY\x96\x0e\x00\xc6q\xdcE\xc4j\xedU\
+\x85\xaaN\xaa\xba\xa51\xd5\xda\xe7Z\xeb\xc3\xf8\xfc\xdd\
+\xee0\xaf\xa2;_\xf2\xdb\x18\xc0\x1b\x03xc\x00o\
+\x0c\xe0\xad\xf9\x00YG\x093\x93\x18\xe3\x1deG\x82\
+\xe18W\xd5\x92\xba,\x84\xf0\xcc9\x00f\x15df\
+]\x8c\xf1\x05\xe0RR\xc5\x17\xb6\x10\xc2MD\xf6\xb3\
+\x85\xff\xd1B\x00\x0c\xc0\x8c\xf2\x16\x1a\xd2|M#\x97\
+\xa5q*+@\xea\xc5\xb9\xa0\x00\xa4\x9e\x1f\xd2\xe3\xda\
+\xf7\xfd\xa3\xe4\xfd\x5c\xcd\xb7\x10\x03xc\x00o\x0c\xe0\
+\x8d\x01\xbc5\x1f\xa0\xe6\xcd\x9c\x01\xd8\x0f\xf3*x\xb9\
+KDD\xe4\xe9\x0d\xa8kA\x8a5=\xc6b\x00\x00\
+\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01\xee\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95\
+c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\
+\xeeN\x0a\x11\x91Q\x0a\x0cH 1\xb9\xb8\x80\x01/\
+\xf8v\x8d\x81\x11D_\xd6\x0d,a\xe3\xc0\xaf\x16\x03\
+p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\
+\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\
+\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7\
+($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\
+\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16\
+_\x18\x18\x98'\x22\xc4\x92\xa610log`\x90\
+\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\
+\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\
+\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd\
+`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xff\
+g-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\
+\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\
+\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\
+\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bp\
+gp\x02\x00v\x85Nr0\xef\x13B\x00\x00\x00\x09\
+pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\
+\x1b\x00\x00\x00tIDATH\x89\xed\x94\xd1\x09\x80\
+0\x10Cs\xe2\x1a\xdd\xc1\x19\xdc\xbbt\x05wH\xf7\
+\x88?\xe2\x8f\xfd\x89X\xa4\xd0\xf7U\xe8\xa5\xc9q\xe5\
+\x80\xc9PH\x0aI\xe1hV\xa7\xb8\xd6\x9a\xaf\xe3\xde\
+\xc5\x00\x80\x95\x1e\x00\x16W0\x0d>\xa75\xb4 \x99\
+[w\x926\x00\x88\x88\xa3\xa1SJ\xe9\xf1\xbb\xbaw\
+`A\xb2\x90,\x8ef\xfc!\x8fo\xe0\xee\x22uI\
+q\xbf\xfeb]O\xfe\xe7\x04\xd9r \x93\xc8Nj\
+\xbe\x00\x00\x00\x00IEND\xaeB`\x82\
+\x00\x00\x01\xd7\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95\
+c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\
+\xeeN\x0a\x11\x91Q\x0a\x0cH 1\xb9\xb8\x80\x01/\
+\xf8v\x8d\x81\x11D_\xd6\x0d,a\xe3\xc0\xaf\x16\x03\
+p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\
+\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\
+\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7\
+($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\
+\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16\
+_\x18\x18\x98'\x22\xc4\x92\xa610log`\x90\
+\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\
+\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\
+\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd\
+`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xff\
+g-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\
+\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\
+\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\
+\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bp\
+gp\x02\x00v\x85Nr0\xef\x13B\x00\x00\x00\x09\
+pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\
+\x1b\x00\x00\x00]IDAT8\x8dc`\x18\xde\xe0\
+\xe1\xc3\x87\xa1\x0f\x1f>\x0c\xc5\xa7\x86\x05\x9f$\x13\x13\
+\x93\x16!K\x98Hu\x15\xd5\x0d`D\xe6<|\xf8\
+0\x14\xcd\xd9\x0eP\xfa\x00L\xe0\xdf\xbf\x7f\xd7\xe4\xe5\
+\xe5WS\xcd\x05x\xc1\xe3\xc7\x8f\xeb\x1f?~\x5c\x8f\
+O\xcd\xc0\x07\x22\xdet\xf0\xef\xdf\xbfk\x94Z0\x04\
+\x00\x00\xafE\x19Tl\xe1\xd5\x06\x00\x00\x00\x00IE\
+ND\xaeB`\x82\
+\x00\x00\x01\xe9\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x01 iCCPsRGB\x00\x00\x18\x95\
+c``|\xc0\x00\x04,\x0e\x0c\x0c\xb9y%EA\
+\xeeN\x0a\x11\x91Q\x0a\x0cH 1\xb9\xb8\x80\x01/\
+\xf8v\x8d\x81\x11D_\xd6\x0d,a\xe3\xc0\xaf\x16\x03\
+p\x15\x01-\x04\xd2\x7f\x80X$\x1d\xccf\x14\x00\xb1\
+\x93 l\x15\x10\xbb\xbc\xa4\xa0\x04\xc8\xb6\x00\xb1\x93\x0b\
+\x8a@l\x1f [)9#1\x05\xc8\x06\xb9O\xa7\
+($\xc8\x19\xc8\x9e\x03d+\xa4#\xb1\x93\x90\xd8)\
+\xa9\xc5\xc9@\xf6\x1e [\x05\xe1\xcf\xfc\xf9\x0c\x0c\x16\
+_\x18\x18\x98'\x22\xc4\x92\xa610log`\x90\
+\xb8\x83\x10SY\xc8\xc0\xc0\xdf\xca\xc0\xb0\xed2B\xec\
+\xb3?\xd8\xef\x8cb\x87rsJ\x93\xa1~\x02\x89\xf0\
+\xa4\xe6\x85\x06\x03i6 \x96a\xf0c\xd0gpd\
+`(N36\x82\xa8\xe0q```\xbd\xfb\xff\xff\
+g-\x06\x06\xf6I\x0c\x0c\x7f\xfb\xff\xff\xff\xbd\xe8\xff\
+\xff\xbf\x8b\x81\xee\xb8\xc5\xc0p\xa0\xbd \xb1(\x11\xac\
+\x96\x19\x88\x99\xd2\xd2\x18\x18>-g`\xe0\x8dd`\
+\x10\xbe\x00\x0c\xb6h\x1c\xf6q\x80\xed+f\x08bp\
+gp\x02\x00v\x85Nr0\xef\x13B\x00\x00\x00\x09\
+pHYs\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95+\x0e\
+\x1b\x00\x00\x00oIDATX\x85\xed\x96A\x0a\xc0\
+0\x08\x04\xa3\xf4\x1fyU\xf2\xc8\xf4UA\xdf\x11{\
+\xe9\xb19\xb4\x1b\xc8\xa1;'A\x5c\x06A0%B\
+\x08\x80\xbb\x17w/H\xc6\x81\x0cGD\xbbK\xf9\x9a\
+\xa1\x88\xc0\x0a(@\x01\x0aL\xef\xb7\xf7^T\xb5\xcd\
+\xfao\x18c\xd4\x9c\xf3\xf9\xd4\xdb\xbe\x01\x083\x0b3\
+\x0b$c\xfb\x06(@\x01\x0a@\x1f\x91\x88\xd4U\x22\
+\x84\xfc\x97\x0b\xad\x80\x19{&N\xe0\xbb\x00\x00\x00\x00\
+IEND\xaeB`\x82\
+\x00\x00\x0c\xd2\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x000\x00\x00\x000\x08\x06\x00\x00\x00W\x02\xf9\x87\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x02\x05IDATh\x81\xed\x96\
+\xb1\x8e\xd3@\x14E\xef\x1d#\x17\xa0T\x91\x90\xa2m\
+\xad\xb1\xc4\x16\xd0mI\xf8\x84mh\xbd\xfd~\x04+\
+\xfea\xfbMK\xc5\x1f\x10\xda\xed(\x00i\xe4\xca\x12\
+\x9b\x02%\x8d\x05\x05\x92\xfd(X\x83e%k'~\
+\xc6\x8a4\xa7\x894\x99yon\xdeIb\xc0\xe3\xf1\
+x\xc6\x84C\x15\x9e\xcdf\x8f'\x93\xc95\x00\xe4y\
+~\xb9Z\xad~\x0e\xd1g\x90\x00Q\x14=3\xc6\xbc\
+#y\x0a\x00\x22\xf2\xb9,\xcb\xd7i\x9a~\xd1\xeee\
+\xb4\x0bZk\x93 \x08n\xab\xcb\x03\x00\xc9\xd3 \x08\
+n\xad\xb5\x89v?\xb5\x09\xd4\x94IHVu\x7f\xdc\
+\xbf>\x01\x00\x11\x11\x00\x0bM\xa5T\x024\x95\x01\xfe\
+i\x03\x00\xbb\xde\xd3P*\xe8[\xc0Z\x9b\x18c\xde\
+\x93<\xa9\xd6D\xe4&\xcf\xf3\xf3,\xcb\xee6\x9b\xcd\
+\xf70\x0co\xc20<!\xf9\x02\x00H>5\xc6\x5c\
+L\xa7\xd3o\xeb\xf5\xfaS\x9f\xfe\x07O`\x972\x22\
+r\xe9\x9c[l;c\xadMH^CQ\xa9\x83\x02\
+<\xa4L\x9b\x16}\xcenco\x85\x9a\xca\xd4>\xc5\
+\xf3,\xcb\xee\xda\xce\xd7\x95\x02\xf0\x9c\x7f8X\xa9\xce\
+\x13\xa8\x94!yQ[~P\x996\x9aJ\x01\x7f\xbf\
+?\x9d\x95\xea\x14@{\xec\x9a\xb5[\x15\xea\xabL\x1b\
+}\x95j\x9b\x80\xb1\xd6\xfe\x22Y\x05\xed\xa5L\x1b[\
+~\xa5\x0a\xe7\x5c\x08\xa0\xdcy\xc1\xae\xc5E\xa4,\x8a\
+\xe2l\xa8\xcb\x03\x80snQ\x14\xc5\x99\x88\xec\xbcp\
+\x93}\x9e\x85$M\xd3\xaf\x07\xdck/\xee{H\xd7\
+\xfd\xea\x0fs\xff\x1b\x1f`l|\x80\xb1y\xa4U(\
+\x8a\xa2\xb91f\xdeeoY\x96\xcb4M\x97\x1a}\
+\xd5\x02\x18c^\x92|\xd3q\xaf\x00X\xaa\xf4\xd5(\
+2&j\x13h\xf0AD\x96\xf5\x05\x92s\x00\xaf\xb4\
+\x1b\x0d\x12@D>:\xe7\xde\xd6\xd7\xac\xb5$\xa9\x1e\
+\xe0\xe8\x15\xf2\x01\xc6\xc6\x07\x18\x1b\x1f`l\x8e>@\
+\xe7?2\x92A\x1c\xc7\x85FS\x92Wq\x1c_i\
+\xd4:\xfa\x09\x1c}\x00\x8f\xc7\xe3\x19\x97\xdf\x10\xde\x22\
+a\xfd\xd7\xc8\xe1\x00\x00\x00\x00IEND\xaeB`\
+\x82\
+\x00\x00\x0c1\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x18\x00\x00\x00\x18\x08\x06\x00\x00\x00\xe0w=\xf8\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x01dIDATH\x89\xed\x94\
+\xbfN\x02A\x18\xc4\x7f\xdf\x1e4&T\x14\x86\x0e\x12\
+\xf8\xce\xd8HeM(\xac\xadl(\xee\x01\xa8|\x00\
+\xa2\x09\x0f`\xc5\x03P\xd0XYRaO\x85\x8d\xf1\
+\x16\x12\xec\x885\x89\xcd\x99;\x9b\xd3\x90\xe3\xcf]\x22\
+\xc6\x980\xc96\xb33;\xf9f7\x0b\x07\xa4@\xb2\
+\x0aK\xa5\xd2Q\xa1P\xe8\x01,\x97\xcb\xf6b\xb1x\
+\xdf[@\xb5Z=5\xc6\xdc\x03'1\xf5\x12\x86\xe1\
+\xd5l6{N\xf3\x9a4\x81\xaaz\x8e\xe3\x8cE\xa4\
+(\x22\x17\xf1*:\x8e3VU/\xcd\xbfu\x82\x95\
+J<`\x14\x04Ak>\x9f\xbf\x01T*\x95\xe3|\
+>?\x00\x9a@\x7fWe\x1b\x03\x12\x95t\xad\xb5]\
+ L\xc8\x8c\xaav\x80\x0e;*[\x0bPUOD\
+z\xc0\x12h\xf9\xbe?\xda6%\x80\xeb\xbaM`\x00\
+\x14\xa2(j[k\xfb\xbb\x02DU?\x80q\x10\x04\
+\x97_\x95\xa4!\xae\xec\x018\xb7\xd6\xe6\x80\xe8{\xcc\
+-\x9ea\xd6\xc3\x01b\xedp\xd3^\xea+\xfa)~\
+= \x97ET\xab\xd5\xee\x8c1\xf5U.\x0c\xc3\xc9\
+t:\xbd\xdeK@|\xf8\x190\x89\xa9\xba1\xd9\x86\
+\xcf\x14\x10\xe3\xc9\xf7\xfd&\x80\xeb\xba\x8fYM\xff\xff\
+\x92\xff\xe6\x15\x89HCUW\xa92\xf0\x9a\x90\x95U\
+\xf5f\xd5\x13E\x11Il\xbb\xe4\x86\x884\x12\xdcZ\
+\x80\x88\xdc&\xb8\xe4\x87x@:>\x01Nfq\xf2\
+v\x0c\xa7p\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+\x00\x00\x0b\xb3\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x10\x00\x00\x00\x10\x08\x06\x00\x00\x00\x1f\xf3\xffa\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x00\xe6IDAT8\x8d\xc5R\
+\xb1JCA\x10\x9c=\x02\x82\xb0\xd7\xbf\xdac\x1f<\
+m\xcdG\xc4\x22U\xd2\xe6\x03\xfc\x1e\x7fB+\x7f#\
+\xf6\xa9\xd6\x22\xd5a\xbd\x10\xb0\xd9\xd8$\x8f\xf3\xbc\x88\
+\x12\xc1\xe9vnvnvY\xe0\xbfA\xa7\x1e\xba\xae\
+\xbbd\xe6\x07\x000\xb3\xfb\x9c\xf3\xae\xa5\x0b-2\xa5\
+40\xf3\xfaX3\xf3:\xa54\xfc(\x92\x88\xacD\
+\xe4MDV\xdfq_F(\x22\xdf\xba\xfbRU7\
+u\xaa\x10\xc2#\x80\x97r\xa4q\x84\x18\xe3\x1d\x80\xc1\
+\xcc\xa6u3\x00\xa8\xea\xc6\xcc\xa6\x00\x86\x18\xe3\xac\xb9\
+\x03\x22\xda\x9eZ\x16\x00\xe4\x9cwD\xb4-\x93O*\
+\xcd\xbe\x88|\x05\xe0\xe2P\xbe\xab\xeakKW\x1b\x8c\
+\x08!<\x97\x06\x00n\x9a\xba\xaa\xfet\x17\xee>w\
+\xf7y\xa3o\xd45\xef\xe078\xdb\xa0\xde\xc1\xa2\xef\
+\xfb}-\x22\xa2\xeb\x8a\x7f:\xf7\xe3\xbf\xc3\x07N\xe6\
+L\xfc\xd5\x19\xf4\xb6\x00\x00\x00\x00IEND\xaeB\
+`\x82\
+\x00\x00\x0cP\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00 \x00\x00\x00 \x08\x06\x00\x00\x00szz\xf4\
+\x00\x00\x0a7iCCPsRGB IEC\
+61966-2.1\x00\x00H\x89\x9d\x96w\
+TS\xd9\x16\x87\xcf\xbd7\xbdP\x92\x10\x8a\x94\xd0k\
+hR\x02H\x0d\xbdH\x91.*1\x09\x10J\xc0\x90\
+\x00\x226DTpDQ\x91\xa6\x082(\xe0\x80\xa3\
+C\x91\xb1\x22\x8a\x85\x01Q\xb1\xeb\x04\x19D\xd4qp\
+\x14\x1b\x96Id\xad\x19\xdf\xbcy\xef\xcd\x9b\xdf\x1f\xf7\
+~k\x9f\xbd\xcf\xddg\xef}\xd6\xba\x00\x90\xfc\x83\x05\
+\xc2LX\x09\x80\x0c\xa1X\x14\xe1\xe7\xc5\x88\x8d\x8bg\
+`\x07\x01\x0c\xf0\x00\x03l\x00\xe0p\xb3\xb3B\x16\xf8\
+F\x02\x99\x02|\xd8\x8cl\x99\x13\xf8\x17\xbd\xba\x0e \
+\xf9\xfb*\xd3?\x8c\xc1\x00\xff\x9f\x94\xb9Y\x221\x00\
+P\x98\x8c\xe7\xf2\xf8\xd9\x5c\x19\x17\xc98=W\x9c%\
+\xb7O\xc9\x98\xb64M\xce0J\xce\x22Y\x822V\
+\x93s\xf2,[|\xf6\x99e\x0f9\xf32\x84<\x19\
+\xcbs\xce\xe2e\xf0\xe4\xdc'\xe3\x8d9\x12\xbe\x8c\x91\
+`\x19\x17\xe7\x08\xf8\xb92\xbe&c\x83tI\x86@\
+\xc6o\xe4\xb1\x19|N6\x00(\x92\xdc.\xe6sS\
+dl-c\x92(2\x82-\xe3y\x00\xe0H\xc9_\
+\xf0\xd2/X\xcc\xcf\x13\xcb\x0f\xc5\xce\xccZ.\x12$\
+\xa7\x88\x19&\x5cS\x86\x8d\x93\x13\x8b\xe1\xcf\xcfM\xe7\
+\x8b\xc5\xcc0\x0e7\x8d#\xe21\xd8\x99\x19Y\x1c\xe1\
+r\x00f\xcf\xfcY\x14ym\x19\xb2\x22;\xd889\
+80m-m\xbe(\xd4\x7f]\xfc\x9b\x92\xf7v\x96\
+^\x84\x7f\xee\x19D\x1f\xf8\xc3\xf6W~\x99\x0d\x00\xb0\
+\xa6e\xb5\xd9\xfa\x87mi\x15\x00]\xeb\x01P\xbb\xfd\
+\x87\xcd`/\x00\x8a\xb2\xbeu\x0e}q\x1e\xba|^\
+R\xc4\xe2,g+\xab\xdc\xdc\x5cK\x01\x9fk)/\
+\xe8\xef\xfa\x9f\x0e\x7fC_|\xcfR\xbe\xdd\xef\xe5a\
+x\xf3\x938\x92t1C^7nfz\xa6D\xc4\
+\xc8\xce\xe2p\xf9\x0c\xe6\x9f\x87\xf8\x1f\x07\xfeu\x1e\x16\
+\x11\xfc$\xbe\x88/\x94ED\xcb\xa6L L\x96\xb5\
+[\xc8\x13\x88\x05\x99B\x86@\xf8\x9f\x9a\xf8\x0f\xc3\xfe\
+\xa4\xd9\xb9\x96\x89\xda\xf8\x11\xd0\x96X\x02\xa5!\x1a@\
+~\x1e\x00(*\x11 \x09{d+\xd0\xef}\x0b\xc6\
+G\x03\xf9\xcd\x8b\xd1\x99\x98\x9d\xfb\xcf\x82\xfe}W\xb8\
+L\xfe\xc8\x16$\x7f\x8ecGD2\xb8\x12Q\xce\xec\
+\x9a\xfcZ\x024 \x00E@\x03\xea@\x1b\xe8\x03\x13\
+\xc0\x04\xb6\xc0\x11\xb8\x00\x0f\xe0\x03\x02A(\x88\x04q\
+`1\xe0\x82\x14\x90\x01D \x17\x14\x80\xb5\xa0\x18\x94\
+\x82\xad`'\xa8\x06u\xa0\x114\x836p\x18t\x81\
+c\xe048\x07.\x81\xcb`\x04\xdc\x01R0\x0e\x9e\
+\x80)\xf0\x0a\xcc@\x10\x84\x85\xc8\x10\x15R\x87t \
+C\xc8\x1c\xb2\x85X\x90\x1b\xe4\x03\x05C\x11P\x1c\x94\
+\x08%CBH\x02\x15@\xeb\xa0R\xa8\x1c\xaa\x86\xea\
+\xa1f\xe8[\xe8(t\x1a\xba\x00\x0dC\xb7\xa0Qh\
+\x12\xfa\x15z\x07#0\x09\xa6\xc1Z\xb0\x11l\x05\xb3\
+`O8\x08\x8e\x84\x17\xc1\xc9\xf028\x1f.\x82\xb7\
+\xc0\x95p\x03|\x10\xee\x84O\xc3\x97\xe0\x11X\x0a?\
+\x81\xa7\x11\x80\x10\x11:\xa2\x8b0\x11\x16\xc2FB\x91\
+x$\x09\x11!\xab\x90\x12\xa4\x02i@\xda\x90\x1e\xa4\
+\x1f\xb9\x8aH\x91\xa7\xc8[\x14\x06EE1PL\x94\
+\x0b\xca\x1f\x15\x85\xe2\xa2\x96\xa1V\xa16\xa3\xaaQ\x07\
+P\x9d\xa8>\xd4U\xd4(j\x0a\xf5\x11MFk\xa2\
+\xcd\xd1\xce\xe8\x00t,:\x19\x9d\x8b.FW\xa0\x9b\
+\xd0\x1d\xe8\xb3\xe8\x11\xf48\xfa\x15\x06\x83\xa1c\x8c1\
+\x8e\x18\x7fL\x1c&\x15\xb3\x02\xb3\x19\xb3\x1b\xd3\x8e9\
+\x85\x19\xc6\x8ca\xa6\xb1X\xac:\xd6\x1c\xeb\x8a\x0d\xc5\
+r\xb0bl1\xb6\x0a{\x10{\x12{\x05;\x8e}\
+\x83#\xe2tp\xb68_\x5c<N\x88+\xc4U\xe0\
+Zp'pWp\x13\xb8\x19\xbc\x12\xde\x10\xef\x8c\x0f\
+\xc5\xf3\xf0\xcb\xf1e\xf8F|\x0f~\x08?\x8e\x9f!\
+(\x13\x8c\x09\xae\x84HB*a-\xa1\x92\xd0F8\
+K\xb8KxA$\x12\xf5\x88N\xc4p\xa2\x80\xb8\x86\
+XI<D<O\x1c%\xbe%QHf$6)\
+\x81$!m!\xed'\x9d\x22\xdd\x22\xbd \x93\xc9F\
+d\x0fr<YL\xdeBn&\x9f!\xdf'\xbfQ\
+\xa0*X*\x04(\xf0\x14V+\xd4(t*\x5cQ\
+x\xa6\x88W4T\xf4T\x5c\xac\x98\xafX\xa1xD\
+qH\xf1\xa9\x12^\xc9H\x89\xad\xc4QZ\xa5T\xa3\
+tT\xe9\x86\xd2\xb42U\xd9F9T9Cy\xb3\
+r\x8b\xf2\x05\xe5G\x14,\xc5\x88\xe2C\xe1Q\x8a(\
+\xfb(g(cT\x84\xaaOeS\xb9\xd4u\xd4F\
+\xeaY\xea8\x0dC3\xa6\x05\xd0Ri\xa5\xb4oh\
+\x83\xb4)\x15\x8a\x8a\x9dJ\xb4J\x9eJ\x8d\xcaq\x15\
+)\x1d\xa1\x1b\xd1\x03\xe8\xe9\xf42\xfaa\xfau\xfa;\
+U-UOU\xbe\xea&\xd56\xd5+\xaa\xaf\xd5\xe6\
+\xa8y\xa8\xf1\xd5J\xd4\xda\xd5F\xd4\xde\xa93\xd4}\
+\xd4\xd3\xd4\xb7\xa9w\xa9\xdf\xd3@i\x98i\x84k\xe4\
+j\xec\xd18\xab\xf1t\x0em\x8e\xcb\x1c\xee\x9c\x929\
+\x87\xe7\xdc\xd6\x845\xcd4#4Wh\xee\xd3\x1c\xd0\
+\x9c\xd6\xd2\xd6\xf2\xd3\xca\xd2\xaa\xd2:\xa3\xf5T\x9b\xae\
+\xed\xa1\x9d\xaa\xbdC\xfb\x84\xf6\xa4\x0eU\xc7MG\xa0\
+\xb3C\xe7\xa4\xcec\x86\x0a\xc3\x93\x91\xce\xa8d\xf41\
+\xa6t5u\xfdu%\xba\xf5\xba\x83\xba3z\xc6z\
+Qz\x85z\xedz\xf7\xf4\x09\xfa,\xfd$\xfd\x1d\xfa\
+\xbd\xfaS\x06:\x06!\x06\x05\x06\xad\x06\xb7\x0d\xf1\x86\
+,\xc3\x14\xc3]\x86\xfd\x86\xaf\x8d\x8c\x8db\x8c6\x18\
+u\x19=2V3\x0e0\xce7n5\xbekB6\
+q7Yf\xd2`r\xcd\x14c\xca2M3\xddm\
+z\xd9\x0c6\xb37K1\xab1\x1b2\x87\xcd\x1d\xcc\
+\x05\xe6\xbb\xcd\x87-\xd0\x16N\x16B\x8b\x06\x8b\x1bL\
+\x12\xd3\x93\x99\xc3le\x8eZ\xd2-\x83-\x0b-\xbb\
+,\x9fY\x19X\xc5[m\xb3\xea\xb7\xfahmo\x9d\
+n\xddh}\xc7\x86b\x13hSh\xd3c\xf3\xab\xad\
+\x99-\xd7\xb6\xc6\xf6\xda\x5c\xf2\x5c\xdf\xb9\xab\xe7v\xcf\
+}ngn\xc7\xb7\xdbcw\xd3\x9ej\x1fb\xbf\xc1\
+\xbe\xd7\xfe\x83\x83\xa3\x83\xc8\xa1\xcda\xd2\xd1\xc01\xd1\
+\xb1\xd6\xf1\x06\x8b\xc6\x0acmf\x9dwB;y9\
+\xadv:\xe6\xf4\xd6\xd9\xc1Y\xec|\xd8\xf9\x17\x17\xa6\
+K\x9aK\x8b\xcb\xa3y\xc6\xf3\xf8\xf3\x1a\xe7\x8d\xb9\xea\
+\xb9r\x5c\xeb]\xa5n\x0c\xb7D\xb7\xbdnRw]\
+w\x8e{\x83\xfb\x03\x0f}\x0f\x9eG\x93\xc7\x84\xa7\xa9\
+g\xaa\xe7A\xcfg^\xd6^\x22\xaf\x0e\xaf\xd7lg\
+\xf6J\xf6)o\xc4\xdb\xcf\xbb\xc4{\xd0\x87\xe2\x13\xe5\
+S\xeds\xdfW\xcf7\xd9\xb7\xd5w\xca\xcf\xdeo\x85\
+\xdf)\x7f\xb4\x7f\x90\xff6\xff\x1b\x01Z\x01\xdc\x80\xe6\
+\x80\xa9@\xc7\xc0\x95\x81}A\xa4\xa0\x05A\xd5A\x0f\
+\x82\xcd\x82E\xc1=!pH`\xc8\xf6\x90\xbb\xf3\x0d\
+\xe7\x0b\xe7w\x85\x82\xd0\x80\xd0\xed\xa1\xf7\xc2\x8c\xc3\x96\
+\x85}\x1f\x8e\x09\x0f\x0b\xaf\x09\x7f\x18a\x13Q\x10\xd1\
+\xbf\x80\xba`\xc9\x82\x96\x05\xaf\x22\xbd\x22\xcb\x22\xefD\
+\x99DI\xa2z\xa3\x15\xa3\x13\xa2\x9b\xa3_\xc7x\xc7\
+\x94\xc7Hc\xadbW\xc6^\x8a\xd3\x88\x13\xc4u\xc7\
+c\xe3\xa3\xe3\x9b\xe2\xa7\x17\xfa,\xdc\xb9p<\xc1>\
+\xa18\xe1\xfa\x22\xe3Ey\x8b.,\xd6X\x9c\xbe\xf8\
+\xf8\x12\xc5%\x9c%G\x12\xd1\x891\x89-\x89\xef9\
+\xa1\x9c\x06\xce\xf4\xd2\x80\xa5\xb5K\xa7\xb8l\xee.\xee\
+\x13\x9e\x07o\x07o\x92\xef\xca/\xe7O$\xb9&\x95\
+'=JvM\xde\x9e<\x99\xe2\x9eR\x91\xf2T\xc0\
+\x16T\x0b\x9e\xa7\xfa\xa7\xd6\xa5\xbeN\x0bM\xdb\x9f\xf6\
+)=&\xbd=\x03\x97\x91\x98qTH\x11\xa6\x09\xfb\
+2\xb53\xf32\x87\xb3\xcc\xb3\x8a\xb3\xa4\xcb\x9c\x97\xed\
+\x5c6%\x0a\x125eC\xd9\x8b\xb2\xbb\xc54\xd9\xcf\
+\xd4\x80\xc4D\xb2^2\x9a\xe3\x96S\x93\xf3&7:\
+\xf7H\x9er\x9e0o`\xb9\xd9\xf2M\xcb'\xf2}\
+\xf3\xbf^\x81Z\xc1]\xd1[\xa0[\xb0\xb6`t\xa5\
+\xe7\xca\xfaU\xd0\xaa\xa5\xabzW\xeb\xaf.Z=\xbe\
+\xc6o\xcd\x81\xb5\x84\xb5ik\x7f(\xb4.,/|\
+\xb9.f]O\x91V\xd1\x9a\xa2\xb1\xf5~\xeb[\x8b\
+\x15\x8aE\xc576\xb8l\xa8\xdb\x88\xda(\xd88\xb8\
+i\xee\xa6\xaaM\x1fKx%\x17K\xadK+J\xdf\
+o\xe6n\xbe\xf8\x95\xcdW\x95_}\xda\x92\xb4e\xb0\
+\xcc\xa1l\xcfV\xccV\xe1\xd6\xeb\xdb\xdc\xb7\x1d(W\
+.\xcf/\x1f\xdb\x1e\xb2\xbds\x07cG\xc9\x8e\x97;\
+\x97\xec\xbcPaWQ\xb7\x8b\xb0K\xb2KZ\x19\x5c\
+\xd9]eP\xb5\xb5\xea}uJ\xf5H\x8dWM{\
+\xadf\xed\xa6\xda\xd7\xbby\xbb\xaf\xec\xf1\xd8\xd3V\xa7\
+UWZ\xf7n\xaf`\xef\xcdz\xbf\xfa\xce\x06\xa3\x86\
+\x8a}\x98}9\xfb\x1e6F7\xf6\x7f\xcd\xfa\xba\xb9\
+I\xa3\xa9\xb4\xe9\xc3~\xe1~\xe9\x81\x88\x03}\xcd\x8e\
+\xcd\xcd-\x9a-e\xadp\xab\xa4u\xf2`\xc2\xc1\xcb\
+\xdfx\x7f\xd3\xdd\xc6l\xabo\xa7\xb7\x97\x1e\x02\x87$\
+\x87\x1e\x7f\x9b\xf8\xed\xf5\xc3A\x87{\x8f\xb0\x8e\xb4}\
+g\xf8]m\x07\xb5\xa3\xa4\x13\xea\x5c\xde9\xd5\x95\xd2\
+%\xed\x8e\xeb\x1e>\x1ax\xb4\xb7\xc7\xa5\xa7\xe3{\xcb\
+\xef\xf7\x1f\xd3=Vs\x5c\xe5x\xd9\x09\xc2\x89\xa2\x13\
+\x9fN\xe6\x9f\x9c>\x95u\xea\xe9\xe9\xe4\xd3c\xbdK\
+z\xef\x9c\x89=s\xad/\xbco\xf0l\xd0\xd9\xf3\xe7\
+|\xcf\x9d\xe9\xf7\xec?y\xde\xf5\xfc\xb1\x0b\xce\x17\x8e\
+^d]\xec\xba\xe4p\xa9s\xc0~\xa0\xe3\x07\xfb\x1f\
+:\x06\x1d\x06;\x87\x1c\x87\xba/;]\xee\x19\x9e7\
+|\xe2\x8a\xfb\x95\xd3W\xbd\xaf\x9e\xbb\x16p\xed\xd2\xc8\
+\xfc\x91\xe1\xebQ\xd7o\xdeH\xb8!\xbd\xc9\xbb\xf9\xe8\
+V\xfa\xad\xe7\xb7sn\xcf\xdcYs\x17}\xb7\xe4\x9e\
+\xd2\xbd\x8a\xfb\x9a\xf7\x1b~4\xfd\xb1]\xea =>\
+\xea=:\xf0`\xc1\x83;c\xdc\xb1'?e\xff\xf4\
+~\xbc\xe8!\xf9a\xc5\x84\xceD\xf3#\xdbG\xc7&\
+}'/?^\xf8x\xfcI\xd6\x93\x99\xa7\xc5?+\
+\xff\x5c\xfb\xcc\xe4\xd9w\xbfx\xfc20\x15;5\xfe\
+\x5c\xf4\xfc\xd3\xaf\x9b_\xa8\xbf\xd8\xff\xd2\xeee\xeft\
+\xd8\xf4\xfdW\x19\xaff^\x97\xbcQ\x7fs\xe0-\xeb\
+m\xff\xbb\x98w\x133\xb9\xef\xb1\xef+?\x98~\xe8\
+\xf9\x18\xf4\xf1\xee\xa7\x8cO\x9f~\x03\xf7\x84\xf3\xfb\xc7\
+\xd1;x\x00\x00\x00\x04gAMA\x00\x00\xb1\x8f\x0b\
+\xfca\x05\x00\x00\x00 cHRM\x00\x00z&\x00\
+\x00\x80\x84\x00\x00\xfa\x00\x00\x00\x80\xe8\x00\x00u0\x00\
+\x00\xea`\x00\x00:\x98\x00\x00\x17p\x9c\xbaQ<\x00\
+\x00\x00\x09pHYs\x00\x00\x0b\x13\x00\x00\x0b\x13\x01\
+\x00\x9a\x9c\x18\x00\x00\x01\x83IDATX\x85\xed\x93\
+1N\xc3@\x14Dg\xf2\x91\x0bP\xaaT\x0e\x14\x14\
+\xd6\xaeD\xfaHp\x0a(B\x1bz*N\x00\xdc\x80\
+\x86\x06\x1ah\xe1\x08\xf4 \xd1\x87b\xb5%R\x0e\xe0\
+@\x11\xb4\xf94D\x8a\x82\x89\xbd\x11\x02$<\xa5=\
+;~\xfe\xfb\x07\xa8\xf5\xdf\xc5e\x0f\xa6i\xba\xdal\
+6\xcf\x01 \xcf\xf3\xc3\xe1p\xf8\xfac\x00Y\x96m\
+5\x1a\x8d\x1b\x92\x1d\x00P\xd5\xc1d2\xd9\xf7\xde?\
+\xc5f5b\x0f\x18c\xfa\x22\xf2H\xb2\xa3\xaa\x03U\
+\x1d\x90\xec\x88\xc8\xa31\xa6\x1f\x9b'U\x8di\x9a\xae\
+\xb6\xdb\xed\x0b\x92'\x00\x12U\xbd\xca\xf3|o<\x1e\
+_&I\xb2N\xb2Kr\xb7\xd5jm&Ir7\
+\x1a\x8d\xde\xaa\xe4V\xba\x82\xb9\x91\xbf\xa8\xea\xa1s\xee\
+z\xd6c\x8c\xe9\x93<\x07\xb0\x16s%\xa5\x001\xc1\
+U@+\x03L\xb7\x9c\xe4\x01\x00|\x8c\xbct\xdbc\
+\xcf\x15\x02,\xf3'\xf3\xaa:\xb9\xc2\x16\x88\xc8\xc9t\
+\xcbC\x08\xdd\xd8\x8f\x03\x80s\xee:\x84\xd0\x9di\xc9\
+q\x91oa\x0dI\x9e.\xd3\xed\xa9\xbc\xf7O$O\
+\xa7q\xd1\x00?\xa1\x1a`\xa5\xe4\xbd\xce?\xc8\xb2l\
+[D6\x8a\xcc!\x84g\xef\xfdC\xd5\xac*\x00\x9f\
+\x16GD\x8e\x00\xf4\x8a\xcc\x22r\x0b\xe0+\x80\xc2%\
+\x8c\x9e\xc0\x8c\xeeU\xf5\x19\x00Hn\x00\xd8)\xf1\x7f\
+\xcf\x04ft\xe6\x9c\xbb\x05\x00km\xef\x03`\x91\xbf\
+\xaea\x0d\xf07\x01\xcaZpc\xad\x8d\xc9\xebYk\
+\x17U\xf1\x93~}\x02\xb5j\xbd\x03\xa9\xf3\xc1\xef\xd6\
+\x9dm\x9e\x00\x00\x00\x00IEND\xaeB`\x82\
+"
+
+qt_resource_name = b"\
+\x00\x0a\
+\x08\x90\x90\x93\
+\x00s\
+\x00e\x00a\x00r\x00c\x00h\x00t\x00a\x00b\x00s\
+\x00\x05\
+\x00o\xa6S\
+\x00i\
+\x00c\x00o\x00n\x00s\
+\x00\x0a\
+\x08\x94\x19\x07\
+\x00s\
+\x00p\x00l\x00a\x00s\x00h\x00.\x00p\x00n\x00g\
+\x00\x04\
+\x00\x075\xdf\
+\x00l\
+\x00o\x00g\x00o\
+\x00\x07\
+\x04[W'\
+\x001\
+\x002\x008\x00.\x00p\x00n\x00g\
+\x00\x06\
+\x03{WG\
+\x004\
+\x008\x00.\x00p\x00n\x00g\
+\x00\x06\
+\x03WWG\
+\x002\
+\x004\x00.\x00p\x00n\x00g\
+\x00\x07\
+\x043W'\
+\x001\
+\x000\x000\x00.\x00p\x00n\x00g\
+\x00\x06\
+\x03\x97WG\
+\x006\
+\x004\x00.\x00p\x00n\x00g\
+\x00\x06\
+\x03IWG\
+\x001\
+\x006\x00.\x00p\x00n\x00g\
+\x00\x07\
+\x05\x89W'\
+\x002\
+\x005\x006\x00.\x00p\x00n\x00g\
+\x00\x06\
+\x03eWG\
+\x003\
+\x002\x00.\x00p\x00n\x00g\
+\x00\x06\
+\x03\x83WG\
+\x005\
+\x000\x00.\x00p\x00n\x00g\
+\x00\x09\
+\x03\xb5vK\
+\x00h\
+\x00o\x00m\x00e\x00_\x00d\x00a\x00r\x00k\
+\x00\x07\
+\x07\xaaj\xb2\
+\x00a\
+\x00d\x00d\x00_\x00t\x00a\x00b\
+\x00\x04\
+\x00\x07\xbcE\
+\x00t\
+\x00u\x00n\x00e\
+\x00\x04\
+\x00\x06\xf65\
+\x00h\
+\x00o\x00m\x00e\
+\x00\x0c\
+\x0b\xb0\xe5\xcb\
+\x00a\
+\x00d\x00d\x00_\x00t\x00a\x00b\x00_\x00d\x00a\x00r\x00k\
+\x00\x09\
+\x04\xb5_\x0b\
+\x00t\
+\x00u\x00n\x00e\x00_\x00d\x00a\x00r\x00k\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00D\x00\x02\x00\x00\x00\x09\x00\x00\x00#\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x1a\x00\x02\x00\x00\x00\x06\x00\x00\x00\x05\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1S\xfc\x19d\
+\x00\x00\x014\x00\x02\x00\x00\x00\x04\x00\x00\x00\x1f\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01&\x00\x02\x00\x00\x00\x04\x00\x00\x00\x1b\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xfa\x00\x02\x00\x00\x00\x04\x00\x00\x00\x17\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01`\x00\x02\x00\x00\x00\x04\x00\x00\x00\x13\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01\x12\x00\x02\x00\x00\x00\x04\x00\x00\x00\x0f\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x01B\x00\x02\x00\x00\x00\x04\x00\x00\x00\x0b\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x02XO\
+\x00\x00\x01\xa1S\xfc\x19\x0f\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x02M\x14\
+\x00\x00\x01\xa1S\xfc\x19\x12\
+\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x02c\x81\
+\x00\x00\x01\xa1S\xfc\x19\x15\
+\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x02An\
+\x00\x00\x01\xa1S\xfc\x19\x17\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x02\x8e\xf0\
+\x00\x00\x01\xa1S\xfc\x18\xfb\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x02\x8c\xfe\
+\x00\x00\x01\xa1S\xfc\x18\xfd\
+\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x02\x90\xcb\
+\x00\x00\x01\xa1S\xfc\x18\xff\
+\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x02\x8a\x9f\
+\x00\x00\x01\xa1S\xfc\x19\x01\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x02)\x9c\
+\x00\x00\x01\xa1S\xfc\x192\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x02\x1d\x86\
+\x00\x00\x01\xa1S\xfc\x195\
+\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x025>\
+\x00\x00\x01\xa1S\xfc\x198\
+\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x02\x10\xcc\
+\x00\x00\x01\xa1S\xfc\x19;\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x02\xab\xc3\
+\x00\x00\x01\xa1S\xfc\x18\xe9\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x02\x9f\x8e\
+\x00\x00\x01\xa1S\xfc\x18\xec\
+\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x02\xb7z\
+\x00\x00\x01\xa1S\xfc\x18\xef\
+\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x02\x92\xb8\
+\x00\x00\x01\xa1S\xfc\x18\xf2\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x02\x85n\
+\x00\x00\x01\xa1S\xfc\x19 \
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x02\x82\xce\
+\x00\x00\x01\xa1S\xfc\x19#\
+\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x02\x87\xc8\
+\x00\x00\x01\xa1S\xfc\x19&\
+\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x02\x7f\x89\
+\x00\x00\x01\xa1S\xfc\x19(\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x02w\x97\
+\x00\x00\x01\xa1S\xfc\x18\xd5\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x02sv\
+\x00\x00\x01\xa1S\xfc\x18\xd9\
+\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x02{X\
+\x00\x00\x01\xa1S\xfc\x18\xdb\
+\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x02n\xb6\
+\x00\x00\x01\xa1S\xfc\x18\xdd\
+\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\xdd8\
+\x00\x00\x01\xa1S\xfc\x19?\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x00\x86\x12\
+\x00\x00\x01\xa1S\xfc\x19@\
+\x00\x00\x00\xd6\x00\x00\x00\x00\x00\x01\x00\x01\xf4\xa5\
+\x00\x00\x01\xa1S\xfc\x19A\
+\x00\x00\x00f\x00\x00\x00\x00\x00\x01\x00\x00t\xb2\
+\x00\x00\x01\xa1S\xfc\x19A\
+\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x01\xfe\x1f\
+\x00\x00\x01\xa1S\xfc\x19B\
+\x00\x00\x00\x9e\x00\x00\x00\x00\x00\x01\x00\x00\xc2\x1c\
+\x00\x00\x01\xa1S\xfc\x19D\
+\x00\x00\x00\x8a\x00\x00\x00\x00\x00\x01\x00\x00\x8cN\
+\x00\x00\x01\xa1S\xfc\x19G\
+\x00\x00\x00R\x00\x00\x00\x00\x00\x01\x00\x00$\x7f\
+\x00\x00\x01\xa1S\xfc\x19K\
+\x00\x00\x00\xc2\x00\x00\x00\x00\x00\x01\x00\x00\xe0\xb1\
+\x00\x00\x01\xa1S\xfc\x19^\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
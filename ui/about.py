@@ -1,9 +1,12 @@
 from PySide6.QtWidgets import QDialog, QVBoxLayout, QLabel, QPushButton, QScrollArea, QWidget, QFrame, QHBoxLayout
 from PySide6.QtGui import QFont, QDesktopServices, QIcon, QPixmap
 from PySide6.QtCore import Qt, QUrl
+from utils import tracing
+from utils import icons
 
 
 class AboutDialog(QDialog):
+    @tracing.traced()
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("About SearchTabs 1.0 Beta")
@@ -79,9 +82,7 @@ class AboutDialog(QDialog):
 
         # Logo
         logo_label = QLabel()
-        pixmap = QPixmap("icons/final/logo_s.png")
-        scaled_pixmap = pixmap.scaled(50, 50, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        logo_label.setPixmap(scaled_pixmap)
+        logo_label.setPixmap(icons.logo_pixmap(50))
         logo_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
 
         # Add author info and logo to horizontal layout
@@ -0,0 +1,115 @@
+import logging
+from datetime import datetime
+from PySide6.QtCore import Qt, QUrl, QTimer
+from PySide6.QtWidgets import QApplication, QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel
+from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineUrlRequestInterceptor
+from utils import tracing
+
+logger = logging.getLogger(__name__)
+
+_offline_profile = None
+
+
+class OfflineRequestInterceptor(QWebEngineUrlRequestInterceptor):
+    """Blocks every request that would leave the machine"""
+    ALLOWED_SCHEMES = ("file", "data", "blob", "cid", "qrc")
+
+    def interceptRequest(self, info):
+        if info.requestUrl().scheme() not in self.ALLOWED_SCHEMES:
+            info.block(True)
+
+
+def offline_profile():
+    """Off-the-record profile shared by all archive viewers, so the Perplexity session is never touched"""
+    global _offline_profile
+    if _offline_profile is None:
+        _offline_profile = QWebEngineProfile(QApplication.instance())
+        _offline_profile.setUrlRequestInterceptor(OfflineRequestInterceptor(_offline_profile))
+    return _offline_profile
+
+
+class ArchiveViewer(QDialog):
+    """Shows an archived MHTML copy in an isolated, offline profile"""
+    def __init__(self, path, title, parent=None):
+        super().__init__(parent)
+        # The page and its renderer process go away with the viewer
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.setWindowTitle(f"Archived: {title}")
+        self.resize(1024, 768)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        # The page is a child of the view, so it is deleted before the profile it uses
+        self.webview = QWebEngineView()
+        self.webview.setPage(QWebEnginePage(offline_profile(), self.webview))
+        self.webview.setUrl(QUrl.fromLocalFile(path))
+        layout.addWidget(self.webview)
+
+        logger.info(f"Opened archived page {path}")
+
+
+class ArchiveSearchDialog(QDialog):
+    @tracing.traced()
+    def __init__(self, browser_window):
+        super().__init__(browser_window)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.browserwindow = browser_window
+        self.archive_manager = browser_window.archive_manager
+        self.setWindowTitle("Search Archive")
+        self.resize(600, 450)
+
+        self.setPalette(self.browserwindow.theme_manager.get_palette())
+        self.setStyleSheet(self.browserwindow.theme_manager.get_settings_window_stylesheet())
+
+        layout = QVBoxLayout(self)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search archived threads...")
+        self.search_input.textChanged.connect(self.schedule_search)
+        layout.addWidget(self.search_input)
+
+        self.results_list = QListWidget()
+        self.results_list.itemActivated.connect(self.open_result)
+        layout.addWidget(self.results_list)
+
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addWidget(self.status_label)
+
+        # Coalesce keystrokes into a single query
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(50)
+        self.search_timer.timeout.connect(self.run_search)
+
+        self.archive_manager.page_archived.connect(self.schedule_search)
+        self.run_search()
+
+    def schedule_search(self, *args):
+        self.search_timer.start()
+
+    def run_search(self):
+        results = self.archive_manager.search(self.search_input.text())
+
+        self.results_list.clear()
+        for result in results:
+            archived_at = datetime.fromtimestamp(result["archived_at"]).strftime("%Y-%m-%d %H:%M")
+            text = f"{result['title'] or result['url']}\n{archived_at} - {result['url']}"
+            if result["snippet"]:
+                text += f"\n{result['snippet']}"
+            item = QListWidgetItem(text)
+            item.setData(Qt.UserRole, result)
+            self.results_list.addItem(item)
+
+        if not self.archive_manager.search_available:
+            self.status_label.setText("Full-text search is not available on this system")
+        else:
+            self.status_label.setText(f"{len(results)} archived pages")
+
+    def open_result(self, item):
+        result = item.data(Qt.UserRole)
+        # Viewers stay open when the search dialog is closed
+        viewer = ArchiveViewer(result["path"], result["title"] or result["url"], self.browserwindow)
+        viewer.show()
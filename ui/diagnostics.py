@@ -0,0 +1,589 @@
+import time
+import logging
+from datetime import datetime
+from PySide6.QtCore import Qt, QTimer, QRectF
+from PySide6.QtGui import QColor
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget, QWidget, QFormLayout, QLabel,
+                               QListWidget, QTableWidget, QTableWidgetItem, QHeaderView, QPushButton, QFileDialog,
+                               QComboBox, QStyledItemDelegate, QPlainTextEdit, QSplitter)
+from managers.memory_manager import LEVEL_NAMES
+from managers.navigation_telemetry import PERCENTILES, SLICE_SECONDS, SLICE_COUNT
+from managers.network_timing import TIMING_PHASES
+from managers.stall_watchdog import STALL_THRESHOLD_MS
+from managers.leak_detector import COUNTED_TYPES
+from utils import tracing
+from utils import qt_async
+
+logger = logging.getLogger(__name__)
+
+REFRESH_INTERVAL_MS = 1000
+
+
+class MemoryPressurePage(QWidget):
+    def __init__(self, browser_window, parent=None):
+        super().__init__(parent)
+        self.browserwindow = browser_window
+        self.monitor = browser_window.memory_monitor
+
+        layout = QVBoxLayout(self)
+
+        form = QFormLayout()
+        self.mode_label = QLabel()
+        self.level_label = QLabel()
+        self.available_label = QLabel()
+        self.psi_label = QLabel()
+        self.tabs_label = QLabel()
+        form.addRow("Monitor:", self.mode_label)
+        form.addRow("Pressure level:", self.level_label)
+        form.addRow("Available memory:", self.available_label)
+        form.addRow("PSI avg10 (some/full):", self.psi_label)
+        form.addRow("Tabs:", self.tabs_label)
+        layout.addLayout(form)
+
+        layout.addWidget(QLabel("Responses:"))
+        self.actions_list = QListWidget()
+        layout.addWidget(self.actions_list)
+
+    def refresh(self):
+        monitor = self.monitor
+        self.mode_label.setText(monitor.mode)
+        self.level_label.setText(LEVEL_NAMES[monitor.level])
+        if monitor.mem_total:
+            self.available_label.setText(
+                f"{monitor.mem_available / 1024 ** 2:.0f} MB of {monitor.mem_total / 1024 ** 2:.0f} MB "
+                f"({100.0 * monitor.mem_available / monitor.mem_total:.1f}%)")
+        else:
+            self.available_label.setText("Unknown")
+        self.psi_label.setText(f"{monitor.psi['some']:.2f}% / {monitor.psi['full']:.2f}%")
+
+        states = {}
+        for tab in self.browserwindow.window_manager.all_tabs():
+            state = tab.webview.page().lifecycleState().name
+            states[state] = states.get(state, 0) + 1
+        self.tabs_label.setText(", ".join(f"{count} {state}" for state, count in sorted(states.items())))
+
+        if self.actions_list.count() != len(monitor.actions):
+            self.actions_list.clear()
+            for timestamp, message in reversed(monitor.actions):
+                self.actions_list.addItem(f"{datetime.fromtimestamp(timestamp).strftime('%H:%M:%S')}  {message}")
+
+
+class RendererRecoveryPage(QWidget):
+    COLUMNS = ["Tab", "Crashes", "Hangs", "Restarts", "Status"]
+
+    def __init__(self, browser_window, parent=None):
+        super().__init__(parent)
+        self.browserwindow = browser_window
+        self.manager = browser_window.crash_recovery_manager
+
+        layout = QVBoxLayout(self)
+        self.totals_label = QLabel()
+        layout.addWidget(self.totals_label)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+
+    def refresh(self):
+        self.totals_label.setText(f"Since startup: {self.manager.total_crashes} renderer crashes, "
+                                  f"{self.manager.total_hangs} hangs")
+
+        tabs = self.browserwindow.window_manager.all_tabs()
+        self.table.setRowCount(len(tabs))
+        for row, tab in enumerate(tabs):
+            state = tab.recovery_state
+            if state.gave_up:
+                status = "Stopped retrying"
+            elif state.retry_at is not None:
+                status = "Recovering"
+            else:
+                status = "OK"
+            values = [tab.webview.title(), state.crashes, state.hangs, state.restarts, status]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(value)))
+
+
+class PrerenderPage(QWidget):
+    COLUMNS = ["Link", "State", "Age"]
+
+    def __init__(self, browser_window, parent=None):
+        super().__init__(parent)
+        self.manager = browser_window.prerender_manager
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self.status_label = QLabel()
+        self.memory_label = QLabel()
+        self.stats_label = QLabel()
+        form.addRow("Prerendering:", self.status_label)
+        form.addRow("Memory:", self.memory_label)
+        form.addRow("Since startup:", self.stats_label)
+        layout.addLayout(form)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+
+    def refresh(self):
+        manager = self.manager
+        self.status_label.setText(f"{'On' if manager.enabled else 'Off'}, "
+                                  f"{len(manager.prerenders)} of {manager.max_pages} pages")
+        self.memory_label.setText(f"{manager.memory_used_mb():.0f} MB of {manager.budget_mb} MB budget")
+        self.stats_label.setText(", ".join(f"{count} {name}" for name, count in manager.stats.items()))
+
+        now = time.monotonic()
+        self.table.setRowCount(len(manager.prerenders))
+        for row, prerender in enumerate(manager.prerenders.values()):
+            state = f"Ready ({prerender.load_ms:.0f} ms)" if prerender.load_ms is not None else "Loading"
+            values = [prerender.url, state, f"{now - prerender.started:.0f}s"]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(value))
+
+
+class NavigationPage(QWidget):
+    COLUMNS = ["Name", "Loads", "Failed"] + [f"p{pct}" for pct in PERCENTILES]
+
+    def __init__(self, browser_window, parent=None):
+        super().__init__(parent)
+        self.telemetry = browser_window.navigation_telemetry
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel(f"Page load times over the last {SLICE_SECONDS * SLICE_COUNT // 60} minutes"))
+
+        layout.addWidget(QLabel("By origin:"))
+        self.origin_table = self._create_table()
+        layout.addWidget(self.origin_table)
+
+        layout.addWidget(QLabel("By open tab:"))
+        self.tab_table = self._create_table()
+        layout.addWidget(self.tab_table)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        self.export_csv_button = QPushButton("Export CSV")
+        self.export_csv_button.clicked.connect(lambda: self.export("CSV files (*.csv)", False))
+        self.export_json_button = QPushButton("Export JSON")
+        self.export_json_button.clicked.connect(lambda: self.export("JSON files (*.json)", True))
+        buttons_layout.addWidget(self.export_csv_button)
+        buttons_layout.addWidget(self.export_json_button)
+        layout.addLayout(buttons_layout)
+
+    def _create_table(self):
+        table = QTableWidget(0, len(self.COLUMNS))
+        table.setHorizontalHeaderLabels(self.COLUMNS)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        table.verticalHeader().hide()
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        return table
+
+    @staticmethod
+    def _fill_table(table, summaries):
+        table.setRowCount(len(summaries))
+        for row, (name, summary) in enumerate(summaries):
+            values = [name, summary["count"], summary["failures"]]
+            values += [f"{summary[f'p{pct}']:.0f} ms" if summary[f"p{pct}"] is not None else "-"
+                       for pct in PERCENTILES]
+            for column, value in enumerate(values):
+                table.setItem(row, column, QTableWidgetItem(str(value)))
+
+    def refresh(self):
+        self._fill_table(self.origin_table, self.telemetry.origin_summaries())
+        self._fill_table(self.tab_table, self.telemetry.tab_summaries())
+
+    def export(self, file_filter, as_json):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Navigation Telemetry", "", file_filter)
+        if path:
+            qt_async.spawn(self._export(path, as_json), name="Export navigation telemetry")
+
+    async def _export(self, path, as_json):
+        try:
+            await self.telemetry.export_async(path, as_json)
+        except OSError as e:
+            logger.error(f"Error exporting navigation telemetry: {e}")
+
+
+# Waterfall bar colours, one per timing phase
+PHASE_COLORS = {
+    "blocked": QColor("#9e9e9e"),
+    "dns": QColor("#26a69a"),
+    "connect": QColor("#ff9800"),
+    "wait": QColor("#66bb6a"),
+    "receive": QColor("#42a5f5"),
+}
+
+
+class WaterfallDelegate(QStyledItemDelegate):
+    """Draws a request as a bar of its timing phases, placed on the time span of the whole tab"""
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        data = index.data(Qt.UserRole)
+        if not data:
+            return
+        offset, phases, span = data
+        rect = option.rect.adjusted(2, 4, -2, -4)
+        scale = rect.width() / span if span > 0 else 0
+        x = rect.left() + offset * scale
+        painter.save()
+        if phases is None:
+            # Started but never reported as complete
+            painter.fillRect(QRectF(x, rect.center().y(), 2, 2), PHASE_COLORS["blocked"])
+        for phase, duration in phases or ():
+            width = max(duration * scale, 1)
+            painter.fillRect(QRectF(x, rect.top(), width, rect.height()), PHASE_COLORS[phase])
+            x += width
+        painter.restore()
+
+
+class NetworkPage(QWidget):
+    COLUMNS = ["URL", "Type", "Status", "Size", "Start", "Time", "Waterfall"]
+    WATERFALL_COLUMN = 6
+
+    def __init__(self, browser_window, parent=None):
+        super().__init__(parent)
+        self.browserwindow = browser_window
+        self.network_timing = browser_window.network_timing
+        self.shown = None
+
+        layout = QVBoxLayout(self)
+        tab_layout = QHBoxLayout()
+        tab_layout.addWidget(QLabel("Tab:"))
+        self.tab_combo = QComboBox()
+        self.tab_combo.currentIndexChanged.connect(self.refresh)
+        tab_layout.addWidget(self.tab_combo, 1)
+        layout.addLayout(tab_layout)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(self.WATERFALL_COLUMN, QHeaderView.Fixed)
+        self.table.setColumnWidth(self.WATERFALL_COLUMN, 200)
+        self.table.setItemDelegateForColumn(self.WATERFALL_COLUMN, WaterfallDelegate(self.table))
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        legend = "  ".join(f"<span style='color: {PHASE_COLORS[phase].name()}'>&#9632;</span> {phase}"
+                           for phase in TIMING_PHASES)
+        layout.addWidget(QLabel(legend))
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        self.export_button = QPushButton("Export HAR")
+        self.export_button.clicked.connect(self.export)
+        buttons_layout.addWidget(self.export_button)
+        layout.addLayout(buttons_layout)
+
+    def _update_tabs(self):
+        tabs = self.browserwindow.window_manager.all_tabs()
+        keys = [id(tab) for tab in tabs] + [None]
+        current = self.tab_combo.currentData()
+        if [self.tab_combo.itemData(i) for i in range(self.tab_combo.count())] != keys:
+            self.tab_combo.blockSignals(True)
+            self.tab_combo.clear()
+            for tab in tabs:
+                self.tab_combo.addItem(tab.webview.title() or tab.webview.url().toString(), id(tab))
+            self.tab_combo.addItem("Requests of no open tab", None)
+            index = self.tab_combo.findData(current) if current is not None else -1
+            self.tab_combo.setCurrentIndex(index if index >= 0 else 0)
+            self.tab_combo.blockSignals(False)
+        return {id(tab): tab for tab in tabs}
+
+    def refresh(self):
+        tabs = self._update_tabs()
+        key = self.tab_combo.currentData()
+        # The page reports its completed requests asynchronously, they show up on the next refresh
+        if key in tabs:
+            self.network_timing.collect(tabs[key])
+
+        requests = self.network_timing.tab_requests(key)
+        completed = sum(1 for request in requests if request.timing)
+        if self.shown == (key, len(requests), completed):
+            return
+        self.shown = (key, len(requests), completed)
+
+        first = requests[0].started if requests else 0
+        span = max([(request.started - first) * 1000 + (request.duration_ms or 0) for request in requests] or [0])
+        self.summary_label.setText(f"{len(requests)} requests, {completed} completed, {span / 1000:.2f} s")
+
+        self.table.setRowCount(len(requests))
+        for row, request in enumerate(requests):
+            timing = request.timing
+            offset = (request.started - first) * 1000
+            values = [request.url, request.resource_type,
+                      timing["status"] or "" if timing else "",
+                      f"{timing['size'] / 1024:.1f} KB" if timing and timing["size"] else "",
+                      f"{offset:.0f} ms",
+                      f"{request.duration_ms:.0f} ms" if timing else "pending", ""]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(value)))
+            phases = [(phase, timing[phase]) for phase in TIMING_PHASES] if timing else None
+            self.table.item(row, self.WATERFALL_COLUMN).setData(Qt.UserRole, (offset, phases, span))
+
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Network Timing", "", "HAR files (*.har *.json)")
+        if path:
+            qt_async.spawn(self._export(path), name="Export network timing")
+
+    async def _export(self, path):
+        try:
+            await self.network_timing.export_async(path)
+        except OSError as e:
+            logger.error(f"Error exporting network timing: {e}")
+
+
+class StallsPage(QWidget):
+    COLUMNS = ["Time", "Duration", "Where"]
+
+    def __init__(self, browser_window, parent=None):
+        super().__init__(parent)
+        self.watchdog = browser_window.window_manager.stall_watchdog
+        self.shown = None
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self.count_label = QLabel()
+        self.percentiles_label = QLabel()
+        form.addRow("Stalls:", self.count_label)
+        form.addRow("Duration:", self.percentiles_label)
+        layout.addLayout(form)
+
+        splitter = QSplitter(Qt.Vertical)
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.currentCellChanged.connect(self._show_stack)
+        splitter.addWidget(self.table)
+
+        self.stack_view = QPlainTextEdit()
+        self.stack_view.setReadOnly(True)
+        self.stack_view.setLineWrapMode(QPlainTextEdit.NoWrap)
+        self.stack_view.setPlaceholderText("Select a stall to see the main thread's stack")
+        splitter.addWidget(self.stack_view)
+        layout.addWidget(splitter)
+
+    def refresh(self):
+        watchdog = self.watchdog
+        summary = watchdog.summary()
+        self.count_label.setText(f"{watchdog.total_stalls} since startup, {summary['count']} in the last "
+                                 f"{SLICE_SECONDS * SLICE_COUNT // 60} minutes (over {STALL_THRESHOLD_MS} ms)")
+        self.percentiles_label.setText(", ".join(
+            f"p{pct} {summary[f'p{pct}']:.0f} ms" if summary[f"p{pct}"] is not None else f"p{pct} -"
+            for pct in PERCENTILES))
+
+        if self.shown == watchdog.total_stalls:
+            return
+        self.shown = watchdog.total_stalls
+        stalls = list(reversed(watchdog.recent))
+        self.table.setRowCount(len(stalls))
+        for row, stall in enumerate(stalls):
+            values = [datetime.fromtimestamp(stall.started).strftime("%H:%M:%S"), f"{stall.duration_ms:.0f} ms",
+                      stall.location]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                item.setData(Qt.UserRole, "".join(stall.stack))
+                self.table.setItem(row, column, item)
+
+    def _show_stack(self, row, column, previous_row, previous_column):
+        item = self.table.item(row, 0)
+        self.stack_view.setPlainText(item.data(Qt.UserRole) or "No stack was sampled" if item else "")
+
+
+def _format_bytes(size, signed=False):
+    sign = "+" if signed and size > 0 else ""
+    if abs(size) >= 1024 ** 2:
+        return f"{sign}{size / 1024 ** 2:.1f} MB"
+    return f"{sign}{size / 1024:.1f} KB"
+
+
+class LeaksPage(QWidget):
+    COLUMNS = ["Allocated in", "Size", "Growth", "Blocks", "Block growth"]
+
+    def __init__(self, browser_window, parent=None):
+        super().__init__(parent)
+        self.detector = browser_window.window_manager.leak_detector
+        self.compared = None
+
+        layout = QVBoxLayout(self)
+        form = QFormLayout()
+        self.tracing_label = QLabel()
+        self.objects_label = QLabel()
+        form.addRow("Tracing:", self.tracing_label)
+        form.addRow("Live objects:", self.objects_label)
+        layout.addLayout(form)
+
+        buttons_layout = QHBoxLayout()
+        self.tracing_button = QPushButton()
+        self.tracing_button.clicked.connect(self.toggle_tracing)
+        self.snapshot_button = QPushButton("Take Snapshot")
+        self.snapshot_button.clicked.connect(self.take_snapshot)
+        self.export_button = QPushButton("Export Snapshot")
+        self.export_button.clicked.connect(self.export)
+        buttons_layout.addWidget(self.tracing_button)
+        buttons_layout.addWidget(self.snapshot_button)
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.export_button)
+        layout.addLayout(buttons_layout)
+
+        compare_layout = QHBoxLayout()
+        self.old_combo = QComboBox()
+        self.new_combo = QComboBox()
+        self.group_combo = QComboBox()
+        self.group_combo.addItem("Module", True)
+        self.group_combo.addItem("Line", False)
+        for combo in (self.old_combo, self.new_combo, self.group_combo):
+            combo.currentIndexChanged.connect(self.compare)
+        compare_layout.addWidget(QLabel("Growth from"))
+        compare_layout.addWidget(self.old_combo, 1)
+        compare_layout.addWidget(QLabel("to"))
+        compare_layout.addWidget(self.new_combo, 1)
+        compare_layout.addWidget(QLabel("by"))
+        compare_layout.addWidget(self.group_combo)
+        layout.addLayout(compare_layout)
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.verticalHeader().hide()
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        layout.addWidget(self.table)
+
+    def refresh(self):
+        detector = self.detector
+        tracing_on = detector.is_tracing()
+        if tracing_on:
+            current, peak = detector.traced_memory()
+            self.tracing_label.setText(f"{_format_bytes(current)} traced, peak {_format_bytes(peak)}, "
+                                       f"{len(detector.snapshots)} snapshots")
+        else:
+            self.tracing_label.setText("Off, tracing slows the browser down while it runs")
+        self.tracing_button.setText("Stop Tracing" if tracing_on else "Start Tracing")
+        self.snapshot_button.setEnabled(tracing_on and not detector.busy)
+        self.export_button.setEnabled(bool(detector.snapshots))
+        counts = detector.count_objects()
+        self.objects_label.setText(", ".join(f"{counts[name]} {name}" for name in COUNTED_TYPES)
+                                   + f", {counts['Open tabs']} open tabs")
+        self._update_snapshots()
+
+    def _update_snapshots(self):
+        snapshots = self.detector.snapshots
+        if [self.new_combo.itemData(i) for i in range(self.new_combo.count())] == snapshots:
+            return
+        for combo in (self.old_combo, self.new_combo):
+            combo.blockSignals(True)
+            combo.clear()
+            for snapshot in snapshots:
+                counts = ", ".join(f"{snapshot.counts[name]} {name}" for name in COUNTED_TYPES)
+                combo.addItem(f"{datetime.fromtimestamp(snapshot.taken).strftime('%H:%M:%S')} "
+                              f"({_format_bytes(snapshot.traced_bytes)}; {counts})", snapshot)
+        # The two latest snapshots by default
+        self.old_combo.setCurrentIndex(max(len(snapshots) - 2, 0))
+        self.new_combo.setCurrentIndex(len(snapshots) - 1)
+        for combo in (self.old_combo, self.new_combo):
+            combo.blockSignals(False)
+        self.compare()
+
+    def toggle_tracing(self):
+        if self.detector.is_tracing():
+            self.detector.stop()
+        else:
+            self.detector.start()
+        self.refresh()
+
+    def take_snapshot(self):
+        self.snapshot_button.setEnabled(False)
+        qt_async.spawn(self._take_snapshot(), name="Take heap snapshot")
+
+    async def _take_snapshot(self):
+        await self.detector.take_snapshot()
+        self.refresh()
+
+    def compare(self):
+        old, new = self.old_combo.currentData(), self.new_combo.currentData()
+        if old is None or new is None:
+            self.table.setRowCount(0)
+            return
+        qt_async.spawn(self._compare(old, new, self.group_combo.currentData()), name="Compare heap snapshots")
+
+    async def _compare(self, old, new, by_module):
+        key = (old, new, by_module)
+        self.compared = key
+        growth = await self.detector.compare(old, new, by_module)
+        # A newer comparison was started meanwhile
+        if self.compared != key:
+            return
+        self.table.setRowCount(len(growth))
+        for row, entry in enumerate(growth):
+            values = [entry.site, _format_bytes(entry.size), _format_bytes(entry.size_diff, signed=True),
+                      entry.count, f"{entry.count_diff:+d}"]
+            for column, value in enumerate(values):
+                self.table.setItem(row, column, QTableWidgetItem(str(value)))
+
+    def export(self):
+        snapshot = self.new_combo.currentData()
+        if snapshot is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export Heap Snapshot", "", "tracemalloc snapshots (*.tracemalloc)")
+        if path:
+            qt_async.spawn(self._export(snapshot, path), name="Export heap snapshot")
+
+    async def _export(self, snapshot, path):
+        try:
+            await self.detector.export_async(snapshot, path)
+        except OSError as e:
+            logger.error(f"Error exporting heap snapshot: {e}")
+
+
+class DiagnosticsDialog(QDialog):
+    @tracing.traced()
+    def __init__(self, browser_window):
+        super().__init__(browser_window)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.browserwindow = browser_window
+        self.setWindowTitle("Diagnostics")
+        self.resize(640, 480)
+
+        self.setPalette(self.browserwindow.theme_manager.get_palette())
+        self.setStyleSheet(self.browserwindow.theme_manager.get_settings_window_stylesheet())
+
+        layout = QVBoxLayout(self)
+        self.pages = QTabWidget()
+        self.pages.addTab(MemoryPressurePage(browser_window), "Memory")
+        self.pages.addTab(RendererRecoveryPage(browser_window), "Renderers")
+        self.pages.addTab(PrerenderPage(browser_window), "Prerender")
+        self.pages.addTab(NavigationPage(browser_window), "Navigation")
+        self.pages.addTab(NetworkPage(browser_window), "Network")
+        self.pages.addTab(StallsPage(browser_window), "Stalls")
+        self.pages.addTab(LeaksPage(browser_window), "Leaks")
+        layout.addWidget(self.pages)
+
+        # Only the visible page is refreshed, and only while the dialog is shown
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setInterval(REFRESH_INTERVAL_MS)
+        self.refresh_timer.timeout.connect(self.refresh)
+        self.pages.currentChanged.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self.refresh_timer.start()
+
+    def hideEvent(self, event):
+        self.refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        page = self.pages.currentWidget()
+        if page is not None and hasattr(page, "refresh"):
+            page.refresh()
@@ -0,0 +1,99 @@
+import logging
+from PySide6.QtCore import Qt, QStandardPaths
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QCheckBox,
+                               QProgressBar, QFileDialog)
+from utils import tracing
+
+logger = logging.getLogger(__name__)
+
+
+class ExportDialog(QDialog):
+    """Exports every open tab of the window to Markdown and optionally PDF, without blocking the window"""
+    @tracing.traced()
+    def __init__(self, browser_window):
+        super().__init__(browser_window)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.browserwindow = browser_window
+        self.export_manager = browser_window.export_manager
+        self.job = None
+        self.setWindowTitle("Export All Tabs")
+        self.resize(480, 200)
+
+        self.setPalette(self.browserwindow.theme_manager.get_palette())
+        self.setStyleSheet(self.browserwindow.theme_manager.get_settings_window_stylesheet())
+
+        layout = QVBoxLayout(self)
+
+        self.tabs_label = QLabel(f"{browser_window.tabs.count()} open tabs in this window")
+        layout.addWidget(self.tabs_label)
+
+        folder_layout = QHBoxLayout()
+        self.folder_input = QLineEdit(QStandardPaths.writableLocation(QStandardPaths.DocumentsLocation))
+        browse_button = QPushButton("Browse...")
+        browse_button.clicked.connect(self.choose_folder)
+        folder_layout.addWidget(self.folder_input)
+        folder_layout.addWidget(browse_button)
+        layout.addLayout(folder_layout)
+
+        self.pdf_checkbox = QCheckBox("Also save PDF copies")
+        layout.addWidget(self.pdf_checkbox)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setValue(0)
+        layout.addWidget(self.progress_bar)
+
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addWidget(self.status_label)
+
+        buttons_layout = QHBoxLayout()
+        buttons_layout.addStretch()
+        self.export_button = QPushButton("Export")
+        self.export_button.clicked.connect(self.start_export)
+        self.cancel_button = QPushButton("Close")
+        self.cancel_button.clicked.connect(self.cancel_or_close)
+        buttons_layout.addWidget(self.export_button)
+        buttons_layout.addWidget(self.cancel_button)
+        layout.addLayout(buttons_layout)
+
+    def choose_folder(self):
+        folder = QFileDialog.getExistingDirectory(self, "Export To", self.folder_input.text())
+        if folder:
+            self.folder_input.setText(folder)
+
+    def start_export(self):
+        tabs = [self.browserwindow.tabs.widget(i) for i in range(self.browserwindow.tabs.count())]
+        try:
+            self.job = self.export_manager.export_tabs(tabs, self.folder_input.text(), self.pdf_checkbox.isChecked())
+            self.job.progress.connect(self.on_progress)
+            self.job.finished.connect(self.on_finished)
+            self.progress_bar.setMaximum(max(self.job.total, 1))
+            self.progress_bar.setValue(0)
+            self.export_button.setEnabled(False)
+            self.cancel_button.setText("Cancel")
+            self.job.start()
+        except OSError as e:
+            logger.error(f"Error starting export: {e}")
+            self.status_label.setText(f"Could not create the export folder: {e}")
+            self.on_finished(0, 0, "")
+
+    def on_progress(self, done, total, message):
+        self.progress_bar.setValue(done)
+        self.status_label.setText(message)
+
+    def on_finished(self, exported, failed, directory):
+        self.export_button.setEnabled(True)
+        self.cancel_button.setText("Close")
+        if self.job is None:
+            return
+        cancelled = self.job.cancelled
+        self.job = None
+        if directory:
+            summary = f"{exported} tabs exported" + (f", {failed} failed" if failed else "")
+            self.status_label.setText(summary + (" (cancelled)" if cancelled else f" to {directory}"))
+
+    def cancel_or_close(self):
+        if self.job is not None:
+            self.job.cancel()
+        else:
+            self.close()
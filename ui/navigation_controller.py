@@ -1,5 +1,6 @@
 import logging
 from PySide6.QtCore import QUrl
+from ui import ui_components
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +12,7 @@ class NavigationController:
     def go_home(self):
         currenttab = self.browser_window.tabs.currentWidget()
         if currenttab:
-            currenttab.webview.setUrl(QUrl("https://www.perplexity.ai"))
+            currenttab.webview.setUrl(QUrl(ui_components.HOME_URL))
         logger.info("Navigating to home page")
 
     def reload_page(self):
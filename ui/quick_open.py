@@ -0,0 +1,80 @@
+import time
+import logging
+from PySide6.QtCore import Qt, QUrl
+from PySide6.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel
+from utils import tracing
+
+logger = logging.getLogger(__name__)
+
+
+class QuickOpenDialog(QDialog):
+    """Type-ahead box over the browsing history, opens the selected thread in the current tab"""
+    @tracing.traced()
+    def __init__(self, browser_window):
+        super().__init__(browser_window)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.browserwindow = browser_window
+        self.history_manager = browser_window.history_manager
+        self.setWindowTitle("Quick Open")
+        self.resize(600, 400)
+
+        self.setPalette(self.browserwindow.theme_manager.get_palette())
+        self.setStyleSheet(self.browserwindow.theme_manager.get_settings_window_stylesheet())
+
+        layout = QVBoxLayout(self)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search history by URL or title...")
+        self.search_input.textChanged.connect(self.update_results)
+        self.search_input.returnPressed.connect(self.open_selected)
+        self.search_input.installEventFilter(self)
+        layout.addWidget(self.search_input)
+
+        self.results_list = QListWidget()
+        self.results_list.itemActivated.connect(self.open_item)
+        layout.addWidget(self.results_list)
+
+        self.status_label = QLabel()
+        self.status_label.setStyleSheet("color: gray; font-size: 10px;")
+        layout.addWidget(self.status_label)
+
+        self.update_results("")
+
+    def eventFilter(self, obj, event):
+        # Let the arrow keys move the selection while focus stays in the search box
+        if obj is self.search_input and event.type() == event.Type.KeyPress:
+            if event.key() in (Qt.Key_Down, Qt.Key_Up):
+                row = self.results_list.currentRow() + (1 if event.key() == Qt.Key_Down else -1)
+                if 0 <= row < self.results_list.count():
+                    self.results_list.setCurrentRow(row)
+                return True
+        return super().eventFilter(obj, event)
+
+    def update_results(self, text):
+        start = time.perf_counter()
+        results = self.history_manager.search(text)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.results_list.clear()
+        for url, title, visit_count, last_visit in results:
+            item = QListWidgetItem(f"{title or url}\n{url}")
+            item.setData(Qt.UserRole, url)
+            self.results_list.addItem(item)
+        if self.results_list.count():
+            self.results_list.setCurrentRow(0)
+
+        self.status_label.setText(f"{len(results)} results in {elapsed_ms:.1f} ms "
+                                  f"({len(self.history_manager.entries)} history entries)")
+
+    def open_selected(self):
+        item = self.results_list.currentItem()
+        if item:
+            self.open_item(item)
+
+    def open_item(self, item):
+        url = item.data(Qt.UserRole)
+        currenttab = self.browserwindow.tabs.currentWidget()
+        if currenttab:
+            currenttab.webview.setUrl(QUrl(url))
+            logger.info(f"Quick open: {url}")
+        self.close()
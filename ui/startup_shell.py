@@ -0,0 +1,196 @@
+"""The window as the last session left it, shown at launch before the browser itself is loaded.
+
+Only Qt widgets are imported here, so the shell can be on screen before QtWebEngine and the
+managers are imported.
+"""
+import os
+import json
+import time
+import logging
+from PySide6.QtCore import Qt, QTimer, QStandardPaths, QEvent
+from PySide6.QtGui import QPixmap, QPainter, QColor, QPalette
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QTabBar, QListWidget
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_IMAGE = "page.jpg"
+SNAPSHOT_INFO = "tabs.json"
+JPEG_QUALITY = 85
+# Time the page gets to paint its first frame after loading before the shell is removed
+FIRST_FRAME_DELAY_MS = 100
+# A page that never finishes loading doesn't keep the last session on screen
+MAX_SHELL_SECONDS = 20
+SIDEBAR_WIDTH = 240
+
+
+def _snapshot_directory():
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.CacheLocation), "startup_snapshot")
+
+
+def save_snapshot(window):
+    """Save the current page and the tab titles of a closing window, called for the last window"""
+    tab = window.tabs.currentWidget()
+    # A discarded page has nothing to grab, the previous snapshot is kept then
+    if tab is None or tab.is_discarded():
+        return
+    directory = _snapshot_directory()
+    info = {
+        "titles": [window.tabs.tabText(i) for i in range(window.tabs.count())],
+        "current": window.tabs.currentIndex(),
+        "vertical_tabs": window.vertical_tabs,
+        "width": window.width(),
+        "height": window.height(),
+        "background": window.theme_manager.get_colors()["background"],
+        "text": window.theme_manager.get_colors()["text"],
+    }
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # Written next to the old files and renamed, a crash while exiting leaves the previous snapshot
+        image_path = os.path.join(directory, SNAPSHOT_IMAGE)
+        if not tab.webview.grab().save(image_path + ".tmp", "JPEG", JPEG_QUALITY):
+            raise OSError("could not encode the page image")
+        with open(os.path.join(directory, SNAPSHOT_INFO + ".tmp"), "w", encoding="utf-8") as f:
+            json.dump(info, f)
+        os.replace(image_path + ".tmp", image_path)
+        os.replace(os.path.join(directory, SNAPSHOT_INFO + ".tmp"), os.path.join(directory, SNAPSHOT_INFO))
+        logger.info(f"Startup snapshot saved with {len(info['titles'])} tabs")
+    except OSError as e:
+        logger.error(f"Error saving startup snapshot: {e}")
+
+
+def load_snapshot():
+    """The saved page image and tab info, or None when there is no usable snapshot"""
+    directory = _snapshot_directory()
+    try:
+        with open(os.path.join(directory, SNAPSHOT_INFO), encoding="utf-8") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    pixmap = QPixmap(os.path.join(directory, SNAPSHOT_IMAGE))
+    if pixmap.isNull() or not info.get("titles"):
+        return None
+    return pixmap, info
+
+
+def delete_snapshot():
+    """Forget the last session's look, as when browser data is reset"""
+    for name in (SNAPSHOT_IMAGE, SNAPSHOT_INFO):
+        try:
+            os.remove(os.path.join(_snapshot_directory(), name))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Error deleting startup snapshot: {e}")
+
+
+class SnapshotArea(QWidget):
+    """Paints the page image stretched to the width of the tab area"""
+    def __init__(self, pixmap, background, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.pixmap = pixmap
+        self.background = background
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.background)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+        height = self.pixmap.height() * self.width() // self.pixmap.width()
+        painter.drawPixmap(0, 0, self.width(), height, self.pixmap)
+
+
+class StartupShell(QWidget):
+    """Non-interactive stand-in for the main window until its first page has loaded.
+
+    Shown as a window of its own while the browser starts, then moved over the real window
+    and removed once the current tab has loaded.
+    """
+    def __init__(self, snapshot, launched):
+        super().__init__()
+        pixmap, info = snapshot
+        # time.perf_counter() at launch, for reporting how long startup looked and took
+        self.launched = launched
+        self.covered_window = None
+        self.tab = None
+        self.setWindowTitle("SearchTabs")
+        self.setAutoFillBackground(True)
+        background = QColor(info.get("background", "#202222"))
+        palette = self.palette()
+        for role in (QPalette.Window, QPalette.Base, QPalette.Button):
+            palette.setColor(role, background)
+        for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText):
+            palette.setColor(role, QColor(info.get("text", "#FFFFFF")))
+        self.setPalette(palette)
+
+        titles = info["titles"]
+        current = min(max(info.get("current", 0), 0), len(titles) - 1)
+        if info.get("vertical_tabs"):
+            layout = QHBoxLayout(self)
+            tab_strip = QListWidget()
+            tab_strip.setFixedWidth(SIDEBAR_WIDTH)
+            tab_strip.addItems(titles)
+            tab_strip.setCurrentRow(current)
+        else:
+            layout = QVBoxLayout(self)
+            tab_strip = QTabBar()
+            tab_strip.setExpanding(False)
+            for title in titles:
+                tab_strip.addTab(title)
+            tab_strip.setCurrentIndex(current)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        # Looks like the window, but nothing in it reacts before the real one is there
+        tab_strip.setAttribute(Qt.WA_TransparentForMouseEvents)
+        tab_strip.setFocusPolicy(Qt.NoFocus)
+        layout.addWidget(tab_strip)
+        layout.addWidget(SnapshotArea(pixmap, background), 1)
+        self.resize(info.get("width", 1024), info.get("height", 768))
+
+        self.timeout = QTimer(self)
+        self.timeout.setSingleShot(True)
+        self.timeout.timeout.connect(self.finish)
+
+    def show(self):
+        super().show()
+        logger.info(f"Startup shell shown {(time.perf_counter() - self.launched) * 1000:.0f} ms after launch")
+
+    def cover(self, window):
+        """Move over the tab area of the real window, at the size and place the shell had"""
+        window.resize(self.size())
+        if self.isVisible():
+            window.move(self.pos())
+        self.covered_window = window
+        self.tab = window.tabs.currentWidget()
+        self.setParent(window.centralWidget())
+        self.setGeometry(window.centralWidget().rect())
+        window.centralWidget().installEventFilter(self)
+        if self.tab is not None:
+            self.tab.webview.loadFinished.connect(self._on_load_finished)
+        self.timeout.start(MAX_SHELL_SECONDS * 1000)
+        self.raise_()
+        super().show()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self.setGeometry(obj.rect())
+        return False
+
+    def _on_load_finished(self, ok):
+        QTimer.singleShot(FIRST_FRAME_DELAY_MS, self.finish)
+
+    def finish(self):
+        if self.covered_window is None:
+            return
+        window = self.covered_window
+        self.covered_window = None
+        self.timeout.stop()
+        window.centralWidget().removeEventFilter(self)
+        try:
+            self.tab.webview.loadFinished.disconnect(self._on_load_finished)
+        except (RuntimeError, AttributeError):
+            # Tab was closed
+            pass
+        logger.info(f"First page shown {time.perf_counter() - self.launched:.2f} s after launch, "
+                    f"startup shell removed")
+        self.hide()
+        self.deleteLater()
@@ -0,0 +1,70 @@
+import logging
+from PySide6.QtCore import Qt, QObject, QEvent, QPoint
+from PySide6.QtWidgets import QLabel, QVBoxLayout, QFrame, QTabBar
+
+logger = logging.getLogger(__name__)
+
+
+class TabPreviewPopup(QFrame):
+    """Thumbnail and title of a tab, shown in place of the tooltip"""
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.ToolTip | Qt.FramelessWindowHint)
+        self.setFrameShape(QFrame.Box)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.setSpacing(4)
+        self.image_label = QLabel()
+        self.title_label = QLabel()
+        self.title_label.setMaximumWidth(320)
+        layout.addWidget(self.image_label)
+        layout.addWidget(self.title_label)
+
+    def show_preview(self, pixmap, title, global_pos):
+        self.image_label.setPixmap(pixmap)
+        metrics = self.title_label.fontMetrics()
+        self.title_label.setText(metrics.elidedText(title, Qt.ElideRight, pixmap.width()))
+        self.adjustSize()
+        self.move(global_pos + QPoint(12, 16))
+        self.show()
+
+
+class TabHoverPreviews(QObject):
+    """Shows a tab's thumbnail when hovering it in the tab bar or the sidebar"""
+    def __init__(self, browser_window):
+        super().__init__(browser_window)
+        self.browserwindow = browser_window
+        self.thumbnail_cache = browser_window.thumbnail_cache
+        self.popup = TabPreviewPopup(browser_window)
+        self.tab_bar = browser_window.tabs.tabBar()
+        self.sidebar_view = browser_window.tab_sidebar.view
+        self.tab_bar.installEventFilter(self)
+        self.sidebar_view.viewport().installEventFilter(self)
+        self.shown_index = -1
+
+    def _index_at(self, obj, pos):
+        if isinstance(obj, QTabBar):
+            return obj.tabAt(pos)
+        return self.sidebar_view.indexAt(pos).row()
+
+    def eventFilter(self, obj, event):
+        event_type = event.type()
+        if event_type == QEvent.ToolTip:
+            index = self._index_at(obj, event.pos())
+            tab = self.browserwindow.tabs.widget(index) if index >= 0 else None
+            pixmap = self.thumbnail_cache.get(tab.webview.url().toString()) if tab is not None else None
+            if pixmap is None:
+                self.hide()
+                return False
+            self.popup.show_preview(pixmap, self.browserwindow.tabs.tabText(index), event.globalPos())
+            self.shown_index = index
+            return True
+        if event_type == QEvent.MouseMove and self.shown_index != -1:
+            if self._index_at(obj, event.position().toPoint()) != self.shown_index:
+                self.hide()
+        elif event_type in (QEvent.Leave, QEvent.MouseButtonPress, QEvent.Wheel):
+            self.hide()
+        return False
+
+    def hide(self):
+        self.shown_index = -1
+        self.popup.hide()
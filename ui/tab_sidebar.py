@@ -0,0 +1,131 @@
+import logging
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QPoint, Signal
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QListView, QAbstractItemView,
+                               QStyledItemDelegate)
+
+logger = logging.getLogger(__name__)
+
+ROW_HEIGHT = 28
+SIDEBAR_WIDTH = 240
+# Rows laid out per event loop turn, the rest follow in later turns
+LAYOUT_BATCH_SIZE = 100
+# data() runs for every role of every painted row, plain ints compare much faster than Qt enums
+DISPLAY_ROLE = Qt.DisplayRole.value
+TOOLTIP_ROLE = Qt.ToolTipRole.value
+DECORATION_ROLE = Qt.DecorationRole.value
+
+
+class TabListModel(QAbstractListModel):
+    """Exposes the tabs of a TabWidget as list rows with title and favicon"""
+    def __init__(self, tabs, parent=None):
+        super().__init__(parent)
+        self.tabs = tabs
+        # The widget reports changes after they happened, so the model keeps its own row count
+        self._count = tabs.count()
+        tabs.tab_inserted.connect(self._on_tab_inserted)
+        tabs.tab_removed.connect(self._on_tab_removed)
+        tabs.tab_changed.connect(self._on_tab_changed)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._count
+
+    def data(self, index, role=DISPLAY_ROLE):
+        # tabText() and tabIcon() return empty values for rows the widget no longer has
+        if role == DISPLAY_ROLE or role == TOOLTIP_ROLE:
+            return self.tabs.tabText(index.row())
+        if role == DECORATION_ROLE:
+            return self.tabs.tabIcon(index.row())
+        return None
+
+    def _on_tab_inserted(self, index):
+        self.beginInsertRows(QModelIndex(), index, index)
+        self._count += 1
+        self.endInsertRows()
+
+    def _on_tab_removed(self, index):
+        self.beginRemoveRows(QModelIndex(), index, index)
+        self._count -= 1
+        self.endRemoveRows()
+
+    def _on_tab_changed(self, index):
+        model_index = self.index(index)
+        self.dataChanged.emit(model_index, model_index, [Qt.DisplayRole, Qt.DecorationRole, Qt.ToolTipRole])
+
+
+class TabItemDelegate(QStyledItemDelegate):
+    """Rows of ROW_HEIGHT, a style sheet for the height would route all painting through the style sheet style"""
+    def sizeHint(self, option, index):
+        return QSize(SIDEBAR_WIDTH, ROW_HEIGHT)
+
+
+class TabListView(QListView):
+    close_requested = Signal(int)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == Qt.MiddleButton:
+            index = self.indexAt(event.position().toPoint())
+            if index.isValid():
+                self.close_requested.emit(index.row())
+            return
+        super().mouseReleaseEvent(event)
+
+
+class TabSidebar(QWidget):
+    """Vertical tab list, only the visible rows are laid out and painted"""
+    close_requested = Signal(int)
+    menu_requested = Signal(int, QPoint)
+
+    def __init__(self, tabs, parent=None):
+        super().__init__(parent)
+        self.tabs = tabs
+        self.setFixedWidth(SIDEBAR_WIDTH)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+
+        # Buttons that normally live in the tab bar corners are added here by the window
+        self.header_layout = QHBoxLayout()
+        self.header_layout.setContentsMargins(5, 2, 5, 2)
+        self.header_layout.setSpacing(2)
+        layout.addLayout(self.header_layout)
+
+        self.model = TabListModel(tabs, self)
+        self.view = TabListView()
+        self.view.setModel(self.model)
+        # Uniform rows let the view compute its layout without measuring every item, and batches
+        # keep each change from laying out all rows before the next paint
+        self.view.setUniformItemSizes(True)
+        self.view.setLayoutMode(QListView.Batched)
+        self.view.setBatchSize(LAYOUT_BATCH_SIZE)
+        self.view.setItemDelegate(TabItemDelegate(self.view))
+        self.view.setIconSize(QSize(16, 16))
+        self.view.setTextElideMode(Qt.ElideRight)
+        self.view.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.view.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.view.selectionModel().currentChanged.connect(self._on_row_selected)
+        self.view.close_requested.connect(self.close_requested)
+        self.view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.view.customContextMenuRequested.connect(self._on_menu_requested)
+        layout.addWidget(self.view)
+
+        tabs.currentChanged.connect(self._on_current_tab_changed)
+        self._on_current_tab_changed(tabs.currentIndex())
+
+    def _on_menu_requested(self, pos):
+        index = self.view.indexAt(pos)
+        if index.isValid():
+            self.menu_requested.emit(index.row(), self.view.viewport().mapToGlobal(pos))
+
+    def _on_row_selected(self, current, previous):
+        if current.isValid() and current.row() != self.tabs.currentIndex():
+            self.tabs.setCurrentIndex(current.row())
+
+    def _on_current_tab_changed(self, index):
+        if index < 0 or index >= self.model.rowCount():
+            return
+        model_index = self.model.index(index)
+        if self.view.currentIndex() != model_index:
+            self.view.setCurrentIndex(model_index)
+        self.view.scrollTo(model_index)
@@ -1,11 +1,21 @@
+import time
 import logging
-from PySide6.QtCore import Qt, QUrl
-from PySide6.QtWidgets import QProgressBar, QTabBar, QVBoxLayout, QWidget
+from PySide6.QtCore import Qt, QUrl, Signal, QTimer, QPoint, QObject, QSize
+from PySide6.QtWidgets import (QProgressBar, QTabBar, QVBoxLayout, QHBoxLayout, QWidget, QStackedLayout, QStackedWidget,
+                               QLabel, QPushButton, QAbstractButton, QStyle, QStyleOption)
+from PySide6.QtGui import QPainter, QPixmap, QColor, QIcon, QCursor
 from PySide6.QtWebEngineWidgets import QWebEngineView
 from PySide6.QtWebEngineCore import QWebEnginePage
 
 logger = logging.getLogger(__name__)
 
+HOME_URL = "https://www.perplexity.ai"
+
+# Time the web view gets to repaint at its final size before the resize snapshot is removed
+SNAPSHOT_REVEAL_DELAY_MS = 100
+# Time spent filling the tab bar before the event loop gets a turn
+TAB_BAR_SYNC_SLICE_MS = 8
+
 class ThinProgressBar(QProgressBar):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -49,28 +59,670 @@ class ThinProgressBar(QProgressBar):
             """)
 
 
+class TabCloseButton(QAbstractButton):
+    """Close button painted like the ones QTabBar puts on its tabs"""
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setCursor(Qt.ArrowCursor)
+        self.setToolTip("Close Tab")
+        self.resize(self.sizeHint())
+
+    def sizeHint(self):
+        self.ensurePolished()
+        width = self.style().pixelMetric(QStyle.PixelMetric.PM_TabCloseIndicatorWidth, None, self)
+        height = self.style().pixelMetric(QStyle.PixelMetric.PM_TabCloseIndicatorHeight, None, self)
+        return QSize(width, height)
+
+    def enterEvent(self, event):
+        self.update()
+        super().enterEvent(event)
+
+    def leaveEvent(self, event):
+        self.update()
+        super().leaveEvent(event)
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        option = QStyleOption()
+        option.initFrom(self)
+        option.state |= QStyle.StateFlag.State_AutoRaise
+        if self.isEnabled() and self.underMouse() and not self.isDown():
+            option.state |= QStyle.StateFlag.State_Raised
+        if self.isDown():
+            option.state |= QStyle.StateFlag.State_Sunken
+        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_IndicatorTabClose, option, painter, self)
+
+
 class FixedWidthTabBar(QTabBar):
+    """Tab bar with tabs of one width and a single close button, on the hovered or the current tab.
+
+    QTabBar's own close buttons are one widget per tab, and adding each lays out all tabs again,
+    so filling the bar with hundreds of tabs took seconds.
+    """
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._closable = False
+        self._close_index = -1
+        self._close_button = TabCloseButton(self)
+        self._close_button.hide()
+        self._close_button.clicked.connect(self._on_close_clicked)
         self.setExpanding(False)  # Don't expand tabs to fill the tab bar
         self.setElideMode(Qt.TextElideMode.ElideRight)  # Add ellipsis for text that doesn't fit
+        self.setMouseTracking(True)
+        self.currentChanged.connect(lambda index: self._place_close_button())
 
     def tabSizeHint(self, index):
         size = super().tabSizeHint(index)
         size.setWidth(200)  # Set fixed width to 200 pixels (adjust as needed)
         return size
 
+    def setTabsClosable(self, closable):
+        # Not passed on to QTabBar, see the class docstring
+        self._closable = closable
+        self._place_close_button()
+
+    def tabsClosable(self):
+        return self._closable
+
+    def _place_close_button(self, pos=None):
+        if pos is None:
+            pos = self.mapFromGlobal(QCursor.pos())
+        index = self.tabAt(pos) if self._closable else -1
+        if index == -1 and self._closable:
+            index = self.currentIndex()
+        self._close_index = index
+        if index == -1:
+            self._close_button.hide()
+            return
+        rect = self.tabRect(index)
+        size = self._close_button.sizeHint()
+        margin = (rect.height() - size.height()) // 2
+        self._close_button.setGeometry(rect.right() - size.width() - margin, rect.top() + margin,
+                                       size.width(), size.height())
+        self._close_button.show()
+        self._close_button.raise_()
+
+    def _on_close_clicked(self):
+        if self._close_index != -1:
+            self.tabCloseRequested.emit(self._close_index)
+
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        self._place_close_button(event.position().toPoint())
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self._place_close_button()
+
+    def tabLayoutChange(self):
+        super().tabLayoutChange()
+        self._place_close_button()
+
+class TabWidget(QWidget):
+    """Tab container with the QTabWidget API whose tab bar can be detached.
+
+    QTabBar lays out every tab on each change, even while hidden. When the vertical sidebar
+    replaces it the bar is detached and no longer updated, so adding, renaming and switching
+    tabs stops depending on how many tabs are open. Re-attaching only replays what changed,
+    in slices between events, as each tab added to the bar lays out all the others again.
+    """
+    currentChanged = Signal(int)
+    tabCloseRequested = Signal(int)
+    # Emitted after the change, for views that mirror the tabs
+    tab_inserted = Signal(int)
+    tab_removed = Signal(int)
+    tab_changed = Signal(int)
+    # Emitted with the index of the current tab while it is still shown, before another one replaces it
+    current_about_to_change = Signal(int)
+    # Tab index and global position of a context menu request on the tab bar
+    tab_menu_requested = Signal(int, QPoint)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Titles, icons and a key per tab, the key is stored as tab data in the bar
+        self._titles = []
+        self._icons = []
+        self._keys = []
+        self._next_key = 0
+        self._bar = None
+        self._bar_attached = True
+        self._tabs_closable = False
+        # Set while the bar is updated from here, its own signals are ignored then
+        self._syncing = False
+        # Set while the attached bar is still being filled, its indexes don't match the tabs then
+        self._bar_pending = False
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.timeout.connect(self._sync_bar)
+        self._corners = {Qt.Corner.TopLeftCorner: None, Qt.Corner.TopRightCorner: None}
+
+        self._header = QWidget()
+        self._header_layout = QHBoxLayout(self._header)
+        self._header_layout.setContentsMargins(0, 0, 0, 0)
+        self._header_layout.setSpacing(0)
+
+        self._stack = QStackedWidget()
+        self._stack.currentChanged.connect(self._on_stack_changed)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(0)
+        layout.addWidget(self._header)
+        layout.addWidget(self._stack)
+
+        self.setTabBar(QTabBar())
+
+    def setTabBar(self, bar):
+        if self._bar is not None:
+            self._bar.hide()
+            self._bar.deleteLater()
+        self._bar = bar
+        bar.setTabsClosable(self._tabs_closable)
+        bar.currentChanged.connect(self._on_bar_changed)
+        bar.tabCloseRequested.connect(self._on_bar_close_requested)
+        bar.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        bar.customContextMenuRequested.connect(self._on_bar_menu_requested)
+        if self._bar_attached:
+            self._sync_bar()
+        self._rebuild_header()
+
+    def tabBar(self):
+        return self._bar
+
+    def setTabsClosable(self, closable):
+        self._tabs_closable = closable
+        self._bar.setTabsClosable(closable)
+
+    def setCornerWidget(self, widget, corner=Qt.Corner.TopRightCorner):
+        self._corners[corner] = widget
+        self._rebuild_header()
+
+    def cornerWidget(self, corner=Qt.Corner.TopRightCorner):
+        return self._corners.get(corner)
+
+    def is_tab_bar_attached(self):
+        return self._bar_attached
+
+    def set_tab_bar_attached(self, attached):
+        """Show the tab bar and bring it up to date, or hide it and stop updating it"""
+        if attached == self._bar_attached:
+            return
+        self._bar_attached = attached
+        if attached:
+            self._sync_bar()
+        else:
+            self._sync_timer.stop()
+        self._header.setVisible(attached)
+
+    def is_tab_bar_synced(self):
+        """Whether the attached bar shows every tab, it is filled over several event loop turns"""
+        return self._bar_attached and not self._bar_pending
+
+    def _sync_bar(self):
+        """Apply the changes made while the bar was detached, for TAB_BAR_SYNC_SLICE_MS at a time"""
+        if not self._bar_attached:
+            return
+        bar = self._bar
+        deadline = time.perf_counter() + TAB_BAR_SYNC_SLICE_MS / 1000
+        done = True
+        self._syncing = True
+        try:
+            # Tabs are never reordered, so the surviving tabs are in the same order in both
+            keys = set(self._keys)
+            for i in reversed(range(bar.count())):
+                if bar.tabData(i) not in keys:
+                    bar.removeTab(i)
+                    if time.perf_counter() > deadline:
+                        done = False
+                        break
+
+            # With all closed tabs gone the bar holds the first tabs, and maybe some later ones
+            for i, key in enumerate(self._keys if done else ()):
+                if i < bar.count() and bar.tabData(i) == key:
+                    if bar.tabText(i) != self._titles[i]:
+                        bar.setTabText(i, self._titles[i])
+                    if bar.tabIcon(i).cacheKey() != self._icons[i].cacheKey():
+                        bar.setTabIcon(i, self._icons[i])
+                elif time.perf_counter() > deadline:
+                    done = False
+                    break
+                else:
+                    bar.insertTab(i, self._icons[i], self._titles[i])
+                    bar.setTabData(i, key)
+
+            self._bar_pending = not done
+            current = self._bar_index(self._stack.currentIndex())
+            if current != -1:
+                bar.setCurrentIndex(current)
+        finally:
+            self._syncing = False
+        if not done:
+            self._sync_timer.start(0)
+
+    def _bar_index(self, index):
+        """Bar index of a tab, -1 while the bar is filled and doesn't show it yet"""
+        if not self._bar_pending or index == -1:
+            return index
+        key = self._keys[index]
+        for i in range(self._bar.count()):
+            if self._bar.tabData(i) == key:
+                return i
+        return -1
+
+    def _tab_index(self, bar_index):
+        """Tab index of a bar index, -1 for a tab of the bar that was closed while it was detached"""
+        if not self._bar_pending or bar_index == -1:
+            return bar_index
+        try:
+            return self._keys.index(self._bar.tabData(bar_index))
+        except ValueError:
+            return -1
+
+    def _rebuild_header(self):
+        while self._header_layout.count():
+            self._header_layout.takeAt(0)
+        left = self._corners[Qt.Corner.TopLeftCorner]
+        right = self._corners[Qt.Corner.TopRightCorner]
+        if left is not None:
+            self._header_layout.addWidget(left)
+        self._header_layout.addWidget(self._bar, 1)
+        if right is not None:
+            self._header_layout.addWidget(right)
+
+    def addTab(self, widget, *args):
+        return self.insertTab(self.count(), widget, *args)
+
+    def insertTab(self, index, widget, *args):
+        """insertTab(index, widget, label) or insertTab(index, widget, icon, label)"""
+        icon, label = args if len(args) == 2 else (QIcon(), args[0])
+        if index < 0 or index > self.count():
+            index = self.count()
+        key = self._next_key
+        self._next_key += 1
+        self._titles.insert(index, label)
+        self._icons.insert(index, icon)
+        self._keys.insert(index, key)
+        # The stack goes first so a newly selected bar tab always has its widget
+        self._stack.insertWidget(index, widget)
+        if self.is_tab_bar_synced():
+            self._syncing = True
+            try:
+                self._bar.insertTab(index, icon, label)
+                self._bar.setTabData(index, key)
+                self._bar.setCurrentIndex(self._stack.currentIndex())
+            finally:
+                self._syncing = False
+        self.tab_inserted.emit(index)
+        return index
+
+    def removeTab(self, index):
+        if not 0 <= index < self.count():
+            return
+        del self._titles[index]
+        del self._icons[index]
+        del self._keys[index]
+        self._stack.removeWidget(self._stack.widget(index))
+        if self.is_tab_bar_synced():
+            self._syncing = True
+            try:
+                self._bar.removeTab(index)
+                self._bar.setCurrentIndex(self._stack.currentIndex())
+            finally:
+                self._syncing = False
+        self.tab_removed.emit(index)
+
+    def count(self):
+        return self._stack.count()
+
+    def widget(self, index):
+        return self._stack.widget(index)
+
+    def indexOf(self, widget):
+        return self._stack.indexOf(widget)
+
+    def currentIndex(self):
+        return self._stack.currentIndex()
+
+    def currentWidget(self):
+        return self._stack.currentWidget()
+
+    def setCurrentIndex(self, index):
+        self._about_to_change(index)
+        self._stack.setCurrentIndex(index)
+
+    def setCurrentWidget(self, widget):
+        self._about_to_change(self._stack.indexOf(widget))
+        self._stack.setCurrentWidget(widget)
+
+    def _about_to_change(self, index):
+        current = self._stack.currentIndex()
+        if current != -1 and index != current and 0 <= index < self.count():
+            self.current_about_to_change.emit(current)
+
+    def tabText(self, index):
+        return self._titles[index] if 0 <= index < len(self._titles) else ""
+
+    def setTabText(self, index, text):
+        if not 0 <= index < len(self._titles):
+            return
+        self._titles[index] = text
+        if self.is_tab_bar_synced():
+            self._bar.setTabText(index, text)
+        self.tab_changed.emit(index)
+
+    def tabIcon(self, index):
+        return self._icons[index] if 0 <= index < len(self._icons) else QIcon()
+
+    def setTabIcon(self, index, icon):
+        if not 0 <= index < len(self._icons):
+            return
+        self._icons[index] = icon
+        if self.is_tab_bar_synced():
+            self._bar.setTabIcon(index, icon)
+        self.tab_changed.emit(index)
+
+    def _on_stack_changed(self, index):
+        if self._bar_attached and not self._syncing:
+            self._syncing = True
+            try:
+                self._bar.setCurrentIndex(self._bar_index(index))
+            finally:
+                self._syncing = False
+        self.currentChanged.emit(index)
+
+    def _on_bar_changed(self, index):
+        if not self._syncing:
+            index = self._tab_index(index)
+            if index != -1:
+                self._about_to_change(index)
+                self._stack.setCurrentIndex(index)
+
+    def _on_bar_close_requested(self, index):
+        index = self._tab_index(index)
+        if self._bar_attached and index != -1:
+            self.tabCloseRequested.emit(index)
+
+    def _on_bar_menu_requested(self, pos):
+        index = self._tab_index(self._bar.tabAt(pos))
+        if self._bar_attached and index != -1:
+            self.tab_menu_requested.emit(index, self._bar.mapToGlobal(pos))
+
+
+class CrashPlaceholder(QWidget):
+    """Lightweight stand-in shown while a crashed or hung tab is being recovered"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QVBoxLayout(self)
+        layout.setAlignment(Qt.AlignCenter)
+
+        self.message_label = QLabel()
+        self.message_label.setAlignment(Qt.AlignCenter)
+        self.message_label.setWordWrap(True)
+
+        self.reload_button = QPushButton("Reload Now")
+        self.reload_button.setMaximumWidth(160)
+
+        layout.addWidget(self.message_label)
+        layout.addWidget(self.reload_button, alignment=Qt.AlignCenter)
+
+    def set_message(self, message):
+        self.message_label.setText(message)
+
+
+class ResizeSnapshot(QWidget):
+    """Paints a cached image of the page while the window is being resized"""
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        self.pixmap = QPixmap()
+        self.background = QColor("#191A1A")
+        self.frame_times = []
+        self.scaled = False
+
+    def set_snapshot(self, pixmap, background, scaled=False):
+        self.pixmap = pixmap
+        self.background = background
+        self.frame_times = []
+        # A thumbnail is stretched to the width of the tab instead of drawn at its own size
+        self.scaled = scaled
+
+    def paintEvent(self, event):
+        self.frame_times.append(time.perf_counter())
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), self.background)
+        if self.scaled and self.pixmap.width():
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            height = self.pixmap.height() * self.width() // self.pixmap.width()
+            painter.drawPixmap(0, 0, self.width(), height, self.pixmap)
+        else:
+            painter.drawPixmap(0, 0, self.pixmap)
+
+
+class PageView(QObject):
+    """Stands in for a tab's web view when its window shows all tabs in one shared QWebEngineView.
+
+    Has the parts of the QWebEngineView API the managers use, backed by the tab's page, and
+    re-emits the page's signals so connections survive page replacement as with a real view.
+    """
+    titleChanged = Signal(str)
+    urlChanged = Signal(QUrl)
+    iconChanged = Signal(QIcon)
+    loadStarted = Signal()
+    loadProgress = Signal(int)
+    loadFinished = Signal(bool)
+    renderProcessTerminated = Signal(object, int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._page = None
+        self._page_connections = []
+        # The shared view while it shows this page
+        self.view = None
+
+    def page(self):
+        return self._page
+
+    def setPage(self, page):
+        for signal, slot in self._page_connections:
+            signal.disconnect(slot)
+        self._page = page
+        self._page_connections = [
+            (page.titleChanged, self.titleChanged.emit),
+            (page.urlChanged, self.urlChanged.emit),
+            (page.iconChanged, self.iconChanged.emit),
+            (page.loadStarted, self.loadStarted.emit),
+            (page.loadProgress, self.loadProgress.emit),
+            (page.loadFinished, self.loadFinished.emit),
+            (page.renderProcessTerminated, self.renderProcessTerminated.emit),
+        ]
+        for signal, slot in self._page_connections:
+            signal.connect(slot)
+        if self.view is not None:
+            self.view.setPage(page)
+
+    def attach_view(self, view):
+        self.view = view
+        view.setPage(self._page)
+
+    def detach_view(self):
+        self.view = None
+        self._page.setVisible(False)
+
+    def url(self):
+        return self._page.url()
+
+    def setUrl(self, url):
+        self._page.setUrl(url)
+
+    def title(self):
+        return self._page.title()
+
+    def icon(self):
+        return self._page.icon()
+
+    def reload(self):
+        self._page.triggerAction(QWebEnginePage.WebAction.Reload)
+
+    def isVisible(self):
+        return self.view is not None and self.view.isVisible()
+
+    def grab(self):
+        return self.view.grab() if self.view is not None else QPixmap()
+
+    def setStyleSheet(self, stylesheet):
+        # The shared view is styled by its window
+        pass
+
+
 class BrowserTab(QWidget):
-    def __init__(self, profile, parent=None):
+    reload_requested = Signal()
+    # Emitted after the web view got a different page, before that page loads anything
+    page_replaced = Signal()
+
+    def __init__(self, profile, parent=None, shared_view=False):
         super().__init__(parent)
+        self.profile = profile
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
 
-        self.webview = QWebEngineView()
+        if shared_view:
+            # Only a page and an empty area the window moves its web view into when the tab is shown
+            self.webview = PageView(self)
+            self.page_area = QWidget()
+            page_layout = QVBoxLayout(self.page_area)
+            page_layout.setContentsMargins(0, 0, 0, 0)
+        else:
+            self.webview = QWebEngineView()
+            self.page_area = self.webview
+        self.shared_view = shared_view
         page = QWebEnginePage(profile, self.webview)
         self.webview.setPage(page)
-        self.webview.setUrl(QUrl("https://www.perplexity.ai"))
+        self.webview.setUrl(QUrl(HOME_URL))
         self.webview.setStyleSheet("background-color: #191A1A;")
-        layout.addWidget(self.webview)
+
+        # The placeholder shares the tab area with the web view and is only created on first use
+        self.stack = QStackedLayout()
+        self.stack.addWidget(self.page_area)
+        self.crash_placeholder = None
+        self.resize_snapshot = None
+        self.thumbnail_placeholder = None
+        self.resizing = False
+        layout.addLayout(self.stack)
+
+        # Used by the memory pressure monitor to pick the least recently used tab
+        self.last_active = time.monotonic()
 
         logger.info("New browser tab created")
+
+    def mark_active(self):
+        """Record the activation and wake the page if it was frozen or discarded"""
+        self.last_active = time.monotonic()
+        page = self.webview.page()
+        if page.lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+
+    def freeze(self):
+        """Suspend the page's scripts and timers, returns True if the state changed"""
+        page = self.webview.page()
+        if page.isVisible() or page.lifecycleState() != QWebEnginePage.LifecycleState.Active:
+            return False
+        page.setLifecycleState(QWebEnginePage.LifecycleState.Frozen)
+        return True
+
+    def discard(self):
+        """Release the page's renderer memory, the page reloads when it becomes active again"""
+        page = self.webview.page()
+        if page.isVisible() or self.is_discarded():
+            return False
+        page.setLifecycleState(QWebEnginePage.LifecycleState.Discarded)
+        return True
+
+    def is_discarded(self):
+        return self.webview.page().lifecycleState() == QWebEnginePage.LifecycleState.Discarded
+
+    def show_placeholder(self, message):
+        if self.crash_placeholder is None:
+            self.crash_placeholder = CrashPlaceholder()
+            self.crash_placeholder.reload_button.clicked.connect(self.reload_requested)
+            self.stack.addWidget(self.crash_placeholder)
+        self.crash_placeholder.set_message(message)
+        self.stack.setCurrentWidget(self.crash_placeholder)
+
+    def show_webview(self):
+        self.stack.setCurrentWidget(self.page_area)
+
+    def show_in_view(self, view):
+        """Shared view mode, move the window's web view into this tab and show the tab's page in it"""
+        self.page_area.layout().addWidget(view)
+        # Reparenting hides a widget
+        view.show()
+        self.webview.attach_view(view)
+
+    def show_thumbnail(self, pixmap):
+        """Cover the page with its last thumbnail until it has loaded again"""
+        if self.resizing or self.stack.currentWidget() is not self.page_area:
+            return
+        if self.thumbnail_placeholder is None:
+            self.thumbnail_placeholder = ResizeSnapshot()
+            self.stack.addWidget(self.thumbnail_placeholder)
+        self.thumbnail_placeholder.set_snapshot(pixmap, QColor("#191A1A"), scaled=True)
+        self.stack.setCurrentWidget(self.thumbnail_placeholder)
+
+    def hide_thumbnail(self):
+        if self.thumbnail_placeholder is not None and self.stack.currentWidget() is self.thumbnail_placeholder:
+            self.stack.setCurrentWidget(self.page_area)
+
+    def begin_resize(self, background):
+        """Show a snapshot of the page and stop passing geometry changes to the web view"""
+        if self.resizing:
+            return True
+        current = self.stack.currentWidget()
+        if current is not self.page_area and current is not self.resize_snapshot:
+            return False
+        if self.resize_snapshot is None:
+            self.resize_snapshot = ResizeSnapshot()
+            self.stack.addWidget(self.resize_snapshot)
+        if current is self.page_area:
+            self.resize_snapshot.set_snapshot(self.webview.grab(), background)
+        else:
+            # A new drag started while the previous one was still being revealed
+            self.resize_snapshot.frame_times = []
+        self.resizing = True
+        # Only the current widget of a StackOne layout receives geometry updates
+        self.stack.setStackingMode(QStackedLayout.StackingMode.StackOne)
+        self.stack.setCurrentWidget(self.resize_snapshot)
+        return True
+
+    def end_resize(self):
+        """Commit the final geometry to the web view, returns the snapshot's frame timestamps"""
+        if not self.resizing:
+            return []
+        self.resizing = False
+        # StackAll shows and resizes the web view while the raised snapshot still covers it
+        self.stack.setStackingMode(QStackedLayout.StackingMode.StackAll)
+        QTimer.singleShot(SNAPSHOT_REVEAL_DELAY_MS, self._reveal_webview)
+        return self.resize_snapshot.frame_times
+
+    def _reveal_webview(self):
+        if self.resizing or self.stack.currentWidget() is not self.resize_snapshot:
+            return
+        self.stack.setStackingMode(QStackedLayout.StackingMode.StackOne)
+        self.stack.setCurrentWidget(self.page_area)
+
+    def reset_page(self):
+        """Replace a hung page with a fresh one on the same profile and reload its URL"""
+        url = self.webview.url()
+        old_page = self.webview.page()
+        self.webview.setPage(QWebEnginePage(self.profile, self.webview))
+        old_page.deleteLater()
+        self.page_replaced.emit()
+        self.webview.setUrl(url)
+
+    def adopt_page(self, page):
+        """Show a page loaded elsewhere, such as a prerender, in place of the current one"""
+        old_page = self.webview.page()
+        page.setParent(self.webview)
+        self.webview.setPage(page)
+        old_page.deleteLater()
+        self.page_replaced.emit()
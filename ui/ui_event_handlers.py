@@ -13,6 +13,11 @@ class UIEventHandlers:
             self.browser_window.tabs.setTabText(index, title)
         logger.info(f"Tab {index} title updated to {title}")
 
+    def update_tab_icon(self, icon, tab):
+        index = self.browser_window.tabs.indexOf(tab)
+        if index != -1:
+            self.browser_window.tabs.setTabIcon(index, icon)
+
     def load_started(self):
         self.browser_window.progressbar.setValue(0)
         self.browser_window.progressbar.show()
@@ -0,0 +1,71 @@
+"""Icons and logo images from the compiled resource bundle, with one shared QIcon per name.
+
+The bundle holds every icon pre-scaled, so a QIcon only decodes the size that is painted.
+Without resources/resources_rc.py, built by resources/build_resources.py, the full-size
+files in icons/final are used instead.
+"""
+import os
+import logging
+from PySide6.QtCore import QFile
+from PySide6.QtGui import QIcon, QPixmap
+
+logger = logging.getLogger(__name__)
+
+try:
+    import resources.resources_rc  # noqa: F401, registers the :/searchtabs resources
+    RESOURCES_AVAILABLE = True
+except ImportError:
+    RESOURCES_AVAILABLE = False
+    logger.warning("Compiled resources not found, loading icons from icons/final")
+
+RESOURCE_ROOT = ":/searchtabs"
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons", "final")
+
+BUTTON_SIZES = (16, 24, 32, 48)
+LOGO_SIZES = (16, 24, 32, 48, 50, 64, 100, 128, 256)
+
+_icons = {}
+
+
+def _source_path(file_name):
+    return os.path.join(SOURCE_DIR, file_name)
+
+
+def icon(name):
+    """Shared QIcon for one of the button icons, by its file name without extension"""
+    cached = _icons.get(name)
+    if cached is not None:
+        return cached
+    cached = QIcon()
+    if RESOURCES_AVAILABLE and QFile.exists(f"{RESOURCE_ROOT}/icons/{name}/16.png"):
+        # Files are only read when a size is first painted
+        for size in BUTTON_SIZES:
+            cached.addFile(f"{RESOURCE_ROOT}/icons/{name}/{size}.png")
+    else:
+        cached.addFile(_source_path(f"{name}.png"))
+    _icons[name] = cached
+    return cached
+
+
+def app_icon():
+    cached = _icons.get("logo")
+    if cached is None:
+        cached = QIcon()
+        if RESOURCES_AVAILABLE:
+            for size in LOGO_SIZES:
+                cached.addFile(f"{RESOURCE_ROOT}/logo/{size}.png")
+        else:
+            cached.addFile(_source_path("logo_s.png"))
+        _icons["logo"] = cached
+    return cached
+
+
+def logo_pixmap(size):
+    """The logo at size logical pixels, pre-scaled when the bundle has that size"""
+    return app_icon().pixmap(size)
+
+
+def splash_pixmap():
+    if RESOURCES_AVAILABLE:
+        return QPixmap(f"{RESOURCE_ROOT}/splash.png")
+    return QPixmap(_source_path("logo_s.png"))
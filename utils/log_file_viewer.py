@@ -0,0 +1,309 @@
+import os
+import re
+import mmap
+import logging
+from array import array
+from datetime import datetime
+from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView, QPushButton, QCheckBox,
+                               QLineEdit, QLabel)
+from PySide6.QtCore import Qt, QTimer, QObject, Signal, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QFont, QColor, QPalette
+from utils import qt_async
+
+logger = logging.getLogger(__name__)
+
+# Bytes indexed between reports to the view
+INDEX_CHUNK = 8 * 1024 * 1024
+TAIL_INTERVAL_MS = 1000
+# Lines after a line without a timestamp, such as a traceback, that are checked for one
+TIMESTAMP_SCAN_LINES = 1000
+# Lines start with the asctime of utils.logger, which sorts the same as text
+TIMESTAMP = re.compile(rb"\d{4}-\d\d-\d\d \d\d:\d\d:\d\d")
+TIMESTAMP_LENGTH = 19
+
+LEVEL_COLORS = {
+    b" - DEBUG - ": QColor(150, 150, 150),
+    b" - WARNING - ": QColor(255, 200, 0),
+    b" - ERROR - ": QColor(255, 100, 100),
+    b" - CRITICAL - ": QColor(255, 50, 255),
+}
+TEXT_COLOR = QColor(220, 220, 220)
+
+
+def _index_chunk(mm, start, end):
+    """Runs on the worker pool, the start offsets of the lines that begin after a newline in the range"""
+    offsets = array('q')
+    find = mm.find
+    newline = find(b"\n", start, end)
+    while newline != -1:
+        offsets.append(newline + 1)
+        newline = find(b"\n", newline + 1, end)
+    return offsets
+
+
+class MappedLogFile(QObject):
+    """A log file mapped into memory with a line offset index that is built on the worker pool"""
+    # Emitted for each chunk with the generation, the line start offsets found and the offset indexed to
+    indexed = Signal(int, object, int)
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.file = open(path, "rb")
+        self.mm = None
+        self.size = 0
+        # Start offset of every line, the last one may be an unfinished line
+        self.starts = array('q', [0])
+        self.indexed_to = 0
+        self.building = False
+        self.generation = 0
+        self.remap()
+
+    def remap(self):
+        """Map the file at its current size, returns False when it is empty"""
+        size = os.fstat(self.file.fileno()).st_size
+        if size == 0:
+            return False
+        # A mapping can't grow, the old one stays valid for the index task until it is done with it
+        self.mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.size = size
+        return True
+
+    def line_count(self):
+        return len(self.starts) if self.indexed_to > self.starts[-1] else len(self.starts) - 1
+
+    def line(self, row):
+        """Decode one line, the only place file content becomes text"""
+        start = self.starts[row]
+        end = self.starts[row + 1] if row + 1 < len(self.starts) else self.indexed_to
+        return self.mm[start:end].decode("utf-8", "replace").rstrip("\r\n")
+
+    def raw_line(self, row, length):
+        return self.mm[self.starts[row]:self.starts[row] + length]
+
+    def index(self):
+        """Index the mapped bytes beyond what has been indexed so far, in the background"""
+        if self.building or self.mm is None or self.indexed_to >= self.size:
+            return
+        self.building = True
+        qt_async.spawn(self._index(self.generation, self.mm, self.indexed_to, self.size), name="Index log file")
+
+    async def _index(self, generation, mm, start, end):
+        pos = start
+        try:
+            while pos < end and generation == self.generation:
+                chunk_end = min(pos + INDEX_CHUNK, end)
+                offsets = await qt_async.run_blocking(_index_chunk, mm, pos, chunk_end)
+                # The file was closed while the chunk was indexed
+                if generation != self.generation:
+                    return
+                self.indexed.emit(generation, offsets, chunk_end)
+                pos = chunk_end
+        except ValueError:
+            # The mapping was closed
+            pass
+
+    def add_index(self, offsets, indexed_to):
+        """Called for each chunk the index task reports"""
+        self.starts.extend(offsets)
+        self.indexed_to = indexed_to
+        if indexed_to >= self.size:
+            self.building = False
+
+    def rotated(self):
+        """True when the path now names another file, as after log rotation"""
+        try:
+            return os.stat(self.path).st_ino != os.fstat(self.file.fileno()).st_ino
+        except OSError:
+            return False
+
+    def timestamp(self, row):
+        """Timestamp of the line or the first following line that has one"""
+        for candidate in range(row, min(row + TIMESTAMP_SCAN_LINES, self.line_count())):
+            text = self.raw_line(candidate, TIMESTAMP_LENGTH)
+            if TIMESTAMP.match(text):
+                return text
+        return None
+
+    def last_timestamp(self):
+        count = self.line_count()
+        for row in range(count - 1, max(count - TIMESTAMP_SCAN_LINES, 0) - 1, -1):
+            text = self.raw_line(row, TIMESTAMP_LENGTH)
+            if TIMESTAMP.match(text):
+                return text
+        return None
+
+    def find_time(self, target):
+        """Binary search for the first line at or after target, a "YYYY-MM-DD HH:MM:SS" prefix"""
+        low, high = 0, self.line_count()
+        while low < high:
+            middle = (low + high) // 2
+            stamp = self.timestamp(middle)
+            if stamp is not None and stamp < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def close(self):
+        self.generation += 1
+        self.file.close()
+
+
+class MappedLogModel(QAbstractListModel):
+    def __init__(self, log_file, parent=None):
+        super().__init__(parent)
+        self.log_file = log_file
+        self.rows = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.rows
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self.log_file.line(index.row())
+        if role == Qt.ForegroundRole:
+            head = self.log_file.raw_line(index.row(), 80)
+            for marker, color in LEVEL_COLORS.items():
+                if marker in head:
+                    return color
+            return TEXT_COLOR
+        return None
+
+    def sync(self):
+        """Pick up lines indexed since the last call"""
+        count = self.log_file.line_count()
+        if self.rows:
+            # The last line may have been unfinished
+            self.dataChanged.emit(self.index(self.rows - 1), self.index(self.rows - 1))
+        if count > self.rows:
+            self.beginInsertRows(QModelIndex(), self.rows, count - 1)
+            self.rows = count
+            self.endInsertRows()
+
+
+class LogFileViewer(QDialog):
+    """Opens log files of any size, lines are read from the mapped file only when shown"""
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"Log File: {os.path.basename(path)}")
+        self.resize(900, 600)
+
+        self.log_file = MappedLogFile(path, self)
+        self.log_file.indexed.connect(self.on_indexed)
+
+        layout = QVBoxLayout(self)
+
+        controls_layout = QHBoxLayout()
+        self.time_input = QLineEdit()
+        self.time_input.setPlaceholderText("Jump to time: YYYY-MM-DD HH:MM[:SS] or HH:MM[:SS]")
+        self.time_input.returnPressed.connect(self.jump_to_time)
+        self.jump_button = QPushButton("Go")
+        self.jump_button.clicked.connect(self.jump_to_time)
+        self.tail_checkbox = QCheckBox("Follow")
+        self.tail_checkbox.toggled.connect(self.set_tail)
+        self.status_label = QLabel()
+        controls_layout.addWidget(self.time_input, 1)
+        controls_layout.addWidget(self.jump_button)
+        controls_layout.addWidget(self.tail_checkbox)
+        controls_layout.addWidget(self.status_label)
+        layout.addLayout(controls_layout)
+
+        self.model = MappedLogModel(self.log_file, self)
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setFont(QFont("Courier New", 10))
+        self.view.setShowGrid(False)
+        self.view.setWordWrap(False)
+        self.view.horizontalHeader().hide()
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.view.verticalHeader().hide()
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.view.verticalHeader().setDefaultSectionSize(self.view.fontMetrics().height() + 2)
+        palette = self.view.palette()
+        palette.setColor(QPalette.Base, QColor(30, 30, 30))
+        palette.setColor(QPalette.Text, TEXT_COLOR)
+        self.view.setPalette(palette)
+        layout.addWidget(self.view)
+
+        self.tail_timer = QTimer(self)
+        self.tail_timer.timeout.connect(self.check_growth)
+
+        self.log_file.index()
+        self._update_status()
+
+    def on_indexed(self, generation, offsets, indexed_to):
+        if generation != self.log_file.generation:
+            return
+        self.log_file.add_index(offsets, indexed_to)
+        self.model.sync()
+        self._update_status()
+        if self.tail_checkbox.isChecked():
+            self.view.scrollToBottom()
+
+    def _update_status(self):
+        log_file = self.log_file
+        state = f", indexing {100 * log_file.indexed_to // log_file.size}%" if log_file.building else ""
+        self.status_label.setText(f"{log_file.line_count():,} lines, {log_file.size / 1024 ** 2:.1f} MB{state}")
+
+    def set_tail(self, enabled):
+        if enabled:
+            self.tail_timer.start(TAIL_INTERVAL_MS)
+            self.check_growth()
+            self.view.scrollToBottom()
+        else:
+            self.tail_timer.stop()
+
+    def check_growth(self):
+        log_file = self.log_file
+        if log_file.building:
+            return
+        if log_file.rotated():
+            self.reopen()
+            return
+        if os.fstat(log_file.file.fileno()).st_size > log_file.size and log_file.remap():
+            log_file.index()
+
+    def reopen(self):
+        """Start over on the new file once the old one was rotated away"""
+        self.log_file.close()
+        self.model.beginResetModel()
+        self.log_file = MappedLogFile(self.log_file.path, self)
+        self.log_file.indexed.connect(self.on_indexed)
+        self.model.log_file = self.log_file
+        self.model.rows = 0
+        self.model.endResetModel()
+        self.log_file.index()
+        logger.info(f"Log file {self.log_file.path} was rotated, reopened")
+
+    def jump_to_time(self):
+        text = self.time_input.text().strip()
+        target = None
+        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%H:%M:%S", "%H:%M"):
+            try:
+                parsed = datetime.strptime(text, fmt)
+            except ValueError:
+                continue
+            target = parsed.strftime("%Y-%m-%d %H:%M:%S" if "%Y" in fmt else "%H:%M:%S")
+            break
+        rows = self.log_file.line_count()
+        if target is None or not rows:
+            self.time_input.setStyleSheet("color: rgb(255, 100, 100);")
+            return
+        self.time_input.setStyleSheet("")
+        if len(target) < TIMESTAMP_LENGTH:
+            # A time of day refers to the date of the last line
+            last = self.log_file.last_timestamp() or b""
+            target = last[:11].decode("ascii", "replace") + target
+        row = min(self.log_file.find_time(target.encode("ascii")), rows - 1)
+        self.tail_checkbox.setChecked(False)
+        self.view.scrollTo(self.model.index(row), QTableView.PositionAtTop)
+        self.view.selectRow(row)
+
+    def done(self, result):
+        # Closing, Escape and reject all end here
+        self.tail_timer.stop()
+        self.log_file.close()
+        super().done(result)
@@ -1,37 +1,265 @@
+import os
+import re
 import sys
 import time
+import bisect
 import logging
-from PySide6.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout, 
-                              QTextEdit, QPushButton, QCheckBox, QFileDialog)
-from PySide6.QtCore import Qt, QTimer
-from PySide6.QtGui import QFont, QColor, QTextCursor, QPalette
+import threading
+from array import array
+from itertools import compress
+from PySide6.QtWidgets import (QApplication, QDialog, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView,
+                               QPushButton, QCheckBox, QFileDialog, QComboBox, QLineEdit, QLabel)
+from PySide6.QtCore import Qt, QTimer, QObject, Signal, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QFont, QColor, QPalette
+from utils import qt_async
+from utils.log_file_viewer import LogFileViewer
+
+# Oldest records are overwritten beyond this
+MAX_RECORDS = 1000000
+# Loggers are stored as one byte, any beyond the first 255 share the last id
+OTHER_LOGGER = 255
+REFRESH_INTERVAL_MS = 100
+SEARCH_DELAY_MS = 250
+# Records the search worker checks between reports to the view
+SEARCH_CHUNK = 20000
+
+LEVELS = [("All levels", 0), ("DEBUG", logging.DEBUG), ("INFO", logging.INFO), ("WARNING", logging.WARNING),
+          ("ERROR", logging.ERROR), ("CRITICAL", logging.CRITICAL)]
+
+# Colors for the log levels on the dark background
+LEVEL_COLORS = {
+    logging.DEBUG: QColor(150, 150, 150),    # Light Gray
+    logging.INFO: QColor(220, 220, 220),     # White
+    logging.WARNING: QColor(255, 200, 0),    # Yellow
+    logging.ERROR: QColor(255, 100, 100),    # Light Red
+    logging.CRITICAL: QColor(255, 50, 255)   # Pink
+}
+
+
+class LogRecordStore:
+    """Log records in fixed-size columns, the oldest are overwritten once it is full
+
+    Records are addressed by sequence number, record n is in slot n % capacity.
+    """
+    def __init__(self, capacity=MAX_RECORDS):
+        self.capacity = capacity
+        self.created = array('d', bytes(8 * capacity))
+        self.levels = bytearray(capacity)
+        self.loggers = bytearray(capacity)
+        self.messages = [None] * capacity
+        self.logger_names = []
+        self._logger_ids = {}
+        # Sequence number of the next record
+        self.count = 0
+        self.lock = threading.Lock()
+
+    @property
+    def first(self):
+        """Sequence number of the oldest record still stored"""
+        return max(0, self.count - self.capacity)
+
+    def append(self, created, levelno, name, message):
+        # Called from whichever thread logged the record
+        with self.lock:
+            logger_id = self._logger_ids.get(name)
+            if logger_id is None:
+                logger_id = min(len(self.logger_names), OTHER_LOGGER)
+                if logger_id < OTHER_LOGGER:
+                    self.logger_names.append(name)
+                self._logger_ids[name] = logger_id
+            slot = self.count % self.capacity
+            self.created[slot] = created
+            self.levels[slot] = min(levelno, 255)
+            self.loggers[slot] = logger_id
+            self.messages[slot] = message
+            self.count += 1
+
+    def clear(self):
+        with self.lock:
+            self.messages = [None] * self.capacity
+            self.count = 0
+
+    def logger_name(self, seq):
+        logger_id = self.loggers[seq % self.capacity]
+        return self.logger_names[logger_id] if logger_id < OTHER_LOGGER else "other"
+
+    def message(self, seq):
+        return self.messages[seq % self.capacity]
+
+    def level(self, seq):
+        return self.levels[seq % self.capacity]
+
+    def format(self, seq):
+        slot = seq % self.capacity
+        created = self.created[slot]
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(created))
+        return (f"{timestamp},{int(created % 1 * 1000):03d} - {self.logger_name(seq)} - "
+                f"{logging.getLevelName(self.levels[slot])} - {self.messages[slot]}")
+
+    def _column(self, column, start, end):
+        # Bytes of a column from sequence number start to end, which may wrap around the ring
+        length = end - start
+        offset = start % self.capacity
+        if offset + length <= self.capacity:
+            return bytes(column[offset:offset + length])
+        return bytes(column[offset:]) + bytes(column[:length - (self.capacity - offset)])
+
+    def matching(self, start, end, level_table, logger_table):
+        """Sequence numbers from start to end whose level and logger pass the translate tables"""
+        if end <= start:
+            return array('q')
+        # Both columns are mapped to 0 or 1 per record and combined in a single big-int AND
+        levels = self._column(self.levels, start, end).translate(level_table)
+        loggers = self._column(self.loggers, start, end).translate(logger_table)
+        mask = (int.from_bytes(levels, "little") & int.from_bytes(loggers, "little")).to_bytes(end - start, "little")
+        return array('q', compress(range(start, end), mask))
+
+
+class LogListModel(QAbstractListModel):
+    """Rows of the view are sequence numbers into the store, only visible rows are formatted"""
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.rows = array('q')
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        seq = self.rows[index.row()]
+        if seq < self.store.first:
+            return None
+        if role == Qt.DisplayRole:
+            return self.store.format(seq).split("\n", 1)[0]
+        if role == Qt.ForegroundRole:
+            return LEVEL_COLORS.get(self.store.level(seq), LEVEL_COLORS[logging.INFO])
+        if role == Qt.ToolTipRole:
+            message = self.store.message(seq)
+            return message if "\n" in message else None
+        return None
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(rows) - 1)
+        self.rows.extend(rows)
+        self.endInsertRows()
+
+    def trim(self, first):
+        """Drop rows of records that have been overwritten"""
+        count = bisect.bisect_left(self.rows, first)
+        if count:
+            self.beginRemoveRows(QModelIndex(), 0, count - 1)
+            del self.rows[:count]
+            self.endRemoveRows()
+
+
+def _search_chunk(search, messages, capacity, chunk):
+    """Runs on the worker pool, the sequence numbers of the chunk whose message matches"""
+    return array('q', (seq for seq in chunk if search(messages[seq % capacity] or "")))
+
+
+class LogSearch(QObject):
+    """Runs a regex over a snapshot of rows on the worker pool and reports matches in chunks"""
+    # generation, matching sequence numbers, rows searched so far, rows in total
+    progress = Signal(int, object, int, int)
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.generation = 0
+        self.task = None
+
+    def start(self, pattern, rows):
+        self.cancel()
+        self.task = qt_async.spawn(self._run(self.generation, pattern, rows), name="Log search")
+        return self.generation
+
+    def cancel(self):
+        self.generation += 1
+        if self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def _run(self, generation, pattern, rows):
+        total = len(rows)
+        # One chunk per round trip, so the GUI thread takes the GIL between chunks
+        for start in range(0, max(total, 1), SEARCH_CHUNK):
+            chunk = rows[start:start + SEARCH_CHUNK]
+            matches = await qt_async.run_blocking(_search_chunk, pattern.search, self.store.messages,
+                                                  self.store.capacity, chunk)
+            if generation != self.generation:
+                # Another search started while this chunk was searched
+                return
+            self.progress.emit(generation, matches, min(start + SEARCH_CHUNK, total), total)
+
 
 class LogHandler(logging.Handler):
-    """Custom logging handler that sends logs to the terminal window"""
-    def __init__(self, callback):
+    """Logging handler that stores records for the terminal window"""
+    def __init__(self, store):
         super().__init__()
-        self.callback = callback
-        
+        self.store = store
+
     def emit(self, record):
-        log_entry = self.format(record)
-        self.callback(log_entry, record.levelno)
+        try:
+            message = record.getMessage()
+            if record.exc_info and not record.exc_text:
+                record.exc_text = logging.Formatter().formatException(record.exc_info)
+            if record.exc_text:
+                message = f"{message}\n{record.exc_text}"
+            self.store.append(record.created, record.levelno, record.name, message)
+        except Exception:
+            self.handleError(record)
+
+
+def write_records(path, store, rows):
+    """Write records one line at a time, the buffer is never joined into a single string"""
+    with open(path, 'w', encoding='utf-8') as f:
+        for seq in rows:
+            if seq >= store.first:
+                f.write(store.format(seq) + "\n")
+
 
 class LogTerminal(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Application Log Terminal")
         self.resize(800, 500)
-        
+
         # Store original window flags
         self.original_flags = self.windowFlags()
-        
+
+        self.store = LogRecordStore()
+        # Sequence number up to which records have been taken into the view
+        self.seen = 0
+        self.pattern = None
+        self.searching = False
+        self.file_viewers = []
+
         self.init_ui()
-        
+
         # Set up logging
-        self.log_handler = LogHandler(self.append_log)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        self.log_handler.setFormatter(formatter)
-        
+        self.log_handler = LogHandler(self.store)
+
+        self.search = LogSearch(self.store, self)
+        self.search.progress.connect(self.on_search_progress)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.timeout.connect(self.apply_filters)
+
+        # New records are picked up in batches, so a burst of logging doesn't relayout the view per line
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.take_new_records)
+        self.refresh_timer.start(REFRESH_INTERVAL_MS)
+
         # Center the window relative to parent if provided
         if parent:
             parent_geometry = parent.geometry()
@@ -39,53 +267,89 @@ class LogTerminal(QDialog):
             x = parent_geometry.x() + (parent_geometry.width() - self_size.width()) // 2
             y = parent_geometry.y() + (parent_geometry.height() - self_size.height()) // 2
             self.move(x, y)
-            
+
         # Add initial message
         self.append_log("Log Terminal started", logging.INFO)
-    
+
     def init_ui(self):
         layout = QVBoxLayout(self)
-        
+
         # Controls
         controls_layout = QHBoxLayout()
-        
+
         self.clear_button = QPushButton("Clear")
         self.clear_button.clicked.connect(self.clear_logs)
-        
+
         self.save_button = QPushButton("Save Logs")
         self.save_button.clicked.connect(self.save_logs)
-        
+
+        self.open_file_button = QPushButton("Open Log File")
+        self.open_file_button.clicked.connect(self.open_log_file)
+
         self.autoscroll_checkbox = QCheckBox("Auto-scroll")
         self.autoscroll_checkbox.setChecked(True)
-        
+
         self.always_on_top_button = QPushButton("Always on Top: Off")
         self.always_on_top_button.setCheckable(True)
         self.always_on_top_button.clicked.connect(self.toggle_always_on_top)
-        
+
         controls_layout.addWidget(self.clear_button)
         controls_layout.addWidget(self.save_button)
+        controls_layout.addWidget(self.open_file_button)
         controls_layout.addWidget(self.autoscroll_checkbox)
         controls_layout.addWidget(self.always_on_top_button)
         controls_layout.addStretch()
-        
-        # Log display
-        self.log_display = QTextEdit()
-        self.log_display.setReadOnly(True)
+
+        # Filters
+        filter_layout = QHBoxLayout()
+
+        self.level_combo = QComboBox()
+        for name, level in LEVELS:
+            self.level_combo.addItem(name, level)
+        self.level_combo.currentIndexChanged.connect(self.apply_filters)
+
+        self.logger_combo = QComboBox()
+        self.logger_combo.addItem("All modules", None)
+        self.logger_combo.setMinimumContentsLength(16)
+        self.logger_combo.currentIndexChanged.connect(self.apply_filters)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search (regular expression)")
+        self.search_input.textChanged.connect(lambda: self.search_timer.start(SEARCH_DELAY_MS))
+
+        self.status_label = QLabel()
+
+        filter_layout.addWidget(self.level_combo)
+        filter_layout.addWidget(self.logger_combo)
+        filter_layout.addWidget(self.search_input, 1)
+        filter_layout.addWidget(self.status_label)
+
+        # Log display, rows have a fixed height so only the ones in view are formatted and painted
+        self.model = LogListModel(self.store, self)
+        self.log_display = QTableView()
+        self.log_display.setModel(self.model)
         self.log_display.setFont(QFont("Courier New", 10))
-        self.log_display.setLineWrapMode(QTextEdit.NoWrap)
-        
+        self.log_display.setShowGrid(False)
+        self.log_display.setWordWrap(False)
+        self.log_display.horizontalHeader().hide()
+        self.log_display.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.log_display.verticalHeader().hide()
+        self.log_display.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.log_display.verticalHeader().setDefaultSectionSize(self.log_display.fontMetrics().height() + 2)
+
         # Set dark background with white text
         palette = self.log_display.palette()
         palette.setColor(QPalette.Base, QColor(30, 30, 30))  # Dark background
         palette.setColor(QPalette.Text, QColor(220, 220, 220))  # Light gray text
         self.log_display.setPalette(palette)
-        
+
         # Add widgets to layout
         layout.addLayout(controls_layout)
+        layout.addLayout(filter_layout)
         layout.addWidget(self.log_display)
-        
+
         self.setLayout(layout)
-    
+
     def toggle_always_on_top(self):
         """Toggle the always-on-top state of the window"""
         # Store current position and size
@@ -113,88 +377,171 @@ class LogTerminal(QDialog):
             self.append_log("Terminal no longer always on top", logging.INFO)
     
     def append_log(self, message, level=logging.INFO):
-        """Add a log message to the display with appropriate color"""
-        # Define colors for different log levels (on dark background)
-        colors = {
-            logging.DEBUG: QColor(150, 150, 150),    # Light Gray
-            logging.INFO: QColor(220, 220, 220),     # White
-            logging.WARNING: QColor(255, 200, 0),    # Yellow
-            logging.ERROR: QColor(255, 100, 100),    # Light Red
-            logging.CRITICAL: QColor(255, 50, 255)   # Pink
-        }
-        
-        # Get the color for this log level
-        color = colors.get(level, QColor(220, 220, 220))
-        
-        # Set text color
-        self.log_display.setTextColor(color)
-        
-        # Add the log message
-        self.log_display.append(message)
-        
+        """Add a message of the terminal itself to the log"""
+        self.store.append(time.time(), level, "LogTerminal", message)
+
+    def _filter_tables(self):
+        # Translate tables mapping a stored level or logger id to 1 if it passes the filters
+        min_level = self.level_combo.currentData() or 0
+        level_table = bytes(1 if level >= min_level else 0 for level in range(256))
+        logger_id = self.logger_combo.currentData()
+        logger_table = bytes(1 if logger_id is None or i == logger_id else 0 for i in range(256))
+        return level_table, logger_table
+
+    def _update_logger_combo(self):
+        names = self.store.logger_names
+        if self.logger_combo.count() - 1 >= len(names):
+            return
+        for logger_id in range(self.logger_combo.count() - 1, len(names)):
+            self.logger_combo.addItem(names[logger_id], logger_id)
+
+    def apply_filters(self):
+        """Rebuild the view for the current level, module and search filters"""
+        self.search.cancel()
+        self.searching = False
+        pattern_text = self.search_input.text()
+        try:
+            self.pattern = re.compile(pattern_text, re.IGNORECASE) if pattern_text else None
+            self.search_input.setStyleSheet("")
+        except re.error:
+            self.pattern = None
+            self.search_input.setStyleSheet("color: rgb(255, 100, 100);")
+
+        self.seen = self.store.count
+        rows = self.store.matching(self.store.first, self.seen, *self._filter_tables())
+        if self.pattern is None:
+            self.model.set_rows(rows)
+            self._update_status()
+        else:
+            # Matches are added while the worker goes through the filtered records
+            self.model.set_rows(array('q'))
+            self.searching = True
+            self.search.start(self.pattern, rows)
+        self._scroll()
+
+    def on_search_progress(self, generation, matches, searched, total):
+        if generation != self.search.generation:
+            return
+        self.model.append_rows(matches)
+        if searched >= total:
+            self.searching = False
+            self._update_status()
+            # Records logged during the search are added in order now
+            self.take_new_records()
+        else:
+            self.status_label.setText(f"Searching {100 * searched // total}%")
+        self._scroll()
+
+    def take_new_records(self):
+        count = self.store.count
+        if count == self.seen or self.searching:
+            return
+        if count < self.seen:
+            # Cleared
+            self.seen = 0
+        self._update_logger_combo()
+        first = self.store.first
+        self.model.trim(first)
+        rows = self.store.matching(max(self.seen, first), count, *self._filter_tables())
+        if self.pattern is not None:
+            search = self.pattern.search
+            rows = array('q', (seq for seq in rows if search(self.store.message(seq) or "")))
+        self.seen = count
+        self.model.append_rows(rows)
+        self._update_status()
+        self._scroll()
+
+    def _update_status(self):
+        self.status_label.setText(f"{len(self.model.rows)} of {self.store.count - self.store.first} records")
+
+    def _scroll(self):
         # Auto-scroll to the bottom if enabled
         if self.autoscroll_checkbox.isChecked():
-            self.log_display.moveCursor(QTextCursor.End)
-    
+            self.log_display.scrollToBottom()
+
     def clear_logs(self):
         """Clear the log display"""
-        self.log_display.clear()
+        self.search.cancel()
+        self.store.clear()
+        self.seen = 0
+        self.searching = False
+        self.model.set_rows(array('q'))
         self.append_log("Logs cleared", logging.INFO)
-    
+
     def save_logs(self):
-        """Save logs to a file"""
+        """Save the records shown in the view to a file"""
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save Logs", "", "Text Files (*.txt);;All Files (*)"
         )
-        
+
+        if filename:
+            qt_async.spawn(self._save(filename, array('q', self.model.rows)), name="Save logs")
+
+    async def _save(self, filename, rows):
+        try:
+            await qt_async.run_blocking(write_records, filename, self.store, rows)
+            self.append_log(f"Logs saved to {filename}", logging.INFO)
+        except Exception as e:
+            self.append_log(f"Error saving logs: {str(e)}", logging.ERROR)
+
+    def open_log_file(self):
+        """Open a log file of any size in a viewer that maps it instead of loading it"""
+        from utils.logger import LOG_PATH
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Open Log File", os.path.abspath(LOG_PATH), "Log Files (*.log *.log.* *.txt);;All Files (*)"
+        )
+
         if filename:
             try:
-                with open(filename, 'w') as f:
-                    f.write(self.log_display.toPlainText())
-                self.append_log(f"Logs saved to {filename}", logging.INFO)
-            except Exception as e:
-                self.append_log(f"Error saving logs: {str(e)}", logging.ERROR)
-    
+                viewer = LogFileViewer(filename)
+            except OSError as e:
+                self.append_log(f"Error opening log file: {str(e)}", logging.ERROR)
+                return
+            viewer.finished.connect(lambda result, viewer=viewer: self.file_viewers.remove(viewer))
+            self.file_viewers.append(viewer)
+            viewer.show()
+
     def get_log_handler(self):
         """Return the log handler for connecting to application loggers"""
         return self.log_handler
-    
+
     def closeEvent(self, event):
         """Handle window close event"""
         # Remove the log handler from any loggers it's attached to
         root_logger = logging.getLogger()
         if self.log_handler in root_logger.handlers:
             root_logger.removeHandler(self.log_handler)
-            
+
         event.accept()
 
 
 # For testing the module independently
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+    qt_async.install()
     terminal = LogTerminal()
-    
+
     # Set up a testxyz logger
     logger = logging.getLogger()
     logger.setLevel(logging.DEBUG)
     logger.addHandler(terminal.get_log_handler())
-    
+
     # Add some testxyz logs
     logger.debug("This is a debug message")
     logger.info("This is an info message")
     logger.warning("This is a warning message")
     logger.error("This is an error message")
     logger.critical("This is a critical message")
-    
+
     # Show the terminal
     terminal.show()
-    
+
     # Add more logs every few seconds
     def add_log():
         logger.info(f"Current time: {time.strftime('%H:%M:%S')}")
-    
+
     timer = QTimer()
     timer.timeout.connect(add_log)
     timer.start(3000)
-    
-    sys.exit(app.exec())
+
+    sys.exit(qt_async.run())
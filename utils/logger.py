@@ -1,12 +1,49 @@
 import logging
+import logging.handlers
+from utils import tracing
+
+LOG_PATH = '../browser_test.log'
+# Rotated during idle time once the log grows past this, older copies are kept as .1 to .3
+MAX_LOG_BYTES = 5 * 1024 * 1024
+LOG_BACKUPS = 3
+
+_file_handler = None
+
+
+class TracedFileHandler(logging.handlers.RotatingFileHandler):
+    """File handler whose flushes show up in performance traces"""
+    def __init__(self, filename):
+        # maxBytes=0 keeps rotation out of the logging call, rotate_log() does it when idle
+        super().__init__(filename, maxBytes=0, backupCount=LOG_BACKUPS)
+
+    def flush(self):
+        with tracing.span("Log flush", "io"):
+            super().flush()
+
+
+def rotate_log():
+    """Start a new log file when the current one is too large"""
+    handler = _file_handler
+    if handler is None or handler.stream is None:
+        return
+    yield
+    handler.acquire()
+    try:
+        if handler.stream.tell() >= MAX_LOG_BYTES:
+            handler.doRollover()
+    finally:
+        handler.release()
+
 
 def setup_logger():
+    global _file_handler
+    _file_handler = TracedFileHandler(LOG_PATH)
     # Set up logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler('../browser_test.log'),
+            _file_handler,
             logging.StreamHandler()
         ]
     )
@@ -0,0 +1,133 @@
+"""asyncio on top of the Qt event loop, so features can be written as coroutines.
+
+install() sets up the loop after the QApplication exists, and run() replaces app.exec().
+Start coroutines with spawn(), which keeps track of them so they are cancelled in one
+place at shutdown. Blocking calls go to a shared thread pool through run_blocking(), and
+Qt callbacks and signals become awaitable through run_javascript() and wait_signal().
+"""
+import time
+import asyncio
+import logging
+import functools
+import concurrent.futures
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtAsyncio import QAsyncioEventLoopPolicy
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_WORKERS = 4
+# Cancelled tasks get this long to run their cleanup before the app exits
+SHUTDOWN_GRACE_SECONDS = 1.0
+
+_loop = None
+_executor = None
+_tasks = set()
+
+
+def install():
+    """Create the asyncio loop for the running QApplication"""
+    global _loop, _executor
+    if _loop is not None:
+        return _loop
+    app = QCoreApplication.instance()
+    # Connected before the loop exists, so tasks are cancelled before the loop closes itself on quit
+    app.aboutToQuit.connect(shutdown)
+    asyncio.set_event_loop_policy(QAsyncioEventLoopPolicy(quit_qapp=True))
+    _loop = asyncio.get_event_loop()
+    _executor = concurrent.futures.ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS,
+                                                      thread_name_prefix="SearchTabsWorker")
+    _loop.set_default_executor(_executor)
+    _loop.set_exception_handler(_log_exception)
+    logger.info("asyncio event loop installed")
+    return _loop
+
+
+def run():
+    """Run the Qt event loop with asyncio on it until the app quits, replaces app.exec()"""
+    install().run_forever()
+    return 0
+
+
+def spawn(coro, name=None):
+    """Start a coroutine as a task, errors are logged rather than lost"""
+    if _loop is None:
+        coro.close()
+        raise RuntimeError("qt_async.install() has not been called")
+    task = _loop.create_task(coro, name=name)
+    _tasks.add(task)
+    task.add_done_callback(_on_task_done)
+    return task
+
+
+def _on_task_done(task):
+    _tasks.discard(task)
+    if task.cancelled():
+        return
+    error = task.exception()
+    if error is not None:
+        logger.error(f"Task {task.get_name()} failed: {error!r}")
+
+
+def _log_exception(*args):
+    # QtAsyncio passes only the context, and reports every task error as it happens
+    context = args[-1]
+    if isinstance(context.get("exception"), asyncio.CancelledError) or context.get("task") in _tasks:
+        # Spawned tasks are logged by _on_task_done with their name
+        return
+    logger.error(f"asyncio: {context.get('message')} {context.get('exception', '')!r}")
+
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call on the shared thread pool and wait for its result"""
+    return await asyncio.get_running_loop().run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
+def run_javascript(page, source, world_id=0, timeout=None):
+    """Awaitable result of QWebEnginePage.runJavaScript"""
+    future = asyncio.get_running_loop().create_future()
+
+    def on_result(result):
+        if not future.done():
+            future.set_result(result)
+
+    page.runJavaScript(source, world_id, on_result)
+    return asyncio.wait_for(future, timeout)
+
+
+def wait_signal(signal, timeout=None):
+    """Awaitable for the next emission of a Qt signal, returns its arguments"""
+    future = asyncio.get_running_loop().create_future()
+
+    def on_emitted(*args):
+        signal.disconnect(on_emitted)
+        if not future.done():
+            future.set_result(args[0] if len(args) == 1 else args)
+
+    signal.connect(on_emitted)
+
+    async def wait():
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            try:
+                signal.disconnect(on_emitted)
+            except (RuntimeError, TypeError):
+                # Already disconnected by the emission, or the sender is gone
+                pass
+            raise
+    return wait()
+
+
+def shutdown():
+    """Cancel running tasks and stop the thread pool, called when the app quits"""
+    pending = [task for task in _tasks if not task.done()]
+    for task in pending:
+        task.cancel()
+    # The Qt loop has stopped, process events so the cancelled tasks can run their cleanup
+    deadline = time.monotonic() + SHUTDOWN_GRACE_SECONDS
+    while any(not task.done() for task in pending) and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+    if pending:
+        logger.info(f"Cancelled {len(pending)} background tasks on exit")
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
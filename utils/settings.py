@@ -0,0 +1,168 @@
+"""Typed application settings, loaded once at startup and served from memory.
+
+Every setting is declared in SCHEMA with its type and default. Writes update the cache and
+emit changed right away, the backend is written from a background thread after writes settle.
+"""
+import queue
+import logging
+import threading
+from PySide6.QtCore import QObject, QSettings, QTimer, Signal, QCoreApplication
+from utils import qt_async
+
+logger = logging.getLogger(__name__)
+
+ORGANIZATION = "YourOrganization"
+APPLICATION = "SearchTabs"
+# Writes closer together than this go to the backend in one flush
+FLUSH_DELAY_MS = 500
+
+# key -> (type, default)
+SCHEMA = {
+    "theme": (str, "System"),
+    "confirm_close_tabs": (bool, True),
+    "vertical_tabs": (bool, False),
+    "auto_archive": (bool, False),
+    "background_throttling": (bool, True),
+    "background_grace_seconds": (int, 10),
+    "lightweight_mode": (bool, False),
+    "shared_webview": (bool, False),
+    "prerender_enabled": (bool, False),
+    "prerender_max_pages": (int, 2),
+    "prerender_memory_budget_mb": (int, 256),
+    "history_max_entries": (int, 100000),
+    "history_max_age_days": (int, 90),
+    "memory_monitor_enabled": (bool, True),
+    "memory_moderate_available_pct": (int, 15),
+    "memory_high_available_pct": (int, 10),
+    "memory_critical_available_pct": (int, 5),
+    "http_cache_mb": (int, 100),
+    "reset_profile": (bool, False),
+}
+
+CHOICES = {
+    "theme": ("Light", "Dark", "System"),
+}
+
+
+def _coerce(key, value):
+    """Convert a value to the type of the setting, raises ValueError if it does not fit"""
+    if key not in SCHEMA:
+        raise ValueError(f"Unknown setting: {key}")
+    value_type, _ = SCHEMA[key]
+    if value_type is bool:
+        if isinstance(value, str):
+            # Backends without native booleans store them as text
+            if value.lower() not in ("true", "false", "1", "0"):
+                raise ValueError(f"Invalid value for {key}: {value!r}")
+            value = value.lower() in ("true", "1")
+        value = bool(value)
+    elif value_type is int:
+        if isinstance(value, bool):
+            raise ValueError(f"Invalid value for {key}: {value!r}")
+        value = int(value)
+    else:
+        value = value_type(value)
+    if key in CHOICES and value not in CHOICES[key]:
+        raise ValueError(f"Invalid value for {key}: {value!r}")
+    return value
+
+
+class Settings(QObject):
+    """In-memory settings cache with debounced background writes"""
+    changed = Signal(str, object)
+
+    def __init__(self):
+        super().__init__()
+        self._values = {}
+        self._pending = {}
+        self._load()
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(FLUSH_DELAY_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._writer_loop, name="SettingsWriter")
+        self._writer.daemon = True
+        self._writer.start()
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.sync)
+
+        self._migrate_theme()
+
+    def _load(self):
+        backend = QSettings(ORGANIZATION, APPLICATION)
+        stored = set(backend.allKeys())
+        for key, (_, default) in SCHEMA.items():
+            value = default
+            if key in stored:
+                try:
+                    value = _coerce(key, backend.value(key))
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"Ignoring stored setting, using the default: {e}")
+            self._values[key] = value
+        self._stored = stored
+
+    def _migrate_theme(self):
+        # The theme used to be kept in a separate settings file
+        if "theme" in self._stored:
+            return
+        legacy = QSettings("SearchTabs", "Preferences").value("theme")
+        if legacy in CHOICES["theme"]:
+            self.set_value("theme", legacy)
+
+    def value(self, key):
+        return self._values[key]
+
+    def set_value(self, key, value):
+        value = _coerce(key, value)
+        if self._values[key] == value:
+            return
+        self._values[key] = value
+        self._pending[key] = value
+        self._flush_timer.start()
+        self.changed.emit(key, value)
+
+    def flush(self):
+        """Hand the pending writes to the writer thread"""
+        self._flush_timer.stop()
+        if self._pending:
+            self._queue.put(self._pending)
+            self._pending = {}
+
+    def sync(self):
+        """Flush and wait until the backend has been written"""
+        self.flush()
+        self._queue.join()
+
+    async def sync_async(self):
+        """sync() that waits on the worker pool, the event loop keeps running meanwhile"""
+        self.flush()
+        await qt_async.run_blocking(self._queue.join)
+
+    def _writer_loop(self):
+        backend = QSettings(ORGANIZATION, APPLICATION)
+        while True:
+            values = self._queue.get()
+            try:
+                for key, value in values.items():
+                    backend.setValue(key, value)
+                backend.sync()
+                if backend.status() != QSettings.NoError:
+                    logger.error(f"Error writing settings: {backend.status()}")
+            finally:
+                self._queue.task_done()
+
+
+_settings = None
+
+
+def get_settings():
+    """The settings of the process, created on first use"""
+    global _settings
+    if _settings is None:
+        _settings = Settings()
+    return _settings
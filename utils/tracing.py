@@ -0,0 +1,222 @@
+"""Timed spans in the Chrome trace-event JSON format, open the saved files in Perfetto or chrome://tracing.
+
+Tracing starts at launch when SEARCHTABS_TRACE is set, to 1 or to the output path, or from the
+Diagnostics group in Settings. While it is off, span() and traced functions only check a flag.
+"""
+import os
+import json
+import time
+import atexit
+import logging
+import threading
+import functools
+from collections import deque
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+TRACE_ENV = "SEARCHTABS_TRACE"
+# Oldest events are dropped beyond this, about 100 MB of trace data
+MAX_EVENTS = 500000
+
+_enabled = False
+_output_path = None
+_events = deque(maxlen=MAX_EVENTS)
+_thread_names = {}
+_pid = os.getpid()
+
+
+def is_enabled():
+    return _enabled
+
+
+def _now_us():
+    return time.perf_counter_ns() // 1000
+
+
+def _tid():
+    thread = threading.current_thread()
+    tid = thread.ident
+    if tid not in _thread_names:
+        _thread_names[tid] = thread.name
+    return tid
+
+
+def start(output_path=None):
+    """Start recording, events from an earlier recording are discarded"""
+    global _enabled, _output_path
+    _events.clear()
+    _output_path = output_path
+    _enabled = True
+    logger.info("Tracing started")
+
+
+def stop():
+    """Stop recording and write the trace, returns the file path"""
+    path, events = stop_recording()
+    if path is not None:
+        write(path, events)
+    return path
+
+
+def stop_recording():
+    """Stop recording without writing, returns the file path and the recorded events"""
+    global _enabled
+    if not _enabled:
+        return None, []
+    _enabled = False
+    return _output_path or default_trace_path(), list(_events)
+
+
+def default_trace_path():
+    return os.path.join(traces_directory(), f"searchtabs-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+
+
+def traces_directory():
+    from PySide6.QtCore import QStandardPaths
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation), "traces")
+
+
+def prune_traces(keep=20):
+    """Delete saved traces beyond the newest keep, one file per step"""
+    directory = traces_directory()
+    try:
+        names = [name for name in os.listdir(directory) if name.endswith(".json")]
+    except OSError:
+        return
+    paths = sorted((os.path.join(directory, name) for name in names), key=os.path.getmtime, reverse=True)
+    for path in paths[keep:]:
+        try:
+            os.remove(path)
+        except OSError as e:
+            logger.error(f"Error removing old trace {path}: {e}")
+        yield
+
+
+def write(path, events=None):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    events = list(_events) if events is None else events
+    metadata = [{"name": "process_name", "ph": "M", "pid": _pid, "tid": 0, "args": {"name": "SearchTabs"}}]
+    metadata += [{"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": name}}
+                 for tid, name in list(_thread_names.items())]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": metadata + events, "displayTimeUnit": "ms"}, f)
+    logger.info(f"Trace with {len(events)} events written to {path}")
+
+
+class _Span:
+    __slots__ = ("name", "category", "args", "start")
+
+    def __init__(self, name, category, args):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = _now_us()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = _now_us()
+        event = {"name": self.name, "cat": self.category, "ph": "X", "ts": self.start, "dur": end - self.start,
+                 "pid": _pid, "tid": _tid()}
+        if self.args:
+            event["args"] = self.args
+        if exc_type is not None:
+            event.setdefault("args", {})["error"] = exc_type.__name__
+        _events.append(event)
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name, category="app", **args):
+    """Context manager recording the enclosed block as one complete event"""
+    if not _enabled:
+        return _NO_SPAN
+    return _Span(name, category, args)
+
+
+def traced(name=None, category="app"):
+    """Decorator recording each call of the function as a span"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(span_name, category, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instant(name, category="app", **args):
+    if _enabled:
+        _events.append({"name": name, "cat": category, "ph": "i", "s": "t", "ts": _now_us(),
+                        "pid": _pid, "tid": _tid(), "args": args})
+
+
+def complete(name, category, start, duration, **args):
+    """Record a block after it ended, start is a time.perf_counter() value and duration in seconds"""
+    if _enabled:
+        _events.append({"name": name, "cat": category, "ph": "X", "ts": int(start * 1000000),
+                        "dur": int(duration * 1000000), "pid": _pid, "tid": _tid(), "args": args})
+
+
+def begin_async(name, key, category="app", **args):
+    """Start of an operation that ends later in an event callback, matched by name and key"""
+    if _enabled:
+        _events.append({"name": name, "cat": category, "ph": "b", "id": hex(key), "ts": _now_us(),
+                        "pid": _pid, "tid": _tid(), "args": args})
+
+
+def end_async(name, key, category="app", **args):
+    if _enabled:
+        _events.append({"name": name, "cat": category, "ph": "e", "id": hex(key), "ts": _now_us(),
+                        "pid": _pid, "tid": _tid(), "args": args})
+
+
+def trace_page_loads(webview):
+    """Record each loadStarted to loadFinished of a web view as an async span"""
+    key = id(webview)
+
+    def on_load_started():
+        if _enabled:
+            begin_async("Page load", key, "page", url=webview.url().toString())
+
+    def on_load_finished(ok):
+        if _enabled:
+            end_async("Page load", key, "page", ok=ok, url=webview.url().toString())
+
+    webview.loadStarted.connect(on_load_started)
+    webview.loadFinished.connect(on_load_finished)
+
+
+@atexit.register
+def _save_on_exit():
+    # A trace that is still recording when the app exits is saved rather than lost
+    if _enabled:
+        stop()
+
+
+def start_from_environment():
+    value = os.environ.get(TRACE_ENV, "")
+    if not value or value.lower() in ("0", "false", "no"):
+        return
+    start(None if value.lower() in ("1", "true", "yes") else value)
+
+
+start_from_environment()